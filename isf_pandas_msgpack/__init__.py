@@ -10,7 +10,9 @@ import pandas
 #     raise ValueError("pandas_msgpack requires at least pandas 0.19.0")
 # _is_pandas_legacy_version = pv.version[1] == 19 and len(pv.version) == 3
 
-from .packers import to_msgpack, read_msgpack
+from .packers import (to_msgpack, read_msgpack, read_msgpack_schema, dumps,
+                      loads, to_shared_memory, from_shared_memory,
+                      register_codec)
 from importlib.metadata import version, PackageNotFoundError
 try:
     __version__ = version("isf-pandas-msgpack")
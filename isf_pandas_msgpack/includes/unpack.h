@@ -25,6 +25,7 @@ typedef struct unpack_user {
     bool has_pairs_hook;
     PyObject *list_hook;
     PyObject *ext_hook;
+    PyObject *ext_source;
     const char *encoding;
     const char *unicode_errors;
     Py_ssize_t max_str_len, max_bin_len, max_array_len, max_map_len, max_ext_len;
@@ -264,6 +265,19 @@ static inline int unpack_callback_ext(unpack_user* u, const char* base, const ch
         return -1;
     }
     // length also includes the typecode, so the actual data is length-1
+    if (u->ext_source) {
+        // base is the start of ext_source; hand out a view instead of a copy
+        PyObject *data = PySequence_GetSlice(u->ext_source, pos - base,
+                                             pos - base + (Py_ssize_t)length - 1);
+        if (!data)
+            return -1;
+        py = PyObject_CallFunction(u->ext_hook, (char*)"(iO)", typecode, data);
+        Py_DECREF(data);
+        if (!py)
+            return -1;
+        *o = py;
+        return 0;
+    }
 #if PY_MAJOR_VERSION == 2
     py = PyObject_CallFunction(u->ext_hook, (char*)"(is#)", typecode, pos, (Py_ssize_t)length-1);
 #else
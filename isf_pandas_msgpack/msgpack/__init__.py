@@ -14,7 +14,13 @@ class ExtType(namedtuple('ExtType', 'code data')):
         if not isinstance(code, int):
             raise TypeError("code must be int")
         if not isinstance(data, bytes):
-            raise TypeError("data must be bytes")
+            # any C-contiguous object supporting the buffer protocol
+            try:
+                contiguous = memoryview(data).c_contiguous
+            except TypeError:
+                contiguous = False
+            if not contiguous:
+                raise TypeError("data must be bytes or a C-contiguous buffer")
         if not 0 <= code <= 127:
             raise ValueError("code must be 0~127")
         return super(ExtType, cls).__new__(cls, code, data)
@@ -1552,6 +1552,9 @@ static const char *__pyx_f[] = {
 
 /*--- Type declarations ---*/
 struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer;
+struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack;
+struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr;
+struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr;
 struct __pyx_opt_args_7cpython_11contextvars_get_value;
 struct __pyx_opt_args_7cpython_11contextvars_get_value_no_default;
 
@@ -1580,19 +1583,20 @@ struct __pyx_opt_args_7cpython_11contextvars_get_value_no_default {
 };
 struct __pyx_opt_args_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__pack;
 
-/* "isf_pandas_msgpack/msgpack/_packer.pyx":117
- *         free(self.pk.buf);
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":278
+ *         self._flush()
  * 
  *     cdef int _pack(self, object o,             # <<<<<<<<<<<<<<
- *                    int nest_limit=DEFAULT_RECURSE_LIMIT) except -1:
- *         cdef long long llval
+ *                    int nest_limit=DEFAULT_RECURSE_LIMIT,
+ *                    bint encoded=0) except -1:
  */
 struct __pyx_opt_args_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__pack {
   int __pyx_n;
   int nest_limit;
+  int encoded;
 };
 
-/* "isf_pandas_msgpack/msgpack/_packer.pyx":40
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":90
  * 
  * 
  * cdef class Packer(object):             # <<<<<<<<<<<<<<
@@ -1610,15 +1614,88 @@ struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer {
   char *unicode_errors;
   PyBoolObject *use_float;
   int autoreset;
+  PyObject *stream;
+  size_t flush_threshold;
+  PyObject *segments;
+  size_t align;
+  size_t written;
+};
+
+
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":278
+ *         self._flush()
+ * 
+ *     cdef int _pack(self, object o,             # <<<<<<<<<<<<<<
+ *                    int nest_limit=DEFAULT_RECURSE_LIMIT,
+ *                    bint encoded=0) except -1:
+ */
+struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack {
+  PyObject_HEAD
+  struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self;
+};
+
+
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":356
+ *                 pad = self.align and encoded
+ *                 if pad:
+ *                     L += sum(self._aligns(k, v) for k, v in d.iteritems())             # <<<<<<<<<<<<<<
+ *                 if L > (2**32) - 1:
+ *                     raise ValueError("dict is too large")
+ */
+struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr {
+  PyObject_HEAD
+  struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack *__pyx_outer_scope;
+  PyObject *__pyx_genexpr_arg_0;
+  PyObject *__pyx_v_k;
+  PyObject *__pyx_v_v;
+  PyObject *__pyx_t_0;
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  int __pyx_t_3;
+};
+
+
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":374
+ *                 pad = self.align and encoded
+ *                 if pad:
+ *                     L += sum(self._aligns(k, v) for k, v in o.items())             # <<<<<<<<<<<<<<
+ *                 if L > (2**32) - 1:
+ *                     raise ValueError("dict is too large")
+ */
+struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr {
+  PyObject_HEAD
+  struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack *__pyx_outer_scope;
+  PyObject *__pyx_genexpr_arg_0;
+  PyObject *__pyx_v_k;
+  PyObject *__pyx_v_v;
+  PyObject *__pyx_t_0;
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  int __pyx_t_3;
 };
 
 
 
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":90
+ * 
+ * 
+ * cdef class Packer(object):             # <<<<<<<<<<<<<<
+ *     """
+ *     MessagePack Packer
+ */
+
 struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer {
+  PyObject *(*_write)(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *, PyObject *, size_t);
+  PyObject *(*_flush)(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *);
+  PyObject *(*_take)(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *);
+  int (*_aligns)(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *, PyObject *, PyObject *);
+  int (*_pack_padding)(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *, PyObject *, PyObject *);
+  int (*_streaming)(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *);
   int (*_pack)(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *, PyObject *, struct __pyx_opt_args_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__pack *__pyx_optional_args);
   PyObject *(*pack)(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *, PyObject *, int __pyx_skip_dispatch);
 };
 static struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_vtabptr_18isf_pandas_msgpack_7msgpack_7_packer_Packer;
+static CYTHON_INLINE int __pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__streaming(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *);
 /* #### Code section: utility_code_proto ### */
 
 /* --- Runtime support code (head) --- */
@@ -1833,19 +1910,6 @@ static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int
 static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
     Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
 
-/* KeywordStringCheck.proto */
-static int __Pyx_CheckKeywordStrings(PyObject *kw, const char* function_name, int kw_allowed);
-
-/* PyObjectCall.proto */
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
-#else
-#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
-#endif
-
-/* RaiseException.proto */
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
-
 /* RaiseDoubleKeywords.proto */
 static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
 
@@ -1855,8 +1919,32 @@ static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject *const *kwvalues
     PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,
     const char* function_name);
 
-/* ExtTypeTest.proto */
-static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type);
+/* ArgTypeTest.proto */
+#define __Pyx_ArgTypeTest(obj, type, none_allowed, name, exact)\
+    ((likely(__Pyx_IS_TYPE(obj, type) | (none_allowed && (obj == Py_None)))) ? 1 :\
+        __Pyx__ArgTypeTest(obj, type, name, exact))
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact);
+
+/* ListCompAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len)) {
+        Py_INCREF(x);
+        #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030d0000
+        L->ob_item[len] = x;
+        #else
+        PyList_SET_ITEM(list, len, x);
+        #endif
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_ListComp_Append(L,x) PyList_Append(L,x)
+#endif
 
 /* PyFunctionFastCall.proto */
 #if CYTHON_FAST_PYCALL
@@ -1893,6 +1981,13 @@ static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args,
 #endif
 #endif
 
+/* PyObjectCall.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
 /* PyObjectCallMethO.proto */
 #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
@@ -1902,6 +1997,12 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject
 #define __Pyx_PyObject_FastCall(func, args, nargs)  __Pyx_PyObject_FastCallDict(func, args, (size_t)(nargs), NULL)
 static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObject **args, size_t nargs, PyObject *kwargs);
 
+/* GetAttr.proto */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *, PyObject *);
+
+/* HasAttr.proto */
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *, PyObject *);
+
 /* PyDictVersioning.proto */
 #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
 #define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
@@ -1949,6 +2050,102 @@ static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_ve
 static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
 #endif
 
+/* SliceObject.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetSlice(
+        PyObject* obj, Py_ssize_t cstart, Py_ssize_t cstop,
+        PyObject** py_start, PyObject** py_stop, PyObject** py_slice,
+        int has_cstart, int has_cstop, int wraparound);
+
+/* SliceTupleAndList.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyList_GetSlice(PyObject* src, Py_ssize_t start, Py_ssize_t stop);
+static CYTHON_INLINE PyObject* __Pyx_PyTuple_GetSlice(PyObject* src, Py_ssize_t start, Py_ssize_t stop);
+#else
+#define __Pyx_PyList_GetSlice(seq, start, stop)   PySequence_GetSlice(seq, start, stop)
+#define __Pyx_PyTuple_GetSlice(seq, start, stop)  PySequence_GetSlice(seq, start, stop)
+#endif
+
+/* GetItemInt.proto */
+#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
+               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
+#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck) :\
+    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck);
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                                     int is_list, int wraparound, int boundscheck);
+
+/* SetItemInt.proto */
+#define __Pyx_SetItemInt(o, i, v, type, is_signed, to_py_func, is_list, wraparound, boundscheck)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_SetItemInt_Fast(o, (Py_ssize_t)i, v, is_list, wraparound, boundscheck) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list assignment index out of range"), -1) :\
+               __Pyx_SetItemInt_Generic(o, to_py_func(i), v)))
+static int __Pyx_SetItemInt_Generic(PyObject *o, PyObject *j, PyObject *v);
+static CYTHON_INLINE int __Pyx_SetItemInt_Fast(PyObject *o, Py_ssize_t i, PyObject *v,
+                                               int is_list, int wraparound, int boundscheck);
+
+/* KeywordStringCheck.proto */
+static int __Pyx_CheckKeywordStrings(PyObject *kw, const char* function_name, int kw_allowed);
+
+/* RaiseException.proto */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
+/* ExtTypeTest.proto */
+static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type);
+
+/* ListAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_PyList_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len) & likely(len > (L->allocated >> 1))) {
+        Py_INCREF(x);
+        #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030d0000
+        L->ob_item[len] = x;
+        #else
+        PyList_SET_ITEM(list, len, x);
+        #endif
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_PyList_Append(L,x) PyList_Append(L,x)
+#endif
+
+/* SliceObject.proto */
+#define __Pyx_PyObject_DelSlice(obj, cstart, cstop, py_start, py_stop, py_slice, has_cstart, has_cstop, wraparound)\
+    __Pyx_PyObject_SetSlice(obj, (PyObject*)NULL, cstart, cstop, py_start, py_stop, py_slice, has_cstart, has_cstop, wraparound)
+static CYTHON_INLINE int __Pyx_PyObject_SetSlice(
+        PyObject* obj, PyObject* value, Py_ssize_t cstart, Py_ssize_t cstop,
+        PyObject** py_start, PyObject** py_stop, PyObject** py_slice,
+        int has_cstart, int has_cstop, int wraparound);
+
+/* RaiseUnexpectedTypeError.proto */
+static int __Pyx_RaiseUnexpectedTypeError(const char *expected, PyObject *obj);
+
+/* PyIntBinop.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check);
+#else
+#define __Pyx_PyInt_AddObjC(op1, op2, intval, inplace, zerodivision_check)\
+    (inplace ? PyNumber_InPlaceAdd(op1, op2) : PyNumber_Add(op1, op2))
+#endif
+
 /* IterFinish.proto */
 static CYTHON_INLINE int __Pyx_IterFinish(void);
 
@@ -1997,6 +2194,47 @@ static CYTHON_INLINE PyObject* __Pyx_dict_iterator(PyObject* dict, int is_dict,
 static CYTHON_INLINE int __Pyx_dict_iter_next(PyObject* dict_or_iter, Py_ssize_t orig_length, Py_ssize_t* ppos,
                                               PyObject** pkey, PyObject** pvalue, PyObject** pitem, int is_dict);
 
+/* RaiseUnboundLocalError.proto */
+static CYTHON_INLINE void __Pyx_RaiseUnboundLocalError(const char *varname);
+
+/* RaiseClosureNameError.proto */
+static CYTHON_INLINE void __Pyx_RaiseClosureNameError(const char *varname);
+
+/* GetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_GetException(type, value, tb)  __Pyx__GetException(__pyx_tstate, type, value, tb)
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb);
+#endif
+
+/* pep479.proto */
+static void __Pyx_Generator_Replace_StopIteration(int in_async_gen);
+
+/* SwapException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSwap(type, value, tb)  __Pyx__ExceptionSwap(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#else
+static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value, PyObject **tb);
+#endif
+
+/* GetTopmostException.proto */
+#if CYTHON_USE_EXC_INFO_STACK && CYTHON_FAST_THREAD_STATE
+static _PyErr_StackItem * __Pyx_PyErr_GetTopmostException(PyThreadState *tstate);
+#endif
+
+/* SaveResetException.proto */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_ExceptionSave(type, value, tb)  __Pyx__ExceptionSave(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#define __Pyx_ExceptionReset(type, value, tb)  __Pyx__ExceptionReset(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+#else
+#define __Pyx_ExceptionSave(type, value, tb)   PyErr_GetExcInfo(type, value, tb)
+#define __Pyx_ExceptionReset(type, value, tb)  PyErr_SetExcInfo(type, value, tb)
+#endif
+
 /* IncludeStructmemberH.proto */
 #include <structmember.h>
 
@@ -2065,6 +2303,12 @@ static PyTypeObject *__Pyx_ImportType_3_0_12(PyObject* module, const char *modul
 /* Import.proto */
 static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level);
 
+/* ImportDottedModule.proto */
+static PyObject *__Pyx_ImportDottedModule(PyObject *name, PyObject *parts_tuple);
+#if PY_MAJOR_VERSION >= 3
+static PyObject *__Pyx_ImportDottedModule_WalkParts(PyObject *module, PyObject *name, PyObject *parts_tuple);
+#endif
+
 /* ImportFrom.proto */
 static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
 
@@ -2244,9 +2488,15 @@ static void __Pyx_AddTraceback(const char *funcname, int c_line,
 #define __Pyx_HAS_GCC_DIAGNOSTIC
 #endif
 
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+
 /* CIntFromPy.proto */
 static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *);
 
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
+
 /* CIntFromPy.proto */
 static CYTHON_INLINE unsigned PY_LONG_LONG __Pyx_PyInt_As_unsigned_PY_LONG_LONG(PyObject *);
 
@@ -2275,9 +2525,6 @@ typedef const char *__Pyx_TypeName;
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
 
-/* CIntFromPy.proto */
-static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
-
 /* FastTypeChecks.proto */
 #if CYTHON_COMPILING_IN_CPYTHON
 #define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
@@ -2295,6 +2542,88 @@ static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObj
 #define __Pyx_PyErr_ExceptionMatches2(err1, err2)  __Pyx_PyErr_GivenExceptionMatches2(__Pyx_PyErr_CurrentExceptionType(), err1, err2)
 #define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
 
+/* PyObjectCall2Args.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+
+/* PyObjectCallMethod1.proto */
+static PyObject* __Pyx_PyObject_CallMethod1(PyObject* obj, PyObject* method_name, PyObject* arg);
+
+/* CoroutineBase.proto */
+struct __pyx_CoroutineObject;
+typedef PyObject *(*__pyx_coroutine_body_t)(struct __pyx_CoroutineObject *, PyThreadState *, PyObject *);
+#if CYTHON_USE_EXC_INFO_STACK
+#define __Pyx_ExcInfoStruct  _PyErr_StackItem
+#else
+typedef struct {
+    PyObject *exc_type;
+    PyObject *exc_value;
+    PyObject *exc_traceback;
+} __Pyx_ExcInfoStruct;
+#endif
+typedef struct __pyx_CoroutineObject {
+    PyObject_HEAD
+    __pyx_coroutine_body_t body;
+    PyObject *closure;
+    __Pyx_ExcInfoStruct gi_exc_state;
+    PyObject *gi_weakreflist;
+    PyObject *classobj;
+    PyObject *yieldfrom;
+    PyObject *gi_name;
+    PyObject *gi_qualname;
+    PyObject *gi_modulename;
+    PyObject *gi_code;
+    PyObject *gi_frame;
+    int resume_label;
+    char is_running;
+} __pyx_CoroutineObject;
+static __pyx_CoroutineObject *__Pyx__Coroutine_New(
+    PyTypeObject *type, __pyx_coroutine_body_t body, PyObject *code, PyObject *closure,
+    PyObject *name, PyObject *qualname, PyObject *module_name);
+static __pyx_CoroutineObject *__Pyx__Coroutine_NewInit(
+            __pyx_CoroutineObject *gen, __pyx_coroutine_body_t body, PyObject *code, PyObject *closure,
+            PyObject *name, PyObject *qualname, PyObject *module_name);
+static CYTHON_INLINE void __Pyx_Coroutine_ExceptionClear(__Pyx_ExcInfoStruct *self);
+static int __Pyx_Coroutine_clear(PyObject *self);
+static PyObject *__Pyx_Coroutine_Send(PyObject *self, PyObject *value);
+static PyObject *__Pyx_Coroutine_Close(PyObject *self);
+static PyObject *__Pyx_Coroutine_Throw(PyObject *gen, PyObject *args);
+#if CYTHON_USE_EXC_INFO_STACK
+#define __Pyx_Coroutine_SwapException(self)
+#define __Pyx_Coroutine_ResetAndClearException(self)  __Pyx_Coroutine_ExceptionClear(&(self)->gi_exc_state)
+#else
+#define __Pyx_Coroutine_SwapException(self) {\
+    __Pyx_ExceptionSwap(&(self)->gi_exc_state.exc_type, &(self)->gi_exc_state.exc_value, &(self)->gi_exc_state.exc_traceback);\
+    __Pyx_Coroutine_ResetFrameBackpointer(&(self)->gi_exc_state);\
+    }
+#define __Pyx_Coroutine_ResetAndClearException(self) {\
+    __Pyx_ExceptionReset((self)->gi_exc_state.exc_type, (self)->gi_exc_state.exc_value, (self)->gi_exc_state.exc_traceback);\
+    (self)->gi_exc_state.exc_type = (self)->gi_exc_state.exc_value = (self)->gi_exc_state.exc_traceback = NULL;\
+    }
+#endif
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyGen_FetchStopIterationValue(pvalue)\
+    __Pyx_PyGen__FetchStopIterationValue(__pyx_tstate, pvalue)
+#else
+#define __Pyx_PyGen_FetchStopIterationValue(pvalue)\
+    __Pyx_PyGen__FetchStopIterationValue(__Pyx_PyThreadState_Current, pvalue)
+#endif
+static int __Pyx_PyGen__FetchStopIterationValue(PyThreadState *tstate, PyObject **pvalue);
+static CYTHON_INLINE void __Pyx_Coroutine_ResetFrameBackpointer(__Pyx_ExcInfoStruct *exc_state);
+
+/* PatchModuleWithCoroutine.proto */
+static PyObject* __Pyx_Coroutine_patch_module(PyObject* module, const char* py_code);
+
+/* PatchGeneratorABC.proto */
+static int __Pyx_patch_abc(void);
+
+/* Generator.proto */
+#define __Pyx_Generator_USED
+#define __Pyx_Generator_CheckExact(obj) __Pyx_IS_TYPE(obj, __pyx_GeneratorType)
+#define __Pyx_Generator_New(body, code, closure, name, qualname, module_name)\
+    __Pyx__Coroutine_New(__pyx_GeneratorType, body, code, closure, name, qualname, module_name)
+static PyObject *__Pyx_Generator_Next(PyObject *self);
+static int __pyx_Generator_init(PyObject *module);
+
 /* CheckBinaryVersion.proto */
 static unsigned long __Pyx_get_runtime_version(void);
 static int __Pyx_check_binary_version(unsigned long ct_version, unsigned long rt_version, int allow_newer);
@@ -2305,6 +2634,12 @@ static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 /* #### Code section: module_declarations ### */
 static CYTHON_INLINE double __pyx_f_7cpython_7complex_7complex_4real_real(PyComplexObject *__pyx_v_self); /* proto*/
 static CYTHON_INLINE double __pyx_f_7cpython_7complex_7complex_4imag_imag(PyComplexObject *__pyx_v_self); /* proto*/
+static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__write(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_data, size_t __pyx_v_length); /* proto*/
+static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__flush(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self); /* proto*/
+static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__take(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self); /* proto*/
+static int __pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__aligns(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_k, PyObject *__pyx_v_v); /* proto*/
+static int __pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__pack_padding(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_k, PyObject *__pyx_v_v); /* proto*/
+static CYTHON_INLINE int __pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__streaming(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self); /* proto*/
 static int __pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__pack(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_o, struct __pyx_opt_args_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__pack *__pyx_optional_args); /* proto*/
 static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_pack(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_obj, int __pyx_skip_dispatch); /* proto*/
 
@@ -2394,12 +2729,19 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_pack(str
 
 /* Module declarations from "cpython" */
 
+/* Module declarations from "cpython.memoryview" */
+
 /* Module declarations from "libc.stdlib" */
 
 /* Module declarations from "libc.limits" */
 
 /* Module declarations from "isf_pandas_msgpack.msgpack._packer" */
 static int __pyx_v_18isf_pandas_msgpack_7msgpack_7_packer_DEFAULT_RECURSE_LIMIT;
+static size_t __pyx_v_18isf_pandas_msgpack_7msgpack_7_packer_DEFAULT_FLUSH_THRESHOLD;
+static Py_ssize_t __pyx_v_18isf_pandas_msgpack_7msgpack_7_packer_IOV_MAX;
+static char __pyx_v_18isf_pandas_msgpack_7msgpack_7_packer__zeros[0x100];
+static CYTHON_INLINE size_t __pyx_f_18isf_pandas_msgpack_7msgpack_7_packer__raw_header_size(size_t, int); /*proto*/
+static CYTHON_INLINE size_t __pyx_f_18isf_pandas_msgpack_7msgpack_7_packer__ext_header_size(size_t); /*proto*/
 /* #### Code section: typeinfo ### */
 /* #### Code section: before_global_var ### */
 #define __Pyx_MODULE_NAME "isf_pandas_msgpack.msgpack._packer"
@@ -2409,45 +2751,73 @@ int __pyx_module_is_main_isf_pandas_msgpack__msgpack___packer = 0;
 /* Implementation of "isf_pandas_msgpack.msgpack._packer" */
 /* #### Code section: global_var ### */
 static PyObject *__pyx_builtin_MemoryError;
-static PyObject *__pyx_builtin_TypeError;
 static PyObject *__pyx_builtin_ValueError;
+static PyObject *__pyx_builtin_TypeError;
+static PyObject *__pyx_builtin_sum;
 /* #### Code section: string_decls ### */
+static const char __pyx_k_B[] = "B";
+static const char __pyx_k_i[] = "i";
 static const char __pyx_k_k[] = "k";
+static const char __pyx_k_n[] = "n";
+static const char __pyx_k_s[] = "s";
 static const char __pyx_k_v[] = "v";
-static const char __pyx_k__9[] = ".";
+static const char __pyx_k_fd[] = "fd";
 static const char __pyx_k_gc[] = "gc";
-static const char __pyx_k__10[] = "";
-static const char __pyx_k__26[] = "?";
-static const char __pyx_k_buf[] = "buf";
+static const char __pyx_k_os[] = "os";
+static const char __pyx_k__14[] = "*";
+static const char __pyx_k__15[] = ".";
+static const char __pyx_k__16[] = "";
+static const char __pyx_k__37[] = "?";
 static const char __pyx_k_obj[] = "obj";
+static const char __pyx_k_pad[] = "__pad__";
 static const char __pyx_k_ret[] = "ret";
+static const char __pyx_k_sum[] = "sum";
+static const char __pyx_k_args[] = "args";
+static const char __pyx_k_cast[] = "cast";
 static const char __pyx_k_code[] = "code";
 static const char __pyx_k_data[] = "data";
 static const char __pyx_k_main[] = "__main__";
 static const char __pyx_k_name[] = "__name__";
 static const char __pyx_k_pack[] = "pack";
 static const char __pyx_k_self[] = "self";
+static const char __pyx_k_send[] = "send";
 static const char __pyx_k_size[] = "size";
+static const char __pyx_k_spec[] = "__spec__";
+static const char __pyx_k_tell[] = "tell";
 static const char __pyx_k_test[] = "__test__";
+static const char __pyx_k_view[] = "view";
+static const char __pyx_k_align[] = "align";
 static const char __pyx_k_ascii[] = "ascii";
 static const char __pyx_k_bytes[] = "bytes";
+static const char __pyx_k_close[] = "close";
+static const char __pyx_k_flush[] = "flush";
 static const char __pyx_k_items[] = "items";
 static const char __pyx_k_pairs[] = "pairs";
 static const char __pyx_k_reset[] = "reset";
+static const char __pyx_k_throw[] = "throw";
 static const char __pyx_k_utf_8[] = "utf-8";
+static const char __pyx_k_views[] = "views";
+static const char __pyx_k_write[] = "write";
 static const char __pyx_k_Packer[] = "Packer";
 static const char __pyx_k_enable[] = "enable";
 static const char __pyx_k_encode[] = "encode";
 static const char __pyx_k_import[] = "__import__";
+static const char __pyx_k_offset[] = "offset";
 static const char __pyx_k_reduce[] = "__reduce__";
+static const char __pyx_k_stream[] = "stream";
 static const char __pyx_k_strict[] = "strict";
+static const char __pyx_k_writev[] = "writev";
 static const char __pyx_k_ExtType[] = "ExtType";
+static const char __pyx_k_PAD_KEY[] = "PAD_KEY";
 static const char __pyx_k_default[] = "default";
 static const char __pyx_k_disable[] = "disable";
+static const char __pyx_k_genexpr[] = "genexpr";
 static const char __pyx_k_encoding[] = "encoding";
 static const char __pyx_k_getstate[] = "__getstate__";
+static const char __pyx_k_segments[] = "segments";
 static const char __pyx_k_setstate[] = "__setstate__";
 static const char __pyx_k_typecode[] = "typecode";
+static const char __pyx_k_writev_2[] = "_writev";
 static const char __pyx_k_TypeError[] = "TypeError";
 static const char __pyx_k_autoreset[] = "autoreset";
 static const char __pyx_k_isenabled[] = "isenabled";
@@ -2459,16 +2829,21 @@ static const char __pyx_k_exceptions[] = "exceptions";
 static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
 static const char __pyx_k_MemoryError[] = "MemoryError";
 static const char __pyx_k_Packer_pack[] = "Packer.pack";
+static const char __pyx_k_Packer_tell[] = "Packer.tell";
 static const char __pyx_k_Packer_bytes[] = "Packer.bytes";
+static const char __pyx_k_Packer_flush[] = "Packer.flush";
 static const char __pyx_k_Packer_reset[] = "Packer.reset";
+static const char __pyx_k_initializing[] = "_initializing";
 static const char __pyx_k_is_coroutine[] = "_is_coroutine";
 static const char __pyx_k_stringsource[] = "<stringsource>";
 static const char __pyx_k_use_bin_type[] = "use_bin_type";
 static const char __pyx_k_pack_ext_type[] = "pack_ext_type";
+static const char __pyx_k_pack_segments[] = "pack_segments";
 static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
 static const char __pyx_k_PackValueError[] = "PackValueError";
 static const char __pyx_k_pack_map_pairs[] = "pack_map_pairs";
 static const char __pyx_k_unicode_errors[] = "unicode_errors";
+static const char __pyx_k_flush_threshold[] = "flush_threshold";
 static const char __pyx_k_pack_map_header[] = "pack_map_header";
 static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
 static const char __pyx_k_use_single_float[] = "use_single_float";
@@ -2480,6 +2855,7 @@ static const char __pyx_k_asyncio_coroutines[] = "asyncio.coroutines";
 static const char __pyx_k_bytes_is_too_large[] = "bytes is too large";
 static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
 static const char __pyx_k_Packer_pack_ext_type[] = "Packer.pack_ext_type";
+static const char __pyx_k_Packer_pack_segments[] = "Packer.pack_segments";
 static const char __pyx_k_EXT_data_is_too_large[] = "EXT data is too large";
 static const char __pyx_k_Packer_pack_map_pairs[] = "Packer.pack_map_pairs";
 static const char __pyx_k_Packer___reduce_cython[] = "Packer.__reduce_cython__";
@@ -2487,26 +2863,40 @@ static const char __pyx_k_Packer_pack_map_header[] = "Packer.pack_map_header";
 static const char __pyx_k_Packer___setstate_cython[] = "Packer.__setstate_cython__";
 static const char __pyx_k_Packer_pack_array_header[] = "Packer.pack_array_header";
 static const char __pyx_k_recursion_limit_exceeded[] = "recursion limit exceeded.";
+static const char __pyx_k_align_must_be_at_most_256[] = "align must be at most 256.";
 static const char __pyx_k_default_must_be_a_callable[] = "default must be a callable.";
+static const char __pyx_k_Packer__pack_locals_genexpr[] = "Packer._pack.<locals>.genexpr";
+static const char __pyx_k_align_requires_use_bin_type[] = "align requires use_bin_type.";
 static const char __pyx_k_Can_t_encode_unicode_string_no_e[] = "Can't encode unicode string: no encoding is specified";
+static const char __pyx_k_Packer_has_no_stream_to_flush_to[] = "Packer has no stream to flush to.";
 static const char __pyx_k_Unable_to_allocate_internal_buff[] = "Unable to allocate internal buffer.";
-static const char __pyx_k_isf_pandas_msgpack_msgpack__pack[] = "isf_pandas_msgpack/msgpack/_packer.pyx";
+static const char __pyx_k_isf_pandas_msgpack_msgpack__pack[] = "isf_pandas_msgpack.msgpack._packer";
 static const char __pyx_k_no_default___reduce___due_to_non[] = "no default __reduce__ due to non-trivial __cinit__";
-static const char __pyx_k_isf_pandas_msgpack_msgpack__pack_2[] = "isf_pandas_msgpack.msgpack._packer";
+static const char __pyx_k_pack_segments_can_t_be_used_with[] = "pack_segments can't be used with a stream.";
+static const char __pyx_k_isf_pandas_msgpack_msgpack__pack_2[] = "isf_pandas_msgpack/msgpack/_packer.pyx";
 /* #### Code section: decls ### */
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer__writev(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_fd, PyObject *__pyx_v_segments); /* proto */
 static int __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer___cinit__(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self); /* proto */
-static int __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_2__init__(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_default, PyObject *__pyx_v_encoding, PyObject *__pyx_v_unicode_errors, PyObject *__pyx_v_use_single_float, int __pyx_v_autoreset, int __pyx_v_use_bin_type); /* proto */
+static int __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_2__init__(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_default, PyObject *__pyx_v_encoding, PyObject *__pyx_v_unicode_errors, PyObject *__pyx_v_use_single_float, int __pyx_v_autoreset, int __pyx_v_use_bin_type, PyObject *__pyx_v_stream, size_t __pyx_v_flush_threshold, size_t __pyx_v_align, size_t __pyx_v_offset); /* proto */
 static void __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_4__dealloc__(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_6pack(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_obj); /* proto */
-static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_8pack_ext_type(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_typecode, PyObject *__pyx_v_data); /* proto */
-static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_10pack_array_header(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, size_t __pyx_v_size); /* proto */
-static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_12pack_map_header(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, size_t __pyx_v_size); /* proto */
-static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_14pack_map_pairs(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_pairs); /* proto */
-static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_16reset(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_18bytes(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_20__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_22__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_6tell(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_8flush(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_5_pack_genexpr(PyObject *__pyx_self, PyObject *__pyx_genexpr_arg_0); /* proto */
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_5_pack_3genexpr(PyObject *__pyx_self, PyObject *__pyx_genexpr_arg_0); /* proto */
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_10pack(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_obj); /* proto */
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_12pack_segments(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_obj); /* proto */
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_14pack_ext_type(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_typecode, PyObject *__pyx_v_data); /* proto */
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_16pack_array_header(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, size_t __pyx_v_size); /* proto */
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_18pack_map_header(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, size_t __pyx_v_size); /* proto */
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_20pack_map_pairs(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_pairs); /* proto */
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_22reset(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_24bytes(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_26__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_28__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
 static PyObject *__pyx_tp_new_18isf_pandas_msgpack_7msgpack_7_packer_Packer(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 /* #### Code section: late_includes ### */
 /* #### Code section: module_state ### */
 typedef struct {
@@ -2628,38 +3018,59 @@ typedef struct {
   #if CYTHON_USE_MODULE_STATE
   #endif
   #if CYTHON_USE_MODULE_STATE
+  #endif
+  #if CYTHON_USE_MODULE_STATE
   PyObject *__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer_Packer;
+  PyObject *__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack;
+  PyObject *__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr;
+  PyObject *__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr;
   #endif
   PyTypeObject *__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer;
+  PyTypeObject *__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack;
+  PyTypeObject *__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr;
+  PyTypeObject *__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr;
+  PyObject *__pyx_n_s_B;
   PyObject *__pyx_kp_s_Can_t_encode_unicode_string_no_e;
   PyObject *__pyx_kp_s_EXT_data_is_too_large;
   PyObject *__pyx_n_s_ExtType;
   PyObject *__pyx_n_s_MemoryError;
+  PyObject *__pyx_n_s_PAD_KEY;
   PyObject *__pyx_n_s_PackValueError;
   PyObject *__pyx_n_s_Packer;
   PyObject *__pyx_n_s_Packer___reduce_cython;
   PyObject *__pyx_n_s_Packer___setstate_cython;
+  PyObject *__pyx_n_s_Packer__pack_locals_genexpr;
   PyObject *__pyx_n_s_Packer_bytes;
+  PyObject *__pyx_n_s_Packer_flush;
+  PyObject *__pyx_kp_s_Packer_has_no_stream_to_flush_to;
   PyObject *__pyx_n_s_Packer_pack;
   PyObject *__pyx_n_s_Packer_pack_array_header;
   PyObject *__pyx_n_s_Packer_pack_ext_type;
   PyObject *__pyx_n_s_Packer_pack_map_header;
   PyObject *__pyx_n_s_Packer_pack_map_pairs;
+  PyObject *__pyx_n_s_Packer_pack_segments;
   PyObject *__pyx_n_s_Packer_reset;
+  PyObject *__pyx_n_s_Packer_tell;
   PyObject *__pyx_n_s_TypeError;
   PyObject *__pyx_kp_s_Unable_to_allocate_internal_buff;
   PyObject *__pyx_n_s_ValueError;
-  PyObject *__pyx_n_s__10;
-  PyObject *__pyx_n_s__26;
-  PyObject *__pyx_kp_u__9;
+  PyObject *__pyx_n_s__14;
+  PyObject *__pyx_kp_u__15;
+  PyObject *__pyx_n_s__16;
+  PyObject *__pyx_n_s__37;
+  PyObject *__pyx_n_s_align;
+  PyObject *__pyx_kp_s_align_must_be_at_most_256;
+  PyObject *__pyx_kp_s_align_requires_use_bin_type;
+  PyObject *__pyx_n_s_args;
   PyObject *__pyx_n_s_ascii;
   PyObject *__pyx_n_s_asyncio_coroutines;
   PyObject *__pyx_n_s_autoreset;
-  PyObject *__pyx_n_s_buf;
   PyObject *__pyx_n_s_bytes;
   PyObject *__pyx_kp_s_bytes_is_too_large;
   PyObject *__pyx_kp_s_can_t_serialize_r;
+  PyObject *__pyx_n_s_cast;
   PyObject *__pyx_n_s_cline_in_traceback;
+  PyObject *__pyx_n_s_close;
   PyObject *__pyx_n_s_code;
   PyObject *__pyx_n_s_data;
   PyObject *__pyx_n_s_default;
@@ -2670,26 +3081,38 @@ typedef struct {
   PyObject *__pyx_n_s_encode;
   PyObject *__pyx_n_s_encoding;
   PyObject *__pyx_n_s_exceptions;
+  PyObject *__pyx_n_s_fd;
+  PyObject *__pyx_n_s_flush;
+  PyObject *__pyx_n_s_flush_threshold;
   PyObject *__pyx_kp_u_gc;
+  PyObject *__pyx_n_s_genexpr;
   PyObject *__pyx_n_s_getstate;
+  PyObject *__pyx_n_s_i;
   PyObject *__pyx_n_s_import;
+  PyObject *__pyx_n_s_initializing;
   PyObject *__pyx_n_s_is_coroutine;
   PyObject *__pyx_kp_u_isenabled;
-  PyObject *__pyx_kp_s_isf_pandas_msgpack_msgpack__pack;
-  PyObject *__pyx_n_s_isf_pandas_msgpack_msgpack__pack_2;
+  PyObject *__pyx_n_s_isf_pandas_msgpack_msgpack__pack;
+  PyObject *__pyx_kp_s_isf_pandas_msgpack_msgpack__pack_2;
   PyObject *__pyx_n_s_items;
   PyObject *__pyx_n_s_iteritems;
   PyObject *__pyx_n_s_k;
   PyObject *__pyx_kp_s_list_is_too_large;
   PyObject *__pyx_n_s_main;
+  PyObject *__pyx_n_s_n;
   PyObject *__pyx_n_s_name;
   PyObject *__pyx_kp_s_no_default___reduce___due_to_non;
   PyObject *__pyx_n_s_obj;
+  PyObject *__pyx_n_s_offset;
+  PyObject *__pyx_n_s_os;
   PyObject *__pyx_n_s_pack;
   PyObject *__pyx_n_s_pack_array_header;
   PyObject *__pyx_n_s_pack_ext_type;
   PyObject *__pyx_n_s_pack_map_header;
   PyObject *__pyx_n_s_pack_map_pairs;
+  PyObject *__pyx_n_s_pack_segments;
+  PyObject *__pyx_kp_s_pack_segments_can_t_be_used_with;
+  PyObject *__pyx_n_u_pad;
   PyObject *__pyx_n_s_pairs;
   PyObject *__pyx_n_s_pyx_state;
   PyObject *__pyx_n_s_pyx_vtable;
@@ -2699,44 +3122,68 @@ typedef struct {
   PyObject *__pyx_n_s_reduce_ex;
   PyObject *__pyx_n_s_reset;
   PyObject *__pyx_n_s_ret;
+  PyObject *__pyx_n_s_s;
+  PyObject *__pyx_n_s_segments;
   PyObject *__pyx_n_s_self;
+  PyObject *__pyx_n_s_send;
   PyObject *__pyx_n_s_setstate;
   PyObject *__pyx_n_s_setstate_cython;
   PyObject *__pyx_n_s_size;
+  PyObject *__pyx_n_s_spec;
+  PyObject *__pyx_n_s_stream;
   PyObject *__pyx_n_s_strict;
   PyObject *__pyx_kp_s_stringsource;
+  PyObject *__pyx_n_s_sum;
+  PyObject *__pyx_n_s_tell;
   PyObject *__pyx_n_s_test;
+  PyObject *__pyx_n_s_throw;
   PyObject *__pyx_n_s_typecode;
   PyObject *__pyx_n_s_unicode_errors;
   PyObject *__pyx_n_s_use_bin_type;
   PyObject *__pyx_n_s_use_single_float;
   PyObject *__pyx_kp_s_utf_8;
   PyObject *__pyx_n_s_v;
+  PyObject *__pyx_n_s_view;
+  PyObject *__pyx_n_s_views;
+  PyObject *__pyx_n_s_write;
+  PyObject *__pyx_n_s_writev;
+  PyObject *__pyx_n_s_writev_2;
   PyObject *__pyx_int_0;
+  PyObject *__pyx_int_2;
   PyObject *__pyx_int_4294967295;
-  int __pyx_k__3;
+  size_t __pyx_k__2;
+  int __pyx_k__7;
   PyObject *__pyx_tuple_;
-  PyObject *__pyx_tuple__2;
+  PyObject *__pyx_tuple__3;
   PyObject *__pyx_tuple__4;
   PyObject *__pyx_tuple__5;
   PyObject *__pyx_tuple__6;
-  PyObject *__pyx_tuple__7;
   PyObject *__pyx_tuple__8;
+  PyObject *__pyx_tuple__9;
+  PyObject *__pyx_tuple__10;
   PyObject *__pyx_tuple__11;
+  PyObject *__pyx_tuple__12;
   PyObject *__pyx_tuple__13;
-  PyObject *__pyx_tuple__15;
-  PyObject *__pyx_tuple__18;
-  PyObject *__pyx_tuple__20;
-  PyObject *__pyx_tuple__24;
-  PyObject *__pyx_codeobj__12;
-  PyObject *__pyx_codeobj__14;
-  PyObject *__pyx_codeobj__16;
-  PyObject *__pyx_codeobj__17;
-  PyObject *__pyx_codeobj__19;
+  PyObject *__pyx_tuple__17;
+  PyObject *__pyx_tuple__19;
+  PyObject *__pyx_tuple__22;
+  PyObject *__pyx_tuple__25;
+  PyObject *__pyx_tuple__27;
+  PyObject *__pyx_tuple__30;
+  PyObject *__pyx_tuple__35;
+  PyObject *__pyx_codeobj__18;
+  PyObject *__pyx_codeobj__20;
   PyObject *__pyx_codeobj__21;
-  PyObject *__pyx_codeobj__22;
   PyObject *__pyx_codeobj__23;
-  PyObject *__pyx_codeobj__25;
+  PyObject *__pyx_codeobj__24;
+  PyObject *__pyx_codeobj__26;
+  PyObject *__pyx_codeobj__28;
+  PyObject *__pyx_codeobj__29;
+  PyObject *__pyx_codeobj__31;
+  PyObject *__pyx_codeobj__32;
+  PyObject *__pyx_codeobj__33;
+  PyObject *__pyx_codeobj__34;
+  PyObject *__pyx_codeobj__36;
 } __pyx_mstate;
 
 #if CYTHON_USE_MODULE_STATE
@@ -2784,35 +3231,54 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_ptype_7cpython_7complex_complex);
   Py_CLEAR(clear_module_state->__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer);
   Py_CLEAR(clear_module_state->__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer_Packer);
+  Py_CLEAR(clear_module_state->__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack);
+  Py_CLEAR(clear_module_state->__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack);
+  Py_CLEAR(clear_module_state->__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr);
+  Py_CLEAR(clear_module_state->__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr);
+  Py_CLEAR(clear_module_state->__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr);
+  Py_CLEAR(clear_module_state->__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr);
+  Py_CLEAR(clear_module_state->__pyx_n_s_B);
   Py_CLEAR(clear_module_state->__pyx_kp_s_Can_t_encode_unicode_string_no_e);
   Py_CLEAR(clear_module_state->__pyx_kp_s_EXT_data_is_too_large);
   Py_CLEAR(clear_module_state->__pyx_n_s_ExtType);
   Py_CLEAR(clear_module_state->__pyx_n_s_MemoryError);
+  Py_CLEAR(clear_module_state->__pyx_n_s_PAD_KEY);
   Py_CLEAR(clear_module_state->__pyx_n_s_PackValueError);
   Py_CLEAR(clear_module_state->__pyx_n_s_Packer);
   Py_CLEAR(clear_module_state->__pyx_n_s_Packer___reduce_cython);
   Py_CLEAR(clear_module_state->__pyx_n_s_Packer___setstate_cython);
+  Py_CLEAR(clear_module_state->__pyx_n_s_Packer__pack_locals_genexpr);
   Py_CLEAR(clear_module_state->__pyx_n_s_Packer_bytes);
+  Py_CLEAR(clear_module_state->__pyx_n_s_Packer_flush);
+  Py_CLEAR(clear_module_state->__pyx_kp_s_Packer_has_no_stream_to_flush_to);
   Py_CLEAR(clear_module_state->__pyx_n_s_Packer_pack);
   Py_CLEAR(clear_module_state->__pyx_n_s_Packer_pack_array_header);
   Py_CLEAR(clear_module_state->__pyx_n_s_Packer_pack_ext_type);
   Py_CLEAR(clear_module_state->__pyx_n_s_Packer_pack_map_header);
   Py_CLEAR(clear_module_state->__pyx_n_s_Packer_pack_map_pairs);
+  Py_CLEAR(clear_module_state->__pyx_n_s_Packer_pack_segments);
   Py_CLEAR(clear_module_state->__pyx_n_s_Packer_reset);
+  Py_CLEAR(clear_module_state->__pyx_n_s_Packer_tell);
   Py_CLEAR(clear_module_state->__pyx_n_s_TypeError);
   Py_CLEAR(clear_module_state->__pyx_kp_s_Unable_to_allocate_internal_buff);
   Py_CLEAR(clear_module_state->__pyx_n_s_ValueError);
-  Py_CLEAR(clear_module_state->__pyx_n_s__10);
-  Py_CLEAR(clear_module_state->__pyx_n_s__26);
-  Py_CLEAR(clear_module_state->__pyx_kp_u__9);
+  Py_CLEAR(clear_module_state->__pyx_n_s__14);
+  Py_CLEAR(clear_module_state->__pyx_kp_u__15);
+  Py_CLEAR(clear_module_state->__pyx_n_s__16);
+  Py_CLEAR(clear_module_state->__pyx_n_s__37);
+  Py_CLEAR(clear_module_state->__pyx_n_s_align);
+  Py_CLEAR(clear_module_state->__pyx_kp_s_align_must_be_at_most_256);
+  Py_CLEAR(clear_module_state->__pyx_kp_s_align_requires_use_bin_type);
+  Py_CLEAR(clear_module_state->__pyx_n_s_args);
   Py_CLEAR(clear_module_state->__pyx_n_s_ascii);
   Py_CLEAR(clear_module_state->__pyx_n_s_asyncio_coroutines);
   Py_CLEAR(clear_module_state->__pyx_n_s_autoreset);
-  Py_CLEAR(clear_module_state->__pyx_n_s_buf);
   Py_CLEAR(clear_module_state->__pyx_n_s_bytes);
   Py_CLEAR(clear_module_state->__pyx_kp_s_bytes_is_too_large);
   Py_CLEAR(clear_module_state->__pyx_kp_s_can_t_serialize_r);
+  Py_CLEAR(clear_module_state->__pyx_n_s_cast);
   Py_CLEAR(clear_module_state->__pyx_n_s_cline_in_traceback);
+  Py_CLEAR(clear_module_state->__pyx_n_s_close);
   Py_CLEAR(clear_module_state->__pyx_n_s_code);
   Py_CLEAR(clear_module_state->__pyx_n_s_data);
   Py_CLEAR(clear_module_state->__pyx_n_s_default);
@@ -2823,26 +3289,38 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_encode);
   Py_CLEAR(clear_module_state->__pyx_n_s_encoding);
   Py_CLEAR(clear_module_state->__pyx_n_s_exceptions);
+  Py_CLEAR(clear_module_state->__pyx_n_s_fd);
+  Py_CLEAR(clear_module_state->__pyx_n_s_flush);
+  Py_CLEAR(clear_module_state->__pyx_n_s_flush_threshold);
   Py_CLEAR(clear_module_state->__pyx_kp_u_gc);
+  Py_CLEAR(clear_module_state->__pyx_n_s_genexpr);
   Py_CLEAR(clear_module_state->__pyx_n_s_getstate);
+  Py_CLEAR(clear_module_state->__pyx_n_s_i);
   Py_CLEAR(clear_module_state->__pyx_n_s_import);
+  Py_CLEAR(clear_module_state->__pyx_n_s_initializing);
   Py_CLEAR(clear_module_state->__pyx_n_s_is_coroutine);
   Py_CLEAR(clear_module_state->__pyx_kp_u_isenabled);
-  Py_CLEAR(clear_module_state->__pyx_kp_s_isf_pandas_msgpack_msgpack__pack);
-  Py_CLEAR(clear_module_state->__pyx_n_s_isf_pandas_msgpack_msgpack__pack_2);
+  Py_CLEAR(clear_module_state->__pyx_n_s_isf_pandas_msgpack_msgpack__pack);
+  Py_CLEAR(clear_module_state->__pyx_kp_s_isf_pandas_msgpack_msgpack__pack_2);
   Py_CLEAR(clear_module_state->__pyx_n_s_items);
   Py_CLEAR(clear_module_state->__pyx_n_s_iteritems);
   Py_CLEAR(clear_module_state->__pyx_n_s_k);
   Py_CLEAR(clear_module_state->__pyx_kp_s_list_is_too_large);
   Py_CLEAR(clear_module_state->__pyx_n_s_main);
+  Py_CLEAR(clear_module_state->__pyx_n_s_n);
   Py_CLEAR(clear_module_state->__pyx_n_s_name);
   Py_CLEAR(clear_module_state->__pyx_kp_s_no_default___reduce___due_to_non);
   Py_CLEAR(clear_module_state->__pyx_n_s_obj);
+  Py_CLEAR(clear_module_state->__pyx_n_s_offset);
+  Py_CLEAR(clear_module_state->__pyx_n_s_os);
   Py_CLEAR(clear_module_state->__pyx_n_s_pack);
   Py_CLEAR(clear_module_state->__pyx_n_s_pack_array_header);
   Py_CLEAR(clear_module_state->__pyx_n_s_pack_ext_type);
   Py_CLEAR(clear_module_state->__pyx_n_s_pack_map_header);
   Py_CLEAR(clear_module_state->__pyx_n_s_pack_map_pairs);
+  Py_CLEAR(clear_module_state->__pyx_n_s_pack_segments);
+  Py_CLEAR(clear_module_state->__pyx_kp_s_pack_segments_can_t_be_used_with);
+  Py_CLEAR(clear_module_state->__pyx_n_u_pad);
   Py_CLEAR(clear_module_state->__pyx_n_s_pairs);
   Py_CLEAR(clear_module_state->__pyx_n_s_pyx_state);
   Py_CLEAR(clear_module_state->__pyx_n_s_pyx_vtable);
@@ -2852,43 +3330,66 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_reduce_ex);
   Py_CLEAR(clear_module_state->__pyx_n_s_reset);
   Py_CLEAR(clear_module_state->__pyx_n_s_ret);
+  Py_CLEAR(clear_module_state->__pyx_n_s_s);
+  Py_CLEAR(clear_module_state->__pyx_n_s_segments);
   Py_CLEAR(clear_module_state->__pyx_n_s_self);
+  Py_CLEAR(clear_module_state->__pyx_n_s_send);
   Py_CLEAR(clear_module_state->__pyx_n_s_setstate);
   Py_CLEAR(clear_module_state->__pyx_n_s_setstate_cython);
   Py_CLEAR(clear_module_state->__pyx_n_s_size);
+  Py_CLEAR(clear_module_state->__pyx_n_s_spec);
+  Py_CLEAR(clear_module_state->__pyx_n_s_stream);
   Py_CLEAR(clear_module_state->__pyx_n_s_strict);
   Py_CLEAR(clear_module_state->__pyx_kp_s_stringsource);
+  Py_CLEAR(clear_module_state->__pyx_n_s_sum);
+  Py_CLEAR(clear_module_state->__pyx_n_s_tell);
   Py_CLEAR(clear_module_state->__pyx_n_s_test);
+  Py_CLEAR(clear_module_state->__pyx_n_s_throw);
   Py_CLEAR(clear_module_state->__pyx_n_s_typecode);
   Py_CLEAR(clear_module_state->__pyx_n_s_unicode_errors);
   Py_CLEAR(clear_module_state->__pyx_n_s_use_bin_type);
   Py_CLEAR(clear_module_state->__pyx_n_s_use_single_float);
   Py_CLEAR(clear_module_state->__pyx_kp_s_utf_8);
   Py_CLEAR(clear_module_state->__pyx_n_s_v);
+  Py_CLEAR(clear_module_state->__pyx_n_s_view);
+  Py_CLEAR(clear_module_state->__pyx_n_s_views);
+  Py_CLEAR(clear_module_state->__pyx_n_s_write);
+  Py_CLEAR(clear_module_state->__pyx_n_s_writev);
+  Py_CLEAR(clear_module_state->__pyx_n_s_writev_2);
   Py_CLEAR(clear_module_state->__pyx_int_0);
+  Py_CLEAR(clear_module_state->__pyx_int_2);
   Py_CLEAR(clear_module_state->__pyx_int_4294967295);
   Py_CLEAR(clear_module_state->__pyx_tuple_);
-  Py_CLEAR(clear_module_state->__pyx_tuple__2);
+  Py_CLEAR(clear_module_state->__pyx_tuple__3);
   Py_CLEAR(clear_module_state->__pyx_tuple__4);
   Py_CLEAR(clear_module_state->__pyx_tuple__5);
   Py_CLEAR(clear_module_state->__pyx_tuple__6);
-  Py_CLEAR(clear_module_state->__pyx_tuple__7);
   Py_CLEAR(clear_module_state->__pyx_tuple__8);
+  Py_CLEAR(clear_module_state->__pyx_tuple__9);
+  Py_CLEAR(clear_module_state->__pyx_tuple__10);
   Py_CLEAR(clear_module_state->__pyx_tuple__11);
+  Py_CLEAR(clear_module_state->__pyx_tuple__12);
   Py_CLEAR(clear_module_state->__pyx_tuple__13);
-  Py_CLEAR(clear_module_state->__pyx_tuple__15);
-  Py_CLEAR(clear_module_state->__pyx_tuple__18);
-  Py_CLEAR(clear_module_state->__pyx_tuple__20);
-  Py_CLEAR(clear_module_state->__pyx_tuple__24);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__12);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__14);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__16);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__17);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__19);
+  Py_CLEAR(clear_module_state->__pyx_tuple__17);
+  Py_CLEAR(clear_module_state->__pyx_tuple__19);
+  Py_CLEAR(clear_module_state->__pyx_tuple__22);
+  Py_CLEAR(clear_module_state->__pyx_tuple__25);
+  Py_CLEAR(clear_module_state->__pyx_tuple__27);
+  Py_CLEAR(clear_module_state->__pyx_tuple__30);
+  Py_CLEAR(clear_module_state->__pyx_tuple__35);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__18);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__20);
   Py_CLEAR(clear_module_state->__pyx_codeobj__21);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__22);
   Py_CLEAR(clear_module_state->__pyx_codeobj__23);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__25);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__24);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__26);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__28);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__29);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__31);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__32);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__33);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__34);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__36);
   return 0;
 }
 #endif
@@ -2914,35 +3415,54 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_ptype_7cpython_7complex_complex);
   Py_VISIT(traverse_module_state->__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer);
   Py_VISIT(traverse_module_state->__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer_Packer);
+  Py_VISIT(traverse_module_state->__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack);
+  Py_VISIT(traverse_module_state->__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack);
+  Py_VISIT(traverse_module_state->__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr);
+  Py_VISIT(traverse_module_state->__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr);
+  Py_VISIT(traverse_module_state->__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr);
+  Py_VISIT(traverse_module_state->__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr);
+  Py_VISIT(traverse_module_state->__pyx_n_s_B);
   Py_VISIT(traverse_module_state->__pyx_kp_s_Can_t_encode_unicode_string_no_e);
   Py_VISIT(traverse_module_state->__pyx_kp_s_EXT_data_is_too_large);
   Py_VISIT(traverse_module_state->__pyx_n_s_ExtType);
   Py_VISIT(traverse_module_state->__pyx_n_s_MemoryError);
+  Py_VISIT(traverse_module_state->__pyx_n_s_PAD_KEY);
   Py_VISIT(traverse_module_state->__pyx_n_s_PackValueError);
   Py_VISIT(traverse_module_state->__pyx_n_s_Packer);
   Py_VISIT(traverse_module_state->__pyx_n_s_Packer___reduce_cython);
   Py_VISIT(traverse_module_state->__pyx_n_s_Packer___setstate_cython);
+  Py_VISIT(traverse_module_state->__pyx_n_s_Packer__pack_locals_genexpr);
   Py_VISIT(traverse_module_state->__pyx_n_s_Packer_bytes);
+  Py_VISIT(traverse_module_state->__pyx_n_s_Packer_flush);
+  Py_VISIT(traverse_module_state->__pyx_kp_s_Packer_has_no_stream_to_flush_to);
   Py_VISIT(traverse_module_state->__pyx_n_s_Packer_pack);
   Py_VISIT(traverse_module_state->__pyx_n_s_Packer_pack_array_header);
   Py_VISIT(traverse_module_state->__pyx_n_s_Packer_pack_ext_type);
   Py_VISIT(traverse_module_state->__pyx_n_s_Packer_pack_map_header);
   Py_VISIT(traverse_module_state->__pyx_n_s_Packer_pack_map_pairs);
+  Py_VISIT(traverse_module_state->__pyx_n_s_Packer_pack_segments);
   Py_VISIT(traverse_module_state->__pyx_n_s_Packer_reset);
+  Py_VISIT(traverse_module_state->__pyx_n_s_Packer_tell);
   Py_VISIT(traverse_module_state->__pyx_n_s_TypeError);
   Py_VISIT(traverse_module_state->__pyx_kp_s_Unable_to_allocate_internal_buff);
   Py_VISIT(traverse_module_state->__pyx_n_s_ValueError);
-  Py_VISIT(traverse_module_state->__pyx_n_s__10);
-  Py_VISIT(traverse_module_state->__pyx_n_s__26);
-  Py_VISIT(traverse_module_state->__pyx_kp_u__9);
+  Py_VISIT(traverse_module_state->__pyx_n_s__14);
+  Py_VISIT(traverse_module_state->__pyx_kp_u__15);
+  Py_VISIT(traverse_module_state->__pyx_n_s__16);
+  Py_VISIT(traverse_module_state->__pyx_n_s__37);
+  Py_VISIT(traverse_module_state->__pyx_n_s_align);
+  Py_VISIT(traverse_module_state->__pyx_kp_s_align_must_be_at_most_256);
+  Py_VISIT(traverse_module_state->__pyx_kp_s_align_requires_use_bin_type);
+  Py_VISIT(traverse_module_state->__pyx_n_s_args);
   Py_VISIT(traverse_module_state->__pyx_n_s_ascii);
   Py_VISIT(traverse_module_state->__pyx_n_s_asyncio_coroutines);
   Py_VISIT(traverse_module_state->__pyx_n_s_autoreset);
-  Py_VISIT(traverse_module_state->__pyx_n_s_buf);
   Py_VISIT(traverse_module_state->__pyx_n_s_bytes);
   Py_VISIT(traverse_module_state->__pyx_kp_s_bytes_is_too_large);
   Py_VISIT(traverse_module_state->__pyx_kp_s_can_t_serialize_r);
+  Py_VISIT(traverse_module_state->__pyx_n_s_cast);
   Py_VISIT(traverse_module_state->__pyx_n_s_cline_in_traceback);
+  Py_VISIT(traverse_module_state->__pyx_n_s_close);
   Py_VISIT(traverse_module_state->__pyx_n_s_code);
   Py_VISIT(traverse_module_state->__pyx_n_s_data);
   Py_VISIT(traverse_module_state->__pyx_n_s_default);
@@ -2953,26 +3473,38 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_encode);
   Py_VISIT(traverse_module_state->__pyx_n_s_encoding);
   Py_VISIT(traverse_module_state->__pyx_n_s_exceptions);
+  Py_VISIT(traverse_module_state->__pyx_n_s_fd);
+  Py_VISIT(traverse_module_state->__pyx_n_s_flush);
+  Py_VISIT(traverse_module_state->__pyx_n_s_flush_threshold);
   Py_VISIT(traverse_module_state->__pyx_kp_u_gc);
+  Py_VISIT(traverse_module_state->__pyx_n_s_genexpr);
   Py_VISIT(traverse_module_state->__pyx_n_s_getstate);
+  Py_VISIT(traverse_module_state->__pyx_n_s_i);
   Py_VISIT(traverse_module_state->__pyx_n_s_import);
+  Py_VISIT(traverse_module_state->__pyx_n_s_initializing);
   Py_VISIT(traverse_module_state->__pyx_n_s_is_coroutine);
   Py_VISIT(traverse_module_state->__pyx_kp_u_isenabled);
-  Py_VISIT(traverse_module_state->__pyx_kp_s_isf_pandas_msgpack_msgpack__pack);
-  Py_VISIT(traverse_module_state->__pyx_n_s_isf_pandas_msgpack_msgpack__pack_2);
+  Py_VISIT(traverse_module_state->__pyx_n_s_isf_pandas_msgpack_msgpack__pack);
+  Py_VISIT(traverse_module_state->__pyx_kp_s_isf_pandas_msgpack_msgpack__pack_2);
   Py_VISIT(traverse_module_state->__pyx_n_s_items);
   Py_VISIT(traverse_module_state->__pyx_n_s_iteritems);
   Py_VISIT(traverse_module_state->__pyx_n_s_k);
   Py_VISIT(traverse_module_state->__pyx_kp_s_list_is_too_large);
   Py_VISIT(traverse_module_state->__pyx_n_s_main);
+  Py_VISIT(traverse_module_state->__pyx_n_s_n);
   Py_VISIT(traverse_module_state->__pyx_n_s_name);
   Py_VISIT(traverse_module_state->__pyx_kp_s_no_default___reduce___due_to_non);
   Py_VISIT(traverse_module_state->__pyx_n_s_obj);
+  Py_VISIT(traverse_module_state->__pyx_n_s_offset);
+  Py_VISIT(traverse_module_state->__pyx_n_s_os);
   Py_VISIT(traverse_module_state->__pyx_n_s_pack);
   Py_VISIT(traverse_module_state->__pyx_n_s_pack_array_header);
   Py_VISIT(traverse_module_state->__pyx_n_s_pack_ext_type);
   Py_VISIT(traverse_module_state->__pyx_n_s_pack_map_header);
   Py_VISIT(traverse_module_state->__pyx_n_s_pack_map_pairs);
+  Py_VISIT(traverse_module_state->__pyx_n_s_pack_segments);
+  Py_VISIT(traverse_module_state->__pyx_kp_s_pack_segments_can_t_be_used_with);
+  Py_VISIT(traverse_module_state->__pyx_n_u_pad);
   Py_VISIT(traverse_module_state->__pyx_n_s_pairs);
   Py_VISIT(traverse_module_state->__pyx_n_s_pyx_state);
   Py_VISIT(traverse_module_state->__pyx_n_s_pyx_vtable);
@@ -2982,43 +3514,66 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_reduce_ex);
   Py_VISIT(traverse_module_state->__pyx_n_s_reset);
   Py_VISIT(traverse_module_state->__pyx_n_s_ret);
+  Py_VISIT(traverse_module_state->__pyx_n_s_s);
+  Py_VISIT(traverse_module_state->__pyx_n_s_segments);
   Py_VISIT(traverse_module_state->__pyx_n_s_self);
+  Py_VISIT(traverse_module_state->__pyx_n_s_send);
   Py_VISIT(traverse_module_state->__pyx_n_s_setstate);
   Py_VISIT(traverse_module_state->__pyx_n_s_setstate_cython);
   Py_VISIT(traverse_module_state->__pyx_n_s_size);
+  Py_VISIT(traverse_module_state->__pyx_n_s_spec);
+  Py_VISIT(traverse_module_state->__pyx_n_s_stream);
   Py_VISIT(traverse_module_state->__pyx_n_s_strict);
   Py_VISIT(traverse_module_state->__pyx_kp_s_stringsource);
+  Py_VISIT(traverse_module_state->__pyx_n_s_sum);
+  Py_VISIT(traverse_module_state->__pyx_n_s_tell);
   Py_VISIT(traverse_module_state->__pyx_n_s_test);
+  Py_VISIT(traverse_module_state->__pyx_n_s_throw);
   Py_VISIT(traverse_module_state->__pyx_n_s_typecode);
   Py_VISIT(traverse_module_state->__pyx_n_s_unicode_errors);
   Py_VISIT(traverse_module_state->__pyx_n_s_use_bin_type);
   Py_VISIT(traverse_module_state->__pyx_n_s_use_single_float);
   Py_VISIT(traverse_module_state->__pyx_kp_s_utf_8);
   Py_VISIT(traverse_module_state->__pyx_n_s_v);
+  Py_VISIT(traverse_module_state->__pyx_n_s_view);
+  Py_VISIT(traverse_module_state->__pyx_n_s_views);
+  Py_VISIT(traverse_module_state->__pyx_n_s_write);
+  Py_VISIT(traverse_module_state->__pyx_n_s_writev);
+  Py_VISIT(traverse_module_state->__pyx_n_s_writev_2);
   Py_VISIT(traverse_module_state->__pyx_int_0);
+  Py_VISIT(traverse_module_state->__pyx_int_2);
   Py_VISIT(traverse_module_state->__pyx_int_4294967295);
   Py_VISIT(traverse_module_state->__pyx_tuple_);
-  Py_VISIT(traverse_module_state->__pyx_tuple__2);
+  Py_VISIT(traverse_module_state->__pyx_tuple__3);
   Py_VISIT(traverse_module_state->__pyx_tuple__4);
   Py_VISIT(traverse_module_state->__pyx_tuple__5);
   Py_VISIT(traverse_module_state->__pyx_tuple__6);
-  Py_VISIT(traverse_module_state->__pyx_tuple__7);
   Py_VISIT(traverse_module_state->__pyx_tuple__8);
+  Py_VISIT(traverse_module_state->__pyx_tuple__9);
+  Py_VISIT(traverse_module_state->__pyx_tuple__10);
   Py_VISIT(traverse_module_state->__pyx_tuple__11);
+  Py_VISIT(traverse_module_state->__pyx_tuple__12);
   Py_VISIT(traverse_module_state->__pyx_tuple__13);
-  Py_VISIT(traverse_module_state->__pyx_tuple__15);
-  Py_VISIT(traverse_module_state->__pyx_tuple__18);
-  Py_VISIT(traverse_module_state->__pyx_tuple__20);
-  Py_VISIT(traverse_module_state->__pyx_tuple__24);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__12);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__14);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__16);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__17);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__19);
+  Py_VISIT(traverse_module_state->__pyx_tuple__17);
+  Py_VISIT(traverse_module_state->__pyx_tuple__19);
+  Py_VISIT(traverse_module_state->__pyx_tuple__22);
+  Py_VISIT(traverse_module_state->__pyx_tuple__25);
+  Py_VISIT(traverse_module_state->__pyx_tuple__27);
+  Py_VISIT(traverse_module_state->__pyx_tuple__30);
+  Py_VISIT(traverse_module_state->__pyx_tuple__35);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__18);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__20);
   Py_VISIT(traverse_module_state->__pyx_codeobj__21);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__22);
   Py_VISIT(traverse_module_state->__pyx_codeobj__23);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__25);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__24);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__26);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__28);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__29);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__31);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__32);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__33);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__34);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__36);
   return 0;
 }
 #endif
@@ -3141,38 +3696,59 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #if CYTHON_USE_MODULE_STATE
 #endif
 #if CYTHON_USE_MODULE_STATE
+#endif
+#if CYTHON_USE_MODULE_STATE
 #define __pyx_type_18isf_pandas_msgpack_7msgpack_7_packer_Packer __pyx_mstate_global->__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer_Packer
+#define __pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack __pyx_mstate_global->__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack
+#define __pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr __pyx_mstate_global->__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr
+#define __pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr __pyx_mstate_global->__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr
 #endif
 #define __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer __pyx_mstate_global->__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer
+#define __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack __pyx_mstate_global->__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack
+#define __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr __pyx_mstate_global->__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr
+#define __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr __pyx_mstate_global->__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr
+#define __pyx_n_s_B __pyx_mstate_global->__pyx_n_s_B
 #define __pyx_kp_s_Can_t_encode_unicode_string_no_e __pyx_mstate_global->__pyx_kp_s_Can_t_encode_unicode_string_no_e
 #define __pyx_kp_s_EXT_data_is_too_large __pyx_mstate_global->__pyx_kp_s_EXT_data_is_too_large
 #define __pyx_n_s_ExtType __pyx_mstate_global->__pyx_n_s_ExtType
 #define __pyx_n_s_MemoryError __pyx_mstate_global->__pyx_n_s_MemoryError
+#define __pyx_n_s_PAD_KEY __pyx_mstate_global->__pyx_n_s_PAD_KEY
 #define __pyx_n_s_PackValueError __pyx_mstate_global->__pyx_n_s_PackValueError
 #define __pyx_n_s_Packer __pyx_mstate_global->__pyx_n_s_Packer
 #define __pyx_n_s_Packer___reduce_cython __pyx_mstate_global->__pyx_n_s_Packer___reduce_cython
 #define __pyx_n_s_Packer___setstate_cython __pyx_mstate_global->__pyx_n_s_Packer___setstate_cython
+#define __pyx_n_s_Packer__pack_locals_genexpr __pyx_mstate_global->__pyx_n_s_Packer__pack_locals_genexpr
 #define __pyx_n_s_Packer_bytes __pyx_mstate_global->__pyx_n_s_Packer_bytes
+#define __pyx_n_s_Packer_flush __pyx_mstate_global->__pyx_n_s_Packer_flush
+#define __pyx_kp_s_Packer_has_no_stream_to_flush_to __pyx_mstate_global->__pyx_kp_s_Packer_has_no_stream_to_flush_to
 #define __pyx_n_s_Packer_pack __pyx_mstate_global->__pyx_n_s_Packer_pack
 #define __pyx_n_s_Packer_pack_array_header __pyx_mstate_global->__pyx_n_s_Packer_pack_array_header
 #define __pyx_n_s_Packer_pack_ext_type __pyx_mstate_global->__pyx_n_s_Packer_pack_ext_type
 #define __pyx_n_s_Packer_pack_map_header __pyx_mstate_global->__pyx_n_s_Packer_pack_map_header
 #define __pyx_n_s_Packer_pack_map_pairs __pyx_mstate_global->__pyx_n_s_Packer_pack_map_pairs
+#define __pyx_n_s_Packer_pack_segments __pyx_mstate_global->__pyx_n_s_Packer_pack_segments
 #define __pyx_n_s_Packer_reset __pyx_mstate_global->__pyx_n_s_Packer_reset
+#define __pyx_n_s_Packer_tell __pyx_mstate_global->__pyx_n_s_Packer_tell
 #define __pyx_n_s_TypeError __pyx_mstate_global->__pyx_n_s_TypeError
 #define __pyx_kp_s_Unable_to_allocate_internal_buff __pyx_mstate_global->__pyx_kp_s_Unable_to_allocate_internal_buff
 #define __pyx_n_s_ValueError __pyx_mstate_global->__pyx_n_s_ValueError
-#define __pyx_n_s__10 __pyx_mstate_global->__pyx_n_s__10
-#define __pyx_n_s__26 __pyx_mstate_global->__pyx_n_s__26
-#define __pyx_kp_u__9 __pyx_mstate_global->__pyx_kp_u__9
+#define __pyx_n_s__14 __pyx_mstate_global->__pyx_n_s__14
+#define __pyx_kp_u__15 __pyx_mstate_global->__pyx_kp_u__15
+#define __pyx_n_s__16 __pyx_mstate_global->__pyx_n_s__16
+#define __pyx_n_s__37 __pyx_mstate_global->__pyx_n_s__37
+#define __pyx_n_s_align __pyx_mstate_global->__pyx_n_s_align
+#define __pyx_kp_s_align_must_be_at_most_256 __pyx_mstate_global->__pyx_kp_s_align_must_be_at_most_256
+#define __pyx_kp_s_align_requires_use_bin_type __pyx_mstate_global->__pyx_kp_s_align_requires_use_bin_type
+#define __pyx_n_s_args __pyx_mstate_global->__pyx_n_s_args
 #define __pyx_n_s_ascii __pyx_mstate_global->__pyx_n_s_ascii
 #define __pyx_n_s_asyncio_coroutines __pyx_mstate_global->__pyx_n_s_asyncio_coroutines
 #define __pyx_n_s_autoreset __pyx_mstate_global->__pyx_n_s_autoreset
-#define __pyx_n_s_buf __pyx_mstate_global->__pyx_n_s_buf
 #define __pyx_n_s_bytes __pyx_mstate_global->__pyx_n_s_bytes
 #define __pyx_kp_s_bytes_is_too_large __pyx_mstate_global->__pyx_kp_s_bytes_is_too_large
 #define __pyx_kp_s_can_t_serialize_r __pyx_mstate_global->__pyx_kp_s_can_t_serialize_r
+#define __pyx_n_s_cast __pyx_mstate_global->__pyx_n_s_cast
 #define __pyx_n_s_cline_in_traceback __pyx_mstate_global->__pyx_n_s_cline_in_traceback
+#define __pyx_n_s_close __pyx_mstate_global->__pyx_n_s_close
 #define __pyx_n_s_code __pyx_mstate_global->__pyx_n_s_code
 #define __pyx_n_s_data __pyx_mstate_global->__pyx_n_s_data
 #define __pyx_n_s_default __pyx_mstate_global->__pyx_n_s_default
@@ -3183,26 +3759,38 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_encode __pyx_mstate_global->__pyx_n_s_encode
 #define __pyx_n_s_encoding __pyx_mstate_global->__pyx_n_s_encoding
 #define __pyx_n_s_exceptions __pyx_mstate_global->__pyx_n_s_exceptions
+#define __pyx_n_s_fd __pyx_mstate_global->__pyx_n_s_fd
+#define __pyx_n_s_flush __pyx_mstate_global->__pyx_n_s_flush
+#define __pyx_n_s_flush_threshold __pyx_mstate_global->__pyx_n_s_flush_threshold
 #define __pyx_kp_u_gc __pyx_mstate_global->__pyx_kp_u_gc
+#define __pyx_n_s_genexpr __pyx_mstate_global->__pyx_n_s_genexpr
 #define __pyx_n_s_getstate __pyx_mstate_global->__pyx_n_s_getstate
+#define __pyx_n_s_i __pyx_mstate_global->__pyx_n_s_i
 #define __pyx_n_s_import __pyx_mstate_global->__pyx_n_s_import
+#define __pyx_n_s_initializing __pyx_mstate_global->__pyx_n_s_initializing
 #define __pyx_n_s_is_coroutine __pyx_mstate_global->__pyx_n_s_is_coroutine
 #define __pyx_kp_u_isenabled __pyx_mstate_global->__pyx_kp_u_isenabled
-#define __pyx_kp_s_isf_pandas_msgpack_msgpack__pack __pyx_mstate_global->__pyx_kp_s_isf_pandas_msgpack_msgpack__pack
-#define __pyx_n_s_isf_pandas_msgpack_msgpack__pack_2 __pyx_mstate_global->__pyx_n_s_isf_pandas_msgpack_msgpack__pack_2
+#define __pyx_n_s_isf_pandas_msgpack_msgpack__pack __pyx_mstate_global->__pyx_n_s_isf_pandas_msgpack_msgpack__pack
+#define __pyx_kp_s_isf_pandas_msgpack_msgpack__pack_2 __pyx_mstate_global->__pyx_kp_s_isf_pandas_msgpack_msgpack__pack_2
 #define __pyx_n_s_items __pyx_mstate_global->__pyx_n_s_items
 #define __pyx_n_s_iteritems __pyx_mstate_global->__pyx_n_s_iteritems
 #define __pyx_n_s_k __pyx_mstate_global->__pyx_n_s_k
 #define __pyx_kp_s_list_is_too_large __pyx_mstate_global->__pyx_kp_s_list_is_too_large
 #define __pyx_n_s_main __pyx_mstate_global->__pyx_n_s_main
+#define __pyx_n_s_n __pyx_mstate_global->__pyx_n_s_n
 #define __pyx_n_s_name __pyx_mstate_global->__pyx_n_s_name
 #define __pyx_kp_s_no_default___reduce___due_to_non __pyx_mstate_global->__pyx_kp_s_no_default___reduce___due_to_non
 #define __pyx_n_s_obj __pyx_mstate_global->__pyx_n_s_obj
+#define __pyx_n_s_offset __pyx_mstate_global->__pyx_n_s_offset
+#define __pyx_n_s_os __pyx_mstate_global->__pyx_n_s_os
 #define __pyx_n_s_pack __pyx_mstate_global->__pyx_n_s_pack
 #define __pyx_n_s_pack_array_header __pyx_mstate_global->__pyx_n_s_pack_array_header
 #define __pyx_n_s_pack_ext_type __pyx_mstate_global->__pyx_n_s_pack_ext_type
 #define __pyx_n_s_pack_map_header __pyx_mstate_global->__pyx_n_s_pack_map_header
 #define __pyx_n_s_pack_map_pairs __pyx_mstate_global->__pyx_n_s_pack_map_pairs
+#define __pyx_n_s_pack_segments __pyx_mstate_global->__pyx_n_s_pack_segments
+#define __pyx_kp_s_pack_segments_can_t_be_used_with __pyx_mstate_global->__pyx_kp_s_pack_segments_can_t_be_used_with
+#define __pyx_n_u_pad __pyx_mstate_global->__pyx_n_u_pad
 #define __pyx_n_s_pairs __pyx_mstate_global->__pyx_n_s_pairs
 #define __pyx_n_s_pyx_state __pyx_mstate_global->__pyx_n_s_pyx_state
 #define __pyx_n_s_pyx_vtable __pyx_mstate_global->__pyx_n_s_pyx_vtable
@@ -3212,44 +3800,68 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_reduce_ex __pyx_mstate_global->__pyx_n_s_reduce_ex
 #define __pyx_n_s_reset __pyx_mstate_global->__pyx_n_s_reset
 #define __pyx_n_s_ret __pyx_mstate_global->__pyx_n_s_ret
+#define __pyx_n_s_s __pyx_mstate_global->__pyx_n_s_s
+#define __pyx_n_s_segments __pyx_mstate_global->__pyx_n_s_segments
 #define __pyx_n_s_self __pyx_mstate_global->__pyx_n_s_self
+#define __pyx_n_s_send __pyx_mstate_global->__pyx_n_s_send
 #define __pyx_n_s_setstate __pyx_mstate_global->__pyx_n_s_setstate
 #define __pyx_n_s_setstate_cython __pyx_mstate_global->__pyx_n_s_setstate_cython
 #define __pyx_n_s_size __pyx_mstate_global->__pyx_n_s_size
+#define __pyx_n_s_spec __pyx_mstate_global->__pyx_n_s_spec
+#define __pyx_n_s_stream __pyx_mstate_global->__pyx_n_s_stream
 #define __pyx_n_s_strict __pyx_mstate_global->__pyx_n_s_strict
 #define __pyx_kp_s_stringsource __pyx_mstate_global->__pyx_kp_s_stringsource
+#define __pyx_n_s_sum __pyx_mstate_global->__pyx_n_s_sum
+#define __pyx_n_s_tell __pyx_mstate_global->__pyx_n_s_tell
 #define __pyx_n_s_test __pyx_mstate_global->__pyx_n_s_test
+#define __pyx_n_s_throw __pyx_mstate_global->__pyx_n_s_throw
 #define __pyx_n_s_typecode __pyx_mstate_global->__pyx_n_s_typecode
 #define __pyx_n_s_unicode_errors __pyx_mstate_global->__pyx_n_s_unicode_errors
 #define __pyx_n_s_use_bin_type __pyx_mstate_global->__pyx_n_s_use_bin_type
 #define __pyx_n_s_use_single_float __pyx_mstate_global->__pyx_n_s_use_single_float
 #define __pyx_kp_s_utf_8 __pyx_mstate_global->__pyx_kp_s_utf_8
 #define __pyx_n_s_v __pyx_mstate_global->__pyx_n_s_v
+#define __pyx_n_s_view __pyx_mstate_global->__pyx_n_s_view
+#define __pyx_n_s_views __pyx_mstate_global->__pyx_n_s_views
+#define __pyx_n_s_write __pyx_mstate_global->__pyx_n_s_write
+#define __pyx_n_s_writev __pyx_mstate_global->__pyx_n_s_writev
+#define __pyx_n_s_writev_2 __pyx_mstate_global->__pyx_n_s_writev_2
 #define __pyx_int_0 __pyx_mstate_global->__pyx_int_0
+#define __pyx_int_2 __pyx_mstate_global->__pyx_int_2
 #define __pyx_int_4294967295 __pyx_mstate_global->__pyx_int_4294967295
-#define __pyx_k__3 __pyx_mstate_global->__pyx_k__3
+#define __pyx_k__2 __pyx_mstate_global->__pyx_k__2
+#define __pyx_k__7 __pyx_mstate_global->__pyx_k__7
 #define __pyx_tuple_ __pyx_mstate_global->__pyx_tuple_
-#define __pyx_tuple__2 __pyx_mstate_global->__pyx_tuple__2
+#define __pyx_tuple__3 __pyx_mstate_global->__pyx_tuple__3
 #define __pyx_tuple__4 __pyx_mstate_global->__pyx_tuple__4
 #define __pyx_tuple__5 __pyx_mstate_global->__pyx_tuple__5
 #define __pyx_tuple__6 __pyx_mstate_global->__pyx_tuple__6
-#define __pyx_tuple__7 __pyx_mstate_global->__pyx_tuple__7
 #define __pyx_tuple__8 __pyx_mstate_global->__pyx_tuple__8
+#define __pyx_tuple__9 __pyx_mstate_global->__pyx_tuple__9
+#define __pyx_tuple__10 __pyx_mstate_global->__pyx_tuple__10
 #define __pyx_tuple__11 __pyx_mstate_global->__pyx_tuple__11
+#define __pyx_tuple__12 __pyx_mstate_global->__pyx_tuple__12
 #define __pyx_tuple__13 __pyx_mstate_global->__pyx_tuple__13
-#define __pyx_tuple__15 __pyx_mstate_global->__pyx_tuple__15
-#define __pyx_tuple__18 __pyx_mstate_global->__pyx_tuple__18
-#define __pyx_tuple__20 __pyx_mstate_global->__pyx_tuple__20
-#define __pyx_tuple__24 __pyx_mstate_global->__pyx_tuple__24
-#define __pyx_codeobj__12 __pyx_mstate_global->__pyx_codeobj__12
-#define __pyx_codeobj__14 __pyx_mstate_global->__pyx_codeobj__14
-#define __pyx_codeobj__16 __pyx_mstate_global->__pyx_codeobj__16
-#define __pyx_codeobj__17 __pyx_mstate_global->__pyx_codeobj__17
-#define __pyx_codeobj__19 __pyx_mstate_global->__pyx_codeobj__19
+#define __pyx_tuple__17 __pyx_mstate_global->__pyx_tuple__17
+#define __pyx_tuple__19 __pyx_mstate_global->__pyx_tuple__19
+#define __pyx_tuple__22 __pyx_mstate_global->__pyx_tuple__22
+#define __pyx_tuple__25 __pyx_mstate_global->__pyx_tuple__25
+#define __pyx_tuple__27 __pyx_mstate_global->__pyx_tuple__27
+#define __pyx_tuple__30 __pyx_mstate_global->__pyx_tuple__30
+#define __pyx_tuple__35 __pyx_mstate_global->__pyx_tuple__35
+#define __pyx_codeobj__18 __pyx_mstate_global->__pyx_codeobj__18
+#define __pyx_codeobj__20 __pyx_mstate_global->__pyx_codeobj__20
 #define __pyx_codeobj__21 __pyx_mstate_global->__pyx_codeobj__21
-#define __pyx_codeobj__22 __pyx_mstate_global->__pyx_codeobj__22
 #define __pyx_codeobj__23 __pyx_mstate_global->__pyx_codeobj__23
-#define __pyx_codeobj__25 __pyx_mstate_global->__pyx_codeobj__25
+#define __pyx_codeobj__24 __pyx_mstate_global->__pyx_codeobj__24
+#define __pyx_codeobj__26 __pyx_mstate_global->__pyx_codeobj__26
+#define __pyx_codeobj__28 __pyx_mstate_global->__pyx_codeobj__28
+#define __pyx_codeobj__29 __pyx_mstate_global->__pyx_codeobj__29
+#define __pyx_codeobj__31 __pyx_mstate_global->__pyx_codeobj__31
+#define __pyx_codeobj__32 __pyx_mstate_global->__pyx_codeobj__32
+#define __pyx_codeobj__33 __pyx_mstate_global->__pyx_codeobj__33
+#define __pyx_codeobj__34 __pyx_mstate_global->__pyx_codeobj__34
+#define __pyx_codeobj__36 __pyx_mstate_global->__pyx_codeobj__36
 /* #### Code section: module_code ### */
 
 /* "cpython/complex.pxd":19
@@ -3545,2491 +4157,2852 @@ static CYTHON_INLINE PyObject *__pyx_f_7cpython_11contextvars_get_value_no_defau
   return __pyx_r;
 }
 
-/* "isf_pandas_msgpack/msgpack/_packer.pyx":79
- *     cdef bint autoreset
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":50
  * 
- *     def __cinit__(self):             # <<<<<<<<<<<<<<
- *         cdef int buf_size = 1024 * 1024
- *         self.pk.buf = <char*> malloc(buf_size)
+ * 
+ * cdef inline size_t _raw_header_size(size_t l, bint use_bin_type):             # <<<<<<<<<<<<<<
+ *     if l < 32:
+ *         return 1
  */
 
-/* Python wrapper */
-static int __pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__cinit__ (wrapper)", 0);
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return -1;
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
-  if (unlikely(__pyx_nargs > 0)) {
-    __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 0, 0, __pyx_nargs); return -1;}
-  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_VARARGS(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__cinit__", 0))) return -1;
-  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer___cinit__(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self));
-
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static int __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer___cinit__(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self) {
-  int __pyx_v_buf_size;
-  int __pyx_r;
-  __Pyx_RefNannyDeclarations
+static CYTHON_INLINE size_t __pyx_f_18isf_pandas_msgpack_7msgpack_7_packer__raw_header_size(size_t __pyx_v_l, int __pyx_v_use_bin_type) {
+  size_t __pyx_r;
   int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__cinit__", 1);
+  int __pyx_t_2;
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":80
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":51
  * 
- *     def __cinit__(self):
- *         cdef int buf_size = 1024 * 1024             # <<<<<<<<<<<<<<
- *         self.pk.buf = <char*> malloc(buf_size)
- *         if self.pk.buf == NULL:
+ * cdef inline size_t _raw_header_size(size_t l, bint use_bin_type):
+ *     if l < 32:             # <<<<<<<<<<<<<<
+ *         return 1
+ *     elif use_bin_type and l < 256:
+ */
+  __pyx_t_1 = (__pyx_v_l < 32);
+  if (__pyx_t_1) {
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":52
+ * cdef inline size_t _raw_header_size(size_t l, bint use_bin_type):
+ *     if l < 32:
+ *         return 1             # <<<<<<<<<<<<<<
+ *     elif use_bin_type and l < 256:
+ *         return 2
+ */
+    __pyx_r = 1;
+    goto __pyx_L0;
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":51
+ * 
+ * cdef inline size_t _raw_header_size(size_t l, bint use_bin_type):
+ *     if l < 32:             # <<<<<<<<<<<<<<
+ *         return 1
+ *     elif use_bin_type and l < 256:
  */
-  __pyx_v_buf_size = 0x100000;
+  }
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":81
- *     def __cinit__(self):
- *         cdef int buf_size = 1024 * 1024
- *         self.pk.buf = <char*> malloc(buf_size)             # <<<<<<<<<<<<<<
- *         if self.pk.buf == NULL:
- *             raise MemoryError("Unable to allocate internal buffer.")
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":53
+ *     if l < 32:
+ *         return 1
+ *     elif use_bin_type and l < 256:             # <<<<<<<<<<<<<<
+ *         return 2
+ *     elif l < 65536:
  */
-  __pyx_v_self->pk.buf = ((char *)malloc(__pyx_v_buf_size));
+  if (__pyx_v_use_bin_type) {
+  } else {
+    __pyx_t_1 = __pyx_v_use_bin_type;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_l < 0x100);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":54
+ *         return 1
+ *     elif use_bin_type and l < 256:
+ *         return 2             # <<<<<<<<<<<<<<
+ *     elif l < 65536:
+ *         return 3
+ */
+    __pyx_r = 2;
+    goto __pyx_L0;
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":82
- *         cdef int buf_size = 1024 * 1024
- *         self.pk.buf = <char*> malloc(buf_size)
- *         if self.pk.buf == NULL:             # <<<<<<<<<<<<<<
- *             raise MemoryError("Unable to allocate internal buffer.")
- *         self.pk.buf_size = buf_size
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":53
+ *     if l < 32:
+ *         return 1
+ *     elif use_bin_type and l < 256:             # <<<<<<<<<<<<<<
+ *         return 2
+ *     elif l < 65536:
  */
-  __pyx_t_1 = (__pyx_v_self->pk.buf == NULL);
-  if (unlikely(__pyx_t_1)) {
+  }
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":83
- *         self.pk.buf = <char*> malloc(buf_size)
- *         if self.pk.buf == NULL:
- *             raise MemoryError("Unable to allocate internal buffer.")             # <<<<<<<<<<<<<<
- *         self.pk.buf_size = buf_size
- *         self.pk.length = 0
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":55
+ *     elif use_bin_type and l < 256:
+ *         return 2
+ *     elif l < 65536:             # <<<<<<<<<<<<<<
+ *         return 3
+ *     return 5
+ */
+  __pyx_t_1 = (__pyx_v_l < 0x10000);
+  if (__pyx_t_1) {
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":56
+ *         return 2
+ *     elif l < 65536:
+ *         return 3             # <<<<<<<<<<<<<<
+ *     return 5
+ * 
  */
-    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_MemoryError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 83, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __PYX_ERR(0, 83, __pyx_L1_error)
+    __pyx_r = 3;
+    goto __pyx_L0;
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":82
- *         cdef int buf_size = 1024 * 1024
- *         self.pk.buf = <char*> malloc(buf_size)
- *         if self.pk.buf == NULL:             # <<<<<<<<<<<<<<
- *             raise MemoryError("Unable to allocate internal buffer.")
- *         self.pk.buf_size = buf_size
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":55
+ *     elif use_bin_type and l < 256:
+ *         return 2
+ *     elif l < 65536:             # <<<<<<<<<<<<<<
+ *         return 3
+ *     return 5
  */
   }
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":84
- *         if self.pk.buf == NULL:
- *             raise MemoryError("Unable to allocate internal buffer.")
- *         self.pk.buf_size = buf_size             # <<<<<<<<<<<<<<
- *         self.pk.length = 0
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":57
+ *     elif l < 65536:
+ *         return 3
+ *     return 5             # <<<<<<<<<<<<<<
  * 
- */
-  __pyx_v_self->pk.buf_size = __pyx_v_buf_size;
-
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":85
- *             raise MemoryError("Unable to allocate internal buffer.")
- *         self.pk.buf_size = buf_size
- *         self.pk.length = 0             # <<<<<<<<<<<<<<
  * 
- *     def __init__(self, default=None, encoding='utf-8',
  */
-  __pyx_v_self->pk.length = 0;
+  __pyx_r = 5;
+  goto __pyx_L0;
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":79
- *     cdef bint autoreset
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":50
  * 
- *     def __cinit__(self):             # <<<<<<<<<<<<<<
- *         cdef int buf_size = 1024 * 1024
- *         self.pk.buf = <char*> malloc(buf_size)
+ * 
+ * cdef inline size_t _raw_header_size(size_t l, bint use_bin_type):             # <<<<<<<<<<<<<<
+ *     if l < 32:
+ *         return 1
  */
 
   /* function exit code */
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
   __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "isf_pandas_msgpack/msgpack/_packer.pyx":87
- *         self.pk.length = 0
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":60
  * 
- *     def __init__(self, default=None, encoding='utf-8',             # <<<<<<<<<<<<<<
- *                  unicode_errors='strict', use_single_float=False,
- *                  bint autoreset=1, bint use_bin_type=0):
+ * 
+ * cdef inline size_t _ext_header_size(size_t l):             # <<<<<<<<<<<<<<
+ *     if l == 1 or l == 2 or l == 4 or l == 8 or l == 16:
+ *         return 2
+ */
+
+static CYTHON_INLINE size_t __pyx_f_18isf_pandas_msgpack_7msgpack_7_packer__ext_header_size(size_t __pyx_v_l) {
+  size_t __pyx_r;
+  int __pyx_t_1;
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":61
+ * 
+ * cdef inline size_t _ext_header_size(size_t l):
+ *     if l == 1 or l == 2 or l == 4 or l == 8 or l == 16:             # <<<<<<<<<<<<<<
+ *         return 2
+ *     elif l < 256:
+ */
+  switch (__pyx_v_l) {
+    case 1:
+    case 2:
+    case 4:
+    case 8:
+    case 16:
+    __pyx_t_1 = 1;
+    break;
+    default:
+    __pyx_t_1 = 0;
+    break;
+  }
+  if (__pyx_t_1) {
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":62
+ * cdef inline size_t _ext_header_size(size_t l):
+ *     if l == 1 or l == 2 or l == 4 or l == 8 or l == 16:
+ *         return 2             # <<<<<<<<<<<<<<
+ *     elif l < 256:
+ *         return 3
+ */
+    __pyx_r = 2;
+    goto __pyx_L0;
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":61
+ * 
+ * cdef inline size_t _ext_header_size(size_t l):
+ *     if l == 1 or l == 2 or l == 4 or l == 8 or l == 16:             # <<<<<<<<<<<<<<
+ *         return 2
+ *     elif l < 256:
+ */
+  }
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":63
+ *     if l == 1 or l == 2 or l == 4 or l == 8 or l == 16:
+ *         return 2
+ *     elif l < 256:             # <<<<<<<<<<<<<<
+ *         return 3
+ *     elif l < 65536:
+ */
+  __pyx_t_1 = (__pyx_v_l < 0x100);
+  if (__pyx_t_1) {
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":64
+ *         return 2
+ *     elif l < 256:
+ *         return 3             # <<<<<<<<<<<<<<
+ *     elif l < 65536:
+ *         return 4
+ */
+    __pyx_r = 3;
+    goto __pyx_L0;
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":63
+ *     if l == 1 or l == 2 or l == 4 or l == 8 or l == 16:
+ *         return 2
+ *     elif l < 256:             # <<<<<<<<<<<<<<
+ *         return 3
+ *     elif l < 65536:
+ */
+  }
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":65
+ *     elif l < 256:
+ *         return 3
+ *     elif l < 65536:             # <<<<<<<<<<<<<<
+ *         return 4
+ *     return 6
+ */
+  __pyx_t_1 = (__pyx_v_l < 0x10000);
+  if (__pyx_t_1) {
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":66
+ *         return 3
+ *     elif l < 65536:
+ *         return 4             # <<<<<<<<<<<<<<
+ *     return 6
+ * 
+ */
+    __pyx_r = 4;
+    goto __pyx_L0;
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":65
+ *     elif l < 256:
+ *         return 3
+ *     elif l < 65536:             # <<<<<<<<<<<<<<
+ *         return 4
+ *     return 6
+ */
+  }
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":67
+ *     elif l < 65536:
+ *         return 4
+ *     return 6             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_r = 6;
+  goto __pyx_L0;
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":60
+ * 
+ * 
+ * cdef inline size_t _ext_header_size(size_t l):             # <<<<<<<<<<<<<<
+ *     if l == 1 or l == 2 or l == 4 or l == 8 or l == 16:
+ *         return 2
+ */
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":70
+ * 
+ * 
+ * def _writev(int fd, list segments):             # <<<<<<<<<<<<<<
+ *     """Write all of *segments* to *fd*, with `os.writev` where available."""
+ *     cdef Py_ssize_t i = 0, n
  */
 
 /* Python wrapper */
-static int __pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_3__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-PyDoc_STRVAR(__pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_2__init__, "\n        ");
-#if CYTHON_UPDATE_DESCRIPTOR_DOC
-struct wrapperbase __pyx_wrapperbase_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_2__init__;
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_1_writev(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
-static int __pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_3__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyObject *__pyx_v_default = 0;
-  PyObject *__pyx_v_encoding = 0;
-  PyObject *__pyx_v_unicode_errors = 0;
-  PyObject *__pyx_v_use_single_float = 0;
-  int __pyx_v_autoreset;
-  int __pyx_v_use_bin_type;
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer__writev, "_writev(int fd, list segments)\nWrite all of *segments* to *fd*, with `os.writev` where available.");
+static PyMethodDef __pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_1_writev = {"_writev", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_1_writev, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer__writev};
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_1_writev(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  int __pyx_v_fd;
+  PyObject *__pyx_v_segments = 0;
+  #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[6] = {0,0,0,0,0,0};
+  PyObject* values[2] = {0,0};
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  int __pyx_r;
+  PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  __Pyx_RefNannySetupContext("_writev (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_MACROS
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
   #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return -1;
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
   #endif
-  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
   {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_default,&__pyx_n_s_encoding,&__pyx_n_s_unicode_errors,&__pyx_n_s_use_single_float,&__pyx_n_s_autoreset,&__pyx_n_s_use_bin_type,0};
-    values[0] = __Pyx_Arg_NewRef_VARARGS(((PyObject *)Py_None));
-    values[1] = __Pyx_Arg_NewRef_VARARGS(((PyObject *)__pyx_kp_s_utf_8));
-    values[2] = __Pyx_Arg_NewRef_VARARGS(((PyObject *)__pyx_n_s_strict));
-
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":88
- * 
- *     def __init__(self, default=None, encoding='utf-8',
- *                  unicode_errors='strict', use_single_float=False,             # <<<<<<<<<<<<<<
- *                  bint autoreset=1, bint use_bin_type=0):
- *         """
- */
-    values[3] = __Pyx_Arg_NewRef_VARARGS(((PyObject *)Py_False));
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_fd,&__pyx_n_s_segments,0};
     if (__pyx_kwds) {
       Py_ssize_t kw_args;
       switch (__pyx_nargs) {
-        case  6: values[5] = __Pyx_Arg_VARARGS(__pyx_args, 5);
-        CYTHON_FALLTHROUGH;
-        case  5: values[4] = __Pyx_Arg_VARARGS(__pyx_args, 4);
-        CYTHON_FALLTHROUGH;
-        case  4: values[3] = __Pyx_Arg_VARARGS(__pyx_args, 3);
-        CYTHON_FALLTHROUGH;
-        case  3: values[2] = __Pyx_Arg_VARARGS(__pyx_args, 2);
-        CYTHON_FALLTHROUGH;
-        case  2: values[1] = __Pyx_Arg_VARARGS(__pyx_args, 1);
+        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
         CYTHON_FALLTHROUGH;
-        case  1: values[0] = __Pyx_Arg_VARARGS(__pyx_args, 0);
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
-      kw_args = __Pyx_NumKwargs_VARARGS(__pyx_kwds);
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
       switch (__pyx_nargs) {
         case  0:
-        if (kw_args > 0) {
-          PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_default);
-          if (value) { values[0] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 87, __pyx_L3_error)
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_fd)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
         }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 70, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
         CYTHON_FALLTHROUGH;
         case  1:
-        if (kw_args > 0) {
-          PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_encoding);
-          if (value) { values[1] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 87, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  2:
-        if (kw_args > 0) {
-          PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_unicode_errors);
-          if (value) { values[2] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 87, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  3:
-        if (kw_args > 0) {
-          PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_use_single_float);
-          if (value) { values[3] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 87, __pyx_L3_error)
-        }
-        CYTHON_FALLTHROUGH;
-        case  4:
-        if (kw_args > 0) {
-          PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_autoreset);
-          if (value) { values[4] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 87, __pyx_L3_error)
+        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_segments)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
+          kw_args--;
         }
-        CYTHON_FALLTHROUGH;
-        case  5:
-        if (kw_args > 0) {
-          PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_use_bin_type);
-          if (value) { values[5] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 87, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 70, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("_writev", 1, 2, 2, 1); __PYX_ERR(0, 70, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__init__") < 0)) __PYX_ERR(0, 87, __pyx_L3_error)
-      }
-    } else {
-      switch (__pyx_nargs) {
-        case  6: values[5] = __Pyx_Arg_VARARGS(__pyx_args, 5);
-        CYTHON_FALLTHROUGH;
-        case  5: values[4] = __Pyx_Arg_VARARGS(__pyx_args, 4);
-        CYTHON_FALLTHROUGH;
-        case  4: values[3] = __Pyx_Arg_VARARGS(__pyx_args, 3);
-        CYTHON_FALLTHROUGH;
-        case  3: values[2] = __Pyx_Arg_VARARGS(__pyx_args, 2);
-        CYTHON_FALLTHROUGH;
-        case  2: values[1] = __Pyx_Arg_VARARGS(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = __Pyx_Arg_VARARGS(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "_writev") < 0)) __PYX_ERR(0, 70, __pyx_L3_error)
       }
-    }
-    __pyx_v_default = values[0];
-    __pyx_v_encoding = values[1];
-    __pyx_v_unicode_errors = values[2];
-    __pyx_v_use_single_float = values[3];
-    if (values[4]) {
-      __pyx_v_autoreset = __Pyx_PyObject_IsTrue(values[4]); if (unlikely((__pyx_v_autoreset == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 89, __pyx_L3_error)
-    } else {
-      __pyx_v_autoreset = ((int)1);
-    }
-    if (values[5]) {
-      __pyx_v_use_bin_type = __Pyx_PyObject_IsTrue(values[5]); if (unlikely((__pyx_v_use_bin_type == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 89, __pyx_L3_error)
+    } else if (unlikely(__pyx_nargs != 2)) {
+      goto __pyx_L5_argtuple_error;
     } else {
-      __pyx_v_use_bin_type = ((int)0);
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
     }
+    __pyx_v_fd = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_fd == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 70, __pyx_L3_error)
+    __pyx_v_segments = ((PyObject*)values[1]);
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 0, 0, 6, __pyx_nargs); __PYX_ERR(0, 87, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("_writev", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 70, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
   {
     Py_ssize_t __pyx_temp;
     for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_VARARGS(values[__pyx_temp]);
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
     }
   }
-  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer._writev", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
-  return -1;
+  return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_2__init__(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self), __pyx_v_default, __pyx_v_encoding, __pyx_v_unicode_errors, __pyx_v_use_single_float, __pyx_v_autoreset, __pyx_v_use_bin_type);
-
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":87
- *         self.pk.length = 0
- * 
- *     def __init__(self, default=None, encoding='utf-8',             # <<<<<<<<<<<<<<
- *                  unicode_errors='strict', use_single_float=False,
- *                  bint autoreset=1, bint use_bin_type=0):
- */
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_segments), (&PyList_Type), 1, "segments", 1))) __PYX_ERR(0, 70, __pyx_L1_error)
+  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer__writev(__pyx_self, __pyx_v_fd, __pyx_v_segments);
 
   /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
   {
     Py_ssize_t __pyx_temp;
     for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_VARARGS(values[__pyx_temp]);
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
     }
   }
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static int __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_2__init__(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_default, PyObject *__pyx_v_encoding, PyObject *__pyx_v_unicode_errors, PyObject *__pyx_v_use_single_float, int __pyx_v_autoreset, int __pyx_v_use_bin_type) {
-  int __pyx_r;
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer__writev(CYTHON_UNUSED PyObject *__pyx_self, int __pyx_v_fd, PyObject *__pyx_v_segments) {
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_n;
+  PyObject *__pyx_v_views = NULL;
+  PyObject *__pyx_v_view = NULL;
+  PyObject *__pyx_7genexpr__pyx_v_s = NULL;
+  PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  Py_ssize_t __pyx_t_3;
   PyObject *__pyx_t_4 = NULL;
-  unsigned int __pyx_t_5;
-  char *__pyx_t_6;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  unsigned int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  Py_ssize_t __pyx_t_10;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__init__", 1);
-
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":92
- *         """
- *         """
- *         self.use_float = use_single_float             # <<<<<<<<<<<<<<
- *         self.autoreset = autoreset
- *         self.pk.use_bin_type = use_bin_type
- */
-  if (!(likely(((__pyx_v_use_single_float) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_use_single_float, __pyx_ptype_7cpython_4bool_bool))))) __PYX_ERR(0, 92, __pyx_L1_error)
-  __pyx_t_1 = __pyx_v_use_single_float;
-  __Pyx_INCREF(__pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __Pyx_GOTREF((PyObject *)__pyx_v_self->use_float);
-  __Pyx_DECREF((PyObject *)__pyx_v_self->use_float);
-  __pyx_v_self->use_float = ((PyBoolObject *)__pyx_t_1);
+  __Pyx_RefNannySetupContext("_writev", 1);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":72
+ * def _writev(int fd, list segments):
+ *     """Write all of *segments* to *fd*, with `os.writev` where available."""
+ *     cdef Py_ssize_t i = 0, n             # <<<<<<<<<<<<<<
+ *     views = [memoryview(s).cast('B') for s in segments]
+ *     if not hasattr(os, 'writev'):
+ */
+  __pyx_v_i = 0;
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":73
+ *     """Write all of *segments* to *fd*, with `os.writev` where available."""
+ *     cdef Py_ssize_t i = 0, n
+ *     views = [memoryview(s).cast('B') for s in segments]             # <<<<<<<<<<<<<<
+ *     if not hasattr(os, 'writev'):
+ *         for view in views:
+ */
+  { /* enter inner scope */
+    __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 73, __pyx_L5_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    if (unlikely(__pyx_v_segments == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
+      __PYX_ERR(0, 73, __pyx_L5_error)
+    }
+    __pyx_t_2 = __pyx_v_segments; __Pyx_INCREF(__pyx_t_2);
+    __pyx_t_3 = 0;
+    for (;;) {
+      {
+        Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_2);
+        #if !CYTHON_ASSUME_SAFE_MACROS
+        if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 73, __pyx_L5_error)
+        #endif
+        if (__pyx_t_3 >= __pyx_temp) break;
+      }
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      __pyx_t_4 = PyList_GET_ITEM(__pyx_t_2, __pyx_t_3); __Pyx_INCREF(__pyx_t_4); __pyx_t_3++; if (unlikely((0 < 0))) __PYX_ERR(0, 73, __pyx_L5_error)
+      #else
+      __pyx_t_4 = __Pyx_PySequence_ITEM(__pyx_t_2, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 73, __pyx_L5_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      #endif
+      __Pyx_XDECREF_SET(__pyx_7genexpr__pyx_v_s, __pyx_t_4);
+      __pyx_t_4 = 0;
+      __pyx_t_5 = PyMemoryView_FromObject(__pyx_7genexpr__pyx_v_s); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 73, __pyx_L5_error)
+      __Pyx_GOTREF(__pyx_t_5);
+      __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_cast); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 73, __pyx_L5_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __pyx_t_5 = NULL;
+      __pyx_t_7 = 0;
+      #if CYTHON_UNPACK_METHODS
+      if (likely(PyMethod_Check(__pyx_t_6))) {
+        __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_6);
+        if (likely(__pyx_t_5)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+          __Pyx_INCREF(__pyx_t_5);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_6, function);
+          __pyx_t_7 = 1;
+        }
+      }
+      #endif
+      {
+        PyObject *__pyx_callargs[2] = {__pyx_t_5, __pyx_n_s_B};
+        __pyx_t_4 = __Pyx_PyObject_FastCall(__pyx_t_6, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+        if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 73, __pyx_L5_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      }
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_1, (PyObject*)__pyx_t_4))) __PYX_ERR(0, 73, __pyx_L5_error)
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __Pyx_XDECREF(__pyx_7genexpr__pyx_v_s); __pyx_7genexpr__pyx_v_s = 0;
+    goto __pyx_L9_exit_scope;
+    __pyx_L5_error:;
+    __Pyx_XDECREF(__pyx_7genexpr__pyx_v_s); __pyx_7genexpr__pyx_v_s = 0;
+    goto __pyx_L1_error;
+    __pyx_L9_exit_scope:;
+  } /* exit inner scope */
+  __pyx_v_views = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":93
- *         """
- *         self.use_float = use_single_float
- *         self.autoreset = autoreset             # <<<<<<<<<<<<<<
- *         self.pk.use_bin_type = use_bin_type
- *         if default is not None:
- */
-  __pyx_v_self->autoreset = __pyx_v_autoreset;
-
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":94
- *         self.use_float = use_single_float
- *         self.autoreset = autoreset
- *         self.pk.use_bin_type = use_bin_type             # <<<<<<<<<<<<<<
- *         if default is not None:
- *             if not PyCallable_Check(default):
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":74
+ *     cdef Py_ssize_t i = 0, n
+ *     views = [memoryview(s).cast('B') for s in segments]
+ *     if not hasattr(os, 'writev'):             # <<<<<<<<<<<<<<
+ *         for view in views:
+ *             while len(view):
  */
-  __pyx_v_self->pk.use_bin_type = __pyx_v_use_bin_type;
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_os); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 74, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_8 = __Pyx_HasAttr(__pyx_t_1, __pyx_n_s_writev); if (unlikely(__pyx_t_8 == ((int)-1))) __PYX_ERR(0, 74, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_9 = (!__pyx_t_8);
+  if (__pyx_t_9) {
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":95
- *         self.autoreset = autoreset
- *         self.pk.use_bin_type = use_bin_type
- *         if default is not None:             # <<<<<<<<<<<<<<
- *             if not PyCallable_Check(default):
- *                 raise TypeError("default must be a callable.")
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":75
+ *     views = [memoryview(s).cast('B') for s in segments]
+ *     if not hasattr(os, 'writev'):
+ *         for view in views:             # <<<<<<<<<<<<<<
+ *             while len(view):
+ *                 n = os.write(fd, view)
  */
-  __pyx_t_2 = (__pyx_v_default != Py_None);
-  if (__pyx_t_2) {
+    __pyx_t_1 = __pyx_v_views; __Pyx_INCREF(__pyx_t_1);
+    __pyx_t_3 = 0;
+    for (;;) {
+      {
+        Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_1);
+        #if !CYTHON_ASSUME_SAFE_MACROS
+        if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 75, __pyx_L1_error)
+        #endif
+        if (__pyx_t_3 >= __pyx_temp) break;
+      }
+      #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+      __pyx_t_2 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_3); __Pyx_INCREF(__pyx_t_2); __pyx_t_3++; if (unlikely((0 < 0))) __PYX_ERR(0, 75, __pyx_L1_error)
+      #else
+      __pyx_t_2 = __Pyx_PySequence_ITEM(__pyx_t_1, __pyx_t_3); __pyx_t_3++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 75, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      #endif
+      __Pyx_XDECREF_SET(__pyx_v_view, __pyx_t_2);
+      __pyx_t_2 = 0;
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":96
- *         self.pk.use_bin_type = use_bin_type
- *         if default is not None:
- *             if not PyCallable_Check(default):             # <<<<<<<<<<<<<<
- *                 raise TypeError("default must be a callable.")
- *         self._default = default
- */
-    __pyx_t_2 = (!PyCallable_Check(__pyx_v_default));
-    if (unlikely(__pyx_t_2)) {
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":76
+ *     if not hasattr(os, 'writev'):
+ *         for view in views:
+ *             while len(view):             # <<<<<<<<<<<<<<
+ *                 n = os.write(fd, view)
+ *                 view = view[n:]
+ */
+      while (1) {
+        __pyx_t_10 = PyObject_Length(__pyx_v_view); if (unlikely(__pyx_t_10 == ((Py_ssize_t)-1))) __PYX_ERR(0, 76, __pyx_L1_error)
+        __pyx_t_9 = (__pyx_t_10 != 0);
+        if (!__pyx_t_9) break;
+
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":77
+ *         for view in views:
+ *             while len(view):
+ *                 n = os.write(fd, view)             # <<<<<<<<<<<<<<
+ *                 view = view[n:]
+ *         return
+ */
+        __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_os); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 77, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_write); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 77, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_fd); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 77, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __pyx_t_5 = NULL;
+        __pyx_t_7 = 0;
+        #if CYTHON_UNPACK_METHODS
+        if (unlikely(PyMethod_Check(__pyx_t_6))) {
+          __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_6);
+          if (likely(__pyx_t_5)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+            __Pyx_INCREF(__pyx_t_5);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_6, function);
+            __pyx_t_7 = 1;
+          }
+        }
+        #endif
+        {
+          PyObject *__pyx_callargs[3] = {__pyx_t_5, __pyx_t_4, __pyx_v_view};
+          __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_6, __pyx_callargs+1-__pyx_t_7, 2+__pyx_t_7);
+          __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 77, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        }
+        __pyx_t_10 = __Pyx_PyIndex_AsSsize_t(__pyx_t_2); if (unlikely((__pyx_t_10 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 77, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __pyx_v_n = __pyx_t_10;
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":97
- *         if default is not None:
- *             if not PyCallable_Check(default):
- *                 raise TypeError("default must be a callable.")             # <<<<<<<<<<<<<<
- *         self._default = default
- *         if encoding is None:
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":78
+ *             while len(view):
+ *                 n = os.write(fd, view)
+ *                 view = view[n:]             # <<<<<<<<<<<<<<
+ *         return
+ *     while i < len(views):
  */
-      __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 97, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __Pyx_Raise(__pyx_t_1, 0, 0, 0);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      __PYX_ERR(0, 97, __pyx_L1_error)
+        __pyx_t_2 = __Pyx_PyObject_GetSlice(__pyx_v_view, __pyx_v_n, 0, NULL, NULL, NULL, 1, 0, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 78, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF_SET(__pyx_v_view, __pyx_t_2);
+        __pyx_t_2 = 0;
+      }
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":96
- *         self.pk.use_bin_type = use_bin_type
- *         if default is not None:
- *             if not PyCallable_Check(default):             # <<<<<<<<<<<<<<
- *                 raise TypeError("default must be a callable.")
- *         self._default = default
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":75
+ *     views = [memoryview(s).cast('B') for s in segments]
+ *     if not hasattr(os, 'writev'):
+ *         for view in views:             # <<<<<<<<<<<<<<
+ *             while len(view):
+ *                 n = os.write(fd, view)
  */
     }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":95
- *         self.autoreset = autoreset
- *         self.pk.use_bin_type = use_bin_type
- *         if default is not None:             # <<<<<<<<<<<<<<
- *             if not PyCallable_Check(default):
- *                 raise TypeError("default must be a callable.")
- */
-  }
-
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":98
- *             if not PyCallable_Check(default):
- *                 raise TypeError("default must be a callable.")
- *         self._default = default             # <<<<<<<<<<<<<<
- *         if encoding is None:
- *             self.encoding = NULL
- */
-  __Pyx_INCREF(__pyx_v_default);
-  __Pyx_GIVEREF(__pyx_v_default);
-  __Pyx_GOTREF(__pyx_v_self->_default);
-  __Pyx_DECREF(__pyx_v_self->_default);
-  __pyx_v_self->_default = __pyx_v_default;
-
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":99
- *                 raise TypeError("default must be a callable.")
- *         self._default = default
- *         if encoding is None:             # <<<<<<<<<<<<<<
- *             self.encoding = NULL
- *             self.unicode_errors = NULL
- */
-  __pyx_t_2 = (__pyx_v_encoding == Py_None);
-  if (__pyx_t_2) {
-
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":100
- *         self._default = default
- *         if encoding is None:
- *             self.encoding = NULL             # <<<<<<<<<<<<<<
- *             self.unicode_errors = NULL
- *         else:
- */
-    __pyx_v_self->encoding = NULL;
-
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":101
- *         if encoding is None:
- *             self.encoding = NULL
- *             self.unicode_errors = NULL             # <<<<<<<<<<<<<<
- *         else:
- *             if isinstance(encoding, unicode):
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":79
+ *                 n = os.write(fd, view)
+ *                 view = view[n:]
+ *         return             # <<<<<<<<<<<<<<
+ *     while i < len(views):
+ *         n = os.writev(fd, views[i:i + IOV_MAX])
  */
-    __pyx_v_self->unicode_errors = NULL;
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":99
- *                 raise TypeError("default must be a callable.")
- *         self._default = default
- *         if encoding is None:             # <<<<<<<<<<<<<<
- *             self.encoding = NULL
- *             self.unicode_errors = NULL
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":74
+ *     cdef Py_ssize_t i = 0, n
+ *     views = [memoryview(s).cast('B') for s in segments]
+ *     if not hasattr(os, 'writev'):             # <<<<<<<<<<<<<<
+ *         for view in views:
+ *             while len(view):
  */
-    goto __pyx_L5;
   }
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":103
- *             self.unicode_errors = NULL
- *         else:
- *             if isinstance(encoding, unicode):             # <<<<<<<<<<<<<<
- *                 self._bencoding = encoding.encode('ascii')
- *             else:
- */
-  /*else*/ {
-    __pyx_t_2 = PyUnicode_Check(__pyx_v_encoding); 
-    if (__pyx_t_2) {
-
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":104
- *         else:
- *             if isinstance(encoding, unicode):
- *                 self._bencoding = encoding.encode('ascii')             # <<<<<<<<<<<<<<
- *             else:
- *                 self._bencoding = encoding
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":80
+ *                 view = view[n:]
+ *         return
+ *     while i < len(views):             # <<<<<<<<<<<<<<
+ *         n = os.writev(fd, views[i:i + IOV_MAX])
+ *         # writev may stop short, resume from where it did
  */
-      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_encoding, __pyx_n_s_encode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 104, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = NULL;
-      __pyx_t_5 = 0;
-      #if CYTHON_UNPACK_METHODS
-      if (likely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_4)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_4);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
-          __pyx_t_5 = 1;
-        }
-      }
-      #endif
-      {
-        PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_n_s_ascii};
-        __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
-        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 104, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  while (1) {
+    __pyx_t_3 = __Pyx_PyList_GET_SIZE(__pyx_v_views); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 80, __pyx_L1_error)
+    __pyx_t_9 = (__pyx_v_i < __pyx_t_3);
+    if (!__pyx_t_9) break;
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":81
+ *         return
+ *     while i < len(views):
+ *         n = os.writev(fd, views[i:i + IOV_MAX])             # <<<<<<<<<<<<<<
+ *         # writev may stop short, resume from where it did
+ *         while i < len(views) and n >= len(views[i]):
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_os); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 81, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_writev); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 81, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_fd); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 81, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_4 = __Pyx_PyList_GetSlice(__pyx_v_views, __pyx_v_i, (__pyx_v_i + __pyx_v_18isf_pandas_msgpack_7msgpack_7_packer_IOV_MAX)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 81, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = NULL;
+    __pyx_t_7 = 0;
+    #if CYTHON_UNPACK_METHODS
+    if (unlikely(PyMethod_Check(__pyx_t_6))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_6);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_6, function);
+        __pyx_t_7 = 1;
       }
-      __Pyx_GIVEREF(__pyx_t_1);
-      __Pyx_GOTREF(__pyx_v_self->_bencoding);
-      __Pyx_DECREF(__pyx_v_self->_bencoding);
-      __pyx_v_self->_bencoding = __pyx_t_1;
-      __pyx_t_1 = 0;
-
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":103
- *             self.unicode_errors = NULL
- *         else:
- *             if isinstance(encoding, unicode):             # <<<<<<<<<<<<<<
- *                 self._bencoding = encoding.encode('ascii')
- *             else:
- */
-      goto __pyx_L6;
     }
-
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":106
- *                 self._bencoding = encoding.encode('ascii')
- *             else:
- *                 self._bencoding = encoding             # <<<<<<<<<<<<<<
- *             self.encoding = PyBytes_AsString(self._bencoding)
- *             if isinstance(unicode_errors, unicode):
- */
-    /*else*/ {
-      __Pyx_INCREF(__pyx_v_encoding);
-      __Pyx_GIVEREF(__pyx_v_encoding);
-      __Pyx_GOTREF(__pyx_v_self->_bencoding);
-      __Pyx_DECREF(__pyx_v_self->_bencoding);
-      __pyx_v_self->_bencoding = __pyx_v_encoding;
+    #endif
+    {
+      PyObject *__pyx_callargs[3] = {__pyx_t_5, __pyx_t_2, __pyx_t_4};
+      __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_6, __pyx_callargs+1-__pyx_t_7, 2+__pyx_t_7);
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 81, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     }
-    __pyx_L6:;
-
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":107
- *             else:
- *                 self._bencoding = encoding
- *             self.encoding = PyBytes_AsString(self._bencoding)             # <<<<<<<<<<<<<<
- *             if isinstance(unicode_errors, unicode):
- *                 self._berrors = unicode_errors.encode('ascii')
- */
-    __pyx_t_1 = __pyx_v_self->_bencoding;
-    __Pyx_INCREF(__pyx_t_1);
-    __pyx_t_6 = PyBytes_AsString(__pyx_t_1); if (unlikely(__pyx_t_6 == ((char *)NULL))) __PYX_ERR(0, 107, __pyx_L1_error)
-    __pyx_v_self->encoding = __pyx_t_6;
+    __pyx_t_3 = __Pyx_PyIndex_AsSsize_t(__pyx_t_1); if (unlikely((__pyx_t_3 == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 81, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_v_n = __pyx_t_3;
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":108
- *                 self._bencoding = encoding
- *             self.encoding = PyBytes_AsString(self._bencoding)
- *             if isinstance(unicode_errors, unicode):             # <<<<<<<<<<<<<<
- *                 self._berrors = unicode_errors.encode('ascii')
- *             else:
- */
-    __pyx_t_2 = PyUnicode_Check(__pyx_v_unicode_errors); 
-    if (__pyx_t_2) {
-
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":109
- *             self.encoding = PyBytes_AsString(self._bencoding)
- *             if isinstance(unicode_errors, unicode):
- *                 self._berrors = unicode_errors.encode('ascii')             # <<<<<<<<<<<<<<
- *             else:
- *                 self._berrors = unicode_errors
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":83
+ *         n = os.writev(fd, views[i:i + IOV_MAX])
+ *         # writev may stop short, resume from where it did
+ *         while i < len(views) and n >= len(views[i]):             # <<<<<<<<<<<<<<
+ *             n -= len(views[i])
+ *             i += 1
  */
-      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_unicode_errors, __pyx_n_s_encode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 109, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = NULL;
-      __pyx_t_5 = 0;
-      #if CYTHON_UNPACK_METHODS
-      if (likely(PyMethod_Check(__pyx_t_3))) {
-        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-        if (likely(__pyx_t_4)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-          __Pyx_INCREF(__pyx_t_4);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_3, function);
-          __pyx_t_5 = 1;
-        }
-      }
-      #endif
-      {
-        PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_n_s_ascii};
-        __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
-        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 109, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    while (1) {
+      __pyx_t_3 = __Pyx_PyList_GET_SIZE(__pyx_v_views); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 83, __pyx_L1_error)
+      __pyx_t_8 = (__pyx_v_i < __pyx_t_3);
+      if (__pyx_t_8) {
+      } else {
+        __pyx_t_9 = __pyx_t_8;
+        goto __pyx_L20_bool_binop_done;
       }
-      __Pyx_GIVEREF(__pyx_t_1);
-      __Pyx_GOTREF(__pyx_v_self->_berrors);
-      __Pyx_DECREF(__pyx_v_self->_berrors);
-      __pyx_v_self->_berrors = __pyx_t_1;
-      __pyx_t_1 = 0;
+      __pyx_t_1 = __Pyx_GetItemInt_List(__pyx_v_views, __pyx_v_i, Py_ssize_t, 1, PyInt_FromSsize_t, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 83, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_3 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 83, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_8 = (__pyx_v_n >= __pyx_t_3);
+      __pyx_t_9 = __pyx_t_8;
+      __pyx_L20_bool_binop_done:;
+      if (!__pyx_t_9) break;
+
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":84
+ *         # writev may stop short, resume from where it did
+ *         while i < len(views) and n >= len(views[i]):
+ *             n -= len(views[i])             # <<<<<<<<<<<<<<
+ *             i += 1
+ *         if n:
+ */
+      __pyx_t_1 = __Pyx_GetItemInt_List(__pyx_v_views, __pyx_v_i, Py_ssize_t, 1, PyInt_FromSsize_t, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 84, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_3 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 84, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_v_n = (__pyx_v_n - __pyx_t_3);
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":108
- *                 self._bencoding = encoding
- *             self.encoding = PyBytes_AsString(self._bencoding)
- *             if isinstance(unicode_errors, unicode):             # <<<<<<<<<<<<<<
- *                 self._berrors = unicode_errors.encode('ascii')
- *             else:
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":85
+ *         while i < len(views) and n >= len(views[i]):
+ *             n -= len(views[i])
+ *             i += 1             # <<<<<<<<<<<<<<
+ *         if n:
+ *             views[i] = views[i][n:]
  */
-      goto __pyx_L7;
+      __pyx_v_i = (__pyx_v_i + 1);
     }
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":111
- *                 self._berrors = unicode_errors.encode('ascii')
- *             else:
- *                 self._berrors = unicode_errors             # <<<<<<<<<<<<<<
- *             self.unicode_errors = PyBytes_AsString(self._berrors)
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":86
+ *             n -= len(views[i])
+ *             i += 1
+ *         if n:             # <<<<<<<<<<<<<<
+ *             views[i] = views[i][n:]
  * 
  */
-    /*else*/ {
-      __Pyx_INCREF(__pyx_v_unicode_errors);
-      __Pyx_GIVEREF(__pyx_v_unicode_errors);
-      __Pyx_GOTREF(__pyx_v_self->_berrors);
-      __Pyx_DECREF(__pyx_v_self->_berrors);
-      __pyx_v_self->_berrors = __pyx_v_unicode_errors;
-    }
-    __pyx_L7:;
+    __pyx_t_9 = (__pyx_v_n != 0);
+    if (__pyx_t_9) {
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":112
- *             else:
- *                 self._berrors = unicode_errors
- *             self.unicode_errors = PyBytes_AsString(self._berrors)             # <<<<<<<<<<<<<<
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":87
+ *             i += 1
+ *         if n:
+ *             views[i] = views[i][n:]             # <<<<<<<<<<<<<<
+ * 
  * 
- *     def __dealloc__(self):
  */
-    __pyx_t_1 = __pyx_v_self->_berrors;
-    __Pyx_INCREF(__pyx_t_1);
-    __pyx_t_6 = PyBytes_AsString(__pyx_t_1); if (unlikely(__pyx_t_6 == ((char *)NULL))) __PYX_ERR(0, 112, __pyx_L1_error)
-    __pyx_v_self->unicode_errors = __pyx_t_6;
-    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_1 = __Pyx_GetItemInt_List(__pyx_v_views, __pyx_v_i, Py_ssize_t, 1, PyInt_FromSsize_t, 1, 1, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 87, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __pyx_t_6 = __Pyx_PyObject_GetSlice(__pyx_t_1, __pyx_v_n, 0, NULL, NULL, NULL, 1, 0, 1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 87, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      if (unlikely((__Pyx_SetItemInt(__pyx_v_views, __pyx_v_i, __pyx_t_6, Py_ssize_t, 1, PyInt_FromSsize_t, 1, 1, 1) < 0))) __PYX_ERR(0, 87, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":86
+ *             n -= len(views[i])
+ *             i += 1
+ *         if n:             # <<<<<<<<<<<<<<
+ *             views[i] = views[i][n:]
+ * 
+ */
+    }
   }
-  __pyx_L5:;
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":87
- *         self.pk.length = 0
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":70
  * 
- *     def __init__(self, default=None, encoding='utf-8',             # <<<<<<<<<<<<<<
- *                  unicode_errors='strict', use_single_float=False,
- *                  bint autoreset=1, bint use_bin_type=0):
+ * 
+ * def _writev(int fd, list segments):             # <<<<<<<<<<<<<<
+ *     """Write all of *segments* to *fd*, with `os.writev` where available."""
+ *     cdef Py_ssize_t i = 0, n
  */
 
   /* function exit code */
-  __pyx_r = 0;
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = -1;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer._writev", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
   __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_views);
+  __Pyx_XDECREF(__pyx_v_view);
+  __Pyx_XDECREF(__pyx_7genexpr__pyx_v_s);
+  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "isf_pandas_msgpack/msgpack/_packer.pyx":114
- *             self.unicode_errors = PyBytes_AsString(self._berrors)
- * 
- *     def __dealloc__(self):             # <<<<<<<<<<<<<<
- *         free(self.pk.buf);
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":162
+ *     cdef size_t written
  * 
+ *     def __cinit__(self):             # <<<<<<<<<<<<<<
+ *         cdef int buf_size = 1024 * 1024
+ *         self.pk.buf = <char*> malloc(buf_size)
  */
 
 /* Python wrapper */
-static void __pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_5__dealloc__(PyObject *__pyx_v_self); /*proto*/
-static void __pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_5__dealloc__(PyObject *__pyx_v_self) {
+static int __pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__dealloc__ (wrapper)", 0);
+  __Pyx_RefNannySetupContext("__cinit__ (wrapper)", 0);
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return -1;
+  #endif
   __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
-  __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_4__dealloc__(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self));
+  if (unlikely(__pyx_nargs > 0)) {
+    __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 0, 0, __pyx_nargs); return -1;}
+  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_VARARGS(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__cinit__", 0))) return -1;
+  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer___cinit__(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
 
-static void __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_4__dealloc__(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self) {
-
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":115
- * 
- *     def __dealloc__(self):
- *         free(self.pk.buf);             # <<<<<<<<<<<<<<
- * 
- *     cdef int _pack(self, object o,
- */
-  free(__pyx_v_self->pk.buf);
-
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":114
- *             self.unicode_errors = PyBytes_AsString(self._berrors)
- * 
- *     def __dealloc__(self):             # <<<<<<<<<<<<<<
- *         free(self.pk.buf);
- * 
- */
-
-  /* function exit code */
-}
-
-/* "isf_pandas_msgpack/msgpack/_packer.pyx":117
- *         free(self.pk.buf);
- * 
- *     cdef int _pack(self, object o,             # <<<<<<<<<<<<<<
- *                    int nest_limit=DEFAULT_RECURSE_LIMIT) except -1:
- *         cdef long long llval
- */
-
-static int __pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__pack(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_o, struct __pyx_opt_args_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__pack *__pyx_optional_args) {
-  int __pyx_v_nest_limit = __pyx_k__3;
-  PY_LONG_LONG __pyx_v_llval;
-  unsigned PY_LONG_LONG __pyx_v_ullval;
-  long __pyx_v_longval;
-  float __pyx_v_fval;
-  double __pyx_v_dval;
-  char *__pyx_v_rawval;
-  int __pyx_v_ret;
-  PyObject *__pyx_v_d = 0;
-  size_t __pyx_v_L;
-  int __pyx_v_default_used;
-  PyObject *__pyx_v_k = NULL;
-  PyObject *__pyx_v_v = NULL;
+static int __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer___cinit__(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self) {
+  int __pyx_v_buf_size;
   int __pyx_r;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
   PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  unsigned int __pyx_t_5;
-  unsigned PY_LONG_LONG __pyx_t_6;
-  PY_LONG_LONG __pyx_t_7;
-  long __pyx_t_8;
-  float __pyx_t_9;
-  double __pyx_t_10;
-  Py_ssize_t __pyx_t_11;
-  char *__pyx_t_12;
-  Py_ssize_t __pyx_t_13;
-  int __pyx_t_14;
-  int __pyx_t_15;
-  struct __pyx_opt_args_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__pack __pyx_t_16;
-  int __pyx_t_17;
-  PyObject *(*__pyx_t_18)(PyObject *);
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("_pack", 0);
-  if (__pyx_optional_args) {
-    if (__pyx_optional_args->__pyx_n > 0) {
-      __pyx_v_nest_limit = __pyx_optional_args->nest_limit;
-    }
-  }
-  __Pyx_INCREF(__pyx_v_o);
+  __Pyx_RefNannySetupContext("__cinit__", 1);
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":128
- *         cdef dict d
- *         cdef size_t L
- *         cdef int default_used = 0             # <<<<<<<<<<<<<<
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":163
  * 
- *         if nest_limit < 0:
+ *     def __cinit__(self):
+ *         cdef int buf_size = 1024 * 1024             # <<<<<<<<<<<<<<
+ *         self.pk.buf = <char*> malloc(buf_size)
+ *         if self.pk.buf == NULL:
  */
-  __pyx_v_default_used = 0;
+  __pyx_v_buf_size = 0x100000;
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":130
- *         cdef int default_used = 0
- * 
- *         if nest_limit < 0:             # <<<<<<<<<<<<<<
- *             raise PackValueError("recursion limit exceeded.")
- * 
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":164
+ *     def __cinit__(self):
+ *         cdef int buf_size = 1024 * 1024
+ *         self.pk.buf = <char*> malloc(buf_size)             # <<<<<<<<<<<<<<
+ *         if self.pk.buf == NULL:
+ *             raise MemoryError("Unable to allocate internal buffer.")
  */
-  __pyx_t_1 = (__pyx_v_nest_limit < 0);
+  __pyx_v_self->pk.buf = ((char *)malloc(__pyx_v_buf_size));
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":165
+ *         cdef int buf_size = 1024 * 1024
+ *         self.pk.buf = <char*> malloc(buf_size)
+ *         if self.pk.buf == NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError("Unable to allocate internal buffer.")
+ *         self.pk.buf_size = buf_size
+ */
+  __pyx_t_1 = (__pyx_v_self->pk.buf == NULL);
   if (unlikely(__pyx_t_1)) {
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":131
- * 
- *         if nest_limit < 0:
- *             raise PackValueError("recursion limit exceeded.")             # <<<<<<<<<<<<<<
- * 
- *         while True:
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":166
+ *         self.pk.buf = <char*> malloc(buf_size)
+ *         if self.pk.buf == NULL:
+ *             raise MemoryError("Unable to allocate internal buffer.")             # <<<<<<<<<<<<<<
+ *         self.pk.buf_size = buf_size
+ *         self.pk.length = 0
  */
-    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_PackValueError); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 131, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_4 = NULL;
-    __pyx_t_5 = 0;
-    #if CYTHON_UNPACK_METHODS
-    if (unlikely(PyMethod_Check(__pyx_t_3))) {
-      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-      if (likely(__pyx_t_4)) {
-        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-        __Pyx_INCREF(__pyx_t_4);
-        __Pyx_INCREF(function);
-        __Pyx_DECREF_SET(__pyx_t_3, function);
-        __pyx_t_5 = 1;
-      }
-    }
-    #endif
-    {
-      PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_kp_s_recursion_limit_exceeded};
-      __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
-      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 131, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    }
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_MemoryError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 166, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
     __Pyx_Raise(__pyx_t_2, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __PYX_ERR(0, 131, __pyx_L1_error)
+    __PYX_ERR(0, 166, __pyx_L1_error)
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":130
- *         cdef int default_used = 0
- * 
- *         if nest_limit < 0:             # <<<<<<<<<<<<<<
- *             raise PackValueError("recursion limit exceeded.")
- * 
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":165
+ *         cdef int buf_size = 1024 * 1024
+ *         self.pk.buf = <char*> malloc(buf_size)
+ *         if self.pk.buf == NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError("Unable to allocate internal buffer.")
+ *         self.pk.buf_size = buf_size
  */
   }
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":133
- *             raise PackValueError("recursion limit exceeded.")
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":167
+ *         if self.pk.buf == NULL:
+ *             raise MemoryError("Unable to allocate internal buffer.")
+ *         self.pk.buf_size = buf_size             # <<<<<<<<<<<<<<
+ *         self.pk.length = 0
  * 
- *         while True:             # <<<<<<<<<<<<<<
- *             if o is None:
- *                 ret = msgpack_pack_nil(&self.pk)
  */
-  while (1) {
+  __pyx_v_self->pk.buf_size = __pyx_v_buf_size;
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":134
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":168
+ *             raise MemoryError("Unable to allocate internal buffer.")
+ *         self.pk.buf_size = buf_size
+ *         self.pk.length = 0             # <<<<<<<<<<<<<<
  * 
- *         while True:
- *             if o is None:             # <<<<<<<<<<<<<<
- *                 ret = msgpack_pack_nil(&self.pk)
- *             elif isinstance(o, bool):
+ *     def __init__(self, default=None, encoding='utf-8',
  */
-    __pyx_t_1 = (__pyx_v_o == Py_None);
-    if (__pyx_t_1) {
+  __pyx_v_self->pk.length = 0;
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":135
- *         while True:
- *             if o is None:
- *                 ret = msgpack_pack_nil(&self.pk)             # <<<<<<<<<<<<<<
- *             elif isinstance(o, bool):
- *                 if o:
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":162
+ *     cdef size_t written
+ * 
+ *     def __cinit__(self):             # <<<<<<<<<<<<<<
+ *         cdef int buf_size = 1024 * 1024
+ *         self.pk.buf = <char*> malloc(buf_size)
  */
-      __pyx_v_ret = msgpack_pack_nil((&__pyx_v_self->pk));
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":134
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":170
+ *         self.pk.length = 0
  * 
- *         while True:
- *             if o is None:             # <<<<<<<<<<<<<<
- *                 ret = msgpack_pack_nil(&self.pk)
- *             elif isinstance(o, bool):
+ *     def __init__(self, default=None, encoding='utf-8',             # <<<<<<<<<<<<<<
+ *                  unicode_errors='strict', use_single_float=False,
+ *                  bint autoreset=1, bint use_bin_type=0,
  */
-      goto __pyx_L6;
-    }
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":136
- *             if o is None:
- *                 ret = msgpack_pack_nil(&self.pk)
- *             elif isinstance(o, bool):             # <<<<<<<<<<<<<<
- *                 if o:
- *                     ret = msgpack_pack_true(&self.pk)
- */
-    __pyx_t_1 = __Pyx_TypeCheck(__pyx_v_o, __pyx_ptype_7cpython_4bool_bool); 
-    if (__pyx_t_1) {
+/* Python wrapper */
+static int __pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_3__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+PyDoc_STRVAR(__pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_2__init__, "\n        ");
+#if CYTHON_UPDATE_DESCRIPTOR_DOC
+struct wrapperbase __pyx_wrapperbase_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_2__init__;
+#endif
+static int __pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_3__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_default = 0;
+  PyObject *__pyx_v_encoding = 0;
+  PyObject *__pyx_v_unicode_errors = 0;
+  PyObject *__pyx_v_use_single_float = 0;
+  int __pyx_v_autoreset;
+  int __pyx_v_use_bin_type;
+  PyObject *__pyx_v_stream = 0;
+  size_t __pyx_v_flush_threshold;
+  size_t __pyx_v_align;
+  size_t __pyx_v_offset;
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[10] = {0,0,0,0,0,0,0,0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return -1;
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_default,&__pyx_n_s_encoding,&__pyx_n_s_unicode_errors,&__pyx_n_s_use_single_float,&__pyx_n_s_autoreset,&__pyx_n_s_use_bin_type,&__pyx_n_s_stream,&__pyx_n_s_flush_threshold,&__pyx_n_s_align,&__pyx_n_s_offset,0};
+    values[0] = __Pyx_Arg_NewRef_VARARGS(((PyObject *)Py_None));
+    values[1] = __Pyx_Arg_NewRef_VARARGS(((PyObject *)__pyx_kp_s_utf_8));
+    values[2] = __Pyx_Arg_NewRef_VARARGS(((PyObject *)__pyx_n_s_strict));
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":137
- *                 ret = msgpack_pack_nil(&self.pk)
- *             elif isinstance(o, bool):
- *                 if o:             # <<<<<<<<<<<<<<
- *                     ret = msgpack_pack_true(&self.pk)
- *                 else:
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":171
+ * 
+ *     def __init__(self, default=None, encoding='utf-8',
+ *                  unicode_errors='strict', use_single_float=False,             # <<<<<<<<<<<<<<
+ *                  bint autoreset=1, bint use_bin_type=0,
+ *                  stream=None, size_t flush_threshold=DEFAULT_FLUSH_THRESHOLD,
  */
-      __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_o); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 137, __pyx_L1_error)
-      if (__pyx_t_1) {
+    values[3] = __Pyx_Arg_NewRef_VARARGS(((PyObject *)Py_False));
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":138
- *             elif isinstance(o, bool):
- *                 if o:
- *                     ret = msgpack_pack_true(&self.pk)             # <<<<<<<<<<<<<<
- *                 else:
- *                     ret = msgpack_pack_false(&self.pk)
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":173
+ *                  unicode_errors='strict', use_single_float=False,
+ *                  bint autoreset=1, bint use_bin_type=0,
+ *                  stream=None, size_t flush_threshold=DEFAULT_FLUSH_THRESHOLD,             # <<<<<<<<<<<<<<
+ *                  size_t align=0, size_t offset=0):
+ *         """
  */
-        __pyx_v_ret = msgpack_pack_true((&__pyx_v_self->pk));
-
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":137
- *                 ret = msgpack_pack_nil(&self.pk)
- *             elif isinstance(o, bool):
- *                 if o:             # <<<<<<<<<<<<<<
- *                     ret = msgpack_pack_true(&self.pk)
- *                 else:
- */
-        goto __pyx_L7;
+    values[6] = __Pyx_Arg_NewRef_VARARGS(((PyObject *)Py_None));
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case 10: values[9] = __Pyx_Arg_VARARGS(__pyx_args, 9);
+        CYTHON_FALLTHROUGH;
+        case  9: values[8] = __Pyx_Arg_VARARGS(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = __Pyx_Arg_VARARGS(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = __Pyx_Arg_VARARGS(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = __Pyx_Arg_VARARGS(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = __Pyx_Arg_VARARGS(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = __Pyx_Arg_VARARGS(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = __Pyx_Arg_VARARGS(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = __Pyx_Arg_VARARGS(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = __Pyx_Arg_VARARGS(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
       }
-
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":140
- *                     ret = msgpack_pack_true(&self.pk)
- *                 else:
- *                     ret = msgpack_pack_false(&self.pk)             # <<<<<<<<<<<<<<
- *             elif PyLong_Check(o):
- *                 # PyInt_Check(long) is True for Python 3.
- */
-      /*else*/ {
-        __pyx_v_ret = msgpack_pack_false((&__pyx_v_self->pk));
+      kw_args = __Pyx_NumKwargs_VARARGS(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_default);
+          if (value) { values[0] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 170, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_encoding);
+          if (value) { values[1] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 170, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_unicode_errors);
+          if (value) { values[2] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 170, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  3:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_use_single_float);
+          if (value) { values[3] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 170, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  4:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_autoreset);
+          if (value) { values[4] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 170, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  5:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_use_bin_type);
+          if (value) { values[5] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 170, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  6:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_stream);
+          if (value) { values[6] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 170, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  7:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_flush_threshold);
+          if (value) { values[7] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 170, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  8:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_align);
+          if (value) { values[8] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 170, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  9:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_offset);
+          if (value) { values[9] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 170, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__init__") < 0)) __PYX_ERR(0, 170, __pyx_L3_error)
+      }
+    } else {
+      switch (__pyx_nargs) {
+        case 10: values[9] = __Pyx_Arg_VARARGS(__pyx_args, 9);
+        CYTHON_FALLTHROUGH;
+        case  9: values[8] = __Pyx_Arg_VARARGS(__pyx_args, 8);
+        CYTHON_FALLTHROUGH;
+        case  8: values[7] = __Pyx_Arg_VARARGS(__pyx_args, 7);
+        CYTHON_FALLTHROUGH;
+        case  7: values[6] = __Pyx_Arg_VARARGS(__pyx_args, 6);
+        CYTHON_FALLTHROUGH;
+        case  6: values[5] = __Pyx_Arg_VARARGS(__pyx_args, 5);
+        CYTHON_FALLTHROUGH;
+        case  5: values[4] = __Pyx_Arg_VARARGS(__pyx_args, 4);
+        CYTHON_FALLTHROUGH;
+        case  4: values[3] = __Pyx_Arg_VARARGS(__pyx_args, 3);
+        CYTHON_FALLTHROUGH;
+        case  3: values[2] = __Pyx_Arg_VARARGS(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = __Pyx_Arg_VARARGS(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = __Pyx_Arg_VARARGS(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
       }
-      __pyx_L7:;
+    }
+    __pyx_v_default = values[0];
+    __pyx_v_encoding = values[1];
+    __pyx_v_unicode_errors = values[2];
+    __pyx_v_use_single_float = values[3];
+    if (values[4]) {
+      __pyx_v_autoreset = __Pyx_PyObject_IsTrue(values[4]); if (unlikely((__pyx_v_autoreset == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 172, __pyx_L3_error)
+    } else {
+      __pyx_v_autoreset = ((int)1);
+    }
+    if (values[5]) {
+      __pyx_v_use_bin_type = __Pyx_PyObject_IsTrue(values[5]); if (unlikely((__pyx_v_use_bin_type == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 172, __pyx_L3_error)
+    } else {
+      __pyx_v_use_bin_type = ((int)0);
+    }
+    __pyx_v_stream = values[6];
+    if (values[7]) {
+      __pyx_v_flush_threshold = __Pyx_PyInt_As_size_t(values[7]); if (unlikely((__pyx_v_flush_threshold == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 173, __pyx_L3_error)
+    } else {
+      __pyx_v_flush_threshold = __pyx_k__2;
+    }
+    if (values[8]) {
+      __pyx_v_align = __Pyx_PyInt_As_size_t(values[8]); if (unlikely((__pyx_v_align == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 174, __pyx_L3_error)
+    } else {
+      __pyx_v_align = ((size_t)0);
+    }
+    if (values[9]) {
+      __pyx_v_offset = __Pyx_PyInt_As_size_t(values[9]); if (unlikely((__pyx_v_offset == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 174, __pyx_L3_error)
+    } else {
+      __pyx_v_offset = ((size_t)0);
+    }
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 0, 10, __pyx_nargs); __PYX_ERR(0, 170, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_VARARGS(values[__pyx_temp]);
+    }
+  }
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_2__init__(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self), __pyx_v_default, __pyx_v_encoding, __pyx_v_unicode_errors, __pyx_v_use_single_float, __pyx_v_autoreset, __pyx_v_use_bin_type, __pyx_v_stream, __pyx_v_flush_threshold, __pyx_v_align, __pyx_v_offset);
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":136
- *             if o is None:
- *                 ret = msgpack_pack_nil(&self.pk)
- *             elif isinstance(o, bool):             # <<<<<<<<<<<<<<
- *                 if o:
- *                     ret = msgpack_pack_true(&self.pk)
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":170
+ *         self.pk.length = 0
+ * 
+ *     def __init__(self, default=None, encoding='utf-8',             # <<<<<<<<<<<<<<
+ *                  unicode_errors='strict', use_single_float=False,
+ *                  bint autoreset=1, bint use_bin_type=0,
  */
-      goto __pyx_L6;
+
+  /* function exit code */
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_VARARGS(values[__pyx_temp]);
     }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":141
- *                 else:
- *                     ret = msgpack_pack_false(&self.pk)
- *             elif PyLong_Check(o):             # <<<<<<<<<<<<<<
- *                 # PyInt_Check(long) is True for Python 3.
- *                 # Sow we should test long before int.
- */
-    __pyx_t_1 = PyLong_Check(__pyx_v_o);
-    if (__pyx_t_1) {
+static int __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_2__init__(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_default, PyObject *__pyx_v_encoding, PyObject *__pyx_v_unicode_errors, PyObject *__pyx_v_use_single_float, int __pyx_v_autoreset, int __pyx_v_use_bin_type, PyObject *__pyx_v_stream, size_t __pyx_v_flush_threshold, size_t __pyx_v_align, size_t __pyx_v_offset) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  unsigned int __pyx_t_5;
+  char *__pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 1);
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":144
- *                 # PyInt_Check(long) is True for Python 3.
- *                 # Sow we should test long before int.
- *                 if o > 0:             # <<<<<<<<<<<<<<
- *                     ullval = o
- *                     ret = msgpack_pack_unsigned_long_long(&self.pk, ullval)
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":177
+ *         """
+ *         """
+ *         if align:             # <<<<<<<<<<<<<<
+ *             if not use_bin_type:
+ *                 raise ValueError("align requires use_bin_type.")
  */
-      __pyx_t_2 = PyObject_RichCompare(__pyx_v_o, __pyx_int_0, Py_GT); __Pyx_XGOTREF(__pyx_t_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 144, __pyx_L1_error)
-      __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 144, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      if (__pyx_t_1) {
+  __pyx_t_1 = (__pyx_v_align != 0);
+  if (__pyx_t_1) {
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":145
- *                 # Sow we should test long before int.
- *                 if o > 0:
- *                     ullval = o             # <<<<<<<<<<<<<<
- *                     ret = msgpack_pack_unsigned_long_long(&self.pk, ullval)
- *                 else:
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":178
+ *         """
+ *         if align:
+ *             if not use_bin_type:             # <<<<<<<<<<<<<<
+ *                 raise ValueError("align requires use_bin_type.")
+ *             if align > 256:
  */
-        __pyx_t_6 = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(__pyx_v_o); if (unlikely((__pyx_t_6 == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 145, __pyx_L1_error)
-        __pyx_v_ullval = __pyx_t_6;
+    __pyx_t_1 = (!__pyx_v_use_bin_type);
+    if (unlikely(__pyx_t_1)) {
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":146
- *                 if o > 0:
- *                     ullval = o
- *                     ret = msgpack_pack_unsigned_long_long(&self.pk, ullval)             # <<<<<<<<<<<<<<
- *                 else:
- *                     llval = o
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":179
+ *         if align:
+ *             if not use_bin_type:
+ *                 raise ValueError("align requires use_bin_type.")             # <<<<<<<<<<<<<<
+ *             if align > 256:
+ *                 raise ValueError("align must be at most 256.")
  */
-        __pyx_v_ret = msgpack_pack_unsigned_long_long((&__pyx_v_self->pk), __pyx_v_ullval);
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 179, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __PYX_ERR(0, 179, __pyx_L1_error)
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":144
- *                 # PyInt_Check(long) is True for Python 3.
- *                 # Sow we should test long before int.
- *                 if o > 0:             # <<<<<<<<<<<<<<
- *                     ullval = o
- *                     ret = msgpack_pack_unsigned_long_long(&self.pk, ullval)
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":178
+ *         """
+ *         if align:
+ *             if not use_bin_type:             # <<<<<<<<<<<<<<
+ *                 raise ValueError("align requires use_bin_type.")
+ *             if align > 256:
  */
-        goto __pyx_L8;
-      }
+    }
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":148
- *                     ret = msgpack_pack_unsigned_long_long(&self.pk, ullval)
- *                 else:
- *                     llval = o             # <<<<<<<<<<<<<<
- *                     ret = msgpack_pack_long_long(&self.pk, llval)
- *             elif PyInt_Check(o):
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":180
+ *             if not use_bin_type:
+ *                 raise ValueError("align requires use_bin_type.")
+ *             if align > 256:             # <<<<<<<<<<<<<<
+ *                 raise ValueError("align must be at most 256.")
+ *         self.align = align
  */
-      /*else*/ {
-        __pyx_t_7 = __Pyx_PyInt_As_PY_LONG_LONG(__pyx_v_o); if (unlikely((__pyx_t_7 == (PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 148, __pyx_L1_error)
-        __pyx_v_llval = __pyx_t_7;
+    __pyx_t_1 = (__pyx_v_align > 0x100);
+    if (unlikely(__pyx_t_1)) {
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":149
- *                 else:
- *                     llval = o
- *                     ret = msgpack_pack_long_long(&self.pk, llval)             # <<<<<<<<<<<<<<
- *             elif PyInt_Check(o):
- *                 longval = o
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":181
+ *                 raise ValueError("align requires use_bin_type.")
+ *             if align > 256:
+ *                 raise ValueError("align must be at most 256.")             # <<<<<<<<<<<<<<
+ *         self.align = align
+ *         self.written = offset
  */
-        __pyx_v_ret = msgpack_pack_long_long((&__pyx_v_self->pk), __pyx_v_llval);
-      }
-      __pyx_L8:;
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 181, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __PYX_ERR(0, 181, __pyx_L1_error)
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":141
- *                 else:
- *                     ret = msgpack_pack_false(&self.pk)
- *             elif PyLong_Check(o):             # <<<<<<<<<<<<<<
- *                 # PyInt_Check(long) is True for Python 3.
- *                 # Sow we should test long before int.
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":180
+ *             if not use_bin_type:
+ *                 raise ValueError("align requires use_bin_type.")
+ *             if align > 256:             # <<<<<<<<<<<<<<
+ *                 raise ValueError("align must be at most 256.")
+ *         self.align = align
  */
-      goto __pyx_L6;
     }
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":150
- *                     llval = o
- *                     ret = msgpack_pack_long_long(&self.pk, llval)
- *             elif PyInt_Check(o):             # <<<<<<<<<<<<<<
- *                 longval = o
- *                 ret = msgpack_pack_long(&self.pk, longval)
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":177
+ *         """
+ *         """
+ *         if align:             # <<<<<<<<<<<<<<
+ *             if not use_bin_type:
+ *                 raise ValueError("align requires use_bin_type.")
  */
-    __pyx_t_1 = PyInt_Check(__pyx_v_o);
-    if (__pyx_t_1) {
+  }
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":151
- *                     ret = msgpack_pack_long_long(&self.pk, llval)
- *             elif PyInt_Check(o):
- *                 longval = o             # <<<<<<<<<<<<<<
- *                 ret = msgpack_pack_long(&self.pk, longval)
- *             elif PyFloat_Check(o):
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":182
+ *             if align > 256:
+ *                 raise ValueError("align must be at most 256.")
+ *         self.align = align             # <<<<<<<<<<<<<<
+ *         self.written = offset
+ *         self.stream = stream
+ */
+  __pyx_v_self->align = __pyx_v_align;
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":183
+ *                 raise ValueError("align must be at most 256.")
+ *         self.align = align
+ *         self.written = offset             # <<<<<<<<<<<<<<
+ *         self.stream = stream
+ *         self.flush_threshold = flush_threshold
+ */
+  __pyx_v_self->written = __pyx_v_offset;
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":184
+ *         self.align = align
+ *         self.written = offset
+ *         self.stream = stream             # <<<<<<<<<<<<<<
+ *         self.flush_threshold = flush_threshold
+ *         if isinstance(stream, int):
+ */
+  __Pyx_INCREF(__pyx_v_stream);
+  __Pyx_GIVEREF(__pyx_v_stream);
+  __Pyx_GOTREF(__pyx_v_self->stream);
+  __Pyx_DECREF(__pyx_v_self->stream);
+  __pyx_v_self->stream = __pyx_v_stream;
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":185
+ *         self.written = offset
+ *         self.stream = stream
+ *         self.flush_threshold = flush_threshold             # <<<<<<<<<<<<<<
+ *         if isinstance(stream, int):
+ *             self.segments = []
+ */
+  __pyx_v_self->flush_threshold = __pyx_v_flush_threshold;
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":186
+ *         self.stream = stream
+ *         self.flush_threshold = flush_threshold
+ *         if isinstance(stream, int):             # <<<<<<<<<<<<<<
+ *             self.segments = []
+ *         self.use_float = use_single_float
  */
-      __pyx_t_8 = __Pyx_PyInt_As_long(__pyx_v_o); if (unlikely((__pyx_t_8 == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 151, __pyx_L1_error)
-      __pyx_v_longval = __pyx_t_8;
+  __pyx_t_1 = PyInt_Check(__pyx_v_stream); 
+  if (__pyx_t_1) {
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":152
- *             elif PyInt_Check(o):
- *                 longval = o
- *                 ret = msgpack_pack_long(&self.pk, longval)             # <<<<<<<<<<<<<<
- *             elif PyFloat_Check(o):
- *                 if self.use_float:
- */
-      __pyx_v_ret = msgpack_pack_long((&__pyx_v_self->pk), __pyx_v_longval);
-
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":150
- *                     llval = o
- *                     ret = msgpack_pack_long_long(&self.pk, llval)
- *             elif PyInt_Check(o):             # <<<<<<<<<<<<<<
- *                 longval = o
- *                 ret = msgpack_pack_long(&self.pk, longval)
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":187
+ *         self.flush_threshold = flush_threshold
+ *         if isinstance(stream, int):
+ *             self.segments = []             # <<<<<<<<<<<<<<
+ *         self.use_float = use_single_float
+ *         self.autoreset = autoreset
  */
-      goto __pyx_L6;
-    }
+    __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 187, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_GIVEREF(__pyx_t_2);
+    __Pyx_GOTREF(__pyx_v_self->segments);
+    __Pyx_DECREF(__pyx_v_self->segments);
+    __pyx_v_self->segments = ((PyObject*)__pyx_t_2);
+    __pyx_t_2 = 0;
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":153
- *                 longval = o
- *                 ret = msgpack_pack_long(&self.pk, longval)
- *             elif PyFloat_Check(o):             # <<<<<<<<<<<<<<
- *                 if self.use_float:
- *                     fval = o
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":186
+ *         self.stream = stream
+ *         self.flush_threshold = flush_threshold
+ *         if isinstance(stream, int):             # <<<<<<<<<<<<<<
+ *             self.segments = []
+ *         self.use_float = use_single_float
  */
-    __pyx_t_1 = PyFloat_Check(__pyx_v_o);
-    if (__pyx_t_1) {
+  }
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":154
- *                 ret = msgpack_pack_long(&self.pk, longval)
- *             elif PyFloat_Check(o):
- *                 if self.use_float:             # <<<<<<<<<<<<<<
- *                     fval = o
- *                     ret = msgpack_pack_float(&self.pk, fval)
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":188
+ *         if isinstance(stream, int):
+ *             self.segments = []
+ *         self.use_float = use_single_float             # <<<<<<<<<<<<<<
+ *         self.autoreset = autoreset
+ *         self.pk.use_bin_type = use_bin_type
  */
-      __pyx_t_1 = __Pyx_PyObject_IsTrue(((PyObject *)__pyx_v_self->use_float)); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 154, __pyx_L1_error)
-      if (__pyx_t_1) {
+  if (!(likely(((__pyx_v_use_single_float) == Py_None) || likely(__Pyx_TypeTest(__pyx_v_use_single_float, __pyx_ptype_7cpython_4bool_bool))))) __PYX_ERR(0, 188, __pyx_L1_error)
+  __pyx_t_2 = __pyx_v_use_single_float;
+  __Pyx_INCREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __Pyx_GOTREF((PyObject *)__pyx_v_self->use_float);
+  __Pyx_DECREF((PyObject *)__pyx_v_self->use_float);
+  __pyx_v_self->use_float = ((PyBoolObject *)__pyx_t_2);
+  __pyx_t_2 = 0;
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":155
- *             elif PyFloat_Check(o):
- *                 if self.use_float:
- *                     fval = o             # <<<<<<<<<<<<<<
- *                     ret = msgpack_pack_float(&self.pk, fval)
- *                 else:
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":189
+ *             self.segments = []
+ *         self.use_float = use_single_float
+ *         self.autoreset = autoreset             # <<<<<<<<<<<<<<
+ *         self.pk.use_bin_type = use_bin_type
+ *         if default is not None:
  */
-        __pyx_t_9 = __pyx_PyFloat_AsFloat(__pyx_v_o); if (unlikely((__pyx_t_9 == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 155, __pyx_L1_error)
-        __pyx_v_fval = __pyx_t_9;
+  __pyx_v_self->autoreset = __pyx_v_autoreset;
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":156
- *                 if self.use_float:
- *                     fval = o
- *                     ret = msgpack_pack_float(&self.pk, fval)             # <<<<<<<<<<<<<<
- *                 else:
- *                     dval = o
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":190
+ *         self.use_float = use_single_float
+ *         self.autoreset = autoreset
+ *         self.pk.use_bin_type = use_bin_type             # <<<<<<<<<<<<<<
+ *         if default is not None:
+ *             if not PyCallable_Check(default):
  */
-        __pyx_v_ret = msgpack_pack_float((&__pyx_v_self->pk), __pyx_v_fval);
+  __pyx_v_self->pk.use_bin_type = __pyx_v_use_bin_type;
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":154
- *                 ret = msgpack_pack_long(&self.pk, longval)
- *             elif PyFloat_Check(o):
- *                 if self.use_float:             # <<<<<<<<<<<<<<
- *                     fval = o
- *                     ret = msgpack_pack_float(&self.pk, fval)
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":191
+ *         self.autoreset = autoreset
+ *         self.pk.use_bin_type = use_bin_type
+ *         if default is not None:             # <<<<<<<<<<<<<<
+ *             if not PyCallable_Check(default):
+ *                 raise TypeError("default must be a callable.")
  */
-        goto __pyx_L9;
-      }
+  __pyx_t_1 = (__pyx_v_default != Py_None);
+  if (__pyx_t_1) {
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":158
- *                     ret = msgpack_pack_float(&self.pk, fval)
- *                 else:
- *                     dval = o             # <<<<<<<<<<<<<<
- *                     ret = msgpack_pack_double(&self.pk, dval)
- *             elif PyBytes_Check(o):
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":192
+ *         self.pk.use_bin_type = use_bin_type
+ *         if default is not None:
+ *             if not PyCallable_Check(default):             # <<<<<<<<<<<<<<
+ *                 raise TypeError("default must be a callable.")
+ *         self._default = default
  */
-      /*else*/ {
-        __pyx_t_10 = __pyx_PyFloat_AsDouble(__pyx_v_o); if (unlikely((__pyx_t_10 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 158, __pyx_L1_error)
-        __pyx_v_dval = __pyx_t_10;
+    __pyx_t_1 = (!PyCallable_Check(__pyx_v_default));
+    if (unlikely(__pyx_t_1)) {
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":159
- *                 else:
- *                     dval = o
- *                     ret = msgpack_pack_double(&self.pk, dval)             # <<<<<<<<<<<<<<
- *             elif PyBytes_Check(o):
- *                 L = len(o)
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":193
+ *         if default is not None:
+ *             if not PyCallable_Check(default):
+ *                 raise TypeError("default must be a callable.")             # <<<<<<<<<<<<<<
+ *         self._default = default
+ *         if encoding is None:
  */
-        __pyx_v_ret = msgpack_pack_double((&__pyx_v_self->pk), __pyx_v_dval);
-      }
-      __pyx_L9:;
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 193, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __PYX_ERR(0, 193, __pyx_L1_error)
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":153
- *                 longval = o
- *                 ret = msgpack_pack_long(&self.pk, longval)
- *             elif PyFloat_Check(o):             # <<<<<<<<<<<<<<
- *                 if self.use_float:
- *                     fval = o
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":192
+ *         self.pk.use_bin_type = use_bin_type
+ *         if default is not None:
+ *             if not PyCallable_Check(default):             # <<<<<<<<<<<<<<
+ *                 raise TypeError("default must be a callable.")
+ *         self._default = default
  */
-      goto __pyx_L6;
     }
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":160
- *                     dval = o
- *                     ret = msgpack_pack_double(&self.pk, dval)
- *             elif PyBytes_Check(o):             # <<<<<<<<<<<<<<
- *                 L = len(o)
- *                 if L > (2**32) - 1:
- */
-    __pyx_t_1 = PyBytes_Check(__pyx_v_o);
-    if (__pyx_t_1) {
-
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":161
- *                     ret = msgpack_pack_double(&self.pk, dval)
- *             elif PyBytes_Check(o):
- *                 L = len(o)             # <<<<<<<<<<<<<<
- *                 if L > (2**32) - 1:
- *                     raise ValueError("bytes is too large")
- */
-      __pyx_t_11 = PyObject_Length(__pyx_v_o); if (unlikely(__pyx_t_11 == ((Py_ssize_t)-1))) __PYX_ERR(0, 161, __pyx_L1_error)
-      __pyx_v_L = __pyx_t_11;
-
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":162
- *             elif PyBytes_Check(o):
- *                 L = len(o)
- *                 if L > (2**32) - 1:             # <<<<<<<<<<<<<<
- *                     raise ValueError("bytes is too large")
- *                 rawval = o
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":191
+ *         self.autoreset = autoreset
+ *         self.pk.use_bin_type = use_bin_type
+ *         if default is not None:             # <<<<<<<<<<<<<<
+ *             if not PyCallable_Check(default):
+ *                 raise TypeError("default must be a callable.")
  */
-      __pyx_t_2 = __Pyx_PyInt_FromSize_t(__pyx_v_L); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 162, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = PyObject_RichCompare(__pyx_t_2, __pyx_int_4294967295, Py_GT); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 162, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 162, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      if (unlikely(__pyx_t_1)) {
+  }
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":163
- *                 L = len(o)
- *                 if L > (2**32) - 1:
- *                     raise ValueError("bytes is too large")             # <<<<<<<<<<<<<<
- *                 rawval = o
- *                 ret = msgpack_pack_bin(&self.pk, L)
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":194
+ *             if not PyCallable_Check(default):
+ *                 raise TypeError("default must be a callable.")
+ *         self._default = default             # <<<<<<<<<<<<<<
+ *         if encoding is None:
+ *             self.encoding = NULL
  */
-        __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 163, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __PYX_ERR(0, 163, __pyx_L1_error)
+  __Pyx_INCREF(__pyx_v_default);
+  __Pyx_GIVEREF(__pyx_v_default);
+  __Pyx_GOTREF(__pyx_v_self->_default);
+  __Pyx_DECREF(__pyx_v_self->_default);
+  __pyx_v_self->_default = __pyx_v_default;
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":162
- *             elif PyBytes_Check(o):
- *                 L = len(o)
- *                 if L > (2**32) - 1:             # <<<<<<<<<<<<<<
- *                     raise ValueError("bytes is too large")
- *                 rawval = o
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":195
+ *                 raise TypeError("default must be a callable.")
+ *         self._default = default
+ *         if encoding is None:             # <<<<<<<<<<<<<<
+ *             self.encoding = NULL
+ *             self.unicode_errors = NULL
  */
-      }
+  __pyx_t_1 = (__pyx_v_encoding == Py_None);
+  if (__pyx_t_1) {
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":164
- *                 if L > (2**32) - 1:
- *                     raise ValueError("bytes is too large")
- *                 rawval = o             # <<<<<<<<<<<<<<
- *                 ret = msgpack_pack_bin(&self.pk, L)
- *                 if ret == 0:
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":196
+ *         self._default = default
+ *         if encoding is None:
+ *             self.encoding = NULL             # <<<<<<<<<<<<<<
+ *             self.unicode_errors = NULL
+ *         else:
  */
-      __pyx_t_12 = __Pyx_PyObject_AsWritableString(__pyx_v_o); if (unlikely((!__pyx_t_12) && PyErr_Occurred())) __PYX_ERR(0, 164, __pyx_L1_error)
-      __pyx_v_rawval = __pyx_t_12;
+    __pyx_v_self->encoding = NULL;
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":165
- *                     raise ValueError("bytes is too large")
- *                 rawval = o
- *                 ret = msgpack_pack_bin(&self.pk, L)             # <<<<<<<<<<<<<<
- *                 if ret == 0:
- *                     ret = msgpack_pack_raw_body(&self.pk, rawval, L)
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":197
+ *         if encoding is None:
+ *             self.encoding = NULL
+ *             self.unicode_errors = NULL             # <<<<<<<<<<<<<<
+ *         else:
+ *             if isinstance(encoding, unicode):
  */
-      __pyx_v_ret = msgpack_pack_bin((&__pyx_v_self->pk), __pyx_v_L);
+    __pyx_v_self->unicode_errors = NULL;
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":166
- *                 rawval = o
- *                 ret = msgpack_pack_bin(&self.pk, L)
- *                 if ret == 0:             # <<<<<<<<<<<<<<
- *                     ret = msgpack_pack_raw_body(&self.pk, rawval, L)
- *             elif PyUnicode_Check(o):
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":195
+ *                 raise TypeError("default must be a callable.")
+ *         self._default = default
+ *         if encoding is None:             # <<<<<<<<<<<<<<
+ *             self.encoding = NULL
+ *             self.unicode_errors = NULL
  */
-      __pyx_t_1 = (__pyx_v_ret == 0);
-      if (__pyx_t_1) {
+    goto __pyx_L9;
+  }
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":167
- *                 ret = msgpack_pack_bin(&self.pk, L)
- *                 if ret == 0:
- *                     ret = msgpack_pack_raw_body(&self.pk, rawval, L)             # <<<<<<<<<<<<<<
- *             elif PyUnicode_Check(o):
- *                 if not self.encoding:
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":199
+ *             self.unicode_errors = NULL
+ *         else:
+ *             if isinstance(encoding, unicode):             # <<<<<<<<<<<<<<
+ *                 self._bencoding = encoding.encode('ascii')
+ *             else:
  */
-        __pyx_v_ret = msgpack_pack_raw_body((&__pyx_v_self->pk), __pyx_v_rawval, __pyx_v_L);
+  /*else*/ {
+    __pyx_t_1 = PyUnicode_Check(__pyx_v_encoding); 
+    if (__pyx_t_1) {
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":166
- *                 rawval = o
- *                 ret = msgpack_pack_bin(&self.pk, L)
- *                 if ret == 0:             # <<<<<<<<<<<<<<
- *                     ret = msgpack_pack_raw_body(&self.pk, rawval, L)
- *             elif PyUnicode_Check(o):
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":200
+ *         else:
+ *             if isinstance(encoding, unicode):
+ *                 self._bencoding = encoding.encode('ascii')             # <<<<<<<<<<<<<<
+ *             else:
+ *                 self._bencoding = encoding
  */
+      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_encoding, __pyx_n_s_encode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 200, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = NULL;
+      __pyx_t_5 = 0;
+      #if CYTHON_UNPACK_METHODS
+      if (likely(PyMethod_Check(__pyx_t_3))) {
+        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+        if (likely(__pyx_t_4)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+          __Pyx_INCREF(__pyx_t_4);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_3, function);
+          __pyx_t_5 = 1;
+        }
       }
+      #endif
+      {
+        PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_n_s_ascii};
+        __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 200, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      }
+      __Pyx_GIVEREF(__pyx_t_2);
+      __Pyx_GOTREF(__pyx_v_self->_bencoding);
+      __Pyx_DECREF(__pyx_v_self->_bencoding);
+      __pyx_v_self->_bencoding = __pyx_t_2;
+      __pyx_t_2 = 0;
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":160
- *                     dval = o
- *                     ret = msgpack_pack_double(&self.pk, dval)
- *             elif PyBytes_Check(o):             # <<<<<<<<<<<<<<
- *                 L = len(o)
- *                 if L > (2**32) - 1:
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":199
+ *             self.unicode_errors = NULL
+ *         else:
+ *             if isinstance(encoding, unicode):             # <<<<<<<<<<<<<<
+ *                 self._bencoding = encoding.encode('ascii')
+ *             else:
  */
-      goto __pyx_L6;
+      goto __pyx_L10;
     }
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":168
- *                 if ret == 0:
- *                     ret = msgpack_pack_raw_body(&self.pk, rawval, L)
- *             elif PyUnicode_Check(o):             # <<<<<<<<<<<<<<
- *                 if not self.encoding:
- *                     raise TypeError("Can't encode unicode string: "
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":202
+ *                 self._bencoding = encoding.encode('ascii')
+ *             else:
+ *                 self._bencoding = encoding             # <<<<<<<<<<<<<<
+ *             self.encoding = PyBytes_AsString(self._bencoding)
+ *             if isinstance(unicode_errors, unicode):
  */
-    __pyx_t_1 = PyUnicode_Check(__pyx_v_o);
-    if (__pyx_t_1) {
+    /*else*/ {
+      __Pyx_INCREF(__pyx_v_encoding);
+      __Pyx_GIVEREF(__pyx_v_encoding);
+      __Pyx_GOTREF(__pyx_v_self->_bencoding);
+      __Pyx_DECREF(__pyx_v_self->_bencoding);
+      __pyx_v_self->_bencoding = __pyx_v_encoding;
+    }
+    __pyx_L10:;
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":169
- *                     ret = msgpack_pack_raw_body(&self.pk, rawval, L)
- *             elif PyUnicode_Check(o):
- *                 if not self.encoding:             # <<<<<<<<<<<<<<
- *                     raise TypeError("Can't encode unicode string: "
- *                                     "no encoding is specified")
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":203
+ *             else:
+ *                 self._bencoding = encoding
+ *             self.encoding = PyBytes_AsString(self._bencoding)             # <<<<<<<<<<<<<<
+ *             if isinstance(unicode_errors, unicode):
+ *                 self._berrors = unicode_errors.encode('ascii')
  */
-      __pyx_t_1 = (!(__pyx_v_self->encoding != 0));
-      if (unlikely(__pyx_t_1)) {
+    __pyx_t_2 = __pyx_v_self->_bencoding;
+    __Pyx_INCREF(__pyx_t_2);
+    __pyx_t_6 = PyBytes_AsString(__pyx_t_2); if (unlikely(__pyx_t_6 == ((char *)NULL))) __PYX_ERR(0, 203, __pyx_L1_error)
+    __pyx_v_self->encoding = __pyx_t_6;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":170
- *             elif PyUnicode_Check(o):
- *                 if not self.encoding:
- *                     raise TypeError("Can't encode unicode string: "             # <<<<<<<<<<<<<<
- *                                     "no encoding is specified")
- *                 o = PyUnicode_AsEncodedString(o, self.encoding,
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":204
+ *                 self._bencoding = encoding
+ *             self.encoding = PyBytes_AsString(self._bencoding)
+ *             if isinstance(unicode_errors, unicode):             # <<<<<<<<<<<<<<
+ *                 self._berrors = unicode_errors.encode('ascii')
+ *             else:
  */
-        __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 170, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __PYX_ERR(0, 170, __pyx_L1_error)
+    __pyx_t_1 = PyUnicode_Check(__pyx_v_unicode_errors); 
+    if (__pyx_t_1) {
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":169
- *                     ret = msgpack_pack_raw_body(&self.pk, rawval, L)
- *             elif PyUnicode_Check(o):
- *                 if not self.encoding:             # <<<<<<<<<<<<<<
- *                     raise TypeError("Can't encode unicode string: "
- *                                     "no encoding is specified")
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":205
+ *             self.encoding = PyBytes_AsString(self._bencoding)
+ *             if isinstance(unicode_errors, unicode):
+ *                 self._berrors = unicode_errors.encode('ascii')             # <<<<<<<<<<<<<<
+ *             else:
+ *                 self._berrors = unicode_errors
  */
+      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_unicode_errors, __pyx_n_s_encode); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 205, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = NULL;
+      __pyx_t_5 = 0;
+      #if CYTHON_UNPACK_METHODS
+      if (likely(PyMethod_Check(__pyx_t_3))) {
+        __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+        if (likely(__pyx_t_4)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+          __Pyx_INCREF(__pyx_t_4);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_3, function);
+          __pyx_t_5 = 1;
+        }
+      }
+      #endif
+      {
+        PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_n_s_ascii};
+        __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 205, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       }
+      __Pyx_GIVEREF(__pyx_t_2);
+      __Pyx_GOTREF(__pyx_v_self->_berrors);
+      __Pyx_DECREF(__pyx_v_self->_berrors);
+      __pyx_v_self->_berrors = __pyx_t_2;
+      __pyx_t_2 = 0;
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":172
- *                     raise TypeError("Can't encode unicode string: "
- *                                     "no encoding is specified")
- *                 o = PyUnicode_AsEncodedString(o, self.encoding,             # <<<<<<<<<<<<<<
- *                                               self.unicode_errors)
- *                 L = len(o)
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":204
+ *                 self._bencoding = encoding
+ *             self.encoding = PyBytes_AsString(self._bencoding)
+ *             if isinstance(unicode_errors, unicode):             # <<<<<<<<<<<<<<
+ *                 self._berrors = unicode_errors.encode('ascii')
+ *             else:
  */
-      __pyx_t_3 = PyUnicode_AsEncodedString(__pyx_v_o, __pyx_v_self->encoding, __pyx_v_self->unicode_errors); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 172, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __Pyx_DECREF_SET(__pyx_v_o, __pyx_t_3);
-      __pyx_t_3 = 0;
+      goto __pyx_L11;
+    }
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":174
- *                 o = PyUnicode_AsEncodedString(o, self.encoding,
- *                                               self.unicode_errors)
- *                 L = len(o)             # <<<<<<<<<<<<<<
- *                 if L > (2**32) - 1:
- *                     raise ValueError("dict is too large")
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":207
+ *                 self._berrors = unicode_errors.encode('ascii')
+ *             else:
+ *                 self._berrors = unicode_errors             # <<<<<<<<<<<<<<
+ *             self.unicode_errors = PyBytes_AsString(self._berrors)
+ * 
  */
-      __pyx_t_11 = PyObject_Length(__pyx_v_o); if (unlikely(__pyx_t_11 == ((Py_ssize_t)-1))) __PYX_ERR(0, 174, __pyx_L1_error)
-      __pyx_v_L = __pyx_t_11;
+    /*else*/ {
+      __Pyx_INCREF(__pyx_v_unicode_errors);
+      __Pyx_GIVEREF(__pyx_v_unicode_errors);
+      __Pyx_GOTREF(__pyx_v_self->_berrors);
+      __Pyx_DECREF(__pyx_v_self->_berrors);
+      __pyx_v_self->_berrors = __pyx_v_unicode_errors;
+    }
+    __pyx_L11:;
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":175
- *                                               self.unicode_errors)
- *                 L = len(o)
- *                 if L > (2**32) - 1:             # <<<<<<<<<<<<<<
- *                     raise ValueError("dict is too large")
- *                 rawval = o
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":208
+ *             else:
+ *                 self._berrors = unicode_errors
+ *             self.unicode_errors = PyBytes_AsString(self._berrors)             # <<<<<<<<<<<<<<
+ * 
+ *     def __dealloc__(self):
  */
-      __pyx_t_3 = __Pyx_PyInt_FromSize_t(__pyx_v_L); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 175, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_2 = PyObject_RichCompare(__pyx_t_3, __pyx_int_4294967295, Py_GT); __Pyx_XGOTREF(__pyx_t_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 175, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 175, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      if (unlikely(__pyx_t_1)) {
+    __pyx_t_2 = __pyx_v_self->_berrors;
+    __Pyx_INCREF(__pyx_t_2);
+    __pyx_t_6 = PyBytes_AsString(__pyx_t_2); if (unlikely(__pyx_t_6 == ((char *)NULL))) __PYX_ERR(0, 208, __pyx_L1_error)
+    __pyx_v_self->unicode_errors = __pyx_t_6;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  }
+  __pyx_L9:;
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":176
- *                 L = len(o)
- *                 if L > (2**32) - 1:
- *                     raise ValueError("dict is too large")             # <<<<<<<<<<<<<<
- *                 rawval = o
- *                 ret = msgpack_pack_raw(&self.pk, len(o))
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":170
+ *         self.pk.length = 0
+ * 
+ *     def __init__(self, default=None, encoding='utf-8',             # <<<<<<<<<<<<<<
+ *                  unicode_errors='strict', use_single_float=False,
+ *                  bint autoreset=1, bint use_bin_type=0,
  */
-        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 176, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_Raise(__pyx_t_2, 0, 0, 0);
-        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-        __PYX_ERR(0, 176, __pyx_L1_error)
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":175
- *                                               self.unicode_errors)
- *                 L = len(o)
- *                 if L > (2**32) - 1:             # <<<<<<<<<<<<<<
- *                     raise ValueError("dict is too large")
- *                 rawval = o
- */
-      }
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":177
- *                 if L > (2**32) - 1:
- *                     raise ValueError("dict is too large")
- *                 rawval = o             # <<<<<<<<<<<<<<
- *                 ret = msgpack_pack_raw(&self.pk, len(o))
- *                 if ret == 0:
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":210
+ *             self.unicode_errors = PyBytes_AsString(self._berrors)
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         free(self.pk.buf);
+ * 
  */
-      __pyx_t_12 = __Pyx_PyObject_AsWritableString(__pyx_v_o); if (unlikely((!__pyx_t_12) && PyErr_Occurred())) __PYX_ERR(0, 177, __pyx_L1_error)
-      __pyx_v_rawval = __pyx_t_12;
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":178
- *                     raise ValueError("dict is too large")
- *                 rawval = o
- *                 ret = msgpack_pack_raw(&self.pk, len(o))             # <<<<<<<<<<<<<<
- *                 if ret == 0:
- *                     ret = msgpack_pack_raw_body(&self.pk, rawval, len(o))
+/* Python wrapper */
+static void __pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_5__dealloc__(PyObject *__pyx_v_self); /*proto*/
+static void __pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_5__dealloc__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__dealloc__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_4__dealloc__(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+static void __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_4__dealloc__(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self) {
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":211
+ * 
+ *     def __dealloc__(self):
+ *         free(self.pk.buf);             # <<<<<<<<<<<<<<
+ * 
+ *     cdef _write(self, object data, size_t length):
  */
-      __pyx_t_11 = PyObject_Length(__pyx_v_o); if (unlikely(__pyx_t_11 == ((Py_ssize_t)-1))) __PYX_ERR(0, 178, __pyx_L1_error)
-      __pyx_v_ret = msgpack_pack_raw((&__pyx_v_self->pk), __pyx_t_11);
+  free(__pyx_v_self->pk.buf);
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":179
- *                 rawval = o
- *                 ret = msgpack_pack_raw(&self.pk, len(o))
- *                 if ret == 0:             # <<<<<<<<<<<<<<
- *                     ret = msgpack_pack_raw_body(&self.pk, rawval, len(o))
- *             elif PyDict_CheckExact(o):
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":210
+ *             self.unicode_errors = PyBytes_AsString(self._berrors)
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         free(self.pk.buf);
+ * 
  */
-      __pyx_t_1 = (__pyx_v_ret == 0);
-      if (__pyx_t_1) {
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":180
- *                 ret = msgpack_pack_raw(&self.pk, len(o))
- *                 if ret == 0:
- *                     ret = msgpack_pack_raw_body(&self.pk, rawval, len(o))             # <<<<<<<<<<<<<<
- *             elif PyDict_CheckExact(o):
- *                 d = <dict>o
+  /* function exit code */
+}
+
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":213
+ *         free(self.pk.buf);
+ * 
+ *     cdef _write(self, object data, size_t length):             # <<<<<<<<<<<<<<
+ *         if self.segments is not None:
+ *             self.segments.append(data)
  */
-        __pyx_t_11 = PyObject_Length(__pyx_v_o); if (unlikely(__pyx_t_11 == ((Py_ssize_t)-1))) __PYX_ERR(0, 180, __pyx_L1_error)
-        __pyx_v_ret = msgpack_pack_raw_body((&__pyx_v_self->pk), __pyx_v_rawval, __pyx_t_11);
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":179
- *                 rawval = o
- *                 ret = msgpack_pack_raw(&self.pk, len(o))
- *                 if ret == 0:             # <<<<<<<<<<<<<<
- *                     ret = msgpack_pack_raw_body(&self.pk, rawval, len(o))
- *             elif PyDict_CheckExact(o):
+static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__write(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_data, size_t __pyx_v_length) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  unsigned int __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_write", 1);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":214
+ * 
+ *     cdef _write(self, object data, size_t length):
+ *         if self.segments is not None:             # <<<<<<<<<<<<<<
+ *             self.segments.append(data)
+ *         else:
  */
-      }
+  __pyx_t_1 = (__pyx_v_self->segments != ((PyObject*)Py_None));
+  if (__pyx_t_1) {
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":168
- *                 if ret == 0:
- *                     ret = msgpack_pack_raw_body(&self.pk, rawval, L)
- *             elif PyUnicode_Check(o):             # <<<<<<<<<<<<<<
- *                 if not self.encoding:
- *                     raise TypeError("Can't encode unicode string: "
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":215
+ *     cdef _write(self, object data, size_t length):
+ *         if self.segments is not None:
+ *             self.segments.append(data)             # <<<<<<<<<<<<<<
+ *         else:
+ *             self.stream.write(data)
  */
-      goto __pyx_L6;
+    if (unlikely(__pyx_v_self->segments == Py_None)) {
+      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "append");
+      __PYX_ERR(0, 215, __pyx_L1_error)
     }
+    __pyx_t_2 = __Pyx_PyList_Append(__pyx_v_self->segments, __pyx_v_data); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 215, __pyx_L1_error)
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":181
- *                 if ret == 0:
- *                     ret = msgpack_pack_raw_body(&self.pk, rawval, len(o))
- *             elif PyDict_CheckExact(o):             # <<<<<<<<<<<<<<
- *                 d = <dict>o
- *                 L = len(d)
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":214
+ * 
+ *     cdef _write(self, object data, size_t length):
+ *         if self.segments is not None:             # <<<<<<<<<<<<<<
+ *             self.segments.append(data)
+ *         else:
  */
-    __pyx_t_1 = PyDict_CheckExact(__pyx_v_o);
-    if (__pyx_t_1) {
+    goto __pyx_L3;
+  }
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":182
- *                     ret = msgpack_pack_raw_body(&self.pk, rawval, len(o))
- *             elif PyDict_CheckExact(o):
- *                 d = <dict>o             # <<<<<<<<<<<<<<
- *                 L = len(d)
- *                 if L > (2**32) - 1:
- */
-      __pyx_t_2 = __pyx_v_o;
-      __Pyx_INCREF(__pyx_t_2);
-      __pyx_v_d = ((PyObject*)__pyx_t_2);
-      __pyx_t_2 = 0;
-
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":183
- *             elif PyDict_CheckExact(o):
- *                 d = <dict>o
- *                 L = len(d)             # <<<<<<<<<<<<<<
- *                 if L > (2**32) - 1:
- *                     raise ValueError("dict is too large")
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":217
+ *             self.segments.append(data)
+ *         else:
+ *             self.stream.write(data)             # <<<<<<<<<<<<<<
+ *         self.written += length
+ * 
  */
-      if (unlikely(__pyx_v_d == Py_None)) {
-        PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
-        __PYX_ERR(0, 183, __pyx_L1_error)
+  /*else*/ {
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->stream, __pyx_n_s_write); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 217, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = NULL;
+    __pyx_t_6 = 0;
+    #if CYTHON_UNPACK_METHODS
+    if (likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+        __pyx_t_6 = 1;
       }
-      __pyx_t_11 = PyDict_Size(__pyx_v_d); if (unlikely(__pyx_t_11 == ((Py_ssize_t)-1))) __PYX_ERR(0, 183, __pyx_L1_error)
-      __pyx_v_L = __pyx_t_11;
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_5, __pyx_v_data};
+      __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_6, 1+__pyx_t_6);
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 217, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  }
+  __pyx_L3:;
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":184
- *                 d = <dict>o
- *                 L = len(d)
- *                 if L > (2**32) - 1:             # <<<<<<<<<<<<<<
- *                     raise ValueError("dict is too large")
- *                 ret = msgpack_pack_map(&self.pk, L)
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":218
+ *         else:
+ *             self.stream.write(data)
+ *         self.written += length             # <<<<<<<<<<<<<<
+ * 
+ *     cdef _flush(self):
  */
-      __pyx_t_2 = __Pyx_PyInt_FromSize_t(__pyx_v_L); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 184, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_3 = PyObject_RichCompare(__pyx_t_2, __pyx_int_4294967295, Py_GT); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 184, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 184, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      if (unlikely(__pyx_t_1)) {
+  __pyx_v_self->written = (__pyx_v_self->written + __pyx_v_length);
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":185
- *                 L = len(d)
- *                 if L > (2**32) - 1:
- *                     raise ValueError("dict is too large")             # <<<<<<<<<<<<<<
- *                 ret = msgpack_pack_map(&self.pk, L)
- *                 if ret == 0:
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":213
+ *         free(self.pk.buf);
+ * 
+ *     cdef _write(self, object data, size_t length):             # <<<<<<<<<<<<<<
+ *         if self.segments is not None:
+ *             self.segments.append(data)
  */
-        __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 185, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_Raise(__pyx_t_3, 0, 0, 0);
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __PYX_ERR(0, 185, __pyx_L1_error)
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":184
- *                 d = <dict>o
- *                 L = len(d)
- *                 if L > (2**32) - 1:             # <<<<<<<<<<<<<<
- *                     raise ValueError("dict is too large")
- *                 ret = msgpack_pack_map(&self.pk, L)
- */
-      }
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer._write", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":186
- *                 if L > (2**32) - 1:
- *                     raise ValueError("dict is too large")
- *                 ret = msgpack_pack_map(&self.pk, L)             # <<<<<<<<<<<<<<
- *                 if ret == 0:
- *                     for k, v in d.iteritems():
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":220
+ *         self.written += length
+ * 
+ *     cdef _flush(self):             # <<<<<<<<<<<<<<
+ *         if self.segments is not None:
+ *             if self.pk.length:
  */
-      __pyx_v_ret = msgpack_pack_map((&__pyx_v_self->pk), __pyx_v_L);
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":187
- *                     raise ValueError("dict is too large")
- *                 ret = msgpack_pack_map(&self.pk, L)
- *                 if ret == 0:             # <<<<<<<<<<<<<<
- *                     for k, v in d.iteritems():
- *                         ret = self._pack(k, nest_limit - 1)
- */
-      __pyx_t_1 = (__pyx_v_ret == 0);
-      if (__pyx_t_1) {
+static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__flush(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  unsigned int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_flush", 1);
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":188
- *                 ret = msgpack_pack_map(&self.pk, L)
- *                 if ret == 0:
- *                     for k, v in d.iteritems():             # <<<<<<<<<<<<<<
- *                         ret = self._pack(k, nest_limit - 1)
- *                         if ret != 0: break
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":221
+ * 
+ *     cdef _flush(self):
+ *         if self.segments is not None:             # <<<<<<<<<<<<<<
+ *             if self.pk.length:
+ *                 # the buffer is reused, so gathered data has to be copied
  */
-        __pyx_t_11 = 0;
-        if (unlikely(__pyx_v_d == Py_None)) {
-          PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "iteritems");
-          __PYX_ERR(0, 188, __pyx_L1_error)
-        }
-        __pyx_t_2 = __Pyx_dict_iterator(__pyx_v_d, 1, __pyx_n_s_iteritems, (&__pyx_t_13), (&__pyx_t_14)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 188, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_XDECREF(__pyx_t_3);
-        __pyx_t_3 = __pyx_t_2;
-        __pyx_t_2 = 0;
-        while (1) {
-          __pyx_t_15 = __Pyx_dict_iter_next(__pyx_t_3, __pyx_t_13, &__pyx_t_11, &__pyx_t_2, &__pyx_t_4, NULL, __pyx_t_14);
-          if (unlikely(__pyx_t_15 == 0)) break;
-          if (unlikely(__pyx_t_15 == -1)) __PYX_ERR(0, 188, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_2);
-          __Pyx_GOTREF(__pyx_t_4);
-          __Pyx_XDECREF_SET(__pyx_v_k, __pyx_t_2);
-          __pyx_t_2 = 0;
-          __Pyx_XDECREF_SET(__pyx_v_v, __pyx_t_4);
-          __pyx_t_4 = 0;
+  __pyx_t_1 = (__pyx_v_self->segments != ((PyObject*)Py_None));
+  if (__pyx_t_1) {
 
-          /* "isf_pandas_msgpack/msgpack/_packer.pyx":189
- *                 if ret == 0:
- *                     for k, v in d.iteritems():
- *                         ret = self._pack(k, nest_limit - 1)             # <<<<<<<<<<<<<<
- *                         if ret != 0: break
- *                         ret = self._pack(v, nest_limit - 1)
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":222
+ *     cdef _flush(self):
+ *         if self.segments is not None:
+ *             if self.pk.length:             # <<<<<<<<<<<<<<
+ *                 # the buffer is reused, so gathered data has to be copied
+ *                 self.segments.append(self._take())
  */
-          __pyx_t_16.__pyx_n = 1;
-          __pyx_t_16.nest_limit = (__pyx_v_nest_limit - 1);
-          __pyx_t_15 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_pack(__pyx_v_self, __pyx_v_k, &__pyx_t_16); if (unlikely(__pyx_t_15 == ((int)-1))) __PYX_ERR(0, 189, __pyx_L1_error)
-          __pyx_v_ret = __pyx_t_15;
+    __pyx_t_1 = (__pyx_v_self->pk.length != 0);
+    if (__pyx_t_1) {
 
-          /* "isf_pandas_msgpack/msgpack/_packer.pyx":190
- *                     for k, v in d.iteritems():
- *                         ret = self._pack(k, nest_limit - 1)
- *                         if ret != 0: break             # <<<<<<<<<<<<<<
- *                         ret = self._pack(v, nest_limit - 1)
- *                         if ret != 0: break
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":224
+ *             if self.pk.length:
+ *                 # the buffer is reused, so gathered data has to be copied
+ *                 self.segments.append(self._take())             # <<<<<<<<<<<<<<
+ *             if self.stream is not None:
+ *                 _writev(self.stream, self.segments)
+ */
+      if (unlikely(__pyx_v_self->segments == Py_None)) {
+        PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "append");
+        __PYX_ERR(0, 224, __pyx_L1_error)
+      }
+      __pyx_t_2 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_take(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 224, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_3 = __Pyx_PyList_Append(__pyx_v_self->segments, __pyx_t_2); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 224, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":222
+ *     cdef _flush(self):
+ *         if self.segments is not None:
+ *             if self.pk.length:             # <<<<<<<<<<<<<<
+ *                 # the buffer is reused, so gathered data has to be copied
+ *                 self.segments.append(self._take())
  */
-          __pyx_t_1 = (__pyx_v_ret != 0);
-          if (__pyx_t_1) {
-            goto __pyx_L18_break;
-          }
+    }
 
-          /* "isf_pandas_msgpack/msgpack/_packer.pyx":191
- *                         ret = self._pack(k, nest_limit - 1)
- *                         if ret != 0: break
- *                         ret = self._pack(v, nest_limit - 1)             # <<<<<<<<<<<<<<
- *                         if ret != 0: break
- *             elif PyDict_Check(o):
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":225
+ *                 # the buffer is reused, so gathered data has to be copied
+ *                 self.segments.append(self._take())
+ *             if self.stream is not None:             # <<<<<<<<<<<<<<
+ *                 _writev(self.stream, self.segments)
+ *                 del self.segments[:]
  */
-          __pyx_t_16.__pyx_n = 1;
-          __pyx_t_16.nest_limit = (__pyx_v_nest_limit - 1);
-          __pyx_t_15 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_pack(__pyx_v_self, __pyx_v_v, &__pyx_t_16); if (unlikely(__pyx_t_15 == ((int)-1))) __PYX_ERR(0, 191, __pyx_L1_error)
-          __pyx_v_ret = __pyx_t_15;
+    __pyx_t_1 = (__pyx_v_self->stream != Py_None);
+    if (__pyx_t_1) {
 
-          /* "isf_pandas_msgpack/msgpack/_packer.pyx":192
- *                         if ret != 0: break
- *                         ret = self._pack(v, nest_limit - 1)
- *                         if ret != 0: break             # <<<<<<<<<<<<<<
- *             elif PyDict_Check(o):
- *                 L = len(o)
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":226
+ *                 self.segments.append(self._take())
+ *             if self.stream is not None:
+ *                 _writev(self.stream, self.segments)             # <<<<<<<<<<<<<<
+ *                 del self.segments[:]
+ *         elif self.pk.length:
  */
-          __pyx_t_1 = (__pyx_v_ret != 0);
-          if (__pyx_t_1) {
-            goto __pyx_L18_break;
-          }
+      __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_writev_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 226, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_5 = NULL;
+      __pyx_t_6 = 0;
+      #if CYTHON_UNPACK_METHODS
+      if (unlikely(PyMethod_Check(__pyx_t_4))) {
+        __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+        if (likely(__pyx_t_5)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+          __Pyx_INCREF(__pyx_t_5);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_4, function);
+          __pyx_t_6 = 1;
         }
-        __pyx_L18_break:;
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      }
+      #endif
+      {
+        PyObject *__pyx_callargs[3] = {__pyx_t_5, __pyx_v_self->stream, __pyx_v_self->segments};
+        __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_6, 2+__pyx_t_6);
+        __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 226, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      }
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":187
- *                     raise ValueError("dict is too large")
- *                 ret = msgpack_pack_map(&self.pk, L)
- *                 if ret == 0:             # <<<<<<<<<<<<<<
- *                     for k, v in d.iteritems():
- *                         ret = self._pack(k, nest_limit - 1)
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":227
+ *             if self.stream is not None:
+ *                 _writev(self.stream, self.segments)
+ *                 del self.segments[:]             # <<<<<<<<<<<<<<
+ *         elif self.pk.length:
+ *             self.stream.write(PyMemoryView_FromMemory(
  */
+      if (unlikely(__pyx_v_self->segments == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+        __PYX_ERR(0, 227, __pyx_L1_error)
       }
+      if (__Pyx_PyObject_DelSlice(__pyx_v_self->segments, 0, 0, NULL, NULL, NULL, 0, 0, 1) < 0) __PYX_ERR(0, 227, __pyx_L1_error)
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":181
- *                 if ret == 0:
- *                     ret = msgpack_pack_raw_body(&self.pk, rawval, len(o))
- *             elif PyDict_CheckExact(o):             # <<<<<<<<<<<<<<
- *                 d = <dict>o
- *                 L = len(d)
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":225
+ *                 # the buffer is reused, so gathered data has to be copied
+ *                 self.segments.append(self._take())
+ *             if self.stream is not None:             # <<<<<<<<<<<<<<
+ *                 _writev(self.stream, self.segments)
+ *                 del self.segments[:]
  */
-      goto __pyx_L6;
     }
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":193
- *                         ret = self._pack(v, nest_limit - 1)
- *                         if ret != 0: break
- *             elif PyDict_Check(o):             # <<<<<<<<<<<<<<
- *                 L = len(o)
- *                 if L > (2**32) - 1:
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":221
+ * 
+ *     cdef _flush(self):
+ *         if self.segments is not None:             # <<<<<<<<<<<<<<
+ *             if self.pk.length:
+ *                 # the buffer is reused, so gathered data has to be copied
  */
-    __pyx_t_1 = PyDict_Check(__pyx_v_o);
-    if (__pyx_t_1) {
+    goto __pyx_L3;
+  }
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":194
- *                         if ret != 0: break
- *             elif PyDict_Check(o):
- *                 L = len(o)             # <<<<<<<<<<<<<<
- *                 if L > (2**32) - 1:
- *                     raise ValueError("dict is too large")
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":228
+ *                 _writev(self.stream, self.segments)
+ *                 del self.segments[:]
+ *         elif self.pk.length:             # <<<<<<<<<<<<<<
+ *             self.stream.write(PyMemoryView_FromMemory(
+ *                 self.pk.buf, self.pk.length, PyBUF_READ))
  */
-      __pyx_t_13 = PyObject_Length(__pyx_v_o); if (unlikely(__pyx_t_13 == ((Py_ssize_t)-1))) __PYX_ERR(0, 194, __pyx_L1_error)
-      __pyx_v_L = __pyx_t_13;
+  __pyx_t_1 = (__pyx_v_self->pk.length != 0);
+  if (__pyx_t_1) {
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":195
- *             elif PyDict_Check(o):
- *                 L = len(o)
- *                 if L > (2**32) - 1:             # <<<<<<<<<<<<<<
- *                     raise ValueError("dict is too large")
- *                 ret = msgpack_pack_map(&self.pk, L)
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":229
+ *                 del self.segments[:]
+ *         elif self.pk.length:
+ *             self.stream.write(PyMemoryView_FromMemory(             # <<<<<<<<<<<<<<
+ *                 self.pk.buf, self.pk.length, PyBUF_READ))
+ *             self.written += self.pk.length
  */
-      __pyx_t_3 = __Pyx_PyInt_FromSize_t(__pyx_v_L); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 195, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyObject_RichCompare(__pyx_t_3, __pyx_int_4294967295, Py_GT); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 195, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 195, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      if (unlikely(__pyx_t_1)) {
+    __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->stream, __pyx_n_s_write); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 229, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":196
- *                 L = len(o)
- *                 if L > (2**32) - 1:
- *                     raise ValueError("dict is too large")             # <<<<<<<<<<<<<<
- *                 ret = msgpack_pack_map(&self.pk, L)
- *                 if ret == 0:
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":230
+ *         elif self.pk.length:
+ *             self.stream.write(PyMemoryView_FromMemory(
+ *                 self.pk.buf, self.pk.length, PyBUF_READ))             # <<<<<<<<<<<<<<
+ *             self.written += self.pk.length
+ *             self.pk.length = 0
  */
-        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 196, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        __Pyx_Raise(__pyx_t_4, 0, 0, 0);
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __PYX_ERR(0, 196, __pyx_L1_error)
+    __pyx_t_5 = PyMemoryView_FromMemory(__pyx_v_self->pk.buf, __pyx_v_self->pk.length, PyBUF_READ); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 229, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_7 = NULL;
+    __pyx_t_6 = 0;
+    #if CYTHON_UNPACK_METHODS
+    if (likely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_7)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_7);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+        __pyx_t_6 = 1;
+      }
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_7, __pyx_t_5};
+      __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_6, 1+__pyx_t_6);
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 229, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    }
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":195
- *             elif PyDict_Check(o):
- *                 L = len(o)
- *                 if L > (2**32) - 1:             # <<<<<<<<<<<<<<
- *                     raise ValueError("dict is too large")
- *                 ret = msgpack_pack_map(&self.pk, L)
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":231
+ *             self.stream.write(PyMemoryView_FromMemory(
+ *                 self.pk.buf, self.pk.length, PyBUF_READ))
+ *             self.written += self.pk.length             # <<<<<<<<<<<<<<
+ *             self.pk.length = 0
+ * 
  */
-      }
+    __pyx_v_self->written = (__pyx_v_self->written + __pyx_v_self->pk.length);
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":197
- *                 if L > (2**32) - 1:
- *                     raise ValueError("dict is too large")
- *                 ret = msgpack_pack_map(&self.pk, L)             # <<<<<<<<<<<<<<
- *                 if ret == 0:
- *                     for k, v in o.items():
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":232
+ *                 self.pk.buf, self.pk.length, PyBUF_READ))
+ *             self.written += self.pk.length
+ *             self.pk.length = 0             # <<<<<<<<<<<<<<
+ * 
+ *     cdef _take(self):
  */
-      __pyx_v_ret = msgpack_pack_map((&__pyx_v_self->pk), __pyx_v_L);
+    __pyx_v_self->pk.length = 0;
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":198
- *                     raise ValueError("dict is too large")
- *                 ret = msgpack_pack_map(&self.pk, L)
- *                 if ret == 0:             # <<<<<<<<<<<<<<
- *                     for k, v in o.items():
- *                         ret = self._pack(k, nest_limit - 1)
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":228
+ *                 _writev(self.stream, self.segments)
+ *                 del self.segments[:]
+ *         elif self.pk.length:             # <<<<<<<<<<<<<<
+ *             self.stream.write(PyMemoryView_FromMemory(
+ *                 self.pk.buf, self.pk.length, PyBUF_READ))
  */
-      __pyx_t_1 = (__pyx_v_ret == 0);
-      if (__pyx_t_1) {
+  }
+  __pyx_L3:;
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":199
- *                 ret = msgpack_pack_map(&self.pk, L)
- *                 if ret == 0:
- *                     for k, v in o.items():             # <<<<<<<<<<<<<<
- *                         ret = self._pack(k, nest_limit - 1)
- *                         if ret != 0: break
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":220
+ *         self.written += length
+ * 
+ *     cdef _flush(self):             # <<<<<<<<<<<<<<
+ *         if self.segments is not None:
+ *             if self.pk.length:
  */
-        __pyx_t_13 = 0;
-        if (unlikely(__pyx_v_o == Py_None)) {
-          PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "items");
-          __PYX_ERR(0, 199, __pyx_L1_error)
-        }
-        __pyx_t_3 = __Pyx_dict_iterator(__pyx_v_o, 0, __pyx_n_s_items, (&__pyx_t_11), (&__pyx_t_14)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 199, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_3);
-        __Pyx_XDECREF(__pyx_t_4);
-        __pyx_t_4 = __pyx_t_3;
-        __pyx_t_3 = 0;
-        while (1) {
-          __pyx_t_15 = __Pyx_dict_iter_next(__pyx_t_4, __pyx_t_11, &__pyx_t_13, &__pyx_t_3, &__pyx_t_2, NULL, __pyx_t_14);
-          if (unlikely(__pyx_t_15 == 0)) break;
-          if (unlikely(__pyx_t_15 == -1)) __PYX_ERR(0, 199, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_3);
-          __Pyx_GOTREF(__pyx_t_2);
-          __Pyx_XDECREF_SET(__pyx_v_k, __pyx_t_3);
-          __pyx_t_3 = 0;
-          __Pyx_XDECREF_SET(__pyx_v_v, __pyx_t_2);
-          __pyx_t_2 = 0;
 
-          /* "isf_pandas_msgpack/msgpack/_packer.pyx":200
- *                 if ret == 0:
- *                     for k, v in o.items():
- *                         ret = self._pack(k, nest_limit - 1)             # <<<<<<<<<<<<<<
- *                         if ret != 0: break
- *                         ret = self._pack(v, nest_limit - 1)
- */
-          __pyx_t_16.__pyx_n = 1;
-          __pyx_t_16.nest_limit = (__pyx_v_nest_limit - 1);
-          __pyx_t_15 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_pack(__pyx_v_self, __pyx_v_k, &__pyx_t_16); if (unlikely(__pyx_t_15 == ((int)-1))) __PYX_ERR(0, 200, __pyx_L1_error)
-          __pyx_v_ret = __pyx_t_15;
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer._flush", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-          /* "isf_pandas_msgpack/msgpack/_packer.pyx":201
- *                     for k, v in o.items():
- *                         ret = self._pack(k, nest_limit - 1)
- *                         if ret != 0: break             # <<<<<<<<<<<<<<
- *                         ret = self._pack(v, nest_limit - 1)
- *                         if ret != 0: break
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":234
+ *             self.pk.length = 0
+ * 
+ *     cdef _take(self):             # <<<<<<<<<<<<<<
+ *         buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
+ *         self.written += self.pk.length
  */
-          __pyx_t_1 = (__pyx_v_ret != 0);
-          if (__pyx_t_1) {
-            goto __pyx_L24_break;
-          }
 
-          /* "isf_pandas_msgpack/msgpack/_packer.pyx":202
- *                         ret = self._pack(k, nest_limit - 1)
- *                         if ret != 0: break
- *                         ret = self._pack(v, nest_limit - 1)             # <<<<<<<<<<<<<<
- *                         if ret != 0: break
- *             elif isinstance(o, ExtType):
- */
-          __pyx_t_16.__pyx_n = 1;
-          __pyx_t_16.nest_limit = (__pyx_v_nest_limit - 1);
-          __pyx_t_15 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_pack(__pyx_v_self, __pyx_v_v, &__pyx_t_16); if (unlikely(__pyx_t_15 == ((int)-1))) __PYX_ERR(0, 202, __pyx_L1_error)
-          __pyx_v_ret = __pyx_t_15;
+static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__take(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self) {
+  PyObject *__pyx_v_buf = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_take", 1);
 
-          /* "isf_pandas_msgpack/msgpack/_packer.pyx":203
- *                         if ret != 0: break
- *                         ret = self._pack(v, nest_limit - 1)
- *                         if ret != 0: break             # <<<<<<<<<<<<<<
- *             elif isinstance(o, ExtType):
- *                 # This should be before Tuple because ExtType is namedtuple.
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":235
+ * 
+ *     cdef _take(self):
+ *         buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)             # <<<<<<<<<<<<<<
+ *         self.written += self.pk.length
+ *         self.pk.length = 0
  */
-          __pyx_t_1 = (__pyx_v_ret != 0);
-          if (__pyx_t_1) {
-            goto __pyx_L24_break;
-          }
-        }
-        __pyx_L24_break:;
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_1 = PyBytes_FromStringAndSize(__pyx_v_self->pk.buf, __pyx_v_self->pk.length); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 235, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_buf = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":198
- *                     raise ValueError("dict is too large")
- *                 ret = msgpack_pack_map(&self.pk, L)
- *                 if ret == 0:             # <<<<<<<<<<<<<<
- *                     for k, v in o.items():
- *                         ret = self._pack(k, nest_limit - 1)
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":236
+ *     cdef _take(self):
+ *         buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
+ *         self.written += self.pk.length             # <<<<<<<<<<<<<<
+ *         self.pk.length = 0
+ *         return buf
  */
-      }
+  __pyx_v_self->written = (__pyx_v_self->written + __pyx_v_self->pk.length);
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":193
- *                         ret = self._pack(v, nest_limit - 1)
- *                         if ret != 0: break
- *             elif PyDict_Check(o):             # <<<<<<<<<<<<<<
- *                 L = len(o)
- *                 if L > (2**32) - 1:
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":237
+ *         buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
+ *         self.written += self.pk.length
+ *         self.pk.length = 0             # <<<<<<<<<<<<<<
+ *         return buf
+ * 
  */
-      goto __pyx_L6;
-    }
+  __pyx_v_self->pk.length = 0;
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":204
- *                         ret = self._pack(v, nest_limit - 1)
- *                         if ret != 0: break
- *             elif isinstance(o, ExtType):             # <<<<<<<<<<<<<<
- *                 # This should be before Tuple because ExtType is namedtuple.
- *                 longval = o.code
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":238
+ *         self.written += self.pk.length
+ *         self.pk.length = 0
+ *         return buf             # <<<<<<<<<<<<<<
+ * 
+ *     def tell(self):
  */
-    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_ExtType); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 204, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_1 = PyObject_IsInstance(__pyx_v_o, __pyx_t_4); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 204, __pyx_L1_error)
-    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (__pyx_t_1) {
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_buf);
+  __pyx_r = __pyx_v_buf;
+  goto __pyx_L0;
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":206
- *             elif isinstance(o, ExtType):
- *                 # This should be before Tuple because ExtType is namedtuple.
- *                 longval = o.code             # <<<<<<<<<<<<<<
- *                 rawval = o.data
- *                 L = len(o.data)
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":234
+ *             self.pk.length = 0
+ * 
+ *     cdef _take(self):             # <<<<<<<<<<<<<<
+ *         buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
+ *         self.written += self.pk.length
  */
-      __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_o, __pyx_n_s_code); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 206, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_8 = __Pyx_PyInt_As_long(__pyx_t_4); if (unlikely((__pyx_t_8 == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 206, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_v_longval = __pyx_t_8;
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":207
- *                 # This should be before Tuple because ExtType is namedtuple.
- *                 longval = o.code
- *                 rawval = o.data             # <<<<<<<<<<<<<<
- *                 L = len(o.data)
- *                 if L > (2**32) - 1:
- */
-      __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_o, __pyx_n_s_data); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 207, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_12 = __Pyx_PyObject_AsWritableString(__pyx_t_4); if (unlikely((!__pyx_t_12) && PyErr_Occurred())) __PYX_ERR(0, 207, __pyx_L1_error)
-      __pyx_v_rawval = __pyx_t_12;
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer._take", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_buf);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":208
- *                 longval = o.code
- *                 rawval = o.data
- *                 L = len(o.data)             # <<<<<<<<<<<<<<
- *                 if L > (2**32) - 1:
- *                     raise ValueError("EXT data is too large")
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":240
+ *         return buf
+ * 
+ *     def tell(self):             # <<<<<<<<<<<<<<
+ *         """Return the position in the output the next object starts at."""
+ *         return self.written + self.pk.length
  */
-      __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_o, __pyx_n_s_data); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 208, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_11 = PyObject_Length(__pyx_t_4); if (unlikely(__pyx_t_11 == ((Py_ssize_t)-1))) __PYX_ERR(0, 208, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_v_L = __pyx_t_11;
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":209
- *                 rawval = o.data
- *                 L = len(o.data)
- *                 if L > (2**32) - 1:             # <<<<<<<<<<<<<<
- *                     raise ValueError("EXT data is too large")
- *                 ret = msgpack_pack_ext(&self.pk, longval, L)
- */
-      __pyx_t_4 = __Pyx_PyInt_FromSize_t(__pyx_v_L); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 209, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_2 = PyObject_RichCompare(__pyx_t_4, __pyx_int_4294967295, Py_GT); __Pyx_XGOTREF(__pyx_t_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 209, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 209, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      if (unlikely(__pyx_t_1)) {
+/* Python wrapper */
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_7tell(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_6tell, "Packer.tell(self)\nReturn the position in the output the next object starts at.");
+static PyMethodDef __pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_7tell = {"tell", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_7tell, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_6tell};
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_7tell(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("tell (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) {
+    __Pyx_RaiseArgtupleInvalid("tell", 1, 0, 0, __pyx_nargs); return NULL;}
+  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "tell", 0))) return NULL;
+  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_6tell(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self));
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":210
- *                 L = len(o.data)
- *                 if L > (2**32) - 1:
- *                     raise ValueError("EXT data is too large")             # <<<<<<<<<<<<<<
- *                 ret = msgpack_pack_ext(&self.pk, longval, L)
- *                 ret = msgpack_pack_raw_body(&self.pk, rawval, L)
- */
-        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 210, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_Raise(__pyx_t_2, 0, 0, 0);
-        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-        __PYX_ERR(0, 210, __pyx_L1_error)
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":209
- *                 rawval = o.data
- *                 L = len(o.data)
- *                 if L > (2**32) - 1:             # <<<<<<<<<<<<<<
- *                     raise ValueError("EXT data is too large")
- *                 ret = msgpack_pack_ext(&self.pk, longval, L)
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_6tell(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("tell", 1);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":242
+ *     def tell(self):
+ *         """Return the position in the output the next object starts at."""
+ *         return self.written + self.pk.length             # <<<<<<<<<<<<<<
+ * 
+ *     cdef bint _aligns(self, object k, object v):
  */
-      }
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyInt_FromSize_t((__pyx_v_self->written + __pyx_v_self->pk.length)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 242, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":211
- *                 if L > (2**32) - 1:
- *                     raise ValueError("EXT data is too large")
- *                 ret = msgpack_pack_ext(&self.pk, longval, L)             # <<<<<<<<<<<<<<
- *                 ret = msgpack_pack_raw_body(&self.pk, rawval, L)
- *             elif PyTuple_Check(o) or PyList_Check(o):
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":240
+ *         return buf
+ * 
+ *     def tell(self):             # <<<<<<<<<<<<<<
+ *         """Return the position in the output the next object starts at."""
+ *         return self.written + self.pk.length
  */
-      __pyx_v_ret = msgpack_pack_ext((&__pyx_v_self->pk), __pyx_v_longval, __pyx_v_L);
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":212
- *                     raise ValueError("EXT data is too large")
- *                 ret = msgpack_pack_ext(&self.pk, longval, L)
- *                 ret = msgpack_pack_raw_body(&self.pk, rawval, L)             # <<<<<<<<<<<<<<
- *             elif PyTuple_Check(o) or PyList_Check(o):
- *                 L = len(o)
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.tell", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":244
+ *         return self.written + self.pk.length
+ * 
+ *     cdef bint _aligns(self, object k, object v):             # <<<<<<<<<<<<<<
+ *         return (self.align and isinstance(v, ExtType) and
+ *                 PyUnicode_Check(k) and
  */
-      __pyx_v_ret = msgpack_pack_raw_body((&__pyx_v_self->pk), __pyx_v_rawval, __pyx_v_L);
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":204
- *                         ret = self._pack(v, nest_limit - 1)
- *                         if ret != 0: break
- *             elif isinstance(o, ExtType):             # <<<<<<<<<<<<<<
- *                 # This should be before Tuple because ExtType is namedtuple.
- *                 longval = o.code
+static int __pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__aligns(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_k, PyObject *__pyx_v_v) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  unsigned int __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_aligns", 1);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":245
+ * 
+ *     cdef bint _aligns(self, object k, object v):
+ *         return (self.align and isinstance(v, ExtType) and             # <<<<<<<<<<<<<<
+ *                 PyUnicode_Check(k) and
+ *                 len(memoryview(v.data).cast('B')) >= self.align)
  */
-      goto __pyx_L6;
-    }
+  __pyx_t_2 = (__pyx_v_self->align != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L3_bool_binop_done;
+  }
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_ExtType); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 245, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_2 = PyObject_IsInstance(__pyx_v_v, __pyx_t_3); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(0, 245, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L3_bool_binop_done;
+  }
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":213
- *                 ret = msgpack_pack_ext(&self.pk, longval, L)
- *                 ret = msgpack_pack_raw_body(&self.pk, rawval, L)
- *             elif PyTuple_Check(o) or PyList_Check(o):             # <<<<<<<<<<<<<<
- *                 L = len(o)
- *                 if L > (2**32) - 1:
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":246
+ *     cdef bint _aligns(self, object k, object v):
+ *         return (self.align and isinstance(v, ExtType) and
+ *                 PyUnicode_Check(k) and             # <<<<<<<<<<<<<<
+ *                 len(memoryview(v.data).cast('B')) >= self.align)
+ * 
  */
-    __pyx_t_17 = PyTuple_Check(__pyx_v_o);
-    if (!__pyx_t_17) {
-    } else {
-      __pyx_t_1 = __pyx_t_17;
-      goto __pyx_L28_bool_binop_done;
+  __pyx_t_2 = PyUnicode_Check(__pyx_v_k);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L3_bool_binop_done;
+  }
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":247
+ *         return (self.align and isinstance(v, ExtType) and
+ *                 PyUnicode_Check(k) and
+ *                 len(memoryview(v.data).cast('B')) >= self.align)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _pack_padding(self, object k, object v) except -1:
+ */
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_v, __pyx_n_s_data); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 247, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyMemoryView_FromObject(__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 247, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_cast); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 247, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_5 = NULL;
+  __pyx_t_6 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (likely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_5)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_5);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+      __pyx_t_6 = 1;
     }
-    __pyx_t_17 = PyList_Check(__pyx_v_o);
-    __pyx_t_1 = __pyx_t_17;
-    __pyx_L28_bool_binop_done:;
-    if (__pyx_t_1) {
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_5, __pyx_n_s_B};
+    __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_6, 1+__pyx_t_6);
+    __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 247, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  }
+  __pyx_t_7 = PyObject_Length(__pyx_t_3); if (unlikely(__pyx_t_7 == ((Py_ssize_t)-1))) __PYX_ERR(0, 247, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_2 = (__pyx_t_7 >= __pyx_v_self->align);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L3_bool_binop_done:;
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":214
- *                 ret = msgpack_pack_raw_body(&self.pk, rawval, L)
- *             elif PyTuple_Check(o) or PyList_Check(o):
- *                 L = len(o)             # <<<<<<<<<<<<<<
- *                 if L > (2**32) - 1:
- *                     raise ValueError("list is too large")
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":244
+ *         return self.written + self.pk.length
+ * 
+ *     cdef bint _aligns(self, object k, object v):             # <<<<<<<<<<<<<<
+ *         return (self.align and isinstance(v, ExtType) and
+ *                 PyUnicode_Check(k) and
  */
-      __pyx_t_11 = PyObject_Length(__pyx_v_o); if (unlikely(__pyx_t_11 == ((Py_ssize_t)-1))) __PYX_ERR(0, 214, __pyx_L1_error)
-      __pyx_v_L = __pyx_t_11;
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":215
- *             elif PyTuple_Check(o) or PyList_Check(o):
- *                 L = len(o)
- *                 if L > (2**32) - 1:             # <<<<<<<<<<<<<<
- *                     raise ValueError("list is too large")
- *                 ret = msgpack_pack_array(&self.pk, L)
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer._aligns", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":249
+ *                 len(memoryview(v.data).cast('B')) >= self.align)
+ * 
+ *     cdef int _pack_padding(self, object k, object v) except -1:             # <<<<<<<<<<<<<<
+ *         cdef size_t L = len(memoryview(v.data).cast('B'))
+ *         cdef size_t key_len, pad_key_len, pad
  */
-      __pyx_t_2 = __Pyx_PyInt_FromSize_t(__pyx_v_L); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 215, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_2);
-      __pyx_t_4 = PyObject_RichCompare(__pyx_t_2, __pyx_int_4294967295, Py_GT); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 215, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 215, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      if (unlikely(__pyx_t_1)) {
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":216
- *                 L = len(o)
- *                 if L > (2**32) - 1:
- *                     raise ValueError("list is too large")             # <<<<<<<<<<<<<<
- *                 ret = msgpack_pack_array(&self.pk, L)
- *                 if ret == 0:
+static int __pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__pack_padding(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_k, PyObject *__pyx_v_v) {
+  size_t __pyx_v_L;
+  size_t __pyx_v_key_len;
+  size_t __pyx_v_pad_key_len;
+  size_t __pyx_v_pad;
+  int __pyx_v_ret;
+  PyObject *__pyx_v_key = 0;
+  PyObject *__pyx_v_pad_key = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  unsigned int __pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  size_t __pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_pack_padding", 1);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":250
+ * 
+ *     cdef int _pack_padding(self, object k, object v) except -1:
+ *         cdef size_t L = len(memoryview(v.data).cast('B'))             # <<<<<<<<<<<<<<
+ *         cdef size_t key_len, pad_key_len, pad
+ *         cdef int ret
  */
-        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__8, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 216, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        __Pyx_Raise(__pyx_t_4, 0, 0, 0);
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __PYX_ERR(0, 216, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_v, __pyx_n_s_data); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 250, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = PyMemoryView_FromObject(__pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 250, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_cast); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 250, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = NULL;
+  __pyx_t_4 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (likely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_3)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_3);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __pyx_t_4 = 1;
+    }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_n_s_B};
+    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_4, 1+__pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 250, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  }
+  __pyx_t_5 = PyObject_Length(__pyx_t_1); if (unlikely(__pyx_t_5 == ((Py_ssize_t)-1))) __PYX_ERR(0, 250, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_v_L = __pyx_t_5;
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":215
- *             elif PyTuple_Check(o) or PyList_Check(o):
- *                 L = len(o)
- *                 if L > (2**32) - 1:             # <<<<<<<<<<<<<<
- *                     raise ValueError("list is too large")
- *                 ret = msgpack_pack_array(&self.pk, L)
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":253
+ *         cdef size_t key_len, pad_key_len, pad
+ *         cdef int ret
+ *         cdef bytes key = PyUnicode_AsEncodedString(k, self.encoding,             # <<<<<<<<<<<<<<
+ *                                                    self.unicode_errors)
+ *         cdef bytes pad_key = PyUnicode_AsEncodedString(
  */
-      }
+  __pyx_t_1 = PyUnicode_AsEncodedString(__pyx_v_k, __pyx_v_self->encoding, __pyx_v_self->unicode_errors); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 253, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (!(likely(PyBytes_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_1))) __PYX_ERR(0, 253, __pyx_L1_error)
+  __pyx_v_key = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":217
- *                 if L > (2**32) - 1:
- *                     raise ValueError("list is too large")
- *                 ret = msgpack_pack_array(&self.pk, L)             # <<<<<<<<<<<<<<
- *                 if ret == 0:
- *                     for v in o:
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":256
+ *                                                    self.unicode_errors)
+ *         cdef bytes pad_key = PyUnicode_AsEncodedString(
+ *             PAD_KEY, self.encoding, self.unicode_errors)             # <<<<<<<<<<<<<<
+ *         key_len = len(key) + _raw_header_size(len(key), 1)
+ *         pad_key_len = len(pad_key) + _raw_header_size(len(pad_key), 1)
  */
-      __pyx_v_ret = msgpack_pack_array((&__pyx_v_self->pk), __pyx_v_L);
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_PAD_KEY); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 256, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":218
- *                     raise ValueError("list is too large")
- *                 ret = msgpack_pack_array(&self.pk, L)
- *                 if ret == 0:             # <<<<<<<<<<<<<<
- *                     for v in o:
- *                         ret = self._pack(v, nest_limit - 1)
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":255
+ *         cdef bytes key = PyUnicode_AsEncodedString(k, self.encoding,
+ *                                                    self.unicode_errors)
+ *         cdef bytes pad_key = PyUnicode_AsEncodedString(             # <<<<<<<<<<<<<<
+ *             PAD_KEY, self.encoding, self.unicode_errors)
+ *         key_len = len(key) + _raw_header_size(len(key), 1)
  */
-      __pyx_t_1 = (__pyx_v_ret == 0);
-      if (__pyx_t_1) {
+  __pyx_t_2 = PyUnicode_AsEncodedString(__pyx_t_1, __pyx_v_self->encoding, __pyx_v_self->unicode_errors); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 255, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (!(likely(PyBytes_CheckExact(__pyx_t_2))||((__pyx_t_2) == Py_None) || __Pyx_RaiseUnexpectedTypeError("bytes", __pyx_t_2))) __PYX_ERR(0, 255, __pyx_L1_error)
+  __pyx_v_pad_key = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":219
- *                 ret = msgpack_pack_array(&self.pk, L)
- *                 if ret == 0:
- *                     for v in o:             # <<<<<<<<<<<<<<
- *                         ret = self._pack(v, nest_limit - 1)
- *                         if ret != 0: break
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":257
+ *         cdef bytes pad_key = PyUnicode_AsEncodedString(
+ *             PAD_KEY, self.encoding, self.unicode_errors)
+ *         key_len = len(key) + _raw_header_size(len(key), 1)             # <<<<<<<<<<<<<<
+ *         pad_key_len = len(pad_key) + _raw_header_size(len(pad_key), 1)
+ *         # the pad is a bin8, with a 2 byte header
  */
-        if (likely(PyList_CheckExact(__pyx_v_o)) || PyTuple_CheckExact(__pyx_v_o)) {
-          __pyx_t_4 = __pyx_v_o; __Pyx_INCREF(__pyx_t_4);
-          __pyx_t_11 = 0;
-          __pyx_t_18 = NULL;
-        } else {
-          __pyx_t_11 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_v_o); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 219, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_4);
-          __pyx_t_18 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_4); if (unlikely(!__pyx_t_18)) __PYX_ERR(0, 219, __pyx_L1_error)
-        }
-        for (;;) {
-          if (likely(!__pyx_t_18)) {
-            if (likely(PyList_CheckExact(__pyx_t_4))) {
-              {
-                Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_4);
-                #if !CYTHON_ASSUME_SAFE_MACROS
-                if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 219, __pyx_L1_error)
-                #endif
-                if (__pyx_t_11 >= __pyx_temp) break;
-              }
-              #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-              __pyx_t_2 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_11); __Pyx_INCREF(__pyx_t_2); __pyx_t_11++; if (unlikely((0 < 0))) __PYX_ERR(0, 219, __pyx_L1_error)
-              #else
-              __pyx_t_2 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_11); __pyx_t_11++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 219, __pyx_L1_error)
-              __Pyx_GOTREF(__pyx_t_2);
-              #endif
-            } else {
-              {
-                Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_4);
-                #if !CYTHON_ASSUME_SAFE_MACROS
-                if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 219, __pyx_L1_error)
-                #endif
-                if (__pyx_t_11 >= __pyx_temp) break;
-              }
-              #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-              __pyx_t_2 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_11); __Pyx_INCREF(__pyx_t_2); __pyx_t_11++; if (unlikely((0 < 0))) __PYX_ERR(0, 219, __pyx_L1_error)
-              #else
-              __pyx_t_2 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_11); __pyx_t_11++; if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 219, __pyx_L1_error)
-              __Pyx_GOTREF(__pyx_t_2);
-              #endif
-            }
-          } else {
-            __pyx_t_2 = __pyx_t_18(__pyx_t_4);
-            if (unlikely(!__pyx_t_2)) {
-              PyObject* exc_type = PyErr_Occurred();
-              if (exc_type) {
-                if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-                else __PYX_ERR(0, 219, __pyx_L1_error)
-              }
-              break;
-            }
-            __Pyx_GOTREF(__pyx_t_2);
-          }
-          __Pyx_XDECREF_SET(__pyx_v_v, __pyx_t_2);
-          __pyx_t_2 = 0;
+  if (unlikely(__pyx_v_key == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 257, __pyx_L1_error)
+  }
+  __pyx_t_5 = __Pyx_PyBytes_GET_SIZE(__pyx_v_key); if (unlikely(__pyx_t_5 == ((Py_ssize_t)-1))) __PYX_ERR(0, 257, __pyx_L1_error)
+  if (unlikely(__pyx_v_key == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 257, __pyx_L1_error)
+  }
+  __pyx_t_6 = __Pyx_PyBytes_GET_SIZE(__pyx_v_key); if (unlikely(__pyx_t_6 == ((Py_ssize_t)-1))) __PYX_ERR(0, 257, __pyx_L1_error)
+  __pyx_t_7 = __pyx_f_18isf_pandas_msgpack_7msgpack_7_packer__raw_header_size(__pyx_t_6, 1); if (unlikely(__pyx_t_7 == ((size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 257, __pyx_L1_error)
+  __pyx_v_key_len = (__pyx_t_5 + __pyx_t_7);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":258
+ *             PAD_KEY, self.encoding, self.unicode_errors)
+ *         key_len = len(key) + _raw_header_size(len(key), 1)
+ *         pad_key_len = len(pad_key) + _raw_header_size(len(pad_key), 1)             # <<<<<<<<<<<<<<
+ *         # the pad is a bin8, with a 2 byte header
+ *         pad = (self.align - (self.tell() + pad_key_len + 2 + key_len +
+ */
+  if (unlikely(__pyx_v_pad_key == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 258, __pyx_L1_error)
+  }
+  __pyx_t_5 = __Pyx_PyBytes_GET_SIZE(__pyx_v_pad_key); if (unlikely(__pyx_t_5 == ((Py_ssize_t)-1))) __PYX_ERR(0, 258, __pyx_L1_error)
+  if (unlikely(__pyx_v_pad_key == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 258, __pyx_L1_error)
+  }
+  __pyx_t_6 = __Pyx_PyBytes_GET_SIZE(__pyx_v_pad_key); if (unlikely(__pyx_t_6 == ((Py_ssize_t)-1))) __PYX_ERR(0, 258, __pyx_L1_error)
+  __pyx_t_7 = __pyx_f_18isf_pandas_msgpack_7msgpack_7_packer__raw_header_size(__pyx_t_6, 1); if (unlikely(__pyx_t_7 == ((size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 258, __pyx_L1_error)
+  __pyx_v_pad_key_len = (__pyx_t_5 + __pyx_t_7);
 
-          /* "isf_pandas_msgpack/msgpack/_packer.pyx":220
- *                 if ret == 0:
- *                     for v in o:
- *                         ret = self._pack(v, nest_limit - 1)             # <<<<<<<<<<<<<<
- *                         if ret != 0: break
- *             elif not default_used and self._default:
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":260
+ *         pad_key_len = len(pad_key) + _raw_header_size(len(pad_key), 1)
+ *         # the pad is a bin8, with a 2 byte header
+ *         pad = (self.align - (self.tell() + pad_key_len + 2 + key_len +             # <<<<<<<<<<<<<<
+ *                              _ext_header_size(L)) % self.align) % self.align
+ *         ret = self._pack(PAD_KEY)
  */
-          __pyx_t_16.__pyx_n = 1;
-          __pyx_t_16.nest_limit = (__pyx_v_nest_limit - 1);
-          __pyx_t_14 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_pack(__pyx_v_self, __pyx_v_v, &__pyx_t_16); if (unlikely(__pyx_t_14 == ((int)-1))) __PYX_ERR(0, 220, __pyx_L1_error)
-          __pyx_v_ret = __pyx_t_14;
+  __pyx_t_2 = __Pyx_PyInt_FromSize_t(__pyx_v_self->align); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 260, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_tell); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 260, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_8 = NULL;
+  __pyx_t_4 = 0;
+  #if CYTHON_UNPACK_METHODS
+  if (likely(PyMethod_Check(__pyx_t_3))) {
+    __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_3);
+    if (likely(__pyx_t_8)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+      __Pyx_INCREF(__pyx_t_8);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_3, function);
+      __pyx_t_4 = 1;
+    }
+  }
+  #endif
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_8, NULL};
+    __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_4, 0+__pyx_t_4);
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 260, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  }
+  __pyx_t_3 = __Pyx_PyInt_FromSize_t(__pyx_v_pad_key_len); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 260, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_8 = PyNumber_Add(__pyx_t_1, __pyx_t_3); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 260, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_PyInt_AddObjC(__pyx_t_8, __pyx_int_2, 2, 0, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 260, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  __pyx_t_8 = __Pyx_PyInt_FromSize_t(__pyx_v_key_len); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 260, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __pyx_t_1 = PyNumber_Add(__pyx_t_3, __pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 260, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
 
-          /* "isf_pandas_msgpack/msgpack/_packer.pyx":221
- *                     for v in o:
- *                         ret = self._pack(v, nest_limit - 1)
- *                         if ret != 0: break             # <<<<<<<<<<<<<<
- *             elif not default_used and self._default:
- *                 o = self._default(o)
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":261
+ *         # the pad is a bin8, with a 2 byte header
+ *         pad = (self.align - (self.tell() + pad_key_len + 2 + key_len +
+ *                              _ext_header_size(L)) % self.align) % self.align             # <<<<<<<<<<<<<<
+ *         ret = self._pack(PAD_KEY)
+ *         if ret == 0:
  */
-          __pyx_t_1 = (__pyx_v_ret != 0);
-          if (__pyx_t_1) {
-            goto __pyx_L33_break;
-          }
+  __pyx_t_7 = __pyx_f_18isf_pandas_msgpack_7msgpack_7_packer__ext_header_size(__pyx_v_L); if (unlikely(__pyx_t_7 == ((size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 261, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyInt_FromSize_t(__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 261, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
 
-          /* "isf_pandas_msgpack/msgpack/_packer.pyx":219
- *                 ret = msgpack_pack_array(&self.pk, L)
- *                 if ret == 0:
- *                     for v in o:             # <<<<<<<<<<<<<<
- *                         ret = self._pack(v, nest_limit - 1)
- *                         if ret != 0: break
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":260
+ *         pad_key_len = len(pad_key) + _raw_header_size(len(pad_key), 1)
+ *         # the pad is a bin8, with a 2 byte header
+ *         pad = (self.align - (self.tell() + pad_key_len + 2 + key_len +             # <<<<<<<<<<<<<<
+ *                              _ext_header_size(L)) % self.align) % self.align
+ *         ret = self._pack(PAD_KEY)
  */
-        }
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        goto __pyx_L35_for_end;
-        __pyx_L33_break:;
-        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        goto __pyx_L35_for_end;
-        __pyx_L35_for_end:;
+  __pyx_t_3 = PyNumber_Add(__pyx_t_1, __pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 260, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
 
-        /* "isf_pandas_msgpack/msgpack/_packer.pyx":218
- *                     raise ValueError("list is too large")
- *                 ret = msgpack_pack_array(&self.pk, L)
- *                 if ret == 0:             # <<<<<<<<<<<<<<
- *                     for v in o:
- *                         ret = self._pack(v, nest_limit - 1)
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":261
+ *         # the pad is a bin8, with a 2 byte header
+ *         pad = (self.align - (self.tell() + pad_key_len + 2 + key_len +
+ *                              _ext_header_size(L)) % self.align) % self.align             # <<<<<<<<<<<<<<
+ *         ret = self._pack(PAD_KEY)
+ *         if ret == 0:
  */
-      }
+  __pyx_t_8 = __Pyx_PyInt_FromSize_t(__pyx_v_self->align); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 261, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __pyx_t_1 = PyNumber_Remainder(__pyx_t_3, __pyx_t_8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 261, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":213
- *                 ret = msgpack_pack_ext(&self.pk, longval, L)
- *                 ret = msgpack_pack_raw_body(&self.pk, rawval, L)
- *             elif PyTuple_Check(o) or PyList_Check(o):             # <<<<<<<<<<<<<<
- *                 L = len(o)
- *                 if L > (2**32) - 1:
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":260
+ *         pad_key_len = len(pad_key) + _raw_header_size(len(pad_key), 1)
+ *         # the pad is a bin8, with a 2 byte header
+ *         pad = (self.align - (self.tell() + pad_key_len + 2 + key_len +             # <<<<<<<<<<<<<<
+ *                              _ext_header_size(L)) % self.align) % self.align
+ *         ret = self._pack(PAD_KEY)
+ */
+  __pyx_t_8 = PyNumber_Subtract(__pyx_t_2, __pyx_t_1); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 260, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":261
+ *         # the pad is a bin8, with a 2 byte header
+ *         pad = (self.align - (self.tell() + pad_key_len + 2 + key_len +
+ *                              _ext_header_size(L)) % self.align) % self.align             # <<<<<<<<<<<<<<
+ *         ret = self._pack(PAD_KEY)
+ *         if ret == 0:
  */
-      goto __pyx_L6;
-    }
+  __pyx_t_1 = __Pyx_PyInt_FromSize_t(__pyx_v_self->align); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 261, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyNumber_Remainder(__pyx_t_8, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 261, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_7 = __Pyx_PyInt_As_size_t(__pyx_t_2); if (unlikely((__pyx_t_7 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 261, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_pad = __pyx_t_7;
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":222
- *                         ret = self._pack(v, nest_limit - 1)
- *                         if ret != 0: break
- *             elif not default_used and self._default:             # <<<<<<<<<<<<<<
- *                 o = self._default(o)
- *                 default_used = 1
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":262
+ *         pad = (self.align - (self.tell() + pad_key_len + 2 + key_len +
+ *                              _ext_header_size(L)) % self.align) % self.align
+ *         ret = self._pack(PAD_KEY)             # <<<<<<<<<<<<<<
+ *         if ret == 0:
+ *             ret = msgpack_pack_bin(&self.pk, pad)
  */
-    __pyx_t_17 = (!(__pyx_v_default_used != 0));
-    if (__pyx_t_17) {
-    } else {
-      __pyx_t_1 = __pyx_t_17;
-      goto __pyx_L36_bool_binop_done;
-    }
-    __pyx_t_17 = __Pyx_PyObject_IsTrue(__pyx_v_self->_default); if (unlikely((__pyx_t_17 < 0))) __PYX_ERR(0, 222, __pyx_L1_error)
-    __pyx_t_1 = __pyx_t_17;
-    __pyx_L36_bool_binop_done:;
-    if (likely(__pyx_t_1)) {
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_PAD_KEY); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 262, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_9 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_pack(__pyx_v_self, __pyx_t_2, NULL); if (unlikely(__pyx_t_9 == ((int)-1))) __PYX_ERR(0, 262, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_ret = __pyx_t_9;
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":223
- *                         if ret != 0: break
- *             elif not default_used and self._default:
- *                 o = self._default(o)             # <<<<<<<<<<<<<<
- *                 default_used = 1
- *                 continue
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":263
+ *                              _ext_header_size(L)) % self.align) % self.align
+ *         ret = self._pack(PAD_KEY)
+ *         if ret == 0:             # <<<<<<<<<<<<<<
+ *             ret = msgpack_pack_bin(&self.pk, pad)
+ *         if ret == 0:
  */
-      __Pyx_INCREF(__pyx_v_self->_default);
-      __pyx_t_2 = __pyx_v_self->_default; __pyx_t_3 = NULL;
-      __pyx_t_5 = 0;
-      #if CYTHON_UNPACK_METHODS
-      if (likely(PyMethod_Check(__pyx_t_2))) {
-        __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
-        if (likely(__pyx_t_3)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-          __Pyx_INCREF(__pyx_t_3);
-          __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_2, function);
-          __pyx_t_5 = 1;
-        }
-      }
-      #endif
-      {
-        PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v_o};
-        __pyx_t_4 = __Pyx_PyObject_FastCall(__pyx_t_2, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
-        __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-        if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 223, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_4);
-        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      }
-      __Pyx_DECREF_SET(__pyx_v_o, __pyx_t_4);
-      __pyx_t_4 = 0;
+  __pyx_t_10 = (__pyx_v_ret == 0);
+  if (__pyx_t_10) {
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":224
- *             elif not default_used and self._default:
- *                 o = self._default(o)
- *                 default_used = 1             # <<<<<<<<<<<<<<
- *                 continue
- *             else:
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":264
+ *         ret = self._pack(PAD_KEY)
+ *         if ret == 0:
+ *             ret = msgpack_pack_bin(&self.pk, pad)             # <<<<<<<<<<<<<<
+ *         if ret == 0:
+ *             ret = msgpack_pack_raw_body(&self.pk, _zeros, pad)
  */
-      __pyx_v_default_used = 1;
+    __pyx_v_ret = msgpack_pack_bin((&__pyx_v_self->pk), __pyx_v_pad);
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":225
- *                 o = self._default(o)
- *                 default_used = 1
- *                 continue             # <<<<<<<<<<<<<<
- *             else:
- *                 raise TypeError("can't serialize %r" % (o,))
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":263
+ *                              _ext_header_size(L)) % self.align) % self.align
+ *         ret = self._pack(PAD_KEY)
+ *         if ret == 0:             # <<<<<<<<<<<<<<
+ *             ret = msgpack_pack_bin(&self.pk, pad)
+ *         if ret == 0:
  */
-      goto __pyx_L4_continue;
+  }
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":222
- *                         ret = self._pack(v, nest_limit - 1)
- *                         if ret != 0: break
- *             elif not default_used and self._default:             # <<<<<<<<<<<<<<
- *                 o = self._default(o)
- *                 default_used = 1
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":265
+ *         if ret == 0:
+ *             ret = msgpack_pack_bin(&self.pk, pad)
+ *         if ret == 0:             # <<<<<<<<<<<<<<
+ *             ret = msgpack_pack_raw_body(&self.pk, _zeros, pad)
+ *         return ret
  */
-    }
+  __pyx_t_10 = (__pyx_v_ret == 0);
+  if (__pyx_t_10) {
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":227
- *                 continue
- *             else:
- *                 raise TypeError("can't serialize %r" % (o,))             # <<<<<<<<<<<<<<
- *             return ret
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":266
+ *             ret = msgpack_pack_bin(&self.pk, pad)
+ *         if ret == 0:
+ *             ret = msgpack_pack_raw_body(&self.pk, _zeros, pad)             # <<<<<<<<<<<<<<
+ *         return ret
  * 
  */
-    /*else*/ {
-      __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 227, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_INCREF(__pyx_v_o);
-      __Pyx_GIVEREF(__pyx_v_o);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_o)) __PYX_ERR(0, 227, __pyx_L1_error);
-      __pyx_t_2 = __Pyx_PyString_Format(__pyx_kp_s_can_t_serialize_r, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 227, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_2);
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_builtin_TypeError, __pyx_t_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 227, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_4);
-      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __Pyx_Raise(__pyx_t_4, 0, 0, 0);
-      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __PYX_ERR(0, 227, __pyx_L1_error)
-    }
-    __pyx_L6:;
+    __pyx_v_ret = msgpack_pack_raw_body((&__pyx_v_self->pk), __pyx_v_18isf_pandas_msgpack_7msgpack_7_packer__zeros, __pyx_v_pad);
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":228
- *             else:
- *                 raise TypeError("can't serialize %r" % (o,))
- *             return ret             # <<<<<<<<<<<<<<
- * 
- *     cpdef pack(self, object obj):
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":265
+ *         if ret == 0:
+ *             ret = msgpack_pack_bin(&self.pk, pad)
+ *         if ret == 0:             # <<<<<<<<<<<<<<
+ *             ret = msgpack_pack_raw_body(&self.pk, _zeros, pad)
+ *         return ret
  */
-    __pyx_r = __pyx_v_ret;
-    goto __pyx_L0;
-    __pyx_L4_continue:;
   }
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":117
- *         free(self.pk.buf);
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":267
+ *         if ret == 0:
+ *             ret = msgpack_pack_raw_body(&self.pk, _zeros, pad)
+ *         return ret             # <<<<<<<<<<<<<<
  * 
- *     cdef int _pack(self, object o,             # <<<<<<<<<<<<<<
- *                    int nest_limit=DEFAULT_RECURSE_LIMIT) except -1:
- *         cdef long long llval
+ *     cdef inline bint _streaming(self):
+ */
+  __pyx_r = __pyx_v_ret;
+  goto __pyx_L0;
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":249
+ *                 len(memoryview(v.data).cast('B')) >= self.align)
+ * 
+ *     cdef int _pack_padding(self, object k, object v) except -1:             # <<<<<<<<<<<<<<
+ *         cdef size_t L = len(memoryview(v.data).cast('B'))
+ *         cdef size_t key_len, pad_key_len, pad
  */
 
   /* function exit code */
-  __pyx_r = 0;
-  goto __pyx_L0;
   __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer._pack", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer._pack_padding", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = -1;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_d);
-  __Pyx_XDECREF(__pyx_v_k);
-  __Pyx_XDECREF(__pyx_v_v);
-  __Pyx_XDECREF(__pyx_v_o);
+  __Pyx_XDECREF(__pyx_v_key);
+  __Pyx_XDECREF(__pyx_v_pad_key);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "isf_pandas_msgpack/msgpack/_packer.pyx":230
- *             return ret
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":269
+ *         return ret
+ * 
+ *     cdef inline bint _streaming(self):             # <<<<<<<<<<<<<<
+ *         return self.stream is not None or self.segments is not None
  * 
- *     cpdef pack(self, object obj):             # <<<<<<<<<<<<<<
- *         cdef int ret
- *         ret = self._pack(obj, DEFAULT_RECURSE_LIMIT)
- */
-
-static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_7pack(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_pack(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_obj, int __pyx_skip_dispatch) {
-  int __pyx_v_ret;
-  PyObject *__pyx_v_buf = NULL;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  unsigned int __pyx_t_5;
-  int __pyx_t_6;
-  struct __pyx_opt_args_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__pack __pyx_t_7;
-  int __pyx_t_8;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("pack", 1);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overridden in Python */
-  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || __Pyx_PyType_HasFeature(Py_TYPE(((PyObject *)__pyx_v_self)), (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
-    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
-    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
-    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
-      PY_UINT64_T __pyx_typedict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
-      #endif
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_pack); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 230, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      if (!__Pyx_IsSameCFunction(__pyx_t_1, (void*) __pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_7pack)) {
-        __Pyx_XDECREF(__pyx_r);
-        __Pyx_INCREF(__pyx_t_1);
-        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-        __pyx_t_5 = 0;
-        #if CYTHON_UNPACK_METHODS
-        if (unlikely(PyMethod_Check(__pyx_t_3))) {
-          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-          if (likely(__pyx_t_4)) {
-            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-            __Pyx_INCREF(__pyx_t_4);
-            __Pyx_INCREF(function);
-            __Pyx_DECREF_SET(__pyx_t_3, function);
-            __pyx_t_5 = 1;
-          }
-        }
-        #endif
-        {
-          PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_v_obj};
-          __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
-          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 230, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_2);
-          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        }
-        __pyx_r = __pyx_t_2;
-        __pyx_t_2 = 0;
-        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-        goto __pyx_L0;
-      }
-      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
-      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
-      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
-      if (unlikely(__pyx_typedict_guard != __pyx_tp_dict_version)) {
-        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
-      }
-      #endif
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
-    }
-    #endif
-  }
-
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":232
- *     cpdef pack(self, object obj):
- *         cdef int ret
- *         ret = self._pack(obj, DEFAULT_RECURSE_LIMIT)             # <<<<<<<<<<<<<<
- *         if ret == -1:
- *             raise MemoryError
- */
-  __pyx_t_7.__pyx_n = 1;
-  __pyx_t_7.nest_limit = __pyx_v_18isf_pandas_msgpack_7msgpack_7_packer_DEFAULT_RECURSE_LIMIT;
-  __pyx_t_6 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_pack(__pyx_v_self, __pyx_v_obj, &__pyx_t_7); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 232, __pyx_L1_error)
-  __pyx_v_ret = __pyx_t_6;
-
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":233
- *         cdef int ret
- *         ret = self._pack(obj, DEFAULT_RECURSE_LIMIT)
- *         if ret == -1:             # <<<<<<<<<<<<<<
- *             raise MemoryError
- *         elif ret:  # should not happen.
- */
-  __pyx_t_8 = (__pyx_v_ret == -1L);
-  if (unlikely(__pyx_t_8)) {
-
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":234
- *         ret = self._pack(obj, DEFAULT_RECURSE_LIMIT)
- *         if ret == -1:
- *             raise MemoryError             # <<<<<<<<<<<<<<
- *         elif ret:  # should not happen.
- *             raise TypeError
- */
-    PyErr_NoMemory(); __PYX_ERR(0, 234, __pyx_L1_error)
-
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":233
- *         cdef int ret
- *         ret = self._pack(obj, DEFAULT_RECURSE_LIMIT)
- *         if ret == -1:             # <<<<<<<<<<<<<<
- *             raise MemoryError
- *         elif ret:  # should not happen.
- */
-  }
-
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":235
- *         if ret == -1:
- *             raise MemoryError
- *         elif ret:  # should not happen.             # <<<<<<<<<<<<<<
- *             raise TypeError
- *         if self.autoreset:
- */
-  __pyx_t_8 = (__pyx_v_ret != 0);
-  if (unlikely(__pyx_t_8)) {
-
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":236
- *             raise MemoryError
- *         elif ret:  # should not happen.
- *             raise TypeError             # <<<<<<<<<<<<<<
- *         if self.autoreset:
- *             buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
- */
-    __Pyx_Raise(__pyx_builtin_TypeError, 0, 0, 0);
-    __PYX_ERR(0, 236, __pyx_L1_error)
-
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":235
- *         if ret == -1:
- *             raise MemoryError
- *         elif ret:  # should not happen.             # <<<<<<<<<<<<<<
- *             raise TypeError
- *         if self.autoreset:
- */
-  }
-
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":237
- *         elif ret:  # should not happen.
- *             raise TypeError
- *         if self.autoreset:             # <<<<<<<<<<<<<<
- *             buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
- *             self.pk.length = 0
  */
-  if (__pyx_v_self->autoreset) {
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":238
- *             raise TypeError
- *         if self.autoreset:
- *             buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)             # <<<<<<<<<<<<<<
- *             self.pk.length = 0
- *             return buf
- */
-    __pyx_t_1 = PyBytes_FromStringAndSize(__pyx_v_self->pk.buf, __pyx_v_self->pk.length); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 238, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __pyx_v_buf = ((PyObject*)__pyx_t_1);
-    __pyx_t_1 = 0;
+static CYTHON_INLINE int __pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__streaming(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":239
- *         if self.autoreset:
- *             buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
- *             self.pk.length = 0             # <<<<<<<<<<<<<<
- *             return buf
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":270
  * 
- */
-    __pyx_v_self->pk.length = 0;
-
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":240
- *             buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
- *             self.pk.length = 0
- *             return buf             # <<<<<<<<<<<<<<
+ *     cdef inline bint _streaming(self):
+ *         return self.stream is not None or self.segments is not None             # <<<<<<<<<<<<<<
  * 
- *     def pack_ext_type(self, typecode, data):
- */
-    __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(__pyx_v_buf);
-    __pyx_r = __pyx_v_buf;
-    goto __pyx_L0;
-
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":237
- *         elif ret:  # should not happen.
- *             raise TypeError
- *         if self.autoreset:             # <<<<<<<<<<<<<<
- *             buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
- *             self.pk.length = 0
+ *     def flush(self):
  */
+  __pyx_t_2 = (__pyx_v_self->stream != Py_None);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L3_bool_binop_done;
   }
+  __pyx_t_2 = (__pyx_v_self->segments != ((PyObject*)Py_None));
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L3_bool_binop_done:;
+  __pyx_r = __pyx_t_1;
+  goto __pyx_L0;
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":230
- *             return ret
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":269
+ *         return ret
+ * 
+ *     cdef inline bint _streaming(self):             # <<<<<<<<<<<<<<
+ *         return self.stream is not None or self.segments is not None
  * 
- *     cpdef pack(self, object obj):             # <<<<<<<<<<<<<<
- *         cdef int ret
- *         ret = self._pack(obj, DEFAULT_RECURSE_LIMIT)
  */
 
   /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.pack", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_buf);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":272
+ *         return self.stream is not None or self.segments is not None
+ * 
+ *     def flush(self):             # <<<<<<<<<<<<<<
+ *         """Write buffer content to `stream` and clear buffer."""
+ *         if self.stream is None:
+ */
+
 /* Python wrapper */
-static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_7pack(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_9flush(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-PyDoc_STRVAR(__pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_6pack, "Packer.pack(self, obj)");
-static PyMethodDef __pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_7pack = {"pack", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_7pack, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_6pack};
-static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_7pack(PyObject *__pyx_v_self, 
+PyDoc_STRVAR(__pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_8flush, "Packer.flush(self)\nWrite buffer content to `stream` and clear buffer.");
+static PyMethodDef __pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_9flush = {"flush", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_9flush, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_8flush};
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_9flush(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
-  PyObject *__pyx_v_obj = 0;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[1] = {0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("pack (wrapper)", 0);
+  __Pyx_RefNannySetupContext("flush (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_MACROS
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -6038,3440 +7011,8062 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_obj,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_obj)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 230, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "pack") < 0)) __PYX_ERR(0, 230, __pyx_L3_error)
-      }
-    } else if (unlikely(__pyx_nargs != 1)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-    }
-    __pyx_v_obj = values[0];
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("pack", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 230, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.pack", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_6pack(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self), __pyx_v_obj);
+  if (unlikely(__pyx_nargs > 0)) {
+    __Pyx_RaiseArgtupleInvalid("flush", 1, 0, 0, __pyx_nargs); return NULL;}
+  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "flush", 0))) return NULL;
+  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_8flush(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self));
 
   /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_6pack(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_obj) {
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_8flush(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("pack", 1);
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_pack(__pyx_v_self, __pyx_v_obj, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 230, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
+  __Pyx_RefNannySetupContext("flush", 1);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":274
+ *     def flush(self):
+ *         """Write buffer content to `stream` and clear buffer."""
+ *         if self.stream is None:             # <<<<<<<<<<<<<<
+ *             raise TypeError("Packer has no stream to flush to.")
+ *         self._flush()
+ */
+  __pyx_t_1 = (__pyx_v_self->stream == Py_None);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":275
+ *         """Write buffer content to `stream` and clear buffer."""
+ *         if self.stream is None:
+ *             raise TypeError("Packer has no stream to flush to.")             # <<<<<<<<<<<<<<
+ *         self._flush()
+ * 
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 275, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 275, __pyx_L1_error)
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":274
+ *     def flush(self):
+ *         """Write buffer content to `stream` and clear buffer."""
+ *         if self.stream is None:             # <<<<<<<<<<<<<<
+ *             raise TypeError("Packer has no stream to flush to.")
+ *         self._flush()
+ */
+  }
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":276
+ *         if self.stream is None:
+ *             raise TypeError("Packer has no stream to flush to.")
+ *         self._flush()             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _pack(self, object o,
+ */
+  __pyx_t_2 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_flush(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 276, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":272
+ *         return self.stream is not None or self.segments is not None
+ * 
+ *     def flush(self):             # <<<<<<<<<<<<<<
+ *         """Write buffer content to `stream` and clear buffer."""
+ *         if self.stream is None:
+ */
 
   /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.pack", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.flush", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
+static PyObject *__pyx_gb_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_5_pack_2generator(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value); /* proto */
 
-/* "isf_pandas_msgpack/msgpack/_packer.pyx":242
- *             return buf
- * 
- *     def pack_ext_type(self, typecode, data):             # <<<<<<<<<<<<<<
- *         msgpack_pack_ext(&self.pk, typecode, len(data))
- *         msgpack_pack_raw_body(&self.pk, data, len(data))
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":356
+ *                 pad = self.align and encoded
+ *                 if pad:
+ *                     L += sum(self._aligns(k, v) for k, v in d.iteritems())             # <<<<<<<<<<<<<<
+ *                 if L > (2**32) - 1:
+ *                     raise ValueError("dict is too large")
  */
 
-/* Python wrapper */
-static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_9pack_ext_type(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_8pack_ext_type, "Packer.pack_ext_type(self, typecode, data)");
-static PyMethodDef __pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_9pack_ext_type = {"pack_ext_type", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_9pack_ext_type, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_8pack_ext_type};
-static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_9pack_ext_type(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-) {
-  PyObject *__pyx_v_typecode = 0;
-  PyObject *__pyx_v_data = 0;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
-  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[2] = {0,0};
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_5_pack_genexpr(PyObject *__pyx_self, PyObject *__pyx_genexpr_arg_0) {
+  struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr *__pyx_cur_scope;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("pack_ext_type (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_typecode,&__pyx_n_s_data,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-        CYTHON_FALLTHROUGH;
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_typecode)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 242, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-        CYTHON_FALLTHROUGH;
-        case  1:
-        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_data)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 242, __pyx_L3_error)
-        else {
-          __Pyx_RaiseArgtupleInvalid("pack_ext_type", 1, 2, 2, 1); __PYX_ERR(0, 242, __pyx_L3_error)
-        }
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "pack_ext_type") < 0)) __PYX_ERR(0, 242, __pyx_L3_error)
-      }
-    } else if (unlikely(__pyx_nargs != 2)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
-    }
-    __pyx_v_typecode = values[0];
-    __pyx_v_data = values[1];
+  __Pyx_RefNannySetupContext("genexpr", 0);
+  __pyx_cur_scope = (struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr *)__pyx_tp_new_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr(__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr, __pyx_empty_tuple, NULL);
+  if (unlikely(!__pyx_cur_scope)) {
+    __pyx_cur_scope = ((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr *)Py_None);
+    __Pyx_INCREF(Py_None);
+    __PYX_ERR(0, 356, __pyx_L1_error)
+  } else {
+    __Pyx_GOTREF((PyObject *)__pyx_cur_scope);
   }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("pack_ext_type", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 242, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
+  __pyx_cur_scope->__pyx_outer_scope = (struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack *) __pyx_self;
+  __Pyx_INCREF((PyObject *)__pyx_cur_scope->__pyx_outer_scope);
+  __Pyx_GIVEREF((PyObject *)__pyx_cur_scope->__pyx_outer_scope);
+  __pyx_cur_scope->__pyx_genexpr_arg_0 = __pyx_genexpr_arg_0;
+  __Pyx_INCREF(__pyx_cur_scope->__pyx_genexpr_arg_0);
+  __Pyx_GIVEREF(__pyx_cur_scope->__pyx_genexpr_arg_0);
   {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
+    __pyx_CoroutineObject *gen = __Pyx_Generator_New((__pyx_coroutine_body_t) __pyx_gb_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_5_pack_2generator, NULL, (PyObject *) __pyx_cur_scope, __pyx_n_s_genexpr, __pyx_n_s_Packer__pack_locals_genexpr, __pyx_n_s_isf_pandas_msgpack_msgpack__pack); if (unlikely(!gen)) __PYX_ERR(0, 356, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_cur_scope);
+    __Pyx_RefNannyFinishContext();
+    return (PyObject *) gen;
   }
-  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.pack_ext_type", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_8pack_ext_type(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self), __pyx_v_typecode, __pyx_v_data);
 
   /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer._pack.genexpr", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_DECREF((PyObject *)__pyx_cur_scope);
+  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_8pack_ext_type(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_typecode, PyObject *__pyx_v_data) {
+static PyObject *__pyx_gb_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_5_pack_2generator(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value) /* generator body */
+{
+  struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr *__pyx_cur_scope = ((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr *)__pyx_generator->closure);
   PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  char __pyx_t_1;
+  PyObject *__pyx_t_1 = NULL;
   Py_ssize_t __pyx_t_2;
-  char *__pyx_t_3;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  int __pyx_t_8;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("pack_ext_type", 1);
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("genexpr", 0);
+  switch (__pyx_generator->resume_label) {
+    case 0: goto __pyx_L3_first_run;
+    case 1: goto __pyx_L6_resume_from_yield;
+    default: /* CPython raises the right error here */
+    __Pyx_RefNannyFinishContext();
+    return NULL;
+  }
+  __pyx_L3_first_run:;
+  if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 356, __pyx_L1_error)
+  __pyx_t_2 = 0;
+  if (unlikely(!__pyx_cur_scope->__pyx_genexpr_arg_0)) { __Pyx_RaiseUnboundLocalError(".0"); __PYX_ERR(0, 356, __pyx_L1_error) }
+  if (unlikely(__pyx_cur_scope->__pyx_genexpr_arg_0 == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "iteritems");
+    __PYX_ERR(0, 356, __pyx_L1_error)
+  }
+  __pyx_t_5 = __Pyx_dict_iterator(__pyx_cur_scope->__pyx_genexpr_arg_0, 1, __pyx_n_s_iteritems, (&__pyx_t_3), (&__pyx_t_4)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 356, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_1);
+  __pyx_t_1 = __pyx_t_5;
+  __pyx_t_5 = 0;
+  while (1) {
+    __pyx_t_7 = __Pyx_dict_iter_next(__pyx_t_1, __pyx_t_3, &__pyx_t_2, &__pyx_t_5, &__pyx_t_6, NULL, __pyx_t_4);
+    if (unlikely(__pyx_t_7 == 0)) break;
+    if (unlikely(__pyx_t_7 == -1)) __PYX_ERR(0, 356, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_XGOTREF(__pyx_cur_scope->__pyx_v_k);
+    __Pyx_XDECREF_SET(__pyx_cur_scope->__pyx_v_k, __pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_5);
+    __pyx_t_5 = 0;
+    __Pyx_XGOTREF(__pyx_cur_scope->__pyx_v_v);
+    __Pyx_XDECREF_SET(__pyx_cur_scope->__pyx_v_v, __pyx_t_6);
+    __Pyx_GIVEREF(__pyx_t_6);
+    __pyx_t_6 = 0;
+    if (unlikely(!__pyx_cur_scope->__pyx_outer_scope->__pyx_v_self)) { __Pyx_RaiseClosureNameError("self"); __PYX_ERR(0, 356, __pyx_L1_error) }
+    __pyx_t_8 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_cur_scope->__pyx_outer_scope->__pyx_v_self->__pyx_vtab)->_aligns(__pyx_cur_scope->__pyx_outer_scope->__pyx_v_self, __pyx_cur_scope->__pyx_v_k, __pyx_cur_scope->__pyx_v_v); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 356, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyBool_FromLong(__pyx_t_8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 356, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_r = __pyx_t_6;
+    __pyx_t_6 = 0;
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __pyx_cur_scope->__pyx_t_0 = __pyx_t_1;
+    __pyx_cur_scope->__pyx_t_1 = __pyx_t_2;
+    __pyx_cur_scope->__pyx_t_2 = __pyx_t_3;
+    __pyx_cur_scope->__pyx_t_3 = __pyx_t_4;
+    __Pyx_XGIVEREF(__pyx_r);
+    __Pyx_RefNannyFinishContext();
+    __Pyx_Coroutine_ResetAndClearException(__pyx_generator);
+    /* return from generator, yielding value */
+    __pyx_generator->resume_label = 1;
+    return __pyx_r;
+    __pyx_L6_resume_from_yield:;
+    __pyx_t_1 = __pyx_cur_scope->__pyx_t_0;
+    __pyx_cur_scope->__pyx_t_0 = 0;
+    __Pyx_XGOTREF(__pyx_t_1);
+    __pyx_t_2 = __pyx_cur_scope->__pyx_t_1;
+    __pyx_t_3 = __pyx_cur_scope->__pyx_t_2;
+    __pyx_t_4 = __pyx_cur_scope->__pyx_t_3;
+    if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 356, __pyx_L1_error)
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  CYTHON_MAYBE_UNUSED_VAR(__pyx_cur_scope);
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":243
- * 
- *     def pack_ext_type(self, typecode, data):
- *         msgpack_pack_ext(&self.pk, typecode, len(data))             # <<<<<<<<<<<<<<
- *         msgpack_pack_raw_body(&self.pk, data, len(data))
- * 
- */
-  __pyx_t_1 = __Pyx_PyInt_As_char(__pyx_v_typecode); if (unlikely((__pyx_t_1 == (char)-1) && PyErr_Occurred())) __PYX_ERR(0, 243, __pyx_L1_error)
-  __pyx_t_2 = PyObject_Length(__pyx_v_data); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 243, __pyx_L1_error)
-  (void)(msgpack_pack_ext((&__pyx_v_self->pk), __pyx_t_1, __pyx_t_2));
+  /* function exit code */
+  PyErr_SetNone(PyExc_StopIteration);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_Generator_Replace_StopIteration(0);
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("genexpr", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_r); __pyx_r = 0;
+  #if !CYTHON_USE_EXC_INFO_STACK
+  __Pyx_Coroutine_ResetAndClearException(__pyx_generator);
+  #endif
+  __pyx_generator->resume_label = -1;
+  __Pyx_Coroutine_clear((PyObject*)__pyx_generator);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+static PyObject *__pyx_gb_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_5_pack_5generator1(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value); /* proto */
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":244
- *     def pack_ext_type(self, typecode, data):
- *         msgpack_pack_ext(&self.pk, typecode, len(data))
- *         msgpack_pack_raw_body(&self.pk, data, len(data))             # <<<<<<<<<<<<<<
- * 
- *     def pack_array_header(self, size_t size):
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":374
+ *                 pad = self.align and encoded
+ *                 if pad:
+ *                     L += sum(self._aligns(k, v) for k, v in o.items())             # <<<<<<<<<<<<<<
+ *                 if L > (2**32) - 1:
+ *                     raise ValueError("dict is too large")
  */
-  __pyx_t_3 = __Pyx_PyObject_AsWritableString(__pyx_v_data); if (unlikely((!__pyx_t_3) && PyErr_Occurred())) __PYX_ERR(0, 244, __pyx_L1_error)
-  __pyx_t_2 = PyObject_Length(__pyx_v_data); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 244, __pyx_L1_error)
-  (void)(msgpack_pack_raw_body((&__pyx_v_self->pk), __pyx_t_3, __pyx_t_2));
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":242
- *             return buf
- * 
- *     def pack_ext_type(self, typecode, data):             # <<<<<<<<<<<<<<
- *         msgpack_pack_ext(&self.pk, typecode, len(data))
- *         msgpack_pack_raw_body(&self.pk, data, len(data))
- */
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_5_pack_3genexpr(PyObject *__pyx_self, PyObject *__pyx_genexpr_arg_0) {
+  struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr *__pyx_cur_scope;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("genexpr", 0);
+  __pyx_cur_scope = (struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr *)__pyx_tp_new_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr(__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr, __pyx_empty_tuple, NULL);
+  if (unlikely(!__pyx_cur_scope)) {
+    __pyx_cur_scope = ((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr *)Py_None);
+    __Pyx_INCREF(Py_None);
+    __PYX_ERR(0, 374, __pyx_L1_error)
+  } else {
+    __Pyx_GOTREF((PyObject *)__pyx_cur_scope);
+  }
+  __pyx_cur_scope->__pyx_outer_scope = (struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack *) __pyx_self;
+  __Pyx_INCREF((PyObject *)__pyx_cur_scope->__pyx_outer_scope);
+  __Pyx_GIVEREF((PyObject *)__pyx_cur_scope->__pyx_outer_scope);
+  __pyx_cur_scope->__pyx_genexpr_arg_0 = __pyx_genexpr_arg_0;
+  __Pyx_INCREF(__pyx_cur_scope->__pyx_genexpr_arg_0);
+  __Pyx_GIVEREF(__pyx_cur_scope->__pyx_genexpr_arg_0);
+  {
+    __pyx_CoroutineObject *gen = __Pyx_Generator_New((__pyx_coroutine_body_t) __pyx_gb_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_5_pack_5generator1, NULL, (PyObject *) __pyx_cur_scope, __pyx_n_s_genexpr, __pyx_n_s_Packer__pack_locals_genexpr, __pyx_n_s_isf_pandas_msgpack_msgpack__pack); if (unlikely(!gen)) __PYX_ERR(0, 374, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_cur_scope);
+    __Pyx_RefNannyFinishContext();
+    return (PyObject *) gen;
+  }
 
   /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.pack_ext_type", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer._pack.genexpr", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
-  __pyx_L0:;
+  __Pyx_DECREF((PyObject *)__pyx_cur_scope);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "isf_pandas_msgpack/msgpack/_packer.pyx":246
- *         msgpack_pack_raw_body(&self.pk, data, len(data))
- * 
- *     def pack_array_header(self, size_t size):             # <<<<<<<<<<<<<<
- *         if size > (2**32) - 1:
- *             raise ValueError
- */
-
-/* Python wrapper */
-static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_11pack_array_header(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_10pack_array_header, "Packer.pack_array_header(self, size_t size)");
-static PyMethodDef __pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_11pack_array_header = {"pack_array_header", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_11pack_array_header, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_10pack_array_header};
-static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_11pack_array_header(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-) {
-  size_t __pyx_v_size;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
-  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[1] = {0};
+static PyObject *__pyx_gb_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_5_pack_5generator1(__pyx_CoroutineObject *__pyx_generator, CYTHON_UNUSED PyThreadState *__pyx_tstate, PyObject *__pyx_sent_value) /* generator body */
+{
+  struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr *__pyx_cur_scope = ((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr *)__pyx_generator->closure);
+  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
+  int __pyx_t_8;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("pack_array_header (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_size,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_size)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 246, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "pack_array_header") < 0)) __PYX_ERR(0, 246, __pyx_L3_error)
-      }
-    } else if (unlikely(__pyx_nargs != 1)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-    }
-    __pyx_v_size = __Pyx_PyInt_As_size_t(values[0]); if (unlikely((__pyx_v_size == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 246, __pyx_L3_error)
+  __Pyx_RefNannySetupContext("genexpr", 0);
+  switch (__pyx_generator->resume_label) {
+    case 0: goto __pyx_L3_first_run;
+    case 1: goto __pyx_L6_resume_from_yield;
+    default: /* CPython raises the right error here */
+    __Pyx_RefNannyFinishContext();
+    return NULL;
   }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("pack_array_header", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 246, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
+  __pyx_L3_first_run:;
+  if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 374, __pyx_L1_error)
+  __pyx_t_2 = 0;
+  if (unlikely(!__pyx_cur_scope->__pyx_genexpr_arg_0)) { __Pyx_RaiseUnboundLocalError(".0"); __PYX_ERR(0, 374, __pyx_L1_error) }
+  if (unlikely(__pyx_cur_scope->__pyx_genexpr_arg_0 == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "items");
+    __PYX_ERR(0, 374, __pyx_L1_error)
   }
-  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.pack_array_header", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_10pack_array_header(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self), __pyx_v_size);
+  __pyx_t_5 = __Pyx_dict_iterator(__pyx_cur_scope->__pyx_genexpr_arg_0, 0, __pyx_n_s_items, (&__pyx_t_3), (&__pyx_t_4)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 374, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_1);
+  __pyx_t_1 = __pyx_t_5;
+  __pyx_t_5 = 0;
+  while (1) {
+    __pyx_t_7 = __Pyx_dict_iter_next(__pyx_t_1, __pyx_t_3, &__pyx_t_2, &__pyx_t_5, &__pyx_t_6, NULL, __pyx_t_4);
+    if (unlikely(__pyx_t_7 == 0)) break;
+    if (unlikely(__pyx_t_7 == -1)) __PYX_ERR(0, 374, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_XGOTREF(__pyx_cur_scope->__pyx_v_k);
+    __Pyx_XDECREF_SET(__pyx_cur_scope->__pyx_v_k, __pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_5);
+    __pyx_t_5 = 0;
+    __Pyx_XGOTREF(__pyx_cur_scope->__pyx_v_v);
+    __Pyx_XDECREF_SET(__pyx_cur_scope->__pyx_v_v, __pyx_t_6);
+    __Pyx_GIVEREF(__pyx_t_6);
+    __pyx_t_6 = 0;
+    if (unlikely(!__pyx_cur_scope->__pyx_outer_scope->__pyx_v_self)) { __Pyx_RaiseClosureNameError("self"); __PYX_ERR(0, 374, __pyx_L1_error) }
+    __pyx_t_8 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_cur_scope->__pyx_outer_scope->__pyx_v_self->__pyx_vtab)->_aligns(__pyx_cur_scope->__pyx_outer_scope->__pyx_v_self, __pyx_cur_scope->__pyx_v_k, __pyx_cur_scope->__pyx_v_v); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 374, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyBool_FromLong(__pyx_t_8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 374, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_r = __pyx_t_6;
+    __pyx_t_6 = 0;
+    __Pyx_XGIVEREF(__pyx_t_1);
+    __pyx_cur_scope->__pyx_t_0 = __pyx_t_1;
+    __pyx_cur_scope->__pyx_t_1 = __pyx_t_2;
+    __pyx_cur_scope->__pyx_t_2 = __pyx_t_3;
+    __pyx_cur_scope->__pyx_t_3 = __pyx_t_4;
+    __Pyx_XGIVEREF(__pyx_r);
+    __Pyx_RefNannyFinishContext();
+    __Pyx_Coroutine_ResetAndClearException(__pyx_generator);
+    /* return from generator, yielding value */
+    __pyx_generator->resume_label = 1;
+    return __pyx_r;
+    __pyx_L6_resume_from_yield:;
+    __pyx_t_1 = __pyx_cur_scope->__pyx_t_0;
+    __pyx_cur_scope->__pyx_t_0 = 0;
+    __Pyx_XGOTREF(__pyx_t_1);
+    __pyx_t_2 = __pyx_cur_scope->__pyx_t_1;
+    __pyx_t_3 = __pyx_cur_scope->__pyx_t_2;
+    __pyx_t_4 = __pyx_cur_scope->__pyx_t_3;
+    if (unlikely(!__pyx_sent_value)) __PYX_ERR(0, 374, __pyx_L1_error)
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  CYTHON_MAYBE_UNUSED_VAR(__pyx_cur_scope);
 
   /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
+  PyErr_SetNone(PyExc_StopIteration);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_Generator_Replace_StopIteration(0);
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("genexpr", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_r); __pyx_r = 0;
+  #if !CYTHON_USE_EXC_INFO_STACK
+  __Pyx_Coroutine_ResetAndClearException(__pyx_generator);
+  #endif
+  __pyx_generator->resume_label = -1;
+  __Pyx_Coroutine_clear((PyObject*)__pyx_generator);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_10pack_array_header(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, size_t __pyx_v_size) {
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":278
+ *         self._flush()
+ * 
+ *     cdef int _pack(self, object o,             # <<<<<<<<<<<<<<
+ *                    int nest_limit=DEFAULT_RECURSE_LIMIT,
+ *                    bint encoded=0) except -1:
+ */
+
+static int __pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__pack(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_o, struct __pyx_opt_args_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__pack *__pyx_optional_args) {
+  struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack *__pyx_cur_scope;
+  int __pyx_v_nest_limit = __pyx_k__7;
+  int __pyx_v_encoded = ((int)0);
+  PY_LONG_LONG __pyx_v_llval;
+  unsigned PY_LONG_LONG __pyx_v_ullval;
+  long __pyx_v_longval;
+  float __pyx_v_fval;
+  double __pyx_v_dval;
+  char *__pyx_v_rawval;
   int __pyx_v_ret;
-  PyObject *__pyx_v_buf = NULL;
-  PyObject *__pyx_r = NULL;
+  PyObject *__pyx_v_d = 0;
+  size_t __pyx_v_L;
+  int __pyx_v_default_used;
+  int __pyx_v_pad;
+  Py_buffer __pyx_v_view;
+  PyObject *__pyx_v_k = NULL;
+  PyObject *__pyx_v_v = NULL;
+  PyObject *__pyx_gb_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_5_pack_2generator = 0;
+  PyObject *__pyx_gb_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_5_pack_5generator1 = 0;
+  int __pyx_r;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_1;
   PyObject *__pyx_t_2 = NULL;
-  int __pyx_t_3;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  unsigned int __pyx_t_5;
+  int __pyx_t_6;
+  unsigned PY_LONG_LONG __pyx_t_7;
+  PY_LONG_LONG __pyx_t_8;
+  long __pyx_t_9;
+  float __pyx_t_10;
+  double __pyx_t_11;
+  Py_ssize_t __pyx_t_12;
+  char *__pyx_t_13;
+  size_t __pyx_t_14;
+  Py_ssize_t __pyx_t_15;
+  int __pyx_t_16;
+  int __pyx_t_17;
+  struct __pyx_opt_args_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__pack __pyx_t_18;
+  char const *__pyx_t_19;
+  PyObject *__pyx_t_20 = NULL;
+  PyObject *__pyx_t_21 = NULL;
+  PyObject *__pyx_t_22 = NULL;
+  PyObject *__pyx_t_23 = NULL;
+  PyObject *__pyx_t_24 = NULL;
+  PyObject *__pyx_t_25 = NULL;
+  PyObject *(*__pyx_t_26)(PyObject *);
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("pack_array_header", 1);
+  __Pyx_RefNannySetupContext("_pack", 0);
+  __pyx_cur_scope = (struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack *)__pyx_tp_new_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack(__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack, __pyx_empty_tuple, NULL);
+  if (unlikely(!__pyx_cur_scope)) {
+    __pyx_cur_scope = ((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack *)Py_None);
+    __Pyx_INCREF(Py_None);
+    __PYX_ERR(0, 278, __pyx_L1_error)
+  } else {
+    __Pyx_GOTREF((PyObject *)__pyx_cur_scope);
+  }
+  if (__pyx_optional_args) {
+    if (__pyx_optional_args->__pyx_n > 0) {
+      __pyx_v_nest_limit = __pyx_optional_args->nest_limit;
+      if (__pyx_optional_args->__pyx_n > 1) {
+        __pyx_v_encoded = __pyx_optional_args->encoded;
+      }
+    }
+  }
+  __pyx_cur_scope->__pyx_v_self = __pyx_v_self;
+  __Pyx_INCREF((PyObject *)__pyx_cur_scope->__pyx_v_self);
+  __Pyx_GIVEREF((PyObject *)__pyx_cur_scope->__pyx_v_self);
+  __Pyx_INCREF(__pyx_v_o);
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":247
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":290
+ *         cdef dict d
+ *         cdef size_t L
+ *         cdef int default_used = 0             # <<<<<<<<<<<<<<
+ *         cdef bint pad
+ *         cdef Py_buffer view
+ */
+  __pyx_v_default_used = 0;
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":294
+ *         cdef Py_buffer view
+ * 
+ *         if nest_limit < 0:             # <<<<<<<<<<<<<<
+ *             raise PackValueError("recursion limit exceeded.")
  * 
- *     def pack_array_header(self, size_t size):
- *         if size > (2**32) - 1:             # <<<<<<<<<<<<<<
- *             raise ValueError
- *         cdef int ret = msgpack_pack_array(&self.pk, size)
  */
-  __pyx_t_1 = __Pyx_PyInt_FromSize_t(__pyx_v_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 247, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_RichCompare(__pyx_t_1, __pyx_int_4294967295, Py_GT); __Pyx_XGOTREF(__pyx_t_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 247, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_3 < 0))) __PYX_ERR(0, 247, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(__pyx_t_3)) {
+  __pyx_t_1 = (__pyx_v_nest_limit < 0);
+  if (unlikely(__pyx_t_1)) {
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":248
- *     def pack_array_header(self, size_t size):
- *         if size > (2**32) - 1:
- *             raise ValueError             # <<<<<<<<<<<<<<
- *         cdef int ret = msgpack_pack_array(&self.pk, size)
- *         if ret == -1:
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":295
+ * 
+ *         if nest_limit < 0:
+ *             raise PackValueError("recursion limit exceeded.")             # <<<<<<<<<<<<<<
+ * 
+ *         if self._streaming() and self.pk.length >= self.flush_threshold:
  */
-    __Pyx_Raise(__pyx_builtin_ValueError, 0, 0, 0);
-    __PYX_ERR(0, 248, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_PackValueError); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 295, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = NULL;
+    __pyx_t_5 = 0;
+    #if CYTHON_UNPACK_METHODS
+    if (unlikely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+        __pyx_t_5 = 1;
+      }
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_kp_s_recursion_limit_exceeded};
+      __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
+      __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 295, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    }
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 295, __pyx_L1_error)
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":247
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":294
+ *         cdef Py_buffer view
+ * 
+ *         if nest_limit < 0:             # <<<<<<<<<<<<<<
+ *             raise PackValueError("recursion limit exceeded.")
  * 
- *     def pack_array_header(self, size_t size):
- *         if size > (2**32) - 1:             # <<<<<<<<<<<<<<
- *             raise ValueError
- *         cdef int ret = msgpack_pack_array(&self.pk, size)
  */
   }
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":249
- *         if size > (2**32) - 1:
- *             raise ValueError
- *         cdef int ret = msgpack_pack_array(&self.pk, size)             # <<<<<<<<<<<<<<
- *         if ret == -1:
- *             raise MemoryError
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":297
+ *             raise PackValueError("recursion limit exceeded.")
+ * 
+ *         if self._streaming() and self.pk.length >= self.flush_threshold:             # <<<<<<<<<<<<<<
+ *             self._flush()
+ * 
  */
-  __pyx_v_ret = msgpack_pack_array((&__pyx_v_self->pk), __pyx_v_size);
+  __pyx_t_6 = __pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__streaming(__pyx_cur_scope->__pyx_v_self); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 297, __pyx_L1_error)
+  if (__pyx_t_6) {
+  } else {
+    __pyx_t_1 = __pyx_t_6;
+    goto __pyx_L5_bool_binop_done;
+  }
+  __pyx_t_6 = (__pyx_cur_scope->__pyx_v_self->pk.length >= __pyx_cur_scope->__pyx_v_self->flush_threshold);
+  __pyx_t_1 = __pyx_t_6;
+  __pyx_L5_bool_binop_done:;
+  if (__pyx_t_1) {
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":250
- *             raise ValueError
- *         cdef int ret = msgpack_pack_array(&self.pk, size)
- *         if ret == -1:             # <<<<<<<<<<<<<<
- *             raise MemoryError
- *         elif ret:  # should not happen
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":298
+ * 
+ *         if self._streaming() and self.pk.length >= self.flush_threshold:
+ *             self._flush()             # <<<<<<<<<<<<<<
+ * 
+ *         while True:
  */
-  __pyx_t_3 = (__pyx_v_ret == -1L);
-  if (unlikely(__pyx_t_3)) {
+    __pyx_t_2 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_cur_scope->__pyx_v_self->__pyx_vtab)->_flush(__pyx_cur_scope->__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 298, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":251
- *         cdef int ret = msgpack_pack_array(&self.pk, size)
- *         if ret == -1:
- *             raise MemoryError             # <<<<<<<<<<<<<<
- *         elif ret:  # should not happen
- *             raise TypeError
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":297
+ *             raise PackValueError("recursion limit exceeded.")
+ * 
+ *         if self._streaming() and self.pk.length >= self.flush_threshold:             # <<<<<<<<<<<<<<
+ *             self._flush()
+ * 
  */
-    PyErr_NoMemory(); __PYX_ERR(0, 251, __pyx_L1_error)
+  }
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":250
- *             raise ValueError
- *         cdef int ret = msgpack_pack_array(&self.pk, size)
- *         if ret == -1:             # <<<<<<<<<<<<<<
- *             raise MemoryError
- *         elif ret:  # should not happen
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":300
+ *             self._flush()
+ * 
+ *         while True:             # <<<<<<<<<<<<<<
+ *             if o is None:
+ *                 ret = msgpack_pack_nil(&self.pk)
  */
-  }
+  while (1) {
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":252
- *         if ret == -1:
- *             raise MemoryError
- *         elif ret:  # should not happen             # <<<<<<<<<<<<<<
- *             raise TypeError
- *         if self.autoreset:
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":301
+ * 
+ *         while True:
+ *             if o is None:             # <<<<<<<<<<<<<<
+ *                 ret = msgpack_pack_nil(&self.pk)
+ *             elif isinstance(o, bool):
  */
-  __pyx_t_3 = (__pyx_v_ret != 0);
-  if (unlikely(__pyx_t_3)) {
+    __pyx_t_1 = (__pyx_v_o == Py_None);
+    if (__pyx_t_1) {
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":253
- *             raise MemoryError
- *         elif ret:  # should not happen
- *             raise TypeError             # <<<<<<<<<<<<<<
- *         if self.autoreset:
- *             buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":302
+ *         while True:
+ *             if o is None:
+ *                 ret = msgpack_pack_nil(&self.pk)             # <<<<<<<<<<<<<<
+ *             elif isinstance(o, bool):
+ *                 if o:
  */
-    __Pyx_Raise(__pyx_builtin_TypeError, 0, 0, 0);
-    __PYX_ERR(0, 253, __pyx_L1_error)
+      __pyx_v_ret = msgpack_pack_nil((&__pyx_cur_scope->__pyx_v_self->pk));
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":252
- *         if ret == -1:
- *             raise MemoryError
- *         elif ret:  # should not happen             # <<<<<<<<<<<<<<
- *             raise TypeError
- *         if self.autoreset:
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":301
+ * 
+ *         while True:
+ *             if o is None:             # <<<<<<<<<<<<<<
+ *                 ret = msgpack_pack_nil(&self.pk)
+ *             elif isinstance(o, bool):
  */
-  }
+      goto __pyx_L9;
+    }
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":254
- *         elif ret:  # should not happen
- *             raise TypeError
- *         if self.autoreset:             # <<<<<<<<<<<<<<
- *             buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
- *             self.pk.length = 0
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":303
+ *             if o is None:
+ *                 ret = msgpack_pack_nil(&self.pk)
+ *             elif isinstance(o, bool):             # <<<<<<<<<<<<<<
+ *                 if o:
+ *                     ret = msgpack_pack_true(&self.pk)
  */
-  if (__pyx_v_self->autoreset) {
+    __pyx_t_1 = __Pyx_TypeCheck(__pyx_v_o, __pyx_ptype_7cpython_4bool_bool); 
+    if (__pyx_t_1) {
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":255
- *             raise TypeError
- *         if self.autoreset:
- *             buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)             # <<<<<<<<<<<<<<
- *             self.pk.length = 0
- *             return buf
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":304
+ *                 ret = msgpack_pack_nil(&self.pk)
+ *             elif isinstance(o, bool):
+ *                 if o:             # <<<<<<<<<<<<<<
+ *                     ret = msgpack_pack_true(&self.pk)
+ *                 else:
  */
-    __pyx_t_2 = PyBytes_FromStringAndSize(__pyx_v_self->pk.buf, __pyx_v_self->pk.length); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 255, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_v_buf = ((PyObject*)__pyx_t_2);
-    __pyx_t_2 = 0;
+      __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_o); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 304, __pyx_L1_error)
+      if (__pyx_t_1) {
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":256
- *         if self.autoreset:
- *             buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
- *             self.pk.length = 0             # <<<<<<<<<<<<<<
- *             return buf
- * 
- */
-    __pyx_v_self->pk.length = 0;
-
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":257
- *             buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
- *             self.pk.length = 0
- *             return buf             # <<<<<<<<<<<<<<
- * 
- *     def pack_map_header(self, size_t size):
- */
-    __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(__pyx_v_buf);
-    __pyx_r = __pyx_v_buf;
-    goto __pyx_L0;
-
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":254
- *         elif ret:  # should not happen
- *             raise TypeError
- *         if self.autoreset:             # <<<<<<<<<<<<<<
- *             buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
- *             self.pk.length = 0
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":305
+ *             elif isinstance(o, bool):
+ *                 if o:
+ *                     ret = msgpack_pack_true(&self.pk)             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     ret = msgpack_pack_false(&self.pk)
  */
-  }
+        __pyx_v_ret = msgpack_pack_true((&__pyx_cur_scope->__pyx_v_self->pk));
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":246
- *         msgpack_pack_raw_body(&self.pk, data, len(data))
- * 
- *     def pack_array_header(self, size_t size):             # <<<<<<<<<<<<<<
- *         if size > (2**32) - 1:
- *             raise ValueError
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":304
+ *                 ret = msgpack_pack_nil(&self.pk)
+ *             elif isinstance(o, bool):
+ *                 if o:             # <<<<<<<<<<<<<<
+ *                     ret = msgpack_pack_true(&self.pk)
+ *                 else:
  */
+        goto __pyx_L10;
+      }
 
-  /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.pack_array_header", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_buf);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "isf_pandas_msgpack/msgpack/_packer.pyx":259
- *             return buf
- * 
- *     def pack_map_header(self, size_t size):             # <<<<<<<<<<<<<<
- *         if size > (2**32) - 1:
- *             raise ValueError
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":307
+ *                     ret = msgpack_pack_true(&self.pk)
+ *                 else:
+ *                     ret = msgpack_pack_false(&self.pk)             # <<<<<<<<<<<<<<
+ *             elif PyLong_Check(o):
+ *                 # PyInt_Check(long) is True for Python 3.
  */
-
-/* Python wrapper */
-static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_13pack_map_header(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_12pack_map_header, "Packer.pack_map_header(self, size_t size)");
-static PyMethodDef __pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_13pack_map_header = {"pack_map_header", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_13pack_map_header, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_12pack_map_header};
-static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_13pack_map_header(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-) {
-  size_t __pyx_v_size;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
-  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[1] = {0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("pack_map_header (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_size,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_size)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 259, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "pack_map_header") < 0)) __PYX_ERR(0, 259, __pyx_L3_error)
+      /*else*/ {
+        __pyx_v_ret = msgpack_pack_false((&__pyx_cur_scope->__pyx_v_self->pk));
       }
-    } else if (unlikely(__pyx_nargs != 1)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-    }
-    __pyx_v_size = __Pyx_PyInt_As_size_t(values[0]); if (unlikely((__pyx_v_size == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 259, __pyx_L3_error)
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("pack_map_header", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 259, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.pack_map_header", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_12pack_map_header(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self), __pyx_v_size);
+      __pyx_L10:;
 
-  /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":303
+ *             if o is None:
+ *                 ret = msgpack_pack_nil(&self.pk)
+ *             elif isinstance(o, bool):             # <<<<<<<<<<<<<<
+ *                 if o:
+ *                     ret = msgpack_pack_true(&self.pk)
+ */
+      goto __pyx_L9;
     }
-  }
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_12pack_map_header(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, size_t __pyx_v_size) {
-  int __pyx_v_ret;
-  PyObject *__pyx_v_buf = NULL;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  int __pyx_t_3;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("pack_map_header", 1);
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":260
- * 
- *     def pack_map_header(self, size_t size):
- *         if size > (2**32) - 1:             # <<<<<<<<<<<<<<
- *             raise ValueError
- *         cdef int ret = msgpack_pack_map(&self.pk, size)
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":308
+ *                 else:
+ *                     ret = msgpack_pack_false(&self.pk)
+ *             elif PyLong_Check(o):             # <<<<<<<<<<<<<<
+ *                 # PyInt_Check(long) is True for Python 3.
+ *                 # Sow we should test long before int.
  */
-  __pyx_t_1 = __Pyx_PyInt_FromSize_t(__pyx_v_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 260, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = PyObject_RichCompare(__pyx_t_1, __pyx_int_4294967295, Py_GT); __Pyx_XGOTREF(__pyx_t_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 260, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_3 < 0))) __PYX_ERR(0, 260, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(__pyx_t_3)) {
+    __pyx_t_1 = PyLong_Check(__pyx_v_o);
+    if (__pyx_t_1) {
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":261
- *     def pack_map_header(self, size_t size):
- *         if size > (2**32) - 1:
- *             raise ValueError             # <<<<<<<<<<<<<<
- *         cdef int ret = msgpack_pack_map(&self.pk, size)
- *         if ret == -1:
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":311
+ *                 # PyInt_Check(long) is True for Python 3.
+ *                 # Sow we should test long before int.
+ *                 if o > 0:             # <<<<<<<<<<<<<<
+ *                     ullval = o
+ *                     ret = msgpack_pack_unsigned_long_long(&self.pk, ullval)
  */
-    __Pyx_Raise(__pyx_builtin_ValueError, 0, 0, 0);
-    __PYX_ERR(0, 261, __pyx_L1_error)
+      __pyx_t_2 = PyObject_RichCompare(__pyx_v_o, __pyx_int_0, Py_GT); __Pyx_XGOTREF(__pyx_t_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 311, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 311, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      if (__pyx_t_1) {
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":260
- * 
- *     def pack_map_header(self, size_t size):
- *         if size > (2**32) - 1:             # <<<<<<<<<<<<<<
- *             raise ValueError
- *         cdef int ret = msgpack_pack_map(&self.pk, size)
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":312
+ *                 # Sow we should test long before int.
+ *                 if o > 0:
+ *                     ullval = o             # <<<<<<<<<<<<<<
+ *                     ret = msgpack_pack_unsigned_long_long(&self.pk, ullval)
+ *                 else:
  */
-  }
+        __pyx_t_7 = __Pyx_PyInt_As_unsigned_PY_LONG_LONG(__pyx_v_o); if (unlikely((__pyx_t_7 == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 312, __pyx_L1_error)
+        __pyx_v_ullval = __pyx_t_7;
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":262
- *         if size > (2**32) - 1:
- *             raise ValueError
- *         cdef int ret = msgpack_pack_map(&self.pk, size)             # <<<<<<<<<<<<<<
- *         if ret == -1:
- *             raise MemoryError
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":313
+ *                 if o > 0:
+ *                     ullval = o
+ *                     ret = msgpack_pack_unsigned_long_long(&self.pk, ullval)             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     llval = o
  */
-  __pyx_v_ret = msgpack_pack_map((&__pyx_v_self->pk), __pyx_v_size);
+        __pyx_v_ret = msgpack_pack_unsigned_long_long((&__pyx_cur_scope->__pyx_v_self->pk), __pyx_v_ullval);
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":263
- *             raise ValueError
- *         cdef int ret = msgpack_pack_map(&self.pk, size)
- *         if ret == -1:             # <<<<<<<<<<<<<<
- *             raise MemoryError
- *         elif ret:  # should not happen
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":311
+ *                 # PyInt_Check(long) is True for Python 3.
+ *                 # Sow we should test long before int.
+ *                 if o > 0:             # <<<<<<<<<<<<<<
+ *                     ullval = o
+ *                     ret = msgpack_pack_unsigned_long_long(&self.pk, ullval)
  */
-  __pyx_t_3 = (__pyx_v_ret == -1L);
-  if (unlikely(__pyx_t_3)) {
+        goto __pyx_L11;
+      }
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":264
- *         cdef int ret = msgpack_pack_map(&self.pk, size)
- *         if ret == -1:
- *             raise MemoryError             # <<<<<<<<<<<<<<
- *         elif ret:  # should not happen
- *             raise TypeError
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":315
+ *                     ret = msgpack_pack_unsigned_long_long(&self.pk, ullval)
+ *                 else:
+ *                     llval = o             # <<<<<<<<<<<<<<
+ *                     ret = msgpack_pack_long_long(&self.pk, llval)
+ *             elif PyInt_Check(o):
  */
-    PyErr_NoMemory(); __PYX_ERR(0, 264, __pyx_L1_error)
+      /*else*/ {
+        __pyx_t_8 = __Pyx_PyInt_As_PY_LONG_LONG(__pyx_v_o); if (unlikely((__pyx_t_8 == (PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 315, __pyx_L1_error)
+        __pyx_v_llval = __pyx_t_8;
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":263
- *             raise ValueError
- *         cdef int ret = msgpack_pack_map(&self.pk, size)
- *         if ret == -1:             # <<<<<<<<<<<<<<
- *             raise MemoryError
- *         elif ret:  # should not happen
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":316
+ *                 else:
+ *                     llval = o
+ *                     ret = msgpack_pack_long_long(&self.pk, llval)             # <<<<<<<<<<<<<<
+ *             elif PyInt_Check(o):
+ *                 longval = o
  */
-  }
+        __pyx_v_ret = msgpack_pack_long_long((&__pyx_cur_scope->__pyx_v_self->pk), __pyx_v_llval);
+      }
+      __pyx_L11:;
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":265
- *         if ret == -1:
- *             raise MemoryError
- *         elif ret:  # should not happen             # <<<<<<<<<<<<<<
- *             raise TypeError
- *         if self.autoreset:
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":308
+ *                 else:
+ *                     ret = msgpack_pack_false(&self.pk)
+ *             elif PyLong_Check(o):             # <<<<<<<<<<<<<<
+ *                 # PyInt_Check(long) is True for Python 3.
+ *                 # Sow we should test long before int.
  */
-  __pyx_t_3 = (__pyx_v_ret != 0);
-  if (unlikely(__pyx_t_3)) {
+      goto __pyx_L9;
+    }
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":266
- *             raise MemoryError
- *         elif ret:  # should not happen
- *             raise TypeError             # <<<<<<<<<<<<<<
- *         if self.autoreset:
- *             buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":317
+ *                     llval = o
+ *                     ret = msgpack_pack_long_long(&self.pk, llval)
+ *             elif PyInt_Check(o):             # <<<<<<<<<<<<<<
+ *                 longval = o
+ *                 ret = msgpack_pack_long(&self.pk, longval)
  */
-    __Pyx_Raise(__pyx_builtin_TypeError, 0, 0, 0);
-    __PYX_ERR(0, 266, __pyx_L1_error)
+    __pyx_t_1 = PyInt_Check(__pyx_v_o);
+    if (__pyx_t_1) {
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":265
- *         if ret == -1:
- *             raise MemoryError
- *         elif ret:  # should not happen             # <<<<<<<<<<<<<<
- *             raise TypeError
- *         if self.autoreset:
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":318
+ *                     ret = msgpack_pack_long_long(&self.pk, llval)
+ *             elif PyInt_Check(o):
+ *                 longval = o             # <<<<<<<<<<<<<<
+ *                 ret = msgpack_pack_long(&self.pk, longval)
+ *             elif PyFloat_Check(o):
  */
-  }
+      __pyx_t_9 = __Pyx_PyInt_As_long(__pyx_v_o); if (unlikely((__pyx_t_9 == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 318, __pyx_L1_error)
+      __pyx_v_longval = __pyx_t_9;
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":267
- *         elif ret:  # should not happen
- *             raise TypeError
- *         if self.autoreset:             # <<<<<<<<<<<<<<
- *             buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
- *             self.pk.length = 0
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":319
+ *             elif PyInt_Check(o):
+ *                 longval = o
+ *                 ret = msgpack_pack_long(&self.pk, longval)             # <<<<<<<<<<<<<<
+ *             elif PyFloat_Check(o):
+ *                 if self.use_float:
  */
-  if (__pyx_v_self->autoreset) {
+      __pyx_v_ret = msgpack_pack_long((&__pyx_cur_scope->__pyx_v_self->pk), __pyx_v_longval);
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":268
- *             raise TypeError
- *         if self.autoreset:
- *             buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)             # <<<<<<<<<<<<<<
- *             self.pk.length = 0
- *             return buf
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":317
+ *                     llval = o
+ *                     ret = msgpack_pack_long_long(&self.pk, llval)
+ *             elif PyInt_Check(o):             # <<<<<<<<<<<<<<
+ *                 longval = o
+ *                 ret = msgpack_pack_long(&self.pk, longval)
  */
-    __pyx_t_2 = PyBytes_FromStringAndSize(__pyx_v_self->pk.buf, __pyx_v_self->pk.length); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 268, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __pyx_v_buf = ((PyObject*)__pyx_t_2);
-    __pyx_t_2 = 0;
+      goto __pyx_L9;
+    }
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":269
- *         if self.autoreset:
- *             buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
- *             self.pk.length = 0             # <<<<<<<<<<<<<<
- *             return buf
- * 
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":320
+ *                 longval = o
+ *                 ret = msgpack_pack_long(&self.pk, longval)
+ *             elif PyFloat_Check(o):             # <<<<<<<<<<<<<<
+ *                 if self.use_float:
+ *                     fval = o
  */
-    __pyx_v_self->pk.length = 0;
+    __pyx_t_1 = PyFloat_Check(__pyx_v_o);
+    if (__pyx_t_1) {
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":270
- *             buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
- *             self.pk.length = 0
- *             return buf             # <<<<<<<<<<<<<<
- * 
- *     def pack_map_pairs(self, object pairs):
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":321
+ *                 ret = msgpack_pack_long(&self.pk, longval)
+ *             elif PyFloat_Check(o):
+ *                 if self.use_float:             # <<<<<<<<<<<<<<
+ *                     fval = o
+ *                     ret = msgpack_pack_float(&self.pk, fval)
  */
-    __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(__pyx_v_buf);
-    __pyx_r = __pyx_v_buf;
-    goto __pyx_L0;
+      __pyx_t_1 = __Pyx_PyObject_IsTrue(((PyObject *)__pyx_cur_scope->__pyx_v_self->use_float)); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 321, __pyx_L1_error)
+      if (__pyx_t_1) {
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":267
- *         elif ret:  # should not happen
- *             raise TypeError
- *         if self.autoreset:             # <<<<<<<<<<<<<<
- *             buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
- *             self.pk.length = 0
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":322
+ *             elif PyFloat_Check(o):
+ *                 if self.use_float:
+ *                     fval = o             # <<<<<<<<<<<<<<
+ *                     ret = msgpack_pack_float(&self.pk, fval)
+ *                 else:
  */
-  }
+        __pyx_t_10 = __pyx_PyFloat_AsFloat(__pyx_v_o); if (unlikely((__pyx_t_10 == (float)-1) && PyErr_Occurred())) __PYX_ERR(0, 322, __pyx_L1_error)
+        __pyx_v_fval = __pyx_t_10;
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":259
- *             return buf
- * 
- *     def pack_map_header(self, size_t size):             # <<<<<<<<<<<<<<
- *         if size > (2**32) - 1:
- *             raise ValueError
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":323
+ *                 if self.use_float:
+ *                     fval = o
+ *                     ret = msgpack_pack_float(&self.pk, fval)             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     dval = o
  */
+        __pyx_v_ret = msgpack_pack_float((&__pyx_cur_scope->__pyx_v_self->pk), __pyx_v_fval);
 
-  /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.pack_map_header", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_buf);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":321
+ *                 ret = msgpack_pack_long(&self.pk, longval)
+ *             elif PyFloat_Check(o):
+ *                 if self.use_float:             # <<<<<<<<<<<<<<
+ *                     fval = o
+ *                     ret = msgpack_pack_float(&self.pk, fval)
+ */
+        goto __pyx_L12;
+      }
 
-/* "isf_pandas_msgpack/msgpack/_packer.pyx":272
- *             return buf
- * 
- *     def pack_map_pairs(self, object pairs):             # <<<<<<<<<<<<<<
- *         """
- *         Pack *pairs* as msgpack map type.
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":325
+ *                     ret = msgpack_pack_float(&self.pk, fval)
+ *                 else:
+ *                     dval = o             # <<<<<<<<<<<<<<
+ *                     ret = msgpack_pack_double(&self.pk, dval)
+ *             elif PyBytes_Check(o):
  */
+      /*else*/ {
+        __pyx_t_11 = __pyx_PyFloat_AsDouble(__pyx_v_o); if (unlikely((__pyx_t_11 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 325, __pyx_L1_error)
+        __pyx_v_dval = __pyx_t_11;
 
-/* Python wrapper */
-static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_15pack_map_pairs(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_14pack_map_pairs, "Packer.pack_map_pairs(self, pairs)\n\n        Pack *pairs* as msgpack map type.\n\n        *pairs* should sequence of pair.\n        (`len(pairs)` and `for k, v in pairs:` should be supported.)\n        ");
-static PyMethodDef __pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_15pack_map_pairs = {"pack_map_pairs", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_15pack_map_pairs, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_14pack_map_pairs};
-static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_15pack_map_pairs(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-) {
-  PyObject *__pyx_v_pairs = 0;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
-  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[1] = {0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("pack_map_pairs (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pairs,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_pairs)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
-          kw_args--;
-        }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 272, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
-      }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "pack_map_pairs") < 0)) __PYX_ERR(0, 272, __pyx_L3_error)
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":326
+ *                 else:
+ *                     dval = o
+ *                     ret = msgpack_pack_double(&self.pk, dval)             # <<<<<<<<<<<<<<
+ *             elif PyBytes_Check(o):
+ *                 L = len(o)
+ */
+        __pyx_v_ret = msgpack_pack_double((&__pyx_cur_scope->__pyx_v_self->pk), __pyx_v_dval);
       }
-    } else if (unlikely(__pyx_nargs != 1)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-    }
-    __pyx_v_pairs = values[0];
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("pack_map_pairs", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 272, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.pack_map_pairs", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_14pack_map_pairs(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self), __pyx_v_pairs);
+      __pyx_L12:;
 
-  /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":320
+ *                 longval = o
+ *                 ret = msgpack_pack_long(&self.pk, longval)
+ *             elif PyFloat_Check(o):             # <<<<<<<<<<<<<<
+ *                 if self.use_float:
+ *                     fval = o
+ */
+      goto __pyx_L9;
     }
-  }
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_14pack_map_pairs(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_pairs) {
-  int __pyx_v_ret;
-  PyObject *__pyx_v_k = NULL;
-  PyObject *__pyx_v_v = NULL;
-  PyObject *__pyx_v_buf = NULL;
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  Py_ssize_t __pyx_t_1;
-  int __pyx_t_2;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *(*__pyx_t_4)(PyObject *);
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  PyObject *__pyx_t_8 = NULL;
-  PyObject *(*__pyx_t_9)(PyObject *);
-  int __pyx_t_10;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("pack_map_pairs", 1);
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":279
- *         (`len(pairs)` and `for k, v in pairs:` should be supported.)
- *         """
- *         cdef int ret = msgpack_pack_map(&self.pk, len(pairs))             # <<<<<<<<<<<<<<
- *         if ret == 0:
- *             for k, v in pairs:
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":327
+ *                     dval = o
+ *                     ret = msgpack_pack_double(&self.pk, dval)
+ *             elif PyBytes_Check(o):             # <<<<<<<<<<<<<<
+ *                 L = len(o)
+ *                 if L > (2**32) - 1:
  */
-  __pyx_t_1 = PyObject_Length(__pyx_v_pairs); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 279, __pyx_L1_error)
-  __pyx_v_ret = msgpack_pack_map((&__pyx_v_self->pk), __pyx_t_1);
+    __pyx_t_1 = PyBytes_Check(__pyx_v_o);
+    if (__pyx_t_1) {
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":280
- *         """
- *         cdef int ret = msgpack_pack_map(&self.pk, len(pairs))
- *         if ret == 0:             # <<<<<<<<<<<<<<
- *             for k, v in pairs:
- *                 ret = self._pack(k)
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":328
+ *                     ret = msgpack_pack_double(&self.pk, dval)
+ *             elif PyBytes_Check(o):
+ *                 L = len(o)             # <<<<<<<<<<<<<<
+ *                 if L > (2**32) - 1:
+ *                     raise ValueError("bytes is too large")
  */
-  __pyx_t_2 = (__pyx_v_ret == 0);
-  if (__pyx_t_2) {
+      __pyx_t_12 = PyObject_Length(__pyx_v_o); if (unlikely(__pyx_t_12 == ((Py_ssize_t)-1))) __PYX_ERR(0, 328, __pyx_L1_error)
+      __pyx_v_L = __pyx_t_12;
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":281
- *         cdef int ret = msgpack_pack_map(&self.pk, len(pairs))
- *         if ret == 0:
- *             for k, v in pairs:             # <<<<<<<<<<<<<<
- *                 ret = self._pack(k)
- *                 if ret != 0: break
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":329
+ *             elif PyBytes_Check(o):
+ *                 L = len(o)
+ *                 if L > (2**32) - 1:             # <<<<<<<<<<<<<<
+ *                     raise ValueError("bytes is too large")
+ *                 rawval = o
  */
-    if (likely(PyList_CheckExact(__pyx_v_pairs)) || PyTuple_CheckExact(__pyx_v_pairs)) {
-      __pyx_t_3 = __pyx_v_pairs; __Pyx_INCREF(__pyx_t_3);
-      __pyx_t_1 = 0;
-      __pyx_t_4 = NULL;
-    } else {
-      __pyx_t_1 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_v_pairs); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 281, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 281, __pyx_L1_error)
-    }
-    for (;;) {
-      if (likely(!__pyx_t_4)) {
-        if (likely(PyList_CheckExact(__pyx_t_3))) {
-          {
-            Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_3);
-            #if !CYTHON_ASSUME_SAFE_MACROS
-            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 281, __pyx_L1_error)
-            #endif
-            if (__pyx_t_1 >= __pyx_temp) break;
-          }
-          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_5 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_5); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 281, __pyx_L1_error)
-          #else
-          __pyx_t_5 = __Pyx_PySequence_ITEM(__pyx_t_3, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 281, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_5);
-          #endif
-        } else {
-          {
-            Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_3);
-            #if !CYTHON_ASSUME_SAFE_MACROS
-            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 281, __pyx_L1_error)
-            #endif
-            if (__pyx_t_1 >= __pyx_temp) break;
-          }
-          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_5); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 281, __pyx_L1_error)
-          #else
-          __pyx_t_5 = __Pyx_PySequence_ITEM(__pyx_t_3, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 281, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_5);
-          #endif
-        }
-      } else {
-        __pyx_t_5 = __pyx_t_4(__pyx_t_3);
-        if (unlikely(!__pyx_t_5)) {
-          PyObject* exc_type = PyErr_Occurred();
-          if (exc_type) {
-            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-            else __PYX_ERR(0, 281, __pyx_L1_error)
-          }
-          break;
-        }
-        __Pyx_GOTREF(__pyx_t_5);
-      }
-      if ((likely(PyTuple_CheckExact(__pyx_t_5))) || (PyList_CheckExact(__pyx_t_5))) {
-        PyObject* sequence = __pyx_t_5;
-        Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
-        if (unlikely(size != 2)) {
-          if (size > 2) __Pyx_RaiseTooManyValuesError(2);
-          else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-          __PYX_ERR(0, 281, __pyx_L1_error)
-        }
-        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        if (likely(PyTuple_CheckExact(sequence))) {
-          __pyx_t_6 = PyTuple_GET_ITEM(sequence, 0); 
-          __pyx_t_7 = PyTuple_GET_ITEM(sequence, 1); 
-        } else {
-          __pyx_t_6 = PyList_GET_ITEM(sequence, 0); 
-          __pyx_t_7 = PyList_GET_ITEM(sequence, 1); 
-        }
-        __Pyx_INCREF(__pyx_t_6);
-        __Pyx_INCREF(__pyx_t_7);
-        #else
-        __pyx_t_6 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 281, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_6);
-        __pyx_t_7 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 281, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_7);
-        #endif
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-      } else {
-        Py_ssize_t index = -1;
-        __pyx_t_8 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 281, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_8);
-        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        __pyx_t_9 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_8);
-        index = 0; __pyx_t_6 = __pyx_t_9(__pyx_t_8); if (unlikely(!__pyx_t_6)) goto __pyx_L6_unpacking_failed;
-        __Pyx_GOTREF(__pyx_t_6);
-        index = 1; __pyx_t_7 = __pyx_t_9(__pyx_t_8); if (unlikely(!__pyx_t_7)) goto __pyx_L6_unpacking_failed;
-        __Pyx_GOTREF(__pyx_t_7);
-        if (__Pyx_IternextUnpackEndCheck(__pyx_t_9(__pyx_t_8), 2) < 0) __PYX_ERR(0, 281, __pyx_L1_error)
-        __pyx_t_9 = NULL;
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        goto __pyx_L7_unpacking_done;
-        __pyx_L6_unpacking_failed:;
-        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-        __pyx_t_9 = NULL;
-        if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-        __PYX_ERR(0, 281, __pyx_L1_error)
-        __pyx_L7_unpacking_done:;
-      }
-      __Pyx_XDECREF_SET(__pyx_v_k, __pyx_t_6);
-      __pyx_t_6 = 0;
-      __Pyx_XDECREF_SET(__pyx_v_v, __pyx_t_7);
-      __pyx_t_7 = 0;
+      __pyx_t_2 = __Pyx_PyInt_FromSize_t(__pyx_v_L); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 329, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_3 = PyObject_RichCompare(__pyx_t_2, __pyx_int_4294967295, Py_GT); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 329, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 329, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      if (unlikely(__pyx_t_1)) {
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":282
- *         if ret == 0:
- *             for k, v in pairs:
- *                 ret = self._pack(k)             # <<<<<<<<<<<<<<
- *                 if ret != 0: break
- *                 ret = self._pack(v)
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":330
+ *                 L = len(o)
+ *                 if L > (2**32) - 1:
+ *                     raise ValueError("bytes is too large")             # <<<<<<<<<<<<<<
+ *                 rawval = o
+ *                 ret = msgpack_pack_bin(&self.pk, L)
  */
-      __pyx_t_10 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_pack(__pyx_v_self, __pyx_v_k, NULL); if (unlikely(__pyx_t_10 == ((int)-1))) __PYX_ERR(0, 282, __pyx_L1_error)
-      __pyx_v_ret = __pyx_t_10;
+        __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__8, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 330, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __PYX_ERR(0, 330, __pyx_L1_error)
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":283
- *             for k, v in pairs:
- *                 ret = self._pack(k)
- *                 if ret != 0: break             # <<<<<<<<<<<<<<
- *                 ret = self._pack(v)
- *                 if ret != 0: break
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":329
+ *             elif PyBytes_Check(o):
+ *                 L = len(o)
+ *                 if L > (2**32) - 1:             # <<<<<<<<<<<<<<
+ *                     raise ValueError("bytes is too large")
+ *                 rawval = o
  */
-      __pyx_t_2 = (__pyx_v_ret != 0);
-      if (__pyx_t_2) {
-        goto __pyx_L5_break;
       }
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":284
- *                 ret = self._pack(k)
- *                 if ret != 0: break
- *                 ret = self._pack(v)             # <<<<<<<<<<<<<<
- *                 if ret != 0: break
- *         if ret == -1:
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":331
+ *                 if L > (2**32) - 1:
+ *                     raise ValueError("bytes is too large")
+ *                 rawval = o             # <<<<<<<<<<<<<<
+ *                 ret = msgpack_pack_bin(&self.pk, L)
+ *                 if ret == 0:
  */
-      __pyx_t_10 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_pack(__pyx_v_self, __pyx_v_v, NULL); if (unlikely(__pyx_t_10 == ((int)-1))) __PYX_ERR(0, 284, __pyx_L1_error)
-      __pyx_v_ret = __pyx_t_10;
+      __pyx_t_13 = __Pyx_PyObject_AsWritableString(__pyx_v_o); if (unlikely((!__pyx_t_13) && PyErr_Occurred())) __PYX_ERR(0, 331, __pyx_L1_error)
+      __pyx_v_rawval = __pyx_t_13;
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":285
- *                 if ret != 0: break
- *                 ret = self._pack(v)
- *                 if ret != 0: break             # <<<<<<<<<<<<<<
- *         if ret == -1:
- *             raise MemoryError
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":332
+ *                     raise ValueError("bytes is too large")
+ *                 rawval = o
+ *                 ret = msgpack_pack_bin(&self.pk, L)             # <<<<<<<<<<<<<<
+ *                 if ret == 0:
+ *                     ret = msgpack_pack_raw_body(&self.pk, rawval, L)
  */
-      __pyx_t_2 = (__pyx_v_ret != 0);
-      if (__pyx_t_2) {
-        goto __pyx_L5_break;
-      }
+      __pyx_v_ret = msgpack_pack_bin((&__pyx_cur_scope->__pyx_v_self->pk), __pyx_v_L);
 
-      /* "isf_pandas_msgpack/msgpack/_packer.pyx":281
- *         cdef int ret = msgpack_pack_map(&self.pk, len(pairs))
- *         if ret == 0:
- *             for k, v in pairs:             # <<<<<<<<<<<<<<
- *                 ret = self._pack(k)
- *                 if ret != 0: break
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":333
+ *                 rawval = o
+ *                 ret = msgpack_pack_bin(&self.pk, L)
+ *                 if ret == 0:             # <<<<<<<<<<<<<<
+ *                     ret = msgpack_pack_raw_body(&self.pk, rawval, L)
+ *             elif PyUnicode_Check(o):
  */
-    }
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    goto __pyx_L10_for_end;
-    __pyx_L5_break:;
-    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    goto __pyx_L10_for_end;
-    __pyx_L10_for_end:;
+      __pyx_t_1 = (__pyx_v_ret == 0);
+      if (__pyx_t_1) {
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":280
- *         """
- *         cdef int ret = msgpack_pack_map(&self.pk, len(pairs))
- *         if ret == 0:             # <<<<<<<<<<<<<<
- *             for k, v in pairs:
- *                 ret = self._pack(k)
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":334
+ *                 ret = msgpack_pack_bin(&self.pk, L)
+ *                 if ret == 0:
+ *                     ret = msgpack_pack_raw_body(&self.pk, rawval, L)             # <<<<<<<<<<<<<<
+ *             elif PyUnicode_Check(o):
+ *                 if not self.encoding:
  */
-  }
+        __pyx_v_ret = msgpack_pack_raw_body((&__pyx_cur_scope->__pyx_v_self->pk), __pyx_v_rawval, __pyx_v_L);
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":286
- *                 ret = self._pack(v)
- *                 if ret != 0: break
- *         if ret == -1:             # <<<<<<<<<<<<<<
- *             raise MemoryError
- *         elif ret:  # should not happen
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":333
+ *                 rawval = o
+ *                 ret = msgpack_pack_bin(&self.pk, L)
+ *                 if ret == 0:             # <<<<<<<<<<<<<<
+ *                     ret = msgpack_pack_raw_body(&self.pk, rawval, L)
+ *             elif PyUnicode_Check(o):
  */
-  __pyx_t_2 = (__pyx_v_ret == -1L);
-  if (unlikely(__pyx_t_2)) {
+      }
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":287
- *                 if ret != 0: break
- *         if ret == -1:
- *             raise MemoryError             # <<<<<<<<<<<<<<
- *         elif ret:  # should not happen
- *             raise TypeError
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":327
+ *                     dval = o
+ *                     ret = msgpack_pack_double(&self.pk, dval)
+ *             elif PyBytes_Check(o):             # <<<<<<<<<<<<<<
+ *                 L = len(o)
+ *                 if L > (2**32) - 1:
  */
-    PyErr_NoMemory(); __PYX_ERR(0, 287, __pyx_L1_error)
+      goto __pyx_L9;
+    }
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":286
- *                 ret = self._pack(v)
- *                 if ret != 0: break
- *         if ret == -1:             # <<<<<<<<<<<<<<
- *             raise MemoryError
- *         elif ret:  # should not happen
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":335
+ *                 if ret == 0:
+ *                     ret = msgpack_pack_raw_body(&self.pk, rawval, L)
+ *             elif PyUnicode_Check(o):             # <<<<<<<<<<<<<<
+ *                 if not self.encoding:
+ *                     raise TypeError("Can't encode unicode string: "
  */
-  }
+    __pyx_t_1 = PyUnicode_Check(__pyx_v_o);
+    if (__pyx_t_1) {
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":288
- *         if ret == -1:
- *             raise MemoryError
- *         elif ret:  # should not happen             # <<<<<<<<<<<<<<
- *             raise TypeError
- *         if self.autoreset:
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":336
+ *                     ret = msgpack_pack_raw_body(&self.pk, rawval, L)
+ *             elif PyUnicode_Check(o):
+ *                 if not self.encoding:             # <<<<<<<<<<<<<<
+ *                     raise TypeError("Can't encode unicode string: "
+ *                                     "no encoding is specified")
  */
-  __pyx_t_2 = (__pyx_v_ret != 0);
-  if (unlikely(__pyx_t_2)) {
+      __pyx_t_1 = (!(__pyx_cur_scope->__pyx_v_self->encoding != 0));
+      if (unlikely(__pyx_t_1)) {
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":289
- *             raise MemoryError
- *         elif ret:  # should not happen
- *             raise TypeError             # <<<<<<<<<<<<<<
- *         if self.autoreset:
- *             buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":337
+ *             elif PyUnicode_Check(o):
+ *                 if not self.encoding:
+ *                     raise TypeError("Can't encode unicode string: "             # <<<<<<<<<<<<<<
+ *                                     "no encoding is specified")
+ *                 o = PyUnicode_AsEncodedString(o, self.encoding,
  */
-    __Pyx_Raise(__pyx_builtin_TypeError, 0, 0, 0);
-    __PYX_ERR(0, 289, __pyx_L1_error)
+        __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 337, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __PYX_ERR(0, 337, __pyx_L1_error)
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":288
- *         if ret == -1:
- *             raise MemoryError
- *         elif ret:  # should not happen             # <<<<<<<<<<<<<<
- *             raise TypeError
- *         if self.autoreset:
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":336
+ *                     ret = msgpack_pack_raw_body(&self.pk, rawval, L)
+ *             elif PyUnicode_Check(o):
+ *                 if not self.encoding:             # <<<<<<<<<<<<<<
+ *                     raise TypeError("Can't encode unicode string: "
+ *                                     "no encoding is specified")
  */
-  }
+      }
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":290
- *         elif ret:  # should not happen
- *             raise TypeError
- *         if self.autoreset:             # <<<<<<<<<<<<<<
- *             buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
- *             self.pk.length = 0
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":339
+ *                     raise TypeError("Can't encode unicode string: "
+ *                                     "no encoding is specified")
+ *                 o = PyUnicode_AsEncodedString(o, self.encoding,             # <<<<<<<<<<<<<<
+ *                                               self.unicode_errors)
+ *                 L = len(o)
  */
-  if (__pyx_v_self->autoreset) {
+      __pyx_t_3 = PyUnicode_AsEncodedString(__pyx_v_o, __pyx_cur_scope->__pyx_v_self->encoding, __pyx_cur_scope->__pyx_v_self->unicode_errors); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 339, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF_SET(__pyx_v_o, __pyx_t_3);
+      __pyx_t_3 = 0;
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":291
- *             raise TypeError
- *         if self.autoreset:
- *             buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)             # <<<<<<<<<<<<<<
- *             self.pk.length = 0
- *             return buf
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":341
+ *                 o = PyUnicode_AsEncodedString(o, self.encoding,
+ *                                               self.unicode_errors)
+ *                 L = len(o)             # <<<<<<<<<<<<<<
+ *                 if L > (2**32) - 1:
+ *                     raise ValueError("dict is too large")
  */
-    __pyx_t_3 = PyBytes_FromStringAndSize(__pyx_v_self->pk.buf, __pyx_v_self->pk.length); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 291, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_3);
-    __pyx_v_buf = ((PyObject*)__pyx_t_3);
-    __pyx_t_3 = 0;
+      __pyx_t_12 = PyObject_Length(__pyx_v_o); if (unlikely(__pyx_t_12 == ((Py_ssize_t)-1))) __PYX_ERR(0, 341, __pyx_L1_error)
+      __pyx_v_L = __pyx_t_12;
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":292
- *         if self.autoreset:
- *             buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
- *             self.pk.length = 0             # <<<<<<<<<<<<<<
- *             return buf
- * 
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":342
+ *                                               self.unicode_errors)
+ *                 L = len(o)
+ *                 if L > (2**32) - 1:             # <<<<<<<<<<<<<<
+ *                     raise ValueError("dict is too large")
+ *                 rawval = o
  */
-    __pyx_v_self->pk.length = 0;
+      __pyx_t_3 = __Pyx_PyInt_FromSize_t(__pyx_v_L); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 342, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_2 = PyObject_RichCompare(__pyx_t_3, __pyx_int_4294967295, Py_GT); __Pyx_XGOTREF(__pyx_t_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 342, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 342, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      if (unlikely(__pyx_t_1)) {
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":293
- *             buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
- *             self.pk.length = 0
- *             return buf             # <<<<<<<<<<<<<<
- * 
- *     def reset(self):
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":343
+ *                 L = len(o)
+ *                 if L > (2**32) - 1:
+ *                     raise ValueError("dict is too large")             # <<<<<<<<<<<<<<
+ *                 rawval = o
+ *                 ret = msgpack_pack_raw(&self.pk, len(o))
  */
-    __Pyx_XDECREF(__pyx_r);
-    __Pyx_INCREF(__pyx_v_buf);
-    __pyx_r = __pyx_v_buf;
-    goto __pyx_L0;
+        __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 343, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __PYX_ERR(0, 343, __pyx_L1_error)
 
-    /* "isf_pandas_msgpack/msgpack/_packer.pyx":290
- *         elif ret:  # should not happen
- *             raise TypeError
- *         if self.autoreset:             # <<<<<<<<<<<<<<
- *             buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
- *             self.pk.length = 0
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":342
+ *                                               self.unicode_errors)
+ *                 L = len(o)
+ *                 if L > (2**32) - 1:             # <<<<<<<<<<<<<<
+ *                     raise ValueError("dict is too large")
+ *                 rawval = o
  */
-  }
+      }
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":272
- *             return buf
- * 
- *     def pack_map_pairs(self, object pairs):             # <<<<<<<<<<<<<<
- *         """
- *         Pack *pairs* as msgpack map type.
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":344
+ *                 if L > (2**32) - 1:
+ *                     raise ValueError("dict is too large")
+ *                 rawval = o             # <<<<<<<<<<<<<<
+ *                 ret = msgpack_pack_raw(&self.pk, len(o))
+ *                 if ret == 0:
  */
+      __pyx_t_13 = __Pyx_PyObject_AsWritableString(__pyx_v_o); if (unlikely((!__pyx_t_13) && PyErr_Occurred())) __PYX_ERR(0, 344, __pyx_L1_error)
+      __pyx_v_rawval = __pyx_t_13;
 
-  /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_5);
-  __Pyx_XDECREF(__pyx_t_6);
-  __Pyx_XDECREF(__pyx_t_7);
-  __Pyx_XDECREF(__pyx_t_8);
-  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.pack_map_pairs", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_k);
-  __Pyx_XDECREF(__pyx_v_v);
-  __Pyx_XDECREF(__pyx_v_buf);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-
-/* "isf_pandas_msgpack/msgpack/_packer.pyx":295
- *             return buf
- * 
- *     def reset(self):             # <<<<<<<<<<<<<<
- *         """Clear internal buffer."""
- *         self.pk.length = 0
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":345
+ *                     raise ValueError("dict is too large")
+ *                 rawval = o
+ *                 ret = msgpack_pack_raw(&self.pk, len(o))             # <<<<<<<<<<<<<<
+ *                 if ret == 0:
+ *                     ret = msgpack_pack_raw_body(&self.pk, rawval, len(o))
  */
+      __pyx_t_12 = PyObject_Length(__pyx_v_o); if (unlikely(__pyx_t_12 == ((Py_ssize_t)-1))) __PYX_ERR(0, 345, __pyx_L1_error)
+      __pyx_v_ret = msgpack_pack_raw((&__pyx_cur_scope->__pyx_v_self->pk), __pyx_t_12);
 
-/* Python wrapper */
-static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_17reset(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_16reset, "Packer.reset(self)\nClear internal buffer.");
-static PyMethodDef __pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_17reset = {"reset", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_17reset, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_16reset};
-static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_17reset(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-) {
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
-  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("reset (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  if (unlikely(__pyx_nargs > 0)) {
-    __Pyx_RaiseArgtupleInvalid("reset", 1, 0, 0, __pyx_nargs); return NULL;}
-  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "reset", 0))) return NULL;
-  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_16reset(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self));
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":346
+ *                 rawval = o
+ *                 ret = msgpack_pack_raw(&self.pk, len(o))
+ *                 if ret == 0:             # <<<<<<<<<<<<<<
+ *                     ret = msgpack_pack_raw_body(&self.pk, rawval, len(o))
+ *             elif PyDict_CheckExact(o):
+ */
+      __pyx_t_1 = (__pyx_v_ret == 0);
+      if (__pyx_t_1) {
 
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":347
+ *                 ret = msgpack_pack_raw(&self.pk, len(o))
+ *                 if ret == 0:
+ *                     ret = msgpack_pack_raw_body(&self.pk, rawval, len(o))             # <<<<<<<<<<<<<<
+ *             elif PyDict_CheckExact(o):
+ *                 d = <dict>o
+ */
+        __pyx_t_12 = PyObject_Length(__pyx_v_o); if (unlikely(__pyx_t_12 == ((Py_ssize_t)-1))) __PYX_ERR(0, 347, __pyx_L1_error)
+        __pyx_v_ret = msgpack_pack_raw_body((&__pyx_cur_scope->__pyx_v_self->pk), __pyx_v_rawval, __pyx_t_12);
 
-static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_16reset(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("reset", 1);
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":346
+ *                 rawval = o
+ *                 ret = msgpack_pack_raw(&self.pk, len(o))
+ *                 if ret == 0:             # <<<<<<<<<<<<<<
+ *                     ret = msgpack_pack_raw_body(&self.pk, rawval, len(o))
+ *             elif PyDict_CheckExact(o):
+ */
+      }
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":297
- *     def reset(self):
- *         """Clear internal buffer."""
- *         self.pk.length = 0             # <<<<<<<<<<<<<<
- * 
- *     def bytes(self):
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":335
+ *                 if ret == 0:
+ *                     ret = msgpack_pack_raw_body(&self.pk, rawval, L)
+ *             elif PyUnicode_Check(o):             # <<<<<<<<<<<<<<
+ *                 if not self.encoding:
+ *                     raise TypeError("Can't encode unicode string: "
  */
-  __pyx_v_self->pk.length = 0;
+      goto __pyx_L9;
+    }
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":295
- *             return buf
- * 
- *     def reset(self):             # <<<<<<<<<<<<<<
- *         """Clear internal buffer."""
- *         self.pk.length = 0
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":348
+ *                 if ret == 0:
+ *                     ret = msgpack_pack_raw_body(&self.pk, rawval, len(o))
+ *             elif PyDict_CheckExact(o):             # <<<<<<<<<<<<<<
+ *                 d = <dict>o
+ *                 L = len(d)
  */
+    __pyx_t_1 = PyDict_CheckExact(__pyx_v_o);
+    if (__pyx_t_1) {
 
-  /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":349
+ *                     ret = msgpack_pack_raw_body(&self.pk, rawval, len(o))
+ *             elif PyDict_CheckExact(o):
+ *                 d = <dict>o             # <<<<<<<<<<<<<<
+ *                 L = len(d)
+ *                 # only the maps of default, and those in them, are padded,
+ */
+      __pyx_t_2 = __pyx_v_o;
+      __Pyx_INCREF(__pyx_t_2);
+      __pyx_v_d = ((PyObject*)__pyx_t_2);
+      __pyx_t_2 = 0;
 
-/* "isf_pandas_msgpack/msgpack/_packer.pyx":299
- *         self.pk.length = 0
- * 
- *     def bytes(self):             # <<<<<<<<<<<<<<
- *         """Return buffer content."""
- *         return PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":350
+ *             elif PyDict_CheckExact(o):
+ *                 d = <dict>o
+ *                 L = len(d)             # <<<<<<<<<<<<<<
+ *                 # only the maps of default, and those in them, are padded,
+ *                 # the maps of the caller are written as they are
  */
+      if (unlikely(__pyx_v_d == Py_None)) {
+        PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+        __PYX_ERR(0, 350, __pyx_L1_error)
+      }
+      __pyx_t_12 = PyDict_Size(__pyx_v_d); if (unlikely(__pyx_t_12 == ((Py_ssize_t)-1))) __PYX_ERR(0, 350, __pyx_L1_error)
+      __pyx_v_L = __pyx_t_12;
 
-/* Python wrapper */
-static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_19bytes(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_18bytes, "Packer.bytes(self)\nReturn buffer content.");
-static PyMethodDef __pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_19bytes = {"bytes", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_19bytes, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_18bytes};
-static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_19bytes(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-) {
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
-  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("bytes (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  if (unlikely(__pyx_nargs > 0)) {
-    __Pyx_RaiseArgtupleInvalid("bytes", 1, 0, 0, __pyx_nargs); return NULL;}
-  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "bytes", 0))) return NULL;
-  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_18bytes(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self));
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":353
+ *                 # only the maps of default, and those in them, are padded,
+ *                 # the maps of the caller are written as they are
+ *                 encoded = encoded or default_used             # <<<<<<<<<<<<<<
+ *                 pad = self.align and encoded
+ *                 if pad:
+ */
+      if (!__pyx_v_encoded) {
+      } else {
+        __pyx_t_1 = __pyx_v_encoded;
+        goto __pyx_L18_bool_binop_done;
+      }
+      __pyx_t_6 = (__pyx_v_default_used != 0);
+      __pyx_t_1 = __pyx_t_6;
+      __pyx_L18_bool_binop_done:;
+      __pyx_v_encoded = __pyx_t_1;
+
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":354
+ *                 # the maps of the caller are written as they are
+ *                 encoded = encoded or default_used
+ *                 pad = self.align and encoded             # <<<<<<<<<<<<<<
+ *                 if pad:
+ *                     L += sum(self._aligns(k, v) for k, v in d.iteritems())
+ */
+      __pyx_t_6 = (__pyx_cur_scope->__pyx_v_self->align != 0);
+      if (__pyx_t_6) {
+      } else {
+        __pyx_t_1 = __pyx_t_6;
+        goto __pyx_L20_bool_binop_done;
+      }
+      __pyx_t_1 = __pyx_v_encoded;
+      __pyx_L20_bool_binop_done:;
+      __pyx_v_pad = __pyx_t_1;
+
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":355
+ *                 encoded = encoded or default_used
+ *                 pad = self.align and encoded
+ *                 if pad:             # <<<<<<<<<<<<<<
+ *                     L += sum(self._aligns(k, v) for k, v in d.iteritems())
+ *                 if L > (2**32) - 1:
+ */
+      if (__pyx_v_pad) {
 
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":356
+ *                 pad = self.align and encoded
+ *                 if pad:
+ *                     L += sum(self._aligns(k, v) for k, v in d.iteritems())             # <<<<<<<<<<<<<<
+ *                 if L > (2**32) - 1:
+ *                     raise ValueError("dict is too large")
+ */
+        __pyx_t_2 = __Pyx_PyInt_FromSize_t(__pyx_v_L); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 356, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __pyx_t_3 = __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_5_pack_genexpr(((PyObject*)__pyx_cur_scope), __pyx_v_d); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 356, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_builtin_sum, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 356, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_t_3 = PyNumber_InPlaceAdd(__pyx_t_2, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 356, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __pyx_t_14 = __Pyx_PyInt_As_size_t(__pyx_t_3); if (unlikely((__pyx_t_14 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 356, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_v_L = __pyx_t_14;
 
-static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_18bytes(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("bytes", 1);
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":355
+ *                 encoded = encoded or default_used
+ *                 pad = self.align and encoded
+ *                 if pad:             # <<<<<<<<<<<<<<
+ *                     L += sum(self._aligns(k, v) for k, v in d.iteritems())
+ *                 if L > (2**32) - 1:
+ */
+      }
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":301
- *     def bytes(self):
- *         """Return buffer content."""
- *         return PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)             # <<<<<<<<<<<<<<
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":357
+ *                 if pad:
+ *                     L += sum(self._aligns(k, v) for k, v in d.iteritems())
+ *                 if L > (2**32) - 1:             # <<<<<<<<<<<<<<
+ *                     raise ValueError("dict is too large")
+ *                 ret = msgpack_pack_map(&self.pk, L)
  */
-  __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyBytes_FromStringAndSize(__pyx_v_self->pk.buf, __pyx_v_self->pk.length); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 301, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
-  goto __pyx_L0;
+      __pyx_t_3 = __Pyx_PyInt_FromSize_t(__pyx_v_L); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 357, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = PyObject_RichCompare(__pyx_t_3, __pyx_int_4294967295, Py_GT); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 357, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 357, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(__pyx_t_1)) {
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":299
- *         self.pk.length = 0
- * 
- *     def bytes(self):             # <<<<<<<<<<<<<<
- *         """Return buffer content."""
- *         return PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":358
+ *                     L += sum(self._aligns(k, v) for k, v in d.iteritems())
+ *                 if L > (2**32) - 1:
+ *                     raise ValueError("dict is too large")             # <<<<<<<<<<<<<<
+ *                 ret = msgpack_pack_map(&self.pk, L)
+ *                 if ret == 0:
  */
+        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 358, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __PYX_ERR(0, 358, __pyx_L1_error)
 
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.bytes", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":357
+ *                 if pad:
+ *                     L += sum(self._aligns(k, v) for k, v in d.iteritems())
+ *                 if L > (2**32) - 1:             # <<<<<<<<<<<<<<
+ *                     raise ValueError("dict is too large")
+ *                 ret = msgpack_pack_map(&self.pk, L)
+ */
+      }
 
-/* "(tree fragment)":1
- * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
- * def __setstate_cython__(self, __pyx_state):
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":359
+ *                 if L > (2**32) - 1:
+ *                     raise ValueError("dict is too large")
+ *                 ret = msgpack_pack_map(&self.pk, L)             # <<<<<<<<<<<<<<
+ *                 if ret == 0:
+ *                     for k, v in d.iteritems():
  */
+      __pyx_v_ret = msgpack_pack_map((&__pyx_cur_scope->__pyx_v_self->pk), __pyx_v_L);
 
-/* Python wrapper */
-static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_21__reduce_cython__(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_20__reduce_cython__, "Packer.__reduce_cython__(self)");
-static PyMethodDef __pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_21__reduce_cython__ = {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_21__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_20__reduce_cython__};
-static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_21__reduce_cython__(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-) {
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
-  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  if (unlikely(__pyx_nargs > 0)) {
-    __Pyx_RaiseArgtupleInvalid("__reduce_cython__", 1, 0, 0, __pyx_nargs); return NULL;}
-  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__reduce_cython__", 0))) return NULL;
-  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_20__reduce_cython__(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self));
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":360
+ *                     raise ValueError("dict is too large")
+ *                 ret = msgpack_pack_map(&self.pk, L)
+ *                 if ret == 0:             # <<<<<<<<<<<<<<
+ *                     for k, v in d.iteritems():
+ *                         if pad and self._aligns(k, v):
+ */
+      __pyx_t_1 = (__pyx_v_ret == 0);
+      if (__pyx_t_1) {
 
-  /* function exit code */
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":361
+ *                 ret = msgpack_pack_map(&self.pk, L)
+ *                 if ret == 0:
+ *                     for k, v in d.iteritems():             # <<<<<<<<<<<<<<
+ *                         if pad and self._aligns(k, v):
+ *                             ret = self._pack_padding(k, v)
+ */
+        __pyx_t_12 = 0;
+        if (unlikely(__pyx_v_d == Py_None)) {
+          PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "iteritems");
+          __PYX_ERR(0, 361, __pyx_L1_error)
+        }
+        __pyx_t_3 = __Pyx_dict_iterator(__pyx_v_d, 1, __pyx_n_s_iteritems, (&__pyx_t_15), (&__pyx_t_16)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 361, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_XDECREF(__pyx_t_4);
+        __pyx_t_4 = __pyx_t_3;
+        __pyx_t_3 = 0;
+        while (1) {
+          __pyx_t_17 = __Pyx_dict_iter_next(__pyx_t_4, __pyx_t_15, &__pyx_t_12, &__pyx_t_3, &__pyx_t_2, NULL, __pyx_t_16);
+          if (unlikely(__pyx_t_17 == 0)) break;
+          if (unlikely(__pyx_t_17 == -1)) __PYX_ERR(0, 361, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_3);
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_XDECREF_SET(__pyx_v_k, __pyx_t_3);
+          __pyx_t_3 = 0;
+          __Pyx_XDECREF_SET(__pyx_v_v, __pyx_t_2);
+          __pyx_t_2 = 0;
 
-static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_20__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__reduce_cython__", 1);
+          /* "isf_pandas_msgpack/msgpack/_packer.pyx":362
+ *                 if ret == 0:
+ *                     for k, v in d.iteritems():
+ *                         if pad and self._aligns(k, v):             # <<<<<<<<<<<<<<
+ *                             ret = self._pack_padding(k, v)
+ *                             if ret != 0: break
+ */
+          if (__pyx_v_pad) {
+          } else {
+            __pyx_t_1 = __pyx_v_pad;
+            goto __pyx_L28_bool_binop_done;
+          }
+          __pyx_t_6 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_cur_scope->__pyx_v_self->__pyx_vtab)->_aligns(__pyx_cur_scope->__pyx_v_self, __pyx_v_k, __pyx_v_v); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 362, __pyx_L1_error)
+          __pyx_t_1 = __pyx_t_6;
+          __pyx_L28_bool_binop_done:;
+          if (__pyx_t_1) {
 
-  /* "(tree fragment)":2
- * def __reduce_cython__(self):
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"             # <<<<<<<<<<<<<<
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+            /* "isf_pandas_msgpack/msgpack/_packer.pyx":363
+ *                     for k, v in d.iteritems():
+ *                         if pad and self._aligns(k, v):
+ *                             ret = self._pack_padding(k, v)             # <<<<<<<<<<<<<<
+ *                             if ret != 0: break
+ *                         ret = self._pack(k, nest_limit - 1, encoded)
+ */
+            __pyx_t_17 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_cur_scope->__pyx_v_self->__pyx_vtab)->_pack_padding(__pyx_cur_scope->__pyx_v_self, __pyx_v_k, __pyx_v_v); if (unlikely(__pyx_t_17 == ((int)-1))) __PYX_ERR(0, 363, __pyx_L1_error)
+            __pyx_v_ret = __pyx_t_17;
+
+            /* "isf_pandas_msgpack/msgpack/_packer.pyx":364
+ *                         if pad and self._aligns(k, v):
+ *                             ret = self._pack_padding(k, v)
+ *                             if ret != 0: break             # <<<<<<<<<<<<<<
+ *                         ret = self._pack(k, nest_limit - 1, encoded)
+ *                         if ret != 0: break
  */
-  __Pyx_Raise(__pyx_builtin_TypeError, __pyx_kp_s_no_default___reduce___due_to_non, 0, 0);
-  __PYX_ERR(2, 2, __pyx_L1_error)
+            __pyx_t_1 = (__pyx_v_ret != 0);
+            if (__pyx_t_1) {
+              goto __pyx_L26_break;
+            }
 
-  /* "(tree fragment)":1
- * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
- * def __setstate_cython__(self, __pyx_state):
+            /* "isf_pandas_msgpack/msgpack/_packer.pyx":362
+ *                 if ret == 0:
+ *                     for k, v in d.iteritems():
+ *                         if pad and self._aligns(k, v):             # <<<<<<<<<<<<<<
+ *                             ret = self._pack_padding(k, v)
+ *                             if ret != 0: break
  */
+          }
 
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+          /* "isf_pandas_msgpack/msgpack/_packer.pyx":365
+ *                             ret = self._pack_padding(k, v)
+ *                             if ret != 0: break
+ *                         ret = self._pack(k, nest_limit - 1, encoded)             # <<<<<<<<<<<<<<
+ *                         if ret != 0: break
+ *                         ret = self._pack(v, nest_limit - 1, encoded)
+ */
+          __pyx_t_18.__pyx_n = 2;
+          __pyx_t_18.nest_limit = (__pyx_v_nest_limit - 1);
+          __pyx_t_18.encoded = __pyx_v_encoded;
+          __pyx_t_17 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_cur_scope->__pyx_v_self->__pyx_vtab)->_pack(__pyx_cur_scope->__pyx_v_self, __pyx_v_k, &__pyx_t_18); if (unlikely(__pyx_t_17 == ((int)-1))) __PYX_ERR(0, 365, __pyx_L1_error)
+          __pyx_v_ret = __pyx_t_17;
 
-/* "(tree fragment)":3
- * def __reduce_cython__(self):
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
- * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+          /* "isf_pandas_msgpack/msgpack/_packer.pyx":366
+ *                             if ret != 0: break
+ *                         ret = self._pack(k, nest_limit - 1, encoded)
+ *                         if ret != 0: break             # <<<<<<<<<<<<<<
+ *                         ret = self._pack(v, nest_limit - 1, encoded)
+ *                         if ret != 0: break
  */
+          __pyx_t_1 = (__pyx_v_ret != 0);
+          if (__pyx_t_1) {
+            goto __pyx_L26_break;
+          }
 
-/* Python wrapper */
-static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_23__setstate_cython__(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_22__setstate_cython__, "Packer.__setstate_cython__(self, __pyx_state)");
-static PyMethodDef __pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_23__setstate_cython__ = {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_23__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_22__setstate_cython__};
-static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_23__setstate_cython__(PyObject *__pyx_v_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-) {
-  CYTHON_UNUSED PyObject *__pyx_v___pyx_state = 0;
-  #if !CYTHON_METH_FASTCALL
-  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
-  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[1] = {0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
-  #if CYTHON_ASSUME_SAFE_MACROS
-  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
-  #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
-  #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pyx_state,0};
-    if (__pyx_kwds) {
-      Py_ssize_t kw_args;
-      switch (__pyx_nargs) {
-        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
-      switch (__pyx_nargs) {
-        case  0:
-        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_pyx_state)) != 0)) {
-          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
-          kw_args--;
+          /* "isf_pandas_msgpack/msgpack/_packer.pyx":367
+ *                         ret = self._pack(k, nest_limit - 1, encoded)
+ *                         if ret != 0: break
+ *                         ret = self._pack(v, nest_limit - 1, encoded)             # <<<<<<<<<<<<<<
+ *                         if ret != 0: break
+ *             elif PyDict_Check(o):
+ */
+          __pyx_t_18.__pyx_n = 2;
+          __pyx_t_18.nest_limit = (__pyx_v_nest_limit - 1);
+          __pyx_t_18.encoded = __pyx_v_encoded;
+          __pyx_t_17 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_cur_scope->__pyx_v_self->__pyx_vtab)->_pack(__pyx_cur_scope->__pyx_v_self, __pyx_v_v, &__pyx_t_18); if (unlikely(__pyx_t_17 == ((int)-1))) __PYX_ERR(0, 367, __pyx_L1_error)
+          __pyx_v_ret = __pyx_t_17;
+
+          /* "isf_pandas_msgpack/msgpack/_packer.pyx":368
+ *                         if ret != 0: break
+ *                         ret = self._pack(v, nest_limit - 1, encoded)
+ *                         if ret != 0: break             # <<<<<<<<<<<<<<
+ *             elif PyDict_Check(o):
+ *                 L = len(o)
+ */
+          __pyx_t_1 = (__pyx_v_ret != 0);
+          if (__pyx_t_1) {
+            goto __pyx_L26_break;
+          }
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(2, 3, __pyx_L3_error)
-        else goto __pyx_L5_argtuple_error;
+        __pyx_L26_break:;
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":360
+ *                     raise ValueError("dict is too large")
+ *                 ret = msgpack_pack_map(&self.pk, L)
+ *                 if ret == 0:             # <<<<<<<<<<<<<<
+ *                     for k, v in d.iteritems():
+ *                         if pad and self._aligns(k, v):
+ */
       }
-      if (unlikely(kw_args > 0)) {
-        const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__setstate_cython__") < 0)) __PYX_ERR(2, 3, __pyx_L3_error)
-      }
-    } else if (unlikely(__pyx_nargs != 1)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
-    }
-    __pyx_v___pyx_state = values[0];
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__setstate_cython__", 1, 1, 1, __pyx_nargs); __PYX_ERR(2, 3, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
-  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_22__setstate_cython__(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self), __pyx_v___pyx_state);
 
-  /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":348
+ *                 if ret == 0:
+ *                     ret = msgpack_pack_raw_body(&self.pk, rawval, len(o))
+ *             elif PyDict_CheckExact(o):             # <<<<<<<<<<<<<<
+ *                 d = <dict>o
+ *                 L = len(d)
+ */
+      goto __pyx_L9;
     }
-  }
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
 
-static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_22__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__setstate_cython__", 1);
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":369
+ *                         ret = self._pack(v, nest_limit - 1, encoded)
+ *                         if ret != 0: break
+ *             elif PyDict_Check(o):             # <<<<<<<<<<<<<<
+ *                 L = len(o)
+ *                 encoded = encoded or default_used
+ */
+    __pyx_t_1 = PyDict_Check(__pyx_v_o);
+    if (__pyx_t_1) {
 
-  /* "(tree fragment)":4
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"             # <<<<<<<<<<<<<<
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":370
+ *                         if ret != 0: break
+ *             elif PyDict_Check(o):
+ *                 L = len(o)             # <<<<<<<<<<<<<<
+ *                 encoded = encoded or default_used
+ *                 pad = self.align and encoded
  */
-  __Pyx_Raise(__pyx_builtin_TypeError, __pyx_kp_s_no_default___reduce___due_to_non, 0, 0);
-  __PYX_ERR(2, 4, __pyx_L1_error)
+      __pyx_t_15 = PyObject_Length(__pyx_v_o); if (unlikely(__pyx_t_15 == ((Py_ssize_t)-1))) __PYX_ERR(0, 370, __pyx_L1_error)
+      __pyx_v_L = __pyx_t_15;
 
-  /* "(tree fragment)":3
- * def __reduce_cython__(self):
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
- * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":371
+ *             elif PyDict_Check(o):
+ *                 L = len(o)
+ *                 encoded = encoded or default_used             # <<<<<<<<<<<<<<
+ *                 pad = self.align and encoded
+ *                 if pad:
  */
+      if (!__pyx_v_encoded) {
+      } else {
+        __pyx_t_1 = __pyx_v_encoded;
+        goto __pyx_L33_bool_binop_done;
+      }
+      __pyx_t_6 = (__pyx_v_default_used != 0);
+      __pyx_t_1 = __pyx_t_6;
+      __pyx_L33_bool_binop_done:;
+      __pyx_v_encoded = __pyx_t_1;
 
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-static struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer __pyx_vtable_18isf_pandas_msgpack_7msgpack_7_packer_Packer;
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":372
+ *                 L = len(o)
+ *                 encoded = encoded or default_used
+ *                 pad = self.align and encoded             # <<<<<<<<<<<<<<
+ *                 if pad:
+ *                     L += sum(self._aligns(k, v) for k, v in o.items())
+ */
+      __pyx_t_6 = (__pyx_cur_scope->__pyx_v_self->align != 0);
+      if (__pyx_t_6) {
+      } else {
+        __pyx_t_1 = __pyx_t_6;
+        goto __pyx_L35_bool_binop_done;
+      }
+      __pyx_t_1 = __pyx_v_encoded;
+      __pyx_L35_bool_binop_done:;
+      __pyx_v_pad = __pyx_t_1;
+
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":373
+ *                 encoded = encoded or default_used
+ *                 pad = self.align and encoded
+ *                 if pad:             # <<<<<<<<<<<<<<
+ *                     L += sum(self._aligns(k, v) for k, v in o.items())
+ *                 if L > (2**32) - 1:
+ */
+      if (__pyx_v_pad) {
 
-static PyObject *__pyx_tp_new_18isf_pandas_msgpack_7msgpack_7_packer_Packer(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
-  struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *p;
-  PyObject *o;
-  #if CYTHON_COMPILING_IN_LIMITED_API
-  allocfunc alloc_func = (allocfunc)PyType_GetSlot(t, Py_tp_alloc);
-  o = alloc_func(t, 0);
-  #else
-  if (likely(!__Pyx_PyType_HasFeature(t, Py_TPFLAGS_IS_ABSTRACT))) {
-    o = (*t->tp_alloc)(t, 0);
-  } else {
-    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
-  }
-  if (unlikely(!o)) return 0;
-  #endif
-  p = ((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)o);
-  p->__pyx_vtab = __pyx_vtabptr_18isf_pandas_msgpack_7msgpack_7_packer_Packer;
-  new((void*)&(p->pk)) struct msgpack_packer();
-  p->_default = Py_None; Py_INCREF(Py_None);
-  p->_bencoding = Py_None; Py_INCREF(Py_None);
-  p->_berrors = Py_None; Py_INCREF(Py_None);
-  p->use_float = ((PyBoolObject *)Py_None); Py_INCREF(Py_None);
-  if (unlikely(__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_1__cinit__(o, __pyx_empty_tuple, NULL) < 0)) goto bad;
-  return o;
-  bad:
-  Py_DECREF(o); o = 0;
-  return NULL;
-}
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":374
+ *                 pad = self.align and encoded
+ *                 if pad:
+ *                     L += sum(self._aligns(k, v) for k, v in o.items())             # <<<<<<<<<<<<<<
+ *                 if L > (2**32) - 1:
+ *                     raise ValueError("dict is too large")
+ */
+        __pyx_t_4 = __Pyx_PyInt_FromSize_t(__pyx_v_L); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 374, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __pyx_t_2 = __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_5_pack_3genexpr(((PyObject*)__pyx_cur_scope), __pyx_v_o); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 374, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_sum, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 374, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __pyx_t_2 = PyNumber_InPlaceAdd(__pyx_t_4, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 374, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_t_14 = __Pyx_PyInt_As_size_t(__pyx_t_2); if (unlikely((__pyx_t_14 == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 374, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __pyx_v_L = __pyx_t_14;
 
-static void __pyx_tp_dealloc_18isf_pandas_msgpack_7msgpack_7_packer_Packer(PyObject *o) {
-  struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *p = (struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)o;
-  #if CYTHON_USE_TP_FINALIZE
-  if (unlikely((PY_VERSION_HEX >= 0x03080000 || __Pyx_PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE)) && __Pyx_PyObject_GetSlot(o, tp_finalize, destructor)) && !__Pyx_PyObject_GC_IsFinalized(o)) {
-    if (__Pyx_PyObject_GetSlot(o, tp_dealloc, destructor) == __pyx_tp_dealloc_18isf_pandas_msgpack_7msgpack_7_packer_Packer) {
-      if (PyObject_CallFinalizerFromDealloc(o)) return;
-    }
-  }
-  #endif
-  PyObject_GC_UnTrack(o);
-  {
-    PyObject *etype, *eval, *etb;
-    PyErr_Fetch(&etype, &eval, &etb);
-    __Pyx_SET_REFCNT(o, Py_REFCNT(o) + 1);
-    __pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_5__dealloc__(o);
-    __Pyx_SET_REFCNT(o, Py_REFCNT(o) - 1);
-    PyErr_Restore(etype, eval, etb);
-  }
-  __Pyx_call_destructor(p->pk);
-  Py_CLEAR(p->_default);
-  Py_CLEAR(p->_bencoding);
-  Py_CLEAR(p->_berrors);
-  Py_CLEAR(p->use_float);
-  #if CYTHON_USE_TYPE_SLOTS || CYTHON_COMPILING_IN_PYPY
-  (*Py_TYPE(o)->tp_free)(o);
-  #else
-  {
-    freefunc tp_free = (freefunc)PyType_GetSlot(Py_TYPE(o), Py_tp_free);
-    if (tp_free) tp_free(o);
-  }
-  #endif
-}
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":373
+ *                 encoded = encoded or default_used
+ *                 pad = self.align and encoded
+ *                 if pad:             # <<<<<<<<<<<<<<
+ *                     L += sum(self._aligns(k, v) for k, v in o.items())
+ *                 if L > (2**32) - 1:
+ */
+      }
 
-static int __pyx_tp_traverse_18isf_pandas_msgpack_7msgpack_7_packer_Packer(PyObject *o, visitproc v, void *a) {
-  int e;
-  struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *p = (struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)o;
-  if (p->_default) {
-    e = (*v)(p->_default, a); if (e) return e;
-  }
-  if (p->_bencoding) {
-    e = (*v)(p->_bencoding, a); if (e) return e;
-  }
-  if (p->_berrors) {
-    e = (*v)(p->_berrors, a); if (e) return e;
-  }
-  if (p->use_float) {
-    e = (*v)(((PyObject *)p->use_float), a); if (e) return e;
-  }
-  return 0;
-}
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":375
+ *                 if pad:
+ *                     L += sum(self._aligns(k, v) for k, v in o.items())
+ *                 if L > (2**32) - 1:             # <<<<<<<<<<<<<<
+ *                     raise ValueError("dict is too large")
+ *                 ret = msgpack_pack_map(&self.pk, L)
+ */
+      __pyx_t_2 = __Pyx_PyInt_FromSize_t(__pyx_v_L); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 375, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_3 = PyObject_RichCompare(__pyx_t_2, __pyx_int_4294967295, Py_GT); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 375, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 375, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      if (unlikely(__pyx_t_1)) {
 
-static int __pyx_tp_clear_18isf_pandas_msgpack_7msgpack_7_packer_Packer(PyObject *o) {
-  PyObject* tmp;
-  struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *p = (struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)o;
-  tmp = ((PyObject*)p->_default);
-  p->_default = Py_None; Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  tmp = ((PyObject*)p->_bencoding);
-  p->_bencoding = Py_None; Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  tmp = ((PyObject*)p->_berrors);
-  p->_berrors = Py_None; Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  tmp = ((PyObject*)p->use_float);
-  p->use_float = ((PyBoolObject *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  return 0;
-}
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":376
+ *                     L += sum(self._aligns(k, v) for k, v in o.items())
+ *                 if L > (2**32) - 1:
+ *                     raise ValueError("dict is too large")             # <<<<<<<<<<<<<<
+ *                 ret = msgpack_pack_map(&self.pk, L)
+ *                 if ret == 0:
+ */
+        __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 376, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __PYX_ERR(0, 376, __pyx_L1_error)
 
-static PyMethodDef __pyx_methods_18isf_pandas_msgpack_7msgpack_7_packer_Packer[] = {
-  {"pack_ext_type", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_9pack_ext_type, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_8pack_ext_type},
-  {"pack_array_header", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_11pack_array_header, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_10pack_array_header},
-  {"pack_map_header", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_13pack_map_header, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_12pack_map_header},
-  {"pack_map_pairs", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_15pack_map_pairs, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_14pack_map_pairs},
-  {"reset", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_17reset, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_16reset},
-  {"bytes", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_19bytes, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_18bytes},
-  {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_21__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_20__reduce_cython__},
-  {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_23__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_22__setstate_cython__},
-  {0, 0, 0, 0}
-};
-#if CYTHON_USE_TYPE_SPECS
-static PyType_Slot __pyx_type_18isf_pandas_msgpack_7msgpack_7_packer_Packer_slots[] = {
-  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_18isf_pandas_msgpack_7msgpack_7_packer_Packer},
-  {Py_tp_doc, (void *)PyDoc_STR("Packer(default=None, encoding='utf-8', unicode_errors='strict', use_single_float=False, bool autoreset=1, bool use_bin_type=0)\n\n    MessagePack Packer\n\n    usage::\n\n        packer = Packer()\n        astream.write(packer.pack(a))\n        astream.write(packer.pack(b))\n\n    Packer's constructor has some keyword arguments:\n\n    :param callable default:\n        Convert user type to builtin type that Packer supports.\n        See also simplejson's document.\n    :param str encoding:\n        Convert unicode to bytes with this encoding. (default: 'utf-8')\n    :param str unicode_errors:\n        Error handler for encoding unicode. (default: 'strict')\n    :param bool use_single_float:\n        Use single precision float type for float. (default: False)\n    :param bool autoreset:\n        Reset buffer after each pack and return it's\n        content as `bytes`. (default: True).\n        If set this to false, use `bytes()` to get\n        content and `.reset()` to clear buffer.\n    :param bool use_bin_type:\n        Use bin type introduced in msgpack spec 2.0 for bytes.\n        It also enable str8 type for unicode.\n    ")},
-  {Py_tp_traverse, (void *)__pyx_tp_traverse_18isf_pandas_msgpack_7msgpack_7_packer_Packer},
-  {Py_tp_clear, (void *)__pyx_tp_clear_18isf_pandas_msgpack_7msgpack_7_packer_Packer},
-  {Py_tp_methods, (void *)__pyx_methods_18isf_pandas_msgpack_7msgpack_7_packer_Packer},
-  {Py_tp_init, (void *)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_3__init__},
-  {Py_tp_new, (void *)__pyx_tp_new_18isf_pandas_msgpack_7msgpack_7_packer_Packer},
-  {0, 0},
-};
-static PyType_Spec __pyx_type_18isf_pandas_msgpack_7msgpack_7_packer_Packer_spec = {
-  "isf_pandas_msgpack.msgpack._packer.Packer",
-  sizeof(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer),
-  0,
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC,
-  __pyx_type_18isf_pandas_msgpack_7msgpack_7_packer_Packer_slots,
-};
-#else
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":375
+ *                 if pad:
+ *                     L += sum(self._aligns(k, v) for k, v in o.items())
+ *                 if L > (2**32) - 1:             # <<<<<<<<<<<<<<
+ *                     raise ValueError("dict is too large")
+ *                 ret = msgpack_pack_map(&self.pk, L)
+ */
+      }
 
-static PyTypeObject __pyx_type_18isf_pandas_msgpack_7msgpack_7_packer_Packer = {
-  PyVarObject_HEAD_INIT(0, 0)
-  "isf_pandas_msgpack.msgpack._packer.""Packer", /*tp_name*/
-  sizeof(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer), /*tp_basicsize*/
-  0, /*tp_itemsize*/
-  __pyx_tp_dealloc_18isf_pandas_msgpack_7msgpack_7_packer_Packer, /*tp_dealloc*/
-  #if PY_VERSION_HEX < 0x030800b4
-  0, /*tp_print*/
-  #endif
-  #if PY_VERSION_HEX >= 0x030800b4
-  0, /*tp_vectorcall_offset*/
-  #endif
-  0, /*tp_getattr*/
-  0, /*tp_setattr*/
-  #if PY_MAJOR_VERSION < 3
-  0, /*tp_compare*/
-  #endif
-  #if PY_MAJOR_VERSION >= 3
-  0, /*tp_as_async*/
-  #endif
-  0, /*tp_repr*/
-  0, /*tp_as_number*/
-  0, /*tp_as_sequence*/
-  0, /*tp_as_mapping*/
-  0, /*tp_hash*/
-  0, /*tp_call*/
-  0, /*tp_str*/
-  0, /*tp_getattro*/
-  0, /*tp_setattro*/
-  0, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  PyDoc_STR("Packer(default=None, encoding='utf-8', unicode_errors='strict', use_single_float=False, bool autoreset=1, bool use_bin_type=0)\n\n    MessagePack Packer\n\n    usage::\n\n        packer = Packer()\n        astream.write(packer.pack(a))\n        astream.write(packer.pack(b))\n\n    Packer's constructor has some keyword arguments:\n\n    :param callable default:\n        Convert user type to builtin type that Packer supports.\n        See also simplejson's document.\n    :param str encoding:\n        Convert unicode to bytes with this encoding. (default: 'utf-8')\n    :param str unicode_errors:\n        Error handler for encoding unicode. (default: 'strict')\n    :param bool use_single_float:\n        Use single precision float type for float. (default: False)\n    :param bool autoreset:\n        Reset buffer after each pack and return it's\n        content as `bytes`. (default: True).\n        If set this to false, use `bytes()` to get\n        content and `.reset()` to clear buffer.\n    :param bool use_bin_type:\n        Use bin type introduced in msgpack spec 2.0 for bytes.\n        It also enable str8 type for unicode.\n    "), /*tp_doc*/
-  __pyx_tp_traverse_18isf_pandas_msgpack_7msgpack_7_packer_Packer, /*tp_traverse*/
-  __pyx_tp_clear_18isf_pandas_msgpack_7msgpack_7_packer_Packer, /*tp_clear*/
-  0, /*tp_richcompare*/
-  0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_18isf_pandas_msgpack_7msgpack_7_packer_Packer, /*tp_methods*/
-  0, /*tp_members*/
-  0, /*tp_getset*/
-  0, /*tp_base*/
-  0, /*tp_dict*/
-  0, /*tp_descr_get*/
-  0, /*tp_descr_set*/
-  #if !CYTHON_USE_TYPE_SPECS
-  0, /*tp_dictoffset*/
-  #endif
-  __pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_3__init__, /*tp_init*/
-  0, /*tp_alloc*/
-  __pyx_tp_new_18isf_pandas_msgpack_7msgpack_7_packer_Packer, /*tp_new*/
-  0, /*tp_free*/
-  0, /*tp_is_gc*/
-  0, /*tp_bases*/
-  0, /*tp_mro*/
-  0, /*tp_cache*/
-  0, /*tp_subclasses*/
-  0, /*tp_weaklist*/
-  0, /*tp_del*/
-  0, /*tp_version_tag*/
-  #if PY_VERSION_HEX >= 0x030400a1
-  #if CYTHON_USE_TP_FINALIZE
-  0, /*tp_finalize*/
-  #else
-  NULL, /*tp_finalize*/
-  #endif
-  #endif
-  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
-  0, /*tp_vectorcall*/
-  #endif
-  #if __PYX_NEED_TP_PRINT_SLOT == 1
-  0, /*tp_print*/
-  #endif
-  #if PY_VERSION_HEX >= 0x030C0000
-  0, /*tp_watched*/
-  #endif
-  #if PY_VERSION_HEX >= 0x030d00A4
-  0, /*tp_versions_used*/
-  #endif
-  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
-  0, /*tp_pypy_flags*/
-  #endif
-};
-#endif
-
-static PyMethodDef __pyx_methods[] = {
-  {0, 0, 0, 0}
-};
-#ifndef CYTHON_SMALL_CODE
-#if defined(__clang__)
-    #define CYTHON_SMALL_CODE
-#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
-    #define CYTHON_SMALL_CODE __attribute__((cold))
-#else
-    #define CYTHON_SMALL_CODE
-#endif
-#endif
-/* #### Code section: pystring_table ### */
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":377
+ *                 if L > (2**32) - 1:
+ *                     raise ValueError("dict is too large")
+ *                 ret = msgpack_pack_map(&self.pk, L)             # <<<<<<<<<<<<<<
+ *                 if ret == 0:
+ *                     for k, v in o.items():
+ */
+      __pyx_v_ret = msgpack_pack_map((&__pyx_cur_scope->__pyx_v_self->pk), __pyx_v_L);
 
-static int __Pyx_CreateStringTabAndInitStrings(void) {
-  __Pyx_StringTabEntry __pyx_string_tab[] = {
-    {&__pyx_kp_s_Can_t_encode_unicode_string_no_e, __pyx_k_Can_t_encode_unicode_string_no_e, sizeof(__pyx_k_Can_t_encode_unicode_string_no_e), 0, 0, 1, 0},
-    {&__pyx_kp_s_EXT_data_is_too_large, __pyx_k_EXT_data_is_too_large, sizeof(__pyx_k_EXT_data_is_too_large), 0, 0, 1, 0},
-    {&__pyx_n_s_ExtType, __pyx_k_ExtType, sizeof(__pyx_k_ExtType), 0, 0, 1, 1},
-    {&__pyx_n_s_MemoryError, __pyx_k_MemoryError, sizeof(__pyx_k_MemoryError), 0, 0, 1, 1},
-    {&__pyx_n_s_PackValueError, __pyx_k_PackValueError, sizeof(__pyx_k_PackValueError), 0, 0, 1, 1},
-    {&__pyx_n_s_Packer, __pyx_k_Packer, sizeof(__pyx_k_Packer), 0, 0, 1, 1},
-    {&__pyx_n_s_Packer___reduce_cython, __pyx_k_Packer___reduce_cython, sizeof(__pyx_k_Packer___reduce_cython), 0, 0, 1, 1},
-    {&__pyx_n_s_Packer___setstate_cython, __pyx_k_Packer___setstate_cython, sizeof(__pyx_k_Packer___setstate_cython), 0, 0, 1, 1},
-    {&__pyx_n_s_Packer_bytes, __pyx_k_Packer_bytes, sizeof(__pyx_k_Packer_bytes), 0, 0, 1, 1},
-    {&__pyx_n_s_Packer_pack, __pyx_k_Packer_pack, sizeof(__pyx_k_Packer_pack), 0, 0, 1, 1},
-    {&__pyx_n_s_Packer_pack_array_header, __pyx_k_Packer_pack_array_header, sizeof(__pyx_k_Packer_pack_array_header), 0, 0, 1, 1},
-    {&__pyx_n_s_Packer_pack_ext_type, __pyx_k_Packer_pack_ext_type, sizeof(__pyx_k_Packer_pack_ext_type), 0, 0, 1, 1},
-    {&__pyx_n_s_Packer_pack_map_header, __pyx_k_Packer_pack_map_header, sizeof(__pyx_k_Packer_pack_map_header), 0, 0, 1, 1},
-    {&__pyx_n_s_Packer_pack_map_pairs, __pyx_k_Packer_pack_map_pairs, sizeof(__pyx_k_Packer_pack_map_pairs), 0, 0, 1, 1},
-    {&__pyx_n_s_Packer_reset, __pyx_k_Packer_reset, sizeof(__pyx_k_Packer_reset), 0, 0, 1, 1},
-    {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
-    {&__pyx_kp_s_Unable_to_allocate_internal_buff, __pyx_k_Unable_to_allocate_internal_buff, sizeof(__pyx_k_Unable_to_allocate_internal_buff), 0, 0, 1, 0},
-    {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
-    {&__pyx_n_s__10, __pyx_k__10, sizeof(__pyx_k__10), 0, 0, 1, 1},
-    {&__pyx_n_s__26, __pyx_k__26, sizeof(__pyx_k__26), 0, 0, 1, 1},
-    {&__pyx_kp_u__9, __pyx_k__9, sizeof(__pyx_k__9), 0, 1, 0, 0},
-    {&__pyx_n_s_ascii, __pyx_k_ascii, sizeof(__pyx_k_ascii), 0, 0, 1, 1},
-    {&__pyx_n_s_asyncio_coroutines, __pyx_k_asyncio_coroutines, sizeof(__pyx_k_asyncio_coroutines), 0, 0, 1, 1},
-    {&__pyx_n_s_autoreset, __pyx_k_autoreset, sizeof(__pyx_k_autoreset), 0, 0, 1, 1},
-    {&__pyx_n_s_buf, __pyx_k_buf, sizeof(__pyx_k_buf), 0, 0, 1, 1},
-    {&__pyx_n_s_bytes, __pyx_k_bytes, sizeof(__pyx_k_bytes), 0, 0, 1, 1},
-    {&__pyx_kp_s_bytes_is_too_large, __pyx_k_bytes_is_too_large, sizeof(__pyx_k_bytes_is_too_large), 0, 0, 1, 0},
-    {&__pyx_kp_s_can_t_serialize_r, __pyx_k_can_t_serialize_r, sizeof(__pyx_k_can_t_serialize_r), 0, 0, 1, 0},
-    {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
-    {&__pyx_n_s_code, __pyx_k_code, sizeof(__pyx_k_code), 0, 0, 1, 1},
-    {&__pyx_n_s_data, __pyx_k_data, sizeof(__pyx_k_data), 0, 0, 1, 1},
-    {&__pyx_n_s_default, __pyx_k_default, sizeof(__pyx_k_default), 0, 0, 1, 1},
-    {&__pyx_kp_s_default_must_be_a_callable, __pyx_k_default_must_be_a_callable, sizeof(__pyx_k_default_must_be_a_callable), 0, 0, 1, 0},
-    {&__pyx_kp_s_dict_is_too_large, __pyx_k_dict_is_too_large, sizeof(__pyx_k_dict_is_too_large), 0, 0, 1, 0},
-    {&__pyx_kp_u_disable, __pyx_k_disable, sizeof(__pyx_k_disable), 0, 1, 0, 0},
-    {&__pyx_kp_u_enable, __pyx_k_enable, sizeof(__pyx_k_enable), 0, 1, 0, 0},
-    {&__pyx_n_s_encode, __pyx_k_encode, sizeof(__pyx_k_encode), 0, 0, 1, 1},
-    {&__pyx_n_s_encoding, __pyx_k_encoding, sizeof(__pyx_k_encoding), 0, 0, 1, 1},
-    {&__pyx_n_s_exceptions, __pyx_k_exceptions, sizeof(__pyx_k_exceptions), 0, 0, 1, 1},
-    {&__pyx_kp_u_gc, __pyx_k_gc, sizeof(__pyx_k_gc), 0, 1, 0, 0},
-    {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
-    {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
-    {&__pyx_n_s_is_coroutine, __pyx_k_is_coroutine, sizeof(__pyx_k_is_coroutine), 0, 0, 1, 1},
-    {&__pyx_kp_u_isenabled, __pyx_k_isenabled, sizeof(__pyx_k_isenabled), 0, 1, 0, 0},
-    {&__pyx_kp_s_isf_pandas_msgpack_msgpack__pack, __pyx_k_isf_pandas_msgpack_msgpack__pack, sizeof(__pyx_k_isf_pandas_msgpack_msgpack__pack), 0, 0, 1, 0},
-    {&__pyx_n_s_isf_pandas_msgpack_msgpack__pack_2, __pyx_k_isf_pandas_msgpack_msgpack__pack_2, sizeof(__pyx_k_isf_pandas_msgpack_msgpack__pack_2), 0, 0, 1, 1},
-    {&__pyx_n_s_items, __pyx_k_items, sizeof(__pyx_k_items), 0, 0, 1, 1},
-    {&__pyx_n_s_iteritems, __pyx_k_iteritems, sizeof(__pyx_k_iteritems), 0, 0, 1, 1},
-    {&__pyx_n_s_k, __pyx_k_k, sizeof(__pyx_k_k), 0, 0, 1, 1},
-    {&__pyx_kp_s_list_is_too_large, __pyx_k_list_is_too_large, sizeof(__pyx_k_list_is_too_large), 0, 0, 1, 0},
-    {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
-    {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
-    {&__pyx_kp_s_no_default___reduce___due_to_non, __pyx_k_no_default___reduce___due_to_non, sizeof(__pyx_k_no_default___reduce___due_to_non), 0, 0, 1, 0},
-    {&__pyx_n_s_obj, __pyx_k_obj, sizeof(__pyx_k_obj), 0, 0, 1, 1},
-    {&__pyx_n_s_pack, __pyx_k_pack, sizeof(__pyx_k_pack), 0, 0, 1, 1},
-    {&__pyx_n_s_pack_array_header, __pyx_k_pack_array_header, sizeof(__pyx_k_pack_array_header), 0, 0, 1, 1},
-    {&__pyx_n_s_pack_ext_type, __pyx_k_pack_ext_type, sizeof(__pyx_k_pack_ext_type), 0, 0, 1, 1},
-    {&__pyx_n_s_pack_map_header, __pyx_k_pack_map_header, sizeof(__pyx_k_pack_map_header), 0, 0, 1, 1},
-    {&__pyx_n_s_pack_map_pairs, __pyx_k_pack_map_pairs, sizeof(__pyx_k_pack_map_pairs), 0, 0, 1, 1},
-    {&__pyx_n_s_pairs, __pyx_k_pairs, sizeof(__pyx_k_pairs), 0, 0, 1, 1},
-    {&__pyx_n_s_pyx_state, __pyx_k_pyx_state, sizeof(__pyx_k_pyx_state), 0, 0, 1, 1},
-    {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
-    {&__pyx_kp_s_recursion_limit_exceeded, __pyx_k_recursion_limit_exceeded, sizeof(__pyx_k_recursion_limit_exceeded), 0, 0, 1, 0},
-    {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
-    {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
-    {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
-    {&__pyx_n_s_reset, __pyx_k_reset, sizeof(__pyx_k_reset), 0, 0, 1, 1},
-    {&__pyx_n_s_ret, __pyx_k_ret, sizeof(__pyx_k_ret), 0, 0, 1, 1},
-    {&__pyx_n_s_self, __pyx_k_self, sizeof(__pyx_k_self), 0, 0, 1, 1},
-    {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
-    {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
-    {&__pyx_n_s_size, __pyx_k_size, sizeof(__pyx_k_size), 0, 0, 1, 1},
-    {&__pyx_n_s_strict, __pyx_k_strict, sizeof(__pyx_k_strict), 0, 0, 1, 1},
-    {&__pyx_kp_s_stringsource, __pyx_k_stringsource, sizeof(__pyx_k_stringsource), 0, 0, 1, 0},
-    {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
-    {&__pyx_n_s_typecode, __pyx_k_typecode, sizeof(__pyx_k_typecode), 0, 0, 1, 1},
-    {&__pyx_n_s_unicode_errors, __pyx_k_unicode_errors, sizeof(__pyx_k_unicode_errors), 0, 0, 1, 1},
-    {&__pyx_n_s_use_bin_type, __pyx_k_use_bin_type, sizeof(__pyx_k_use_bin_type), 0, 0, 1, 1},
-    {&__pyx_n_s_use_single_float, __pyx_k_use_single_float, sizeof(__pyx_k_use_single_float), 0, 0, 1, 1},
-    {&__pyx_kp_s_utf_8, __pyx_k_utf_8, sizeof(__pyx_k_utf_8), 0, 0, 1, 0},
-    {&__pyx_n_s_v, __pyx_k_v, sizeof(__pyx_k_v), 0, 0, 1, 1},
-    {0, 0, 0, 0, 0, 0, 0}
-  };
-  return __Pyx_InitStrings(__pyx_string_tab);
-}
-/* #### Code section: cached_builtins ### */
-static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(0, 83, __pyx_L1_error)
-  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(0, 97, __pyx_L1_error)
-  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 163, __pyx_L1_error)
-  return 0;
-  __pyx_L1_error:;
-  return -1;
-}
-/* #### Code section: cached_constants ### */
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":378
+ *                     raise ValueError("dict is too large")
+ *                 ret = msgpack_pack_map(&self.pk, L)
+ *                 if ret == 0:             # <<<<<<<<<<<<<<
+ *                     for k, v in o.items():
+ *                         if pad and self._aligns(k, v):
+ */
+      __pyx_t_1 = (__pyx_v_ret == 0);
+      if (__pyx_t_1) {
 
-static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":379
+ *                 ret = msgpack_pack_map(&self.pk, L)
+ *                 if ret == 0:
+ *                     for k, v in o.items():             # <<<<<<<<<<<<<<
+ *                         if pad and self._aligns(k, v):
+ *                             ret = self._pack_padding(k, v)
+ */
+        __pyx_t_15 = 0;
+        if (unlikely(__pyx_v_o == Py_None)) {
+          PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "items");
+          __PYX_ERR(0, 379, __pyx_L1_error)
+        }
+        __pyx_t_2 = __Pyx_dict_iterator(__pyx_v_o, 0, __pyx_n_s_items, (&__pyx_t_12), (&__pyx_t_16)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 379, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_XDECREF(__pyx_t_3);
+        __pyx_t_3 = __pyx_t_2;
+        __pyx_t_2 = 0;
+        while (1) {
+          __pyx_t_17 = __Pyx_dict_iter_next(__pyx_t_3, __pyx_t_12, &__pyx_t_15, &__pyx_t_2, &__pyx_t_4, NULL, __pyx_t_16);
+          if (unlikely(__pyx_t_17 == 0)) break;
+          if (unlikely(__pyx_t_17 == -1)) __PYX_ERR(0, 379, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_GOTREF(__pyx_t_4);
+          __Pyx_XDECREF_SET(__pyx_v_k, __pyx_t_2);
+          __pyx_t_2 = 0;
+          __Pyx_XDECREF_SET(__pyx_v_v, __pyx_t_4);
+          __pyx_t_4 = 0;
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":83
- *         self.pk.buf = <char*> malloc(buf_size)
- *         if self.pk.buf == NULL:
- *             raise MemoryError("Unable to allocate internal buffer.")             # <<<<<<<<<<<<<<
- *         self.pk.buf_size = buf_size
- *         self.pk.length = 0
+          /* "isf_pandas_msgpack/msgpack/_packer.pyx":380
+ *                 if ret == 0:
+ *                     for k, v in o.items():
+ *                         if pad and self._aligns(k, v):             # <<<<<<<<<<<<<<
+ *                             ret = self._pack_padding(k, v)
+ *                             if ret != 0: break
  */
-  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_s_Unable_to_allocate_internal_buff); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 83, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple_);
-  __Pyx_GIVEREF(__pyx_tuple_);
+          if (__pyx_v_pad) {
+          } else {
+            __pyx_t_1 = __pyx_v_pad;
+            goto __pyx_L43_bool_binop_done;
+          }
+          __pyx_t_6 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_cur_scope->__pyx_v_self->__pyx_vtab)->_aligns(__pyx_cur_scope->__pyx_v_self, __pyx_v_k, __pyx_v_v); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 380, __pyx_L1_error)
+          __pyx_t_1 = __pyx_t_6;
+          __pyx_L43_bool_binop_done:;
+          if (__pyx_t_1) {
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":97
- *         if default is not None:
- *             if not PyCallable_Check(default):
- *                 raise TypeError("default must be a callable.")             # <<<<<<<<<<<<<<
- *         self._default = default
- *         if encoding is None:
+            /* "isf_pandas_msgpack/msgpack/_packer.pyx":381
+ *                     for k, v in o.items():
+ *                         if pad and self._aligns(k, v):
+ *                             ret = self._pack_padding(k, v)             # <<<<<<<<<<<<<<
+ *                             if ret != 0: break
+ *                         ret = self._pack(k, nest_limit - 1, encoded)
+ */
+            __pyx_t_17 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_cur_scope->__pyx_v_self->__pyx_vtab)->_pack_padding(__pyx_cur_scope->__pyx_v_self, __pyx_v_k, __pyx_v_v); if (unlikely(__pyx_t_17 == ((int)-1))) __PYX_ERR(0, 381, __pyx_L1_error)
+            __pyx_v_ret = __pyx_t_17;
+
+            /* "isf_pandas_msgpack/msgpack/_packer.pyx":382
+ *                         if pad and self._aligns(k, v):
+ *                             ret = self._pack_padding(k, v)
+ *                             if ret != 0: break             # <<<<<<<<<<<<<<
+ *                         ret = self._pack(k, nest_limit - 1, encoded)
+ *                         if ret != 0: break
  */
-  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_s_default_must_be_a_callable); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 97, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__2);
-  __Pyx_GIVEREF(__pyx_tuple__2);
+            __pyx_t_1 = (__pyx_v_ret != 0);
+            if (__pyx_t_1) {
+              goto __pyx_L41_break;
+            }
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":163
- *                 L = len(o)
- *                 if L > (2**32) - 1:
- *                     raise ValueError("bytes is too large")             # <<<<<<<<<<<<<<
- *                 rawval = o
- *                 ret = msgpack_pack_bin(&self.pk, L)
+            /* "isf_pandas_msgpack/msgpack/_packer.pyx":380
+ *                 if ret == 0:
+ *                     for k, v in o.items():
+ *                         if pad and self._aligns(k, v):             # <<<<<<<<<<<<<<
+ *                             ret = self._pack_padding(k, v)
+ *                             if ret != 0: break
  */
-  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_s_bytes_is_too_large); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 163, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__4);
-  __Pyx_GIVEREF(__pyx_tuple__4);
+          }
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":170
- *             elif PyUnicode_Check(o):
- *                 if not self.encoding:
- *                     raise TypeError("Can't encode unicode string: "             # <<<<<<<<<<<<<<
- *                                     "no encoding is specified")
- *                 o = PyUnicode_AsEncodedString(o, self.encoding,
+          /* "isf_pandas_msgpack/msgpack/_packer.pyx":383
+ *                             ret = self._pack_padding(k, v)
+ *                             if ret != 0: break
+ *                         ret = self._pack(k, nest_limit - 1, encoded)             # <<<<<<<<<<<<<<
+ *                         if ret != 0: break
+ *                         ret = self._pack(v, nest_limit - 1, encoded)
  */
-  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_s_Can_t_encode_unicode_string_no_e); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(0, 170, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__5);
-  __Pyx_GIVEREF(__pyx_tuple__5);
+          __pyx_t_18.__pyx_n = 2;
+          __pyx_t_18.nest_limit = (__pyx_v_nest_limit - 1);
+          __pyx_t_18.encoded = __pyx_v_encoded;
+          __pyx_t_17 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_cur_scope->__pyx_v_self->__pyx_vtab)->_pack(__pyx_cur_scope->__pyx_v_self, __pyx_v_k, &__pyx_t_18); if (unlikely(__pyx_t_17 == ((int)-1))) __PYX_ERR(0, 383, __pyx_L1_error)
+          __pyx_v_ret = __pyx_t_17;
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":176
- *                 L = len(o)
- *                 if L > (2**32) - 1:
- *                     raise ValueError("dict is too large")             # <<<<<<<<<<<<<<
- *                 rawval = o
- *                 ret = msgpack_pack_raw(&self.pk, len(o))
+          /* "isf_pandas_msgpack/msgpack/_packer.pyx":384
+ *                             if ret != 0: break
+ *                         ret = self._pack(k, nest_limit - 1, encoded)
+ *                         if ret != 0: break             # <<<<<<<<<<<<<<
+ *                         ret = self._pack(v, nest_limit - 1, encoded)
+ *                         if ret != 0: break
  */
-  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_s_dict_is_too_large); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 176, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__6);
-  __Pyx_GIVEREF(__pyx_tuple__6);
+          __pyx_t_1 = (__pyx_v_ret != 0);
+          if (__pyx_t_1) {
+            goto __pyx_L41_break;
+          }
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":210
- *                 L = len(o.data)
- *                 if L > (2**32) - 1:
- *                     raise ValueError("EXT data is too large")             # <<<<<<<<<<<<<<
- *                 ret = msgpack_pack_ext(&self.pk, longval, L)
- *                 ret = msgpack_pack_raw_body(&self.pk, rawval, L)
+          /* "isf_pandas_msgpack/msgpack/_packer.pyx":385
+ *                         ret = self._pack(k, nest_limit - 1, encoded)
+ *                         if ret != 0: break
+ *                         ret = self._pack(v, nest_limit - 1, encoded)             # <<<<<<<<<<<<<<
+ *                         if ret != 0: break
+ *             elif isinstance(o, ExtType):
  */
-  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_kp_s_EXT_data_is_too_large); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(0, 210, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__7);
-  __Pyx_GIVEREF(__pyx_tuple__7);
+          __pyx_t_18.__pyx_n = 2;
+          __pyx_t_18.nest_limit = (__pyx_v_nest_limit - 1);
+          __pyx_t_18.encoded = __pyx_v_encoded;
+          __pyx_t_17 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_cur_scope->__pyx_v_self->__pyx_vtab)->_pack(__pyx_cur_scope->__pyx_v_self, __pyx_v_v, &__pyx_t_18); if (unlikely(__pyx_t_17 == ((int)-1))) __PYX_ERR(0, 385, __pyx_L1_error)
+          __pyx_v_ret = __pyx_t_17;
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":216
- *                 L = len(o)
- *                 if L > (2**32) - 1:
- *                     raise ValueError("list is too large")             # <<<<<<<<<<<<<<
- *                 ret = msgpack_pack_array(&self.pk, L)
- *                 if ret == 0:
+          /* "isf_pandas_msgpack/msgpack/_packer.pyx":386
+ *                         if ret != 0: break
+ *                         ret = self._pack(v, nest_limit - 1, encoded)
+ *                         if ret != 0: break             # <<<<<<<<<<<<<<
+ *             elif isinstance(o, ExtType):
+ *                 # This should be before Tuple because ExtType is namedtuple.
  */
-  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_kp_s_list_is_too_large); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(0, 216, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__8);
-  __Pyx_GIVEREF(__pyx_tuple__8);
+          __pyx_t_1 = (__pyx_v_ret != 0);
+          if (__pyx_t_1) {
+            goto __pyx_L41_break;
+          }
+        }
+        __pyx_L41_break:;
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":230
- *             return ret
- * 
- *     cpdef pack(self, object obj):             # <<<<<<<<<<<<<<
- *         cdef int ret
- *         ret = self._pack(obj, DEFAULT_RECURSE_LIMIT)
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":378
+ *                     raise ValueError("dict is too large")
+ *                 ret = msgpack_pack_map(&self.pk, L)
+ *                 if ret == 0:             # <<<<<<<<<<<<<<
+ *                     for k, v in o.items():
+ *                         if pad and self._aligns(k, v):
  */
-  __pyx_tuple__11 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_obj); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(0, 230, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__11);
-  __Pyx_GIVEREF(__pyx_tuple__11);
-  __pyx_codeobj__12 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__11, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__pack, __pyx_n_s_pack, 230, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__12)) __PYX_ERR(0, 230, __pyx_L1_error)
+      }
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":242
- *             return buf
- * 
- *     def pack_ext_type(self, typecode, data):             # <<<<<<<<<<<<<<
- *         msgpack_pack_ext(&self.pk, typecode, len(data))
- *         msgpack_pack_raw_body(&self.pk, data, len(data))
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":369
+ *                         ret = self._pack(v, nest_limit - 1, encoded)
+ *                         if ret != 0: break
+ *             elif PyDict_Check(o):             # <<<<<<<<<<<<<<
+ *                 L = len(o)
+ *                 encoded = encoded or default_used
  */
-  __pyx_tuple__13 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_typecode, __pyx_n_s_data); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(0, 242, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__13);
-  __Pyx_GIVEREF(__pyx_tuple__13);
-  __pyx_codeobj__14 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__pack, __pyx_n_s_pack_ext_type, 242, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__14)) __PYX_ERR(0, 242, __pyx_L1_error)
+      goto __pyx_L9;
+    }
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":246
- *         msgpack_pack_raw_body(&self.pk, data, len(data))
- * 
- *     def pack_array_header(self, size_t size):             # <<<<<<<<<<<<<<
- *         if size > (2**32) - 1:
- *             raise ValueError
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":387
+ *                         ret = self._pack(v, nest_limit - 1, encoded)
+ *                         if ret != 0: break
+ *             elif isinstance(o, ExtType):             # <<<<<<<<<<<<<<
+ *                 # This should be before Tuple because ExtType is namedtuple.
+ *                 longval = o.code
  */
-  __pyx_tuple__15 = PyTuple_Pack(4, __pyx_n_s_self, __pyx_n_s_size, __pyx_n_s_ret, __pyx_n_s_buf); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(0, 246, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__15);
-  __Pyx_GIVEREF(__pyx_tuple__15);
-  __pyx_codeobj__16 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__15, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__pack, __pyx_n_s_pack_array_header, 246, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__16)) __PYX_ERR(0, 246, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_ExtType); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 387, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_1 = PyObject_IsInstance(__pyx_v_o, __pyx_t_3); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 387, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (__pyx_t_1) {
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":259
- *             return buf
- * 
- *     def pack_map_header(self, size_t size):             # <<<<<<<<<<<<<<
- *         if size > (2**32) - 1:
- *             raise ValueError
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":389
+ *             elif isinstance(o, ExtType):
+ *                 # This should be before Tuple because ExtType is namedtuple.
+ *                 longval = o.code             # <<<<<<<<<<<<<<
+ *                 PyObject_GetBuffer(o.data, &view, PyBUF_C_CONTIGUOUS)
+ *                 try:
  */
-  __pyx_codeobj__17 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__15, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__pack, __pyx_n_s_pack_map_header, 259, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__17)) __PYX_ERR(0, 259, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_o, __pyx_n_s_code); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 389, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_9 = __Pyx_PyInt_As_long(__pyx_t_3); if (unlikely((__pyx_t_9 == (long)-1) && PyErr_Occurred())) __PYX_ERR(0, 389, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_v_longval = __pyx_t_9;
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":272
- *             return buf
- * 
- *     def pack_map_pairs(self, object pairs):             # <<<<<<<<<<<<<<
- *         """
- *         Pack *pairs* as msgpack map type.
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":390
+ *                 # This should be before Tuple because ExtType is namedtuple.
+ *                 longval = o.code
+ *                 PyObject_GetBuffer(o.data, &view, PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
+ *                 try:
+ *                     L = view.len
  */
-  __pyx_tuple__18 = PyTuple_Pack(6, __pyx_n_s_self, __pyx_n_s_pairs, __pyx_n_s_ret, __pyx_n_s_k, __pyx_n_s_v, __pyx_n_s_buf); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(0, 272, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__18);
-  __Pyx_GIVEREF(__pyx_tuple__18);
-  __pyx_codeobj__19 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 6, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__pack, __pyx_n_s_pack_map_pairs, 272, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__19)) __PYX_ERR(0, 272, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_o, __pyx_n_s_data); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 390, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_16 = PyObject_GetBuffer(__pyx_t_3, (&__pyx_v_view), PyBUF_C_CONTIGUOUS); if (unlikely(__pyx_t_16 == ((int)-1))) __PYX_ERR(0, 390, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":295
- *             return buf
- * 
- *     def reset(self):             # <<<<<<<<<<<<<<
- *         """Clear internal buffer."""
- *         self.pk.length = 0
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":391
+ *                 longval = o.code
+ *                 PyObject_GetBuffer(o.data, &view, PyBUF_C_CONTIGUOUS)
+ *                 try:             # <<<<<<<<<<<<<<
+ *                     L = view.len
+ *                     if L > (2**32) - 1:
+ */
+      /*try:*/ {
+
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":392
+ *                 PyObject_GetBuffer(o.data, &view, PyBUF_C_CONTIGUOUS)
+ *                 try:
+ *                     L = view.len             # <<<<<<<<<<<<<<
+ *                     if L > (2**32) - 1:
+ *                         raise ValueError("EXT data is too large")
+ */
+        __pyx_t_12 = __pyx_v_view.len;
+        __pyx_v_L = __pyx_t_12;
+
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":393
+ *                 try:
+ *                     L = view.len
+ *                     if L > (2**32) - 1:             # <<<<<<<<<<<<<<
+ *                         raise ValueError("EXT data is too large")
+ *                     ret = msgpack_pack_ext(&self.pk, longval, L)
+ */
+        __pyx_t_3 = __Pyx_PyInt_FromSize_t(__pyx_v_L); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 393, __pyx_L51_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __pyx_t_4 = PyObject_RichCompare(__pyx_t_3, __pyx_int_4294967295, Py_GT); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 393, __pyx_L51_error)
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 393, __pyx_L51_error)
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        if (unlikely(__pyx_t_1)) {
+
+          /* "isf_pandas_msgpack/msgpack/_packer.pyx":394
+ *                     L = view.len
+ *                     if L > (2**32) - 1:
+ *                         raise ValueError("EXT data is too large")             # <<<<<<<<<<<<<<
+ *                     ret = msgpack_pack_ext(&self.pk, longval, L)
+ *                     if ret == 0:
  */
-  __pyx_tuple__20 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(0, 295, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__20);
-  __Pyx_GIVEREF(__pyx_tuple__20);
-  __pyx_codeobj__21 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__20, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__pack, __pyx_n_s_reset, 295, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__21)) __PYX_ERR(0, 295, __pyx_L1_error)
+          __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__11, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 394, __pyx_L51_error)
+          __Pyx_GOTREF(__pyx_t_4);
+          __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+          __PYX_ERR(0, 394, __pyx_L51_error)
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":299
- *         self.pk.length = 0
- * 
- *     def bytes(self):             # <<<<<<<<<<<<<<
- *         """Return buffer content."""
- *         return PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
+          /* "isf_pandas_msgpack/msgpack/_packer.pyx":393
+ *                 try:
+ *                     L = view.len
+ *                     if L > (2**32) - 1:             # <<<<<<<<<<<<<<
+ *                         raise ValueError("EXT data is too large")
+ *                     ret = msgpack_pack_ext(&self.pk, longval, L)
  */
-  __pyx_codeobj__22 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__20, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__pack, __pyx_n_s_bytes, 299, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__22)) __PYX_ERR(0, 299, __pyx_L1_error)
+        }
 
-  /* "(tree fragment)":1
- * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
- * def __setstate_cython__(self, __pyx_state):
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":395
+ *                     if L > (2**32) - 1:
+ *                         raise ValueError("EXT data is too large")
+ *                     ret = msgpack_pack_ext(&self.pk, longval, L)             # <<<<<<<<<<<<<<
+ *                     if ret == 0:
+ *                         if self._streaming() and L >= self.flush_threshold:
+ */
+        __pyx_v_ret = msgpack_pack_ext((&__pyx_cur_scope->__pyx_v_self->pk), __pyx_v_longval, __pyx_v_L);
+
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":396
+ *                         raise ValueError("EXT data is too large")
+ *                     ret = msgpack_pack_ext(&self.pk, longval, L)
+ *                     if ret == 0:             # <<<<<<<<<<<<<<
+ *                         if self._streaming() and L >= self.flush_threshold:
+ *                             # write large bodies from their own memory
+ */
+        __pyx_t_1 = (__pyx_v_ret == 0);
+        if (__pyx_t_1) {
+
+          /* "isf_pandas_msgpack/msgpack/_packer.pyx":397
+ *                     ret = msgpack_pack_ext(&self.pk, longval, L)
+ *                     if ret == 0:
+ *                         if self._streaming() and L >= self.flush_threshold:             # <<<<<<<<<<<<<<
+ *                             # write large bodies from their own memory
+ *                             self._flush()
+ */
+          __pyx_t_6 = __pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__streaming(__pyx_cur_scope->__pyx_v_self); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 397, __pyx_L51_error)
+          if (__pyx_t_6) {
+          } else {
+            __pyx_t_1 = __pyx_t_6;
+            goto __pyx_L56_bool_binop_done;
+          }
+          __pyx_t_6 = (__pyx_v_L >= __pyx_cur_scope->__pyx_v_self->flush_threshold);
+          __pyx_t_1 = __pyx_t_6;
+          __pyx_L56_bool_binop_done:;
+          if (__pyx_t_1) {
+
+            /* "isf_pandas_msgpack/msgpack/_packer.pyx":399
+ *                         if self._streaming() and L >= self.flush_threshold:
+ *                             # write large bodies from their own memory
+ *                             self._flush()             # <<<<<<<<<<<<<<
+ *                             self._write(o.data, L)
+ *                         else:
+ */
+            __pyx_t_4 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_cur_scope->__pyx_v_self->__pyx_vtab)->_flush(__pyx_cur_scope->__pyx_v_self); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 399, __pyx_L51_error)
+            __Pyx_GOTREF(__pyx_t_4);
+            __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+
+            /* "isf_pandas_msgpack/msgpack/_packer.pyx":400
+ *                             # write large bodies from their own memory
+ *                             self._flush()
+ *                             self._write(o.data, L)             # <<<<<<<<<<<<<<
+ *                         else:
+ *                             ret = msgpack_pack_raw_body(
+ */
+            __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_o, __pyx_n_s_data); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 400, __pyx_L51_error)
+            __Pyx_GOTREF(__pyx_t_4);
+            __pyx_t_3 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_cur_scope->__pyx_v_self->__pyx_vtab)->_write(__pyx_cur_scope->__pyx_v_self, __pyx_t_4, __pyx_v_L); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 400, __pyx_L51_error)
+            __Pyx_GOTREF(__pyx_t_3);
+            __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+            __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+            /* "isf_pandas_msgpack/msgpack/_packer.pyx":397
+ *                     ret = msgpack_pack_ext(&self.pk, longval, L)
+ *                     if ret == 0:
+ *                         if self._streaming() and L >= self.flush_threshold:             # <<<<<<<<<<<<<<
+ *                             # write large bodies from their own memory
+ *                             self._flush()
+ */
+            goto __pyx_L55;
+          }
+
+          /* "isf_pandas_msgpack/msgpack/_packer.pyx":402
+ *                             self._write(o.data, L)
+ *                         else:
+ *                             ret = msgpack_pack_raw_body(             # <<<<<<<<<<<<<<
+ *                                 &self.pk, <char*>view.buf, L)
+ *                 finally:
  */
-  __pyx_codeobj__23 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__20, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_reduce_cython, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__23)) __PYX_ERR(2, 1, __pyx_L1_error)
+          /*else*/ {
 
-  /* "(tree fragment)":3
- * def __reduce_cython__(self):
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
- * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+            /* "isf_pandas_msgpack/msgpack/_packer.pyx":403
+ *                         else:
+ *                             ret = msgpack_pack_raw_body(
+ *                                 &self.pk, <char*>view.buf, L)             # <<<<<<<<<<<<<<
+ *                 finally:
+ *                     PyBuffer_Release(&view)
  */
-  __pyx_tuple__24 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_pyx_state); if (unlikely(!__pyx_tuple__24)) __PYX_ERR(2, 3, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__24);
-  __Pyx_GIVEREF(__pyx_tuple__24);
-  __pyx_codeobj__25 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__24, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_setstate_cython, 3, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__25)) __PYX_ERR(2, 3, __pyx_L1_error)
-  __Pyx_RefNannyFinishContext();
-  return 0;
-  __pyx_L1_error:;
-  __Pyx_RefNannyFinishContext();
-  return -1;
-}
-/* #### Code section: init_constants ### */
+            __pyx_v_ret = msgpack_pack_raw_body((&__pyx_cur_scope->__pyx_v_self->pk), ((char *)__pyx_v_view.buf), __pyx_v_L);
+          }
+          __pyx_L55:;
 
-static CYTHON_SMALL_CODE int __Pyx_InitConstants(void) {
-  if (__Pyx_CreateStringTabAndInitStrings() < 0) __PYX_ERR(0, 1, __pyx_L1_error);
-  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_int_4294967295 = PyInt_FromString((char *)"4294967295", 0, 0); if (unlikely(!__pyx_int_4294967295)) __PYX_ERR(0, 1, __pyx_L1_error)
-  return 0;
-  __pyx_L1_error:;
-  return -1;
-}
-/* #### Code section: init_globals ### */
+          /* "isf_pandas_msgpack/msgpack/_packer.pyx":396
+ *                         raise ValueError("EXT data is too large")
+ *                     ret = msgpack_pack_ext(&self.pk, longval, L)
+ *                     if ret == 0:             # <<<<<<<<<<<<<<
+ *                         if self._streaming() and L >= self.flush_threshold:
+ *                             # write large bodies from their own memory
+ */
+        }
+      }
 
-static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
-  return 0;
-}
-/* #### Code section: init_module ### */
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":405
+ *                                 &self.pk, <char*>view.buf, L)
+ *                 finally:
+ *                     PyBuffer_Release(&view)             # <<<<<<<<<<<<<<
+ *             elif PyTuple_Check(o) or PyList_Check(o):
+ *                 L = len(o)
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          PyBuffer_Release((&__pyx_v_view));
+          goto __pyx_L52;
+        }
+        __pyx_L51_error:;
+        /*exception exit:*/{
+          __Pyx_PyThreadState_declare
+          __Pyx_PyThreadState_assign
+          __pyx_t_20 = 0; __pyx_t_21 = 0; __pyx_t_22 = 0; __pyx_t_23 = 0; __pyx_t_24 = 0; __pyx_t_25 = 0;
+          __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+          __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+          if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_23, &__pyx_t_24, &__pyx_t_25);
+          if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_20, &__pyx_t_21, &__pyx_t_22) < 0)) __Pyx_ErrFetch(&__pyx_t_20, &__pyx_t_21, &__pyx_t_22);
+          __Pyx_XGOTREF(__pyx_t_20);
+          __Pyx_XGOTREF(__pyx_t_21);
+          __Pyx_XGOTREF(__pyx_t_22);
+          __Pyx_XGOTREF(__pyx_t_23);
+          __Pyx_XGOTREF(__pyx_t_24);
+          __Pyx_XGOTREF(__pyx_t_25);
+          __pyx_t_16 = __pyx_lineno; __pyx_t_17 = __pyx_clineno; __pyx_t_19 = __pyx_filename;
+          {
+            PyBuffer_Release((&__pyx_v_view));
+          }
+          if (PY_MAJOR_VERSION >= 3) {
+            __Pyx_XGIVEREF(__pyx_t_23);
+            __Pyx_XGIVEREF(__pyx_t_24);
+            __Pyx_XGIVEREF(__pyx_t_25);
+            __Pyx_ExceptionReset(__pyx_t_23, __pyx_t_24, __pyx_t_25);
+          }
+          __Pyx_XGIVEREF(__pyx_t_20);
+          __Pyx_XGIVEREF(__pyx_t_21);
+          __Pyx_XGIVEREF(__pyx_t_22);
+          __Pyx_ErrRestore(__pyx_t_20, __pyx_t_21, __pyx_t_22);
+          __pyx_t_20 = 0; __pyx_t_21 = 0; __pyx_t_22 = 0; __pyx_t_23 = 0; __pyx_t_24 = 0; __pyx_t_25 = 0;
+          __pyx_lineno = __pyx_t_16; __pyx_clineno = __pyx_t_17; __pyx_filename = __pyx_t_19;
+          goto __pyx_L1_error;
+        }
+        __pyx_L52:;
+      }
 
-static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
-static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":387
+ *                         ret = self._pack(v, nest_limit - 1, encoded)
+ *                         if ret != 0: break
+ *             elif isinstance(o, ExtType):             # <<<<<<<<<<<<<<
+ *                 # This should be before Tuple because ExtType is namedtuple.
+ *                 longval = o.code
+ */
+      goto __pyx_L9;
+    }
 
-static int __Pyx_modinit_global_init_code(void) {
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
-  /*--- Global init code ---*/
-  __Pyx_RefNannyFinishContext();
-  return 0;
-}
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":406
+ *                 finally:
+ *                     PyBuffer_Release(&view)
+ *             elif PyTuple_Check(o) or PyList_Check(o):             # <<<<<<<<<<<<<<
+ *                 L = len(o)
+ *                 if L > (2**32) - 1:
+ */
+    __pyx_t_6 = PyTuple_Check(__pyx_v_o);
+    if (!__pyx_t_6) {
+    } else {
+      __pyx_t_1 = __pyx_t_6;
+      goto __pyx_L62_bool_binop_done;
+    }
+    __pyx_t_6 = PyList_Check(__pyx_v_o);
+    __pyx_t_1 = __pyx_t_6;
+    __pyx_L62_bool_binop_done:;
+    if (__pyx_t_1) {
 
-static int __Pyx_modinit_variable_export_code(void) {
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
-  /*--- Variable export code ---*/
-  __Pyx_RefNannyFinishContext();
-  return 0;
-}
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":407
+ *                     PyBuffer_Release(&view)
+ *             elif PyTuple_Check(o) or PyList_Check(o):
+ *                 L = len(o)             # <<<<<<<<<<<<<<
+ *                 if L > (2**32) - 1:
+ *                     raise ValueError("list is too large")
+ */
+      __pyx_t_12 = PyObject_Length(__pyx_v_o); if (unlikely(__pyx_t_12 == ((Py_ssize_t)-1))) __PYX_ERR(0, 407, __pyx_L1_error)
+      __pyx_v_L = __pyx_t_12;
 
-static int __Pyx_modinit_function_export_code(void) {
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
-  /*--- Function export code ---*/
-  __Pyx_RefNannyFinishContext();
-  return 0;
-}
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":408
+ *             elif PyTuple_Check(o) or PyList_Check(o):
+ *                 L = len(o)
+ *                 if L > (2**32) - 1:             # <<<<<<<<<<<<<<
+ *                     raise ValueError("list is too large")
+ *                 ret = msgpack_pack_array(&self.pk, L)
+ */
+      __pyx_t_3 = __Pyx_PyInt_FromSize_t(__pyx_v_L); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 408, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = PyObject_RichCompare(__pyx_t_3, __pyx_int_4294967295, Py_GT); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 408, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 408, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      if (unlikely(__pyx_t_1)) {
 
-static int __Pyx_modinit_type_init_code(void) {
-  __Pyx_RefNannyDeclarations
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
-  /*--- Type init code ---*/
-  __pyx_vtabptr_18isf_pandas_msgpack_7msgpack_7_packer_Packer = &__pyx_vtable_18isf_pandas_msgpack_7msgpack_7_packer_Packer;
-  __pyx_vtable_18isf_pandas_msgpack_7msgpack_7_packer_Packer._pack = (int (*)(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *, PyObject *, struct __pyx_opt_args_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__pack *__pyx_optional_args))__pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__pack;
-  __pyx_vtable_18isf_pandas_msgpack_7msgpack_7_packer_Packer.pack = (PyObject *(*)(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *, PyObject *, int __pyx_skip_dispatch))__pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_pack;
-  #if CYTHON_USE_TYPE_SPECS
-  __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer_Packer_spec, NULL); if (unlikely(!__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer)) __PYX_ERR(0, 40, __pyx_L1_error)
-  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer_Packer_spec, __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer) < 0) __PYX_ERR(0, 40, __pyx_L1_error)
-  #else
-  __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer = &__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer_Packer;
-  #endif
-  #if !CYTHON_COMPILING_IN_LIMITED_API
-  #endif
-  #if !CYTHON_USE_TYPE_SPECS
-  if (__Pyx_PyType_Ready(__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer) < 0) __PYX_ERR(0, 40, __pyx_L1_error)
-  #endif
-  #if PY_MAJOR_VERSION < 3
-  __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer->tp_print = 0;
-  #endif
-  #if !CYTHON_COMPILING_IN_LIMITED_API
-  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer->tp_dictoffset && __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer->tp_getattro == PyObject_GenericGetAttr)) {
-    __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer->tp_getattro = __Pyx_PyObject_GenericGetAttr;
-  }
-  #endif
-  #if CYTHON_UPDATE_DESCRIPTOR_DOC
-  {
-    PyObject *wrapper = PyObject_GetAttrString((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer, "__init__"); if (unlikely(!wrapper)) __PYX_ERR(0, 40, __pyx_L1_error)
-    if (__Pyx_IS_TYPE(wrapper, &PyWrapperDescr_Type)) {
-      __pyx_wrapperbase_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_2__init__ = *((PyWrapperDescrObject *)wrapper)->d_base;
-      __pyx_wrapperbase_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_2__init__.doc = __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_2__init__;
-      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_2__init__;
-    }
-  }
-  #endif
-  if (__Pyx_SetVtable(__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer, __pyx_vtabptr_18isf_pandas_msgpack_7msgpack_7_packer_Packer) < 0) __PYX_ERR(0, 40, __pyx_L1_error)
-  #if !CYTHON_COMPILING_IN_LIMITED_API
-  if (__Pyx_MergeVtables(__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer) < 0) __PYX_ERR(0, 40, __pyx_L1_error)
-  #endif
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_Packer, (PyObject *) __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer) < 0) __PYX_ERR(0, 40, __pyx_L1_error)
-  #if !CYTHON_COMPILING_IN_LIMITED_API
-  if (__Pyx_setup_reduce((PyObject *) __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer) < 0) __PYX_ERR(0, 40, __pyx_L1_error)
-  #endif
-  __Pyx_RefNannyFinishContext();
-  return 0;
-  __pyx_L1_error:;
-  __Pyx_RefNannyFinishContext();
-  return -1;
-}
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":409
+ *                 L = len(o)
+ *                 if L > (2**32) - 1:
+ *                     raise ValueError("list is too large")             # <<<<<<<<<<<<<<
+ *                 ret = msgpack_pack_array(&self.pk, L)
+ *                 if ret == 0:
+ */
+        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__12, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 409, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __PYX_ERR(0, 409, __pyx_L1_error)
 
-static int __Pyx_modinit_type_import_code(void) {
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
-  /*--- Type import code ---*/
-  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 9, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_ptype_7cpython_4type_type = __Pyx_ImportType_3_0_12(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "type", 
-  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
-  sizeof(PyTypeObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyTypeObject),
-  #elif CYTHON_COMPILING_IN_LIMITED_API
-  sizeof(PyTypeObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyTypeObject),
-  #else
-  sizeof(PyHeapTypeObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyHeapTypeObject),
-  #endif
-  __Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_7cpython_4type_type) __PYX_ERR(3, 9, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(4, 8, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_ptype_7cpython_4bool_bool = __Pyx_ImportType_3_0_12(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "bool", sizeof(PyBoolObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyBoolObject),__Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_7cpython_4bool_bool) __PYX_ERR(4, 8, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(5, 15, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_ptype_7cpython_7complex_complex = __Pyx_ImportType_3_0_12(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "complex", sizeof(PyComplexObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyComplexObject),__Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_7cpython_7complex_complex) __PYX_ERR(5, 15, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_RefNannyFinishContext();
-  return 0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_RefNannyFinishContext();
-  return -1;
-}
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":408
+ *             elif PyTuple_Check(o) or PyList_Check(o):
+ *                 L = len(o)
+ *                 if L > (2**32) - 1:             # <<<<<<<<<<<<<<
+ *                     raise ValueError("list is too large")
+ *                 ret = msgpack_pack_array(&self.pk, L)
+ */
+      }
 
-static int __Pyx_modinit_variable_import_code(void) {
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
-  /*--- Variable import code ---*/
-  __Pyx_RefNannyFinishContext();
-  return 0;
-}
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":410
+ *                 if L > (2**32) - 1:
+ *                     raise ValueError("list is too large")
+ *                 ret = msgpack_pack_array(&self.pk, L)             # <<<<<<<<<<<<<<
+ *                 if ret == 0:
+ *                     for v in o:
+ */
+      __pyx_v_ret = msgpack_pack_array((&__pyx_cur_scope->__pyx_v_self->pk), __pyx_v_L);
 
-static int __Pyx_modinit_function_import_code(void) {
-  __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
-  /*--- Function import code ---*/
-  __Pyx_RefNannyFinishContext();
-  return 0;
-}
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":411
+ *                     raise ValueError("list is too large")
+ *                 ret = msgpack_pack_array(&self.pk, L)
+ *                 if ret == 0:             # <<<<<<<<<<<<<<
+ *                     for v in o:
+ *                         ret = self._pack(v, nest_limit - 1,
+ */
+      __pyx_t_1 = (__pyx_v_ret == 0);
+      if (__pyx_t_1) {
 
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":412
+ *                 ret = msgpack_pack_array(&self.pk, L)
+ *                 if ret == 0:
+ *                     for v in o:             # <<<<<<<<<<<<<<
+ *                         ret = self._pack(v, nest_limit - 1,
+ *                                          encoded or default_used)
+ */
+        if (likely(PyList_CheckExact(__pyx_v_o)) || PyTuple_CheckExact(__pyx_v_o)) {
+          __pyx_t_4 = __pyx_v_o; __Pyx_INCREF(__pyx_t_4);
+          __pyx_t_12 = 0;
+          __pyx_t_26 = NULL;
+        } else {
+          __pyx_t_12 = -1; __pyx_t_4 = PyObject_GetIter(__pyx_v_o); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 412, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_4);
+          __pyx_t_26 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_4); if (unlikely(!__pyx_t_26)) __PYX_ERR(0, 412, __pyx_L1_error)
+        }
+        for (;;) {
+          if (likely(!__pyx_t_26)) {
+            if (likely(PyList_CheckExact(__pyx_t_4))) {
+              {
+                Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_4);
+                #if !CYTHON_ASSUME_SAFE_MACROS
+                if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 412, __pyx_L1_error)
+                #endif
+                if (__pyx_t_12 >= __pyx_temp) break;
+              }
+              #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+              __pyx_t_3 = PyList_GET_ITEM(__pyx_t_4, __pyx_t_12); __Pyx_INCREF(__pyx_t_3); __pyx_t_12++; if (unlikely((0 < 0))) __PYX_ERR(0, 412, __pyx_L1_error)
+              #else
+              __pyx_t_3 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_12); __pyx_t_12++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 412, __pyx_L1_error)
+              __Pyx_GOTREF(__pyx_t_3);
+              #endif
+            } else {
+              {
+                Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_4);
+                #if !CYTHON_ASSUME_SAFE_MACROS
+                if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 412, __pyx_L1_error)
+                #endif
+                if (__pyx_t_12 >= __pyx_temp) break;
+              }
+              #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+              __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_4, __pyx_t_12); __Pyx_INCREF(__pyx_t_3); __pyx_t_12++; if (unlikely((0 < 0))) __PYX_ERR(0, 412, __pyx_L1_error)
+              #else
+              __pyx_t_3 = __Pyx_PySequence_ITEM(__pyx_t_4, __pyx_t_12); __pyx_t_12++; if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 412, __pyx_L1_error)
+              __Pyx_GOTREF(__pyx_t_3);
+              #endif
+            }
+          } else {
+            __pyx_t_3 = __pyx_t_26(__pyx_t_4);
+            if (unlikely(!__pyx_t_3)) {
+              PyObject* exc_type = PyErr_Occurred();
+              if (exc_type) {
+                if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+                else __PYX_ERR(0, 412, __pyx_L1_error)
+              }
+              break;
+            }
+            __Pyx_GOTREF(__pyx_t_3);
+          }
+          __Pyx_XDECREF_SET(__pyx_v_v, __pyx_t_3);
+          __pyx_t_3 = 0;
 
-#if PY_MAJOR_VERSION >= 3
-#if CYTHON_PEP489_MULTI_PHASE_INIT
-static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
-static int __pyx_pymod_exec__packer(PyObject* module); /*proto*/
-static PyModuleDef_Slot __pyx_moduledef_slots[] = {
-  {Py_mod_create, (void*)__pyx_pymod_create},
-  {Py_mod_exec, (void*)__pyx_pymod_exec__packer},
-  {0, NULL}
-};
-#endif
+          /* "isf_pandas_msgpack/msgpack/_packer.pyx":414
+ *                     for v in o:
+ *                         ret = self._pack(v, nest_limit - 1,
+ *                                          encoded or default_used)             # <<<<<<<<<<<<<<
+ *                         if ret != 0: break
+ *             elif not default_used and self._default:
+ */
+          if (!__pyx_v_encoded) {
+          } else {
+            __pyx_t_1 = __pyx_v_encoded;
+            goto __pyx_L68_bool_binop_done;
+          }
+          __pyx_t_6 = (__pyx_v_default_used != 0);
+          __pyx_t_1 = __pyx_t_6;
+          __pyx_L68_bool_binop_done:;
 
-#ifdef __cplusplus
-namespace {
-  struct PyModuleDef __pyx_moduledef =
-  #else
-  static struct PyModuleDef __pyx_moduledef =
-  #endif
-  {
-      PyModuleDef_HEAD_INIT,
-      "_packer",
-      0, /* m_doc */
-    #if CYTHON_PEP489_MULTI_PHASE_INIT
-      0, /* m_size */
-    #elif CYTHON_USE_MODULE_STATE
-      sizeof(__pyx_mstate), /* m_size */
-    #else
-      -1, /* m_size */
-    #endif
-      __pyx_methods /* m_methods */,
-    #if CYTHON_PEP489_MULTI_PHASE_INIT
-      __pyx_moduledef_slots, /* m_slots */
-    #else
-      NULL, /* m_reload */
-    #endif
-    #if CYTHON_USE_MODULE_STATE
-      __pyx_m_traverse, /* m_traverse */
-      __pyx_m_clear, /* m_clear */
-      NULL /* m_free */
-    #else
-      NULL, /* m_traverse */
-      NULL, /* m_clear */
-      NULL /* m_free */
-    #endif
-  };
-  #ifdef __cplusplus
-} /* anonymous namespace */
-#endif
-#endif
+          /* "isf_pandas_msgpack/msgpack/_packer.pyx":413
+ *                 if ret == 0:
+ *                     for v in o:
+ *                         ret = self._pack(v, nest_limit - 1,             # <<<<<<<<<<<<<<
+ *                                          encoded or default_used)
+ *                         if ret != 0: break
+ */
+          __pyx_t_18.__pyx_n = 2;
+          __pyx_t_18.nest_limit = (__pyx_v_nest_limit - 1);
+          __pyx_t_18.encoded = __pyx_t_1;
+          __pyx_t_17 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_cur_scope->__pyx_v_self->__pyx_vtab)->_pack(__pyx_cur_scope->__pyx_v_self, __pyx_v_v, &__pyx_t_18); if (unlikely(__pyx_t_17 == ((int)-1))) __PYX_ERR(0, 413, __pyx_L1_error)
+          __pyx_v_ret = __pyx_t_17;
 
-#ifndef CYTHON_NO_PYINIT_EXPORT
-#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
-#elif PY_MAJOR_VERSION < 3
-#ifdef __cplusplus
-#define __Pyx_PyMODINIT_FUNC extern "C" void
-#else
-#define __Pyx_PyMODINIT_FUNC void
-#endif
-#else
-#ifdef __cplusplus
-#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
-#else
-#define __Pyx_PyMODINIT_FUNC PyObject *
-#endif
-#endif
+          /* "isf_pandas_msgpack/msgpack/_packer.pyx":415
+ *                         ret = self._pack(v, nest_limit - 1,
+ *                                          encoded or default_used)
+ *                         if ret != 0: break             # <<<<<<<<<<<<<<
+ *             elif not default_used and self._default:
+ *                 o = self._default(o)
+ */
+          __pyx_t_1 = (__pyx_v_ret != 0);
+          if (__pyx_t_1) {
+            goto __pyx_L67_break;
+          }
 
+          /* "isf_pandas_msgpack/msgpack/_packer.pyx":412
+ *                 ret = msgpack_pack_array(&self.pk, L)
+ *                 if ret == 0:
+ *                     for v in o:             # <<<<<<<<<<<<<<
+ *                         ret = self._pack(v, nest_limit - 1,
+ *                                          encoded or default_used)
+ */
+        }
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        goto __pyx_L71_for_end;
+        __pyx_L67_break:;
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        goto __pyx_L71_for_end;
+        __pyx_L71_for_end:;
 
-#if PY_MAJOR_VERSION < 3
-__Pyx_PyMODINIT_FUNC init_packer(void) CYTHON_SMALL_CODE; /*proto*/
-__Pyx_PyMODINIT_FUNC init_packer(void)
-#else
-__Pyx_PyMODINIT_FUNC PyInit__packer(void) CYTHON_SMALL_CODE; /*proto*/
-__Pyx_PyMODINIT_FUNC PyInit__packer(void)
-#if CYTHON_PEP489_MULTI_PHASE_INIT
-{
-  return PyModuleDef_Init(&__pyx_moduledef);
-}
-static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
-    #if PY_VERSION_HEX >= 0x030700A1
-    static PY_INT64_T main_interpreter_id = -1;
-    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
-    if (main_interpreter_id == -1) {
-        main_interpreter_id = current_id;
-        return (unlikely(current_id == -1)) ? -1 : 0;
-    } else if (unlikely(main_interpreter_id != current_id))
-    #else
-    static PyInterpreterState *main_interpreter = NULL;
-    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
-    if (!main_interpreter) {
-        main_interpreter = current_interpreter;
-    } else if (unlikely(main_interpreter != current_interpreter))
-    #endif
-    {
-        PyErr_SetString(
-            PyExc_ImportError,
-            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
-        return -1;
+        /* "isf_pandas_msgpack/msgpack/_packer.pyx":411
+ *                     raise ValueError("list is too large")
+ *                 ret = msgpack_pack_array(&self.pk, L)
+ *                 if ret == 0:             # <<<<<<<<<<<<<<
+ *                     for v in o:
+ *                         ret = self._pack(v, nest_limit - 1,
+ */
+      }
+
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":406
+ *                 finally:
+ *                     PyBuffer_Release(&view)
+ *             elif PyTuple_Check(o) or PyList_Check(o):             # <<<<<<<<<<<<<<
+ *                 L = len(o)
+ *                 if L > (2**32) - 1:
+ */
+      goto __pyx_L9;
     }
-    return 0;
-}
-#if CYTHON_COMPILING_IN_LIMITED_API
-static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *module, const char* from_name, const char* to_name, int allow_none)
-#else
-static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none)
-#endif
-{
-    PyObject *value = PyObject_GetAttrString(spec, from_name);
-    int result = 0;
-    if (likely(value)) {
-        if (allow_none || value != Py_None) {
-#if CYTHON_COMPILING_IN_LIMITED_API
-            result = PyModule_AddObject(module, to_name, value);
-#else
-            result = PyDict_SetItemString(moddict, to_name, value);
-#endif
-        }
-        Py_DECREF(value);
-    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
-        PyErr_Clear();
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":416
+ *                                          encoded or default_used)
+ *                         if ret != 0: break
+ *             elif not default_used and self._default:             # <<<<<<<<<<<<<<
+ *                 o = self._default(o)
+ *                 default_used = 1
+ */
+    __pyx_t_6 = (!(__pyx_v_default_used != 0));
+    if (__pyx_t_6) {
     } else {
-        result = -1;
+      __pyx_t_1 = __pyx_t_6;
+      goto __pyx_L72_bool_binop_done;
     }
-    return result;
-}
-static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def) {
-    PyObject *module = NULL, *moddict, *modname;
-    CYTHON_UNUSED_VAR(def);
-    if (__Pyx_check_single_interpreter())
-        return NULL;
-    if (__pyx_m)
-        return __Pyx_NewRef(__pyx_m);
-    modname = PyObject_GetAttrString(spec, "name");
-    if (unlikely(!modname)) goto bad;
-    module = PyModule_NewObject(modname);
-    Py_DECREF(modname);
-    if (unlikely(!module)) goto bad;
-#if CYTHON_COMPILING_IN_LIMITED_API
-    moddict = module;
-#else
-    moddict = PyModule_GetDict(module);
-    if (unlikely(!moddict)) goto bad;
-#endif
-    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
-    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
-    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
-    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
-    return module;
-bad:
-    Py_XDECREF(module);
-    return NULL;
-}
-
-
-static CYTHON_SMALL_CODE int __pyx_pymod_exec__packer(PyObject *__pyx_pyinit_module)
-#endif
-#endif
-{
-  int stringtab_initialized = 0;
-  #if CYTHON_USE_MODULE_STATE
-  int pystate_addmodule_run = 0;
-  #endif
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannyDeclarations
-  #if CYTHON_PEP489_MULTI_PHASE_INIT
-  if (__pyx_m) {
-    if (__pyx_m == __pyx_pyinit_module) return 0;
-    PyErr_SetString(PyExc_RuntimeError, "Module '_packer' has already been imported. Re-initialisation is not supported.");
-    return -1;
-  }
-  #elif PY_MAJOR_VERSION >= 3
-  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
-  #endif
-  /*--- Module creation code ---*/
-  #if CYTHON_PEP489_MULTI_PHASE_INIT
-  __pyx_m = __pyx_pyinit_module;
-  Py_INCREF(__pyx_m);
-  #else
-  #if PY_MAJOR_VERSION < 3
-  __pyx_m = Py_InitModule4("_packer", __pyx_methods, 0, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
-  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
-  #elif CYTHON_USE_MODULE_STATE
-  __pyx_t_1 = PyModule_Create(&__pyx_moduledef); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
-  {
-    int add_module_result = PyState_AddModule(__pyx_t_1, &__pyx_moduledef);
-    __pyx_t_1 = 0; /* transfer ownership from __pyx_t_1 to "_packer" pseudovariable */
-    if (unlikely((add_module_result < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
-    pystate_addmodule_run = 1;
-  }
-  #else
-  __pyx_m = PyModule_Create(&__pyx_moduledef);
-  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-  #endif
-  CYTHON_UNUSED_VAR(__pyx_t_1);
-  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
-  Py_INCREF(__pyx_d);
-  __pyx_b = __Pyx_PyImport_AddModuleRef(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_cython_runtime = __Pyx_PyImport_AddModuleRef((const char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
-  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #if CYTHON_REFNANNY
-__Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
-if (!__Pyx_RefNanny) {
-  PyErr_Clear();
-  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
-  if (!__Pyx_RefNanny)
-      Py_FatalError("failed to import 'refnanny' module");
-}
-#endif
-  __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit__packer(void)", 0);
-  if (__Pyx_check_binary_version(__PYX_LIMITED_VERSION_HEX, __Pyx_get_runtime_version(), CYTHON_COMPILING_IN_LIMITED_API) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #ifdef __Pxy_PyFrame_Initialize_Offsets
-  __Pxy_PyFrame_Initialize_Offsets();
-  #endif
-  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
-  #ifdef __Pyx_CyFunction_USED
-  if (__pyx_CyFunction_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-  #ifdef __Pyx_FusedFunction_USED
-  if (__pyx_FusedFunction_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-  #ifdef __Pyx_Coroutine_USED
-  if (__pyx_Coroutine_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-  #ifdef __Pyx_Generator_USED
-  if (__pyx_Generator_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-  #ifdef __Pyx_AsyncGen_USED
-  if (__pyx_AsyncGen_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-  #ifdef __Pyx_StopAsyncIteration_USED
-  if (__pyx_StopAsyncIteration_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-  /*--- Library function declarations ---*/
-  /*--- Threads initialization code ---*/
-  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
-  PyEval_InitThreads();
-  #endif
-  /*--- Initialize various global constants etc. ---*/
-  if (__Pyx_InitConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  stringtab_initialized = 1;
-  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
-  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
-  if (__pyx_module_is_main_isf_pandas_msgpack__msgpack___packer) {
-    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  }
-  #if PY_MAJOR_VERSION >= 3
-  {
-    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
-    if (!PyDict_GetItemString(modules, "isf_pandas_msgpack.msgpack._packer")) {
-      if (unlikely((PyDict_SetItemString(modules, "isf_pandas_msgpack.msgpack._packer", __pyx_m) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
-    }
-  }
-  #endif
-  /*--- Builtin init code ---*/
-  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  /*--- Constants init code ---*/
-  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  /*--- Global type/function init code ---*/
-  (void)__Pyx_modinit_global_init_code();
-  (void)__Pyx_modinit_variable_export_code();
-  (void)__Pyx_modinit_function_export_code();
-  if (unlikely((__Pyx_modinit_type_init_code() < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
-  if (unlikely((__Pyx_modinit_type_import_code() < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
-  (void)__Pyx_modinit_variable_import_code();
-  (void)__Pyx_modinit_function_import_code();
-  /*--- Execution code ---*/
-  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
-  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  #endif
+    __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_cur_scope->__pyx_v_self->_default); if (unlikely((__pyx_t_6 < 0))) __PYX_ERR(0, 416, __pyx_L1_error)
+    __pyx_t_1 = __pyx_t_6;
+    __pyx_L72_bool_binop_done:;
+    if (likely(__pyx_t_1)) {
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":9
- * from libc.limits cimport *
- * 
- * from .exceptions import PackValueError             # <<<<<<<<<<<<<<
- * from . import ExtType
- * 
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":417
+ *                         if ret != 0: break
+ *             elif not default_used and self._default:
+ *                 o = self._default(o)             # <<<<<<<<<<<<<<
+ *                 default_used = 1
+ *                 continue
  */
-  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 9, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_INCREF(__pyx_n_s_PackValueError);
-  __Pyx_GIVEREF(__pyx_n_s_PackValueError);
-  if (__Pyx_PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_PackValueError)) __PYX_ERR(0, 9, __pyx_L1_error);
-  __pyx_t_3 = __Pyx_Import(__pyx_n_s_exceptions, __pyx_t_2, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 9, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_3, __pyx_n_s_PackValueError); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 9, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PackValueError, __pyx_t_2) < 0) __PYX_ERR(0, 9, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_INCREF(__pyx_cur_scope->__pyx_v_self->_default);
+      __pyx_t_3 = __pyx_cur_scope->__pyx_v_self->_default; __pyx_t_2 = NULL;
+      __pyx_t_5 = 0;
+      #if CYTHON_UNPACK_METHODS
+      if (likely(PyMethod_Check(__pyx_t_3))) {
+        __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_3);
+        if (likely(__pyx_t_2)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+          __Pyx_INCREF(__pyx_t_2);
+          __Pyx_INCREF(function);
+          __Pyx_DECREF_SET(__pyx_t_3, function);
+          __pyx_t_5 = 1;
+        }
+      }
+      #endif
+      {
+        PyObject *__pyx_callargs[2] = {__pyx_t_2, __pyx_v_o};
+        __pyx_t_4 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
+        __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+        if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 417, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      }
+      __Pyx_DECREF_SET(__pyx_v_o, __pyx_t_4);
+      __pyx_t_4 = 0;
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":10
- * 
- * from .exceptions import PackValueError
- * from . import ExtType             # <<<<<<<<<<<<<<
- * 
- * 
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":418
+ *             elif not default_used and self._default:
+ *                 o = self._default(o)
+ *                 default_used = 1             # <<<<<<<<<<<<<<
+ *                 continue
+ *             else:
  */
-  __pyx_t_3 = PyList_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 10, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_INCREF(__pyx_n_s_ExtType);
-  __Pyx_GIVEREF(__pyx_n_s_ExtType);
-  if (__Pyx_PyList_SET_ITEM(__pyx_t_3, 0, __pyx_n_s_ExtType)) __PYX_ERR(0, 10, __pyx_L1_error);
-  __pyx_t_2 = __Pyx_Import(__pyx_n_s__10, __pyx_t_3, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 10, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_ExtType); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 10, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_ExtType, __pyx_t_3) < 0) __PYX_ERR(0, 10, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __pyx_v_default_used = 1;
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":37
- *     int msgpack_pack_ext(msgpack_packer* pk, char typecode, size_t l)
- * 
- * cdef int DEFAULT_RECURSE_LIMIT=511             # <<<<<<<<<<<<<<
- * 
- * 
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":419
+ *                 o = self._default(o)
+ *                 default_used = 1
+ *                 continue             # <<<<<<<<<<<<<<
+ *             else:
+ *                 raise TypeError("can't serialize %r" % (o,))
  */
-  __pyx_v_18isf_pandas_msgpack_7msgpack_7_packer_DEFAULT_RECURSE_LIMIT = 0x1FF;
+      goto __pyx_L7_continue;
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":118
- * 
- *     cdef int _pack(self, object o,
- *                    int nest_limit=DEFAULT_RECURSE_LIMIT) except -1:             # <<<<<<<<<<<<<<
- *         cdef long long llval
- *         cdef unsigned long long ullval
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":416
+ *                                          encoded or default_used)
+ *                         if ret != 0: break
+ *             elif not default_used and self._default:             # <<<<<<<<<<<<<<
+ *                 o = self._default(o)
+ *                 default_used = 1
  */
-  __pyx_k__3 = __pyx_v_18isf_pandas_msgpack_7msgpack_7_packer_DEFAULT_RECURSE_LIMIT;
+    }
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":230
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":421
+ *                 continue
+ *             else:
+ *                 raise TypeError("can't serialize %r" % (o,))             # <<<<<<<<<<<<<<
  *             return ret
  * 
- *     cpdef pack(self, object obj):             # <<<<<<<<<<<<<<
- *         cdef int ret
- *         ret = self._pack(obj, DEFAULT_RECURSE_LIMIT)
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_7pack, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Packer_pack, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__pack_2, __pyx_d, ((PyObject *)__pyx_codeobj__12)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 230, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer, __pyx_n_s_pack, __pyx_t_2) < 0) __PYX_ERR(0, 230, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  PyType_Modified(__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer);
+    /*else*/ {
+      __pyx_t_4 = PyTuple_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 421, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_INCREF(__pyx_v_o);
+      __Pyx_GIVEREF(__pyx_v_o);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_4, 0, __pyx_v_o)) __PYX_ERR(0, 421, __pyx_L1_error);
+      __pyx_t_3 = __Pyx_PyString_Format(__pyx_kp_s_can_t_serialize_r, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 421, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_builtin_TypeError, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 421, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __PYX_ERR(0, 421, __pyx_L1_error)
+    }
+    __pyx_L9:;
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":242
- *             return buf
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":422
+ *             else:
+ *                 raise TypeError("can't serialize %r" % (o,))
+ *             return ret             # <<<<<<<<<<<<<<
  * 
- *     def pack_ext_type(self, typecode, data):             # <<<<<<<<<<<<<<
- *         msgpack_pack_ext(&self.pk, typecode, len(data))
- *         msgpack_pack_raw_body(&self.pk, data, len(data))
+ *     cpdef pack(self, object obj):
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_9pack_ext_type, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Packer_pack_ext_type, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__pack_2, __pyx_d, ((PyObject *)__pyx_codeobj__14)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 242, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer, __pyx_n_s_pack_ext_type, __pyx_t_2) < 0) __PYX_ERR(0, 242, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  PyType_Modified(__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer);
+    __pyx_r = __pyx_v_ret;
+    goto __pyx_L0;
+    __pyx_L7_continue:;
+  }
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":246
- *         msgpack_pack_raw_body(&self.pk, data, len(data))
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":278
+ *         self._flush()
  * 
- *     def pack_array_header(self, size_t size):             # <<<<<<<<<<<<<<
- *         if size > (2**32) - 1:
- *             raise ValueError
+ *     cdef int _pack(self, object o,             # <<<<<<<<<<<<<<
+ *                    int nest_limit=DEFAULT_RECURSE_LIMIT,
+ *                    bint encoded=0) except -1:
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_11pack_array_header, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Packer_pack_array_header, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__pack_2, __pyx_d, ((PyObject *)__pyx_codeobj__16)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 246, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer, __pyx_n_s_pack_array_header, __pyx_t_2) < 0) __PYX_ERR(0, 246, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  PyType_Modified(__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer);
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":259
- *             return buf
- * 
- *     def pack_map_header(self, size_t size):             # <<<<<<<<<<<<<<
- *         if size > (2**32) - 1:
- *             raise ValueError
- */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_13pack_map_header, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Packer_pack_map_header, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__pack_2, __pyx_d, ((PyObject *)__pyx_codeobj__17)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 259, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer, __pyx_n_s_pack_map_header, __pyx_t_2) < 0) __PYX_ERR(0, 259, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  PyType_Modified(__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer);
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer._pack", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_d);
+  __Pyx_XDECREF(__pyx_v_k);
+  __Pyx_XDECREF(__pyx_v_v);
+  __Pyx_XDECREF(__pyx_gb_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_5_pack_2generator);
+  __Pyx_XDECREF(__pyx_gb_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_5_pack_5generator1);
+  __Pyx_XDECREF(__pyx_v_o);
+  __Pyx_DECREF((PyObject *)__pyx_cur_scope);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":272
- *             return buf
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":424
+ *             return ret
  * 
- *     def pack_map_pairs(self, object pairs):             # <<<<<<<<<<<<<<
- *         """
- *         Pack *pairs* as msgpack map type.
+ *     cpdef pack(self, object obj):             # <<<<<<<<<<<<<<
+ *         cdef int ret
+ *         ret = self._pack(obj, DEFAULT_RECURSE_LIMIT)
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_15pack_map_pairs, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Packer_pack_map_pairs, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__pack_2, __pyx_d, ((PyObject *)__pyx_codeobj__19)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 272, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer, __pyx_n_s_pack_map_pairs, __pyx_t_2) < 0) __PYX_ERR(0, 272, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  PyType_Modified(__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer);
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":295
- *             return buf
- * 
- *     def reset(self):             # <<<<<<<<<<<<<<
- *         """Clear internal buffer."""
- *         self.pk.length = 0
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_11pack(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_pack(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_obj, int __pyx_skip_dispatch) {
+  int __pyx_v_ret;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  unsigned int __pyx_t_5;
+  int __pyx_t_6;
+  struct __pyx_opt_args_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__pack __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("pack", 1);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || __Pyx_PyType_HasFeature(Py_TYPE(((PyObject *)__pyx_v_self)), (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_typedict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_pack); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 424, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!__Pyx_IsSameCFunction(__pyx_t_1, (void*) __pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_11pack)) {
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        __pyx_t_5 = 0;
+        #if CYTHON_UNPACK_METHODS
+        if (unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+            __pyx_t_5 = 1;
+          }
+        }
+        #endif
+        {
+          PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_v_obj};
+          __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 1+__pyx_t_5);
+          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 424, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        }
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_typedict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":426
+ *     cpdef pack(self, object obj):
+ *         cdef int ret
+ *         ret = self._pack(obj, DEFAULT_RECURSE_LIMIT)             # <<<<<<<<<<<<<<
+ *         if ret == -1:
+ *             raise MemoryError
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_17reset, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Packer_reset, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__pack_2, __pyx_d, ((PyObject *)__pyx_codeobj__21)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 295, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer, __pyx_n_s_reset, __pyx_t_2) < 0) __PYX_ERR(0, 295, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  PyType_Modified(__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer);
+  __pyx_t_7.__pyx_n = 1;
+  __pyx_t_7.nest_limit = __pyx_v_18isf_pandas_msgpack_7msgpack_7_packer_DEFAULT_RECURSE_LIMIT;
+  __pyx_t_6 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_pack(__pyx_v_self, __pyx_v_obj, &__pyx_t_7); if (unlikely(__pyx_t_6 == ((int)-1))) __PYX_ERR(0, 426, __pyx_L1_error)
+  __pyx_v_ret = __pyx_t_6;
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":299
- *         self.pk.length = 0
- * 
- *     def bytes(self):             # <<<<<<<<<<<<<<
- *         """Return buffer content."""
- *         return PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":427
+ *         cdef int ret
+ *         ret = self._pack(obj, DEFAULT_RECURSE_LIMIT)
+ *         if ret == -1:             # <<<<<<<<<<<<<<
+ *             raise MemoryError
+ *         elif ret:  # should not happen.
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_19bytes, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Packer_bytes, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__pack_2, __pyx_d, ((PyObject *)__pyx_codeobj__22)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 299, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer, __pyx_n_s_bytes, __pyx_t_2) < 0) __PYX_ERR(0, 299, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  PyType_Modified(__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer);
+  __pyx_t_8 = (__pyx_v_ret == -1L);
+  if (unlikely(__pyx_t_8)) {
 
-  /* "(tree fragment)":1
- * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
- * def __setstate_cython__(self, __pyx_state):
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":428
+ *         ret = self._pack(obj, DEFAULT_RECURSE_LIMIT)
+ *         if ret == -1:
+ *             raise MemoryError             # <<<<<<<<<<<<<<
+ *         elif ret:  # should not happen.
+ *             raise TypeError
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_21__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Packer___reduce_cython, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__pack_2, __pyx_d, ((PyObject *)__pyx_codeobj__23)); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_reduce_cython, __pyx_t_2) < 0) __PYX_ERR(2, 1, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    PyErr_NoMemory(); __PYX_ERR(0, 428, __pyx_L1_error)
 
-  /* "(tree fragment)":3
- * def __reduce_cython__(self):
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
- * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":427
+ *         cdef int ret
+ *         ret = self._pack(obj, DEFAULT_RECURSE_LIMIT)
+ *         if ret == -1:             # <<<<<<<<<<<<<<
+ *             raise MemoryError
+ *         elif ret:  # should not happen.
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_23__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Packer___setstate_cython, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__pack_2, __pyx_d, ((PyObject *)__pyx_codeobj__25)); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 3, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_setstate_cython, __pyx_t_2) < 0) __PYX_ERR(2, 3, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  }
 
-  /* "isf_pandas_msgpack/msgpack/_packer.pyx":1
- * # coding: utf-8             # <<<<<<<<<<<<<<
- * #cython: embedsignature=True
- * 
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":429
+ *         if ret == -1:
+ *             raise MemoryError
+ *         elif ret:  # should not happen.             # <<<<<<<<<<<<<<
+ *             raise TypeError
+ *         if self._streaming():
  */
-  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_2) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_8 = (__pyx_v_ret != 0);
+  if (unlikely(__pyx_t_8)) {
 
-  /*--- Wrapped vars code ---*/
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":430
+ *             raise MemoryError
+ *         elif ret:  # should not happen.
+ *             raise TypeError             # <<<<<<<<<<<<<<
+ *         if self._streaming():
+ *             self._flush()
+ */
+    __Pyx_Raise(__pyx_builtin_TypeError, 0, 0, 0);
+    __PYX_ERR(0, 430, __pyx_L1_error)
 
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  if (__pyx_m) {
-    if (__pyx_d && stringtab_initialized) {
-      __Pyx_AddTraceback("init isf_pandas_msgpack.msgpack._packer", __pyx_clineno, __pyx_lineno, __pyx_filename);
-    }
-    #if !CYTHON_USE_MODULE_STATE
-    Py_CLEAR(__pyx_m);
-    #else
-    Py_DECREF(__pyx_m);
-    if (pystate_addmodule_run) {
-      PyObject *tp, *value, *tb;
-      PyErr_Fetch(&tp, &value, &tb);
-      PyState_RemoveModule(&__pyx_moduledef);
-      PyErr_Restore(tp, value, tb);
-    }
-    #endif
-  } else if (!PyErr_Occurred()) {
-    PyErr_SetString(PyExc_ImportError, "init isf_pandas_msgpack.msgpack._packer");
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":429
+ *         if ret == -1:
+ *             raise MemoryError
+ *         elif ret:  # should not happen.             # <<<<<<<<<<<<<<
+ *             raise TypeError
+ *         if self._streaming():
+ */
   }
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-  #if CYTHON_PEP489_MULTI_PHASE_INIT
-  return (__pyx_m != NULL) ? 0 : -1;
-  #elif PY_MAJOR_VERSION >= 3
-  return __pyx_m;
-  #else
-  return;
-  #endif
-}
-/* #### Code section: cleanup_globals ### */
-/* #### Code section: cleanup_module ### */
-/* #### Code section: main_method ### */
-/* #### Code section: utility_code_pragmas ### */
-#ifdef _MSC_VER
-#pragma warning( push )
-/* Warning 4127: conditional expression is constant
- * Cython uses constant conditional expressions to allow in inline functions to be optimized at
- * compile-time, so this warning is not useful
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":431
+ *         elif ret:  # should not happen.
+ *             raise TypeError
+ *         if self._streaming():             # <<<<<<<<<<<<<<
+ *             self._flush()
+ *         elif self.autoreset:
  */
-#pragma warning( disable : 4127 )
-#endif
+  __pyx_t_8 = __pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__streaming(__pyx_v_self); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 431, __pyx_L1_error)
+  if (__pyx_t_8) {
 
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":432
+ *             raise TypeError
+ *         if self._streaming():
+ *             self._flush()             # <<<<<<<<<<<<<<
+ *         elif self.autoreset:
+ *             return self._take()
+ */
+    __pyx_t_1 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_flush(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 432, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":431
+ *         elif ret:  # should not happen.
+ *             raise TypeError
+ *         if self._streaming():             # <<<<<<<<<<<<<<
+ *             self._flush()
+ *         elif self.autoreset:
+ */
+    goto __pyx_L4;
+  }
 
-/* #### Code section: utility_code_def ### */
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":433
+ *         if self._streaming():
+ *             self._flush()
+ *         elif self.autoreset:             # <<<<<<<<<<<<<<
+ *             return self._take()
+ * 
+ */
+  if (__pyx_v_self->autoreset) {
 
-/* --- Runtime support code --- */
-/* Refnanny */
-#if CYTHON_REFNANNY
-static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
-    PyObject *m = NULL, *p = NULL;
-    void *r = NULL;
-    m = PyImport_ImportModule(modname);
-    if (!m) goto end;
-    p = PyObject_GetAttrString(m, "RefNannyAPI");
-    if (!p) goto end;
-    r = PyLong_AsVoidPtr(p);
-end:
-    Py_XDECREF(p);
-    Py_XDECREF(m);
-    return (__Pyx_RefNannyAPIStruct *)r;
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":434
+ *             self._flush()
+ *         elif self.autoreset:
+ *             return self._take()             # <<<<<<<<<<<<<<
+ * 
+ *     def pack_segments(self, object obj):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_1 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_take(__pyx_v_self); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 434, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_r = __pyx_t_1;
+    __pyx_t_1 = 0;
+    goto __pyx_L0;
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":433
+ *         if self._streaming():
+ *             self._flush()
+ *         elif self.autoreset:             # <<<<<<<<<<<<<<
+ *             return self._take()
+ * 
+ */
+  }
+  __pyx_L4:;
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":424
+ *             return ret
+ * 
+ *     cpdef pack(self, object obj):             # <<<<<<<<<<<<<<
+ *         cdef int ret
+ *         ret = self._pack(obj, DEFAULT_RECURSE_LIMIT)
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.pack", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
-#endif
 
-/* PyErrExceptionMatches */
-#if CYTHON_FAST_THREAD_STATE
-static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
-    Py_ssize_t i, n;
-    n = PyTuple_GET_SIZE(tuple);
-#if PY_MAJOR_VERSION >= 3
-    for (i=0; i<n; i++) {
-        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
-    }
+/* Python wrapper */
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_11pack(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
-    for (i=0; i<n; i++) {
-        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
-    }
-    return 0;
-}
-static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
-    int result;
-    PyObject *exc_type;
-#if PY_VERSION_HEX >= 0x030C00A6
-    PyObject *current_exception = tstate->current_exception;
-    if (unlikely(!current_exception)) return 0;
-    exc_type = (PyObject*) Py_TYPE(current_exception);
-    if (exc_type == err) return 1;
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_10pack, "Packer.pack(self, obj)");
+static PyMethodDef __pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_11pack = {"pack", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_11pack, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_10pack};
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_11pack(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
-    exc_type = tstate->curexc_type;
-    if (exc_type == err) return 1;
-    if (unlikely(!exc_type)) return 0;
+PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
-    #if CYTHON_AVOID_BORROWED_REFS
-    Py_INCREF(exc_type);
-    #endif
-    if (unlikely(PyTuple_Check(err))) {
-        result = __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+) {
+  PyObject *__pyx_v_obj = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[1] = {0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("pack (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_obj,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_obj)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 424, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "pack") < 0)) __PYX_ERR(0, 424, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
     } else {
-        result = __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
     }
-    #if CYTHON_AVOID_BORROWED_REFS
-    Py_DECREF(exc_type);
-    #endif
-    return result;
-}
-#endif
-
-/* PyErrFetchRestore */
-#if CYTHON_FAST_THREAD_STATE
-static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
-#if PY_VERSION_HEX >= 0x030C00A6
-    PyObject *tmp_value;
-    assert(type == NULL || (value != NULL && type == (PyObject*) Py_TYPE(value)));
-    if (value) {
-        #if CYTHON_COMPILING_IN_CPYTHON
-        if (unlikely(((PyBaseExceptionObject*) value)->traceback != tb))
-        #endif
-            PyException_SetTraceback(value, tb);
+    __pyx_v_obj = values[0];
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("pack", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 424, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
     }
-    tmp_value = tstate->current_exception;
-    tstate->current_exception = value;
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(type);
-    Py_XDECREF(tb);
-#else
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    tmp_type = tstate->curexc_type;
-    tmp_value = tstate->curexc_value;
-    tmp_tb = tstate->curexc_traceback;
-    tstate->curexc_type = type;
-    tstate->curexc_value = value;
-    tstate->curexc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-#endif
-}
-static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
-#if PY_VERSION_HEX >= 0x030C00A6
-    PyObject* exc_value;
-    exc_value = tstate->current_exception;
-    tstate->current_exception = 0;
-    *value = exc_value;
-    *type = NULL;
-    *tb = NULL;
-    if (exc_value) {
-        *type = (PyObject*) Py_TYPE(exc_value);
-        Py_INCREF(*type);
-        #if CYTHON_COMPILING_IN_CPYTHON
-        *tb = ((PyBaseExceptionObject*) exc_value)->traceback;
-        Py_XINCREF(*tb);
-        #else
-        *tb = PyException_GetTraceback(exc_value);
-        #endif
+  }
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.pack", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_10pack(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self), __pyx_v_obj);
+
+  /* function exit code */
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
     }
-#else
-    *type = tstate->curexc_type;
-    *value = tstate->curexc_value;
-    *tb = tstate->curexc_traceback;
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
-#endif
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
-#endif
 
-/* PyObjectGetAttrStr */
-#if CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
-    PyTypeObject* tp = Py_TYPE(obj);
-    if (likely(tp->tp_getattro))
-        return tp->tp_getattro(obj, attr_name);
-#if PY_MAJOR_VERSION < 3
-    if (likely(tp->tp_getattr))
-        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
-#endif
-    return PyObject_GetAttr(obj, attr_name);
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_10pack(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_obj) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("pack", 1);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_pack(__pyx_v_self, __pyx_v_obj, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 424, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.pack", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
-#endif
 
-/* PyObjectGetAttrStrNoError */
-#if __PYX_LIMITED_VERSION_HEX < 0x030d00A1
-static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
-    __Pyx_PyThreadState_declare
-    __Pyx_PyThreadState_assign
-    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
-        __Pyx_PyErr_Clear();
-}
-#endif
-static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
-    PyObject *result;
-#if __PYX_LIMITED_VERSION_HEX >= 0x030d00A1
-    (void) PyObject_GetOptionalAttr(obj, attr_name, &result);
-    return result;
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":436
+ *             return self._take()
+ * 
+ *     def pack_segments(self, object obj):             # <<<<<<<<<<<<<<
+ *         """
+ *         Pack *obj* and return it as a list of segments whose concatenation
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_13pack_segments(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
-#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS && PY_VERSION_HEX >= 0x030700B1
-    PyTypeObject* tp = Py_TYPE(obj);
-    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
-        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
-    }
-#endif
-    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
-    if (unlikely(!result)) {
-        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
-    }
-    return result;
+PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
-}
-
-/* GetBuiltinName */
-static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
-    PyObject* result = __Pyx_PyObject_GetAttrStrNoError(__pyx_b, name);
-    if (unlikely(!result) && !PyErr_Occurred()) {
-        PyErr_Format(PyExc_NameError,
-#if PY_MAJOR_VERSION >= 3
-            "name '%U' is not defined", name);
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_12pack_segments, "Packer.pack_segments(self, obj)\n\n        Pack *obj* and return it as a list of segments whose concatenation\n        is the packed data.\n\n        Segments are `bytes` holding packed data, with ext bodies of at\n        least *flush_threshold* bytes returned as the original objects\n        rather than copies. Can't be used with *stream*.\n        ");
+static PyMethodDef __pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_13pack_segments = {"pack_segments", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_13pack_segments, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_12pack_segments};
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_13pack_segments(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
-            "name '%.200s' is not defined", PyString_AS_STRING(name));
+PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
+) {
+  PyObject *__pyx_v_obj = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[1] = {0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("pack_segments (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_obj,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_obj)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 436, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "pack_segments") < 0)) __PYX_ERR(0, 436, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
     }
-    return result;
-}
-
-/* TupleAndListFromArray */
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE void __Pyx_copy_object_array(PyObject *const *CYTHON_RESTRICT src, PyObject** CYTHON_RESTRICT dest, Py_ssize_t length) {
-    PyObject *v;
-    Py_ssize_t i;
-    for (i = 0; i < length; i++) {
-        v = dest[i] = src[i];
-        Py_INCREF(v);
+    __pyx_v_obj = values[0];
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("pack_segments", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 436, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
     }
-}
-static CYTHON_INLINE PyObject *
-__Pyx_PyTuple_FromArray(PyObject *const *src, Py_ssize_t n)
-{
-    PyObject *res;
-    if (n <= 0) {
-        Py_INCREF(__pyx_empty_tuple);
-        return __pyx_empty_tuple;
+  }
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.pack_segments", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_12pack_segments(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self), __pyx_v_obj);
+
+  /* function exit code */
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
     }
-    res = PyTuple_New(n);
-    if (unlikely(res == NULL)) return NULL;
-    __Pyx_copy_object_array(src, ((PyTupleObject*)res)->ob_item, n);
-    return res;
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
-static CYTHON_INLINE PyObject *
-__Pyx_PyList_FromArray(PyObject *const *src, Py_ssize_t n)
-{
-    PyObject *res;
-    if (n <= 0) {
-        return PyList_New(0);
+
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_12pack_segments(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_obj) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  char const *__pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyObject *__pyx_t_11 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("pack_segments", 1);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":445
+ *         rather than copies. Can't be used with *stream*.
+ *         """
+ *         if self.stream is not None:             # <<<<<<<<<<<<<<
+ *             raise TypeError("pack_segments can't be used with a stream.")
+ *         self.segments = []
+ */
+  __pyx_t_1 = (__pyx_v_self->stream != Py_None);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":446
+ *         """
+ *         if self.stream is not None:
+ *             raise TypeError("pack_segments can't be used with a stream.")             # <<<<<<<<<<<<<<
+ *         self.segments = []
+ *         try:
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 446, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 446, __pyx_L1_error)
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":445
+ *         rather than copies. Can't be used with *stream*.
+ *         """
+ *         if self.stream is not None:             # <<<<<<<<<<<<<<
+ *             raise TypeError("pack_segments can't be used with a stream.")
+ *         self.segments = []
+ */
+  }
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":447
+ *         if self.stream is not None:
+ *             raise TypeError("pack_segments can't be used with a stream.")
+ *         self.segments = []             # <<<<<<<<<<<<<<
+ *         try:
+ *             self.pack(obj)
+ */
+  __pyx_t_2 = PyList_New(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 447, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_2);
+  __Pyx_GOTREF(__pyx_v_self->segments);
+  __Pyx_DECREF(__pyx_v_self->segments);
+  __pyx_v_self->segments = ((PyObject*)__pyx_t_2);
+  __pyx_t_2 = 0;
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":448
+ *             raise TypeError("pack_segments can't be used with a stream.")
+ *         self.segments = []
+ *         try:             # <<<<<<<<<<<<<<
+ *             self.pack(obj)
+ *             self._flush()
+ */
+  /*try:*/ {
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":449
+ *         self.segments = []
+ *         try:
+ *             self.pack(obj)             # <<<<<<<<<<<<<<
+ *             self._flush()
+ *             return self.segments
+ */
+    __pyx_t_2 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->pack(__pyx_v_self, __pyx_v_obj, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 449, __pyx_L5_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":450
+ *         try:
+ *             self.pack(obj)
+ *             self._flush()             # <<<<<<<<<<<<<<
+ *             return self.segments
+ *         finally:
+ */
+    __pyx_t_2 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_flush(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 450, __pyx_L5_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":451
+ *             self.pack(obj)
+ *             self._flush()
+ *             return self.segments             # <<<<<<<<<<<<<<
+ *         finally:
+ *             self.segments = None
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_v_self->segments);
+    __pyx_r = __pyx_v_self->segments;
+    goto __pyx_L4_return;
+  }
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":453
+ *             return self.segments
+ *         finally:
+ *             self.segments = None             # <<<<<<<<<<<<<<
+ * 
+ *     def pack_ext_type(self, typecode, data):
+ */
+  /*finally:*/ {
+    __pyx_L5_error:;
+    /*exception exit:*/{
+      __Pyx_PyThreadState_declare
+      __Pyx_PyThreadState_assign
+      __pyx_t_6 = 0; __pyx_t_7 = 0; __pyx_t_8 = 0; __pyx_t_9 = 0; __pyx_t_10 = 0; __pyx_t_11 = 0;
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+      if (PY_MAJOR_VERSION >= 3) __Pyx_ExceptionSwap(&__pyx_t_9, &__pyx_t_10, &__pyx_t_11);
+      if ((PY_MAJOR_VERSION < 3) || unlikely(__Pyx_GetException(&__pyx_t_6, &__pyx_t_7, &__pyx_t_8) < 0)) __Pyx_ErrFetch(&__pyx_t_6, &__pyx_t_7, &__pyx_t_8);
+      __Pyx_XGOTREF(__pyx_t_6);
+      __Pyx_XGOTREF(__pyx_t_7);
+      __Pyx_XGOTREF(__pyx_t_8);
+      __Pyx_XGOTREF(__pyx_t_9);
+      __Pyx_XGOTREF(__pyx_t_10);
+      __Pyx_XGOTREF(__pyx_t_11);
+      __pyx_t_3 = __pyx_lineno; __pyx_t_4 = __pyx_clineno; __pyx_t_5 = __pyx_filename;
+      {
+        __Pyx_INCREF(Py_None);
+        __Pyx_GIVEREF(Py_None);
+        __Pyx_GOTREF(__pyx_v_self->segments);
+        __Pyx_DECREF(__pyx_v_self->segments);
+        __pyx_v_self->segments = ((PyObject*)Py_None);
+      }
+      if (PY_MAJOR_VERSION >= 3) {
+        __Pyx_XGIVEREF(__pyx_t_9);
+        __Pyx_XGIVEREF(__pyx_t_10);
+        __Pyx_XGIVEREF(__pyx_t_11);
+        __Pyx_ExceptionReset(__pyx_t_9, __pyx_t_10, __pyx_t_11);
+      }
+      __Pyx_XGIVEREF(__pyx_t_6);
+      __Pyx_XGIVEREF(__pyx_t_7);
+      __Pyx_XGIVEREF(__pyx_t_8);
+      __Pyx_ErrRestore(__pyx_t_6, __pyx_t_7, __pyx_t_8);
+      __pyx_t_6 = 0; __pyx_t_7 = 0; __pyx_t_8 = 0; __pyx_t_9 = 0; __pyx_t_10 = 0; __pyx_t_11 = 0;
+      __pyx_lineno = __pyx_t_3; __pyx_clineno = __pyx_t_4; __pyx_filename = __pyx_t_5;
+      goto __pyx_L1_error;
+    }
+    __pyx_L4_return: {
+      __pyx_t_11 = __pyx_r;
+      __pyx_r = 0;
+      __Pyx_INCREF(Py_None);
+      __Pyx_GIVEREF(Py_None);
+      __Pyx_GOTREF(__pyx_v_self->segments);
+      __Pyx_DECREF(__pyx_v_self->segments);
+      __pyx_v_self->segments = ((PyObject*)Py_None);
+      __pyx_r = __pyx_t_11;
+      __pyx_t_11 = 0;
+      goto __pyx_L0;
     }
-    res = PyList_New(n);
-    if (unlikely(res == NULL)) return NULL;
-    __Pyx_copy_object_array(src, ((PyListObject*)res)->ob_item, n);
-    return res;
+  }
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":436
+ *             return self._take()
+ * 
+ *     def pack_segments(self, object obj):             # <<<<<<<<<<<<<<
+ *         """
+ *         Pack *obj* and return it as a list of segments whose concatenation
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.pack_segments", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
-#endif
 
-/* BytesEquals */
-static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals) {
-#if CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API
-    return PyObject_RichCompareBool(s1, s2, equals);
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":455
+ *             self.segments = None
+ * 
+ *     def pack_ext_type(self, typecode, data):             # <<<<<<<<<<<<<<
+ *         msgpack_pack_ext(&self.pk, typecode, len(data))
+ *         msgpack_pack_raw_body(&self.pk, data, len(data))
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_15pack_ext_type(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
-    if (s1 == s2) {
-        return (equals == Py_EQ);
-    } else if (PyBytes_CheckExact(s1) & PyBytes_CheckExact(s2)) {
-        const char *ps1, *ps2;
-        Py_ssize_t length = PyBytes_GET_SIZE(s1);
-        if (length != PyBytes_GET_SIZE(s2))
-            return (equals == Py_NE);
-        ps1 = PyBytes_AS_STRING(s1);
-        ps2 = PyBytes_AS_STRING(s2);
-        if (ps1[0] != ps2[0]) {
-            return (equals == Py_NE);
-        } else if (length == 1) {
-            return (equals == Py_EQ);
-        } else {
-            int result;
-#if CYTHON_USE_UNICODE_INTERNALS && (PY_VERSION_HEX < 0x030B0000)
-            Py_hash_t hash1, hash2;
-            hash1 = ((PyBytesObject*)s1)->ob_shash;
-            hash2 = ((PyBytesObject*)s2)->ob_shash;
-            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
-                return (equals == Py_NE);
-            }
+PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
-            result = memcmp(ps1, ps2, (size_t)length);
-            return (equals == Py_EQ) ? (result == 0) : (result != 0);
-        }
-    } else if ((s1 == Py_None) & PyBytes_CheckExact(s2)) {
-        return (equals == Py_NE);
-    } else if ((s2 == Py_None) & PyBytes_CheckExact(s1)) {
-        return (equals == Py_NE);
-    } else {
-        int result;
-        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
-        if (!py_result)
-            return -1;
-        result = __Pyx_PyObject_IsTrue(py_result);
-        Py_DECREF(py_result);
-        return result;
-    }
-#endif
-}
-
-/* UnicodeEquals */
-static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals) {
-#if CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API
-    return PyObject_RichCompareBool(s1, s2, equals);
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_14pack_ext_type, "Packer.pack_ext_type(self, typecode, data)");
+static PyMethodDef __pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_15pack_ext_type = {"pack_ext_type", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_15pack_ext_type, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_14pack_ext_type};
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_15pack_ext_type(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
-#if PY_MAJOR_VERSION < 3
-    PyObject* owned_ref = NULL;
-#endif
-    int s1_is_unicode, s2_is_unicode;
-    if (s1 == s2) {
-        goto return_eq;
-    }
-    s1_is_unicode = PyUnicode_CheckExact(s1);
-    s2_is_unicode = PyUnicode_CheckExact(s2);
-#if PY_MAJOR_VERSION < 3
-    if ((s1_is_unicode & (!s2_is_unicode)) && PyString_CheckExact(s2)) {
-        owned_ref = PyUnicode_FromObject(s2);
-        if (unlikely(!owned_ref))
-            return -1;
-        s2 = owned_ref;
-        s2_is_unicode = 1;
-    } else if ((s2_is_unicode & (!s1_is_unicode)) && PyString_CheckExact(s1)) {
-        owned_ref = PyUnicode_FromObject(s1);
-        if (unlikely(!owned_ref))
-            return -1;
-        s1 = owned_ref;
-        s1_is_unicode = 1;
-    } else if (((!s2_is_unicode) & (!s1_is_unicode))) {
-        return __Pyx_PyBytes_Equals(s1, s2, equals);
-    }
+PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
-    if (s1_is_unicode & s2_is_unicode) {
-        Py_ssize_t length;
-        int kind;
-        void *data1, *data2;
-        if (unlikely(__Pyx_PyUnicode_READY(s1) < 0) || unlikely(__Pyx_PyUnicode_READY(s2) < 0))
-            return -1;
-        length = __Pyx_PyUnicode_GET_LENGTH(s1);
-        if (length != __Pyx_PyUnicode_GET_LENGTH(s2)) {
-            goto return_ne;
-        }
-#if CYTHON_USE_UNICODE_INTERNALS
-        {
-            Py_hash_t hash1, hash2;
-        #if CYTHON_PEP393_ENABLED
-            hash1 = ((PyASCIIObject*)s1)->hash;
-            hash2 = ((PyASCIIObject*)s2)->hash;
-        #else
-            hash1 = ((PyUnicodeObject*)s1)->hash;
-            hash2 = ((PyUnicodeObject*)s2)->hash;
-        #endif
-            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
-                goto return_ne;
-            }
+) {
+  PyObject *__pyx_v_typecode = 0;
+  PyObject *__pyx_v_data = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[2] = {0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("pack_ext_type (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_typecode,&__pyx_n_s_data,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  2: values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_typecode)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
         }
-#endif
-        kind = __Pyx_PyUnicode_KIND(s1);
-        if (kind != __Pyx_PyUnicode_KIND(s2)) {
-            goto return_ne;
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 455, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_data)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
+          kw_args--;
         }
-        data1 = __Pyx_PyUnicode_DATA(s1);
-        data2 = __Pyx_PyUnicode_DATA(s2);
-        if (__Pyx_PyUnicode_READ(kind, data1, 0) != __Pyx_PyUnicode_READ(kind, data2, 0)) {
-            goto return_ne;
-        } else if (length == 1) {
-            goto return_eq;
-        } else {
-            int result = memcmp(data1, data2, (size_t)(length * kind));
-            #if PY_MAJOR_VERSION < 3
-            Py_XDECREF(owned_ref);
-            #endif
-            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 455, __pyx_L3_error)
+        else {
+          __Pyx_RaiseArgtupleInvalid("pack_ext_type", 1, 2, 2, 1); __PYX_ERR(0, 455, __pyx_L3_error)
         }
-    } else if ((s1 == Py_None) & s2_is_unicode) {
-        goto return_ne;
-    } else if ((s2 == Py_None) & s1_is_unicode) {
-        goto return_ne;
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "pack_ext_type") < 0)) __PYX_ERR(0, 455, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 2)) {
+      goto __pyx_L5_argtuple_error;
     } else {
-        int result;
-        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
-        #if PY_MAJOR_VERSION < 3
-        Py_XDECREF(owned_ref);
-        #endif
-        if (!py_result)
-            return -1;
-        result = __Pyx_PyObject_IsTrue(py_result);
-        Py_DECREF(py_result);
-        return result;
-    }
-return_eq:
-    #if PY_MAJOR_VERSION < 3
-    Py_XDECREF(owned_ref);
-    #endif
-    return (equals == Py_EQ);
-return_ne:
-    #if PY_MAJOR_VERSION < 3
-    Py_XDECREF(owned_ref);
-    #endif
-    return (equals == Py_NE);
-#endif
-}
-
-/* fastcall */
-#if CYTHON_METH_FASTCALL
-static CYTHON_INLINE PyObject * __Pyx_GetKwValue_FASTCALL(PyObject *kwnames, PyObject *const *kwvalues, PyObject *s)
-{
-    Py_ssize_t i, n = PyTuple_GET_SIZE(kwnames);
-    for (i = 0; i < n; i++)
-    {
-        if (s == PyTuple_GET_ITEM(kwnames, i)) return kwvalues[i];
-    }
-    for (i = 0; i < n; i++)
-    {
-        int eq = __Pyx_PyUnicode_Equals(s, PyTuple_GET_ITEM(kwnames, i), Py_EQ);
-        if (unlikely(eq != 0)) {
-            if (unlikely(eq < 0)) return NULL;
-            return kwvalues[i];
-        }
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+      values[1] = __Pyx_Arg_FASTCALL(__pyx_args, 1);
     }
-    return NULL;
-}
-#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030d0000
-CYTHON_UNUSED static PyObject *__Pyx_KwargsAsDict_FASTCALL(PyObject *kwnames, PyObject *const *kwvalues) {
-    Py_ssize_t i, nkwargs = PyTuple_GET_SIZE(kwnames);
-    PyObject *dict;
-    dict = PyDict_New();
-    if (unlikely(!dict))
-        return NULL;
-    for (i=0; i<nkwargs; i++) {
-        PyObject *key = PyTuple_GET_ITEM(kwnames, i);
-        if (unlikely(PyDict_SetItem(dict, key, kwvalues[i]) < 0))
-            goto bad;
+    __pyx_v_typecode = values[0];
+    __pyx_v_data = values[1];
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("pack_ext_type", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 455, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
     }
-    return dict;
-bad:
-    Py_DECREF(dict);
-    return NULL;
-}
-#endif
-#endif
+  }
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.pack_ext_type", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_14pack_ext_type(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self), __pyx_v_typecode, __pyx_v_data);
 
-/* RaiseArgTupleInvalid */
-static void __Pyx_RaiseArgtupleInvalid(
-    const char* func_name,
-    int exact,
-    Py_ssize_t num_min,
-    Py_ssize_t num_max,
-    Py_ssize_t num_found)
-{
-    Py_ssize_t num_expected;
-    const char *more_or_less;
-    if (num_found < num_min) {
-        num_expected = num_min;
-        more_or_less = "at least";
-    } else {
-        num_expected = num_max;
-        more_or_less = "at most";
-    }
-    if (exact) {
-        more_or_less = "exactly";
+  /* function exit code */
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
     }
-    PyErr_Format(PyExc_TypeError,
-                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
-                 func_name, more_or_less, num_expected,
-                 (num_expected == 1) ? "" : "s", num_found);
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
 
-/* KeywordStringCheck */
-static int __Pyx_CheckKeywordStrings(
-    PyObject *kw,
-    const char* function_name,
-    int kw_allowed)
-{
-    PyObject* key = 0;
-    Py_ssize_t pos = 0;
-#if CYTHON_COMPILING_IN_PYPY
-    if (!kw_allowed && PyDict_Next(kw, &pos, &key, 0))
-        goto invalid_keyword;
-    return 1;
-#else
-    if (CYTHON_METH_FASTCALL && likely(PyTuple_Check(kw))) {
-        Py_ssize_t kwsize;
-#if CYTHON_ASSUME_SAFE_MACROS
-        kwsize = PyTuple_GET_SIZE(kw);
-#else
-        kwsize = PyTuple_Size(kw);
-        if (kwsize < 0) return 0;
-#endif
-        if (unlikely(kwsize == 0))
-            return 1;
-        if (!kw_allowed) {
-#if CYTHON_ASSUME_SAFE_MACROS
-            key = PyTuple_GET_ITEM(kw, 0);
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_14pack_ext_type(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_typecode, PyObject *__pyx_v_data) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  char __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  char *__pyx_t_3;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("pack_ext_type", 1);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":456
+ * 
+ *     def pack_ext_type(self, typecode, data):
+ *         msgpack_pack_ext(&self.pk, typecode, len(data))             # <<<<<<<<<<<<<<
+ *         msgpack_pack_raw_body(&self.pk, data, len(data))
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyInt_As_char(__pyx_v_typecode); if (unlikely((__pyx_t_1 == (char)-1) && PyErr_Occurred())) __PYX_ERR(0, 456, __pyx_L1_error)
+  __pyx_t_2 = PyObject_Length(__pyx_v_data); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 456, __pyx_L1_error)
+  (void)(msgpack_pack_ext((&__pyx_v_self->pk), __pyx_t_1, __pyx_t_2));
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":457
+ *     def pack_ext_type(self, typecode, data):
+ *         msgpack_pack_ext(&self.pk, typecode, len(data))
+ *         msgpack_pack_raw_body(&self.pk, data, len(data))             # <<<<<<<<<<<<<<
+ * 
+ *     def pack_array_header(self, size_t size):
+ */
+  __pyx_t_3 = __Pyx_PyObject_AsWritableString(__pyx_v_data); if (unlikely((!__pyx_t_3) && PyErr_Occurred())) __PYX_ERR(0, 457, __pyx_L1_error)
+  __pyx_t_2 = PyObject_Length(__pyx_v_data); if (unlikely(__pyx_t_2 == ((Py_ssize_t)-1))) __PYX_ERR(0, 457, __pyx_L1_error)
+  (void)(msgpack_pack_raw_body((&__pyx_v_self->pk), __pyx_t_3, __pyx_t_2));
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":455
+ *             self.segments = None
+ * 
+ *     def pack_ext_type(self, typecode, data):             # <<<<<<<<<<<<<<
+ *         msgpack_pack_ext(&self.pk, typecode, len(data))
+ *         msgpack_pack_raw_body(&self.pk, data, len(data))
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.pack_ext_type", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":459
+ *         msgpack_pack_raw_body(&self.pk, data, len(data))
+ * 
+ *     def pack_array_header(self, size_t size):             # <<<<<<<<<<<<<<
+ *         if size > (2**32) - 1:
+ *             raise ValueError
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_17pack_array_header(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
-            key = PyTuple_GetItem(kw, pos);
-            if (!key) return 0;
+PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
-            goto invalid_keyword;
-        }
-#if PY_VERSION_HEX < 0x03090000
-        for (pos = 0; pos < kwsize; pos++) {
-#if CYTHON_ASSUME_SAFE_MACROS
-            key = PyTuple_GET_ITEM(kw, pos);
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_16pack_array_header, "Packer.pack_array_header(self, size_t size)");
+static PyMethodDef __pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_17pack_array_header = {"pack_array_header", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_17pack_array_header, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_16pack_array_header};
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_17pack_array_header(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
-            key = PyTuple_GetItem(kw, pos);
-            if (!key) return 0;
+PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
-            if (unlikely(!PyUnicode_Check(key)))
-                goto invalid_keyword_type;
+) {
+  size_t __pyx_v_size;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[1] = {0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("pack_array_header (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_size,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_size)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
         }
-#endif
-        return 1;
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 459, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "pack_array_header") < 0)) __PYX_ERR(0, 459, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
     }
-    while (PyDict_Next(kw, &pos, &key, 0)) {
-        #if PY_MAJOR_VERSION < 3
-        if (unlikely(!PyString_Check(key)))
-        #endif
-            if (unlikely(!PyUnicode_Check(key)))
-                goto invalid_keyword_type;
+    __pyx_v_size = __Pyx_PyInt_As_size_t(values[0]); if (unlikely((__pyx_v_size == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 459, __pyx_L3_error)
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("pack_array_header", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 459, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
     }
-    if (!kw_allowed && unlikely(key))
-        goto invalid_keyword;
-    return 1;
-invalid_keyword_type:
-    PyErr_Format(PyExc_TypeError,
-        "%.200s() keywords must be strings", function_name);
-    return 0;
-#endif
-invalid_keyword:
-    #if PY_MAJOR_VERSION < 3
-    PyErr_Format(PyExc_TypeError,
-        "%.200s() got an unexpected keyword argument '%.200s'",
-        function_name, PyString_AsString(key));
-    #else
-    PyErr_Format(PyExc_TypeError,
-        "%s() got an unexpected keyword argument '%U'",
-        function_name, key);
-    #endif
-    return 0;
-}
+  }
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.pack_array_header", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_16pack_array_header(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self), __pyx_v_size);
 
-/* PyObjectCall */
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
-    PyObject *result;
-    ternaryfunc call = Py_TYPE(func)->tp_call;
-    if (unlikely(!call))
-        return PyObject_Call(func, arg, kw);
-    #if PY_MAJOR_VERSION < 3
-    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
-        return NULL;
-    #else
-    if (unlikely(Py_EnterRecursiveCall(" while calling a Python object")))
-        return NULL;
-    #endif
-    result = (*call)(func, arg, kw);
-    Py_LeaveRecursiveCall();
-    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
-        PyErr_SetString(
-            PyExc_SystemError,
-            "NULL result without error in PyObject_Call");
+  /* function exit code */
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
     }
-    return result;
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
 }
-#endif
 
-/* RaiseException */
-#if PY_MAJOR_VERSION < 3
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
-    __Pyx_PyThreadState_declare
-    CYTHON_UNUSED_VAR(cause);
-    Py_XINCREF(type);
-    if (!value || value == Py_None)
-        value = NULL;
-    else
-        Py_INCREF(value);
-    if (!tb || tb == Py_None)
-        tb = NULL;
-    else {
-        Py_INCREF(tb);
-        if (!PyTraceBack_Check(tb)) {
-            PyErr_SetString(PyExc_TypeError,
-                "raise: arg 3 must be a traceback or None");
-            goto raise_error;
-        }
-    }
-    if (PyType_Check(type)) {
-#if CYTHON_COMPILING_IN_PYPY
-        if (!value) {
-            Py_INCREF(Py_None);
-            value = Py_None;
-        }
-#endif
-        PyErr_NormalizeException(&type, &value, &tb);
-    } else {
-        if (value) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto raise_error;
-        }
-        value = type;
-        type = (PyObject*) Py_TYPE(type);
-        Py_INCREF(type);
-        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
-            PyErr_SetString(PyExc_TypeError,
-                "raise: exception class must be a subclass of BaseException");
-            goto raise_error;
-        }
-    }
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_16pack_array_header(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, size_t __pyx_v_size) {
+  int __pyx_v_ret;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("pack_array_header", 1);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":460
+ * 
+ *     def pack_array_header(self, size_t size):
+ *         if size > (2**32) - 1:             # <<<<<<<<<<<<<<
+ *             raise ValueError
+ *         cdef int ret = msgpack_pack_array(&self.pk, size)
+ */
+  __pyx_t_1 = __Pyx_PyInt_FromSize_t(__pyx_v_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 460, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_RichCompare(__pyx_t_1, __pyx_int_4294967295, Py_GT); __Pyx_XGOTREF(__pyx_t_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 460, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_3 < 0))) __PYX_ERR(0, 460, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (unlikely(__pyx_t_3)) {
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":461
+ *     def pack_array_header(self, size_t size):
+ *         if size > (2**32) - 1:
+ *             raise ValueError             # <<<<<<<<<<<<<<
+ *         cdef int ret = msgpack_pack_array(&self.pk, size)
+ *         if ret == -1:
+ */
+    __Pyx_Raise(__pyx_builtin_ValueError, 0, 0, 0);
+    __PYX_ERR(0, 461, __pyx_L1_error)
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":460
+ * 
+ *     def pack_array_header(self, size_t size):
+ *         if size > (2**32) - 1:             # <<<<<<<<<<<<<<
+ *             raise ValueError
+ *         cdef int ret = msgpack_pack_array(&self.pk, size)
+ */
+  }
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":462
+ *         if size > (2**32) - 1:
+ *             raise ValueError
+ *         cdef int ret = msgpack_pack_array(&self.pk, size)             # <<<<<<<<<<<<<<
+ *         if ret == -1:
+ *             raise MemoryError
+ */
+  __pyx_v_ret = msgpack_pack_array((&__pyx_v_self->pk), __pyx_v_size);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":463
+ *             raise ValueError
+ *         cdef int ret = msgpack_pack_array(&self.pk, size)
+ *         if ret == -1:             # <<<<<<<<<<<<<<
+ *             raise MemoryError
+ *         elif ret:  # should not happen
+ */
+  __pyx_t_3 = (__pyx_v_ret == -1L);
+  if (unlikely(__pyx_t_3)) {
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":464
+ *         cdef int ret = msgpack_pack_array(&self.pk, size)
+ *         if ret == -1:
+ *             raise MemoryError             # <<<<<<<<<<<<<<
+ *         elif ret:  # should not happen
+ *             raise TypeError
+ */
+    PyErr_NoMemory(); __PYX_ERR(0, 464, __pyx_L1_error)
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":463
+ *             raise ValueError
+ *         cdef int ret = msgpack_pack_array(&self.pk, size)
+ *         if ret == -1:             # <<<<<<<<<<<<<<
+ *             raise MemoryError
+ *         elif ret:  # should not happen
+ */
+  }
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":465
+ *         if ret == -1:
+ *             raise MemoryError
+ *         elif ret:  # should not happen             # <<<<<<<<<<<<<<
+ *             raise TypeError
+ *         if self._streaming():
+ */
+  __pyx_t_3 = (__pyx_v_ret != 0);
+  if (unlikely(__pyx_t_3)) {
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":466
+ *             raise MemoryError
+ *         elif ret:  # should not happen
+ *             raise TypeError             # <<<<<<<<<<<<<<
+ *         if self._streaming():
+ *             self._flush()
+ */
+    __Pyx_Raise(__pyx_builtin_TypeError, 0, 0, 0);
+    __PYX_ERR(0, 466, __pyx_L1_error)
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":465
+ *         if ret == -1:
+ *             raise MemoryError
+ *         elif ret:  # should not happen             # <<<<<<<<<<<<<<
+ *             raise TypeError
+ *         if self._streaming():
+ */
+  }
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":467
+ *         elif ret:  # should not happen
+ *             raise TypeError
+ *         if self._streaming():             # <<<<<<<<<<<<<<
+ *             self._flush()
+ *         elif self.autoreset:
+ */
+  __pyx_t_3 = __pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__streaming(__pyx_v_self); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 467, __pyx_L1_error)
+  if (__pyx_t_3) {
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":468
+ *             raise TypeError
+ *         if self._streaming():
+ *             self._flush()             # <<<<<<<<<<<<<<
+ *         elif self.autoreset:
+ *             return self._take()
+ */
+    __pyx_t_2 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_flush(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 468, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":467
+ *         elif ret:  # should not happen
+ *             raise TypeError
+ *         if self._streaming():             # <<<<<<<<<<<<<<
+ *             self._flush()
+ *         elif self.autoreset:
+ */
+    goto __pyx_L5;
+  }
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":469
+ *         if self._streaming():
+ *             self._flush()
+ *         elif self.autoreset:             # <<<<<<<<<<<<<<
+ *             return self._take()
+ * 
+ */
+  if (__pyx_v_self->autoreset) {
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":470
+ *             self._flush()
+ *         elif self.autoreset:
+ *             return self._take()             # <<<<<<<<<<<<<<
+ * 
+ *     def pack_map_header(self, size_t size):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_take(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 470, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":469
+ *         if self._streaming():
+ *             self._flush()
+ *         elif self.autoreset:             # <<<<<<<<<<<<<<
+ *             return self._take()
+ * 
+ */
+  }
+  __pyx_L5:;
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":459
+ *         msgpack_pack_raw_body(&self.pk, data, len(data))
+ * 
+ *     def pack_array_header(self, size_t size):             # <<<<<<<<<<<<<<
+ *         if size > (2**32) - 1:
+ *             raise ValueError
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.pack_array_header", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":472
+ *             return self._take()
+ * 
+ *     def pack_map_header(self, size_t size):             # <<<<<<<<<<<<<<
+ *         if size > (2**32) - 1:
+ *             raise ValueError
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_19pack_map_header(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_18pack_map_header, "Packer.pack_map_header(self, size_t size)");
+static PyMethodDef __pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_19pack_map_header = {"pack_map_header", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_19pack_map_header, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_18pack_map_header};
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_19pack_map_header(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  size_t __pyx_v_size;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[1] = {0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("pack_map_header (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_size,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_size)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 472, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "pack_map_header") < 0)) __PYX_ERR(0, 472, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+    }
+    __pyx_v_size = __Pyx_PyInt_As_size_t(values[0]); if (unlikely((__pyx_v_size == (size_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 472, __pyx_L3_error)
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("pack_map_header", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 472, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.pack_map_header", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_18pack_map_header(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self), __pyx_v_size);
+
+  /* function exit code */
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_18pack_map_header(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, size_t __pyx_v_size) {
+  int __pyx_v_ret;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("pack_map_header", 1);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":473
+ * 
+ *     def pack_map_header(self, size_t size):
+ *         if size > (2**32) - 1:             # <<<<<<<<<<<<<<
+ *             raise ValueError
+ *         cdef int ret = msgpack_pack_map(&self.pk, size)
+ */
+  __pyx_t_1 = __Pyx_PyInt_FromSize_t(__pyx_v_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 473, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyObject_RichCompare(__pyx_t_1, __pyx_int_4294967295, Py_GT); __Pyx_XGOTREF(__pyx_t_2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 473, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_3 = __Pyx_PyObject_IsTrue(__pyx_t_2); if (unlikely((__pyx_t_3 < 0))) __PYX_ERR(0, 473, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (unlikely(__pyx_t_3)) {
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":474
+ *     def pack_map_header(self, size_t size):
+ *         if size > (2**32) - 1:
+ *             raise ValueError             # <<<<<<<<<<<<<<
+ *         cdef int ret = msgpack_pack_map(&self.pk, size)
+ *         if ret == -1:
+ */
+    __Pyx_Raise(__pyx_builtin_ValueError, 0, 0, 0);
+    __PYX_ERR(0, 474, __pyx_L1_error)
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":473
+ * 
+ *     def pack_map_header(self, size_t size):
+ *         if size > (2**32) - 1:             # <<<<<<<<<<<<<<
+ *             raise ValueError
+ *         cdef int ret = msgpack_pack_map(&self.pk, size)
+ */
+  }
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":475
+ *         if size > (2**32) - 1:
+ *             raise ValueError
+ *         cdef int ret = msgpack_pack_map(&self.pk, size)             # <<<<<<<<<<<<<<
+ *         if ret == -1:
+ *             raise MemoryError
+ */
+  __pyx_v_ret = msgpack_pack_map((&__pyx_v_self->pk), __pyx_v_size);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":476
+ *             raise ValueError
+ *         cdef int ret = msgpack_pack_map(&self.pk, size)
+ *         if ret == -1:             # <<<<<<<<<<<<<<
+ *             raise MemoryError
+ *         elif ret:  # should not happen
+ */
+  __pyx_t_3 = (__pyx_v_ret == -1L);
+  if (unlikely(__pyx_t_3)) {
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":477
+ *         cdef int ret = msgpack_pack_map(&self.pk, size)
+ *         if ret == -1:
+ *             raise MemoryError             # <<<<<<<<<<<<<<
+ *         elif ret:  # should not happen
+ *             raise TypeError
+ */
+    PyErr_NoMemory(); __PYX_ERR(0, 477, __pyx_L1_error)
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":476
+ *             raise ValueError
+ *         cdef int ret = msgpack_pack_map(&self.pk, size)
+ *         if ret == -1:             # <<<<<<<<<<<<<<
+ *             raise MemoryError
+ *         elif ret:  # should not happen
+ */
+  }
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":478
+ *         if ret == -1:
+ *             raise MemoryError
+ *         elif ret:  # should not happen             # <<<<<<<<<<<<<<
+ *             raise TypeError
+ *         if self._streaming():
+ */
+  __pyx_t_3 = (__pyx_v_ret != 0);
+  if (unlikely(__pyx_t_3)) {
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":479
+ *             raise MemoryError
+ *         elif ret:  # should not happen
+ *             raise TypeError             # <<<<<<<<<<<<<<
+ *         if self._streaming():
+ *             self._flush()
+ */
+    __Pyx_Raise(__pyx_builtin_TypeError, 0, 0, 0);
+    __PYX_ERR(0, 479, __pyx_L1_error)
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":478
+ *         if ret == -1:
+ *             raise MemoryError
+ *         elif ret:  # should not happen             # <<<<<<<<<<<<<<
+ *             raise TypeError
+ *         if self._streaming():
+ */
+  }
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":480
+ *         elif ret:  # should not happen
+ *             raise TypeError
+ *         if self._streaming():             # <<<<<<<<<<<<<<
+ *             self._flush()
+ *         elif self.autoreset:
+ */
+  __pyx_t_3 = __pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__streaming(__pyx_v_self); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 480, __pyx_L1_error)
+  if (__pyx_t_3) {
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":481
+ *             raise TypeError
+ *         if self._streaming():
+ *             self._flush()             # <<<<<<<<<<<<<<
+ *         elif self.autoreset:
+ *             return self._take()
+ */
+    __pyx_t_2 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_flush(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 481, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":480
+ *         elif ret:  # should not happen
+ *             raise TypeError
+ *         if self._streaming():             # <<<<<<<<<<<<<<
+ *             self._flush()
+ *         elif self.autoreset:
+ */
+    goto __pyx_L5;
+  }
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":482
+ *         if self._streaming():
+ *             self._flush()
+ *         elif self.autoreset:             # <<<<<<<<<<<<<<
+ *             return self._take()
+ * 
+ */
+  if (__pyx_v_self->autoreset) {
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":483
+ *             self._flush()
+ *         elif self.autoreset:
+ *             return self._take()             # <<<<<<<<<<<<<<
+ * 
+ *     def pack_map_pairs(self, object pairs):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_2 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_take(__pyx_v_self); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 483, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_r = __pyx_t_2;
+    __pyx_t_2 = 0;
+    goto __pyx_L0;
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":482
+ *         if self._streaming():
+ *             self._flush()
+ *         elif self.autoreset:             # <<<<<<<<<<<<<<
+ *             return self._take()
+ * 
+ */
+  }
+  __pyx_L5:;
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":472
+ *             return self._take()
+ * 
+ *     def pack_map_header(self, size_t size):             # <<<<<<<<<<<<<<
+ *         if size > (2**32) - 1:
+ *             raise ValueError
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.pack_map_header", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":485
+ *             return self._take()
+ * 
+ *     def pack_map_pairs(self, object pairs):             # <<<<<<<<<<<<<<
+ *         """
+ *         Pack *pairs* as msgpack map type.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_21pack_map_pairs(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_20pack_map_pairs, "Packer.pack_map_pairs(self, pairs)\n\n        Pack *pairs* as msgpack map type.\n\n        *pairs* should sequence of pair.\n        (`len(pairs)` and `for k, v in pairs:` should be supported.)\n        ");
+static PyMethodDef __pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_21pack_map_pairs = {"pack_map_pairs", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_21pack_map_pairs, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_20pack_map_pairs};
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_21pack_map_pairs(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v_pairs = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[1] = {0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("pack_map_pairs (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pairs,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_pairs)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 485, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "pack_map_pairs") < 0)) __PYX_ERR(0, 485, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+    }
+    __pyx_v_pairs = values[0];
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("pack_map_pairs", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 485, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.pack_map_pairs", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_20pack_map_pairs(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self), __pyx_v_pairs);
+
+  /* function exit code */
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_20pack_map_pairs(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, PyObject *__pyx_v_pairs) {
+  int __pyx_v_ret;
+  PyObject *__pyx_v_k = NULL;
+  PyObject *__pyx_v_v = NULL;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  Py_ssize_t __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *(*__pyx_t_4)(PyObject *);
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *(*__pyx_t_9)(PyObject *);
+  int __pyx_t_10;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("pack_map_pairs", 1);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":492
+ *         (`len(pairs)` and `for k, v in pairs:` should be supported.)
+ *         """
+ *         cdef int ret = msgpack_pack_map(&self.pk, len(pairs))             # <<<<<<<<<<<<<<
+ *         if ret == 0:
+ *             for k, v in pairs:
+ */
+  __pyx_t_1 = PyObject_Length(__pyx_v_pairs); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 492, __pyx_L1_error)
+  __pyx_v_ret = msgpack_pack_map((&__pyx_v_self->pk), __pyx_t_1);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":493
+ *         """
+ *         cdef int ret = msgpack_pack_map(&self.pk, len(pairs))
+ *         if ret == 0:             # <<<<<<<<<<<<<<
+ *             for k, v in pairs:
+ *                 ret = self._pack(k)
+ */
+  __pyx_t_2 = (__pyx_v_ret == 0);
+  if (__pyx_t_2) {
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":494
+ *         cdef int ret = msgpack_pack_map(&self.pk, len(pairs))
+ *         if ret == 0:
+ *             for k, v in pairs:             # <<<<<<<<<<<<<<
+ *                 ret = self._pack(k)
+ *                 if ret != 0: break
+ */
+    if (likely(PyList_CheckExact(__pyx_v_pairs)) || PyTuple_CheckExact(__pyx_v_pairs)) {
+      __pyx_t_3 = __pyx_v_pairs; __Pyx_INCREF(__pyx_t_3);
+      __pyx_t_1 = 0;
+      __pyx_t_4 = NULL;
+    } else {
+      __pyx_t_1 = -1; __pyx_t_3 = PyObject_GetIter(__pyx_v_pairs); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 494, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_4 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 494, __pyx_L1_error)
+    }
+    for (;;) {
+      if (likely(!__pyx_t_4)) {
+        if (likely(PyList_CheckExact(__pyx_t_3))) {
+          {
+            Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_3);
+            #if !CYTHON_ASSUME_SAFE_MACROS
+            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 494, __pyx_L1_error)
+            #endif
+            if (__pyx_t_1 >= __pyx_temp) break;
+          }
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_5 = PyList_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_5); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 494, __pyx_L1_error)
+          #else
+          __pyx_t_5 = __Pyx_PySequence_ITEM(__pyx_t_3, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 494, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          #endif
+        } else {
+          {
+            Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_3);
+            #if !CYTHON_ASSUME_SAFE_MACROS
+            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 494, __pyx_L1_error)
+            #endif
+            if (__pyx_t_1 >= __pyx_temp) break;
+          }
+          #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+          __pyx_t_5 = PyTuple_GET_ITEM(__pyx_t_3, __pyx_t_1); __Pyx_INCREF(__pyx_t_5); __pyx_t_1++; if (unlikely((0 < 0))) __PYX_ERR(0, 494, __pyx_L1_error)
+          #else
+          __pyx_t_5 = __Pyx_PySequence_ITEM(__pyx_t_3, __pyx_t_1); __pyx_t_1++; if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 494, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_5);
+          #endif
+        }
+      } else {
+        __pyx_t_5 = __pyx_t_4(__pyx_t_3);
+        if (unlikely(!__pyx_t_5)) {
+          PyObject* exc_type = PyErr_Occurred();
+          if (exc_type) {
+            if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
+            else __PYX_ERR(0, 494, __pyx_L1_error)
+          }
+          break;
+        }
+        __Pyx_GOTREF(__pyx_t_5);
+      }
+      if ((likely(PyTuple_CheckExact(__pyx_t_5))) || (PyList_CheckExact(__pyx_t_5))) {
+        PyObject* sequence = __pyx_t_5;
+        Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
+        if (unlikely(size != 2)) {
+          if (size > 2) __Pyx_RaiseTooManyValuesError(2);
+          else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
+          __PYX_ERR(0, 494, __pyx_L1_error)
+        }
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        if (likely(PyTuple_CheckExact(sequence))) {
+          __pyx_t_6 = PyTuple_GET_ITEM(sequence, 0); 
+          __pyx_t_7 = PyTuple_GET_ITEM(sequence, 1); 
+        } else {
+          __pyx_t_6 = PyList_GET_ITEM(sequence, 0); 
+          __pyx_t_7 = PyList_GET_ITEM(sequence, 1); 
+        }
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(__pyx_t_7);
+        #else
+        __pyx_t_6 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 494, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_6);
+        __pyx_t_7 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 494, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_7);
+        #endif
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+      } else {
+        Py_ssize_t index = -1;
+        __pyx_t_8 = PyObject_GetIter(__pyx_t_5); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 494, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_8);
+        __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+        __pyx_t_9 = __Pyx_PyObject_GetIterNextFunc(__pyx_t_8);
+        index = 0; __pyx_t_6 = __pyx_t_9(__pyx_t_8); if (unlikely(!__pyx_t_6)) goto __pyx_L6_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_6);
+        index = 1; __pyx_t_7 = __pyx_t_9(__pyx_t_8); if (unlikely(!__pyx_t_7)) goto __pyx_L6_unpacking_failed;
+        __Pyx_GOTREF(__pyx_t_7);
+        if (__Pyx_IternextUnpackEndCheck(__pyx_t_9(__pyx_t_8), 2) < 0) __PYX_ERR(0, 494, __pyx_L1_error)
+        __pyx_t_9 = NULL;
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        goto __pyx_L7_unpacking_done;
+        __pyx_L6_unpacking_failed:;
+        __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+        __pyx_t_9 = NULL;
+        if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
+        __PYX_ERR(0, 494, __pyx_L1_error)
+        __pyx_L7_unpacking_done:;
+      }
+      __Pyx_XDECREF_SET(__pyx_v_k, __pyx_t_6);
+      __pyx_t_6 = 0;
+      __Pyx_XDECREF_SET(__pyx_v_v, __pyx_t_7);
+      __pyx_t_7 = 0;
+
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":495
+ *         if ret == 0:
+ *             for k, v in pairs:
+ *                 ret = self._pack(k)             # <<<<<<<<<<<<<<
+ *                 if ret != 0: break
+ *                 ret = self._pack(v)
+ */
+      __pyx_t_10 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_pack(__pyx_v_self, __pyx_v_k, NULL); if (unlikely(__pyx_t_10 == ((int)-1))) __PYX_ERR(0, 495, __pyx_L1_error)
+      __pyx_v_ret = __pyx_t_10;
+
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":496
+ *             for k, v in pairs:
+ *                 ret = self._pack(k)
+ *                 if ret != 0: break             # <<<<<<<<<<<<<<
+ *                 ret = self._pack(v)
+ *                 if ret != 0: break
+ */
+      __pyx_t_2 = (__pyx_v_ret != 0);
+      if (__pyx_t_2) {
+        goto __pyx_L5_break;
+      }
+
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":497
+ *                 ret = self._pack(k)
+ *                 if ret != 0: break
+ *                 ret = self._pack(v)             # <<<<<<<<<<<<<<
+ *                 if ret != 0: break
+ *         if ret == -1:
+ */
+      __pyx_t_10 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_pack(__pyx_v_self, __pyx_v_v, NULL); if (unlikely(__pyx_t_10 == ((int)-1))) __PYX_ERR(0, 497, __pyx_L1_error)
+      __pyx_v_ret = __pyx_t_10;
+
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":498
+ *                 if ret != 0: break
+ *                 ret = self._pack(v)
+ *                 if ret != 0: break             # <<<<<<<<<<<<<<
+ *         if ret == -1:
+ *             raise MemoryError
+ */
+      __pyx_t_2 = (__pyx_v_ret != 0);
+      if (__pyx_t_2) {
+        goto __pyx_L5_break;
+      }
+
+      /* "isf_pandas_msgpack/msgpack/_packer.pyx":494
+ *         cdef int ret = msgpack_pack_map(&self.pk, len(pairs))
+ *         if ret == 0:
+ *             for k, v in pairs:             # <<<<<<<<<<<<<<
+ *                 ret = self._pack(k)
+ *                 if ret != 0: break
+ */
+    }
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    goto __pyx_L10_for_end;
+    __pyx_L5_break:;
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    goto __pyx_L10_for_end;
+    __pyx_L10_for_end:;
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":493
+ *         """
+ *         cdef int ret = msgpack_pack_map(&self.pk, len(pairs))
+ *         if ret == 0:             # <<<<<<<<<<<<<<
+ *             for k, v in pairs:
+ *                 ret = self._pack(k)
+ */
+  }
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":499
+ *                 ret = self._pack(v)
+ *                 if ret != 0: break
+ *         if ret == -1:             # <<<<<<<<<<<<<<
+ *             raise MemoryError
+ *         elif ret:  # should not happen
+ */
+  __pyx_t_2 = (__pyx_v_ret == -1L);
+  if (unlikely(__pyx_t_2)) {
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":500
+ *                 if ret != 0: break
+ *         if ret == -1:
+ *             raise MemoryError             # <<<<<<<<<<<<<<
+ *         elif ret:  # should not happen
+ *             raise TypeError
+ */
+    PyErr_NoMemory(); __PYX_ERR(0, 500, __pyx_L1_error)
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":499
+ *                 ret = self._pack(v)
+ *                 if ret != 0: break
+ *         if ret == -1:             # <<<<<<<<<<<<<<
+ *             raise MemoryError
+ *         elif ret:  # should not happen
+ */
+  }
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":501
+ *         if ret == -1:
+ *             raise MemoryError
+ *         elif ret:  # should not happen             # <<<<<<<<<<<<<<
+ *             raise TypeError
+ *         if self._streaming():
+ */
+  __pyx_t_2 = (__pyx_v_ret != 0);
+  if (unlikely(__pyx_t_2)) {
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":502
+ *             raise MemoryError
+ *         elif ret:  # should not happen
+ *             raise TypeError             # <<<<<<<<<<<<<<
+ *         if self._streaming():
+ *             self._flush()
+ */
+    __Pyx_Raise(__pyx_builtin_TypeError, 0, 0, 0);
+    __PYX_ERR(0, 502, __pyx_L1_error)
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":501
+ *         if ret == -1:
+ *             raise MemoryError
+ *         elif ret:  # should not happen             # <<<<<<<<<<<<<<
+ *             raise TypeError
+ *         if self._streaming():
+ */
+  }
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":503
+ *         elif ret:  # should not happen
+ *             raise TypeError
+ *         if self._streaming():             # <<<<<<<<<<<<<<
+ *             self._flush()
+ *         elif self.autoreset:
+ */
+  __pyx_t_2 = __pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__streaming(__pyx_v_self); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 503, __pyx_L1_error)
+  if (__pyx_t_2) {
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":504
+ *             raise TypeError
+ *         if self._streaming():
+ *             self._flush()             # <<<<<<<<<<<<<<
+ *         elif self.autoreset:
+ *             return self._take()
+ */
+    __pyx_t_3 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_flush(__pyx_v_self); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 504, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":503
+ *         elif ret:  # should not happen
+ *             raise TypeError
+ *         if self._streaming():             # <<<<<<<<<<<<<<
+ *             self._flush()
+ *         elif self.autoreset:
+ */
+    goto __pyx_L12;
+  }
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":505
+ *         if self._streaming():
+ *             self._flush()
+ *         elif self.autoreset:             # <<<<<<<<<<<<<<
+ *             return self._take()
+ * 
+ */
+  if (__pyx_v_self->autoreset) {
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":506
+ *             self._flush()
+ *         elif self.autoreset:
+ *             return self._take()             # <<<<<<<<<<<<<<
+ * 
+ *     def reset(self):
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_t_3 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self->__pyx_vtab)->_take(__pyx_v_self); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 506, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_r = __pyx_t_3;
+    __pyx_t_3 = 0;
+    goto __pyx_L0;
+
+    /* "isf_pandas_msgpack/msgpack/_packer.pyx":505
+ *         if self._streaming():
+ *             self._flush()
+ *         elif self.autoreset:             # <<<<<<<<<<<<<<
+ *             return self._take()
+ * 
+ */
+  }
+  __pyx_L12:;
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":485
+ *             return self._take()
+ * 
+ *     def pack_map_pairs(self, object pairs):             # <<<<<<<<<<<<<<
+ *         """
+ *         Pack *pairs* as msgpack map type.
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.pack_map_pairs", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_k);
+  __Pyx_XDECREF(__pyx_v_v);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":508
+ *             return self._take()
+ * 
+ *     def reset(self):             # <<<<<<<<<<<<<<
+ *         """Clear internal buffer."""
+ *         self.pk.length = 0
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_23reset(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_22reset, "Packer.reset(self)\nClear internal buffer.");
+static PyMethodDef __pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_23reset = {"reset", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_23reset, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_22reset};
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_23reset(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("reset (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) {
+    __Pyx_RaiseArgtupleInvalid("reset", 1, 0, 0, __pyx_nargs); return NULL;}
+  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "reset", 0))) return NULL;
+  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_22reset(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_22reset(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("reset", 1);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":510
+ *     def reset(self):
+ *         """Clear internal buffer."""
+ *         self.pk.length = 0             # <<<<<<<<<<<<<<
+ * 
+ *     def bytes(self):
+ */
+  __pyx_v_self->pk.length = 0;
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":508
+ *             return self._take()
+ * 
+ *     def reset(self):             # <<<<<<<<<<<<<<
+ *         """Clear internal buffer."""
+ *         self.pk.length = 0
+ */
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "isf_pandas_msgpack/msgpack/_packer.pyx":512
+ *         self.pk.length = 0
+ * 
+ *     def bytes(self):             # <<<<<<<<<<<<<<
+ *         """Return buffer content."""
+ *         return PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_25bytes(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_24bytes, "Packer.bytes(self)\nReturn buffer content.");
+static PyMethodDef __pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_25bytes = {"bytes", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_25bytes, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_24bytes};
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_25bytes(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("bytes (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) {
+    __Pyx_RaiseArgtupleInvalid("bytes", 1, 0, 0, __pyx_nargs); return NULL;}
+  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "bytes", 0))) return NULL;
+  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_24bytes(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_24bytes(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("bytes", 1);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":514
+ *     def bytes(self):
+ *         """Return buffer content."""
+ *         return PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)             # <<<<<<<<<<<<<<
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyBytes_FromStringAndSize(__pyx_v_self->pk.buf, __pyx_v_self->pk.length); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 514, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":512
+ *         self.pk.length = 0
+ * 
+ *     def bytes(self):             # <<<<<<<<<<<<<<
+ *         """Return buffer content."""
+ *         return PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.bytes", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_27__reduce_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_26__reduce_cython__, "Packer.__reduce_cython__(self)");
+static PyMethodDef __pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_27__reduce_cython__ = {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_27__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_26__reduce_cython__};
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_27__reduce_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) {
+    __Pyx_RaiseArgtupleInvalid("__reduce_cython__", 1, 0, 0, __pyx_nargs); return NULL;}
+  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__reduce_cython__", 0))) return NULL;
+  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_26__reduce_cython__(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_26__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 1);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ */
+  __Pyx_Raise(__pyx_builtin_TypeError, __pyx_kp_s_no_default___reduce___due_to_non, 0, 0);
+  __PYX_ERR(2, 2, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_29__setstate_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_28__setstate_cython__, "Packer.__setstate_cython__(self, __pyx_state)");
+static PyMethodDef __pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_29__setstate_cython__ = {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_29__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_28__setstate_cython__};
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_29__setstate_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  CYTHON_UNUSED PyObject *__pyx_v___pyx_state = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[1] = {0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_pyx_state,0};
+    if (__pyx_kwds) {
+      Py_ssize_t kw_args;
+      switch (__pyx_nargs) {
+        case  1: values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = __Pyx_NumKwargs_FASTCALL(__pyx_kwds);
+      switch (__pyx_nargs) {
+        case  0:
+        if (likely((values[0] = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_pyx_state)) != 0)) {
+          (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
+          kw_args--;
+        }
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(2, 3, __pyx_L3_error)
+        else goto __pyx_L5_argtuple_error;
+      }
+      if (unlikely(kw_args > 0)) {
+        const Py_ssize_t kwd_pos_args = __pyx_nargs;
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__setstate_cython__") < 0)) __PYX_ERR(2, 3, __pyx_L3_error)
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
+    }
+    __pyx_v___pyx_state = values[0];
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__setstate_cython__", 1, 1, 1, __pyx_nargs); __PYX_ERR(2, 3, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_28__setstate_cython__(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)__pyx_v_self), __pyx_v___pyx_state);
+
+  /* function exit code */
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_28__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 1);
+
+  /* "(tree fragment)":4
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"             # <<<<<<<<<<<<<<
+ */
+  __Pyx_Raise(__pyx_builtin_TypeError, __pyx_kp_s_no_default___reduce___due_to_non, 0, 0);
+  __PYX_ERR(2, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._packer.Packer.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+static struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_7_packer_Packer __pyx_vtable_18isf_pandas_msgpack_7msgpack_7_packer_Packer;
+
+static PyObject *__pyx_tp_new_18isf_pandas_msgpack_7msgpack_7_packer_Packer(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *p;
+  PyObject *o;
+  #if CYTHON_COMPILING_IN_LIMITED_API
+  allocfunc alloc_func = (allocfunc)PyType_GetSlot(t, Py_tp_alloc);
+  o = alloc_func(t, 0);
+  #else
+  if (likely(!__Pyx_PyType_HasFeature(t, Py_TPFLAGS_IS_ABSTRACT))) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
+    o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
+  }
+  if (unlikely(!o)) return 0;
+  #endif
+  p = ((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)o);
+  p->__pyx_vtab = __pyx_vtabptr_18isf_pandas_msgpack_7msgpack_7_packer_Packer;
+  new((void*)&(p->pk)) struct msgpack_packer();
+  p->_default = Py_None; Py_INCREF(Py_None);
+  p->_bencoding = Py_None; Py_INCREF(Py_None);
+  p->_berrors = Py_None; Py_INCREF(Py_None);
+  p->use_float = ((PyBoolObject *)Py_None); Py_INCREF(Py_None);
+  p->stream = Py_None; Py_INCREF(Py_None);
+  p->segments = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  if (unlikely(__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_1__cinit__(o, __pyx_empty_tuple, NULL) < 0)) goto bad;
+  return o;
+  bad:
+  Py_DECREF(o); o = 0;
+  return NULL;
+}
+
+static void __pyx_tp_dealloc_18isf_pandas_msgpack_7msgpack_7_packer_Packer(PyObject *o) {
+  struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *p = (struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely((PY_VERSION_HEX >= 0x03080000 || __Pyx_PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE)) && __Pyx_PyObject_GetSlot(o, tp_finalize, destructor)) && !__Pyx_PyObject_GC_IsFinalized(o)) {
+    if (__Pyx_PyObject_GetSlot(o, tp_dealloc, destructor) == __pyx_tp_dealloc_18isf_pandas_msgpack_7msgpack_7_packer_Packer) {
+      if (PyObject_CallFinalizerFromDealloc(o)) return;
+    }
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  {
+    PyObject *etype, *eval, *etb;
+    PyErr_Fetch(&etype, &eval, &etb);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) + 1);
+    __pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_5__dealloc__(o);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) - 1);
+    PyErr_Restore(etype, eval, etb);
+  }
+  __Pyx_call_destructor(p->pk);
+  Py_CLEAR(p->_default);
+  Py_CLEAR(p->_bencoding);
+  Py_CLEAR(p->_berrors);
+  Py_CLEAR(p->use_float);
+  Py_CLEAR(p->stream);
+  Py_CLEAR(p->segments);
+  #if CYTHON_USE_TYPE_SLOTS || CYTHON_COMPILING_IN_PYPY
+  (*Py_TYPE(o)->tp_free)(o);
+  #else
+  {
+    freefunc tp_free = (freefunc)PyType_GetSlot(Py_TYPE(o), Py_tp_free);
+    if (tp_free) tp_free(o);
+  }
+  #endif
+}
+
+static int __pyx_tp_traverse_18isf_pandas_msgpack_7msgpack_7_packer_Packer(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *p = (struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)o;
+  if (p->_default) {
+    e = (*v)(p->_default, a); if (e) return e;
+  }
+  if (p->_bencoding) {
+    e = (*v)(p->_bencoding, a); if (e) return e;
+  }
+  if (p->_berrors) {
+    e = (*v)(p->_berrors, a); if (e) return e;
+  }
+  if (p->use_float) {
+    e = (*v)(((PyObject *)p->use_float), a); if (e) return e;
+  }
+  if (p->stream) {
+    e = (*v)(p->stream, a); if (e) return e;
+  }
+  if (p->segments) {
+    e = (*v)(p->segments, a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_18isf_pandas_msgpack_7msgpack_7_packer_Packer(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *p = (struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)o;
+  tmp = ((PyObject*)p->_default);
+  p->_default = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->_bencoding);
+  p->_bencoding = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->_berrors);
+  p->_berrors = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->use_float);
+  p->use_float = ((PyBoolObject *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->stream);
+  p->stream = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->segments);
+  p->segments = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyMethodDef __pyx_methods_18isf_pandas_msgpack_7msgpack_7_packer_Packer[] = {
+  {"tell", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_7tell, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_6tell},
+  {"flush", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_9flush, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_8flush},
+  {"pack_segments", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_13pack_segments, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_12pack_segments},
+  {"pack_ext_type", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_15pack_ext_type, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_14pack_ext_type},
+  {"pack_array_header", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_17pack_array_header, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_16pack_array_header},
+  {"pack_map_header", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_19pack_map_header, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_18pack_map_header},
+  {"pack_map_pairs", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_21pack_map_pairs, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_20pack_map_pairs},
+  {"reset", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_23reset, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_22reset},
+  {"bytes", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_25bytes, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_24bytes},
+  {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_27__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_26__reduce_cython__},
+  {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_29__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_28__setstate_cython__},
+  {0, 0, 0, 0}
+};
+#if CYTHON_USE_TYPE_SPECS
+static PyType_Slot __pyx_type_18isf_pandas_msgpack_7msgpack_7_packer_Packer_slots[] = {
+  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_18isf_pandas_msgpack_7msgpack_7_packer_Packer},
+  {Py_tp_doc, (void *)PyDoc_STR("Packer(default=None, encoding='utf-8', unicode_errors='strict', use_single_float=False, bool autoreset=1, bool use_bin_type=0, stream=None, size_t flush_threshold=DEFAULT_FLUSH_THRESHOLD, size_t align=0, size_t offset=0)\n\n    MessagePack Packer\n\n    usage::\n\n        packer = Packer()\n        astream.write(packer.pack(a))\n        astream.write(packer.pack(b))\n\n    Packer's constructor has some keyword arguments:\n\n    :param callable default:\n        Convert user type to builtin type that Packer supports.\n        See also simplejson's document.\n    :param str encoding:\n        Convert unicode to bytes with this encoding. (default: 'utf-8')\n    :param str unicode_errors:\n        Error handler for encoding unicode. (default: 'strict')\n    :param bool use_single_float:\n        Use single precision float type for float. (default: False)\n    :param bool autoreset:\n        Reset buffer after each pack and return it's\n        content as `bytes`. (default: True).\n        If set this to false, use `bytes()` to get\n        content and `.reset()` to clear buffer.\n    :param bool use_bin_type:\n        Use bin type introduced in msgpack spec 2.0 for bytes.\n        It also enable str8 type for unicode.\n    :param stream:\n        File-like object having `.write(b)` method, or a file descriptor.\n        If specified, packed data is written to it instead of being\n        returned, whenever the internal buffer grows past\n        *flush_threshold* and at the end of every `pack` call.\n        Ext bodies of at least *flush_threshold* bytes are written\n        straight from their own buffer without being copied; for a file\n        descriptor they are gathered with the packed data in between and\n        written with a single `os.writev`.\n    :param int flush_threshold:\n        Buffer size in bytes at which to write to *stream*, and the ext\n        body size from which bodies are referenced instead of copied.\n        (default: 1MB)\n\n    :param int a""lign:\n        If nonzero, start the body of every ext value of at least *align*\n        bytes in a map on an *align*-byte boundary of the output, by\n        inserting a `__pad__` bin entry in front of it. Readers that\n        ignore unknown map keys are unaffected. Requires *use_bin_type*\n        and *align* <= 256. (default: 0)\n    :param int offset:\n        Position of the output in the stream it ends up in, used for\n        *align* and :meth:`tell`. (default: 0)\n\n    Ext bodies may be any C-contiguous object supporting the buffer\n    protocol. See also :meth:`pack_segments`.\n    ")},
+  {Py_tp_traverse, (void *)__pyx_tp_traverse_18isf_pandas_msgpack_7msgpack_7_packer_Packer},
+  {Py_tp_clear, (void *)__pyx_tp_clear_18isf_pandas_msgpack_7msgpack_7_packer_Packer},
+  {Py_tp_methods, (void *)__pyx_methods_18isf_pandas_msgpack_7msgpack_7_packer_Packer},
+  {Py_tp_init, (void *)__pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_3__init__},
+  {Py_tp_new, (void *)__pyx_tp_new_18isf_pandas_msgpack_7msgpack_7_packer_Packer},
+  {0, 0},
+};
+static PyType_Spec __pyx_type_18isf_pandas_msgpack_7msgpack_7_packer_Packer_spec = {
+  "isf_pandas_msgpack.msgpack._packer.Packer",
+  sizeof(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer),
+  0,
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC,
+  __pyx_type_18isf_pandas_msgpack_7msgpack_7_packer_Packer_slots,
+};
+#else
+
+static PyTypeObject __pyx_type_18isf_pandas_msgpack_7msgpack_7_packer_Packer = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "isf_pandas_msgpack.msgpack._packer.""Packer", /*tp_name*/
+  sizeof(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_18isf_pandas_msgpack_7msgpack_7_packer_Packer, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  PyDoc_STR("Packer(default=None, encoding='utf-8', unicode_errors='strict', use_single_float=False, bool autoreset=1, bool use_bin_type=0, stream=None, size_t flush_threshold=DEFAULT_FLUSH_THRESHOLD, size_t align=0, size_t offset=0)\n\n    MessagePack Packer\n\n    usage::\n\n        packer = Packer()\n        astream.write(packer.pack(a))\n        astream.write(packer.pack(b))\n\n    Packer's constructor has some keyword arguments:\n\n    :param callable default:\n        Convert user type to builtin type that Packer supports.\n        See also simplejson's document.\n    :param str encoding:\n        Convert unicode to bytes with this encoding. (default: 'utf-8')\n    :param str unicode_errors:\n        Error handler for encoding unicode. (default: 'strict')\n    :param bool use_single_float:\n        Use single precision float type for float. (default: False)\n    :param bool autoreset:\n        Reset buffer after each pack and return it's\n        content as `bytes`. (default: True).\n        If set this to false, use `bytes()` to get\n        content and `.reset()` to clear buffer.\n    :param bool use_bin_type:\n        Use bin type introduced in msgpack spec 2.0 for bytes.\n        It also enable str8 type for unicode.\n    :param stream:\n        File-like object having `.write(b)` method, or a file descriptor.\n        If specified, packed data is written to it instead of being\n        returned, whenever the internal buffer grows past\n        *flush_threshold* and at the end of every `pack` call.\n        Ext bodies of at least *flush_threshold* bytes are written\n        straight from their own buffer without being copied; for a file\n        descriptor they are gathered with the packed data in between and\n        written with a single `os.writev`.\n    :param int flush_threshold:\n        Buffer size in bytes at which to write to *stream*, and the ext\n        body size from which bodies are referenced instead of copied.\n        (default: 1MB)\n\n    :param int a""lign:\n        If nonzero, start the body of every ext value of at least *align*\n        bytes in a map on an *align*-byte boundary of the output, by\n        inserting a `__pad__` bin entry in front of it. Readers that\n        ignore unknown map keys are unaffected. Requires *use_bin_type*\n        and *align* <= 256. (default: 0)\n    :param int offset:\n        Position of the output in the stream it ends up in, used for\n        *align* and :meth:`tell`. (default: 0)\n\n    Ext bodies may be any C-contiguous object supporting the buffer\n    protocol. See also :meth:`pack_segments`.\n    "), /*tp_doc*/
+  __pyx_tp_traverse_18isf_pandas_msgpack_7msgpack_7_packer_Packer, /*tp_traverse*/
+  __pyx_tp_clear_18isf_pandas_msgpack_7msgpack_7_packer_Packer, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_18isf_pandas_msgpack_7msgpack_7_packer_Packer, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  #if !CYTHON_USE_TYPE_SPECS
+  0, /*tp_dictoffset*/
+  #endif
+  __pyx_pw_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_3__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_18isf_pandas_msgpack_7msgpack_7_packer_Packer, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  #if CYTHON_USE_TP_FINALIZE
+  0, /*tp_finalize*/
+  #else
+  NULL, /*tp_finalize*/
+  #endif
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if __PYX_NEED_TP_PRINT_SLOT == 1
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030C0000
+  0, /*tp_watched*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030d00A4
+  0, /*tp_versions_used*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+#endif
+
+#if CYTHON_USE_FREELISTS
+static struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack *__pyx_freelist_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack[8];
+static int __pyx_freecount_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack = 0;
+#endif
+
+static PyObject *__pyx_tp_new_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  PyObject *o;
+  #if CYTHON_COMPILING_IN_LIMITED_API
+  allocfunc alloc_func = (allocfunc)PyType_GetSlot(t, Py_tp_alloc);
+  o = alloc_func(t, 0);
+  #else
+  #if CYTHON_USE_FREELISTS
+  if (likely((int)(__pyx_freecount_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack > 0) & (int)(t->tp_basicsize == sizeof(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack)))) {
+    o = (PyObject*)__pyx_freelist_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack[--__pyx_freecount_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack];
+    memset(o, 0, sizeof(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack));
+    (void) PyObject_INIT(o, t);
+    PyObject_GC_Track(o);
+  } else
+  #endif
+  {
+    o = (*t->tp_alloc)(t, 0);
+    if (unlikely(!o)) return 0;
+  }
+  #endif
+  return o;
+}
+
+static void __pyx_tp_dealloc_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack(PyObject *o) {
+  struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack *p = (struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely((PY_VERSION_HEX >= 0x03080000 || __Pyx_PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE)) && __Pyx_PyObject_GetSlot(o, tp_finalize, destructor)) && !__Pyx_PyObject_GC_IsFinalized(o)) {
+    if (__Pyx_PyObject_GetSlot(o, tp_dealloc, destructor) == __pyx_tp_dealloc_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack) {
+      if (PyObject_CallFinalizerFromDealloc(o)) return;
+    }
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  Py_CLEAR(p->__pyx_v_self);
+  #if CYTHON_USE_FREELISTS
+  if (((int)(__pyx_freecount_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack < 8) & (int)(Py_TYPE(o)->tp_basicsize == sizeof(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack)))) {
+    __pyx_freelist_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack[__pyx_freecount_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack++] = ((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack *)o);
+  } else
+  #endif
+  {
+    #if CYTHON_USE_TYPE_SLOTS || CYTHON_COMPILING_IN_PYPY
+    (*Py_TYPE(o)->tp_free)(o);
+    #else
+    {
+      freefunc tp_free = (freefunc)PyType_GetSlot(Py_TYPE(o), Py_tp_free);
+      if (tp_free) tp_free(o);
+    }
+    #endif
+  }
+}
+
+static int __pyx_tp_traverse_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack *p = (struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack *)o;
+  if (p->__pyx_v_self) {
+    e = (*v)(((PyObject *)p->__pyx_v_self), a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack *p = (struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack *)o;
+  tmp = ((PyObject*)p->__pyx_v_self);
+  p->__pyx_v_self = ((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+#if CYTHON_USE_TYPE_SPECS
+static PyType_Slot __pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack_slots[] = {
+  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack},
+  {Py_tp_traverse, (void *)__pyx_tp_traverse_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack},
+  {Py_tp_clear, (void *)__pyx_tp_clear_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack},
+  {Py_tp_new, (void *)__pyx_tp_new_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack},
+  {0, 0},
+};
+static PyType_Spec __pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack_spec = {
+  "isf_pandas_msgpack.msgpack._packer.__pyx_scope_struct___pack",
+  sizeof(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack),
+  0,
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC|Py_TPFLAGS_HAVE_FINALIZE,
+  __pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack_slots,
+};
+#else
+
+static PyTypeObject __pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "isf_pandas_msgpack.msgpack._packer.""__pyx_scope_struct___pack", /*tp_name*/
+  sizeof(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC|Py_TPFLAGS_HAVE_FINALIZE, /*tp_flags*/
+  0, /*tp_doc*/
+  __pyx_tp_traverse_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack, /*tp_traverse*/
+  __pyx_tp_clear_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  0, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  #if !CYTHON_USE_TYPE_SPECS
+  0, /*tp_dictoffset*/
+  #endif
+  0, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  #if CYTHON_USE_TP_FINALIZE
+  0, /*tp_finalize*/
+  #else
+  NULL, /*tp_finalize*/
+  #endif
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if __PYX_NEED_TP_PRINT_SLOT == 1
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030C0000
+  0, /*tp_watched*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030d00A4
+  0, /*tp_versions_used*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+#endif
+
+#if CYTHON_USE_FREELISTS
+static struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr *__pyx_freelist_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr[8];
+static int __pyx_freecount_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr = 0;
+#endif
+
+static PyObject *__pyx_tp_new_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  PyObject *o;
+  #if CYTHON_COMPILING_IN_LIMITED_API
+  allocfunc alloc_func = (allocfunc)PyType_GetSlot(t, Py_tp_alloc);
+  o = alloc_func(t, 0);
+  #else
+  #if CYTHON_USE_FREELISTS
+  if (likely((int)(__pyx_freecount_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr > 0) & (int)(t->tp_basicsize == sizeof(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr)))) {
+    o = (PyObject*)__pyx_freelist_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr[--__pyx_freecount_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr];
+    memset(o, 0, sizeof(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr));
+    (void) PyObject_INIT(o, t);
+    PyObject_GC_Track(o);
+  } else
+  #endif
+  {
+    o = (*t->tp_alloc)(t, 0);
+    if (unlikely(!o)) return 0;
+  }
+  #endif
+  return o;
+}
+
+static void __pyx_tp_dealloc_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr(PyObject *o) {
+  struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr *p = (struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely((PY_VERSION_HEX >= 0x03080000 || __Pyx_PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE)) && __Pyx_PyObject_GetSlot(o, tp_finalize, destructor)) && !__Pyx_PyObject_GC_IsFinalized(o)) {
+    if (__Pyx_PyObject_GetSlot(o, tp_dealloc, destructor) == __pyx_tp_dealloc_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr) {
+      if (PyObject_CallFinalizerFromDealloc(o)) return;
+    }
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  Py_CLEAR(p->__pyx_outer_scope);
+  Py_CLEAR(p->__pyx_genexpr_arg_0);
+  Py_CLEAR(p->__pyx_v_k);
+  Py_CLEAR(p->__pyx_v_v);
+  Py_CLEAR(p->__pyx_t_0);
+  #if CYTHON_USE_FREELISTS
+  if (((int)(__pyx_freecount_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr < 8) & (int)(Py_TYPE(o)->tp_basicsize == sizeof(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr)))) {
+    __pyx_freelist_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr[__pyx_freecount_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr++] = ((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr *)o);
+  } else
+  #endif
+  {
+    #if CYTHON_USE_TYPE_SLOTS || CYTHON_COMPILING_IN_PYPY
+    (*Py_TYPE(o)->tp_free)(o);
+    #else
+    {
+      freefunc tp_free = (freefunc)PyType_GetSlot(Py_TYPE(o), Py_tp_free);
+      if (tp_free) tp_free(o);
+    }
+    #endif
+  }
+}
+
+static int __pyx_tp_traverse_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr *p = (struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr *)o;
+  if (p->__pyx_outer_scope) {
+    e = (*v)(((PyObject *)p->__pyx_outer_scope), a); if (e) return e;
+  }
+  if (p->__pyx_genexpr_arg_0) {
+    e = (*v)(p->__pyx_genexpr_arg_0, a); if (e) return e;
+  }
+  if (p->__pyx_v_k) {
+    e = (*v)(p->__pyx_v_k, a); if (e) return e;
+  }
+  if (p->__pyx_v_v) {
+    e = (*v)(p->__pyx_v_v, a); if (e) return e;
+  }
+  if (p->__pyx_t_0) {
+    e = (*v)(p->__pyx_t_0, a); if (e) return e;
+  }
+  return 0;
+}
+#if CYTHON_USE_TYPE_SPECS
+static PyType_Slot __pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr_slots[] = {
+  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr},
+  {Py_tp_traverse, (void *)__pyx_tp_traverse_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr},
+  {Py_tp_new, (void *)__pyx_tp_new_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr},
+  {0, 0},
+};
+static PyType_Spec __pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr_spec = {
+  "isf_pandas_msgpack.msgpack._packer.__pyx_scope_struct_1_genexpr",
+  sizeof(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr),
+  0,
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC|Py_TPFLAGS_HAVE_FINALIZE,
+  __pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr_slots,
+};
+#else
+
+static PyTypeObject __pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "isf_pandas_msgpack.msgpack._packer.""__pyx_scope_struct_1_genexpr", /*tp_name*/
+  sizeof(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC|Py_TPFLAGS_HAVE_FINALIZE, /*tp_flags*/
+  0, /*tp_doc*/
+  __pyx_tp_traverse_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr, /*tp_traverse*/
+  0, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  0, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  #if !CYTHON_USE_TYPE_SPECS
+  0, /*tp_dictoffset*/
+  #endif
+  0, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  #if CYTHON_USE_TP_FINALIZE
+  0, /*tp_finalize*/
+  #else
+  NULL, /*tp_finalize*/
+  #endif
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if __PYX_NEED_TP_PRINT_SLOT == 1
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030C0000
+  0, /*tp_watched*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030d00A4
+  0, /*tp_versions_used*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+#endif
+
+#if CYTHON_USE_FREELISTS
+static struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr *__pyx_freelist_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr[8];
+static int __pyx_freecount_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr = 0;
+#endif
+
+static PyObject *__pyx_tp_new_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  PyObject *o;
+  #if CYTHON_COMPILING_IN_LIMITED_API
+  allocfunc alloc_func = (allocfunc)PyType_GetSlot(t, Py_tp_alloc);
+  o = alloc_func(t, 0);
+  #else
+  #if CYTHON_USE_FREELISTS
+  if (likely((int)(__pyx_freecount_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr > 0) & (int)(t->tp_basicsize == sizeof(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr)))) {
+    o = (PyObject*)__pyx_freelist_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr[--__pyx_freecount_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr];
+    memset(o, 0, sizeof(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr));
+    (void) PyObject_INIT(o, t);
+    PyObject_GC_Track(o);
+  } else
+  #endif
+  {
+    o = (*t->tp_alloc)(t, 0);
+    if (unlikely(!o)) return 0;
+  }
+  #endif
+  return o;
+}
+
+static void __pyx_tp_dealloc_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr(PyObject *o) {
+  struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr *p = (struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely((PY_VERSION_HEX >= 0x03080000 || __Pyx_PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE)) && __Pyx_PyObject_GetSlot(o, tp_finalize, destructor)) && !__Pyx_PyObject_GC_IsFinalized(o)) {
+    if (__Pyx_PyObject_GetSlot(o, tp_dealloc, destructor) == __pyx_tp_dealloc_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr) {
+      if (PyObject_CallFinalizerFromDealloc(o)) return;
+    }
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  Py_CLEAR(p->__pyx_outer_scope);
+  Py_CLEAR(p->__pyx_genexpr_arg_0);
+  Py_CLEAR(p->__pyx_v_k);
+  Py_CLEAR(p->__pyx_v_v);
+  Py_CLEAR(p->__pyx_t_0);
+  #if CYTHON_USE_FREELISTS
+  if (((int)(__pyx_freecount_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr < 8) & (int)(Py_TYPE(o)->tp_basicsize == sizeof(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr)))) {
+    __pyx_freelist_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr[__pyx_freecount_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr++] = ((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr *)o);
+  } else
+  #endif
+  {
+    #if CYTHON_USE_TYPE_SLOTS || CYTHON_COMPILING_IN_PYPY
+    (*Py_TYPE(o)->tp_free)(o);
+    #else
+    {
+      freefunc tp_free = (freefunc)PyType_GetSlot(Py_TYPE(o), Py_tp_free);
+      if (tp_free) tp_free(o);
+    }
+    #endif
+  }
+}
+
+static int __pyx_tp_traverse_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr *p = (struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr *)o;
+  if (p->__pyx_outer_scope) {
+    e = (*v)(((PyObject *)p->__pyx_outer_scope), a); if (e) return e;
+  }
+  if (p->__pyx_genexpr_arg_0) {
+    e = (*v)(p->__pyx_genexpr_arg_0, a); if (e) return e;
+  }
+  if (p->__pyx_v_k) {
+    e = (*v)(p->__pyx_v_k, a); if (e) return e;
+  }
+  if (p->__pyx_v_v) {
+    e = (*v)(p->__pyx_v_v, a); if (e) return e;
+  }
+  if (p->__pyx_t_0) {
+    e = (*v)(p->__pyx_t_0, a); if (e) return e;
+  }
+  return 0;
+}
+#if CYTHON_USE_TYPE_SPECS
+static PyType_Slot __pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr_slots[] = {
+  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr},
+  {Py_tp_traverse, (void *)__pyx_tp_traverse_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr},
+  {Py_tp_new, (void *)__pyx_tp_new_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr},
+  {0, 0},
+};
+static PyType_Spec __pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr_spec = {
+  "isf_pandas_msgpack.msgpack._packer.__pyx_scope_struct_2_genexpr",
+  sizeof(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr),
+  0,
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC|Py_TPFLAGS_HAVE_FINALIZE,
+  __pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr_slots,
+};
+#else
+
+static PyTypeObject __pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "isf_pandas_msgpack.msgpack._packer.""__pyx_scope_struct_2_genexpr", /*tp_name*/
+  sizeof(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr, /*tp_dealloc*/
+  #if PY_VERSION_HEX < 0x030800b4
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b4
+  0, /*tp_vectorcall_offset*/
+  #endif
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  #if PY_MAJOR_VERSION < 3
+  0, /*tp_compare*/
+  #endif
+  #if PY_MAJOR_VERSION >= 3
+  0, /*tp_as_async*/
+  #endif
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC|Py_TPFLAGS_HAVE_FINALIZE, /*tp_flags*/
+  0, /*tp_doc*/
+  __pyx_tp_traverse_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr, /*tp_traverse*/
+  0, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  0, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  #if !CYTHON_USE_TYPE_SPECS
+  0, /*tp_dictoffset*/
+  #endif
+  0, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if PY_VERSION_HEX >= 0x030400a1
+  #if CYTHON_USE_TP_FINALIZE
+  0, /*tp_finalize*/
+  #else
+  NULL, /*tp_finalize*/
+  #endif
+  #endif
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+  0, /*tp_vectorcall*/
+  #endif
+  #if __PYX_NEED_TP_PRINT_SLOT == 1
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030C0000
+  0, /*tp_watched*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030d00A4
+  0, /*tp_versions_used*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+#endif
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+/* #### Code section: pystring_table ### */
+
+static int __Pyx_CreateStringTabAndInitStrings(void) {
+  __Pyx_StringTabEntry __pyx_string_tab[] = {
+    {&__pyx_n_s_B, __pyx_k_B, sizeof(__pyx_k_B), 0, 0, 1, 1},
+    {&__pyx_kp_s_Can_t_encode_unicode_string_no_e, __pyx_k_Can_t_encode_unicode_string_no_e, sizeof(__pyx_k_Can_t_encode_unicode_string_no_e), 0, 0, 1, 0},
+    {&__pyx_kp_s_EXT_data_is_too_large, __pyx_k_EXT_data_is_too_large, sizeof(__pyx_k_EXT_data_is_too_large), 0, 0, 1, 0},
+    {&__pyx_n_s_ExtType, __pyx_k_ExtType, sizeof(__pyx_k_ExtType), 0, 0, 1, 1},
+    {&__pyx_n_s_MemoryError, __pyx_k_MemoryError, sizeof(__pyx_k_MemoryError), 0, 0, 1, 1},
+    {&__pyx_n_s_PAD_KEY, __pyx_k_PAD_KEY, sizeof(__pyx_k_PAD_KEY), 0, 0, 1, 1},
+    {&__pyx_n_s_PackValueError, __pyx_k_PackValueError, sizeof(__pyx_k_PackValueError), 0, 0, 1, 1},
+    {&__pyx_n_s_Packer, __pyx_k_Packer, sizeof(__pyx_k_Packer), 0, 0, 1, 1},
+    {&__pyx_n_s_Packer___reduce_cython, __pyx_k_Packer___reduce_cython, sizeof(__pyx_k_Packer___reduce_cython), 0, 0, 1, 1},
+    {&__pyx_n_s_Packer___setstate_cython, __pyx_k_Packer___setstate_cython, sizeof(__pyx_k_Packer___setstate_cython), 0, 0, 1, 1},
+    {&__pyx_n_s_Packer__pack_locals_genexpr, __pyx_k_Packer__pack_locals_genexpr, sizeof(__pyx_k_Packer__pack_locals_genexpr), 0, 0, 1, 1},
+    {&__pyx_n_s_Packer_bytes, __pyx_k_Packer_bytes, sizeof(__pyx_k_Packer_bytes), 0, 0, 1, 1},
+    {&__pyx_n_s_Packer_flush, __pyx_k_Packer_flush, sizeof(__pyx_k_Packer_flush), 0, 0, 1, 1},
+    {&__pyx_kp_s_Packer_has_no_stream_to_flush_to, __pyx_k_Packer_has_no_stream_to_flush_to, sizeof(__pyx_k_Packer_has_no_stream_to_flush_to), 0, 0, 1, 0},
+    {&__pyx_n_s_Packer_pack, __pyx_k_Packer_pack, sizeof(__pyx_k_Packer_pack), 0, 0, 1, 1},
+    {&__pyx_n_s_Packer_pack_array_header, __pyx_k_Packer_pack_array_header, sizeof(__pyx_k_Packer_pack_array_header), 0, 0, 1, 1},
+    {&__pyx_n_s_Packer_pack_ext_type, __pyx_k_Packer_pack_ext_type, sizeof(__pyx_k_Packer_pack_ext_type), 0, 0, 1, 1},
+    {&__pyx_n_s_Packer_pack_map_header, __pyx_k_Packer_pack_map_header, sizeof(__pyx_k_Packer_pack_map_header), 0, 0, 1, 1},
+    {&__pyx_n_s_Packer_pack_map_pairs, __pyx_k_Packer_pack_map_pairs, sizeof(__pyx_k_Packer_pack_map_pairs), 0, 0, 1, 1},
+    {&__pyx_n_s_Packer_pack_segments, __pyx_k_Packer_pack_segments, sizeof(__pyx_k_Packer_pack_segments), 0, 0, 1, 1},
+    {&__pyx_n_s_Packer_reset, __pyx_k_Packer_reset, sizeof(__pyx_k_Packer_reset), 0, 0, 1, 1},
+    {&__pyx_n_s_Packer_tell, __pyx_k_Packer_tell, sizeof(__pyx_k_Packer_tell), 0, 0, 1, 1},
+    {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
+    {&__pyx_kp_s_Unable_to_allocate_internal_buff, __pyx_k_Unable_to_allocate_internal_buff, sizeof(__pyx_k_Unable_to_allocate_internal_buff), 0, 0, 1, 0},
+    {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
+    {&__pyx_n_s__14, __pyx_k__14, sizeof(__pyx_k__14), 0, 0, 1, 1},
+    {&__pyx_kp_u__15, __pyx_k__15, sizeof(__pyx_k__15), 0, 1, 0, 0},
+    {&__pyx_n_s__16, __pyx_k__16, sizeof(__pyx_k__16), 0, 0, 1, 1},
+    {&__pyx_n_s__37, __pyx_k__37, sizeof(__pyx_k__37), 0, 0, 1, 1},
+    {&__pyx_n_s_align, __pyx_k_align, sizeof(__pyx_k_align), 0, 0, 1, 1},
+    {&__pyx_kp_s_align_must_be_at_most_256, __pyx_k_align_must_be_at_most_256, sizeof(__pyx_k_align_must_be_at_most_256), 0, 0, 1, 0},
+    {&__pyx_kp_s_align_requires_use_bin_type, __pyx_k_align_requires_use_bin_type, sizeof(__pyx_k_align_requires_use_bin_type), 0, 0, 1, 0},
+    {&__pyx_n_s_args, __pyx_k_args, sizeof(__pyx_k_args), 0, 0, 1, 1},
+    {&__pyx_n_s_ascii, __pyx_k_ascii, sizeof(__pyx_k_ascii), 0, 0, 1, 1},
+    {&__pyx_n_s_asyncio_coroutines, __pyx_k_asyncio_coroutines, sizeof(__pyx_k_asyncio_coroutines), 0, 0, 1, 1},
+    {&__pyx_n_s_autoreset, __pyx_k_autoreset, sizeof(__pyx_k_autoreset), 0, 0, 1, 1},
+    {&__pyx_n_s_bytes, __pyx_k_bytes, sizeof(__pyx_k_bytes), 0, 0, 1, 1},
+    {&__pyx_kp_s_bytes_is_too_large, __pyx_k_bytes_is_too_large, sizeof(__pyx_k_bytes_is_too_large), 0, 0, 1, 0},
+    {&__pyx_kp_s_can_t_serialize_r, __pyx_k_can_t_serialize_r, sizeof(__pyx_k_can_t_serialize_r), 0, 0, 1, 0},
+    {&__pyx_n_s_cast, __pyx_k_cast, sizeof(__pyx_k_cast), 0, 0, 1, 1},
+    {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
+    {&__pyx_n_s_close, __pyx_k_close, sizeof(__pyx_k_close), 0, 0, 1, 1},
+    {&__pyx_n_s_code, __pyx_k_code, sizeof(__pyx_k_code), 0, 0, 1, 1},
+    {&__pyx_n_s_data, __pyx_k_data, sizeof(__pyx_k_data), 0, 0, 1, 1},
+    {&__pyx_n_s_default, __pyx_k_default, sizeof(__pyx_k_default), 0, 0, 1, 1},
+    {&__pyx_kp_s_default_must_be_a_callable, __pyx_k_default_must_be_a_callable, sizeof(__pyx_k_default_must_be_a_callable), 0, 0, 1, 0},
+    {&__pyx_kp_s_dict_is_too_large, __pyx_k_dict_is_too_large, sizeof(__pyx_k_dict_is_too_large), 0, 0, 1, 0},
+    {&__pyx_kp_u_disable, __pyx_k_disable, sizeof(__pyx_k_disable), 0, 1, 0, 0},
+    {&__pyx_kp_u_enable, __pyx_k_enable, sizeof(__pyx_k_enable), 0, 1, 0, 0},
+    {&__pyx_n_s_encode, __pyx_k_encode, sizeof(__pyx_k_encode), 0, 0, 1, 1},
+    {&__pyx_n_s_encoding, __pyx_k_encoding, sizeof(__pyx_k_encoding), 0, 0, 1, 1},
+    {&__pyx_n_s_exceptions, __pyx_k_exceptions, sizeof(__pyx_k_exceptions), 0, 0, 1, 1},
+    {&__pyx_n_s_fd, __pyx_k_fd, sizeof(__pyx_k_fd), 0, 0, 1, 1},
+    {&__pyx_n_s_flush, __pyx_k_flush, sizeof(__pyx_k_flush), 0, 0, 1, 1},
+    {&__pyx_n_s_flush_threshold, __pyx_k_flush_threshold, sizeof(__pyx_k_flush_threshold), 0, 0, 1, 1},
+    {&__pyx_kp_u_gc, __pyx_k_gc, sizeof(__pyx_k_gc), 0, 1, 0, 0},
+    {&__pyx_n_s_genexpr, __pyx_k_genexpr, sizeof(__pyx_k_genexpr), 0, 0, 1, 1},
+    {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
+    {&__pyx_n_s_i, __pyx_k_i, sizeof(__pyx_k_i), 0, 0, 1, 1},
+    {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+    {&__pyx_n_s_initializing, __pyx_k_initializing, sizeof(__pyx_k_initializing), 0, 0, 1, 1},
+    {&__pyx_n_s_is_coroutine, __pyx_k_is_coroutine, sizeof(__pyx_k_is_coroutine), 0, 0, 1, 1},
+    {&__pyx_kp_u_isenabled, __pyx_k_isenabled, sizeof(__pyx_k_isenabled), 0, 1, 0, 0},
+    {&__pyx_n_s_isf_pandas_msgpack_msgpack__pack, __pyx_k_isf_pandas_msgpack_msgpack__pack, sizeof(__pyx_k_isf_pandas_msgpack_msgpack__pack), 0, 0, 1, 1},
+    {&__pyx_kp_s_isf_pandas_msgpack_msgpack__pack_2, __pyx_k_isf_pandas_msgpack_msgpack__pack_2, sizeof(__pyx_k_isf_pandas_msgpack_msgpack__pack_2), 0, 0, 1, 0},
+    {&__pyx_n_s_items, __pyx_k_items, sizeof(__pyx_k_items), 0, 0, 1, 1},
+    {&__pyx_n_s_iteritems, __pyx_k_iteritems, sizeof(__pyx_k_iteritems), 0, 0, 1, 1},
+    {&__pyx_n_s_k, __pyx_k_k, sizeof(__pyx_k_k), 0, 0, 1, 1},
+    {&__pyx_kp_s_list_is_too_large, __pyx_k_list_is_too_large, sizeof(__pyx_k_list_is_too_large), 0, 0, 1, 0},
+    {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+    {&__pyx_n_s_n, __pyx_k_n, sizeof(__pyx_k_n), 0, 0, 1, 1},
+    {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+    {&__pyx_kp_s_no_default___reduce___due_to_non, __pyx_k_no_default___reduce___due_to_non, sizeof(__pyx_k_no_default___reduce___due_to_non), 0, 0, 1, 0},
+    {&__pyx_n_s_obj, __pyx_k_obj, sizeof(__pyx_k_obj), 0, 0, 1, 1},
+    {&__pyx_n_s_offset, __pyx_k_offset, sizeof(__pyx_k_offset), 0, 0, 1, 1},
+    {&__pyx_n_s_os, __pyx_k_os, sizeof(__pyx_k_os), 0, 0, 1, 1},
+    {&__pyx_n_s_pack, __pyx_k_pack, sizeof(__pyx_k_pack), 0, 0, 1, 1},
+    {&__pyx_n_s_pack_array_header, __pyx_k_pack_array_header, sizeof(__pyx_k_pack_array_header), 0, 0, 1, 1},
+    {&__pyx_n_s_pack_ext_type, __pyx_k_pack_ext_type, sizeof(__pyx_k_pack_ext_type), 0, 0, 1, 1},
+    {&__pyx_n_s_pack_map_header, __pyx_k_pack_map_header, sizeof(__pyx_k_pack_map_header), 0, 0, 1, 1},
+    {&__pyx_n_s_pack_map_pairs, __pyx_k_pack_map_pairs, sizeof(__pyx_k_pack_map_pairs), 0, 0, 1, 1},
+    {&__pyx_n_s_pack_segments, __pyx_k_pack_segments, sizeof(__pyx_k_pack_segments), 0, 0, 1, 1},
+    {&__pyx_kp_s_pack_segments_can_t_be_used_with, __pyx_k_pack_segments_can_t_be_used_with, sizeof(__pyx_k_pack_segments_can_t_be_used_with), 0, 0, 1, 0},
+    {&__pyx_n_u_pad, __pyx_k_pad, sizeof(__pyx_k_pad), 0, 1, 0, 1},
+    {&__pyx_n_s_pairs, __pyx_k_pairs, sizeof(__pyx_k_pairs), 0, 0, 1, 1},
+    {&__pyx_n_s_pyx_state, __pyx_k_pyx_state, sizeof(__pyx_k_pyx_state), 0, 0, 1, 1},
+    {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
+    {&__pyx_kp_s_recursion_limit_exceeded, __pyx_k_recursion_limit_exceeded, sizeof(__pyx_k_recursion_limit_exceeded), 0, 0, 1, 0},
+    {&__pyx_n_s_reduce, __pyx_k_reduce, sizeof(__pyx_k_reduce), 0, 0, 1, 1},
+    {&__pyx_n_s_reduce_cython, __pyx_k_reduce_cython, sizeof(__pyx_k_reduce_cython), 0, 0, 1, 1},
+    {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
+    {&__pyx_n_s_reset, __pyx_k_reset, sizeof(__pyx_k_reset), 0, 0, 1, 1},
+    {&__pyx_n_s_ret, __pyx_k_ret, sizeof(__pyx_k_ret), 0, 0, 1, 1},
+    {&__pyx_n_s_s, __pyx_k_s, sizeof(__pyx_k_s), 0, 0, 1, 1},
+    {&__pyx_n_s_segments, __pyx_k_segments, sizeof(__pyx_k_segments), 0, 0, 1, 1},
+    {&__pyx_n_s_self, __pyx_k_self, sizeof(__pyx_k_self), 0, 0, 1, 1},
+    {&__pyx_n_s_send, __pyx_k_send, sizeof(__pyx_k_send), 0, 0, 1, 1},
+    {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
+    {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
+    {&__pyx_n_s_size, __pyx_k_size, sizeof(__pyx_k_size), 0, 0, 1, 1},
+    {&__pyx_n_s_spec, __pyx_k_spec, sizeof(__pyx_k_spec), 0, 0, 1, 1},
+    {&__pyx_n_s_stream, __pyx_k_stream, sizeof(__pyx_k_stream), 0, 0, 1, 1},
+    {&__pyx_n_s_strict, __pyx_k_strict, sizeof(__pyx_k_strict), 0, 0, 1, 1},
+    {&__pyx_kp_s_stringsource, __pyx_k_stringsource, sizeof(__pyx_k_stringsource), 0, 0, 1, 0},
+    {&__pyx_n_s_sum, __pyx_k_sum, sizeof(__pyx_k_sum), 0, 0, 1, 1},
+    {&__pyx_n_s_tell, __pyx_k_tell, sizeof(__pyx_k_tell), 0, 0, 1, 1},
+    {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+    {&__pyx_n_s_throw, __pyx_k_throw, sizeof(__pyx_k_throw), 0, 0, 1, 1},
+    {&__pyx_n_s_typecode, __pyx_k_typecode, sizeof(__pyx_k_typecode), 0, 0, 1, 1},
+    {&__pyx_n_s_unicode_errors, __pyx_k_unicode_errors, sizeof(__pyx_k_unicode_errors), 0, 0, 1, 1},
+    {&__pyx_n_s_use_bin_type, __pyx_k_use_bin_type, sizeof(__pyx_k_use_bin_type), 0, 0, 1, 1},
+    {&__pyx_n_s_use_single_float, __pyx_k_use_single_float, sizeof(__pyx_k_use_single_float), 0, 0, 1, 1},
+    {&__pyx_kp_s_utf_8, __pyx_k_utf_8, sizeof(__pyx_k_utf_8), 0, 0, 1, 0},
+    {&__pyx_n_s_v, __pyx_k_v, sizeof(__pyx_k_v), 0, 0, 1, 1},
+    {&__pyx_n_s_view, __pyx_k_view, sizeof(__pyx_k_view), 0, 0, 1, 1},
+    {&__pyx_n_s_views, __pyx_k_views, sizeof(__pyx_k_views), 0, 0, 1, 1},
+    {&__pyx_n_s_write, __pyx_k_write, sizeof(__pyx_k_write), 0, 0, 1, 1},
+    {&__pyx_n_s_writev, __pyx_k_writev, sizeof(__pyx_k_writev), 0, 0, 1, 1},
+    {&__pyx_n_s_writev_2, __pyx_k_writev_2, sizeof(__pyx_k_writev_2), 0, 0, 1, 1},
+    {0, 0, 0, 0, 0, 0, 0}
+  };
+  return __Pyx_InitStrings(__pyx_string_tab);
+}
+/* #### Code section: cached_builtins ### */
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
+  __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(0, 166, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 179, __pyx_L1_error)
+  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(0, 193, __pyx_L1_error)
+  __pyx_builtin_sum = __Pyx_GetBuiltinName(__pyx_n_s_sum); if (!__pyx_builtin_sum) __PYX_ERR(0, 356, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+/* #### Code section: cached_constants ### */
+
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":166
+ *         self.pk.buf = <char*> malloc(buf_size)
+ *         if self.pk.buf == NULL:
+ *             raise MemoryError("Unable to allocate internal buffer.")             # <<<<<<<<<<<<<<
+ *         self.pk.buf_size = buf_size
+ *         self.pk.length = 0
+ */
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_s_Unable_to_allocate_internal_buff); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 166, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple_);
+  __Pyx_GIVEREF(__pyx_tuple_);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":179
+ *         if align:
+ *             if not use_bin_type:
+ *                 raise ValueError("align requires use_bin_type.")             # <<<<<<<<<<<<<<
+ *             if align > 256:
+ *                 raise ValueError("align must be at most 256.")
+ */
+  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_s_align_requires_use_bin_type); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 179, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__3);
+  __Pyx_GIVEREF(__pyx_tuple__3);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":181
+ *                 raise ValueError("align requires use_bin_type.")
+ *             if align > 256:
+ *                 raise ValueError("align must be at most 256.")             # <<<<<<<<<<<<<<
+ *         self.align = align
+ *         self.written = offset
+ */
+  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_s_align_must_be_at_most_256); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 181, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":193
+ *         if default is not None:
+ *             if not PyCallable_Check(default):
+ *                 raise TypeError("default must be a callable.")             # <<<<<<<<<<<<<<
+ *         self._default = default
+ *         if encoding is None:
+ */
+  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_s_default_must_be_a_callable); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(0, 193, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__5);
+  __Pyx_GIVEREF(__pyx_tuple__5);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":275
+ *         """Write buffer content to `stream` and clear buffer."""
+ *         if self.stream is None:
+ *             raise TypeError("Packer has no stream to flush to.")             # <<<<<<<<<<<<<<
+ *         self._flush()
+ * 
+ */
+  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_s_Packer_has_no_stream_to_flush_to); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 275, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__6);
+  __Pyx_GIVEREF(__pyx_tuple__6);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":330
+ *                 L = len(o)
+ *                 if L > (2**32) - 1:
+ *                     raise ValueError("bytes is too large")             # <<<<<<<<<<<<<<
+ *                 rawval = o
+ *                 ret = msgpack_pack_bin(&self.pk, L)
+ */
+  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_kp_s_bytes_is_too_large); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(0, 330, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__8);
+  __Pyx_GIVEREF(__pyx_tuple__8);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":337
+ *             elif PyUnicode_Check(o):
+ *                 if not self.encoding:
+ *                     raise TypeError("Can't encode unicode string: "             # <<<<<<<<<<<<<<
+ *                                     "no encoding is specified")
+ *                 o = PyUnicode_AsEncodedString(o, self.encoding,
+ */
+  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_s_Can_t_encode_unicode_string_no_e); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(0, 337, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__9);
+  __Pyx_GIVEREF(__pyx_tuple__9);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":343
+ *                 L = len(o)
+ *                 if L > (2**32) - 1:
+ *                     raise ValueError("dict is too large")             # <<<<<<<<<<<<<<
+ *                 rawval = o
+ *                 ret = msgpack_pack_raw(&self.pk, len(o))
+ */
+  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_kp_s_dict_is_too_large); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(0, 343, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__10);
+  __Pyx_GIVEREF(__pyx_tuple__10);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":394
+ *                     L = view.len
+ *                     if L > (2**32) - 1:
+ *                         raise ValueError("EXT data is too large")             # <<<<<<<<<<<<<<
+ *                     ret = msgpack_pack_ext(&self.pk, longval, L)
+ *                     if ret == 0:
+ */
+  __pyx_tuple__11 = PyTuple_Pack(1, __pyx_kp_s_EXT_data_is_too_large); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(0, 394, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__11);
+  __Pyx_GIVEREF(__pyx_tuple__11);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":409
+ *                 L = len(o)
+ *                 if L > (2**32) - 1:
+ *                     raise ValueError("list is too large")             # <<<<<<<<<<<<<<
+ *                 ret = msgpack_pack_array(&self.pk, L)
+ *                 if ret == 0:
+ */
+  __pyx_tuple__12 = PyTuple_Pack(1, __pyx_kp_s_list_is_too_large); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(0, 409, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__12);
+  __Pyx_GIVEREF(__pyx_tuple__12);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":446
+ *         """
+ *         if self.stream is not None:
+ *             raise TypeError("pack_segments can't be used with a stream.")             # <<<<<<<<<<<<<<
+ *         self.segments = []
+ *         try:
+ */
+  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_kp_s_pack_segments_can_t_be_used_with); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(0, 446, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__13);
+  __Pyx_GIVEREF(__pyx_tuple__13);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":70
+ * 
+ * 
+ * def _writev(int fd, list segments):             # <<<<<<<<<<<<<<
+ *     """Write all of *segments* to *fd*, with `os.writev` where available."""
+ *     cdef Py_ssize_t i = 0, n
+ */
+  __pyx_tuple__17 = PyTuple_Pack(7, __pyx_n_s_fd, __pyx_n_s_segments, __pyx_n_s_i, __pyx_n_s_n, __pyx_n_s_views, __pyx_n_s_view, __pyx_n_s_s); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(0, 70, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__17);
+  __Pyx_GIVEREF(__pyx_tuple__17);
+  __pyx_codeobj__18 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 7, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__17, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__pack_2, __pyx_n_s_writev_2, 70, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__18)) __PYX_ERR(0, 70, __pyx_L1_error)
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":240
+ *         return buf
+ * 
+ *     def tell(self):             # <<<<<<<<<<<<<<
+ *         """Return the position in the output the next object starts at."""
+ *         return self.written + self.pk.length
+ */
+  __pyx_tuple__19 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__19)) __PYX_ERR(0, 240, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__19);
+  __Pyx_GIVEREF(__pyx_tuple__19);
+  __pyx_codeobj__20 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__19, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__pack_2, __pyx_n_s_tell, 240, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__20)) __PYX_ERR(0, 240, __pyx_L1_error)
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":272
+ *         return self.stream is not None or self.segments is not None
+ * 
+ *     def flush(self):             # <<<<<<<<<<<<<<
+ *         """Write buffer content to `stream` and clear buffer."""
+ *         if self.stream is None:
+ */
+  __pyx_codeobj__21 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__19, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__pack_2, __pyx_n_s_flush, 272, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__21)) __PYX_ERR(0, 272, __pyx_L1_error)
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":424
+ *             return ret
+ * 
+ *     cpdef pack(self, object obj):             # <<<<<<<<<<<<<<
+ *         cdef int ret
+ *         ret = self._pack(obj, DEFAULT_RECURSE_LIMIT)
+ */
+  __pyx_tuple__22 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_obj); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(0, 424, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__22);
+  __Pyx_GIVEREF(__pyx_tuple__22);
+  __pyx_codeobj__23 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__22, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__pack_2, __pyx_n_s_pack, 424, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__23)) __PYX_ERR(0, 424, __pyx_L1_error)
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":436
+ *             return self._take()
+ * 
+ *     def pack_segments(self, object obj):             # <<<<<<<<<<<<<<
+ *         """
+ *         Pack *obj* and return it as a list of segments whose concatenation
+ */
+  __pyx_codeobj__24 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__22, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__pack_2, __pyx_n_s_pack_segments, 436, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__24)) __PYX_ERR(0, 436, __pyx_L1_error)
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":455
+ *             self.segments = None
+ * 
+ *     def pack_ext_type(self, typecode, data):             # <<<<<<<<<<<<<<
+ *         msgpack_pack_ext(&self.pk, typecode, len(data))
+ *         msgpack_pack_raw_body(&self.pk, data, len(data))
+ */
+  __pyx_tuple__25 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_typecode, __pyx_n_s_data); if (unlikely(!__pyx_tuple__25)) __PYX_ERR(0, 455, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__25);
+  __Pyx_GIVEREF(__pyx_tuple__25);
+  __pyx_codeobj__26 = (PyObject*)__Pyx_PyCode_New(3, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__25, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__pack_2, __pyx_n_s_pack_ext_type, 455, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__26)) __PYX_ERR(0, 455, __pyx_L1_error)
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":459
+ *         msgpack_pack_raw_body(&self.pk, data, len(data))
+ * 
+ *     def pack_array_header(self, size_t size):             # <<<<<<<<<<<<<<
+ *         if size > (2**32) - 1:
+ *             raise ValueError
+ */
+  __pyx_tuple__27 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_size, __pyx_n_s_ret); if (unlikely(!__pyx_tuple__27)) __PYX_ERR(0, 459, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__27);
+  __Pyx_GIVEREF(__pyx_tuple__27);
+  __pyx_codeobj__28 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__27, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__pack_2, __pyx_n_s_pack_array_header, 459, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__28)) __PYX_ERR(0, 459, __pyx_L1_error)
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":472
+ *             return self._take()
+ * 
+ *     def pack_map_header(self, size_t size):             # <<<<<<<<<<<<<<
+ *         if size > (2**32) - 1:
+ *             raise ValueError
+ */
+  __pyx_codeobj__29 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__27, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__pack_2, __pyx_n_s_pack_map_header, 472, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__29)) __PYX_ERR(0, 472, __pyx_L1_error)
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":485
+ *             return self._take()
+ * 
+ *     def pack_map_pairs(self, object pairs):             # <<<<<<<<<<<<<<
+ *         """
+ *         Pack *pairs* as msgpack map type.
+ */
+  __pyx_tuple__30 = PyTuple_Pack(5, __pyx_n_s_self, __pyx_n_s_pairs, __pyx_n_s_ret, __pyx_n_s_k, __pyx_n_s_v); if (unlikely(!__pyx_tuple__30)) __PYX_ERR(0, 485, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__30);
+  __Pyx_GIVEREF(__pyx_tuple__30);
+  __pyx_codeobj__31 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__30, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__pack_2, __pyx_n_s_pack_map_pairs, 485, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__31)) __PYX_ERR(0, 485, __pyx_L1_error)
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":508
+ *             return self._take()
+ * 
+ *     def reset(self):             # <<<<<<<<<<<<<<
+ *         """Clear internal buffer."""
+ *         self.pk.length = 0
+ */
+  __pyx_codeobj__32 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__19, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__pack_2, __pyx_n_s_reset, 508, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__32)) __PYX_ERR(0, 508, __pyx_L1_error)
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":512
+ *         self.pk.length = 0
+ * 
+ *     def bytes(self):             # <<<<<<<<<<<<<<
+ *         """Return buffer content."""
+ *         return PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
+ */
+  __pyx_codeobj__33 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__19, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__pack_2, __pyx_n_s_bytes, 512, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__33)) __PYX_ERR(0, 512, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
+ */
+  __pyx_codeobj__34 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__19, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_reduce_cython, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__34)) __PYX_ERR(2, 1, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ */
+  __pyx_tuple__35 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_pyx_state); if (unlikely(!__pyx_tuple__35)) __PYX_ERR(2, 3, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__35);
+  __Pyx_GIVEREF(__pyx_tuple__35);
+  __pyx_codeobj__36 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__35, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_setstate_cython, 3, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__36)) __PYX_ERR(2, 3, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+/* #### Code section: init_constants ### */
+
+static CYTHON_SMALL_CODE int __Pyx_InitConstants(void) {
+  if (__Pyx_CreateStringTabAndInitStrings() < 0) __PYX_ERR(0, 1, __pyx_L1_error);
+  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_2 = PyInt_FromLong(2); if (unlikely(!__pyx_int_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_4294967295 = PyInt_FromString((char *)"4294967295", 0, 0); if (unlikely(!__pyx_int_4294967295)) __PYX_ERR(0, 1, __pyx_L1_error)
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+/* #### Code section: init_globals ### */
+
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
+  return 0;
+}
+/* #### Code section: init_module ### */
+
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(void); /*proto*/
+
+static int __Pyx_modinit_global_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  /*--- Global init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_export_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
+  /*--- Function export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_init_code(void) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
+  /*--- Type init code ---*/
+  __pyx_vtabptr_18isf_pandas_msgpack_7msgpack_7_packer_Packer = &__pyx_vtable_18isf_pandas_msgpack_7msgpack_7_packer_Packer;
+  __pyx_vtable_18isf_pandas_msgpack_7msgpack_7_packer_Packer._write = (PyObject *(*)(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *, PyObject *, size_t))__pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__write;
+  __pyx_vtable_18isf_pandas_msgpack_7msgpack_7_packer_Packer._flush = (PyObject *(*)(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *))__pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__flush;
+  __pyx_vtable_18isf_pandas_msgpack_7msgpack_7_packer_Packer._take = (PyObject *(*)(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *))__pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__take;
+  __pyx_vtable_18isf_pandas_msgpack_7msgpack_7_packer_Packer._aligns = (int (*)(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *, PyObject *, PyObject *))__pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__aligns;
+  __pyx_vtable_18isf_pandas_msgpack_7msgpack_7_packer_Packer._pack_padding = (int (*)(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *, PyObject *, PyObject *))__pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__pack_padding;
+  __pyx_vtable_18isf_pandas_msgpack_7msgpack_7_packer_Packer._streaming = (int (*)(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *))__pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__streaming;
+  __pyx_vtable_18isf_pandas_msgpack_7msgpack_7_packer_Packer._pack = (int (*)(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *, PyObject *, struct __pyx_opt_args_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__pack *__pyx_optional_args))__pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer__pack;
+  __pyx_vtable_18isf_pandas_msgpack_7msgpack_7_packer_Packer.pack = (PyObject *(*)(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_7_packer_Packer *, PyObject *, int __pyx_skip_dispatch))__pyx_f_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_pack;
+  #if CYTHON_USE_TYPE_SPECS
+  __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer_Packer_spec, NULL); if (unlikely(!__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer)) __PYX_ERR(0, 90, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer_Packer_spec, __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer) < 0) __PYX_ERR(0, 90, __pyx_L1_error)
+  #else
+  __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer = &__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer_Packer;
+  #endif
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  #endif
+  #if !CYTHON_USE_TYPE_SPECS
+  if (__Pyx_PyType_Ready(__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer) < 0) __PYX_ERR(0, 90, __pyx_L1_error)
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer->tp_print = 0;
+  #endif
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer->tp_dictoffset && __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer->tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer->tp_getattro = __Pyx_PyObject_GenericGetAttr;
+  }
+  #endif
+  #if CYTHON_UPDATE_DESCRIPTOR_DOC
+  {
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer, "__init__"); if (unlikely(!wrapper)) __PYX_ERR(0, 90, __pyx_L1_error)
+    if (__Pyx_IS_TYPE(wrapper, &PyWrapperDescr_Type)) {
+      __pyx_wrapperbase_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_2__init__ = *((PyWrapperDescrObject *)wrapper)->d_base;
+      __pyx_wrapperbase_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_2__init__.doc = __pyx_doc_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_2__init__;
+      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_2__init__;
+    }
+  }
+  #endif
+  if (__Pyx_SetVtable(__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer, __pyx_vtabptr_18isf_pandas_msgpack_7msgpack_7_packer_Packer) < 0) __PYX_ERR(0, 90, __pyx_L1_error)
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  if (__Pyx_MergeVtables(__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer) < 0) __PYX_ERR(0, 90, __pyx_L1_error)
+  #endif
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_Packer, (PyObject *) __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer) < 0) __PYX_ERR(0, 90, __pyx_L1_error)
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  if (__Pyx_setup_reduce((PyObject *) __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer) < 0) __PYX_ERR(0, 90, __pyx_L1_error)
+  #endif
+  #if CYTHON_USE_TYPE_SPECS
+  __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack_spec, NULL); if (unlikely(!__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack)) __PYX_ERR(0, 278, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack_spec, __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack) < 0) __PYX_ERR(0, 278, __pyx_L1_error)
+  #else
+  __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack = &__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack;
+  #endif
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  #endif
+  #if !CYTHON_USE_TYPE_SPECS
+  if (__Pyx_PyType_Ready(__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack) < 0) __PYX_ERR(0, 278, __pyx_L1_error)
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack->tp_print = 0;
+  #endif
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack->tp_dictoffset && __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack->tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct___pack->tp_getattro = __Pyx_PyObject_GenericGetAttrNoDict;
+  }
+  #endif
+  #if CYTHON_USE_TYPE_SPECS
+  __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr_spec, NULL); if (unlikely(!__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr)) __PYX_ERR(0, 356, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr_spec, __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr) < 0) __PYX_ERR(0, 356, __pyx_L1_error)
+  #else
+  __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr = &__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr;
+  #endif
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  #endif
+  #if !CYTHON_USE_TYPE_SPECS
+  if (__Pyx_PyType_Ready(__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr) < 0) __PYX_ERR(0, 356, __pyx_L1_error)
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr->tp_print = 0;
+  #endif
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr->tp_dictoffset && __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr->tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_1_genexpr->tp_getattro = __Pyx_PyObject_GenericGetAttrNoDict;
+  }
+  #endif
+  #if CYTHON_USE_TYPE_SPECS
+  __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr_spec, NULL); if (unlikely(!__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr)) __PYX_ERR(0, 374, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr_spec, __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr) < 0) __PYX_ERR(0, 374, __pyx_L1_error)
+  #else
+  __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr = &__pyx_type_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr;
+  #endif
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  #endif
+  #if !CYTHON_USE_TYPE_SPECS
+  if (__Pyx_PyType_Ready(__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr) < 0) __PYX_ERR(0, 374, __pyx_L1_error)
+  #endif
+  #if PY_MAJOR_VERSION < 3
+  __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr->tp_print = 0;
+  #endif
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr->tp_dictoffset && __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr->tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer___pyx_scope_struct_2_genexpr->tp_getattro = __Pyx_PyObject_GenericGetAttrNoDict;
+  }
+  #endif
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_type_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
+  /*--- Type import code ---*/
+  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 9, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_7cpython_4type_type = __Pyx_ImportType_3_0_12(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "type", 
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(PyTypeObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyTypeObject),
+  #elif CYTHON_COMPILING_IN_LIMITED_API
+  sizeof(PyTypeObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyTypeObject),
+  #else
+  sizeof(PyHeapTypeObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyHeapTypeObject),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_7cpython_4type_type) __PYX_ERR(3, 9, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(4, 8, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_7cpython_4bool_bool = __Pyx_ImportType_3_0_12(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "bool", sizeof(PyBoolObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyBoolObject),__Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_7cpython_4bool_bool) __PYX_ERR(4, 8, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(5, 15, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_ptype_7cpython_7complex_complex = __Pyx_ImportType_3_0_12(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "complex", sizeof(PyComplexObject), __PYX_GET_STRUCT_ALIGNMENT_3_0_12(PyComplexObject),__Pyx_ImportType_CheckSize_Warn_3_0_12); if (!__pyx_ptype_7cpython_7complex_complex) __PYX_ERR(5, 15, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_variable_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_import_code(void) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
+  /*--- Function import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+
+#if PY_MAJOR_VERSION >= 3
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec__packer(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec__packer},
+  {0, NULL}
+};
+#endif
+
+#ifdef __cplusplus
+namespace {
+  struct PyModuleDef __pyx_moduledef =
+  #else
+  static struct PyModuleDef __pyx_moduledef =
+  #endif
+  {
+      PyModuleDef_HEAD_INIT,
+      "_packer",
+      0, /* m_doc */
+    #if CYTHON_PEP489_MULTI_PHASE_INIT
+      0, /* m_size */
+    #elif CYTHON_USE_MODULE_STATE
+      sizeof(__pyx_mstate), /* m_size */
+    #else
+      -1, /* m_size */
+    #endif
+      __pyx_methods /* m_methods */,
+    #if CYTHON_PEP489_MULTI_PHASE_INIT
+      __pyx_moduledef_slots, /* m_slots */
+    #else
+      NULL, /* m_reload */
+    #endif
+    #if CYTHON_USE_MODULE_STATE
+      __pyx_m_traverse, /* m_traverse */
+      __pyx_m_clear, /* m_clear */
+      NULL /* m_free */
+    #else
+      NULL, /* m_traverse */
+      NULL, /* m_clear */
+      NULL /* m_free */
+    #endif
+  };
+  #ifdef __cplusplus
+} /* anonymous namespace */
+#endif
+#endif
+
+#ifndef CYTHON_NO_PYINIT_EXPORT
+#define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#elif PY_MAJOR_VERSION < 3
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" void
+#else
+#define __Pyx_PyMODINIT_FUNC void
+#endif
+#else
+#ifdef __cplusplus
+#define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+#else
+#define __Pyx_PyMODINIT_FUNC PyObject *
+#endif
+#endif
+
+
+#if PY_MAJOR_VERSION < 3
+__Pyx_PyMODINIT_FUNC init_packer(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC init_packer(void)
+#else
+__Pyx_PyMODINIT_FUNC PyInit__packer(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit__packer(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    #if PY_VERSION_HEX >= 0x030700A1
+    static PY_INT64_T main_interpreter_id = -1;
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return (unlikely(current_id == -1)) ? -1 : 0;
+    } else if (unlikely(main_interpreter_id != current_id))
+    #else
+    static PyInterpreterState *main_interpreter = NULL;
+    PyInterpreterState *current_interpreter = PyThreadState_Get()->interp;
+    if (!main_interpreter) {
+        main_interpreter = current_interpreter;
+    } else if (unlikely(main_interpreter != current_interpreter))
+    #endif
+    {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+#if CYTHON_COMPILING_IN_LIMITED_API
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *module, const char* from_name, const char* to_name, int allow_none)
+#else
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none)
+#endif
+{
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+            result = PyModule_AddObject(module, to_name, value);
+#else
+            result = PyDict_SetItemString(moddict, to_name, value);
+#endif
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    CYTHON_UNUSED_VAR(def);
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    moddict = module;
+#else
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+#endif
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec__packer(PyObject *__pyx_pyinit_module)
+#endif
+#endif
+{
+  int stringtab_initialized = 0;
+  #if CYTHON_USE_MODULE_STATE
+  int pystate_addmodule_run = 0;
+  #endif
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module '_packer' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #elif PY_MAJOR_VERSION >= 3
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_m = __pyx_pyinit_module;
+  Py_INCREF(__pyx_m);
+  #else
+  #if PY_MAJOR_VERSION < 3
+  __pyx_m = Py_InitModule4("_packer", __pyx_methods, 0, 0, PYTHON_API_VERSION); Py_XINCREF(__pyx_m);
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #elif CYTHON_USE_MODULE_STATE
+  __pyx_t_1 = PyModule_Create(&__pyx_moduledef); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  {
+    int add_module_result = PyState_AddModule(__pyx_t_1, &__pyx_moduledef);
+    __pyx_t_1 = 0; /* transfer ownership from __pyx_t_1 to "_packer" pseudovariable */
+    if (unlikely((add_module_result < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+    pystate_addmodule_run = 1;
+  }
+  #else
+  __pyx_m = PyModule_Create(&__pyx_moduledef);
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #endif
+  CYTHON_UNUSED_VAR(__pyx_t_1);
+  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_d);
+  __pyx_b = __Pyx_PyImport_AddModuleRef(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_cython_runtime = __Pyx_PyImport_AddModuleRef((const char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #if CYTHON_REFNANNY
+__Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+if (!__Pyx_RefNanny) {
+  PyErr_Clear();
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+  if (!__Pyx_RefNanny)
+      Py_FatalError("failed to import 'refnanny' module");
+}
+#endif
+  __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit__packer(void)", 0);
+  if (__Pyx_check_binary_version(__PYX_LIMITED_VERSION_HEX, __Pyx_get_runtime_version(), CYTHON_COMPILING_IN_LIMITED_API) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pxy_PyFrame_Initialize_Offsets
+  __Pxy_PyFrame_Initialize_Offsets();
+  #endif
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #ifdef __Pyx_CyFunction_USED
+  if (__pyx_CyFunction_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_FusedFunction_USED
+  if (__pyx_FusedFunction_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Coroutine_USED
+  if (__pyx_Coroutine_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_Generator_USED
+  if (__pyx_Generator_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_AsyncGen_USED
+  if (__pyx_AsyncGen_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #ifdef __Pyx_StopAsyncIteration_USED
+  if (__pyx_StopAsyncIteration_init(__pyx_m) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  /*--- Library function declarations ---*/
+  /*--- Threads initialization code ---*/
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
+  PyEval_InitThreads();
+  #endif
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  stringtab_initialized = 1;
+  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
+  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  if (__pyx_module_is_main_isf_pandas_msgpack__msgpack___packer) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  #if PY_MAJOR_VERSION >= 3
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "isf_pandas_msgpack.msgpack._packer")) {
+      if (unlikely((PyDict_SetItemString(modules, "isf_pandas_msgpack.msgpack._packer", __pyx_m) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  #endif
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_global_init_code();
+  (void)__Pyx_modinit_variable_export_code();
+  (void)__Pyx_modinit_function_export_code();
+  if (unlikely((__Pyx_modinit_type_init_code() < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely((__Pyx_modinit_type_import_code() < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+  (void)__Pyx_modinit_variable_import_code();
+  (void)__Pyx_modinit_function_import_code();
+  /*--- Execution code ---*/
+  #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":11
+ * from libc.limits cimport *
+ * 
+ * import os             # <<<<<<<<<<<<<<
+ * 
+ * from .exceptions import PackValueError
+ */
+  __pyx_t_2 = __Pyx_ImportDottedModule(__pyx_n_s_os, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 11, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_os, __pyx_t_2) < 0) __PYX_ERR(0, 11, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":13
+ * import os
+ * 
+ * from .exceptions import PackValueError             # <<<<<<<<<<<<<<
+ * from . import ExtType
+ * 
+ */
+  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 13, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_n_s_PackValueError);
+  __Pyx_GIVEREF(__pyx_n_s_PackValueError);
+  if (__Pyx_PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_PackValueError)) __PYX_ERR(0, 13, __pyx_L1_error);
+  __pyx_t_3 = __Pyx_Import(__pyx_n_s_exceptions, __pyx_t_2, 1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 13, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_3, __pyx_n_s_PackValueError); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 13, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PackValueError, __pyx_t_2) < 0) __PYX_ERR(0, 13, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":14
+ * 
+ * from .exceptions import PackValueError
+ * from . import ExtType             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_3 = PyList_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 14, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __Pyx_INCREF(__pyx_n_s_ExtType);
+  __Pyx_GIVEREF(__pyx_n_s_ExtType);
+  if (__Pyx_PyList_SET_ITEM(__pyx_t_3, 0, __pyx_n_s_ExtType)) __PYX_ERR(0, 14, __pyx_L1_error);
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s__16, __pyx_t_3, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 14, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_t_3 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_ExtType); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 14, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_ExtType, __pyx_t_3) < 0) __PYX_ERR(0, 14, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":41
+ *     int msgpack_pack_ext(msgpack_packer* pk, char typecode, size_t l)
+ * 
+ * cdef int DEFAULT_RECURSE_LIMIT=511             # <<<<<<<<<<<<<<
+ * cdef size_t DEFAULT_FLUSH_THRESHOLD=1024 * 1024
+ * cdef Py_ssize_t IOV_MAX=1024
+ */
+  __pyx_v_18isf_pandas_msgpack_7msgpack_7_packer_DEFAULT_RECURSE_LIMIT = 0x1FF;
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":42
+ * 
+ * cdef int DEFAULT_RECURSE_LIMIT=511
+ * cdef size_t DEFAULT_FLUSH_THRESHOLD=1024 * 1024             # <<<<<<<<<<<<<<
+ * cdef Py_ssize_t IOV_MAX=1024
+ * 
+ */
+  __pyx_v_18isf_pandas_msgpack_7msgpack_7_packer_DEFAULT_FLUSH_THRESHOLD = 0x100000;
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":43
+ * cdef int DEFAULT_RECURSE_LIMIT=511
+ * cdef size_t DEFAULT_FLUSH_THRESHOLD=1024 * 1024
+ * cdef Py_ssize_t IOV_MAX=1024             # <<<<<<<<<<<<<<
+ * 
+ * # map key of the bin entry padding the ext value that follows it
+ */
+  __pyx_v_18isf_pandas_msgpack_7msgpack_7_packer_IOV_MAX = 0x400;
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":46
+ * 
+ * # map key of the bin entry padding the ext value that follows it
+ * PAD_KEY = u'__pad__'             # <<<<<<<<<<<<<<
+ * cdef char _zeros[256]
+ * 
+ */
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_PAD_KEY, __pyx_n_u_pad) < 0) __PYX_ERR(0, 46, __pyx_L1_error)
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":70
+ * 
+ * 
+ * def _writev(int fd, list segments):             # <<<<<<<<<<<<<<
+ *     """Write all of *segments* to *fd*, with `os.writev` where available."""
+ *     cdef Py_ssize_t i = 0, n
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_1_writev, 0, __pyx_n_s_writev_2, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__pack, __pyx_d, ((PyObject *)__pyx_codeobj__18)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 70, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_writev_2, __pyx_t_2) < 0) __PYX_ERR(0, 70, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":173
+ *                  unicode_errors='strict', use_single_float=False,
+ *                  bint autoreset=1, bint use_bin_type=0,
+ *                  stream=None, size_t flush_threshold=DEFAULT_FLUSH_THRESHOLD,             # <<<<<<<<<<<<<<
+ *                  size_t align=0, size_t offset=0):
+ *         """
+ */
+  __pyx_k__2 = __pyx_v_18isf_pandas_msgpack_7msgpack_7_packer_DEFAULT_FLUSH_THRESHOLD;
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":240
+ *         return buf
+ * 
+ *     def tell(self):             # <<<<<<<<<<<<<<
+ *         """Return the position in the output the next object starts at."""
+ *         return self.written + self.pk.length
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_7tell, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Packer_tell, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__pack, __pyx_d, ((PyObject *)__pyx_codeobj__20)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 240, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer, __pyx_n_s_tell, __pyx_t_2) < 0) __PYX_ERR(0, 240, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":272
+ *         return self.stream is not None or self.segments is not None
+ * 
+ *     def flush(self):             # <<<<<<<<<<<<<<
+ *         """Write buffer content to `stream` and clear buffer."""
+ *         if self.stream is None:
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_9flush, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Packer_flush, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__pack, __pyx_d, ((PyObject *)__pyx_codeobj__21)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 272, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer, __pyx_n_s_flush, __pyx_t_2) < 0) __PYX_ERR(0, 272, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":279
+ * 
+ *     cdef int _pack(self, object o,
+ *                    int nest_limit=DEFAULT_RECURSE_LIMIT,             # <<<<<<<<<<<<<<
+ *                    bint encoded=0) except -1:
+ *         cdef long long llval
+ */
+  __pyx_k__7 = __pyx_v_18isf_pandas_msgpack_7msgpack_7_packer_DEFAULT_RECURSE_LIMIT;
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":424
+ *             return ret
+ * 
+ *     cpdef pack(self, object obj):             # <<<<<<<<<<<<<<
+ *         cdef int ret
+ *         ret = self._pack(obj, DEFAULT_RECURSE_LIMIT)
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_11pack, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Packer_pack, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__pack, __pyx_d, ((PyObject *)__pyx_codeobj__23)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 424, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer, __pyx_n_s_pack, __pyx_t_2) < 0) __PYX_ERR(0, 424, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":436
+ *             return self._take()
+ * 
+ *     def pack_segments(self, object obj):             # <<<<<<<<<<<<<<
+ *         """
+ *         Pack *obj* and return it as a list of segments whose concatenation
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_13pack_segments, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Packer_pack_segments, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__pack, __pyx_d, ((PyObject *)__pyx_codeobj__24)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 436, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer, __pyx_n_s_pack_segments, __pyx_t_2) < 0) __PYX_ERR(0, 436, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":455
+ *             self.segments = None
+ * 
+ *     def pack_ext_type(self, typecode, data):             # <<<<<<<<<<<<<<
+ *         msgpack_pack_ext(&self.pk, typecode, len(data))
+ *         msgpack_pack_raw_body(&self.pk, data, len(data))
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_15pack_ext_type, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Packer_pack_ext_type, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__pack, __pyx_d, ((PyObject *)__pyx_codeobj__26)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 455, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer, __pyx_n_s_pack_ext_type, __pyx_t_2) < 0) __PYX_ERR(0, 455, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":459
+ *         msgpack_pack_raw_body(&self.pk, data, len(data))
+ * 
+ *     def pack_array_header(self, size_t size):             # <<<<<<<<<<<<<<
+ *         if size > (2**32) - 1:
+ *             raise ValueError
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_17pack_array_header, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Packer_pack_array_header, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__pack, __pyx_d, ((PyObject *)__pyx_codeobj__28)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 459, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer, __pyx_n_s_pack_array_header, __pyx_t_2) < 0) __PYX_ERR(0, 459, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":472
+ *             return self._take()
+ * 
+ *     def pack_map_header(self, size_t size):             # <<<<<<<<<<<<<<
+ *         if size > (2**32) - 1:
+ *             raise ValueError
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_19pack_map_header, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Packer_pack_map_header, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__pack, __pyx_d, ((PyObject *)__pyx_codeobj__29)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 472, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer, __pyx_n_s_pack_map_header, __pyx_t_2) < 0) __PYX_ERR(0, 472, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":485
+ *             return self._take()
+ * 
+ *     def pack_map_pairs(self, object pairs):             # <<<<<<<<<<<<<<
+ *         """
+ *         Pack *pairs* as msgpack map type.
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_21pack_map_pairs, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Packer_pack_map_pairs, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__pack, __pyx_d, ((PyObject *)__pyx_codeobj__31)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 485, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer, __pyx_n_s_pack_map_pairs, __pyx_t_2) < 0) __PYX_ERR(0, 485, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":508
+ *             return self._take()
+ * 
+ *     def reset(self):             # <<<<<<<<<<<<<<
+ *         """Clear internal buffer."""
+ *         self.pk.length = 0
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_23reset, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Packer_reset, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__pack, __pyx_d, ((PyObject *)__pyx_codeobj__32)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 508, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer, __pyx_n_s_reset, __pyx_t_2) < 0) __PYX_ERR(0, 508, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer);
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":512
+ *         self.pk.length = 0
+ * 
+ *     def bytes(self):             # <<<<<<<<<<<<<<
+ *         """Return buffer content."""
+ *         return PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_25bytes, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Packer_bytes, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__pack, __pyx_d, ((PyObject *)__pyx_codeobj__33)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 512, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer, __pyx_n_s_bytes, __pyx_t_2) < 0) __PYX_ERR(0, 512, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_18isf_pandas_msgpack_7msgpack_7_packer_Packer);
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_27__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Packer___reduce_cython, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__pack, __pyx_d, ((PyObject *)__pyx_codeobj__34)); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_reduce_cython, __pyx_t_2) < 0) __PYX_ERR(2, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_7_packer_6Packer_29__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Packer___setstate_cython, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__pack, __pyx_d, ((PyObject *)__pyx_codeobj__36)); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 3, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_setstate_cython, __pyx_t_2) < 0) __PYX_ERR(2, 3, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "isf_pandas_msgpack/msgpack/_packer.pyx":1
+ * # coding: utf-8             # <<<<<<<<<<<<<<
+ * #cython: embedsignature=True
+ * 
+ */
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_2) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  if (__pyx_m) {
+    if (__pyx_d && stringtab_initialized) {
+      __Pyx_AddTraceback("init isf_pandas_msgpack.msgpack._packer", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    #if !CYTHON_USE_MODULE_STATE
+    Py_CLEAR(__pyx_m);
+    #else
+    Py_DECREF(__pyx_m);
+    if (pystate_addmodule_run) {
+      PyObject *tp, *value, *tb;
+      PyErr_Fetch(&tp, &value, &tb);
+      PyState_RemoveModule(&__pyx_moduledef);
+      PyErr_Restore(tp, value, tb);
+    }
+    #endif
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init isf_pandas_msgpack.msgpack._packer");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #elif PY_MAJOR_VERSION >= 3
+  return __pyx_m;
+  #else
+  return;
+  #endif
+}
+/* #### Code section: cleanup_globals ### */
+/* #### Code section: cleanup_module ### */
+/* #### Code section: main_method ### */
+/* #### Code section: utility_code_pragmas ### */
+#ifdef _MSC_VER
+#pragma warning( push )
+/* Warning 4127: conditional expression is constant
+ * Cython uses constant conditional expressions to allow in inline functions to be optimized at
+ * compile-time, so this warning is not useful
+ */
+#pragma warning( disable : 4127 )
+#endif
+
+
+
+/* #### Code section: utility_code_def ### */
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* PyErrExceptionMatches */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    int result;
+    PyObject *exc_type;
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject *current_exception = tstate->current_exception;
+    if (unlikely(!current_exception)) return 0;
+    exc_type = (PyObject*) Py_TYPE(current_exception);
+    if (exc_type == err) return 1;
+#else
+    exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+#endif
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_INCREF(exc_type);
+    #endif
+    if (unlikely(PyTuple_Check(err))) {
+        result = __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    } else {
+        result = __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+    }
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_DECREF(exc_type);
+    #endif
+    return result;
+}
+#endif
+
+/* PyErrFetchRestore */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject *tmp_value;
+    assert(type == NULL || (value != NULL && type == (PyObject*) Py_TYPE(value)));
+    if (value) {
+        #if CYTHON_COMPILING_IN_CPYTHON
+        if (unlikely(((PyBaseExceptionObject*) value)->traceback != tb))
+        #endif
+            PyException_SetTraceback(value, tb);
+    }
+    tmp_value = tstate->current_exception;
+    tstate->current_exception = value;
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+#else
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+#endif
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject* exc_value;
+    exc_value = tstate->current_exception;
+    tstate->current_exception = 0;
+    *value = exc_value;
+    *type = NULL;
+    *tb = NULL;
+    if (exc_value) {
+        *type = (PyObject*) Py_TYPE(exc_value);
+        Py_INCREF(*type);
+        #if CYTHON_COMPILING_IN_CPYTHON
+        *tb = ((PyBaseExceptionObject*) exc_value)->traceback;
+        Py_XINCREF(*tb);
+        #else
+        *tb = PyException_GetTraceback(exc_value);
+        #endif
+    }
+#else
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+#endif
+}
+#endif
+
+/* PyObjectGetAttrStr */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+#if PY_MAJOR_VERSION < 3
+    if (likely(tp->tp_getattr))
+        return tp->tp_getattr(obj, PyString_AS_STRING(attr_name));
+#endif
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* PyObjectGetAttrStrNoError */
+#if __PYX_LIMITED_VERSION_HEX < 0x030d00A1
+static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+#endif
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
+    PyObject *result;
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d00A1
+    (void) PyObject_GetOptionalAttr(obj, attr_name, &result);
+    return result;
+#else
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS && PY_VERSION_HEX >= 0x030700B1
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
+    }
+#endif
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    }
+    return result;
+#endif
+}
+
+/* GetBuiltinName */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStrNoError(__pyx_b, name);
+    if (unlikely(!result) && !PyErr_Occurred()) {
+        PyErr_Format(PyExc_NameError,
+#if PY_MAJOR_VERSION >= 3
+            "name '%U' is not defined", name);
+#else
+            "name '%.200s' is not defined", PyString_AS_STRING(name));
+#endif
+    }
+    return result;
+}
+
+/* TupleAndListFromArray */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE void __Pyx_copy_object_array(PyObject *const *CYTHON_RESTRICT src, PyObject** CYTHON_RESTRICT dest, Py_ssize_t length) {
+    PyObject *v;
+    Py_ssize_t i;
+    for (i = 0; i < length; i++) {
+        v = dest[i] = src[i];
+        Py_INCREF(v);
+    }
+}
+static CYTHON_INLINE PyObject *
+__Pyx_PyTuple_FromArray(PyObject *const *src, Py_ssize_t n)
+{
+    PyObject *res;
+    if (n <= 0) {
+        Py_INCREF(__pyx_empty_tuple);
+        return __pyx_empty_tuple;
+    }
+    res = PyTuple_New(n);
+    if (unlikely(res == NULL)) return NULL;
+    __Pyx_copy_object_array(src, ((PyTupleObject*)res)->ob_item, n);
+    return res;
+}
+static CYTHON_INLINE PyObject *
+__Pyx_PyList_FromArray(PyObject *const *src, Py_ssize_t n)
+{
+    PyObject *res;
+    if (n <= 0) {
+        return PyList_New(0);
+    }
+    res = PyList_New(n);
+    if (unlikely(res == NULL)) return NULL;
+    __Pyx_copy_object_array(src, ((PyListObject*)res)->ob_item, n);
+    return res;
+}
+#endif
+
+/* BytesEquals */
+static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+    if (s1 == s2) {
+        return (equals == Py_EQ);
+    } else if (PyBytes_CheckExact(s1) & PyBytes_CheckExact(s2)) {
+        const char *ps1, *ps2;
+        Py_ssize_t length = PyBytes_GET_SIZE(s1);
+        if (length != PyBytes_GET_SIZE(s2))
+            return (equals == Py_NE);
+        ps1 = PyBytes_AS_STRING(s1);
+        ps2 = PyBytes_AS_STRING(s2);
+        if (ps1[0] != ps2[0]) {
+            return (equals == Py_NE);
+        } else if (length == 1) {
+            return (equals == Py_EQ);
+        } else {
+            int result;
+#if CYTHON_USE_UNICODE_INTERNALS && (PY_VERSION_HEX < 0x030B0000)
+            Py_hash_t hash1, hash2;
+            hash1 = ((PyBytesObject*)s1)->ob_shash;
+            hash2 = ((PyBytesObject*)s2)->ob_shash;
+            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
+                return (equals == Py_NE);
+            }
+#endif
+            result = memcmp(ps1, ps2, (size_t)length);
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & PyBytes_CheckExact(s2)) {
+        return (equals == Py_NE);
+    } else if ((s2 == Py_None) & PyBytes_CheckExact(s1)) {
+        return (equals == Py_NE);
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
+    }
+#endif
+}
+
+/* UnicodeEquals */
+static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+#if PY_MAJOR_VERSION < 3
+    PyObject* owned_ref = NULL;
+#endif
+    int s1_is_unicode, s2_is_unicode;
+    if (s1 == s2) {
+        goto return_eq;
+    }
+    s1_is_unicode = PyUnicode_CheckExact(s1);
+    s2_is_unicode = PyUnicode_CheckExact(s2);
+#if PY_MAJOR_VERSION < 3
+    if ((s1_is_unicode & (!s2_is_unicode)) && PyString_CheckExact(s2)) {
+        owned_ref = PyUnicode_FromObject(s2);
+        if (unlikely(!owned_ref))
+            return -1;
+        s2 = owned_ref;
+        s2_is_unicode = 1;
+    } else if ((s2_is_unicode & (!s1_is_unicode)) && PyString_CheckExact(s1)) {
+        owned_ref = PyUnicode_FromObject(s1);
+        if (unlikely(!owned_ref))
+            return -1;
+        s1 = owned_ref;
+        s1_is_unicode = 1;
+    } else if (((!s2_is_unicode) & (!s1_is_unicode))) {
+        return __Pyx_PyBytes_Equals(s1, s2, equals);
+    }
+#endif
+    if (s1_is_unicode & s2_is_unicode) {
+        Py_ssize_t length;
+        int kind;
+        void *data1, *data2;
+        if (unlikely(__Pyx_PyUnicode_READY(s1) < 0) || unlikely(__Pyx_PyUnicode_READY(s2) < 0))
+            return -1;
+        length = __Pyx_PyUnicode_GET_LENGTH(s1);
+        if (length != __Pyx_PyUnicode_GET_LENGTH(s2)) {
+            goto return_ne;
+        }
+#if CYTHON_USE_UNICODE_INTERNALS
+        {
+            Py_hash_t hash1, hash2;
+        #if CYTHON_PEP393_ENABLED
+            hash1 = ((PyASCIIObject*)s1)->hash;
+            hash2 = ((PyASCIIObject*)s2)->hash;
+        #else
+            hash1 = ((PyUnicodeObject*)s1)->hash;
+            hash2 = ((PyUnicodeObject*)s2)->hash;
+        #endif
+            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
+                goto return_ne;
+            }
+        }
+#endif
+        kind = __Pyx_PyUnicode_KIND(s1);
+        if (kind != __Pyx_PyUnicode_KIND(s2)) {
+            goto return_ne;
+        }
+        data1 = __Pyx_PyUnicode_DATA(s1);
+        data2 = __Pyx_PyUnicode_DATA(s2);
+        if (__Pyx_PyUnicode_READ(kind, data1, 0) != __Pyx_PyUnicode_READ(kind, data2, 0)) {
+            goto return_ne;
+        } else if (length == 1) {
+            goto return_eq;
+        } else {
+            int result = memcmp(data1, data2, (size_t)(length * kind));
+            #if PY_MAJOR_VERSION < 3
+            Py_XDECREF(owned_ref);
+            #endif
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & s2_is_unicode) {
+        goto return_ne;
+    } else if ((s2 == Py_None) & s1_is_unicode) {
+        goto return_ne;
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        #if PY_MAJOR_VERSION < 3
+        Py_XDECREF(owned_ref);
+        #endif
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
+    }
+return_eq:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
+    #endif
+    return (equals == Py_EQ);
+return_ne:
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(owned_ref);
+    #endif
+    return (equals == Py_NE);
+#endif
+}
+
+/* fastcall */
+#if CYTHON_METH_FASTCALL
+static CYTHON_INLINE PyObject * __Pyx_GetKwValue_FASTCALL(PyObject *kwnames, PyObject *const *kwvalues, PyObject *s)
+{
+    Py_ssize_t i, n = PyTuple_GET_SIZE(kwnames);
+    for (i = 0; i < n; i++)
+    {
+        if (s == PyTuple_GET_ITEM(kwnames, i)) return kwvalues[i];
+    }
+    for (i = 0; i < n; i++)
+    {
+        int eq = __Pyx_PyUnicode_Equals(s, PyTuple_GET_ITEM(kwnames, i), Py_EQ);
+        if (unlikely(eq != 0)) {
+            if (unlikely(eq < 0)) return NULL;
+            return kwvalues[i];
+        }
+    }
+    return NULL;
+}
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030d0000
+CYTHON_UNUSED static PyObject *__Pyx_KwargsAsDict_FASTCALL(PyObject *kwnames, PyObject *const *kwvalues) {
+    Py_ssize_t i, nkwargs = PyTuple_GET_SIZE(kwnames);
+    PyObject *dict;
+    dict = PyDict_New();
+    if (unlikely(!dict))
+        return NULL;
+    for (i=0; i<nkwargs; i++) {
+        PyObject *key = PyTuple_GET_ITEM(kwnames, i);
+        if (unlikely(PyDict_SetItem(dict, key, kwvalues[i]) < 0))
+            goto bad;
+    }
+    return dict;
+bad:
+    Py_DECREF(dict);
+    return NULL;
+}
+#endif
+#endif
+
+/* RaiseArgTupleInvalid */
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* RaiseDoubleKeywords */
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        #if PY_MAJOR_VERSION >= 3
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+        #else
+        "%s() got multiple values for keyword argument '%s'", func_name,
+        PyString_AsString(kw_name));
+        #endif
+}
+
+/* ParseKeywords */
+static int __Pyx_ParseOptionalKeywords(
+    PyObject *kwds,
+    PyObject *const *kwvalues,
+    PyObject **argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject *key = 0, *value = 0;
+    Py_ssize_t pos = 0;
+    PyObject*** name;
+    PyObject*** first_kw_arg = argnames + num_pos_args;
+    int kwds_is_tuple = CYTHON_METH_FASTCALL && likely(PyTuple_Check(kwds));
+    while (1) {
+        Py_XDECREF(key); key = NULL;
+        Py_XDECREF(value); value = NULL;
+        if (kwds_is_tuple) {
+            Py_ssize_t size;
+#if CYTHON_ASSUME_SAFE_MACROS
+            size = PyTuple_GET_SIZE(kwds);
+#else
+            size = PyTuple_Size(kwds);
+            if (size < 0) goto bad;
+#endif
+            if (pos >= size) break;
+#if CYTHON_AVOID_BORROWED_REFS
+            key = __Pyx_PySequence_ITEM(kwds, pos);
+            if (!key) goto bad;
+#elif CYTHON_ASSUME_SAFE_MACROS
+            key = PyTuple_GET_ITEM(kwds, pos);
+#else
+            key = PyTuple_GetItem(kwds, pos);
+            if (!key) goto bad;
+#endif
+            value = kwvalues[pos];
+            pos++;
+        }
+        else
+        {
+            if (!PyDict_Next(kwds, &pos, &key, &value)) break;
+#if CYTHON_AVOID_BORROWED_REFS
+            Py_INCREF(key);
+#endif
+        }
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            values[name-argnames] = value;
+#if CYTHON_AVOID_BORROWED_REFS
+            Py_INCREF(value);
+            Py_DECREF(key);
+#endif
+            key = NULL;
+            value = NULL;
+            continue;
+        }
+#if !CYTHON_AVOID_BORROWED_REFS
+        Py_INCREF(key);
+#endif
+        Py_INCREF(value);
+        name = first_kw_arg;
+        #if PY_MAJOR_VERSION < 3
+        if (likely(PyString_Check(key))) {
+            while (*name) {
+                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
+                        && _PyString_Eq(**name, key)) {
+                    values[name-argnames] = value;
+#if CYTHON_AVOID_BORROWED_REFS
+                    value = NULL;
+#endif
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    if ((**argname == key) || (
+                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
+                             && _PyString_Eq(**argname, key))) {
+                        goto arg_passed_twice;
+                    }
+                    argname++;
+                }
+            }
+        } else
+        #endif
+        if (likely(PyUnicode_Check(key))) {
+            while (*name) {
+                int cmp = (
+                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                #endif
+                    PyUnicode_Compare(**name, key)
+                );
+                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                if (cmp == 0) {
+                    values[name-argnames] = value;
+#if CYTHON_AVOID_BORROWED_REFS
+                    value = NULL;
+#endif
+                    break;
+                }
+                name++;
+            }
+            if (*name) continue;
+            else {
+                PyObject*** argname = argnames;
+                while (argname != first_kw_arg) {
+                    int cmp = (**argname == key) ? 0 :
+                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
+                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
+                    #endif
+                        PyUnicode_Compare(**argname, key);
+                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+                    if (cmp == 0) goto arg_passed_twice;
+                    argname++;
+                }
+            }
+        } else
+            goto invalid_keyword_type;
+        if (kwds2) {
+            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+        } else {
+            goto invalid_keyword;
+        }
+    }
+    Py_XDECREF(key);
+    Py_XDECREF(value);
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+invalid_keyword:
+    #if PY_MAJOR_VERSION < 3
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+    PyErr_Format(PyExc_TypeError,
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+bad:
+    Py_XDECREF(key);
+    Py_XDECREF(value);
+    return -1;
+}
+
+/* ArgTypeTest */
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
+{
+    __Pyx_TypeName type_name;
+    __Pyx_TypeName obj_type_name;
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    else if (exact) {
+        #if PY_MAJOR_VERSION == 2
+        if ((type == &PyBaseString_Type) && likely(__Pyx_PyBaseString_CheckExact(obj))) return 1;
+        #endif
+    }
+    else {
+        if (likely(__Pyx_TypeCheck(obj, type))) return 1;
+    }
+    type_name = __Pyx_PyType_GetName(type);
+    obj_type_name = __Pyx_PyType_GetName(Py_TYPE(obj));
+    PyErr_Format(PyExc_TypeError,
+        "Argument '%.200s' has incorrect type (expected " __Pyx_FMT_TYPENAME
+        ", got " __Pyx_FMT_TYPENAME ")", name, type_name, obj_type_name);
+    __Pyx_DECREF_TypeName(type_name);
+    __Pyx_DECREF_TypeName(obj_type_name);
+    return 0;
+}
+
+/* PyFunctionFastCall */
+#if CYTHON_FAST_PYCALL && !CYTHON_VECTORCALL
+static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
+                                               PyObject *globals) {
+    PyFrameObject *f;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject **fastlocals;
+    Py_ssize_t i;
+    PyObject *result;
+    assert(globals != NULL);
+    /* XXX Perhaps we should create a specialized
+       PyFrame_New() that doesn't take locals, but does
+       take builtins without sanity checking them.
+       */
+    assert(tstate != NULL);
+    f = PyFrame_New(tstate, co, globals, NULL);
+    if (f == NULL) {
+        return NULL;
+    }
+    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
+    for (i = 0; i < na; i++) {
+        Py_INCREF(*args);
+        fastlocals[i] = *args++;
+    }
+    result = PyEval_EvalFrameEx(f,0);
+    ++tstate->recursion_depth;
+    Py_DECREF(f);
+    --tstate->recursion_depth;
+    return result;
+}
+static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
+    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
+    PyObject *globals = PyFunction_GET_GLOBALS(func);
+    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
+    PyObject *closure;
+#if PY_MAJOR_VERSION >= 3
+    PyObject *kwdefs;
+#endif
+    PyObject *kwtuple, **k;
+    PyObject **d;
+    Py_ssize_t nd;
+    Py_ssize_t nk;
+    PyObject *result;
+    assert(kwargs == NULL || PyDict_Check(kwargs));
+    nk = kwargs ? PyDict_Size(kwargs) : 0;
+    #if PY_MAJOR_VERSION < 3
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object"))) {
+        return NULL;
+    }
+    #else
+    if (unlikely(Py_EnterRecursiveCall(" while calling a Python object"))) {
+        return NULL;
+    }
+    #endif
+    if (
+#if PY_MAJOR_VERSION >= 3
+            co->co_kwonlyargcount == 0 &&
+#endif
+            likely(kwargs == NULL || nk == 0) &&
+            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
+        if (argdefs == NULL && co->co_argcount == nargs) {
+            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
+            goto done;
+        }
+        else if (nargs == 0 && argdefs != NULL
+                 && co->co_argcount == Py_SIZE(argdefs)) {
+            /* function called with no arguments, but all parameters have
+               a default value: use default values as arguments .*/
+            args = &PyTuple_GET_ITEM(argdefs, 0);
+            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
+            goto done;
+        }
+    }
+    if (kwargs != NULL) {
+        Py_ssize_t pos, i;
+        kwtuple = PyTuple_New(2 * nk);
+        if (kwtuple == NULL) {
+            result = NULL;
+            goto done;
+        }
+        k = &PyTuple_GET_ITEM(kwtuple, 0);
+        pos = i = 0;
+        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
+            Py_INCREF(k[i]);
+            Py_INCREF(k[i+1]);
+            i += 2;
+        }
+        nk = i / 2;
+    }
+    else {
+        kwtuple = NULL;
+        k = NULL;
+    }
+    closure = PyFunction_GET_CLOSURE(func);
+#if PY_MAJOR_VERSION >= 3
+    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
+#endif
+    if (argdefs != NULL) {
+        d = &PyTuple_GET_ITEM(argdefs, 0);
+        nd = Py_SIZE(argdefs);
+    }
+    else {
+        d = NULL;
+        nd = 0;
+    }
+#if PY_MAJOR_VERSION >= 3
+    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, kwdefs, closure);
+#else
+    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
+                               args, (int)nargs,
+                               k, (int)nk,
+                               d, (int)nd, closure);
+#endif
+    Py_XDECREF(kwtuple);
+done:
+    Py_LeaveRecursiveCall();
+    return result;
+}
+#endif
+
+/* PyObjectCall */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    #if PY_MAJOR_VERSION < 3
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    #else
+    if (unlikely(Py_EnterRecursiveCall(" while calling a Python object")))
+        return NULL;
+    #endif
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallMethO */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = __Pyx_CyOrPyCFunction_GET_FUNCTION(func);
+    self = __Pyx_CyOrPyCFunction_GET_SELF(func);
+    #if PY_MAJOR_VERSION < 3
+    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
+        return NULL;
+    #else
+    if (unlikely(Py_EnterRecursiveCall(" while calling a Python object")))
+        return NULL;
+    #endif
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectFastCall */
+#if PY_VERSION_HEX < 0x03090000 || CYTHON_COMPILING_IN_LIMITED_API
+static PyObject* __Pyx_PyObject_FastCall_fallback(PyObject *func, PyObject **args, size_t nargs, PyObject *kwargs) {
+    PyObject *argstuple;
+    PyObject *result = 0;
+    size_t i;
+    argstuple = PyTuple_New((Py_ssize_t)nargs);
+    if (unlikely(!argstuple)) return NULL;
+    for (i = 0; i < nargs; i++) {
+        Py_INCREF(args[i]);
+        if (__Pyx_PyTuple_SET_ITEM(argstuple, (Py_ssize_t)i, args[i]) < 0) goto bad;
+    }
+    result = __Pyx_PyObject_Call(func, argstuple, kwargs);
+  bad:
+    Py_DECREF(argstuple);
+    return result;
+}
+#endif
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObject **args, size_t _nargs, PyObject *kwargs) {
+    Py_ssize_t nargs = __Pyx_PyVectorcall_NARGS(_nargs);
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (nargs == 0 && kwargs == NULL) {
+        if (__Pyx_CyOrPyCFunction_Check(func) && likely( __Pyx_CyOrPyCFunction_GET_FLAGS(func) & METH_NOARGS))
+            return __Pyx_PyObject_CallMethO(func, NULL);
+    }
+    else if (nargs == 1 && kwargs == NULL) {
+        if (__Pyx_CyOrPyCFunction_Check(func) && likely( __Pyx_CyOrPyCFunction_GET_FLAGS(func) & METH_O))
+            return __Pyx_PyObject_CallMethO(func, args[0]);
+    }
+#endif
+    #if PY_VERSION_HEX < 0x030800B1
+    #if CYTHON_FAST_PYCCALL
+    if (PyCFunction_Check(func)) {
+        if (kwargs) {
+            return _PyCFunction_FastCallDict(func, args, nargs, kwargs);
+        } else {
+            return _PyCFunction_FastCallKeywords(func, args, nargs, NULL);
+        }
+    }
+    #if PY_VERSION_HEX >= 0x030700A1
+    if (!kwargs && __Pyx_IS_TYPE(func, &PyMethodDescr_Type)) {
+        return _PyMethodDescr_FastCallKeywords(func, args, nargs, NULL);
+    }
+    #endif
+    #endif
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs);
+    }
+    #endif
+    #endif
+    if (kwargs == NULL) {
+        #if CYTHON_VECTORCALL
+        #if PY_VERSION_HEX < 0x03090000
+        vectorcallfunc f = _PyVectorcall_Function(func);
+        #else
+        vectorcallfunc f = PyVectorcall_Function(func);
+        #endif
+        if (f) {
+            return f(func, args, (size_t)nargs, NULL);
+        }
+        #elif defined(__Pyx_CyFunction_USED) && CYTHON_BACKPORT_VECTORCALL
+        if (__Pyx_CyFunction_CheckExact(func)) {
+            __pyx_vectorcallfunc f = __Pyx_CyFunction_func_vectorcall(func);
+            if (f) return f(func, args, (size_t)nargs, NULL);
+        }
+        #endif
+    }
+    if (nargs == 0) {
+        return __Pyx_PyObject_Call(func, __pyx_empty_tuple, kwargs);
+    }
+    #if PY_VERSION_HEX >= 0x03090000 && !CYTHON_COMPILING_IN_LIMITED_API
+    return PyObject_VectorcallDict(func, args, (size_t)nargs, kwargs);
+    #else
+    return __Pyx_PyObject_FastCall_fallback(func, args, (size_t)nargs, kwargs);
+    #endif
+}
+
+/* GetAttr */
+static CYTHON_INLINE PyObject *__Pyx_GetAttr(PyObject *o, PyObject *n) {
+#if CYTHON_USE_TYPE_SLOTS
+#if PY_MAJOR_VERSION >= 3
+    if (likely(PyUnicode_Check(n)))
+#else
+    if (likely(PyString_Check(n)))
+#endif
+        return __Pyx_PyObject_GetAttrStr(o, n);
+#endif
+    return PyObject_GetAttr(o, n);
+}
+
+/* HasAttr */
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *o, PyObject *n) {
+    PyObject *r;
+    if (unlikely(!__Pyx_PyBaseString_Check(n))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "hasattr(): attribute name must be string");
+        return -1;
+    }
+    r = __Pyx_GetAttr(o, n);
+    if (!r) {
+        PyErr_Clear();
+        return 0;
+    } else {
+        Py_DECREF(r);
+        return 1;
+    }
+}
+
+/* PyDictVersioning */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if !CYTHON_AVOID_BORROWED_REFS
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1 && PY_VERSION_HEX < 0x030d0000
+    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    } else if (unlikely(PyErr_Occurred())) {
+        return NULL;
+    }
+#elif CYTHON_COMPILING_IN_LIMITED_API
+    if (unlikely(!__pyx_m)) {
+        return NULL;
+    }
+    result = PyObject_GetAttr(__pyx_m, name);
+    if (likely(result)) {
+        return result;
+    }
+#else
+    result = PyDict_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+#endif
+#else
+    result = PyObject_GetItem(__pyx_d, name);
+    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
+/* SliceObject */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetSlice(PyObject* obj,
+        Py_ssize_t cstart, Py_ssize_t cstop,
+        PyObject** _py_start, PyObject** _py_stop, PyObject** _py_slice,
+        int has_cstart, int has_cstop, int wraparound) {
+    __Pyx_TypeName obj_type_name;
+#if CYTHON_USE_TYPE_SLOTS
+    PyMappingMethods* mp;
+#if PY_MAJOR_VERSION < 3
+    PySequenceMethods* ms = Py_TYPE(obj)->tp_as_sequence;
+    if (likely(ms && ms->sq_slice)) {
+        if (!has_cstart) {
+            if (_py_start && (*_py_start != Py_None)) {
+                cstart = __Pyx_PyIndex_AsSsize_t(*_py_start);
+                if ((cstart == (Py_ssize_t)-1) && PyErr_Occurred()) goto bad;
+            } else
+                cstart = 0;
+        }
+        if (!has_cstop) {
+            if (_py_stop && (*_py_stop != Py_None)) {
+                cstop = __Pyx_PyIndex_AsSsize_t(*_py_stop);
+                if ((cstop == (Py_ssize_t)-1) && PyErr_Occurred()) goto bad;
+            } else
+                cstop = PY_SSIZE_T_MAX;
+        }
+        if (wraparound && unlikely((cstart < 0) | (cstop < 0)) && likely(ms->sq_length)) {
+            Py_ssize_t l = ms->sq_length(obj);
+            if (likely(l >= 0)) {
+                if (cstop < 0) {
+                    cstop += l;
+                    if (cstop < 0) cstop = 0;
+                }
+                if (cstart < 0) {
+                    cstart += l;
+                    if (cstart < 0) cstart = 0;
+                }
+            } else {
+                if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                    goto bad;
+                PyErr_Clear();
+            }
+        }
+        return ms->sq_slice(obj, cstart, cstop);
+    }
+#else
+    CYTHON_UNUSED_VAR(wraparound);
+#endif
+    mp = Py_TYPE(obj)->tp_as_mapping;
+    if (likely(mp && mp->mp_subscript))
+#else
+    CYTHON_UNUSED_VAR(wraparound);
+#endif
+    {
+        PyObject* result;
+        PyObject *py_slice, *py_start, *py_stop;
+        if (_py_slice) {
+            py_slice = *_py_slice;
+        } else {
+            PyObject* owned_start = NULL;
+            PyObject* owned_stop = NULL;
+            if (_py_start) {
+                py_start = *_py_start;
+            } else {
+                if (has_cstart) {
+                    owned_start = py_start = PyInt_FromSsize_t(cstart);
+                    if (unlikely(!py_start)) goto bad;
+                } else
+                    py_start = Py_None;
+            }
+            if (_py_stop) {
+                py_stop = *_py_stop;
+            } else {
+                if (has_cstop) {
+                    owned_stop = py_stop = PyInt_FromSsize_t(cstop);
+                    if (unlikely(!py_stop)) {
+                        Py_XDECREF(owned_start);
+                        goto bad;
+                    }
+                } else
+                    py_stop = Py_None;
+            }
+            py_slice = PySlice_New(py_start, py_stop, Py_None);
+            Py_XDECREF(owned_start);
+            Py_XDECREF(owned_stop);
+            if (unlikely(!py_slice)) goto bad;
+        }
+#if CYTHON_USE_TYPE_SLOTS
+        result = mp->mp_subscript(obj, py_slice);
+#else
+        result = PyObject_GetItem(obj, py_slice);
+#endif
+        if (!_py_slice) {
+            Py_DECREF(py_slice);
+        }
+        return result;
+    }
+    obj_type_name = __Pyx_PyType_GetName(Py_TYPE(obj));
+    PyErr_Format(PyExc_TypeError,
+        "'" __Pyx_FMT_TYPENAME "' object is unsliceable", obj_type_name);
+    __Pyx_DECREF_TypeName(obj_type_name);
+bad:
+    return NULL;
+}
+
+/* SliceTupleAndList */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE void __Pyx_crop_slice(Py_ssize_t* _start, Py_ssize_t* _stop, Py_ssize_t* _length) {
+    Py_ssize_t start = *_start, stop = *_stop, length = *_length;
+    if (start < 0) {
+        start += length;
+        if (start < 0)
+            start = 0;
+    }
+    if (stop < 0)
+        stop += length;
+    else if (stop > length)
+        stop = length;
+    *_length = stop - start;
+    *_start = start;
+    *_stop = stop;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyList_GetSlice(
+            PyObject* src, Py_ssize_t start, Py_ssize_t stop) {
+    Py_ssize_t length = PyList_GET_SIZE(src);
+    __Pyx_crop_slice(&start, &stop, &length);
+    if (length <= 0) {
+        return PyList_New(0);
+    }
+    return __Pyx_PyList_FromArray(((PyListObject*)src)->ob_item + start, length);
+}
+static CYTHON_INLINE PyObject* __Pyx_PyTuple_GetSlice(
+            PyObject* src, Py_ssize_t start, Py_ssize_t stop) {
+    Py_ssize_t length = PyTuple_GET_SIZE(src);
+    __Pyx_crop_slice(&start, &stop, &length);
+    return __Pyx_PyTuple_FromArray(((PyTupleObject*)src)->ob_item + start, length);
+}
+#endif
+
+/* GetItemInt */
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (unlikely(!j)) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyList_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyList_GET_SIZE(o)))) {
+        PyObject *r = PyList_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              CYTHON_NCP_UNUSED int wraparound,
+                                                              CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyTuple_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyTuple_GET_SIZE(o)))) {
+        PyObject *r = PyTuple_GET_ITEM(o, wrapped_i);
+        Py_INCREF(r);
+        return r;
+    }
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+#else
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
+                                                     CYTHON_NCP_UNUSED int wraparound,
+                                                     CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
+        if ((!boundscheck) || (likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o))))) {
+            PyObject *r = PyList_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    }
+    else if (PyTuple_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyTuple_GET_SIZE(o)))) {
+            PyObject *r = PyTuple_GET_ITEM(o, n);
+            Py_INCREF(r);
+            return r;
+        }
+    } else {
+        PyMappingMethods *mm = Py_TYPE(o)->tp_as_mapping;
+        PySequenceMethods *sm = Py_TYPE(o)->tp_as_sequence;
+        if (mm && mm->mp_subscript) {
+            PyObject *r, *key = PyInt_FromSsize_t(i);
+            if (unlikely(!key)) return NULL;
+            r = mm->mp_subscript(o, key);
+            Py_DECREF(key);
+            return r;
+        }
+        if (likely(sm && sm->sq_item)) {
+            if (wraparound && unlikely(i < 0) && likely(sm->sq_length)) {
+                Py_ssize_t l = sm->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return NULL;
+                    PyErr_Clear();
+                }
+            }
+            return sm->sq_item(o, i);
+        }
+    }
+#else
+    if (is_list || !PyMapping_Check(o)) {
+        return PySequence_GetItem(o, i);
+    }
+#endif
+    return __Pyx_GetItemInt_Generic(o, PyInt_FromSsize_t(i));
+}
+
+/* SetItemInt */
+static int __Pyx_SetItemInt_Generic(PyObject *o, PyObject *j, PyObject *v) {
+    int r;
+    if (unlikely(!j)) return -1;
+    r = PyObject_SetItem(o, j, v);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE int __Pyx_SetItemInt_Fast(PyObject *o, Py_ssize_t i, PyObject *v, int is_list,
+                                               CYTHON_NCP_UNUSED int wraparound, CYTHON_NCP_UNUSED int boundscheck) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS && CYTHON_USE_TYPE_SLOTS
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = (!wraparound) ? i : ((likely(i >= 0)) ? i : i + PyList_GET_SIZE(o));
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o)))) {
+            PyObject* old = PyList_GET_ITEM(o, n);
+            Py_INCREF(v);
+            PyList_SET_ITEM(o, n, v);
+            Py_DECREF(old);
+            return 1;
+        }
+    } else {
+        PyMappingMethods *mm = Py_TYPE(o)->tp_as_mapping;
+        PySequenceMethods *sm = Py_TYPE(o)->tp_as_sequence;
+        if (mm && mm->mp_ass_subscript) {
+            int r;
+            PyObject *key = PyInt_FromSsize_t(i);
+            if (unlikely(!key)) return -1;
+            r = mm->mp_ass_subscript(o, key, v);
+            Py_DECREF(key);
+            return r;
+        }
+        if (likely(sm && sm->sq_ass_item)) {
+            if (wraparound && unlikely(i < 0) && likely(sm->sq_length)) {
+                Py_ssize_t l = sm->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return -1;
+                    PyErr_Clear();
+                }
+            }
+            return sm->sq_ass_item(o, i, v);
+        }
+    }
+#else
+    if (is_list || !PyMapping_Check(o))
+    {
+        return PySequence_SetItem(o, i, v);
+    }
+#endif
+    return __Pyx_SetItemInt_Generic(o, PyInt_FromSsize_t(i), v);
+}
+
+/* KeywordStringCheck */
+static int __Pyx_CheckKeywordStrings(
+    PyObject *kw,
+    const char* function_name,
+    int kw_allowed)
+{
+    PyObject* key = 0;
+    Py_ssize_t pos = 0;
+#if CYTHON_COMPILING_IN_PYPY
+    if (!kw_allowed && PyDict_Next(kw, &pos, &key, 0))
+        goto invalid_keyword;
+    return 1;
+#else
+    if (CYTHON_METH_FASTCALL && likely(PyTuple_Check(kw))) {
+        Py_ssize_t kwsize;
+#if CYTHON_ASSUME_SAFE_MACROS
+        kwsize = PyTuple_GET_SIZE(kw);
+#else
+        kwsize = PyTuple_Size(kw);
+        if (kwsize < 0) return 0;
+#endif
+        if (unlikely(kwsize == 0))
+            return 1;
+        if (!kw_allowed) {
+#if CYTHON_ASSUME_SAFE_MACROS
+            key = PyTuple_GET_ITEM(kw, 0);
+#else
+            key = PyTuple_GetItem(kw, pos);
+            if (!key) return 0;
+#endif
+            goto invalid_keyword;
+        }
+#if PY_VERSION_HEX < 0x03090000
+        for (pos = 0; pos < kwsize; pos++) {
+#if CYTHON_ASSUME_SAFE_MACROS
+            key = PyTuple_GET_ITEM(kw, pos);
+#else
+            key = PyTuple_GetItem(kw, pos);
+            if (!key) return 0;
+#endif
+            if (unlikely(!PyUnicode_Check(key)))
+                goto invalid_keyword_type;
+        }
+#endif
+        return 1;
+    }
+    while (PyDict_Next(kw, &pos, &key, 0)) {
+        #if PY_MAJOR_VERSION < 3
+        if (unlikely(!PyString_Check(key)))
+        #endif
+            if (unlikely(!PyUnicode_Check(key)))
+                goto invalid_keyword_type;
+    }
+    if (!kw_allowed && unlikely(key))
+        goto invalid_keyword;
+    return 1;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    return 0;
+#endif
+invalid_keyword:
+    #if PY_MAJOR_VERSION < 3
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() got an unexpected keyword argument '%.200s'",
+        function_name, PyString_AsString(key));
+    #else
+    PyErr_Format(PyExc_TypeError,
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    #endif
+    return 0;
+}
+
+/* RaiseException */
+#if PY_MAJOR_VERSION < 3
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    __Pyx_PyThreadState_declare
+    CYTHON_UNUSED_VAR(cause);
+    Py_XINCREF(type);
+    if (!value || value == Py_None)
+        value = NULL;
+    else
+        Py_INCREF(value);
+    if (!tb || tb == Py_None)
+        tb = NULL;
+    else {
+        Py_INCREF(tb);
+        if (!PyTraceBack_Check(tb)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: arg 3 must be a traceback or None");
+            goto raise_error;
+        }
+    }
+    if (PyType_Check(type)) {
+#if CYTHON_COMPILING_IN_PYPY
+        if (!value) {
+            Py_INCREF(Py_None);
+            value = Py_None;
+        }
+#endif
+        PyErr_NormalizeException(&type, &value, &tb);
+    } else {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto raise_error;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(type);
+        Py_INCREF(type);
+        if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
+            PyErr_SetString(PyExc_TypeError,
+                "raise: exception class must be a subclass of BaseException");
+            goto raise_error;
+        }
+    }
     __Pyx_PyThreadState_assign
     __Pyx_ErrRestore(type, value, tb);
     return;
@@ -9576,189 +15171,19 @@ static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject
             tstate->curexc_traceback = tb;
             Py_XDECREF(tmp_tb);
         }
-#else
-        PyObject *tmp_type, *tmp_value, *tmp_tb;
-        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
-        Py_INCREF(tb);
-        PyErr_Restore(tmp_type, tmp_value, tb);
-        Py_XDECREF(tmp_tb);
-#endif
-    }
-bad:
-    Py_XDECREF(owned_instance);
-    return;
-}
-#endif
-
-/* RaiseDoubleKeywords */
-static void __Pyx_RaiseDoubleKeywordsError(
-    const char* func_name,
-    PyObject* kw_name)
-{
-    PyErr_Format(PyExc_TypeError,
-        #if PY_MAJOR_VERSION >= 3
-        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
-        #else
-        "%s() got multiple values for keyword argument '%s'", func_name,
-        PyString_AsString(kw_name));
-        #endif
-}
-
-/* ParseKeywords */
-static int __Pyx_ParseOptionalKeywords(
-    PyObject *kwds,
-    PyObject *const *kwvalues,
-    PyObject **argnames[],
-    PyObject *kwds2,
-    PyObject *values[],
-    Py_ssize_t num_pos_args,
-    const char* function_name)
-{
-    PyObject *key = 0, *value = 0;
-    Py_ssize_t pos = 0;
-    PyObject*** name;
-    PyObject*** first_kw_arg = argnames + num_pos_args;
-    int kwds_is_tuple = CYTHON_METH_FASTCALL && likely(PyTuple_Check(kwds));
-    while (1) {
-        Py_XDECREF(key); key = NULL;
-        Py_XDECREF(value); value = NULL;
-        if (kwds_is_tuple) {
-            Py_ssize_t size;
-#if CYTHON_ASSUME_SAFE_MACROS
-            size = PyTuple_GET_SIZE(kwds);
-#else
-            size = PyTuple_Size(kwds);
-            if (size < 0) goto bad;
-#endif
-            if (pos >= size) break;
-#if CYTHON_AVOID_BORROWED_REFS
-            key = __Pyx_PySequence_ITEM(kwds, pos);
-            if (!key) goto bad;
-#elif CYTHON_ASSUME_SAFE_MACROS
-            key = PyTuple_GET_ITEM(kwds, pos);
-#else
-            key = PyTuple_GetItem(kwds, pos);
-            if (!key) goto bad;
-#endif
-            value = kwvalues[pos];
-            pos++;
-        }
-        else
-        {
-            if (!PyDict_Next(kwds, &pos, &key, &value)) break;
-#if CYTHON_AVOID_BORROWED_REFS
-            Py_INCREF(key);
-#endif
-        }
-        name = first_kw_arg;
-        while (*name && (**name != key)) name++;
-        if (*name) {
-            values[name-argnames] = value;
-#if CYTHON_AVOID_BORROWED_REFS
-            Py_INCREF(value);
-            Py_DECREF(key);
-#endif
-            key = NULL;
-            value = NULL;
-            continue;
-        }
-#if !CYTHON_AVOID_BORROWED_REFS
-        Py_INCREF(key);
-#endif
-        Py_INCREF(value);
-        name = first_kw_arg;
-        #if PY_MAJOR_VERSION < 3
-        if (likely(PyString_Check(key))) {
-            while (*name) {
-                if ((CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**name) == PyString_GET_SIZE(key))
-                        && _PyString_Eq(**name, key)) {
-                    values[name-argnames] = value;
-#if CYTHON_AVOID_BORROWED_REFS
-                    value = NULL;
-#endif
-                    break;
-                }
-                name++;
-            }
-            if (*name) continue;
-            else {
-                PyObject*** argname = argnames;
-                while (argname != first_kw_arg) {
-                    if ((**argname == key) || (
-                            (CYTHON_COMPILING_IN_PYPY || PyString_GET_SIZE(**argname) == PyString_GET_SIZE(key))
-                             && _PyString_Eq(**argname, key))) {
-                        goto arg_passed_twice;
-                    }
-                    argname++;
-                }
-            }
-        } else
-        #endif
-        if (likely(PyUnicode_Check(key))) {
-            while (*name) {
-                int cmp = (
-                #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
-                    (__Pyx_PyUnicode_GET_LENGTH(**name) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
-                #endif
-                    PyUnicode_Compare(**name, key)
-                );
-                if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
-                if (cmp == 0) {
-                    values[name-argnames] = value;
-#if CYTHON_AVOID_BORROWED_REFS
-                    value = NULL;
-#endif
-                    break;
-                }
-                name++;
-            }
-            if (*name) continue;
-            else {
-                PyObject*** argname = argnames;
-                while (argname != first_kw_arg) {
-                    int cmp = (**argname == key) ? 0 :
-                    #if !CYTHON_COMPILING_IN_PYPY && PY_MAJOR_VERSION >= 3
-                        (__Pyx_PyUnicode_GET_LENGTH(**argname) != __Pyx_PyUnicode_GET_LENGTH(key)) ? 1 :
-                    #endif
-                        PyUnicode_Compare(**argname, key);
-                    if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
-                    if (cmp == 0) goto arg_passed_twice;
-                    argname++;
-                }
-            }
-        } else
-            goto invalid_keyword_type;
-        if (kwds2) {
-            if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
-        } else {
-            goto invalid_keyword;
-        }
-    }
-    Py_XDECREF(key);
-    Py_XDECREF(value);
-    return 0;
-arg_passed_twice:
-    __Pyx_RaiseDoubleKeywordsError(function_name, key);
-    goto bad;
-invalid_keyword_type:
-    PyErr_Format(PyExc_TypeError,
-        "%.200s() keywords must be strings", function_name);
-    goto bad;
-invalid_keyword:
-    #if PY_MAJOR_VERSION < 3
-    PyErr_Format(PyExc_TypeError,
-        "%.200s() got an unexpected keyword argument '%.200s'",
-        function_name, PyString_AsString(key));
-    #else
-    PyErr_Format(PyExc_TypeError,
-        "%s() got an unexpected keyword argument '%U'",
-        function_name, key);
-    #endif
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
+    }
 bad:
-    Py_XDECREF(key);
-    Py_XDECREF(value);
-    return -1;
+    Py_XDECREF(owned_instance);
+    return;
 }
+#endif
 
 /* ExtTypeTest */
 static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
@@ -9780,300 +15205,254 @@ static CYTHON_INLINE int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
     return 0;
 }
 
-/* PyFunctionFastCall */
-#if CYTHON_FAST_PYCALL && !CYTHON_VECTORCALL
-static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
-                                               PyObject *globals) {
-    PyFrameObject *f;
-    PyThreadState *tstate = __Pyx_PyThreadState_Current;
-    PyObject **fastlocals;
-    Py_ssize_t i;
-    PyObject *result;
-    assert(globals != NULL);
-    /* XXX Perhaps we should create a specialized
-       PyFrame_New() that doesn't take locals, but does
-       take builtins without sanity checking them.
-       */
-    assert(tstate != NULL);
-    f = PyFrame_New(tstate, co, globals, NULL);
-    if (f == NULL) {
-        return NULL;
-    }
-    fastlocals = __Pyx_PyFrame_GetLocalsplus(f);
-    for (i = 0; i < na; i++) {
-        Py_INCREF(*args);
-        fastlocals[i] = *args++;
-    }
-    result = PyEval_EvalFrameEx(f,0);
-    ++tstate->recursion_depth;
-    Py_DECREF(f);
-    --tstate->recursion_depth;
-    return result;
-}
-static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args, Py_ssize_t nargs, PyObject *kwargs) {
-    PyCodeObject *co = (PyCodeObject *)PyFunction_GET_CODE(func);
-    PyObject *globals = PyFunction_GET_GLOBALS(func);
-    PyObject *argdefs = PyFunction_GET_DEFAULTS(func);
-    PyObject *closure;
-#if PY_MAJOR_VERSION >= 3
-    PyObject *kwdefs;
-#endif
-    PyObject *kwtuple, **k;
-    PyObject **d;
-    Py_ssize_t nd;
-    Py_ssize_t nk;
-    PyObject *result;
-    assert(kwargs == NULL || PyDict_Check(kwargs));
-    nk = kwargs ? PyDict_Size(kwargs) : 0;
-    #if PY_MAJOR_VERSION < 3
-    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object"))) {
-        return NULL;
-    }
-    #else
-    if (unlikely(Py_EnterRecursiveCall(" while calling a Python object"))) {
-        return NULL;
-    }
-    #endif
-    if (
-#if PY_MAJOR_VERSION >= 3
-            co->co_kwonlyargcount == 0 &&
-#endif
-            likely(kwargs == NULL || nk == 0) &&
-            co->co_flags == (CO_OPTIMIZED | CO_NEWLOCALS | CO_NOFREE)) {
-        if (argdefs == NULL && co->co_argcount == nargs) {
-            result = __Pyx_PyFunction_FastCallNoKw(co, args, nargs, globals);
-            goto done;
-        }
-        else if (nargs == 0 && argdefs != NULL
-                 && co->co_argcount == Py_SIZE(argdefs)) {
-            /* function called with no arguments, but all parameters have
-               a default value: use default values as arguments .*/
-            args = &PyTuple_GET_ITEM(argdefs, 0);
-            result =__Pyx_PyFunction_FastCallNoKw(co, args, Py_SIZE(argdefs), globals);
-            goto done;
+/* SliceObject */
+static CYTHON_INLINE int __Pyx_PyObject_SetSlice(PyObject* obj, PyObject* value,
+        Py_ssize_t cstart, Py_ssize_t cstop,
+        PyObject** _py_start, PyObject** _py_stop, PyObject** _py_slice,
+        int has_cstart, int has_cstop, int wraparound) {
+    __Pyx_TypeName obj_type_name;
+#if CYTHON_USE_TYPE_SLOTS
+    PyMappingMethods* mp;
+#if PY_MAJOR_VERSION < 3
+    PySequenceMethods* ms = Py_TYPE(obj)->tp_as_sequence;
+    if (likely(ms && ms->sq_ass_slice)) {
+        if (!has_cstart) {
+            if (_py_start && (*_py_start != Py_None)) {
+                cstart = __Pyx_PyIndex_AsSsize_t(*_py_start);
+                if ((cstart == (Py_ssize_t)-1) && PyErr_Occurred()) goto bad;
+            } else
+                cstart = 0;
         }
-    }
-    if (kwargs != NULL) {
-        Py_ssize_t pos, i;
-        kwtuple = PyTuple_New(2 * nk);
-        if (kwtuple == NULL) {
-            result = NULL;
-            goto done;
+        if (!has_cstop) {
+            if (_py_stop && (*_py_stop != Py_None)) {
+                cstop = __Pyx_PyIndex_AsSsize_t(*_py_stop);
+                if ((cstop == (Py_ssize_t)-1) && PyErr_Occurred()) goto bad;
+            } else
+                cstop = PY_SSIZE_T_MAX;
         }
-        k = &PyTuple_GET_ITEM(kwtuple, 0);
-        pos = i = 0;
-        while (PyDict_Next(kwargs, &pos, &k[i], &k[i+1])) {
-            Py_INCREF(k[i]);
-            Py_INCREF(k[i+1]);
-            i += 2;
+        if (wraparound && unlikely((cstart < 0) | (cstop < 0)) && likely(ms->sq_length)) {
+            Py_ssize_t l = ms->sq_length(obj);
+            if (likely(l >= 0)) {
+                if (cstop < 0) {
+                    cstop += l;
+                    if (cstop < 0) cstop = 0;
+                }
+                if (cstart < 0) {
+                    cstart += l;
+                    if (cstart < 0) cstart = 0;
+                }
+            } else {
+                if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                    goto bad;
+                PyErr_Clear();
+            }
         }
-        nk = i / 2;
-    }
-    else {
-        kwtuple = NULL;
-        k = NULL;
-    }
-    closure = PyFunction_GET_CLOSURE(func);
-#if PY_MAJOR_VERSION >= 3
-    kwdefs = PyFunction_GET_KW_DEFAULTS(func);
-#endif
-    if (argdefs != NULL) {
-        d = &PyTuple_GET_ITEM(argdefs, 0);
-        nd = Py_SIZE(argdefs);
-    }
-    else {
-        d = NULL;
-        nd = 0;
+        return ms->sq_ass_slice(obj, cstart, cstop, value);
     }
-#if PY_MAJOR_VERSION >= 3
-    result = PyEval_EvalCodeEx((PyObject*)co, globals, (PyObject *)NULL,
-                               args, (int)nargs,
-                               k, (int)nk,
-                               d, (int)nd, kwdefs, closure);
 #else
-    result = PyEval_EvalCodeEx(co, globals, (PyObject *)NULL,
-                               args, (int)nargs,
-                               k, (int)nk,
-                               d, (int)nd, closure);
-#endif
-    Py_XDECREF(kwtuple);
-done:
-    Py_LeaveRecursiveCall();
-    return result;
-}
-#endif
-
-/* PyObjectCallMethO */
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
-    PyObject *self, *result;
-    PyCFunction cfunc;
-    cfunc = __Pyx_CyOrPyCFunction_GET_FUNCTION(func);
-    self = __Pyx_CyOrPyCFunction_GET_SELF(func);
-    #if PY_MAJOR_VERSION < 3
-    if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
-        return NULL;
-    #else
-    if (unlikely(Py_EnterRecursiveCall(" while calling a Python object")))
-        return NULL;
-    #endif
-    result = cfunc(self, arg);
-    Py_LeaveRecursiveCall();
-    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
-        PyErr_SetString(
-            PyExc_SystemError,
-            "NULL result without error in PyObject_Call");
-    }
-    return result;
-}
-#endif
-
-/* PyObjectFastCall */
-#if PY_VERSION_HEX < 0x03090000 || CYTHON_COMPILING_IN_LIMITED_API
-static PyObject* __Pyx_PyObject_FastCall_fallback(PyObject *func, PyObject **args, size_t nargs, PyObject *kwargs) {
-    PyObject *argstuple;
-    PyObject *result = 0;
-    size_t i;
-    argstuple = PyTuple_New((Py_ssize_t)nargs);
-    if (unlikely(!argstuple)) return NULL;
-    for (i = 0; i < nargs; i++) {
-        Py_INCREF(args[i]);
-        if (__Pyx_PyTuple_SET_ITEM(argstuple, (Py_ssize_t)i, args[i]) < 0) goto bad;
-    }
-    result = __Pyx_PyObject_Call(func, argstuple, kwargs);
-  bad:
-    Py_DECREF(argstuple);
-    return result;
-}
-#endif
-static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObject **args, size_t _nargs, PyObject *kwargs) {
-    Py_ssize_t nargs = __Pyx_PyVectorcall_NARGS(_nargs);
-#if CYTHON_COMPILING_IN_CPYTHON
-    if (nargs == 0 && kwargs == NULL) {
-        if (__Pyx_CyOrPyCFunction_Check(func) && likely( __Pyx_CyOrPyCFunction_GET_FLAGS(func) & METH_NOARGS))
-            return __Pyx_PyObject_CallMethO(func, NULL);
-    }
-    else if (nargs == 1 && kwargs == NULL) {
-        if (__Pyx_CyOrPyCFunction_Check(func) && likely( __Pyx_CyOrPyCFunction_GET_FLAGS(func) & METH_O))
-            return __Pyx_PyObject_CallMethO(func, args[0]);
-    }
+    CYTHON_UNUSED_VAR(wraparound);
 #endif
-    #if PY_VERSION_HEX < 0x030800B1
-    #if CYTHON_FAST_PYCCALL
-    if (PyCFunction_Check(func)) {
-        if (kwargs) {
-            return _PyCFunction_FastCallDict(func, args, nargs, kwargs);
-        } else {
-            return _PyCFunction_FastCallKeywords(func, args, nargs, NULL);
-        }
-    }
-    #if PY_VERSION_HEX >= 0x030700A1
-    if (!kwargs && __Pyx_IS_TYPE(func, &PyMethodDescr_Type)) {
-        return _PyMethodDescr_FastCallKeywords(func, args, nargs, NULL);
-    }
-    #endif
-    #endif
-    #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(func)) {
-        return __Pyx_PyFunction_FastCallDict(func, args, nargs, kwargs);
-    }
-    #endif
-    #endif
-    if (kwargs == NULL) {
-        #if CYTHON_VECTORCALL
-        #if PY_VERSION_HEX < 0x03090000
-        vectorcallfunc f = _PyVectorcall_Function(func);
-        #else
-        vectorcallfunc f = PyVectorcall_Function(func);
-        #endif
-        if (f) {
-            return f(func, args, (size_t)nargs, NULL);
-        }
-        #elif defined(__Pyx_CyFunction_USED) && CYTHON_BACKPORT_VECTORCALL
-        if (__Pyx_CyFunction_CheckExact(func)) {
-            __pyx_vectorcallfunc f = __Pyx_CyFunction_func_vectorcall(func);
-            if (f) return f(func, args, (size_t)nargs, NULL);
-        }
-        #endif
-    }
-    if (nargs == 0) {
-        return __Pyx_PyObject_Call(func, __pyx_empty_tuple, kwargs);
-    }
-    #if PY_VERSION_HEX >= 0x03090000 && !CYTHON_COMPILING_IN_LIMITED_API
-    return PyObject_VectorcallDict(func, args, (size_t)nargs, kwargs);
-    #else
-    return __Pyx_PyObject_FastCall_fallback(func, args, (size_t)nargs, kwargs);
-    #endif
-}
-
-/* PyDictVersioning */
-#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
-    PyObject *dict = Py_TYPE(obj)->tp_dict;
-    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
-}
-static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
-    PyObject **dictptr = NULL;
-    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
-    if (offset) {
-#if CYTHON_COMPILING_IN_CPYTHON
-        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+    mp = Py_TYPE(obj)->tp_as_mapping;
+    if (likely(mp && mp->mp_ass_subscript))
 #else
-        dictptr = _PyObject_GetDictPtr(obj);
+    CYTHON_UNUSED_VAR(wraparound);
+#endif
+    {
+        int result;
+        PyObject *py_slice, *py_start, *py_stop;
+        if (_py_slice) {
+            py_slice = *_py_slice;
+        } else {
+            PyObject* owned_start = NULL;
+            PyObject* owned_stop = NULL;
+            if (_py_start) {
+                py_start = *_py_start;
+            } else {
+                if (has_cstart) {
+                    owned_start = py_start = PyInt_FromSsize_t(cstart);
+                    if (unlikely(!py_start)) goto bad;
+                } else
+                    py_start = Py_None;
+            }
+            if (_py_stop) {
+                py_stop = *_py_stop;
+            } else {
+                if (has_cstop) {
+                    owned_stop = py_stop = PyInt_FromSsize_t(cstop);
+                    if (unlikely(!py_stop)) {
+                        Py_XDECREF(owned_start);
+                        goto bad;
+                    }
+                } else
+                    py_stop = Py_None;
+            }
+            py_slice = PySlice_New(py_start, py_stop, Py_None);
+            Py_XDECREF(owned_start);
+            Py_XDECREF(owned_stop);
+            if (unlikely(!py_slice)) goto bad;
+        }
+#if CYTHON_USE_TYPE_SLOTS
+        result = mp->mp_ass_subscript(obj, py_slice, value);
+#else
+        result = value ? PyObject_SetItem(obj, py_slice, value) : PyObject_DelItem(obj, py_slice);
 #endif
+        if (!_py_slice) {
+            Py_DECREF(py_slice);
+        }
+        return result;
     }
-    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
-}
-static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
-    PyObject *dict = Py_TYPE(obj)->tp_dict;
-    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
-        return 0;
-    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+    obj_type_name = __Pyx_PyType_GetName(Py_TYPE(obj));
+    PyErr_Format(PyExc_TypeError,
+        "'" __Pyx_FMT_TYPENAME "' object does not support slice %.10s",
+        obj_type_name, value ? "assignment" : "deletion");
+    __Pyx_DECREF_TypeName(obj_type_name);
+bad:
+    return -1;
 }
-#endif
 
-/* GetModuleGlobalName */
-#if CYTHON_USE_DICT_VERSIONS
-static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
-#else
-static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
-#endif
+/* RaiseUnexpectedTypeError */
+static int
+__Pyx_RaiseUnexpectedTypeError(const char *expected, PyObject *obj)
 {
-    PyObject *result;
-#if !CYTHON_AVOID_BORROWED_REFS
-#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030500A1 && PY_VERSION_HEX < 0x030d0000
-    result = _PyDict_GetItem_KnownHash(__pyx_d, name, ((PyASCIIObject *) name)->hash);
-    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
-    if (likely(result)) {
-        return __Pyx_NewRef(result);
-    } else if (unlikely(PyErr_Occurred())) {
-        return NULL;
-    }
-#elif CYTHON_COMPILING_IN_LIMITED_API
-    if (unlikely(!__pyx_m)) {
-        return NULL;
+    __Pyx_TypeName obj_type_name = __Pyx_PyType_GetName(Py_TYPE(obj));
+    PyErr_Format(PyExc_TypeError, "Expected %s, got " __Pyx_FMT_TYPENAME,
+                 expected, obj_type_name);
+    __Pyx_DECREF_TypeName(obj_type_name);
+    return 0;
+}
+
+/* PyIntBinop */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject* __Pyx_PyInt_AddObjC(PyObject *op1, PyObject *op2, long intval, int inplace, int zerodivision_check) {
+    CYTHON_MAYBE_UNUSED_VAR(intval);
+    CYTHON_MAYBE_UNUSED_VAR(inplace);
+    CYTHON_UNUSED_VAR(zerodivision_check);
+    #if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_CheckExact(op1))) {
+        const long b = intval;
+        long x;
+        long a = PyInt_AS_LONG(op1);
+        
+            x = (long)((unsigned long)a + (unsigned long)b);
+            if (likely((x^a) >= 0 || (x^b) >= 0))
+                return PyInt_FromLong(x);
+            return PyLong_Type.tp_as_number->nb_add(op1, op2);
     }
-    result = PyObject_GetAttr(__pyx_m, name);
-    if (likely(result)) {
-        return result;
+    #endif
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(PyLong_CheckExact(op1))) {
+        const long b = intval;
+        long a, x;
+#ifdef HAVE_LONG_LONG
+        const PY_LONG_LONG llb = intval;
+        PY_LONG_LONG lla, llx;
+#endif
+        if (unlikely(__Pyx_PyLong_IsZero(op1))) {
+            return __Pyx_NewRef(op2);
+        }
+        if (likely(__Pyx_PyLong_IsCompact(op1))) {
+            a = __Pyx_PyLong_CompactValue(op1);
+        } else {
+            const digit* digits = __Pyx_PyLong_Digits(op1);
+            const Py_ssize_t size = __Pyx_PyLong_SignedDigitCount(op1);
+            switch (size) {
+                case -2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 2:
+                    if (8 * sizeof(long) - 1 > 2 * PyLong_SHIFT) {
+                        a = (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 3:
+                    if (8 * sizeof(long) - 1 > 3 * PyLong_SHIFT) {
+                        a = (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case -4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = -(PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                case 4:
+                    if (8 * sizeof(long) - 1 > 4 * PyLong_SHIFT) {
+                        a = (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                        break;
+                    #ifdef HAVE_LONG_LONG
+                    } else if (8 * sizeof(PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT) {
+                        lla = (PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        goto long_long;
+                    #endif
+                    }
+                    CYTHON_FALLTHROUGH;
+                default: return PyLong_Type.tp_as_number->nb_add(op1, op2);
+            }
+        }
+                x = a + b;
+            return PyLong_FromLong(x);
+#ifdef HAVE_LONG_LONG
+        long_long:
+                llx = lla + llb;
+            return PyLong_FromLongLong(llx);
+#endif
+        
+        
     }
+    #endif
+    if (PyFloat_CheckExact(op1)) {
+        const long b = intval;
+#if CYTHON_COMPILING_IN_LIMITED_API
+        double a = __pyx_PyFloat_AsDouble(op1);
 #else
-    result = PyDict_GetItem(__pyx_d, name);
-    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
-    if (likely(result)) {
-        return __Pyx_NewRef(result);
-    }
+        double a = PyFloat_AS_DOUBLE(op1);
 #endif
-#else
-    result = PyObject_GetItem(__pyx_d, name);
-    __PYX_UPDATE_DICT_CACHE(__pyx_d, result, *dict_cached_value, *dict_version)
-    if (likely(result)) {
-        return __Pyx_NewRef(result);
+            double result;
+            
+            PyFPE_START_PROTECT("add", return NULL)
+            result = ((double)a) + (double)b;
+            PyFPE_END_PROTECT(result)
+            return PyFloat_FromDouble(result);
     }
-    PyErr_Clear();
-#endif
-    return __Pyx_GetBuiltinName(name);
+    return (inplace ? PyNumber_InPlaceAdd : PyNumber_Add)(op1, op2);
 }
+#endif
 
 /* IterFinish */
 static CYTHON_INLINE int __Pyx_IterFinish(void) {
@@ -10426,6 +15805,277 @@ static CYTHON_INLINE int __Pyx_dict_iter_next(
     return 1;
 }
 
+/* RaiseUnboundLocalError */
+static CYTHON_INLINE void __Pyx_RaiseUnboundLocalError(const char *varname) {
+    PyErr_Format(PyExc_UnboundLocalError, "local variable '%s' referenced before assignment", varname);
+}
+
+/* RaiseClosureNameError */
+static CYTHON_INLINE void __Pyx_RaiseClosureNameError(const char *varname) {
+    PyErr_Format(PyExc_NameError, "free variable '%s' referenced before assignment in enclosing scope", varname);
+}
+
+/* GetException */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx__GetException(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb)
+#else
+static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb)
+#endif
+{
+    PyObject *local_type = NULL, *local_value, *local_tb = NULL;
+#if CYTHON_FAST_THREAD_STATE
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+  #if PY_VERSION_HEX >= 0x030C00A6
+    local_value = tstate->current_exception;
+    tstate->current_exception = 0;
+    if (likely(local_value)) {
+        local_type = (PyObject*) Py_TYPE(local_value);
+        Py_INCREF(local_type);
+        local_tb = PyException_GetTraceback(local_value);
+    }
+  #else
+    local_type = tstate->curexc_type;
+    local_value = tstate->curexc_value;
+    local_tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+  #endif
+#else
+    PyErr_Fetch(&local_type, &local_value, &local_tb);
+#endif
+    PyErr_NormalizeException(&local_type, &local_value, &local_tb);
+#if CYTHON_FAST_THREAD_STATE && PY_VERSION_HEX >= 0x030C00A6
+    if (unlikely(tstate->current_exception))
+#elif CYTHON_FAST_THREAD_STATE
+    if (unlikely(tstate->curexc_type))
+#else
+    if (unlikely(PyErr_Occurred()))
+#endif
+        goto bad;
+    #if PY_MAJOR_VERSION >= 3
+    if (local_tb) {
+        if (unlikely(PyException_SetTraceback(local_value, local_tb) < 0))
+            goto bad;
+    }
+    #endif
+    Py_XINCREF(local_tb);
+    Py_XINCREF(local_type);
+    Py_XINCREF(local_value);
+    *type = local_type;
+    *value = local_value;
+    *tb = local_tb;
+#if CYTHON_FAST_THREAD_STATE
+    #if CYTHON_USE_EXC_INFO_STACK
+    {
+        _PyErr_StackItem *exc_info = tstate->exc_info;
+      #if PY_VERSION_HEX >= 0x030B00a4
+        tmp_value = exc_info->exc_value;
+        exc_info->exc_value = local_value;
+        tmp_type = NULL;
+        tmp_tb = NULL;
+        Py_XDECREF(local_type);
+        Py_XDECREF(local_tb);
+      #else
+        tmp_type = exc_info->exc_type;
+        tmp_value = exc_info->exc_value;
+        tmp_tb = exc_info->exc_traceback;
+        exc_info->exc_type = local_type;
+        exc_info->exc_value = local_value;
+        exc_info->exc_traceback = local_tb;
+      #endif
+    }
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = local_type;
+    tstate->exc_value = local_value;
+    tstate->exc_traceback = local_tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+#else
+    PyErr_SetExcInfo(local_type, local_value, local_tb);
+#endif
+    return 0;
+bad:
+    *type = 0;
+    *value = 0;
+    *tb = 0;
+    Py_XDECREF(local_type);
+    Py_XDECREF(local_value);
+    Py_XDECREF(local_tb);
+    return -1;
+}
+
+/* pep479 */
+static void __Pyx_Generator_Replace_StopIteration(int in_async_gen) {
+    PyObject *exc, *val, *tb, *cur_exc;
+    __Pyx_PyThreadState_declare
+    #ifdef __Pyx_StopAsyncIteration_USED
+    int is_async_stopiteration = 0;
+    #endif
+    CYTHON_MAYBE_UNUSED_VAR(in_async_gen);
+    cur_exc = PyErr_Occurred();
+    if (likely(!__Pyx_PyErr_GivenExceptionMatches(cur_exc, PyExc_StopIteration))) {
+        #ifdef __Pyx_StopAsyncIteration_USED
+        if (in_async_gen && unlikely(__Pyx_PyErr_GivenExceptionMatches(cur_exc, __Pyx_PyExc_StopAsyncIteration))) {
+            is_async_stopiteration = 1;
+        } else
+        #endif
+            return;
+    }
+    __Pyx_PyThreadState_assign
+    __Pyx_GetException(&exc, &val, &tb);
+    Py_XDECREF(exc);
+    Py_XDECREF(val);
+    Py_XDECREF(tb);
+    PyErr_SetString(PyExc_RuntimeError,
+        #ifdef __Pyx_StopAsyncIteration_USED
+        is_async_stopiteration ? "async generator raised StopAsyncIteration" :
+        in_async_gen ? "async generator raised StopIteration" :
+        #endif
+        "generator raised StopIteration");
+}
+
+/* SwapException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSwap(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+  #if CYTHON_USE_EXC_INFO_STACK && PY_VERSION_HEX >= 0x030B00a4
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_value = exc_info->exc_value;
+    exc_info->exc_value = *value;
+    if (tmp_value == NULL || tmp_value == Py_None) {
+        Py_XDECREF(tmp_value);
+        tmp_value = NULL;
+        tmp_type = NULL;
+        tmp_tb = NULL;
+    } else {
+        tmp_type = (PyObject*) Py_TYPE(tmp_value);
+        Py_INCREF(tmp_type);
+        #if CYTHON_COMPILING_IN_CPYTHON
+        tmp_tb = ((PyBaseExceptionObject*) tmp_value)->traceback;
+        Py_XINCREF(tmp_tb);
+        #else
+        tmp_tb = PyException_GetTraceback(tmp_value);
+        #endif
+    }
+  #elif CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = *type;
+    exc_info->exc_value = *value;
+    exc_info->exc_traceback = *tb;
+  #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = *type;
+    tstate->exc_value = *value;
+    tstate->exc_traceback = *tb;
+  #endif
+    *type = tmp_type;
+    *value = tmp_value;
+    *tb = tmp_tb;
+}
+#else
+static CYTHON_INLINE void __Pyx_ExceptionSwap(PyObject **type, PyObject **value, PyObject **tb) {
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    PyErr_GetExcInfo(&tmp_type, &tmp_value, &tmp_tb);
+    PyErr_SetExcInfo(*type, *value, *tb);
+    *type = tmp_type;
+    *value = tmp_value;
+    *tb = tmp_tb;
+}
+#endif
+
+/* GetTopmostException */
+#if CYTHON_USE_EXC_INFO_STACK && CYTHON_FAST_THREAD_STATE
+static _PyErr_StackItem *
+__Pyx_PyErr_GetTopmostException(PyThreadState *tstate)
+{
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    while ((exc_info->exc_value == NULL || exc_info->exc_value == Py_None) &&
+           exc_info->previous_item != NULL)
+    {
+        exc_info = exc_info->previous_item;
+    }
+    return exc_info;
+}
+#endif
+
+/* SaveResetException */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx__ExceptionSave(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+  #if CYTHON_USE_EXC_INFO_STACK && PY_VERSION_HEX >= 0x030B00a4
+    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
+    PyObject *exc_value = exc_info->exc_value;
+    if (exc_value == NULL || exc_value == Py_None) {
+        *value = NULL;
+        *type = NULL;
+        *tb = NULL;
+    } else {
+        *value = exc_value;
+        Py_INCREF(*value);
+        *type = (PyObject*) Py_TYPE(exc_value);
+        Py_INCREF(*type);
+        *tb = PyException_GetTraceback(exc_value);
+    }
+  #elif CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = __Pyx_PyErr_GetTopmostException(tstate);
+    *type = exc_info->exc_type;
+    *value = exc_info->exc_value;
+    *tb = exc_info->exc_traceback;
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+  #else
+    *type = tstate->exc_type;
+    *value = tstate->exc_value;
+    *tb = tstate->exc_traceback;
+    Py_XINCREF(*type);
+    Py_XINCREF(*value);
+    Py_XINCREF(*tb);
+  #endif
+}
+static CYTHON_INLINE void __Pyx__ExceptionReset(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+  #if CYTHON_USE_EXC_INFO_STACK && PY_VERSION_HEX >= 0x030B00a4
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    PyObject *tmp_value = exc_info->exc_value;
+    exc_info->exc_value = value;
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+  #else
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    #if CYTHON_USE_EXC_INFO_STACK
+    _PyErr_StackItem *exc_info = tstate->exc_info;
+    tmp_type = exc_info->exc_type;
+    tmp_value = exc_info->exc_value;
+    tmp_tb = exc_info->exc_traceback;
+    exc_info->exc_type = type;
+    exc_info->exc_value = value;
+    exc_info->exc_traceback = tb;
+    #else
+    tmp_type = tstate->exc_type;
+    tmp_value = tstate->exc_value;
+    tmp_tb = tstate->exc_traceback;
+    tstate->exc_type = type;
+    tstate->exc_value = value;
+    tstate->exc_traceback = tb;
+    #endif
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+  #endif
+}
+#endif
+
 /* FixUpExtensionType */
 #if CYTHON_USE_TYPE_SPECS
 static int __Pyx_fix_up_extension_type_from_spec(PyType_Spec *spec, PyTypeObject *type) {
@@ -11049,13 +16699,141 @@ static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list, int level) {
             #endif
         }
     }
-bad:
-    Py_XDECREF(empty_dict);
-    Py_XDECREF(empty_list);
-    #if PY_MAJOR_VERSION < 3
-    Py_XDECREF(py_import);
-    #endif
-    return module;
+bad:
+    Py_XDECREF(empty_dict);
+    Py_XDECREF(empty_list);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_import);
+    #endif
+    return module;
+}
+
+/* ImportDottedModule */
+#if PY_MAJOR_VERSION >= 3
+static PyObject *__Pyx__ImportDottedModule_Error(PyObject *name, PyObject *parts_tuple, Py_ssize_t count) {
+    PyObject *partial_name = NULL, *slice = NULL, *sep = NULL;
+    if (unlikely(PyErr_Occurred())) {
+        PyErr_Clear();
+    }
+    if (likely(PyTuple_GET_SIZE(parts_tuple) == count)) {
+        partial_name = name;
+    } else {
+        slice = PySequence_GetSlice(parts_tuple, 0, count);
+        if (unlikely(!slice))
+            goto bad;
+        sep = PyUnicode_FromStringAndSize(".", 1);
+        if (unlikely(!sep))
+            goto bad;
+        partial_name = PyUnicode_Join(sep, slice);
+    }
+    PyErr_Format(
+#if PY_MAJOR_VERSION < 3
+        PyExc_ImportError,
+        "No module named '%s'", PyString_AS_STRING(partial_name));
+#else
+#if PY_VERSION_HEX >= 0x030600B1
+        PyExc_ModuleNotFoundError,
+#else
+        PyExc_ImportError,
+#endif
+        "No module named '%U'", partial_name);
+#endif
+bad:
+    Py_XDECREF(sep);
+    Py_XDECREF(slice);
+    Py_XDECREF(partial_name);
+    return NULL;
+}
+#endif
+#if PY_MAJOR_VERSION >= 3
+static PyObject *__Pyx__ImportDottedModule_Lookup(PyObject *name) {
+    PyObject *imported_module;
+#if PY_VERSION_HEX < 0x030700A1 || (CYTHON_COMPILING_IN_PYPY && PYPY_VERSION_NUM  < 0x07030400)
+    PyObject *modules = PyImport_GetModuleDict();
+    if (unlikely(!modules))
+        return NULL;
+    imported_module = __Pyx_PyDict_GetItemStr(modules, name);
+    Py_XINCREF(imported_module);
+#else
+    imported_module = PyImport_GetModule(name);
+#endif
+    return imported_module;
+}
+#endif
+#if PY_MAJOR_VERSION >= 3
+static PyObject *__Pyx_ImportDottedModule_WalkParts(PyObject *module, PyObject *name, PyObject *parts_tuple) {
+    Py_ssize_t i, nparts;
+    nparts = PyTuple_GET_SIZE(parts_tuple);
+    for (i=1; i < nparts && module; i++) {
+        PyObject *part, *submodule;
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        part = PyTuple_GET_ITEM(parts_tuple, i);
+#else
+        part = PySequence_ITEM(parts_tuple, i);
+#endif
+        submodule = __Pyx_PyObject_GetAttrStrNoError(module, part);
+#if !(CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS)
+        Py_DECREF(part);
+#endif
+        Py_DECREF(module);
+        module = submodule;
+    }
+    if (unlikely(!module)) {
+        return __Pyx__ImportDottedModule_Error(name, parts_tuple, i);
+    }
+    return module;
+}
+#endif
+static PyObject *__Pyx__ImportDottedModule(PyObject *name, PyObject *parts_tuple) {
+#if PY_MAJOR_VERSION < 3
+    PyObject *module, *from_list, *star = __pyx_n_s__14;
+    CYTHON_UNUSED_VAR(parts_tuple);
+    from_list = PyList_New(1);
+    if (unlikely(!from_list))
+        return NULL;
+    Py_INCREF(star);
+    PyList_SET_ITEM(from_list, 0, star);
+    module = __Pyx_Import(name, from_list, 0);
+    Py_DECREF(from_list);
+    return module;
+#else
+    PyObject *imported_module;
+    PyObject *module = __Pyx_Import(name, NULL, 0);
+    if (!parts_tuple || unlikely(!module))
+        return module;
+    imported_module = __Pyx__ImportDottedModule_Lookup(name);
+    if (likely(imported_module)) {
+        Py_DECREF(module);
+        return imported_module;
+    }
+    PyErr_Clear();
+    return __Pyx_ImportDottedModule_WalkParts(module, name, parts_tuple);
+#endif
+}
+static PyObject *__Pyx_ImportDottedModule(PyObject *name, PyObject *parts_tuple) {
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030400B1
+    PyObject *module = __Pyx__ImportDottedModule_Lookup(name);
+    if (likely(module)) {
+        PyObject *spec = __Pyx_PyObject_GetAttrStrNoError(module, __pyx_n_s_spec);
+        if (likely(spec)) {
+            PyObject *unsafe = __Pyx_PyObject_GetAttrStrNoError(spec, __pyx_n_s_initializing);
+            if (likely(!unsafe || !__Pyx_PyObject_IsTrue(unsafe))) {
+                Py_DECREF(spec);
+                spec = NULL;
+            }
+            Py_XDECREF(unsafe);
+        }
+        if (likely(!spec)) {
+            PyErr_Clear();
+            return module;
+        }
+        Py_DECREF(spec);
+        Py_DECREF(module);
+    } else if (PyErr_Occurred()) {
+        PyErr_Clear();
+    }
+#endif
+    return __Pyx__ImportDottedModule(name, parts_tuple);
 }
 
 /* ImportFrom */
@@ -11071,7 +16849,7 @@ static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
         if (unlikely(!module_name_str)) { goto modbad; }
         module_name = PyUnicode_FromString(module_name_str);
         if (unlikely(!module_name)) { goto modbad; }
-        module_dot = PyUnicode_Concat(module_name, __pyx_kp_u__9);
+        module_dot = PyUnicode_Concat(module_name, __pyx_kp_u__15);
         if (unlikely(!module_dot)) { goto modbad; }
         full_name = PyUnicode_Concat(module_dot, name);
         if (unlikely(!full_name)) { goto modbad; }
@@ -12316,309 +18094,576 @@ static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line) {
         c_line = 0;
         (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
     }
-    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
-        c_line = 0;
+    else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
+}
+#endif
+
+/* CodeObjectCache */
+#if !CYTHON_COMPILING_IN_LIMITED_API
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
+        } else {
+            return mid;
+        }
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
+    } else {
+        return mid + 1;
+    }
+}
+static PyCodeObject *__pyx_find_code_object(int code_line) {
+    PyCodeObject* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
+        return NULL;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
+        return NULL;
+    }
+    code_object = __pyx_code_cache.entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
+}
+static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
+    if (unlikely(!code_line)) {
+        return;
+    }
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            __pyx_code_cache.entries = entries;
+            __pyx_code_cache.max_count = 64;
+            __pyx_code_cache.count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
+        }
+        return;
+    }
+    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
+    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
+        PyCodeObject* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_DECREF(tmp);
+        return;
+    }
+    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
+        int new_max = __pyx_code_cache.max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
+        }
+        __pyx_code_cache.entries = entries;
+        __pyx_code_cache.max_count = new_max;
+    }
+    for (i=__pyx_code_cache.count; i>pos; i--) {
+        entries[i] = entries[i-1];
+    }
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    __pyx_code_cache.count++;
+    Py_INCREF(code_object);
+}
+#endif
+
+/* AddTraceback */
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6 && !CYTHON_COMPILING_IN_LIMITED_API && !defined(PYPY_VERSION)
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+static PyObject *__Pyx_PyCode_Replace_For_AddTraceback(PyObject *code, PyObject *scratch_dict,
+                                                       PyObject *firstlineno, PyObject *name) {
+    PyObject *replace = NULL;
+    if (unlikely(PyDict_SetItemString(scratch_dict, "co_firstlineno", firstlineno))) return NULL;
+    if (unlikely(PyDict_SetItemString(scratch_dict, "co_name", name))) return NULL;
+    replace = PyObject_GetAttrString(code, "replace");
+    if (likely(replace)) {
+        PyObject *result;
+        result = PyObject_Call(replace, __pyx_empty_tuple, scratch_dict);
+        Py_DECREF(replace);
+        return result;
+    }
+    PyErr_Clear();
+    #if __PYX_LIMITED_VERSION_HEX < 0x030780000
+    {
+        PyObject *compiled = NULL, *result = NULL;
+        if (unlikely(PyDict_SetItemString(scratch_dict, "code", code))) return NULL;
+        if (unlikely(PyDict_SetItemString(scratch_dict, "type", (PyObject*)(&PyType_Type)))) return NULL;
+        compiled = Py_CompileString(
+            "out = type(code)(\n"
+            "  code.co_argcount, code.co_kwonlyargcount, code.co_nlocals, code.co_stacksize,\n"
+            "  code.co_flags, code.co_code, code.co_consts, code.co_names,\n"
+            "  code.co_varnames, code.co_filename, co_name, co_firstlineno,\n"
+            "  code.co_lnotab)\n", "<dummy>", Py_file_input);
+        if (!compiled) return NULL;
+        result = PyEval_EvalCode(compiled, scratch_dict, scratch_dict);
+        Py_DECREF(compiled);
+        if (!result) PyErr_Print();
+        Py_DECREF(result);
+        result = PyDict_GetItemString(scratch_dict, "out");
+        if (result) Py_INCREF(result);
+        return result;
+    }
+    #else
+    return NULL;
+    #endif
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyObject *code_object = NULL, *py_py_line = NULL, *py_funcname = NULL, *dict = NULL;
+    PyObject *replace = NULL, *getframe = NULL, *frame = NULL;
+    PyObject *exc_type, *exc_value, *exc_traceback;
+    int success = 0;
+    if (c_line) {
+        (void) __pyx_cfilenm;
+        (void) __Pyx_CLineForTraceback(__Pyx_PyThreadState_Current, c_line);
+    }
+    PyErr_Fetch(&exc_type, &exc_value, &exc_traceback);
+    code_object = Py_CompileString("_getframe()", filename, Py_eval_input);
+    if (unlikely(!code_object)) goto bad;
+    py_py_line = PyLong_FromLong(py_line);
+    if (unlikely(!py_py_line)) goto bad;
+    py_funcname = PyUnicode_FromString(funcname);
+    if (unlikely(!py_funcname)) goto bad;
+    dict = PyDict_New();
+    if (unlikely(!dict)) goto bad;
+    {
+        PyObject *old_code_object = code_object;
+        code_object = __Pyx_PyCode_Replace_For_AddTraceback(code_object, dict, py_py_line, py_funcname);
+        Py_DECREF(old_code_object);
+    }
+    if (unlikely(!code_object)) goto bad;
+    getframe = PySys_GetObject("_getframe");
+    if (unlikely(!getframe)) goto bad;
+    if (unlikely(PyDict_SetItemString(dict, "_getframe", getframe))) goto bad;
+    frame = PyEval_EvalCode(code_object, dict, dict);
+    if (unlikely(!frame) || frame == Py_None) goto bad;
+    success = 1;
+  bad:
+    PyErr_Restore(exc_type, exc_value, exc_traceback);
+    Py_XDECREF(code_object);
+    Py_XDECREF(py_py_line);
+    Py_XDECREF(py_funcname);
+    Py_XDECREF(dict);
+    Py_XDECREF(replace);
+    if (success) {
+        PyTraceBack_Here(
+            (struct _frame*)frame);
+    }
+    Py_XDECREF(frame);
+}
+#else
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
+    #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
+    py_srcfile = PyString_FromString(filename);
+    if (!py_srcfile) goto bad;
+    #endif
+    if (c_line) {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        #else
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
+        #endif
+    }
+    else {
+        #if PY_MAJOR_VERSION < 3
+        py_funcname = PyString_FromString(funcname);
+        if (!py_funcname) goto bad;
+        #endif
+    }
+    #if PY_MAJOR_VERSION < 3
+    py_code = __Pyx_PyCode_New(
+        0,
+        0,
+        0,
+        0,
+        0,
+        0,
+        __pyx_empty_bytes, /*PyObject *code,*/
+        __pyx_empty_tuple, /*PyObject *consts,*/
+        __pyx_empty_tuple, /*PyObject *names,*/
+        __pyx_empty_tuple, /*PyObject *varnames,*/
+        __pyx_empty_tuple, /*PyObject *freevars,*/
+        __pyx_empty_tuple, /*PyObject *cellvars,*/
+        py_srcfile,   /*PyObject *filename,*/
+        py_funcname,  /*PyObject *name,*/
+        py_line,
+        __pyx_empty_bytes  /*PyObject *lnotab*/
+    );
+    Py_DECREF(py_srcfile);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);
+    return py_code;
+bad:
+    Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
     }
-    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
-    return c_line;
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
 }
 #endif
 
-/* CodeObjectCache */
-#if !CYTHON_COMPILING_IN_LIMITED_API
-static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
-    int start = 0, mid = 0, end = count - 1;
-    if (end >= 0 && code_line > entries[end].code_line) {
-        return count;
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
     }
-    while (start < end) {
-        mid = start + (end - start) / 2;
-        if (code_line < entries[mid].code_line) {
-            end = mid;
-        } else if (code_line > entries[mid].code_line) {
-             start = mid + 1;
+
+/* CIntFromPy */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if ((sizeof(int) < sizeof(long))) {
+            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
         } else {
-            return mid;
-        }
-    }
-    if (code_line <= entries[mid].code_line) {
-        return mid;
-    } else {
-        return mid + 1;
-    }
-}
-static PyCodeObject *__pyx_find_code_object(int code_line) {
-    PyCodeObject* code_object;
-    int pos;
-    if (unlikely(!code_line) || unlikely(!__pyx_code_cache.entries)) {
-        return NULL;
-    }
-    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
-    if (unlikely(pos >= __pyx_code_cache.count) || unlikely(__pyx_code_cache.entries[pos].code_line != code_line)) {
-        return NULL;
-    }
-    code_object = __pyx_code_cache.entries[pos].code_object;
-    Py_INCREF(code_object);
-    return code_object;
-}
-static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
-    int pos, i;
-    __Pyx_CodeObjectCacheEntry* entries = __pyx_code_cache.entries;
-    if (unlikely(!code_line)) {
-        return;
-    }
-    if (unlikely(!entries)) {
-        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
-        if (likely(entries)) {
-            __pyx_code_cache.entries = entries;
-            __pyx_code_cache.max_count = 64;
-            __pyx_code_cache.count = 1;
-            entries[0].code_line = code_line;
-            entries[0].code_object = code_object;
-            Py_INCREF(code_object);
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int) val;
         }
-        return;
     }
-    pos = __pyx_bisect_code_objects(__pyx_code_cache.entries, __pyx_code_cache.count, code_line);
-    if ((pos < __pyx_code_cache.count) && unlikely(__pyx_code_cache.entries[pos].code_line == code_line)) {
-        PyCodeObject* tmp = entries[pos].code_object;
-        entries[pos].code_object = code_object;
+#endif
+    if (unlikely(!PyLong_Check(x))) {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
         Py_DECREF(tmp);
-        return;
+        return val;
     }
-    if (__pyx_code_cache.count == __pyx_code_cache.max_count) {
-        int new_max = __pyx_code_cache.max_count + 64;
-        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
-            __pyx_code_cache.entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
-        if (unlikely(!entries)) {
-            return;
+    if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+        if (unlikely(__Pyx_PyLong_IsNeg(x))) {
+            goto raise_neg_overflow;
+        } else if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
+        } else {
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            assert(__Pyx_PyLong_DigitCount(x) > 1);
+            switch (__Pyx_PyLong_DigitCount(x)) {
+                case 2:
+                    if ((8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) >= 2 * PyLong_SHIFT)) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) >= 3 * PyLong_SHIFT)) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) >= 4 * PyLong_SHIFT)) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+        }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+        if (unlikely(Py_SIZE(x) < 0)) {
+            goto raise_neg_overflow;
+        }
+#else
+        {
+            int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+            if (unlikely(result < 0))
+                return (int) -1;
+            if (unlikely(result == 1))
+                goto raise_neg_overflow;
+        }
+#endif
+        if ((sizeof(int) <= sizeof(unsigned long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+        } else if ((sizeof(int) <= sizeof(unsigned PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+        }
+    } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+        if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
+        } else {
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            assert(__Pyx_PyLong_DigitCount(x) > 1);
+            switch (__Pyx_PyLong_SignedDigitCount(x)) {
+                case -2:
+                    if ((8 * sizeof(int) - 1 > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if ((8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
         }
-        __pyx_code_cache.entries = entries;
-        __pyx_code_cache.max_count = new_max;
-    }
-    for (i=__pyx_code_cache.count; i>pos; i--) {
-        entries[i] = entries[i-1];
-    }
-    entries[pos].code_line = code_line;
-    entries[pos].code_object = code_object;
-    __pyx_code_cache.count++;
-    Py_INCREF(code_object);
-}
 #endif
-
-/* AddTraceback */
-#include "compile.h"
-#include "frameobject.h"
-#include "traceback.h"
-#if PY_VERSION_HEX >= 0x030b00a6 && !CYTHON_COMPILING_IN_LIMITED_API && !defined(PYPY_VERSION)
-  #ifndef Py_BUILD_CORE
-    #define Py_BUILD_CORE 1
-  #endif
-  #include "internal/pycore_frame.h"
+        if ((sizeof(int) <= sizeof(long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+        } else if ((sizeof(int) <= sizeof(PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
 #endif
-#if CYTHON_COMPILING_IN_LIMITED_API
-static PyObject *__Pyx_PyCode_Replace_For_AddTraceback(PyObject *code, PyObject *scratch_dict,
-                                                       PyObject *firstlineno, PyObject *name) {
-    PyObject *replace = NULL;
-    if (unlikely(PyDict_SetItemString(scratch_dict, "co_firstlineno", firstlineno))) return NULL;
-    if (unlikely(PyDict_SetItemString(scratch_dict, "co_name", name))) return NULL;
-    replace = PyObject_GetAttrString(code, "replace");
-    if (likely(replace)) {
-        PyObject *result;
-        result = PyObject_Call(replace, __pyx_empty_tuple, scratch_dict);
-        Py_DECREF(replace);
-        return result;
-    }
-    PyErr_Clear();
-    #if __PYX_LIMITED_VERSION_HEX < 0x030780000
-    {
-        PyObject *compiled = NULL, *result = NULL;
-        if (unlikely(PyDict_SetItemString(scratch_dict, "code", code))) return NULL;
-        if (unlikely(PyDict_SetItemString(scratch_dict, "type", (PyObject*)(&PyType_Type)))) return NULL;
-        compiled = Py_CompileString(
-            "out = type(code)(\n"
-            "  code.co_argcount, code.co_kwonlyargcount, code.co_nlocals, code.co_stacksize,\n"
-            "  code.co_flags, code.co_code, code.co_consts, code.co_names,\n"
-            "  code.co_varnames, code.co_filename, co_name, co_firstlineno,\n"
-            "  code.co_lnotab)\n", "<dummy>", Py_file_input);
-        if (!compiled) return NULL;
-        result = PyEval_EvalCode(compiled, scratch_dict, scratch_dict);
-        Py_DECREF(compiled);
-        if (!result) PyErr_Print();
-        Py_DECREF(result);
-        result = PyDict_GetItemString(scratch_dict, "out");
-        if (result) Py_INCREF(result);
-        return result;
-    }
-    #else
-    return NULL;
-    #endif
-}
-static void __Pyx_AddTraceback(const char *funcname, int c_line,
-                               int py_line, const char *filename) {
-    PyObject *code_object = NULL, *py_py_line = NULL, *py_funcname = NULL, *dict = NULL;
-    PyObject *replace = NULL, *getframe = NULL, *frame = NULL;
-    PyObject *exc_type, *exc_value, *exc_traceback;
-    int success = 0;
-    if (c_line) {
-        (void) __pyx_cfilenm;
-        (void) __Pyx_CLineForTraceback(__Pyx_PyThreadState_Current, c_line);
+        }
     }
-    PyErr_Fetch(&exc_type, &exc_value, &exc_traceback);
-    code_object = Py_CompileString("_getframe()", filename, Py_eval_input);
-    if (unlikely(!code_object)) goto bad;
-    py_py_line = PyLong_FromLong(py_line);
-    if (unlikely(!py_py_line)) goto bad;
-    py_funcname = PyUnicode_FromString(funcname);
-    if (unlikely(!py_funcname)) goto bad;
-    dict = PyDict_New();
-    if (unlikely(!dict)) goto bad;
     {
-        PyObject *old_code_object = code_object;
-        code_object = __Pyx_PyCode_Replace_For_AddTraceback(code_object, dict, py_py_line, py_funcname);
-        Py_DECREF(old_code_object);
-    }
-    if (unlikely(!code_object)) goto bad;
-    getframe = PySys_GetObject("_getframe");
-    if (unlikely(!getframe)) goto bad;
-    if (unlikely(PyDict_SetItemString(dict, "_getframe", getframe))) goto bad;
-    frame = PyEval_EvalCode(code_object, dict, dict);
-    if (unlikely(!frame) || frame == Py_None) goto bad;
-    success = 1;
-  bad:
-    PyErr_Restore(exc_type, exc_value, exc_traceback);
-    Py_XDECREF(code_object);
-    Py_XDECREF(py_py_line);
-    Py_XDECREF(py_funcname);
-    Py_XDECREF(dict);
-    Py_XDECREF(replace);
-    if (success) {
-        PyTraceBack_Here(
-            (struct _frame*)frame);
-    }
-    Py_XDECREF(frame);
-}
+        int val;
+        int ret = -1;
+#if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
+        Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
+            x, &val, sizeof(val), Py_ASNATIVEBYTES_NATIVE_ENDIAN | (is_unsigned ? Py_ASNATIVEBYTES_UNSIGNED_BUFFER | Py_ASNATIVEBYTES_REJECT_NEGATIVE : 0));
+        if (unlikely(bytes_copied == -1)) {
+        } else if (unlikely(bytes_copied > (Py_ssize_t) sizeof(val))) {
+            goto raise_overflow;
+        } else {
+            ret = 0;
+        }
+#elif PY_VERSION_HEX < 0x030d0000 && !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) || defined(_PyLong_AsByteArray)
+        int one = 1; int is_little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&val;
+        ret = _PyLong_AsByteArray((PyLongObject *)x,
+                                    bytes, sizeof(val),
+                                    is_little, !is_unsigned);
 #else
-static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
-            const char *funcname, int c_line,
-            int py_line, const char *filename) {
-    PyCodeObject *py_code = NULL;
-    PyObject *py_funcname = NULL;
-    #if PY_MAJOR_VERSION < 3
-    PyObject *py_srcfile = NULL;
-    py_srcfile = PyString_FromString(filename);
-    if (!py_srcfile) goto bad;
-    #endif
-    if (c_line) {
-        #if PY_MAJOR_VERSION < 3
-        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
-        if (!py_funcname) goto bad;
-        #else
-        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
-        if (!py_funcname) goto bad;
-        funcname = PyUnicode_AsUTF8(py_funcname);
-        if (!funcname) goto bad;
-        #endif
-    }
-    else {
-        #if PY_MAJOR_VERSION < 3
-        py_funcname = PyString_FromString(funcname);
-        if (!py_funcname) goto bad;
-        #endif
-    }
-    #if PY_MAJOR_VERSION < 3
-    py_code = __Pyx_PyCode_New(
-        0,
-        0,
-        0,
-        0,
-        0,
-        0,
-        __pyx_empty_bytes, /*PyObject *code,*/
-        __pyx_empty_tuple, /*PyObject *consts,*/
-        __pyx_empty_tuple, /*PyObject *names,*/
-        __pyx_empty_tuple, /*PyObject *varnames,*/
-        __pyx_empty_tuple, /*PyObject *freevars,*/
-        __pyx_empty_tuple, /*PyObject *cellvars,*/
-        py_srcfile,   /*PyObject *filename,*/
-        py_funcname,  /*PyObject *name,*/
-        py_line,
-        __pyx_empty_bytes  /*PyObject *lnotab*/
-    );
-    Py_DECREF(py_srcfile);
-    #else
-    py_code = PyCode_NewEmpty(filename, funcname, py_line);
-    #endif
-    Py_XDECREF(py_funcname);
-    return py_code;
-bad:
-    Py_XDECREF(py_funcname);
-    #if PY_MAJOR_VERSION < 3
-    Py_XDECREF(py_srcfile);
-    #endif
-    return NULL;
-}
-static void __Pyx_AddTraceback(const char *funcname, int c_line,
-                               int py_line, const char *filename) {
-    PyCodeObject *py_code = 0;
-    PyFrameObject *py_frame = 0;
-    PyThreadState *tstate = __Pyx_PyThreadState_Current;
-    PyObject *ptype, *pvalue, *ptraceback;
-    if (c_line) {
-        c_line = __Pyx_CLineForTraceback(tstate, c_line);
-    }
-    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
-    if (!py_code) {
-        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
-        py_code = __Pyx_CreateCodeObjectForTraceback(
-            funcname, c_line, py_line, filename);
-        if (!py_code) {
-            /* If the code object creation fails, then we should clear the
-               fetched exception references and propagate the new exception */
-            Py_XDECREF(ptype);
-            Py_XDECREF(pvalue);
-            Py_XDECREF(ptraceback);
-            goto bad;
+        PyObject *v;
+        PyObject *stepval = NULL, *mask = NULL, *shift = NULL;
+        int bits, remaining_bits, is_negative = 0;
+        int chunk_size = (sizeof(long) < 8) ? 30 : 62;
+        if (likely(PyLong_CheckExact(x))) {
+            v = __Pyx_NewRef(x);
+        } else {
+            v = PyNumber_Long(x);
+            if (unlikely(!v)) return (int) -1;
+            assert(PyLong_CheckExact(v));
+        }
+        {
+            int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
+            if (unlikely(result < 0)) {
+                Py_DECREF(v);
+                return (int) -1;
+            }
+            is_negative = result == 1;
+        }
+        if (is_unsigned && unlikely(is_negative)) {
+            Py_DECREF(v);
+            goto raise_neg_overflow;
+        } else if (is_negative) {
+            stepval = PyNumber_Invert(v);
+            Py_DECREF(v);
+            if (unlikely(!stepval))
+                return (int) -1;
+        } else {
+            stepval = v;
+        }
+        v = NULL;
+        val = (int) 0;
+        mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
+        shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
+        for (bits = 0; bits < (int) sizeof(int) * 8 - chunk_size; bits += chunk_size) {
+            PyObject *tmp, *digit;
+            long idigit;
+            digit = PyNumber_And(stepval, mask);
+            if (unlikely(!digit)) goto done;
+            idigit = PyLong_AsLong(digit);
+            Py_DECREF(digit);
+            if (unlikely(idigit < 0)) goto done;
+            val |= ((int) idigit) << bits;
+            tmp = PyNumber_Rshift(stepval, shift);
+            if (unlikely(!tmp)) goto done;
+            Py_DECREF(stepval); stepval = tmp;
         }
-        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
-        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
-    }
-    py_frame = PyFrame_New(
-        tstate,            /*PyThreadState *tstate,*/
-        py_code,           /*PyCodeObject *code,*/
-        __pyx_d,    /*PyObject *globals,*/
-        0                  /*PyObject *locals*/
-    );
-    if (!py_frame) goto bad;
-    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
-    PyTraceBack_Here(py_frame);
-bad:
-    Py_XDECREF(py_code);
-    Py_XDECREF(py_frame);
-}
+        Py_DECREF(shift); shift = NULL;
+        Py_DECREF(mask); mask = NULL;
+        {
+            long idigit = PyLong_AsLong(stepval);
+            if (unlikely(idigit < 0)) goto done;
+            remaining_bits = ((int) sizeof(int) * 8) - bits - (is_unsigned ? 0 : 1);
+            if (unlikely(idigit >= (1L << remaining_bits)))
+                goto raise_overflow;
+            val |= ((int) idigit) << bits;
+        }
+        if (!is_unsigned) {
+            if (unlikely(val & (((int) 1) << (sizeof(int) * 8 - 1))))
+                goto raise_overflow;
+            if (is_negative)
+                val = ~val;
+        }
+        ret = 0;
+    done:
+        Py_XDECREF(shift);
+        Py_XDECREF(mask);
+        Py_XDECREF(stepval);
 #endif
-
-/* CIntFromPyVerify */
-#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
-    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
-#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
-    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
-#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
-    {\
-        func_type value = func_value;\
-        if (sizeof(target_type) < sizeof(func_type)) {\
-            if (unlikely(value != (func_type) (target_type) value)) {\
-                func_type zero = 0;\
-                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
-                    return (target_type) -1;\
-                if (is_unsigned && unlikely(value < zero))\
-                    goto raise_neg_overflow;\
-                else\
-                    goto raise_overflow;\
-            }\
-        }\
-        return (target_type) value;\
+        if (unlikely(ret))
+            return (int) -1;
+        return val;
     }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
+}
 
 /* CIntFromPy */
 static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *x) {
@@ -12887,6 +18932,77 @@ raise_neg_overflow:
     return (size_t) -1;
 }
 
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *from_bytes, *result = NULL;
+        PyObject *py_bytes = NULL, *arg_tuple = NULL, *kwds = NULL, *order_str = NULL;
+        from_bytes = PyObject_GetAttrString((PyObject*)&PyLong_Type, "from_bytes");
+        if (!from_bytes) return NULL;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(int));
+        if (!py_bytes) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        arg_tuple = PyTuple_Pack(2, py_bytes, order_str);
+        if (!arg_tuple) goto limited_bad;
+        if (!is_unsigned) {
+            kwds = PyDict_New();
+            if (!kwds) goto limited_bad;
+            if (PyDict_SetItemString(kwds, "signed", __Pyx_NewRef(Py_True))) goto limited_bad;
+        }
+        result = PyObject_Call(from_bytes, arg_tuple, kwds);
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(arg_tuple);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes);
+        return result;
+#endif
+    }
+}
+
 /* CIntFromPy */
 static CYTHON_INLINE unsigned PY_LONG_LONG __Pyx_PyInt_As_unsigned_PY_LONG_LONG(PyObject *x) {
 #ifdef __Pyx_HAS_GCC_DIAGNOSTIC
@@ -13965,7 +20081,7 @@ __Pyx_PyType_GetName(PyTypeObject* tp)
     if (unlikely(name == NULL) || unlikely(!PyUnicode_Check(name))) {
         PyErr_Clear();
         Py_XDECREF(name);
-        name = __Pyx_NewRef(__pyx_n_s__26);
+        name = __Pyx_NewRef(__pyx_n_s__37);
     }
     return name;
 }
@@ -14001,429 +20117,1279 @@ static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
 #endif
         }
     }
-    {
-        unsigned char *bytes = (unsigned char *)&value;
-#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
-        if (is_unsigned) {
-            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+    {
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *from_bytes, *result = NULL;
+        PyObject *py_bytes = NULL, *arg_tuple = NULL, *kwds = NULL, *order_str = NULL;
+        from_bytes = PyObject_GetAttrString((PyObject*)&PyLong_Type, "from_bytes");
+        if (!from_bytes) return NULL;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(long));
+        if (!py_bytes) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        arg_tuple = PyTuple_Pack(2, py_bytes, order_str);
+        if (!arg_tuple) goto limited_bad;
+        if (!is_unsigned) {
+            kwds = PyDict_New();
+            if (!kwds) goto limited_bad;
+            if (PyDict_SetItemString(kwds, "signed", __Pyx_NewRef(Py_True))) goto limited_bad;
+        }
+        result = PyObject_Call(from_bytes, arg_tuple, kwds);
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(arg_tuple);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes);
+        return result;
+#endif
+    }
+}
+
+/* FastTypeChecks */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = __Pyx_PyType_GetSlot(a, tp_base, PyTypeObject*);
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+static CYTHON_INLINE int __Pyx_IsAnySubtype2(PyTypeObject *cls, PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (cls == a || cls == b) return 1;
+    mro = cls->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            PyObject *base = PyTuple_GET_ITEM(mro, i);
+            if (base == (PyObject *)a || base == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(cls, a) || __Pyx_InBases(cls, b);
+}
+#if PY_MAJOR_VERSION == 2
+static int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject* exc_type2) {
+    PyObject *exception, *value, *tb;
+    int res;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&exception, &value, &tb);
+    res = exc_type1 ? PyObject_IsSubclass(err, exc_type1) : 0;
+    if (unlikely(res == -1)) {
+        PyErr_WriteUnraisable(err);
+        res = 0;
+    }
+    if (!res) {
+        res = PyObject_IsSubclass(err, exc_type2);
+        if (unlikely(res == -1)) {
+            PyErr_WriteUnraisable(err);
+            res = 0;
+        }
+    }
+    __Pyx_ErrRestore(exception, value, tb);
+    return res;
+}
+#else
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    if (exc_type1) {
+        return __Pyx_IsAnySubtype2((PyTypeObject*)err, (PyTypeObject*)exc_type1, (PyTypeObject*)exc_type2);
+    } else {
+        return __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+}
+#endif
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+#if PY_MAJOR_VERSION >= 3
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+#endif
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        #if PY_MAJOR_VERSION < 3
+        if (likely(exc_type == t)) return 1;
+        #endif
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
         } else {
-            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
         }
-#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        return _PyLong_FromByteArray(bytes, sizeof(long),
-                                     little, !is_unsigned);
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
+
+/* PyObjectCall2Args */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args[3] = {NULL, arg1, arg2};
+    return __Pyx_PyObject_FastCall(function, args+1, 2 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
+}
+
+/* PyObjectCallMethod1 */
+#if !(CYTHON_VECTORCALL && __PYX_LIMITED_VERSION_HEX >= 0x030C00A2)
+static PyObject* __Pyx__PyObject_CallMethod1(PyObject* method, PyObject* arg) {
+    PyObject *result = __Pyx_PyObject_CallOneArg(method, arg);
+    Py_DECREF(method);
+    return result;
+}
+#endif
+static PyObject* __Pyx_PyObject_CallMethod1(PyObject* obj, PyObject* method_name, PyObject* arg) {
+#if CYTHON_VECTORCALL && __PYX_LIMITED_VERSION_HEX >= 0x030C00A2
+    PyObject *args[2] = {obj, arg};
+    (void) __Pyx_PyObject_GetMethod;
+    (void) __Pyx_PyObject_CallOneArg;
+    (void) __Pyx_PyObject_Call2Args;
+    return PyObject_VectorcallMethod(method_name, args, 2 | PY_VECTORCALL_ARGUMENTS_OFFSET, NULL);
 #else
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        PyObject *from_bytes, *result = NULL;
-        PyObject *py_bytes = NULL, *arg_tuple = NULL, *kwds = NULL, *order_str = NULL;
-        from_bytes = PyObject_GetAttrString((PyObject*)&PyLong_Type, "from_bytes");
-        if (!from_bytes) return NULL;
-        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(long));
-        if (!py_bytes) goto limited_bad;
-        order_str = PyUnicode_FromString(little ? "little" : "big");
-        if (!order_str) goto limited_bad;
-        arg_tuple = PyTuple_Pack(2, py_bytes, order_str);
-        if (!arg_tuple) goto limited_bad;
-        if (!is_unsigned) {
-            kwds = PyDict_New();
-            if (!kwds) goto limited_bad;
-            if (PyDict_SetItemString(kwds, "signed", __Pyx_NewRef(Py_True))) goto limited_bad;
-        }
-        result = PyObject_Call(from_bytes, arg_tuple, kwds);
-        limited_bad:
-        Py_XDECREF(kwds);
-        Py_XDECREF(arg_tuple);
-        Py_XDECREF(order_str);
-        Py_XDECREF(py_bytes);
-        Py_XDECREF(from_bytes);
+    PyObject *method = NULL, *result;
+    int is_method = __Pyx_PyObject_GetMethod(obj, method_name, &method);
+    if (likely(is_method)) {
+        result = __Pyx_PyObject_Call2Args(method, obj, arg);
+        Py_DECREF(method);
         return result;
-#endif
     }
+    if (unlikely(!method)) return NULL;
+    return __Pyx__PyObject_CallMethod1(method, arg);
+#endif
 }
 
-/* CIntFromPy */
-static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
-#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
-#pragma GCC diagnostic push
-#pragma GCC diagnostic ignored "-Wconversion"
-#endif
-    const int neg_one = (int) -1, const_zero = (int) 0;
-#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
-#pragma GCC diagnostic pop
+/* CoroutineBase */
+#include <frameobject.h>
+#if PY_VERSION_HEX >= 0x030b00a6 && !defined(PYPY_VERSION)
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
 #endif
-    const int is_unsigned = neg_one > const_zero;
-#if PY_MAJOR_VERSION < 3
-    if (likely(PyInt_Check(x))) {
-        if ((sizeof(int) < sizeof(long))) {
-            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
-        } else {
-            long val = PyInt_AS_LONG(x);
-            if (is_unsigned && unlikely(val < 0)) {
-                goto raise_neg_overflow;
-            }
-            return (int) val;
-        }
+#define __Pyx_Coroutine_Undelegate(gen) Py_CLEAR((gen)->yieldfrom)
+static int __Pyx_PyGen__FetchStopIterationValue(PyThreadState *__pyx_tstate, PyObject **pvalue) {
+    PyObject *et, *ev, *tb;
+    PyObject *value = NULL;
+    CYTHON_UNUSED_VAR(__pyx_tstate);
+    __Pyx_ErrFetch(&et, &ev, &tb);
+    if (!et) {
+        Py_XDECREF(tb);
+        Py_XDECREF(ev);
+        Py_INCREF(Py_None);
+        *pvalue = Py_None;
+        return 0;
     }
+    if (likely(et == PyExc_StopIteration)) {
+        if (!ev) {
+            Py_INCREF(Py_None);
+            value = Py_None;
+        }
+#if PY_VERSION_HEX >= 0x030300A0
+        else if (likely(__Pyx_IS_TYPE(ev, (PyTypeObject*)PyExc_StopIteration))) {
+            value = ((PyStopIterationObject *)ev)->value;
+            Py_INCREF(value);
+            Py_DECREF(ev);
+        }
 #endif
-    if (unlikely(!PyLong_Check(x))) {
-        int val;
-        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
-        if (!tmp) return (int) -1;
-        val = __Pyx_PyInt_As_int(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-    if (is_unsigned) {
-#if CYTHON_USE_PYLONG_INTERNALS
-        if (unlikely(__Pyx_PyLong_IsNeg(x))) {
-            goto raise_neg_overflow;
-        } else if (__Pyx_PyLong_IsCompact(x)) {
-            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
-        } else {
-            const digit* digits = __Pyx_PyLong_Digits(x);
-            assert(__Pyx_PyLong_DigitCount(x) > 1);
-            switch (__Pyx_PyLong_DigitCount(x)) {
-                case 2:
-                    if ((8 * sizeof(int) > 1 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) >= 2 * PyLong_SHIFT)) {
-                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
-                        }
-                    }
-                    break;
-                case 3:
-                    if ((8 * sizeof(int) > 2 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) >= 3 * PyLong_SHIFT)) {
-                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
-                        }
-                    }
-                    break;
-                case 4:
-                    if ((8 * sizeof(int) > 3 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) >= 4 * PyLong_SHIFT)) {
-                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
-                        }
-                    }
-                    break;
+        else if (unlikely(PyTuple_Check(ev))) {
+            if (PyTuple_GET_SIZE(ev) >= 1) {
+#if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+                value = PyTuple_GET_ITEM(ev, 0);
+                Py_INCREF(value);
+#else
+                value = PySequence_ITEM(ev, 0);
+#endif
+            } else {
+                Py_INCREF(Py_None);
+                value = Py_None;
             }
+            Py_DECREF(ev);
         }
-#endif
-#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
-        if (unlikely(Py_SIZE(x) < 0)) {
-            goto raise_neg_overflow;
+        else if (!__Pyx_TypeCheck(ev, (PyTypeObject*)PyExc_StopIteration)) {
+            value = ev;
         }
-#else
-        {
-            int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
-            if (unlikely(result < 0))
-                return (int) -1;
-            if (unlikely(result == 1))
-                goto raise_neg_overflow;
+        if (likely(value)) {
+            Py_XDECREF(tb);
+            Py_DECREF(et);
+            *pvalue = value;
+            return 0;
         }
-#endif
-        if ((sizeof(int) <= sizeof(unsigned long))) {
-            __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
-#ifdef HAVE_LONG_LONG
-        } else if ((sizeof(int) <= sizeof(unsigned PY_LONG_LONG))) {
-            __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
-#endif
+    } else if (!__Pyx_PyErr_GivenExceptionMatches(et, PyExc_StopIteration)) {
+        __Pyx_ErrRestore(et, ev, tb);
+        return -1;
+    }
+    PyErr_NormalizeException(&et, &ev, &tb);
+    if (unlikely(!PyObject_TypeCheck(ev, (PyTypeObject*)PyExc_StopIteration))) {
+        __Pyx_ErrRestore(et, ev, tb);
+        return -1;
+    }
+    Py_XDECREF(tb);
+    Py_DECREF(et);
+#if PY_VERSION_HEX >= 0x030300A0
+    value = ((PyStopIterationObject *)ev)->value;
+    Py_INCREF(value);
+    Py_DECREF(ev);
+#else
+    {
+        PyObject* args = __Pyx_PyObject_GetAttrStr(ev, __pyx_n_s_args);
+        Py_DECREF(ev);
+        if (likely(args)) {
+            value = PySequence_GetItem(args, 0);
+            Py_DECREF(args);
         }
-    } else {
-#if CYTHON_USE_PYLONG_INTERNALS
-        if (__Pyx_PyLong_IsCompact(x)) {
-            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
-        } else {
-            const digit* digits = __Pyx_PyLong_Digits(x);
-            assert(__Pyx_PyLong_DigitCount(x) > 1);
-            switch (__Pyx_PyLong_SignedDigitCount(x)) {
-                case -2:
-                    if ((8 * sizeof(int) - 1 > 1 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
-                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case 2:
-                    if ((8 * sizeof(int) > 1 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
-                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case -3:
-                    if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
-                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case 3:
-                    if ((8 * sizeof(int) > 2 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
-                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case -4:
-                    if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
-                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-                case 4:
-                    if ((8 * sizeof(int) > 3 * PyLong_SHIFT)) {
-                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
-                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
-                        }
-                    }
-                    break;
-            }
+        if (unlikely(!value)) {
+            __Pyx_ErrRestore(NULL, NULL, NULL);
+            Py_INCREF(Py_None);
+            value = Py_None;
         }
+    }
+#endif
+    *pvalue = value;
+    return 0;
+}
+static CYTHON_INLINE
+void __Pyx_Coroutine_ExceptionClear(__Pyx_ExcInfoStruct *exc_state) {
+#if PY_VERSION_HEX >= 0x030B00a4
+    Py_CLEAR(exc_state->exc_value);
+#else
+    PyObject *t, *v, *tb;
+    t = exc_state->exc_type;
+    v = exc_state->exc_value;
+    tb = exc_state->exc_traceback;
+    exc_state->exc_type = NULL;
+    exc_state->exc_value = NULL;
+    exc_state->exc_traceback = NULL;
+    Py_XDECREF(t);
+    Py_XDECREF(v);
+    Py_XDECREF(tb);
 #endif
-        if ((sizeof(int) <= sizeof(long))) {
-            __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
-#ifdef HAVE_LONG_LONG
-        } else if ((sizeof(int) <= sizeof(PY_LONG_LONG))) {
-            __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+}
+#define __Pyx_Coroutine_AlreadyRunningError(gen)  (__Pyx__Coroutine_AlreadyRunningError(gen), (PyObject*)NULL)
+static void __Pyx__Coroutine_AlreadyRunningError(__pyx_CoroutineObject *gen) {
+    const char *msg;
+    CYTHON_MAYBE_UNUSED_VAR(gen);
+    if ((0)) {
+    #ifdef __Pyx_Coroutine_USED
+    } else if (__Pyx_Coroutine_Check((PyObject*)gen)) {
+        msg = "coroutine already executing";
+    #endif
+    #ifdef __Pyx_AsyncGen_USED
+    } else if (__Pyx_AsyncGen_CheckExact((PyObject*)gen)) {
+        msg = "async generator already executing";
+    #endif
+    } else {
+        msg = "generator already executing";
+    }
+    PyErr_SetString(PyExc_ValueError, msg);
+}
+#define __Pyx_Coroutine_NotStartedError(gen)  (__Pyx__Coroutine_NotStartedError(gen), (PyObject*)NULL)
+static void __Pyx__Coroutine_NotStartedError(PyObject *gen) {
+    const char *msg;
+    CYTHON_MAYBE_UNUSED_VAR(gen);
+    if ((0)) {
+    #ifdef __Pyx_Coroutine_USED
+    } else if (__Pyx_Coroutine_Check(gen)) {
+        msg = "can't send non-None value to a just-started coroutine";
+    #endif
+    #ifdef __Pyx_AsyncGen_USED
+    } else if (__Pyx_AsyncGen_CheckExact(gen)) {
+        msg = "can't send non-None value to a just-started async generator";
+    #endif
+    } else {
+        msg = "can't send non-None value to a just-started generator";
+    }
+    PyErr_SetString(PyExc_TypeError, msg);
+}
+#define __Pyx_Coroutine_AlreadyTerminatedError(gen, value, closing)  (__Pyx__Coroutine_AlreadyTerminatedError(gen, value, closing), (PyObject*)NULL)
+static void __Pyx__Coroutine_AlreadyTerminatedError(PyObject *gen, PyObject *value, int closing) {
+    CYTHON_MAYBE_UNUSED_VAR(gen);
+    CYTHON_MAYBE_UNUSED_VAR(closing);
+    #ifdef __Pyx_Coroutine_USED
+    if (!closing && __Pyx_Coroutine_Check(gen)) {
+        PyErr_SetString(PyExc_RuntimeError, "cannot reuse already awaited coroutine");
+    } else
+    #endif
+    if (value) {
+        #ifdef __Pyx_AsyncGen_USED
+        if (__Pyx_AsyncGen_CheckExact(gen))
+            PyErr_SetNone(__Pyx_PyExc_StopAsyncIteration);
+        else
+        #endif
+        PyErr_SetNone(PyExc_StopIteration);
+    }
+}
+static
+PyObject *__Pyx_Coroutine_SendEx(__pyx_CoroutineObject *self, PyObject *value, int closing) {
+    __Pyx_PyThreadState_declare
+    PyThreadState *tstate;
+    __Pyx_ExcInfoStruct *exc_state;
+    PyObject *retval;
+    assert(!self->is_running);
+    if (unlikely(self->resume_label == 0)) {
+        if (unlikely(value && value != Py_None)) {
+            return __Pyx_Coroutine_NotStartedError((PyObject*)self);
+        }
+    }
+    if (unlikely(self->resume_label == -1)) {
+        return __Pyx_Coroutine_AlreadyTerminatedError((PyObject*)self, value, closing);
+    }
+#if CYTHON_FAST_THREAD_STATE
+    __Pyx_PyThreadState_assign
+    tstate = __pyx_tstate;
+#else
+    tstate = __Pyx_PyThreadState_Current;
 #endif
+    exc_state = &self->gi_exc_state;
+    if (exc_state->exc_value) {
+        #if CYTHON_COMPILING_IN_PYPY
+        #else
+        PyObject *exc_tb;
+        #if PY_VERSION_HEX >= 0x030B00a4 && !CYTHON_COMPILING_IN_CPYTHON
+        exc_tb = PyException_GetTraceback(exc_state->exc_value);
+        #elif PY_VERSION_HEX >= 0x030B00a4
+        exc_tb = ((PyBaseExceptionObject*) exc_state->exc_value)->traceback;
+        #else
+        exc_tb = exc_state->exc_traceback;
+        #endif
+        if (exc_tb) {
+            PyTracebackObject *tb = (PyTracebackObject *) exc_tb;
+            PyFrameObject *f = tb->tb_frame;
+            assert(f->f_back == NULL);
+            #if PY_VERSION_HEX >= 0x030B00A1
+            f->f_back = PyThreadState_GetFrame(tstate);
+            #else
+            Py_XINCREF(tstate->frame);
+            f->f_back = tstate->frame;
+            #endif
+            #if PY_VERSION_HEX >= 0x030B00a4 && !CYTHON_COMPILING_IN_CPYTHON
+            Py_DECREF(exc_tb);
+            #endif
         }
+        #endif
     }
-    {
-        int val;
-        int ret = -1;
-#if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
-        Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
-            x, &val, sizeof(val), Py_ASNATIVEBYTES_NATIVE_ENDIAN | (is_unsigned ? Py_ASNATIVEBYTES_UNSIGNED_BUFFER | Py_ASNATIVEBYTES_REJECT_NEGATIVE : 0));
-        if (unlikely(bytes_copied == -1)) {
-        } else if (unlikely(bytes_copied > (Py_ssize_t) sizeof(val))) {
-            goto raise_overflow;
-        } else {
-            ret = 0;
+#if CYTHON_USE_EXC_INFO_STACK
+    exc_state->previous_item = tstate->exc_info;
+    tstate->exc_info = exc_state;
+#else
+    if (exc_state->exc_type) {
+        __Pyx_ExceptionSwap(&exc_state->exc_type, &exc_state->exc_value, &exc_state->exc_traceback);
+    } else {
+        __Pyx_Coroutine_ExceptionClear(exc_state);
+        __Pyx_ExceptionSave(&exc_state->exc_type, &exc_state->exc_value, &exc_state->exc_traceback);
+    }
+#endif
+    self->is_running = 1;
+    retval = self->body(self, tstate, value);
+    self->is_running = 0;
+#if CYTHON_USE_EXC_INFO_STACK
+    exc_state = &self->gi_exc_state;
+    tstate->exc_info = exc_state->previous_item;
+    exc_state->previous_item = NULL;
+    __Pyx_Coroutine_ResetFrameBackpointer(exc_state);
+#endif
+    return retval;
+}
+static CYTHON_INLINE void __Pyx_Coroutine_ResetFrameBackpointer(__Pyx_ExcInfoStruct *exc_state) {
+#if CYTHON_COMPILING_IN_PYPY
+    CYTHON_UNUSED_VAR(exc_state);
+#else
+    PyObject *exc_tb;
+    #if PY_VERSION_HEX >= 0x030B00a4
+    if (!exc_state->exc_value) return;
+    exc_tb = PyException_GetTraceback(exc_state->exc_value);
+    #else
+    exc_tb = exc_state->exc_traceback;
+    #endif
+    if (likely(exc_tb)) {
+        PyTracebackObject *tb = (PyTracebackObject *) exc_tb;
+        PyFrameObject *f = tb->tb_frame;
+        Py_CLEAR(f->f_back);
+        #if PY_VERSION_HEX >= 0x030B00a4
+        Py_DECREF(exc_tb);
+        #endif
+    }
+#endif
+}
+static CYTHON_INLINE
+PyObject *__Pyx_Coroutine_MethodReturn(PyObject* gen, PyObject *retval) {
+    CYTHON_MAYBE_UNUSED_VAR(gen);
+    if (unlikely(!retval)) {
+        __Pyx_PyThreadState_declare
+        __Pyx_PyThreadState_assign
+        if (!__Pyx_PyErr_Occurred()) {
+            PyObject *exc = PyExc_StopIteration;
+            #ifdef __Pyx_AsyncGen_USED
+            if (__Pyx_AsyncGen_CheckExact(gen))
+                exc = __Pyx_PyExc_StopAsyncIteration;
+            #endif
+            __Pyx_PyErr_SetNone(exc);
         }
-#elif PY_VERSION_HEX < 0x030d0000 && !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) || defined(_PyLong_AsByteArray)
-        int one = 1; int is_little = (int)*(unsigned char *)&one;
-        unsigned char *bytes = (unsigned char *)&val;
-        ret = _PyLong_AsByteArray((PyLongObject *)x,
-                                    bytes, sizeof(val),
-                                    is_little, !is_unsigned);
+    }
+    return retval;
+}
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03030000 && (defined(__linux__) || PY_VERSION_HEX >= 0x030600B3)
+static CYTHON_INLINE
+PyObject *__Pyx_PyGen_Send(PyGenObject *gen, PyObject *arg) {
+#if PY_VERSION_HEX <= 0x030A00A1
+    return _PyGen_Send(gen, arg);
 #else
-        PyObject *v;
-        PyObject *stepval = NULL, *mask = NULL, *shift = NULL;
-        int bits, remaining_bits, is_negative = 0;
-        int chunk_size = (sizeof(long) < 8) ? 30 : 62;
-        if (likely(PyLong_CheckExact(x))) {
-            v = __Pyx_NewRef(x);
-        } else {
-            v = PyNumber_Long(x);
-            if (unlikely(!v)) return (int) -1;
-            assert(PyLong_CheckExact(v));
+    PyObject *result;
+    if (PyIter_Send((PyObject*)gen, arg ? arg : Py_None, &result) == PYGEN_RETURN) {
+        if (PyAsyncGen_CheckExact(gen)) {
+            assert(result == Py_None);
+            PyErr_SetNone(PyExc_StopAsyncIteration);
         }
-        {
-            int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
-            if (unlikely(result < 0)) {
-                Py_DECREF(v);
-                return (int) -1;
+        else if (result == Py_None) {
+            PyErr_SetNone(PyExc_StopIteration);
+        }
+        else {
+#if PY_VERSION_HEX < 0x030d00A1
+            _PyGen_SetStopIterationValue(result);
+#else
+            if (!PyTuple_Check(result) && !PyExceptionInstance_Check(result)) {
+                PyErr_SetObject(PyExc_StopIteration, result);
+            } else {
+                PyObject *exc = __Pyx_PyObject_CallOneArg(PyExc_StopIteration, result);
+                if (likely(exc != NULL)) {
+                    PyErr_SetObject(PyExc_StopIteration, exc);
+                    Py_DECREF(exc);
+                }
             }
-            is_negative = result == 1;
+#endif
         }
-        if (is_unsigned && unlikely(is_negative)) {
-            Py_DECREF(v);
-            goto raise_neg_overflow;
-        } else if (is_negative) {
-            stepval = PyNumber_Invert(v);
-            Py_DECREF(v);
-            if (unlikely(!stepval))
-                return (int) -1;
-        } else {
-            stepval = v;
+        Py_DECREF(result);
+        result = NULL;
+    }
+    return result;
+#endif
+}
+#endif
+static CYTHON_INLINE
+PyObject *__Pyx_Coroutine_FinishDelegation(__pyx_CoroutineObject *gen) {
+    PyObject *ret;
+    PyObject *val = NULL;
+    __Pyx_Coroutine_Undelegate(gen);
+    __Pyx_PyGen__FetchStopIterationValue(__Pyx_PyThreadState_Current, &val);
+    ret = __Pyx_Coroutine_SendEx(gen, val, 0);
+    Py_XDECREF(val);
+    return ret;
+}
+static PyObject *__Pyx_Coroutine_Send(PyObject *self, PyObject *value) {
+    PyObject *retval;
+    __pyx_CoroutineObject *gen = (__pyx_CoroutineObject*) self;
+    PyObject *yf = gen->yieldfrom;
+    if (unlikely(gen->is_running))
+        return __Pyx_Coroutine_AlreadyRunningError(gen);
+    if (yf) {
+        PyObject *ret;
+        gen->is_running = 1;
+        #ifdef __Pyx_Generator_USED
+        if (__Pyx_Generator_CheckExact(yf)) {
+            ret = __Pyx_Coroutine_Send(yf, value);
+        } else
+        #endif
+        #ifdef __Pyx_Coroutine_USED
+        if (__Pyx_Coroutine_Check(yf)) {
+            ret = __Pyx_Coroutine_Send(yf, value);
+        } else
+        #endif
+        #ifdef __Pyx_AsyncGen_USED
+        if (__pyx_PyAsyncGenASend_CheckExact(yf)) {
+            ret = __Pyx_async_gen_asend_send(yf, value);
+        } else
+        #endif
+        #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03030000 && (defined(__linux__) || PY_VERSION_HEX >= 0x030600B3)
+        if (PyGen_CheckExact(yf)) {
+            ret = __Pyx_PyGen_Send((PyGenObject*)yf, value == Py_None ? NULL : value);
+        } else
+        #endif
+        #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03050000 && defined(PyCoro_CheckExact) && (defined(__linux__) || PY_VERSION_HEX >= 0x030600B3)
+        if (PyCoro_CheckExact(yf)) {
+            ret = __Pyx_PyGen_Send((PyGenObject*)yf, value == Py_None ? NULL : value);
+        } else
+        #endif
+        {
+            if (value == Py_None)
+                ret = __Pyx_PyObject_GetIterNextFunc(yf)(yf);
+            else
+                ret = __Pyx_PyObject_CallMethod1(yf, __pyx_n_s_send, value);
         }
-        v = NULL;
-        val = (int) 0;
-        mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
-        shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
-        for (bits = 0; bits < (int) sizeof(int) * 8 - chunk_size; bits += chunk_size) {
-            PyObject *tmp, *digit;
-            long idigit;
-            digit = PyNumber_And(stepval, mask);
-            if (unlikely(!digit)) goto done;
-            idigit = PyLong_AsLong(digit);
-            Py_DECREF(digit);
-            if (unlikely(idigit < 0)) goto done;
-            val |= ((int) idigit) << bits;
-            tmp = PyNumber_Rshift(stepval, shift);
-            if (unlikely(!tmp)) goto done;
-            Py_DECREF(stepval); stepval = tmp;
+        gen->is_running = 0;
+        if (likely(ret)) {
+            return ret;
         }
-        Py_DECREF(shift); shift = NULL;
-        Py_DECREF(mask); mask = NULL;
-        {
-            long idigit = PyLong_AsLong(stepval);
-            if (unlikely(idigit < 0)) goto done;
-            remaining_bits = ((int) sizeof(int) * 8) - bits - (is_unsigned ? 0 : 1);
-            if (unlikely(idigit >= (1L << remaining_bits)))
-                goto raise_overflow;
-            val |= ((int) idigit) << bits;
+        retval = __Pyx_Coroutine_FinishDelegation(gen);
+    } else {
+        retval = __Pyx_Coroutine_SendEx(gen, value, 0);
+    }
+    return __Pyx_Coroutine_MethodReturn(self, retval);
+}
+static int __Pyx_Coroutine_CloseIter(__pyx_CoroutineObject *gen, PyObject *yf) {
+    PyObject *retval = NULL;
+    int err = 0;
+    #ifdef __Pyx_Generator_USED
+    if (__Pyx_Generator_CheckExact(yf)) {
+        retval = __Pyx_Coroutine_Close(yf);
+        if (!retval)
+            return -1;
+    } else
+    #endif
+    #ifdef __Pyx_Coroutine_USED
+    if (__Pyx_Coroutine_Check(yf)) {
+        retval = __Pyx_Coroutine_Close(yf);
+        if (!retval)
+            return -1;
+    } else
+    if (__Pyx_CoroutineAwait_CheckExact(yf)) {
+        retval = __Pyx_CoroutineAwait_Close((__pyx_CoroutineAwaitObject*)yf, NULL);
+        if (!retval)
+            return -1;
+    } else
+    #endif
+    #ifdef __Pyx_AsyncGen_USED
+    if (__pyx_PyAsyncGenASend_CheckExact(yf)) {
+        retval = __Pyx_async_gen_asend_close(yf, NULL);
+    } else
+    if (__pyx_PyAsyncGenAThrow_CheckExact(yf)) {
+        retval = __Pyx_async_gen_athrow_close(yf, NULL);
+    } else
+    #endif
+    {
+        PyObject *meth;
+        gen->is_running = 1;
+        meth = __Pyx_PyObject_GetAttrStrNoError(yf, __pyx_n_s_close);
+        if (unlikely(!meth)) {
+            if (unlikely(PyErr_Occurred())) {
+                PyErr_WriteUnraisable(yf);
+            }
+        } else {
+            retval = __Pyx_PyObject_CallNoArg(meth);
+            Py_DECREF(meth);
+            if (unlikely(!retval))
+                err = -1;
         }
-        if (!is_unsigned) {
-            if (unlikely(val & (((int) 1) << (sizeof(int) * 8 - 1))))
-                goto raise_overflow;
-            if (is_negative)
-                val = ~val;
+        gen->is_running = 0;
+    }
+    Py_XDECREF(retval);
+    return err;
+}
+static PyObject *__Pyx_Generator_Next(PyObject *self) {
+    __pyx_CoroutineObject *gen = (__pyx_CoroutineObject*) self;
+    PyObject *yf = gen->yieldfrom;
+    if (unlikely(gen->is_running))
+        return __Pyx_Coroutine_AlreadyRunningError(gen);
+    if (yf) {
+        PyObject *ret;
+        gen->is_running = 1;
+        #ifdef __Pyx_Generator_USED
+        if (__Pyx_Generator_CheckExact(yf)) {
+            ret = __Pyx_Generator_Next(yf);
+        } else
+        #endif
+        #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03030000 && (defined(__linux__) || PY_VERSION_HEX >= 0x030600B3)
+        if (PyGen_CheckExact(yf)) {
+            ret = __Pyx_PyGen_Send((PyGenObject*)yf, NULL);
+        } else
+        #endif
+        #ifdef __Pyx_Coroutine_USED
+        if (__Pyx_Coroutine_Check(yf)) {
+            ret = __Pyx_Coroutine_Send(yf, Py_None);
+        } else
+        #endif
+            ret = __Pyx_PyObject_GetIterNextFunc(yf)(yf);
+        gen->is_running = 0;
+        if (likely(ret)) {
+            return ret;
         }
-        ret = 0;
-    done:
-        Py_XDECREF(shift);
-        Py_XDECREF(mask);
-        Py_XDECREF(stepval);
-#endif
-        if (unlikely(ret))
-            return (int) -1;
-        return val;
+        return __Pyx_Coroutine_FinishDelegation(gen);
     }
-raise_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to int");
-    return (int) -1;
-raise_neg_overflow:
-    PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to int");
-    return (int) -1;
+    return __Pyx_Coroutine_SendEx(gen, Py_None, 0);
 }
-
-/* FastTypeChecks */
-#if CYTHON_COMPILING_IN_CPYTHON
-static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
-    while (a) {
-        a = __Pyx_PyType_GetSlot(a, tp_base, PyTypeObject*);
-        if (a == b)
-            return 1;
+static PyObject *__Pyx_Coroutine_Close_Method(PyObject *self, PyObject *arg) {
+    CYTHON_UNUSED_VAR(arg);
+    return __Pyx_Coroutine_Close(self);
+}
+static PyObject *__Pyx_Coroutine_Close(PyObject *self) {
+    __pyx_CoroutineObject *gen = (__pyx_CoroutineObject *) self;
+    PyObject *retval, *raised_exception;
+    PyObject *yf = gen->yieldfrom;
+    int err = 0;
+    if (unlikely(gen->is_running))
+        return __Pyx_Coroutine_AlreadyRunningError(gen);
+    if (yf) {
+        Py_INCREF(yf);
+        err = __Pyx_Coroutine_CloseIter(gen, yf);
+        __Pyx_Coroutine_Undelegate(gen);
+        Py_DECREF(yf);
+    }
+    if (err == 0)
+        PyErr_SetNone(PyExc_GeneratorExit);
+    retval = __Pyx_Coroutine_SendEx(gen, NULL, 1);
+    if (unlikely(retval)) {
+        const char *msg;
+        Py_DECREF(retval);
+        if ((0)) {
+        #ifdef __Pyx_Coroutine_USED
+        } else if (__Pyx_Coroutine_Check(self)) {
+            msg = "coroutine ignored GeneratorExit";
+        #endif
+        #ifdef __Pyx_AsyncGen_USED
+        } else if (__Pyx_AsyncGen_CheckExact(self)) {
+#if PY_VERSION_HEX < 0x03060000
+            msg = "async generator ignored GeneratorExit - might require Python 3.6+ finalisation (PEP 525)";
+#else
+            msg = "async generator ignored GeneratorExit";
+#endif
+        #endif
+        } else {
+            msg = "generator ignored GeneratorExit";
+        }
+        PyErr_SetString(PyExc_RuntimeError, msg);
+        return NULL;
     }
-    return b == &PyBaseObject_Type;
+    raised_exception = PyErr_Occurred();
+    if (likely(!raised_exception || __Pyx_PyErr_GivenExceptionMatches2(raised_exception, PyExc_GeneratorExit, PyExc_StopIteration))) {
+        if (raised_exception) PyErr_Clear();
+        Py_INCREF(Py_None);
+        return Py_None;
+    }
+    return NULL;
 }
-static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
-    PyObject *mro;
-    if (a == b) return 1;
-    mro = a->tp_mro;
-    if (likely(mro)) {
-        Py_ssize_t i, n;
-        n = PyTuple_GET_SIZE(mro);
-        for (i = 0; i < n; i++) {
-            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
-                return 1;
+static PyObject *__Pyx__Coroutine_Throw(PyObject *self, PyObject *typ, PyObject *val, PyObject *tb,
+                                        PyObject *args, int close_on_genexit) {
+    __pyx_CoroutineObject *gen = (__pyx_CoroutineObject *) self;
+    PyObject *yf = gen->yieldfrom;
+    if (unlikely(gen->is_running))
+        return __Pyx_Coroutine_AlreadyRunningError(gen);
+    if (yf) {
+        PyObject *ret;
+        Py_INCREF(yf);
+        if (__Pyx_PyErr_GivenExceptionMatches(typ, PyExc_GeneratorExit) && close_on_genexit) {
+            int err = __Pyx_Coroutine_CloseIter(gen, yf);
+            Py_DECREF(yf);
+            __Pyx_Coroutine_Undelegate(gen);
+            if (err < 0)
+                return __Pyx_Coroutine_MethodReturn(self, __Pyx_Coroutine_SendEx(gen, NULL, 0));
+            goto throw_here;
         }
-        return 0;
+        gen->is_running = 1;
+        if (0
+        #ifdef __Pyx_Generator_USED
+            || __Pyx_Generator_CheckExact(yf)
+        #endif
+        #ifdef __Pyx_Coroutine_USED
+            || __Pyx_Coroutine_Check(yf)
+        #endif
+            ) {
+            ret = __Pyx__Coroutine_Throw(yf, typ, val, tb, args, close_on_genexit);
+        #ifdef __Pyx_Coroutine_USED
+        } else if (__Pyx_CoroutineAwait_CheckExact(yf)) {
+            ret = __Pyx__Coroutine_Throw(((__pyx_CoroutineAwaitObject*)yf)->coroutine, typ, val, tb, args, close_on_genexit);
+        #endif
+        } else {
+            PyObject *meth = __Pyx_PyObject_GetAttrStrNoError(yf, __pyx_n_s_throw);
+            if (unlikely(!meth)) {
+                Py_DECREF(yf);
+                if (unlikely(PyErr_Occurred())) {
+                    gen->is_running = 0;
+                    return NULL;
+                }
+                __Pyx_Coroutine_Undelegate(gen);
+                gen->is_running = 0;
+                goto throw_here;
+            }
+            if (likely(args)) {
+                ret = __Pyx_PyObject_Call(meth, args, NULL);
+            } else {
+                PyObject *cargs[4] = {NULL, typ, val, tb};
+                ret = __Pyx_PyObject_FastCall(meth, cargs+1, 3 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
+            }
+            Py_DECREF(meth);
+        }
+        gen->is_running = 0;
+        Py_DECREF(yf);
+        if (!ret) {
+            ret = __Pyx_Coroutine_FinishDelegation(gen);
+        }
+        return __Pyx_Coroutine_MethodReturn(self, ret);
     }
-    return __Pyx_InBases(a, b);
+throw_here:
+    __Pyx_Raise(typ, val, tb, NULL);
+    return __Pyx_Coroutine_MethodReturn(self, __Pyx_Coroutine_SendEx(gen, NULL, 0));
 }
-static CYTHON_INLINE int __Pyx_IsAnySubtype2(PyTypeObject *cls, PyTypeObject *a, PyTypeObject *b) {
-    PyObject *mro;
-    if (cls == a || cls == b) return 1;
-    mro = cls->tp_mro;
-    if (likely(mro)) {
-        Py_ssize_t i, n;
-        n = PyTuple_GET_SIZE(mro);
-        for (i = 0; i < n; i++) {
-            PyObject *base = PyTuple_GET_ITEM(mro, i);
-            if (base == (PyObject *)a || base == (PyObject *)b)
-                return 1;
+static PyObject *__Pyx_Coroutine_Throw(PyObject *self, PyObject *args) {
+    PyObject *typ;
+    PyObject *val = NULL;
+    PyObject *tb = NULL;
+    if (unlikely(!PyArg_UnpackTuple(args, (char *)"throw", 1, 3, &typ, &val, &tb)))
+        return NULL;
+    return __Pyx__Coroutine_Throw(self, typ, val, tb, args, 1);
+}
+static CYTHON_INLINE int __Pyx_Coroutine_traverse_excstate(__Pyx_ExcInfoStruct *exc_state, visitproc visit, void *arg) {
+#if PY_VERSION_HEX >= 0x030B00a4
+    Py_VISIT(exc_state->exc_value);
+#else
+    Py_VISIT(exc_state->exc_type);
+    Py_VISIT(exc_state->exc_value);
+    Py_VISIT(exc_state->exc_traceback);
+#endif
+    return 0;
+}
+static int __Pyx_Coroutine_traverse(__pyx_CoroutineObject *gen, visitproc visit, void *arg) {
+    Py_VISIT(gen->closure);
+    Py_VISIT(gen->classobj);
+    Py_VISIT(gen->yieldfrom);
+    return __Pyx_Coroutine_traverse_excstate(&gen->gi_exc_state, visit, arg);
+}
+static int __Pyx_Coroutine_clear(PyObject *self) {
+    __pyx_CoroutineObject *gen = (__pyx_CoroutineObject *) self;
+    Py_CLEAR(gen->closure);
+    Py_CLEAR(gen->classobj);
+    Py_CLEAR(gen->yieldfrom);
+    __Pyx_Coroutine_ExceptionClear(&gen->gi_exc_state);
+#ifdef __Pyx_AsyncGen_USED
+    if (__Pyx_AsyncGen_CheckExact(self)) {
+        Py_CLEAR(((__pyx_PyAsyncGenObject*)gen)->ag_finalizer);
+    }
+#endif
+    Py_CLEAR(gen->gi_code);
+    Py_CLEAR(gen->gi_frame);
+    Py_CLEAR(gen->gi_name);
+    Py_CLEAR(gen->gi_qualname);
+    Py_CLEAR(gen->gi_modulename);
+    return 0;
+}
+static void __Pyx_Coroutine_dealloc(PyObject *self) {
+    __pyx_CoroutineObject *gen = (__pyx_CoroutineObject *) self;
+    PyObject_GC_UnTrack(gen);
+    if (gen->gi_weakreflist != NULL)
+        PyObject_ClearWeakRefs(self);
+    if (gen->resume_label >= 0) {
+        PyObject_GC_Track(self);
+#if PY_VERSION_HEX >= 0x030400a1 && CYTHON_USE_TP_FINALIZE
+        if (unlikely(PyObject_CallFinalizerFromDealloc(self)))
+#else
+        Py_TYPE(gen)->tp_del(self);
+        if (unlikely(Py_REFCNT(self) > 0))
+#endif
+        {
+            return;
         }
-        return 0;
+        PyObject_GC_UnTrack(self);
     }
-    return __Pyx_InBases(cls, a) || __Pyx_InBases(cls, b);
+#ifdef __Pyx_AsyncGen_USED
+    if (__Pyx_AsyncGen_CheckExact(self)) {
+        /* We have to handle this case for asynchronous generators
+           right here, because this code has to be between UNTRACK
+           and GC_Del. */
+        Py_CLEAR(((__pyx_PyAsyncGenObject*)self)->ag_finalizer);
+    }
+#endif
+    __Pyx_Coroutine_clear(self);
+    __Pyx_PyHeapTypeObject_GC_Del(gen);
 }
-#if PY_MAJOR_VERSION == 2
-static int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject* exc_type2) {
-    PyObject *exception, *value, *tb;
-    int res;
+static void __Pyx_Coroutine_del(PyObject *self) {
+    PyObject *error_type, *error_value, *error_traceback;
+    __pyx_CoroutineObject *gen = (__pyx_CoroutineObject *) self;
     __Pyx_PyThreadState_declare
-    __Pyx_PyThreadState_assign
-    __Pyx_ErrFetch(&exception, &value, &tb);
-    res = exc_type1 ? PyObject_IsSubclass(err, exc_type1) : 0;
-    if (unlikely(res == -1)) {
-        PyErr_WriteUnraisable(err);
-        res = 0;
+    if (gen->resume_label < 0) {
+        return;
     }
-    if (!res) {
-        res = PyObject_IsSubclass(err, exc_type2);
-        if (unlikely(res == -1)) {
-            PyErr_WriteUnraisable(err);
-            res = 0;
+#if !CYTHON_USE_TP_FINALIZE
+    assert(self->ob_refcnt == 0);
+    __Pyx_SET_REFCNT(self, 1);
+#endif
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&error_type, &error_value, &error_traceback);
+#ifdef __Pyx_AsyncGen_USED
+    if (__Pyx_AsyncGen_CheckExact(self)) {
+        __pyx_PyAsyncGenObject *agen = (__pyx_PyAsyncGenObject*)self;
+        PyObject *finalizer = agen->ag_finalizer;
+        if (finalizer && !agen->ag_closed) {
+            PyObject *res = __Pyx_PyObject_CallOneArg(finalizer, self);
+            if (unlikely(!res)) {
+                PyErr_WriteUnraisable(self);
+            } else {
+                Py_DECREF(res);
+            }
+            __Pyx_ErrRestore(error_type, error_value, error_traceback);
+            return;
         }
     }
-    __Pyx_ErrRestore(exception, value, tb);
-    return res;
-}
+#endif
+    if (unlikely(gen->resume_label == 0 && !error_value)) {
+#ifdef __Pyx_Coroutine_USED
+#ifdef __Pyx_Generator_USED
+    if (!__Pyx_Generator_CheckExact(self))
+#endif
+        {
+        PyObject_GC_UnTrack(self);
+#if PY_MAJOR_VERSION >= 3  || defined(PyErr_WarnFormat)
+        if (unlikely(PyErr_WarnFormat(PyExc_RuntimeWarning, 1, "coroutine '%.50S' was never awaited", gen->gi_qualname) < 0))
+            PyErr_WriteUnraisable(self);
 #else
-static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
-    if (exc_type1) {
-        return __Pyx_IsAnySubtype2((PyTypeObject*)err, (PyTypeObject*)exc_type1, (PyTypeObject*)exc_type2);
+        {PyObject *msg;
+        char *cmsg;
+        #if CYTHON_COMPILING_IN_PYPY
+        msg = NULL;
+        cmsg = (char*) "coroutine was never awaited";
+        #else
+        char *cname;
+        PyObject *qualname;
+        qualname = gen->gi_qualname;
+        cname = PyString_AS_STRING(qualname);
+        msg = PyString_FromFormat("coroutine '%.50s' was never awaited", cname);
+        if (unlikely(!msg)) {
+            PyErr_Clear();
+            cmsg = (char*) "coroutine was never awaited";
+        } else {
+            cmsg = PyString_AS_STRING(msg);
+        }
+        #endif
+        if (unlikely(PyErr_WarnEx(PyExc_RuntimeWarning, cmsg, 1) < 0))
+            PyErr_WriteUnraisable(self);
+        Py_XDECREF(msg);}
+#endif
+        PyObject_GC_Track(self);
+        }
+#endif
     } else {
-        return __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+        PyObject *res = __Pyx_Coroutine_Close(self);
+        if (unlikely(!res)) {
+            if (PyErr_Occurred())
+                PyErr_WriteUnraisable(self);
+        } else {
+            Py_DECREF(res);
+        }
     }
-}
+    __Pyx_ErrRestore(error_type, error_value, error_traceback);
+#if !CYTHON_USE_TP_FINALIZE
+    assert(Py_REFCNT(self) > 0);
+    if (likely(--self->ob_refcnt == 0)) {
+        return;
+    }
+    {
+        Py_ssize_t refcnt = Py_REFCNT(self);
+        _Py_NewReference(self);
+        __Pyx_SET_REFCNT(self, refcnt);
+    }
+#if CYTHON_COMPILING_IN_CPYTHON
+    assert(PyType_IS_GC(Py_TYPE(self)) &&
+           _Py_AS_GC(self)->gc.gc_refs != _PyGC_REFS_UNTRACKED);
+    _Py_DEC_REFTOTAL;
 #endif
-static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
-    Py_ssize_t i, n;
-    assert(PyExceptionClass_Check(exc_type));
-    n = PyTuple_GET_SIZE(tuple);
+#ifdef COUNT_ALLOCS
+    --Py_TYPE(self)->tp_frees;
+    --Py_TYPE(self)->tp_allocs;
+#endif
+#endif
+}
+static PyObject *
+__Pyx_Coroutine_get_name(__pyx_CoroutineObject *self, void *context)
+{
+    PyObject *name = self->gi_name;
+    CYTHON_UNUSED_VAR(context);
+    if (unlikely(!name)) name = Py_None;
+    Py_INCREF(name);
+    return name;
+}
+static int
+__Pyx_Coroutine_set_name(__pyx_CoroutineObject *self, PyObject *value, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
 #if PY_MAJOR_VERSION >= 3
-    for (i=0; i<n; i++) {
-        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    if (unlikely(value == NULL || !PyUnicode_Check(value)))
+#else
+    if (unlikely(value == NULL || !PyString_Check(value)))
+#endif
+    {
+        PyErr_SetString(PyExc_TypeError,
+                        "__name__ must be set to a string object");
+        return -1;
     }
+    Py_INCREF(value);
+    __Pyx_Py_XDECREF_SET(self->gi_name, value);
+    return 0;
+}
+static PyObject *
+__Pyx_Coroutine_get_qualname(__pyx_CoroutineObject *self, void *context)
+{
+    PyObject *name = self->gi_qualname;
+    CYTHON_UNUSED_VAR(context);
+    if (unlikely(!name)) name = Py_None;
+    Py_INCREF(name);
+    return name;
+}
+static int
+__Pyx_Coroutine_set_qualname(__pyx_CoroutineObject *self, PyObject *value, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+#if PY_MAJOR_VERSION >= 3
+    if (unlikely(value == NULL || !PyUnicode_Check(value)))
+#else
+    if (unlikely(value == NULL || !PyString_Check(value)))
 #endif
-    for (i=0; i<n; i++) {
-        PyObject *t = PyTuple_GET_ITEM(tuple, i);
-        #if PY_MAJOR_VERSION < 3
-        if (likely(exc_type == t)) return 1;
-        #endif
-        if (likely(PyExceptionClass_Check(t))) {
-            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
-        } else {
-        }
+    {
+        PyErr_SetString(PyExc_TypeError,
+                        "__qualname__ must be set to a string object");
+        return -1;
     }
+    Py_INCREF(value);
+    __Pyx_Py_XDECREF_SET(self->gi_qualname, value);
     return 0;
 }
-static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
-    if (likely(err == exc_type)) return 1;
-    if (likely(PyExceptionClass_Check(err))) {
-        if (likely(PyExceptionClass_Check(exc_type))) {
-            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
-        } else if (likely(PyTuple_Check(exc_type))) {
-            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
-        } else {
+static PyObject *
+__Pyx_Coroutine_get_frame(__pyx_CoroutineObject *self, void *context)
+{
+    PyObject *frame = self->gi_frame;
+    CYTHON_UNUSED_VAR(context);
+    if (!frame) {
+        if (unlikely(!self->gi_code)) {
+            Py_RETURN_NONE;
         }
+        frame = (PyObject *) PyFrame_New(
+            PyThreadState_Get(),            /*PyThreadState *tstate,*/
+            (PyCodeObject*) self->gi_code,  /*PyCodeObject *code,*/
+            __pyx_d,                 /*PyObject *globals,*/
+            0                               /*PyObject *locals*/
+        );
+        if (unlikely(!frame))
+            return NULL;
+        self->gi_frame = frame;
     }
-    return PyErr_GivenExceptionMatches(err, exc_type);
+    Py_INCREF(frame);
+    return frame;
 }
-static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
-    assert(PyExceptionClass_Check(exc_type1));
-    assert(PyExceptionClass_Check(exc_type2));
-    if (likely(err == exc_type1 || err == exc_type2)) return 1;
-    if (likely(PyExceptionClass_Check(err))) {
-        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+static __pyx_CoroutineObject *__Pyx__Coroutine_New(
+            PyTypeObject* type, __pyx_coroutine_body_t body, PyObject *code, PyObject *closure,
+            PyObject *name, PyObject *qualname, PyObject *module_name) {
+    __pyx_CoroutineObject *gen = PyObject_GC_New(__pyx_CoroutineObject, type);
+    if (unlikely(!gen))
+        return NULL;
+    return __Pyx__Coroutine_NewInit(gen, body, code, closure, name, qualname, module_name);
+}
+static __pyx_CoroutineObject *__Pyx__Coroutine_NewInit(
+            __pyx_CoroutineObject *gen, __pyx_coroutine_body_t body, PyObject *code, PyObject *closure,
+            PyObject *name, PyObject *qualname, PyObject *module_name) {
+    gen->body = body;
+    gen->closure = closure;
+    Py_XINCREF(closure);
+    gen->is_running = 0;
+    gen->resume_label = 0;
+    gen->classobj = NULL;
+    gen->yieldfrom = NULL;
+    #if PY_VERSION_HEX >= 0x030B00a4
+    gen->gi_exc_state.exc_value = NULL;
+    #else
+    gen->gi_exc_state.exc_type = NULL;
+    gen->gi_exc_state.exc_value = NULL;
+    gen->gi_exc_state.exc_traceback = NULL;
+    #endif
+#if CYTHON_USE_EXC_INFO_STACK
+    gen->gi_exc_state.previous_item = NULL;
+#endif
+    gen->gi_weakreflist = NULL;
+    Py_XINCREF(qualname);
+    gen->gi_qualname = qualname;
+    Py_XINCREF(name);
+    gen->gi_name = name;
+    Py_XINCREF(module_name);
+    gen->gi_modulename = module_name;
+    Py_XINCREF(code);
+    gen->gi_code = code;
+    gen->gi_frame = NULL;
+    PyObject_GC_Track(gen);
+    return gen;
+}
+
+/* PatchModuleWithCoroutine */
+static PyObject* __Pyx_Coroutine_patch_module(PyObject* module, const char* py_code) {
+#if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+    int result;
+    PyObject *globals, *result_obj;
+    globals = PyDict_New();  if (unlikely(!globals)) goto ignore;
+    result = PyDict_SetItemString(globals, "_cython_coroutine_type",
+    #ifdef __Pyx_Coroutine_USED
+        (PyObject*)__pyx_CoroutineType);
+    #else
+        Py_None);
+    #endif
+    if (unlikely(result < 0)) goto ignore;
+    result = PyDict_SetItemString(globals, "_cython_generator_type",
+    #ifdef __Pyx_Generator_USED
+        (PyObject*)__pyx_GeneratorType);
+    #else
+        Py_None);
+    #endif
+    if (unlikely(result < 0)) goto ignore;
+    if (unlikely(PyDict_SetItemString(globals, "_module", module) < 0)) goto ignore;
+    if (unlikely(PyDict_SetItemString(globals, "__builtins__", __pyx_b) < 0)) goto ignore;
+    result_obj = PyRun_String(py_code, Py_file_input, globals, globals);
+    if (unlikely(!result_obj)) goto ignore;
+    Py_DECREF(result_obj);
+    Py_DECREF(globals);
+    return module;
+ignore:
+    Py_XDECREF(globals);
+    PyErr_WriteUnraisable(module);
+    if (unlikely(PyErr_WarnEx(PyExc_RuntimeWarning, "Cython module failed to patch module with custom type", 1) < 0)) {
+        Py_DECREF(module);
+        module = NULL;
     }
-    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+#else
+    py_code++;
+#endif
+    return module;
+}
+
+/* PatchGeneratorABC */
+#ifndef CYTHON_REGISTER_ABCS
+#define CYTHON_REGISTER_ABCS 1
+#endif
+#if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+static PyObject* __Pyx_patch_abc_module(PyObject *module);
+static PyObject* __Pyx_patch_abc_module(PyObject *module) {
+    module = __Pyx_Coroutine_patch_module(
+        module, ""
+"if _cython_generator_type is not None:\n"
+"    try: Generator = _module.Generator\n"
+"    except AttributeError: pass\n"
+"    else: Generator.register(_cython_generator_type)\n"
+"if _cython_coroutine_type is not None:\n"
+"    try: Coroutine = _module.Coroutine\n"
+"    except AttributeError: pass\n"
+"    else: Coroutine.register(_cython_coroutine_type)\n"
+    );
+    return module;
+}
+#endif
+static int __Pyx_patch_abc(void) {
+#if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
+    static int abc_patched = 0;
+    if (CYTHON_REGISTER_ABCS && !abc_patched) {
+        PyObject *module;
+        module = PyImport_ImportModule((PY_MAJOR_VERSION >= 3) ? "collections.abc" : "collections");
+        if (unlikely(!module)) {
+            PyErr_WriteUnraisable(NULL);
+            if (unlikely(PyErr_WarnEx(PyExc_RuntimeWarning,
+                    ((PY_MAJOR_VERSION >= 3) ?
+                        "Cython module failed to register with collections.abc module" :
+                        "Cython module failed to register with collections module"), 1) < 0)) {
+                return -1;
+            }
+        } else {
+            module = __Pyx_patch_abc_module(module);
+            abc_patched = 1;
+            if (unlikely(!module))
+                return -1;
+            Py_DECREF(module);
+        }
+        module = PyImport_ImportModule("backports_abc");
+        if (module) {
+            module = __Pyx_patch_abc_module(module);
+            Py_XDECREF(module);
+        }
+        if (!module) {
+            PyErr_Clear();
+        }
+    }
+#else
+    if ((0)) __Pyx_Coroutine_patch_module(NULL, NULL);
+#endif
+    return 0;
 }
+
+/* Generator */
+static PyMethodDef __pyx_Generator_methods[] = {
+    {"send", (PyCFunction) __Pyx_Coroutine_Send, METH_O,
+     (char*) PyDoc_STR("send(arg) -> send 'arg' into generator,\nreturn next yielded value or raise StopIteration.")},
+    {"throw", (PyCFunction) __Pyx_Coroutine_Throw, METH_VARARGS,
+     (char*) PyDoc_STR("throw(typ[,val[,tb]]) -> raise exception in generator,\nreturn next yielded value or raise StopIteration.")},
+    {"close", (PyCFunction) __Pyx_Coroutine_Close_Method, METH_NOARGS,
+     (char*) PyDoc_STR("close() -> raise GeneratorExit inside generator.")},
+    {0, 0, 0, 0}
+};
+static PyMemberDef __pyx_Generator_memberlist[] = {
+    {(char *) "gi_running", T_BOOL, offsetof(__pyx_CoroutineObject, is_running), READONLY, NULL},
+    {(char*) "gi_yieldfrom", T_OBJECT, offsetof(__pyx_CoroutineObject, yieldfrom), READONLY,
+     (char*) PyDoc_STR("object being iterated by 'yield from', or None")},
+    {(char*) "gi_code", T_OBJECT, offsetof(__pyx_CoroutineObject, gi_code), READONLY, NULL},
+    {(char *) "__module__", T_OBJECT, offsetof(__pyx_CoroutineObject, gi_modulename), 0, 0},
+#if CYTHON_USE_TYPE_SPECS
+    {(char *) "__weaklistoffset__", T_PYSSIZET, offsetof(__pyx_CoroutineObject, gi_weakreflist), READONLY, 0},
+#endif
+    {0, 0, 0, 0, 0}
+};
+static PyGetSetDef __pyx_Generator_getsets[] = {
+    {(char *) "__name__", (getter)__Pyx_Coroutine_get_name, (setter)__Pyx_Coroutine_set_name,
+     (char*) PyDoc_STR("name of the generator"), 0},
+    {(char *) "__qualname__", (getter)__Pyx_Coroutine_get_qualname, (setter)__Pyx_Coroutine_set_qualname,
+     (char*) PyDoc_STR("qualified name of the generator"), 0},
+    {(char *) "gi_frame", (getter)__Pyx_Coroutine_get_frame, NULL,
+     (char*) PyDoc_STR("Frame of the generator"), 0},
+    {0, 0, 0, 0, 0}
+};
+#if CYTHON_USE_TYPE_SPECS
+static PyType_Slot __pyx_GeneratorType_slots[] = {
+    {Py_tp_dealloc, (void *)__Pyx_Coroutine_dealloc},
+    {Py_tp_traverse, (void *)__Pyx_Coroutine_traverse},
+    {Py_tp_iter, (void *)PyObject_SelfIter},
+    {Py_tp_iternext, (void *)__Pyx_Generator_Next},
+    {Py_tp_methods, (void *)__pyx_Generator_methods},
+    {Py_tp_members, (void *)__pyx_Generator_memberlist},
+    {Py_tp_getset, (void *)__pyx_Generator_getsets},
+    {Py_tp_getattro, (void *) __Pyx_PyObject_GenericGetAttrNoDict},
+#if CYTHON_USE_TP_FINALIZE
+    {Py_tp_finalize, (void *)__Pyx_Coroutine_del},
+#endif
+    {0, 0},
+};
+static PyType_Spec __pyx_GeneratorType_spec = {
+    __PYX_TYPE_MODULE_PREFIX "generator",
+    sizeof(__pyx_CoroutineObject),
+    0,
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_HAVE_FINALIZE,
+    __pyx_GeneratorType_slots
+};
+#else
+static PyTypeObject __pyx_GeneratorType_type = {
+    PyVarObject_HEAD_INIT(0, 0)
+    __PYX_TYPE_MODULE_PREFIX "generator",
+    sizeof(__pyx_CoroutineObject),
+    0,
+    (destructor) __Pyx_Coroutine_dealloc,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_HAVE_FINALIZE,
+    0,
+    (traverseproc) __Pyx_Coroutine_traverse,
+    0,
+    0,
+    offsetof(__pyx_CoroutineObject, gi_weakreflist),
+    0,
+    (iternextfunc) __Pyx_Generator_Next,
+    __pyx_Generator_methods,
+    __pyx_Generator_memberlist,
+    __pyx_Generator_getsets,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+#if CYTHON_USE_TP_FINALIZE
+    0,
+#else
+    __Pyx_Coroutine_del,
+#endif
+    0,
+#if CYTHON_USE_TP_FINALIZE
+    __Pyx_Coroutine_del,
+#elif PY_VERSION_HEX >= 0x030400a1
+    0,
+#endif
+#if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
+    0,
+#endif
+#if __PYX_NEED_TP_PRINT_SLOT
+    0,
+#endif
+#if PY_VERSION_HEX >= 0x030C0000
+    0,
 #endif
+#if PY_VERSION_HEX >= 0x030d00A4
+    0,
+#endif
+#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+    0,
+#endif
+};
+#endif
+static int __pyx_Generator_init(PyObject *module) {
+#if CYTHON_USE_TYPE_SPECS
+    __pyx_GeneratorType = __Pyx_FetchCommonTypeFromSpec(module, &__pyx_GeneratorType_spec, NULL);
+#else
+    CYTHON_UNUSED_VAR(module);
+    __pyx_GeneratorType_type.tp_getattro = __Pyx_PyObject_GenericGetAttrNoDict;
+    __pyx_GeneratorType_type.tp_iter = PyObject_SelfIter;
+    __pyx_GeneratorType = __Pyx_FetchCommonType(&__pyx_GeneratorType_type);
+#endif
+    if (unlikely(!__pyx_GeneratorType)) {
+        return -1;
+    }
+    return 0;
+}
 
 /* CheckBinaryVersion */
 static unsigned long __Pyx_get_runtime_version(void) {
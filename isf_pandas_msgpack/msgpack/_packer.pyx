@@ -2,10 +2,14 @@
 #cython: embedsignature=True
 
 from cpython cimport *
+from cpython.memoryview cimport PyMemoryView_FromMemory
+from cpython.buffer cimport PyBUF_READ
 from libc.stdlib cimport *
 from libc.string cimport *
 from libc.limits cimport *
 
+import os
+
 from .exceptions import PackValueError
 from . import ExtType
 
@@ -35,6 +39,52 @@ cdef extern from "../includes/pack.h":
     int msgpack_pack_ext(msgpack_packer* pk, char typecode, size_t l)
 
 cdef int DEFAULT_RECURSE_LIMIT=511
+cdef size_t DEFAULT_FLUSH_THRESHOLD=1024 * 1024
+cdef Py_ssize_t IOV_MAX=1024
+
+# map key of the bin entry padding the ext value that follows it
+PAD_KEY = u'__pad__'
+cdef char _zeros[256]
+
+
+cdef inline size_t _raw_header_size(size_t l, bint use_bin_type):
+    if l < 32:
+        return 1
+    elif use_bin_type and l < 256:
+        return 2
+    elif l < 65536:
+        return 3
+    return 5
+
+
+cdef inline size_t _ext_header_size(size_t l):
+    if l == 1 or l == 2 or l == 4 or l == 8 or l == 16:
+        return 2
+    elif l < 256:
+        return 3
+    elif l < 65536:
+        return 4
+    return 6
+
+
+def _writev(int fd, list segments):
+    """Write all of *segments* to *fd*, with `os.writev` where available."""
+    cdef Py_ssize_t i = 0, n
+    views = [memoryview(s).cast('B') for s in segments]
+    if not hasattr(os, 'writev'):
+        for view in views:
+            while len(view):
+                n = os.write(fd, view)
+                view = view[n:]
+        return
+    while i < len(views):
+        n = os.writev(fd, views[i:i + IOV_MAX])
+        # writev may stop short, resume from where it did
+        while i < len(views) and n >= len(views[i]):
+            n -= len(views[i])
+            i += 1
+        if n:
+            views[i] = views[i][n:]
 
 
 cdef class Packer(object):
@@ -66,6 +116,32 @@ cdef class Packer(object):
     :param bool use_bin_type:
         Use bin type introduced in msgpack spec 2.0 for bytes.
         It also enable str8 type for unicode.
+    :param stream:
+        File-like object having `.write(b)` method, or a file descriptor.
+        If specified, packed data is written to it instead of being
+        returned, whenever the internal buffer grows past
+        *flush_threshold* and at the end of every `pack` call.
+        Ext bodies of at least *flush_threshold* bytes are written
+        straight from their own buffer without being copied; for a file
+        descriptor they are gathered with the packed data in between and
+        written with a single `os.writev`.
+    :param int flush_threshold:
+        Buffer size in bytes at which to write to *stream*, and the ext
+        body size from which bodies are referenced instead of copied.
+        (default: 1MB)
+
+    :param int align:
+        If nonzero, start the body of every ext value of at least *align*
+        bytes in a map on an *align*-byte boundary of the output, by
+        inserting a `__pad__` bin entry in front of it. Readers that
+        ignore unknown map keys are unaffected. Requires *use_bin_type*
+        and *align* <= 256. (default: 0)
+    :param int offset:
+        Position of the output in the stream it ends up in, used for
+        *align* and :meth:`tell`. (default: 0)
+
+    Ext bodies may be any C-contiguous object supporting the buffer
+    protocol. See also :meth:`pack_segments`.
     """
     cdef msgpack_packer pk
     cdef object _default
@@ -75,6 +151,13 @@ cdef class Packer(object):
     cdef char *unicode_errors
     cdef bool use_float
     cdef bint autoreset
+    cdef object stream
+    cdef size_t flush_threshold
+    # output gathered for writev or pack_segments, None when not gathering
+    cdef list segments
+    cdef size_t align
+    # bytes emitted so far, plus offset
+    cdef size_t written
 
     def __cinit__(self):
         cdef int buf_size = 1024 * 1024
@@ -86,9 +169,22 @@ cdef class Packer(object):
 
     def __init__(self, default=None, encoding='utf-8',
                  unicode_errors='strict', use_single_float=False,
-                 bint autoreset=1, bint use_bin_type=0):
+                 bint autoreset=1, bint use_bin_type=0,
+                 stream=None, size_t flush_threshold=DEFAULT_FLUSH_THRESHOLD,
+                 size_t align=0, size_t offset=0):
         """
         """
+        if align:
+            if not use_bin_type:
+                raise ValueError("align requires use_bin_type.")
+            if align > 256:
+                raise ValueError("align must be at most 256.")
+        self.align = align
+        self.written = offset
+        self.stream = stream
+        self.flush_threshold = flush_threshold
+        if isinstance(stream, int):
+            self.segments = []
         self.use_float = use_single_float
         self.autoreset = autoreset
         self.pk.use_bin_type = use_bin_type
@@ -114,8 +210,74 @@ cdef class Packer(object):
     def __dealloc__(self):
         free(self.pk.buf);
 
+    cdef _write(self, object data, size_t length):
+        if self.segments is not None:
+            self.segments.append(data)
+        else:
+            self.stream.write(data)
+        self.written += length
+
+    cdef _flush(self):
+        if self.segments is not None:
+            if self.pk.length:
+                # the buffer is reused, so gathered data has to be copied
+                self.segments.append(self._take())
+            if self.stream is not None:
+                _writev(self.stream, self.segments)
+                del self.segments[:]
+        elif self.pk.length:
+            self.stream.write(PyMemoryView_FromMemory(
+                self.pk.buf, self.pk.length, PyBUF_READ))
+            self.written += self.pk.length
+            self.pk.length = 0
+
+    cdef _take(self):
+        buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
+        self.written += self.pk.length
+        self.pk.length = 0
+        return buf
+
+    def tell(self):
+        """Return the position in the output the next object starts at."""
+        return self.written + self.pk.length
+
+    cdef bint _aligns(self, object k, object v):
+        return (self.align and isinstance(v, ExtType) and
+                PyUnicode_Check(k) and
+                len(memoryview(v.data).cast('B')) >= self.align)
+
+    cdef int _pack_padding(self, object k, object v) except -1:
+        cdef size_t L = len(memoryview(v.data).cast('B'))
+        cdef size_t key_len, pad_key_len, pad
+        cdef int ret
+        cdef bytes key = PyUnicode_AsEncodedString(k, self.encoding,
+                                                   self.unicode_errors)
+        cdef bytes pad_key = PyUnicode_AsEncodedString(
+            PAD_KEY, self.encoding, self.unicode_errors)
+        key_len = len(key) + _raw_header_size(len(key), 1)
+        pad_key_len = len(pad_key) + _raw_header_size(len(pad_key), 1)
+        # the pad is a bin8, with a 2 byte header
+        pad = (self.align - (self.tell() + pad_key_len + 2 + key_len +
+                             _ext_header_size(L)) % self.align) % self.align
+        ret = self._pack(PAD_KEY)
+        if ret == 0:
+            ret = msgpack_pack_bin(&self.pk, pad)
+        if ret == 0:
+            ret = msgpack_pack_raw_body(&self.pk, _zeros, pad)
+        return ret
+
+    cdef inline bint _streaming(self):
+        return self.stream is not None or self.segments is not None
+
+    def flush(self):
+        """Write buffer content to `stream` and clear buffer."""
+        if self.stream is None:
+            raise TypeError("Packer has no stream to flush to.")
+        self._flush()
+
     cdef int _pack(self, object o,
-                   int nest_limit=DEFAULT_RECURSE_LIMIT) except -1:
+                   int nest_limit=DEFAULT_RECURSE_LIMIT,
+                   bint encoded=0) except -1:
         cdef long long llval
         cdef unsigned long long ullval
         cdef long longval
@@ -126,10 +288,15 @@ cdef class Packer(object):
         cdef dict d
         cdef size_t L
         cdef int default_used = 0
+        cdef bint pad
+        cdef Py_buffer view
 
         if nest_limit < 0:
             raise PackValueError("recursion limit exceeded.")
 
+        if self._streaming() and self.pk.length >= self.flush_threshold:
+            self._flush()
+
         while True:
             if o is None:
                 ret = msgpack_pack_nil(&self.pk)
@@ -181,35 +348,61 @@ cdef class Packer(object):
             elif PyDict_CheckExact(o):
                 d = <dict>o
                 L = len(d)
+                # only the maps of default, and those in them, are padded,
+                # the maps of the caller are written as they are
+                encoded = encoded or default_used
+                pad = self.align and encoded
+                if pad:
+                    L += sum(self._aligns(k, v) for k, v in d.iteritems())
                 if L > (2**32) - 1:
                     raise ValueError("dict is too large")
                 ret = msgpack_pack_map(&self.pk, L)
                 if ret == 0:
                     for k, v in d.iteritems():
-                        ret = self._pack(k, nest_limit - 1)
+                        if pad and self._aligns(k, v):
+                            ret = self._pack_padding(k, v)
+                            if ret != 0: break
+                        ret = self._pack(k, nest_limit - 1, encoded)
                         if ret != 0: break
-                        ret = self._pack(v, nest_limit - 1)
+                        ret = self._pack(v, nest_limit - 1, encoded)
                         if ret != 0: break
             elif PyDict_Check(o):
                 L = len(o)
+                encoded = encoded or default_used
+                pad = self.align and encoded
+                if pad:
+                    L += sum(self._aligns(k, v) for k, v in o.items())
                 if L > (2**32) - 1:
                     raise ValueError("dict is too large")
                 ret = msgpack_pack_map(&self.pk, L)
                 if ret == 0:
                     for k, v in o.items():
-                        ret = self._pack(k, nest_limit - 1)
+                        if pad and self._aligns(k, v):
+                            ret = self._pack_padding(k, v)
+                            if ret != 0: break
+                        ret = self._pack(k, nest_limit - 1, encoded)
                         if ret != 0: break
-                        ret = self._pack(v, nest_limit - 1)
+                        ret = self._pack(v, nest_limit - 1, encoded)
                         if ret != 0: break
             elif isinstance(o, ExtType):
                 # This should be before Tuple because ExtType is namedtuple.
                 longval = o.code
-                rawval = o.data
-                L = len(o.data)
-                if L > (2**32) - 1:
-                    raise ValueError("EXT data is too large")
-                ret = msgpack_pack_ext(&self.pk, longval, L)
-                ret = msgpack_pack_raw_body(&self.pk, rawval, L)
+                PyObject_GetBuffer(o.data, &view, PyBUF_C_CONTIGUOUS)
+                try:
+                    L = view.len
+                    if L > (2**32) - 1:
+                        raise ValueError("EXT data is too large")
+                    ret = msgpack_pack_ext(&self.pk, longval, L)
+                    if ret == 0:
+                        if self._streaming() and L >= self.flush_threshold:
+                            # write large bodies from their own memory
+                            self._flush()
+                            self._write(o.data, L)
+                        else:
+                            ret = msgpack_pack_raw_body(
+                                &self.pk, <char*>view.buf, L)
+                finally:
+                    PyBuffer_Release(&view)
             elif PyTuple_Check(o) or PyList_Check(o):
                 L = len(o)
                 if L > (2**32) - 1:
@@ -217,7 +410,8 @@ cdef class Packer(object):
                 ret = msgpack_pack_array(&self.pk, L)
                 if ret == 0:
                     for v in o:
-                        ret = self._pack(v, nest_limit - 1)
+                        ret = self._pack(v, nest_limit - 1,
+                                         encoded or default_used)
                         if ret != 0: break
             elif not default_used and self._default:
                 o = self._default(o)
@@ -234,10 +428,29 @@ cdef class Packer(object):
             raise MemoryError
         elif ret:  # should not happen.
             raise TypeError
-        if self.autoreset:
-            buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
-            self.pk.length = 0
-            return buf
+        if self._streaming():
+            self._flush()
+        elif self.autoreset:
+            return self._take()
+
+    def pack_segments(self, object obj):
+        """
+        Pack *obj* and return it as a list of segments whose concatenation
+        is the packed data.
+
+        Segments are `bytes` holding packed data, with ext bodies of at
+        least *flush_threshold* bytes returned as the original objects
+        rather than copies. Can't be used with *stream*.
+        """
+        if self.stream is not None:
+            raise TypeError("pack_segments can't be used with a stream.")
+        self.segments = []
+        try:
+            self.pack(obj)
+            self._flush()
+            return self.segments
+        finally:
+            self.segments = None
 
     def pack_ext_type(self, typecode, data):
         msgpack_pack_ext(&self.pk, typecode, len(data))
@@ -251,10 +464,10 @@ cdef class Packer(object):
             raise MemoryError
         elif ret:  # should not happen
             raise TypeError
-        if self.autoreset:
-            buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
-            self.pk.length = 0
-            return buf
+        if self._streaming():
+            self._flush()
+        elif self.autoreset:
+            return self._take()
 
     def pack_map_header(self, size_t size):
         if size > (2**32) - 1:
@@ -264,10 +477,10 @@ cdef class Packer(object):
             raise MemoryError
         elif ret:  # should not happen
             raise TypeError
-        if self.autoreset:
-            buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
-            self.pk.length = 0
-            return buf
+        if self._streaming():
+            self._flush()
+        elif self.autoreset:
+            return self._take()
 
     def pack_map_pairs(self, object pairs):
         """
@@ -287,10 +500,10 @@ cdef class Packer(object):
             raise MemoryError
         elif ret:  # should not happen
             raise TypeError
-        if self.autoreset:
-            buf = PyBytes_FromStringAndSize(self.pk.buf, self.pk.length)
-            self.pk.length = 0
-            return buf
+        if self._streaming():
+            self._flush()
+        elif self.autoreset:
+            return self._take()
 
     def reset(self):
         """Clear internal buffer."""
@@ -1583,7 +1583,7 @@ struct __pyx_opt_args_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unpack
 struct __pyx_defaults;
 typedef struct __pyx_defaults __pyx_defaults;
 
-/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":386
+/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":419
  *             self.file_like = None
  * 
  *     cdef object _unpack(self, execute_fn execute,             # <<<<<<<<<<<<<<
@@ -1598,7 +1598,7 @@ struct __pyx_defaults {
   PyObject *__pyx_arg_ext_hook;
 };
 
-/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":174
+/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":176
  * 
  * 
  * cdef class Unpacker(object):             # <<<<<<<<<<<<<<
@@ -1623,6 +1623,9 @@ struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker {
   PyObject *encoding;
   PyObject *unicode_errors;
   size_t max_buffer_size;
+  Py_buffer view;
+  int has_view;
+  PyObject *source;
 };
 
 
@@ -2257,6 +2260,9 @@ static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
 
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_unsigned_char(unsigned char value);
+
 /* FormatTypeName.proto */
 #if CYTHON_COMPILING_IN_LIMITED_API
 typedef PyObject *__Pyx_TypeName;
@@ -2414,15 +2420,17 @@ static PyObject *__pyx_builtin_MemoryError;
 static PyObject *__pyx_builtin_AssertionError;
 static PyObject *__pyx_builtin_StopIteration;
 /* #### Code section: string_decls ### */
+static const char __pyx_k_B[] = "B";
 static const char __pyx_k_gc[] = "gc";
-static const char __pyx_k__16[] = ".";
-static const char __pyx_k__17[] = "";
-static const char __pyx_k__38[] = "?";
+static const char __pyx_k__18[] = ".";
+static const char __pyx_k__19[] = "";
+static const char __pyx_k__41[] = "?";
 static const char __pyx_k_buf[] = "buf";
 static const char __pyx_k_ctx[] = "ctx";
 static const char __pyx_k_obj[] = "obj";
 static const char __pyx_k_off[] = "off";
 static const char __pyx_k_ret[] = "ret";
+static const char __pyx_k_cast[] = "cast";
 static const char __pyx_k_cenc[] = "cenc";
 static const char __pyx_k_cerr[] = "cerr";
 static const char __pyx_k_data[] = "data";
@@ -2436,6 +2444,7 @@ static const char __pyx_k_test[] = "__test__";
 static const char __pyx_k_view[] = "view";
 static const char __pyx_k_ascii[] = "ascii";
 static const char __pyx_k_nread[] = "nread";
+static const char __pyx_k_buffer[] = "buffer";
 static const char __pyx_k_enable[] = "enable";
 static const char __pyx_k_encode[] = "encode";
 static const char __pyx_k_import[] = "__import__";
@@ -2463,6 +2472,7 @@ static const char __pyx_k_TypeError[] = "TypeError";
 static const char __pyx_k_file_like[] = "file_like";
 static const char __pyx_k_isenabled[] = "isenabled";
 static const char __pyx_k_list_hook[] = "list_hook";
+static const char __pyx_k_peek_type[] = "peek_type";
 static const char __pyx_k_pyx_state[] = "__pyx_state";
 static const char __pyx_k_read_size[] = "read_size";
 static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
@@ -2495,6 +2505,7 @@ static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
 static const char __pyx_k_UnpackValueError[] = "UnpackValueError";
 static const char __pyx_k_object_pairs_hook[] = "object_pairs_hook";
 static const char __pyx_k_read_array_header[] = "read_array_header";
+static const char __pyx_k_Unpacker_peek_type[] = "Unpacker.peek_type";
 static const char __pyx_k_asyncio_coroutines[] = "asyncio.coroutines";
 static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
 static const char __pyx_k_NotImplementedError[] = "NotImplementedError";
@@ -2516,12 +2527,14 @@ static const char __pyx_k_Cannot_decode_extended_type_with[] = "Cannot decode ex
 static const char __pyx_k_Unable_to_allocate_internal_buff[] = "Unable to allocate internal buffer.";
 static const char __pyx_k_Unable_to_enlarge_internal_buffe[] = "Unable to enlarge internal buffer.";
 static const char __pyx_k_encoding_should_be_bytes_or_unic[] = "encoding should be bytes or unicode";
+static const char __pyx_k_file_like_and_buffer_are_mutuall[] = "file_like and buffer are mutually exclusive.";
 static const char __pyx_k_isf_pandas_msgpack_msgpack__unpa[] = "isf_pandas_msgpack/msgpack/_unpacker.pyx";
 static const char __pyx_k_no_default___reduce___due_to_non[] = "no default __reduce__ due to non-trivial __cinit__";
 static const char __pyx_k_object_pairs_hook_and_object_hoo[] = "object_pairs_hook and object_hook are mutually exclusive.";
 static const char __pyx_k_object_pairs_hook_must_be_a_call[] = "object_pairs_hook must be a callable.";
 static const char __pyx_k_read_size_should_be_less_or_equa[] = "read_size should be less or equal to max_buffer_size";
 static const char __pyx_k_unicode_errors_should_be_bytes_o[] = "unicode_errors should be bytes or unicode";
+static const char __pyx_k_unpacker_feed_is_not_be_able_to_2[] = "unpacker.feed() is not be able to use with `buffer`.";
 static const char __pyx_k_isf_pandas_msgpack_msgpack__unpa_2[] = "isf_pandas_msgpack.msgpack._unpacker";
 /* #### Code section: decls ### */
 static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_default_read_extended_type(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_typecode, CYTHON_UNUSED PyObject *__pyx_v_data); /* proto */
@@ -2530,17 +2543,18 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_2unpackb(CYTH
 static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_4unpack(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_stream, PyObject *__pyx_v_object_hook, PyObject *__pyx_v_list_hook, int __pyx_v_use_list, PyObject *__pyx_v_encoding, PyObject *__pyx_v_unicode_errors, PyObject *__pyx_v_object_pairs_hook); /* proto */
 static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker___cinit__(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self); /* proto */
 static void __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_2__dealloc__(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self); /* proto */
-static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self, PyObject *__pyx_v_file_like, Py_ssize_t __pyx_v_read_size, int __pyx_v_use_list, PyObject *__pyx_v_object_hook, PyObject *__pyx_v_object_pairs_hook, PyObject *__pyx_v_list_hook, PyObject *__pyx_v_encoding, PyObject *__pyx_v_unicode_errors, int __pyx_v_max_buffer_size, PyObject *__pyx_v_ext_hook, Py_ssize_t __pyx_v_max_str_len, Py_ssize_t __pyx_v_max_bin_len, Py_ssize_t __pyx_v_max_array_len, Py_ssize_t __pyx_v_max_map_len, Py_ssize_t __pyx_v_max_ext_len); /* proto */
+static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self, PyObject *__pyx_v_file_like, Py_ssize_t __pyx_v_read_size, int __pyx_v_use_list, PyObject *__pyx_v_object_hook, PyObject *__pyx_v_object_pairs_hook, PyObject *__pyx_v_list_hook, PyObject *__pyx_v_encoding, PyObject *__pyx_v_unicode_errors, int __pyx_v_max_buffer_size, PyObject *__pyx_v_ext_hook, Py_ssize_t __pyx_v_max_str_len, Py_ssize_t __pyx_v_max_bin_len, Py_ssize_t __pyx_v_max_array_len, Py_ssize_t __pyx_v_max_map_len, Py_ssize_t __pyx_v_max_ext_len, PyObject *__pyx_v_buffer); /* proto */
 static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_6feed(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self, PyObject *__pyx_v_next_bytes); /* proto */
 static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_8read_bytes(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self, Py_ssize_t __pyx_v_nbytes); /* proto */
 static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_10unpack(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self, PyObject *__pyx_v_write_bytes); /* proto */
 static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_12skip(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self, PyObject *__pyx_v_write_bytes); /* proto */
 static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_14read_array_header(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self, PyObject *__pyx_v_write_bytes); /* proto */
 static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_16read_map_header(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self, PyObject *__pyx_v_write_bytes); /* proto */
-static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_18__iter__(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_20__next__(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_22__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_24__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_18peek_type(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_20__iter__(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_22__next__(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_24__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_26__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
 static PyObject *__pyx_tp_new_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 /* #### Code section: late_includes ### */
 /* #### Code section: module_state ### */
@@ -2667,6 +2681,7 @@ typedef struct {
   #endif
   PyTypeObject *__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker;
   PyObject *__pyx_n_s_AssertionError;
+  PyObject *__pyx_n_s_B;
   PyObject *__pyx_n_s_BufferFull;
   PyObject *__pyx_kp_s_Cannot_decode_extended_type_with;
   PyObject *__pyx_n_s_ExtType;
@@ -2686,19 +2701,22 @@ typedef struct {
   PyObject *__pyx_n_s_Unpacker___reduce_cython;
   PyObject *__pyx_n_s_Unpacker___setstate_cython;
   PyObject *__pyx_n_s_Unpacker_feed;
+  PyObject *__pyx_n_s_Unpacker_peek_type;
   PyObject *__pyx_n_s_Unpacker_read_array_header;
   PyObject *__pyx_n_s_Unpacker_read_bytes;
   PyObject *__pyx_n_s_Unpacker_read_map_header;
   PyObject *__pyx_n_s_Unpacker_skip;
   PyObject *__pyx_n_s_Unpacker_unpack;
   PyObject *__pyx_n_s_ValueError;
-  PyObject *__pyx_kp_u__16;
-  PyObject *__pyx_n_s__17;
-  PyObject *__pyx_n_s__38;
+  PyObject *__pyx_kp_u__18;
+  PyObject *__pyx_n_s__19;
+  PyObject *__pyx_n_s__41;
   PyObject *__pyx_n_s_ascii;
   PyObject *__pyx_n_s_asyncio_coroutines;
   PyObject *__pyx_n_s_buf;
   PyObject *__pyx_n_s_buf_len;
+  PyObject *__pyx_n_s_buffer;
+  PyObject *__pyx_n_s_cast;
   PyObject *__pyx_n_s_cenc;
   PyObject *__pyx_n_s_cerr;
   PyObject *__pyx_n_s_cline_in_traceback;
@@ -2715,6 +2733,7 @@ typedef struct {
   PyObject *__pyx_kp_s_ext_hook_must_be_a_callable;
   PyObject *__pyx_n_s_feed;
   PyObject *__pyx_n_s_file_like;
+  PyObject *__pyx_kp_s_file_like_and_buffer_are_mutuall;
   PyObject *__pyx_kp_s_file_like_read_must_be_a_callab;
   PyObject *__pyx_kp_u_gc;
   PyObject *__pyx_n_s_getstate;
@@ -2745,6 +2764,7 @@ typedef struct {
   PyObject *__pyx_kp_s_object_pairs_hook_must_be_a_call;
   PyObject *__pyx_n_s_off;
   PyObject *__pyx_n_s_packed;
+  PyObject *__pyx_n_s_peek_type;
   PyObject *__pyx_n_s_pybuff;
   PyObject *__pyx_n_s_pyx_state;
   PyObject *__pyx_n_s_pyx_vtable;
@@ -2772,6 +2792,7 @@ typedef struct {
   PyObject *__pyx_n_s_unpack;
   PyObject *__pyx_n_s_unpackb;
   PyObject *__pyx_kp_s_unpacker_feed_is_not_be_able_to;
+  PyObject *__pyx_kp_s_unpacker_feed_is_not_be_able_to_2;
   PyObject *__pyx_n_s_use_list;
   PyObject *__pyx_n_s_view;
   PyObject *__pyx_n_s_write_bytes;
@@ -2790,26 +2811,29 @@ typedef struct {
   PyObject *__pyx_tuple__13;
   PyObject *__pyx_tuple__14;
   PyObject *__pyx_tuple__15;
-  PyObject *__pyx_tuple__18;
+  PyObject *__pyx_tuple__16;
+  PyObject *__pyx_tuple__17;
   PyObject *__pyx_tuple__20;
   PyObject *__pyx_tuple__22;
   PyObject *__pyx_tuple__24;
   PyObject *__pyx_tuple__26;
   PyObject *__pyx_tuple__28;
   PyObject *__pyx_tuple__30;
-  PyObject *__pyx_tuple__34;
+  PyObject *__pyx_tuple__32;
   PyObject *__pyx_tuple__36;
-  PyObject *__pyx_codeobj__19;
+  PyObject *__pyx_tuple__39;
   PyObject *__pyx_codeobj__21;
   PyObject *__pyx_codeobj__23;
   PyObject *__pyx_codeobj__25;
   PyObject *__pyx_codeobj__27;
   PyObject *__pyx_codeobj__29;
   PyObject *__pyx_codeobj__31;
-  PyObject *__pyx_codeobj__32;
   PyObject *__pyx_codeobj__33;
+  PyObject *__pyx_codeobj__34;
   PyObject *__pyx_codeobj__35;
   PyObject *__pyx_codeobj__37;
+  PyObject *__pyx_codeobj__38;
+  PyObject *__pyx_codeobj__40;
 } __pyx_mstate;
 
 #if CYTHON_USE_MODULE_STATE
@@ -2858,6 +2882,7 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker);
   Py_CLEAR(clear_module_state->__pyx_type_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker);
   Py_CLEAR(clear_module_state->__pyx_n_s_AssertionError);
+  Py_CLEAR(clear_module_state->__pyx_n_s_B);
   Py_CLEAR(clear_module_state->__pyx_n_s_BufferFull);
   Py_CLEAR(clear_module_state->__pyx_kp_s_Cannot_decode_extended_type_with);
   Py_CLEAR(clear_module_state->__pyx_n_s_ExtType);
@@ -2877,19 +2902,22 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_Unpacker___reduce_cython);
   Py_CLEAR(clear_module_state->__pyx_n_s_Unpacker___setstate_cython);
   Py_CLEAR(clear_module_state->__pyx_n_s_Unpacker_feed);
+  Py_CLEAR(clear_module_state->__pyx_n_s_Unpacker_peek_type);
   Py_CLEAR(clear_module_state->__pyx_n_s_Unpacker_read_array_header);
   Py_CLEAR(clear_module_state->__pyx_n_s_Unpacker_read_bytes);
   Py_CLEAR(clear_module_state->__pyx_n_s_Unpacker_read_map_header);
   Py_CLEAR(clear_module_state->__pyx_n_s_Unpacker_skip);
   Py_CLEAR(clear_module_state->__pyx_n_s_Unpacker_unpack);
   Py_CLEAR(clear_module_state->__pyx_n_s_ValueError);
-  Py_CLEAR(clear_module_state->__pyx_kp_u__16);
-  Py_CLEAR(clear_module_state->__pyx_n_s__17);
-  Py_CLEAR(clear_module_state->__pyx_n_s__38);
+  Py_CLEAR(clear_module_state->__pyx_kp_u__18);
+  Py_CLEAR(clear_module_state->__pyx_n_s__19);
+  Py_CLEAR(clear_module_state->__pyx_n_s__41);
   Py_CLEAR(clear_module_state->__pyx_n_s_ascii);
   Py_CLEAR(clear_module_state->__pyx_n_s_asyncio_coroutines);
   Py_CLEAR(clear_module_state->__pyx_n_s_buf);
   Py_CLEAR(clear_module_state->__pyx_n_s_buf_len);
+  Py_CLEAR(clear_module_state->__pyx_n_s_buffer);
+  Py_CLEAR(clear_module_state->__pyx_n_s_cast);
   Py_CLEAR(clear_module_state->__pyx_n_s_cenc);
   Py_CLEAR(clear_module_state->__pyx_n_s_cerr);
   Py_CLEAR(clear_module_state->__pyx_n_s_cline_in_traceback);
@@ -2906,6 +2934,7 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_kp_s_ext_hook_must_be_a_callable);
   Py_CLEAR(clear_module_state->__pyx_n_s_feed);
   Py_CLEAR(clear_module_state->__pyx_n_s_file_like);
+  Py_CLEAR(clear_module_state->__pyx_kp_s_file_like_and_buffer_are_mutuall);
   Py_CLEAR(clear_module_state->__pyx_kp_s_file_like_read_must_be_a_callab);
   Py_CLEAR(clear_module_state->__pyx_kp_u_gc);
   Py_CLEAR(clear_module_state->__pyx_n_s_getstate);
@@ -2936,6 +2965,7 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_kp_s_object_pairs_hook_must_be_a_call);
   Py_CLEAR(clear_module_state->__pyx_n_s_off);
   Py_CLEAR(clear_module_state->__pyx_n_s_packed);
+  Py_CLEAR(clear_module_state->__pyx_n_s_peek_type);
   Py_CLEAR(clear_module_state->__pyx_n_s_pybuff);
   Py_CLEAR(clear_module_state->__pyx_n_s_pyx_state);
   Py_CLEAR(clear_module_state->__pyx_n_s_pyx_vtable);
@@ -2963,6 +2993,7 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_n_s_unpack);
   Py_CLEAR(clear_module_state->__pyx_n_s_unpackb);
   Py_CLEAR(clear_module_state->__pyx_kp_s_unpacker_feed_is_not_be_able_to);
+  Py_CLEAR(clear_module_state->__pyx_kp_s_unpacker_feed_is_not_be_able_to_2);
   Py_CLEAR(clear_module_state->__pyx_n_s_use_list);
   Py_CLEAR(clear_module_state->__pyx_n_s_view);
   Py_CLEAR(clear_module_state->__pyx_n_s_write_bytes);
@@ -2981,26 +3012,29 @@ static int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->__pyx_tuple__13);
   Py_CLEAR(clear_module_state->__pyx_tuple__14);
   Py_CLEAR(clear_module_state->__pyx_tuple__15);
-  Py_CLEAR(clear_module_state->__pyx_tuple__18);
+  Py_CLEAR(clear_module_state->__pyx_tuple__16);
+  Py_CLEAR(clear_module_state->__pyx_tuple__17);
   Py_CLEAR(clear_module_state->__pyx_tuple__20);
   Py_CLEAR(clear_module_state->__pyx_tuple__22);
   Py_CLEAR(clear_module_state->__pyx_tuple__24);
   Py_CLEAR(clear_module_state->__pyx_tuple__26);
   Py_CLEAR(clear_module_state->__pyx_tuple__28);
   Py_CLEAR(clear_module_state->__pyx_tuple__30);
-  Py_CLEAR(clear_module_state->__pyx_tuple__34);
+  Py_CLEAR(clear_module_state->__pyx_tuple__32);
   Py_CLEAR(clear_module_state->__pyx_tuple__36);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__19);
+  Py_CLEAR(clear_module_state->__pyx_tuple__39);
   Py_CLEAR(clear_module_state->__pyx_codeobj__21);
   Py_CLEAR(clear_module_state->__pyx_codeobj__23);
   Py_CLEAR(clear_module_state->__pyx_codeobj__25);
   Py_CLEAR(clear_module_state->__pyx_codeobj__27);
   Py_CLEAR(clear_module_state->__pyx_codeobj__29);
   Py_CLEAR(clear_module_state->__pyx_codeobj__31);
-  Py_CLEAR(clear_module_state->__pyx_codeobj__32);
   Py_CLEAR(clear_module_state->__pyx_codeobj__33);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__34);
   Py_CLEAR(clear_module_state->__pyx_codeobj__35);
   Py_CLEAR(clear_module_state->__pyx_codeobj__37);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__38);
+  Py_CLEAR(clear_module_state->__pyx_codeobj__40);
   return 0;
 }
 #endif
@@ -3027,6 +3061,7 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker);
   Py_VISIT(traverse_module_state->__pyx_type_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker);
   Py_VISIT(traverse_module_state->__pyx_n_s_AssertionError);
+  Py_VISIT(traverse_module_state->__pyx_n_s_B);
   Py_VISIT(traverse_module_state->__pyx_n_s_BufferFull);
   Py_VISIT(traverse_module_state->__pyx_kp_s_Cannot_decode_extended_type_with);
   Py_VISIT(traverse_module_state->__pyx_n_s_ExtType);
@@ -3046,19 +3081,22 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_Unpacker___reduce_cython);
   Py_VISIT(traverse_module_state->__pyx_n_s_Unpacker___setstate_cython);
   Py_VISIT(traverse_module_state->__pyx_n_s_Unpacker_feed);
+  Py_VISIT(traverse_module_state->__pyx_n_s_Unpacker_peek_type);
   Py_VISIT(traverse_module_state->__pyx_n_s_Unpacker_read_array_header);
   Py_VISIT(traverse_module_state->__pyx_n_s_Unpacker_read_bytes);
   Py_VISIT(traverse_module_state->__pyx_n_s_Unpacker_read_map_header);
   Py_VISIT(traverse_module_state->__pyx_n_s_Unpacker_skip);
   Py_VISIT(traverse_module_state->__pyx_n_s_Unpacker_unpack);
   Py_VISIT(traverse_module_state->__pyx_n_s_ValueError);
-  Py_VISIT(traverse_module_state->__pyx_kp_u__16);
-  Py_VISIT(traverse_module_state->__pyx_n_s__17);
-  Py_VISIT(traverse_module_state->__pyx_n_s__38);
+  Py_VISIT(traverse_module_state->__pyx_kp_u__18);
+  Py_VISIT(traverse_module_state->__pyx_n_s__19);
+  Py_VISIT(traverse_module_state->__pyx_n_s__41);
   Py_VISIT(traverse_module_state->__pyx_n_s_ascii);
   Py_VISIT(traverse_module_state->__pyx_n_s_asyncio_coroutines);
   Py_VISIT(traverse_module_state->__pyx_n_s_buf);
   Py_VISIT(traverse_module_state->__pyx_n_s_buf_len);
+  Py_VISIT(traverse_module_state->__pyx_n_s_buffer);
+  Py_VISIT(traverse_module_state->__pyx_n_s_cast);
   Py_VISIT(traverse_module_state->__pyx_n_s_cenc);
   Py_VISIT(traverse_module_state->__pyx_n_s_cerr);
   Py_VISIT(traverse_module_state->__pyx_n_s_cline_in_traceback);
@@ -3075,6 +3113,7 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_kp_s_ext_hook_must_be_a_callable);
   Py_VISIT(traverse_module_state->__pyx_n_s_feed);
   Py_VISIT(traverse_module_state->__pyx_n_s_file_like);
+  Py_VISIT(traverse_module_state->__pyx_kp_s_file_like_and_buffer_are_mutuall);
   Py_VISIT(traverse_module_state->__pyx_kp_s_file_like_read_must_be_a_callab);
   Py_VISIT(traverse_module_state->__pyx_kp_u_gc);
   Py_VISIT(traverse_module_state->__pyx_n_s_getstate);
@@ -3105,6 +3144,7 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_kp_s_object_pairs_hook_must_be_a_call);
   Py_VISIT(traverse_module_state->__pyx_n_s_off);
   Py_VISIT(traverse_module_state->__pyx_n_s_packed);
+  Py_VISIT(traverse_module_state->__pyx_n_s_peek_type);
   Py_VISIT(traverse_module_state->__pyx_n_s_pybuff);
   Py_VISIT(traverse_module_state->__pyx_n_s_pyx_state);
   Py_VISIT(traverse_module_state->__pyx_n_s_pyx_vtable);
@@ -3132,6 +3172,7 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_n_s_unpack);
   Py_VISIT(traverse_module_state->__pyx_n_s_unpackb);
   Py_VISIT(traverse_module_state->__pyx_kp_s_unpacker_feed_is_not_be_able_to);
+  Py_VISIT(traverse_module_state->__pyx_kp_s_unpacker_feed_is_not_be_able_to_2);
   Py_VISIT(traverse_module_state->__pyx_n_s_use_list);
   Py_VISIT(traverse_module_state->__pyx_n_s_view);
   Py_VISIT(traverse_module_state->__pyx_n_s_write_bytes);
@@ -3150,26 +3191,29 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
   Py_VISIT(traverse_module_state->__pyx_tuple__13);
   Py_VISIT(traverse_module_state->__pyx_tuple__14);
   Py_VISIT(traverse_module_state->__pyx_tuple__15);
-  Py_VISIT(traverse_module_state->__pyx_tuple__18);
+  Py_VISIT(traverse_module_state->__pyx_tuple__16);
+  Py_VISIT(traverse_module_state->__pyx_tuple__17);
   Py_VISIT(traverse_module_state->__pyx_tuple__20);
   Py_VISIT(traverse_module_state->__pyx_tuple__22);
   Py_VISIT(traverse_module_state->__pyx_tuple__24);
   Py_VISIT(traverse_module_state->__pyx_tuple__26);
   Py_VISIT(traverse_module_state->__pyx_tuple__28);
   Py_VISIT(traverse_module_state->__pyx_tuple__30);
-  Py_VISIT(traverse_module_state->__pyx_tuple__34);
+  Py_VISIT(traverse_module_state->__pyx_tuple__32);
   Py_VISIT(traverse_module_state->__pyx_tuple__36);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__19);
+  Py_VISIT(traverse_module_state->__pyx_tuple__39);
   Py_VISIT(traverse_module_state->__pyx_codeobj__21);
   Py_VISIT(traverse_module_state->__pyx_codeobj__23);
   Py_VISIT(traverse_module_state->__pyx_codeobj__25);
   Py_VISIT(traverse_module_state->__pyx_codeobj__27);
   Py_VISIT(traverse_module_state->__pyx_codeobj__29);
   Py_VISIT(traverse_module_state->__pyx_codeobj__31);
-  Py_VISIT(traverse_module_state->__pyx_codeobj__32);
   Py_VISIT(traverse_module_state->__pyx_codeobj__33);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__34);
   Py_VISIT(traverse_module_state->__pyx_codeobj__35);
   Py_VISIT(traverse_module_state->__pyx_codeobj__37);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__38);
+  Py_VISIT(traverse_module_state->__pyx_codeobj__40);
   return 0;
 }
 #endif
@@ -3296,6 +3340,7 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #endif
 #define __pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker __pyx_mstate_global->__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker
 #define __pyx_n_s_AssertionError __pyx_mstate_global->__pyx_n_s_AssertionError
+#define __pyx_n_s_B __pyx_mstate_global->__pyx_n_s_B
 #define __pyx_n_s_BufferFull __pyx_mstate_global->__pyx_n_s_BufferFull
 #define __pyx_kp_s_Cannot_decode_extended_type_with __pyx_mstate_global->__pyx_kp_s_Cannot_decode_extended_type_with
 #define __pyx_n_s_ExtType __pyx_mstate_global->__pyx_n_s_ExtType
@@ -3315,19 +3360,22 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_Unpacker___reduce_cython __pyx_mstate_global->__pyx_n_s_Unpacker___reduce_cython
 #define __pyx_n_s_Unpacker___setstate_cython __pyx_mstate_global->__pyx_n_s_Unpacker___setstate_cython
 #define __pyx_n_s_Unpacker_feed __pyx_mstate_global->__pyx_n_s_Unpacker_feed
+#define __pyx_n_s_Unpacker_peek_type __pyx_mstate_global->__pyx_n_s_Unpacker_peek_type
 #define __pyx_n_s_Unpacker_read_array_header __pyx_mstate_global->__pyx_n_s_Unpacker_read_array_header
 #define __pyx_n_s_Unpacker_read_bytes __pyx_mstate_global->__pyx_n_s_Unpacker_read_bytes
 #define __pyx_n_s_Unpacker_read_map_header __pyx_mstate_global->__pyx_n_s_Unpacker_read_map_header
 #define __pyx_n_s_Unpacker_skip __pyx_mstate_global->__pyx_n_s_Unpacker_skip
 #define __pyx_n_s_Unpacker_unpack __pyx_mstate_global->__pyx_n_s_Unpacker_unpack
 #define __pyx_n_s_ValueError __pyx_mstate_global->__pyx_n_s_ValueError
-#define __pyx_kp_u__16 __pyx_mstate_global->__pyx_kp_u__16
-#define __pyx_n_s__17 __pyx_mstate_global->__pyx_n_s__17
-#define __pyx_n_s__38 __pyx_mstate_global->__pyx_n_s__38
+#define __pyx_kp_u__18 __pyx_mstate_global->__pyx_kp_u__18
+#define __pyx_n_s__19 __pyx_mstate_global->__pyx_n_s__19
+#define __pyx_n_s__41 __pyx_mstate_global->__pyx_n_s__41
 #define __pyx_n_s_ascii __pyx_mstate_global->__pyx_n_s_ascii
 #define __pyx_n_s_asyncio_coroutines __pyx_mstate_global->__pyx_n_s_asyncio_coroutines
 #define __pyx_n_s_buf __pyx_mstate_global->__pyx_n_s_buf
 #define __pyx_n_s_buf_len __pyx_mstate_global->__pyx_n_s_buf_len
+#define __pyx_n_s_buffer __pyx_mstate_global->__pyx_n_s_buffer
+#define __pyx_n_s_cast __pyx_mstate_global->__pyx_n_s_cast
 #define __pyx_n_s_cenc __pyx_mstate_global->__pyx_n_s_cenc
 #define __pyx_n_s_cerr __pyx_mstate_global->__pyx_n_s_cerr
 #define __pyx_n_s_cline_in_traceback __pyx_mstate_global->__pyx_n_s_cline_in_traceback
@@ -3344,6 +3392,7 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_kp_s_ext_hook_must_be_a_callable __pyx_mstate_global->__pyx_kp_s_ext_hook_must_be_a_callable
 #define __pyx_n_s_feed __pyx_mstate_global->__pyx_n_s_feed
 #define __pyx_n_s_file_like __pyx_mstate_global->__pyx_n_s_file_like
+#define __pyx_kp_s_file_like_and_buffer_are_mutuall __pyx_mstate_global->__pyx_kp_s_file_like_and_buffer_are_mutuall
 #define __pyx_kp_s_file_like_read_must_be_a_callab __pyx_mstate_global->__pyx_kp_s_file_like_read_must_be_a_callab
 #define __pyx_kp_u_gc __pyx_mstate_global->__pyx_kp_u_gc
 #define __pyx_n_s_getstate __pyx_mstate_global->__pyx_n_s_getstate
@@ -3374,6 +3423,7 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_kp_s_object_pairs_hook_must_be_a_call __pyx_mstate_global->__pyx_kp_s_object_pairs_hook_must_be_a_call
 #define __pyx_n_s_off __pyx_mstate_global->__pyx_n_s_off
 #define __pyx_n_s_packed __pyx_mstate_global->__pyx_n_s_packed
+#define __pyx_n_s_peek_type __pyx_mstate_global->__pyx_n_s_peek_type
 #define __pyx_n_s_pybuff __pyx_mstate_global->__pyx_n_s_pybuff
 #define __pyx_n_s_pyx_state __pyx_mstate_global->__pyx_n_s_pyx_state
 #define __pyx_n_s_pyx_vtable __pyx_mstate_global->__pyx_n_s_pyx_vtable
@@ -3401,6 +3451,7 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_n_s_unpack __pyx_mstate_global->__pyx_n_s_unpack
 #define __pyx_n_s_unpackb __pyx_mstate_global->__pyx_n_s_unpackb
 #define __pyx_kp_s_unpacker_feed_is_not_be_able_to __pyx_mstate_global->__pyx_kp_s_unpacker_feed_is_not_be_able_to
+#define __pyx_kp_s_unpacker_feed_is_not_be_able_to_2 __pyx_mstate_global->__pyx_kp_s_unpacker_feed_is_not_be_able_to_2
 #define __pyx_n_s_use_list __pyx_mstate_global->__pyx_n_s_use_list
 #define __pyx_n_s_view __pyx_mstate_global->__pyx_n_s_view
 #define __pyx_n_s_write_bytes __pyx_mstate_global->__pyx_n_s_write_bytes
@@ -3419,26 +3470,29 @@ static int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
 #define __pyx_tuple__13 __pyx_mstate_global->__pyx_tuple__13
 #define __pyx_tuple__14 __pyx_mstate_global->__pyx_tuple__14
 #define __pyx_tuple__15 __pyx_mstate_global->__pyx_tuple__15
-#define __pyx_tuple__18 __pyx_mstate_global->__pyx_tuple__18
+#define __pyx_tuple__16 __pyx_mstate_global->__pyx_tuple__16
+#define __pyx_tuple__17 __pyx_mstate_global->__pyx_tuple__17
 #define __pyx_tuple__20 __pyx_mstate_global->__pyx_tuple__20
 #define __pyx_tuple__22 __pyx_mstate_global->__pyx_tuple__22
 #define __pyx_tuple__24 __pyx_mstate_global->__pyx_tuple__24
 #define __pyx_tuple__26 __pyx_mstate_global->__pyx_tuple__26
 #define __pyx_tuple__28 __pyx_mstate_global->__pyx_tuple__28
 #define __pyx_tuple__30 __pyx_mstate_global->__pyx_tuple__30
-#define __pyx_tuple__34 __pyx_mstate_global->__pyx_tuple__34
+#define __pyx_tuple__32 __pyx_mstate_global->__pyx_tuple__32
 #define __pyx_tuple__36 __pyx_mstate_global->__pyx_tuple__36
-#define __pyx_codeobj__19 __pyx_mstate_global->__pyx_codeobj__19
+#define __pyx_tuple__39 __pyx_mstate_global->__pyx_tuple__39
 #define __pyx_codeobj__21 __pyx_mstate_global->__pyx_codeobj__21
 #define __pyx_codeobj__23 __pyx_mstate_global->__pyx_codeobj__23
 #define __pyx_codeobj__25 __pyx_mstate_global->__pyx_codeobj__25
 #define __pyx_codeobj__27 __pyx_mstate_global->__pyx_codeobj__27
 #define __pyx_codeobj__29 __pyx_mstate_global->__pyx_codeobj__29
 #define __pyx_codeobj__31 __pyx_mstate_global->__pyx_codeobj__31
-#define __pyx_codeobj__32 __pyx_mstate_global->__pyx_codeobj__32
 #define __pyx_codeobj__33 __pyx_mstate_global->__pyx_codeobj__33
+#define __pyx_codeobj__34 __pyx_mstate_global->__pyx_codeobj__34
 #define __pyx_codeobj__35 __pyx_mstate_global->__pyx_codeobj__35
 #define __pyx_codeobj__37 __pyx_mstate_global->__pyx_codeobj__37
+#define __pyx_codeobj__38 __pyx_mstate_global->__pyx_codeobj__38
+#define __pyx_codeobj__40 __pyx_mstate_global->__pyx_codeobj__40
 /* #### Code section: module_code ### */
 
 /* "cpython/complex.pxd":19
@@ -3734,7 +3788,7 @@ static CYTHON_INLINE PyObject *__pyx_f_7cpython_11contextvars_get_value_no_defau
   return __pyx_r;
 }
 
-/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":50
+/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":51
  *     object unpack_data(unpack_context* ctx)
  * 
  * cdef inline init_ctx(unpack_context *ctx,             # <<<<<<<<<<<<<<
@@ -3753,7 +3807,7 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("init_ctx", 1);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":57
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":58
  *                      Py_ssize_t max_array_len, Py_ssize_t max_map_len,
  *                      Py_ssize_t max_ext_len):
  *     unpack_init(ctx)             # <<<<<<<<<<<<<<
@@ -3762,36 +3816,45 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
  */
   unpack_init(__pyx_v_ctx);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":58
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":59
  *                      Py_ssize_t max_ext_len):
  *     unpack_init(ctx)
  *     ctx.user.use_list = use_list             # <<<<<<<<<<<<<<
  *     ctx.user.object_hook = ctx.user.list_hook = <PyObject*>NULL
- *     ctx.user.max_str_len = max_str_len
+ *     ctx.user.ext_source = <PyObject*>NULL
  */
   __pyx_v_ctx->user.use_list = __pyx_v_use_list;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":59
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":60
  *     unpack_init(ctx)
  *     ctx.user.use_list = use_list
  *     ctx.user.object_hook = ctx.user.list_hook = <PyObject*>NULL             # <<<<<<<<<<<<<<
+ *     ctx.user.ext_source = <PyObject*>NULL
  *     ctx.user.max_str_len = max_str_len
- *     ctx.user.max_bin_len = max_bin_len
  */
   __pyx_v_ctx->user.object_hook = ((PyObject *)NULL);
   __pyx_v_ctx->user.list_hook = ((PyObject *)NULL);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":60
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":61
  *     ctx.user.use_list = use_list
  *     ctx.user.object_hook = ctx.user.list_hook = <PyObject*>NULL
+ *     ctx.user.ext_source = <PyObject*>NULL             # <<<<<<<<<<<<<<
+ *     ctx.user.max_str_len = max_str_len
+ *     ctx.user.max_bin_len = max_bin_len
+ */
+  __pyx_v_ctx->user.ext_source = ((PyObject *)NULL);
+
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":62
+ *     ctx.user.object_hook = ctx.user.list_hook = <PyObject*>NULL
+ *     ctx.user.ext_source = <PyObject*>NULL
  *     ctx.user.max_str_len = max_str_len             # <<<<<<<<<<<<<<
  *     ctx.user.max_bin_len = max_bin_len
  *     ctx.user.max_array_len = max_array_len
  */
   __pyx_v_ctx->user.max_str_len = __pyx_v_max_str_len;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":61
- *     ctx.user.object_hook = ctx.user.list_hook = <PyObject*>NULL
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":63
+ *     ctx.user.ext_source = <PyObject*>NULL
  *     ctx.user.max_str_len = max_str_len
  *     ctx.user.max_bin_len = max_bin_len             # <<<<<<<<<<<<<<
  *     ctx.user.max_array_len = max_array_len
@@ -3799,7 +3862,7 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
  */
   __pyx_v_ctx->user.max_bin_len = __pyx_v_max_bin_len;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":62
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":64
  *     ctx.user.max_str_len = max_str_len
  *     ctx.user.max_bin_len = max_bin_len
  *     ctx.user.max_array_len = max_array_len             # <<<<<<<<<<<<<<
@@ -3808,7 +3871,7 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
  */
   __pyx_v_ctx->user.max_array_len = __pyx_v_max_array_len;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":63
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":65
  *     ctx.user.max_bin_len = max_bin_len
  *     ctx.user.max_array_len = max_array_len
  *     ctx.user.max_map_len = max_map_len             # <<<<<<<<<<<<<<
@@ -3817,7 +3880,7 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
  */
   __pyx_v_ctx->user.max_map_len = __pyx_v_max_map_len;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":64
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":66
  *     ctx.user.max_array_len = max_array_len
  *     ctx.user.max_map_len = max_map_len
  *     ctx.user.max_ext_len = max_ext_len             # <<<<<<<<<<<<<<
@@ -3826,7 +3889,7 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
  */
   __pyx_v_ctx->user.max_ext_len = __pyx_v_max_ext_len;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":66
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":68
  *     ctx.user.max_ext_len = max_ext_len
  * 
  *     if object_hook is not None and object_pairs_hook is not None:             # <<<<<<<<<<<<<<
@@ -3844,20 +3907,20 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
   __pyx_L4_bool_binop_done:;
   if (unlikely(__pyx_t_1)) {
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":67
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":69
  * 
  *     if object_hook is not None and object_pairs_hook is not None:
  *         raise TypeError("object_pairs_hook and object_hook "             # <<<<<<<<<<<<<<
  *                         "are mutually exclusive.")
  * 
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 67, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple_, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 69, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __PYX_ERR(0, 67, __pyx_L1_error)
+    __PYX_ERR(0, 69, __pyx_L1_error)
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":66
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":68
  *     ctx.user.max_ext_len = max_ext_len
  * 
  *     if object_hook is not None and object_pairs_hook is not None:             # <<<<<<<<<<<<<<
@@ -3866,7 +3929,7 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
  */
   }
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":70
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":72
  *                         "are mutually exclusive.")
  * 
  *     if object_hook is not None:             # <<<<<<<<<<<<<<
@@ -3876,7 +3939,7 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
   __pyx_t_1 = (__pyx_v_object_hook != Py_None);
   if (__pyx_t_1) {
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":71
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":73
  * 
  *     if object_hook is not None:
  *         if not PyCallable_Check(object_hook):             # <<<<<<<<<<<<<<
@@ -3886,20 +3949,20 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
     __pyx_t_1 = (!PyCallable_Check(__pyx_v_object_hook));
     if (unlikely(__pyx_t_1)) {
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":72
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":74
  *     if object_hook is not None:
  *         if not PyCallable_Check(object_hook):
  *             raise TypeError("object_hook must be a callable.")             # <<<<<<<<<<<<<<
  *         ctx.user.object_hook = <PyObject*>object_hook
  * 
  */
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 72, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 74, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __PYX_ERR(0, 72, __pyx_L1_error)
+      __PYX_ERR(0, 74, __pyx_L1_error)
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":71
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":73
  * 
  *     if object_hook is not None:
  *         if not PyCallable_Check(object_hook):             # <<<<<<<<<<<<<<
@@ -3908,7 +3971,7 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
  */
     }
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":73
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":75
  *         if not PyCallable_Check(object_hook):
  *             raise TypeError("object_hook must be a callable.")
  *         ctx.user.object_hook = <PyObject*>object_hook             # <<<<<<<<<<<<<<
@@ -3917,7 +3980,7 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
  */
     __pyx_v_ctx->user.object_hook = ((PyObject *)__pyx_v_object_hook);
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":70
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":72
  *                         "are mutually exclusive.")
  * 
  *     if object_hook is not None:             # <<<<<<<<<<<<<<
@@ -3926,7 +3989,7 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
  */
   }
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":75
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":77
  *         ctx.user.object_hook = <PyObject*>object_hook
  * 
  *     if object_pairs_hook is None:             # <<<<<<<<<<<<<<
@@ -3936,7 +3999,7 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
   __pyx_t_1 = (__pyx_v_object_pairs_hook == Py_None);
   if (__pyx_t_1) {
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":76
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":78
  * 
  *     if object_pairs_hook is None:
  *         ctx.user.has_pairs_hook = False             # <<<<<<<<<<<<<<
@@ -3945,7 +4008,7 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
  */
     __pyx_v_ctx->user.has_pairs_hook = 0;
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":75
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":77
  *         ctx.user.object_hook = <PyObject*>object_hook
  * 
  *     if object_pairs_hook is None:             # <<<<<<<<<<<<<<
@@ -3955,7 +4018,7 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
     goto __pyx_L8;
   }
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":78
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":80
  *         ctx.user.has_pairs_hook = False
  *     else:
  *         if not PyCallable_Check(object_pairs_hook):             # <<<<<<<<<<<<<<
@@ -3966,20 +4029,20 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
     __pyx_t_1 = (!PyCallable_Check(__pyx_v_object_pairs_hook));
     if (unlikely(__pyx_t_1)) {
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":79
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":81
  *     else:
  *         if not PyCallable_Check(object_pairs_hook):
  *             raise TypeError("object_pairs_hook must be a callable.")             # <<<<<<<<<<<<<<
  *         ctx.user.object_hook = <PyObject*>object_pairs_hook
  *         ctx.user.has_pairs_hook = True
  */
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 79, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 81, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __PYX_ERR(0, 79, __pyx_L1_error)
+      __PYX_ERR(0, 81, __pyx_L1_error)
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":78
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":80
  *         ctx.user.has_pairs_hook = False
  *     else:
  *         if not PyCallable_Check(object_pairs_hook):             # <<<<<<<<<<<<<<
@@ -3988,7 +4051,7 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
  */
     }
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":80
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":82
  *         if not PyCallable_Check(object_pairs_hook):
  *             raise TypeError("object_pairs_hook must be a callable.")
  *         ctx.user.object_hook = <PyObject*>object_pairs_hook             # <<<<<<<<<<<<<<
@@ -3997,7 +4060,7 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
  */
     __pyx_v_ctx->user.object_hook = ((PyObject *)__pyx_v_object_pairs_hook);
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":81
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":83
  *             raise TypeError("object_pairs_hook must be a callable.")
  *         ctx.user.object_hook = <PyObject*>object_pairs_hook
  *         ctx.user.has_pairs_hook = True             # <<<<<<<<<<<<<<
@@ -4008,7 +4071,7 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
   }
   __pyx_L8:;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":83
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":85
  *         ctx.user.has_pairs_hook = True
  * 
  *     if list_hook is not None:             # <<<<<<<<<<<<<<
@@ -4018,7 +4081,7 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
   __pyx_t_1 = (__pyx_v_list_hook != Py_None);
   if (__pyx_t_1) {
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":84
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":86
  * 
  *     if list_hook is not None:
  *         if not PyCallable_Check(list_hook):             # <<<<<<<<<<<<<<
@@ -4028,20 +4091,20 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
     __pyx_t_1 = (!PyCallable_Check(__pyx_v_list_hook));
     if (unlikely(__pyx_t_1)) {
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":85
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":87
  *     if list_hook is not None:
  *         if not PyCallable_Check(list_hook):
  *             raise TypeError("list_hook must be a callable.")             # <<<<<<<<<<<<<<
  *         ctx.user.list_hook = <PyObject*>list_hook
  * 
  */
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 85, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 87, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __PYX_ERR(0, 85, __pyx_L1_error)
+      __PYX_ERR(0, 87, __pyx_L1_error)
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":84
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":86
  * 
  *     if list_hook is not None:
  *         if not PyCallable_Check(list_hook):             # <<<<<<<<<<<<<<
@@ -4050,7 +4113,7 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
  */
     }
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":86
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":88
  *         if not PyCallable_Check(list_hook):
  *             raise TypeError("list_hook must be a callable.")
  *         ctx.user.list_hook = <PyObject*>list_hook             # <<<<<<<<<<<<<<
@@ -4059,7 +4122,7 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
  */
     __pyx_v_ctx->user.list_hook = ((PyObject *)__pyx_v_list_hook);
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":83
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":85
  *         ctx.user.has_pairs_hook = True
  * 
  *     if list_hook is not None:             # <<<<<<<<<<<<<<
@@ -4068,7 +4131,7 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
  */
   }
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":88
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":90
  *         ctx.user.list_hook = <PyObject*>list_hook
  * 
  *     if ext_hook is not None:             # <<<<<<<<<<<<<<
@@ -4078,7 +4141,7 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
   __pyx_t_1 = (__pyx_v_ext_hook != Py_None);
   if (__pyx_t_1) {
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":89
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":91
  * 
  *     if ext_hook is not None:
  *         if not PyCallable_Check(ext_hook):             # <<<<<<<<<<<<<<
@@ -4088,20 +4151,20 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
     __pyx_t_1 = (!PyCallable_Check(__pyx_v_ext_hook));
     if (unlikely(__pyx_t_1)) {
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":90
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":92
  *     if ext_hook is not None:
  *         if not PyCallable_Check(ext_hook):
  *             raise TypeError("ext_hook must be a callable.")             # <<<<<<<<<<<<<<
  *         ctx.user.ext_hook = <PyObject*>ext_hook
  * 
  */
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 90, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 92, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __PYX_ERR(0, 90, __pyx_L1_error)
+      __PYX_ERR(0, 92, __pyx_L1_error)
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":89
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":91
  * 
  *     if ext_hook is not None:
  *         if not PyCallable_Check(ext_hook):             # <<<<<<<<<<<<<<
@@ -4110,7 +4173,7 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
  */
     }
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":91
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":93
  *         if not PyCallable_Check(ext_hook):
  *             raise TypeError("ext_hook must be a callable.")
  *         ctx.user.ext_hook = <PyObject*>ext_hook             # <<<<<<<<<<<<<<
@@ -4119,7 +4182,7 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
  */
     __pyx_v_ctx->user.ext_hook = ((PyObject *)__pyx_v_ext_hook);
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":88
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":90
  *         ctx.user.list_hook = <PyObject*>list_hook
  * 
  *     if ext_hook is not None:             # <<<<<<<<<<<<<<
@@ -4128,7 +4191,7 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
  */
   }
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":93
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":95
  *         ctx.user.ext_hook = <PyObject*>ext_hook
  * 
  *     ctx.user.encoding = encoding             # <<<<<<<<<<<<<<
@@ -4137,7 +4200,7 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
  */
   __pyx_v_ctx->user.encoding = __pyx_v_encoding;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":94
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":96
  * 
  *     ctx.user.encoding = encoding
  *     ctx.user.unicode_errors = unicode_errors             # <<<<<<<<<<<<<<
@@ -4146,7 +4209,7 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
  */
   __pyx_v_ctx->user.unicode_errors = __pyx_v_unicode_errors;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":50
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":51
  *     object unpack_data(unpack_context* ctx)
  * 
  * cdef inline init_ctx(unpack_context *ctx,             # <<<<<<<<<<<<<<
@@ -4167,7 +4230,7 @@ static CYTHON_INLINE PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_
   return __pyx_r;
 }
 
-/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":97
+/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":99
  * 
  * 
  * def default_read_extended_type(typecode, data):             # <<<<<<<<<<<<<<
@@ -4232,7 +4295,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 97, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 99, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
         CYTHON_FALLTHROUGH;
         case  1:
@@ -4240,14 +4303,14 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[1]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 97, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 99, __pyx_L3_error)
         else {
-          __Pyx_RaiseArgtupleInvalid("default_read_extended_type", 1, 2, 2, 1); __PYX_ERR(0, 97, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("default_read_extended_type", 1, 2, 2, 1); __PYX_ERR(0, 99, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "default_read_extended_type") < 0)) __PYX_ERR(0, 97, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "default_read_extended_type") < 0)) __PYX_ERR(0, 99, __pyx_L3_error)
       }
     } else if (unlikely(__pyx_nargs != 2)) {
       goto __pyx_L5_argtuple_error;
@@ -4260,7 +4323,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("default_read_extended_type", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 97, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("default_read_extended_type", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 99, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -4297,31 +4360,31 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_default_read_
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("default_read_extended_type", 1);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":99
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":101
  * def default_read_extended_type(typecode, data):
  *     raise NotImplementedError("Cannot decode extended type "
  *                               "with typecode=%d" % typecode)             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_t_1 = __Pyx_PyString_FormatSafe(__pyx_kp_s_Cannot_decode_extended_type_with, __pyx_v_typecode); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyString_FormatSafe(__pyx_kp_s_Cannot_decode_extended_type_with, __pyx_v_typecode); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 101, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":98
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":100
  * 
  * def default_read_extended_type(typecode, data):
  *     raise NotImplementedError("Cannot decode extended type "             # <<<<<<<<<<<<<<
  *                               "with typecode=%d" % typecode)
  * 
  */
-  __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_builtin_NotImplementedError, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 98, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_builtin_NotImplementedError, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 100, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_Raise(__pyx_t_2, 0, 0, 0);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __PYX_ERR(0, 98, __pyx_L1_error)
+  __PYX_ERR(0, 100, __pyx_L1_error)
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":97
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":99
  * 
  * 
  * def default_read_extended_type(typecode, data):             # <<<<<<<<<<<<<<
@@ -4340,7 +4403,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_default_read_
   return __pyx_r;
 }
 
-/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":102
+/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":104
  * 
  * 
  * def unpackb(object packed, object object_hook=None, object list_hook=None,             # <<<<<<<<<<<<<<
@@ -4364,118 +4427,118 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_6__defaults__
   __Pyx_RefNannySetupContext("__defaults__", 1);
   __Pyx_XDECREF(__pyx_r);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":103
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":105
  * 
  * def unpackb(object packed, object object_hook=None, object list_hook=None,
  *             bint use_list=1, encoding=None, unicode_errors="strict",             # <<<<<<<<<<<<<<
  *             object_pairs_hook=None, ext_hook=ExtType,
  *             Py_ssize_t max_str_len=2147483647, # 2**32-1
  */
-  __pyx_t_1 = __Pyx_PyBool_FromLong(((int)1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 103, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyBool_FromLong(((int)1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 105, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":105
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":107
  *             bint use_list=1, encoding=None, unicode_errors="strict",
  *             object_pairs_hook=None, ext_hook=ExtType,
  *             Py_ssize_t max_str_len=2147483647, # 2**32-1             # <<<<<<<<<<<<<<
  *             Py_ssize_t max_bin_len=2147483647,
  *             Py_ssize_t max_array_len=2147483647,
  */
-  __pyx_t_2 = PyInt_FromSsize_t(((Py_ssize_t)0x7FFFFFFF)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 105, __pyx_L1_error)
+  __pyx_t_2 = PyInt_FromSsize_t(((Py_ssize_t)0x7FFFFFFF)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 107, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":106
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":108
  *             object_pairs_hook=None, ext_hook=ExtType,
  *             Py_ssize_t max_str_len=2147483647, # 2**32-1
  *             Py_ssize_t max_bin_len=2147483647,             # <<<<<<<<<<<<<<
  *             Py_ssize_t max_array_len=2147483647,
  *             Py_ssize_t max_map_len=2147483647,
  */
-  __pyx_t_3 = PyInt_FromSsize_t(((Py_ssize_t)0x7FFFFFFF)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 106, __pyx_L1_error)
+  __pyx_t_3 = PyInt_FromSsize_t(((Py_ssize_t)0x7FFFFFFF)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 108, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":107
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":109
  *             Py_ssize_t max_str_len=2147483647, # 2**32-1
  *             Py_ssize_t max_bin_len=2147483647,
  *             Py_ssize_t max_array_len=2147483647,             # <<<<<<<<<<<<<<
  *             Py_ssize_t max_map_len=2147483647,
  *             Py_ssize_t max_ext_len=2147483647):
  */
-  __pyx_t_4 = PyInt_FromSsize_t(((Py_ssize_t)0x7FFFFFFF)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 107, __pyx_L1_error)
+  __pyx_t_4 = PyInt_FromSsize_t(((Py_ssize_t)0x7FFFFFFF)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 109, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":108
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":110
  *             Py_ssize_t max_bin_len=2147483647,
  *             Py_ssize_t max_array_len=2147483647,
  *             Py_ssize_t max_map_len=2147483647,             # <<<<<<<<<<<<<<
  *             Py_ssize_t max_ext_len=2147483647):
  *     """
  */
-  __pyx_t_5 = PyInt_FromSsize_t(((Py_ssize_t)0x7FFFFFFF)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 108, __pyx_L1_error)
+  __pyx_t_5 = PyInt_FromSsize_t(((Py_ssize_t)0x7FFFFFFF)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 110, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":109
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":111
  *             Py_ssize_t max_array_len=2147483647,
  *             Py_ssize_t max_map_len=2147483647,
  *             Py_ssize_t max_ext_len=2147483647):             # <<<<<<<<<<<<<<
  *     """
  *     Unpack packed_bytes to object. Returns an unpacked object.
  */
-  __pyx_t_6 = PyInt_FromSsize_t(((Py_ssize_t)0x7FFFFFFF)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 109, __pyx_L1_error)
+  __pyx_t_6 = PyInt_FromSsize_t(((Py_ssize_t)0x7FFFFFFF)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 111, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":102
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":104
  * 
  * 
  * def unpackb(object packed, object object_hook=None, object list_hook=None,             # <<<<<<<<<<<<<<
  *             bint use_list=1, encoding=None, unicode_errors="strict",
  *             object_pairs_hook=None, ext_hook=ExtType,
  */
-  __pyx_t_7 = PyTuple_New(12); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 102, __pyx_L1_error)
+  __pyx_t_7 = PyTuple_New(12); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 104, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __Pyx_INCREF(Py_None);
   __Pyx_GIVEREF(Py_None);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 0, Py_None)) __PYX_ERR(0, 102, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 0, Py_None)) __PYX_ERR(0, 104, __pyx_L1_error);
   __Pyx_INCREF(Py_None);
   __Pyx_GIVEREF(Py_None);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 1, Py_None)) __PYX_ERR(0, 102, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 1, Py_None)) __PYX_ERR(0, 104, __pyx_L1_error);
   __Pyx_GIVEREF(__pyx_t_1);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 2, __pyx_t_1)) __PYX_ERR(0, 102, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 2, __pyx_t_1)) __PYX_ERR(0, 104, __pyx_L1_error);
   __Pyx_INCREF(Py_None);
   __Pyx_GIVEREF(Py_None);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 3, Py_None)) __PYX_ERR(0, 102, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 3, Py_None)) __PYX_ERR(0, 104, __pyx_L1_error);
   __Pyx_INCREF(((PyObject*)__pyx_n_s_strict));
   __Pyx_GIVEREF(((PyObject*)__pyx_n_s_strict));
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 4, ((PyObject*)__pyx_n_s_strict))) __PYX_ERR(0, 102, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 4, ((PyObject*)__pyx_n_s_strict))) __PYX_ERR(0, 104, __pyx_L1_error);
   __Pyx_INCREF(Py_None);
   __Pyx_GIVEREF(Py_None);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 5, Py_None)) __PYX_ERR(0, 102, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 5, Py_None)) __PYX_ERR(0, 104, __pyx_L1_error);
   __Pyx_INCREF(__Pyx_CyFunction_Defaults(__pyx_defaults, __pyx_self)->__pyx_arg_ext_hook);
   __Pyx_GIVEREF(__Pyx_CyFunction_Defaults(__pyx_defaults, __pyx_self)->__pyx_arg_ext_hook);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 6, __Pyx_CyFunction_Defaults(__pyx_defaults, __pyx_self)->__pyx_arg_ext_hook)) __PYX_ERR(0, 102, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 6, __Pyx_CyFunction_Defaults(__pyx_defaults, __pyx_self)->__pyx_arg_ext_hook)) __PYX_ERR(0, 104, __pyx_L1_error);
   __Pyx_GIVEREF(__pyx_t_2);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 7, __pyx_t_2)) __PYX_ERR(0, 102, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 7, __pyx_t_2)) __PYX_ERR(0, 104, __pyx_L1_error);
   __Pyx_GIVEREF(__pyx_t_3);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 8, __pyx_t_3)) __PYX_ERR(0, 102, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 8, __pyx_t_3)) __PYX_ERR(0, 104, __pyx_L1_error);
   __Pyx_GIVEREF(__pyx_t_4);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 9, __pyx_t_4)) __PYX_ERR(0, 102, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 9, __pyx_t_4)) __PYX_ERR(0, 104, __pyx_L1_error);
   __Pyx_GIVEREF(__pyx_t_5);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 10, __pyx_t_5)) __PYX_ERR(0, 102, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 10, __pyx_t_5)) __PYX_ERR(0, 104, __pyx_L1_error);
   __Pyx_GIVEREF(__pyx_t_6);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 11, __pyx_t_6)) __PYX_ERR(0, 102, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_7, 11, __pyx_t_6)) __PYX_ERR(0, 104, __pyx_L1_error);
   __pyx_t_1 = 0;
   __pyx_t_2 = 0;
   __pyx_t_3 = 0;
   __pyx_t_4 = 0;
   __pyx_t_5 = 0;
   __pyx_t_6 = 0;
-  __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 102, __pyx_L1_error)
+  __pyx_t_6 = PyTuple_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 104, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_GIVEREF(__pyx_t_7);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_7)) __PYX_ERR(0, 102, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_7)) __PYX_ERR(0, 104, __pyx_L1_error);
   __Pyx_INCREF(Py_None);
   __Pyx_GIVEREF(Py_None);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 1, Py_None)) __PYX_ERR(0, 102, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 1, Py_None)) __PYX_ERR(0, 104, __pyx_L1_error);
   __pyx_t_7 = 0;
   __pyx_r = __pyx_t_6;
   __pyx_t_6 = 0;
@@ -4553,7 +4616,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
     values[1] = __Pyx_Arg_NewRef_FASTCALL(((PyObject *)Py_None));
     values[2] = __Pyx_Arg_NewRef_FASTCALL(((PyObject *)Py_None));
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":103
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":105
  * 
  * def unpackb(object packed, object object_hook=None, object list_hook=None,
  *             bint use_list=1, encoding=None, unicode_errors="strict",             # <<<<<<<<<<<<<<
@@ -4563,7 +4626,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
     values[4] = __Pyx_Arg_NewRef_FASTCALL(((PyObject *)Py_None));
     values[5] = __Pyx_Arg_NewRef_FASTCALL(((PyObject *)((PyObject*)__pyx_n_s_strict)));
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":104
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":106
  * def unpackb(object packed, object object_hook=None, object list_hook=None,
  *             bint use_list=1, encoding=None, unicode_errors="strict",
  *             object_pairs_hook=None, ext_hook=ExtType,             # <<<<<<<<<<<<<<
@@ -4611,96 +4674,96 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 102, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 104, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
         CYTHON_FALLTHROUGH;
         case  1:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_object_hook);
           if (value) { values[1] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 102, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 104, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_list_hook);
           if (value) { values[2] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 102, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 104, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_use_list);
           if (value) { values[3] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 102, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 104, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  4:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_encoding);
           if (value) { values[4] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 102, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 104, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  5:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_unicode_errors);
           if (value) { values[5] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 102, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 104, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  6:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_object_pairs_hook);
           if (value) { values[6] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 102, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 104, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  7:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_ext_hook);
           if (value) { values[7] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 102, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 104, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  8:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_max_str_len);
           if (value) { values[8] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 102, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 104, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  9:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_max_bin_len);
           if (value) { values[9] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 102, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 104, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case 10:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_max_array_len);
           if (value) { values[10] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 102, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 104, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case 11:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_max_map_len);
           if (value) { values[11] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 102, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 104, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case 12:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_max_ext_len);
           if (value) { values[12] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 102, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 104, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "unpackb") < 0)) __PYX_ERR(0, 102, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "unpackb") < 0)) __PYX_ERR(0, 104, __pyx_L3_error)
       }
     } else {
       switch (__pyx_nargs) {
@@ -4737,7 +4800,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
     __pyx_v_object_hook = values[1];
     __pyx_v_list_hook = values[2];
     if (values[3]) {
-      __pyx_v_use_list = __Pyx_PyObject_IsTrue(values[3]); if (unlikely((__pyx_v_use_list == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 103, __pyx_L3_error)
+      __pyx_v_use_list = __Pyx_PyObject_IsTrue(values[3]); if (unlikely((__pyx_v_use_list == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 105, __pyx_L3_error)
     } else {
       __pyx_v_use_list = ((int)((int)1));
     }
@@ -4746,34 +4809,34 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
     __pyx_v_object_pairs_hook = values[6];
     __pyx_v_ext_hook = values[7];
     if (values[8]) {
-      __pyx_v_max_str_len = __Pyx_PyIndex_AsSsize_t(values[8]); if (unlikely((__pyx_v_max_str_len == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 105, __pyx_L3_error)
+      __pyx_v_max_str_len = __Pyx_PyIndex_AsSsize_t(values[8]); if (unlikely((__pyx_v_max_str_len == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 107, __pyx_L3_error)
     } else {
       __pyx_v_max_str_len = ((Py_ssize_t)((Py_ssize_t)0x7FFFFFFF));
     }
     if (values[9]) {
-      __pyx_v_max_bin_len = __Pyx_PyIndex_AsSsize_t(values[9]); if (unlikely((__pyx_v_max_bin_len == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 106, __pyx_L3_error)
+      __pyx_v_max_bin_len = __Pyx_PyIndex_AsSsize_t(values[9]); if (unlikely((__pyx_v_max_bin_len == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 108, __pyx_L3_error)
     } else {
       __pyx_v_max_bin_len = ((Py_ssize_t)((Py_ssize_t)0x7FFFFFFF));
     }
     if (values[10]) {
-      __pyx_v_max_array_len = __Pyx_PyIndex_AsSsize_t(values[10]); if (unlikely((__pyx_v_max_array_len == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 107, __pyx_L3_error)
+      __pyx_v_max_array_len = __Pyx_PyIndex_AsSsize_t(values[10]); if (unlikely((__pyx_v_max_array_len == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 109, __pyx_L3_error)
     } else {
       __pyx_v_max_array_len = ((Py_ssize_t)((Py_ssize_t)0x7FFFFFFF));
     }
     if (values[11]) {
-      __pyx_v_max_map_len = __Pyx_PyIndex_AsSsize_t(values[11]); if (unlikely((__pyx_v_max_map_len == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 108, __pyx_L3_error)
+      __pyx_v_max_map_len = __Pyx_PyIndex_AsSsize_t(values[11]); if (unlikely((__pyx_v_max_map_len == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 110, __pyx_L3_error)
     } else {
       __pyx_v_max_map_len = ((Py_ssize_t)((Py_ssize_t)0x7FFFFFFF));
     }
     if (values[12]) {
-      __pyx_v_max_ext_len = __Pyx_PyIndex_AsSsize_t(values[12]); if (unlikely((__pyx_v_max_ext_len == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 109, __pyx_L3_error)
+      __pyx_v_max_ext_len = __Pyx_PyIndex_AsSsize_t(values[12]); if (unlikely((__pyx_v_max_ext_len == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 111, __pyx_L3_error)
     } else {
       __pyx_v_max_ext_len = ((Py_ssize_t)((Py_ssize_t)0x7FFFFFFF));
     }
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("unpackb", 0, 1, 13, __pyx_nargs); __PYX_ERR(0, 102, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("unpackb", 0, 1, 13, __pyx_nargs); __PYX_ERR(0, 104, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -4789,7 +4852,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __pyx_L4_argument_unpacking_done:;
   __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_2unpackb(__pyx_self, __pyx_v_packed, __pyx_v_object_hook, __pyx_v_list_hook, __pyx_v_use_list, __pyx_v_encoding, __pyx_v_unicode_errors, __pyx_v_object_pairs_hook, __pyx_v_ext_hook, __pyx_v_max_str_len, __pyx_v_max_bin_len, __pyx_v_max_array_len, __pyx_v_max_map_len, __pyx_v_max_ext_len);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":102
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":104
  * 
  * 
  * def unpackb(object packed, object object_hook=None, object list_hook=None,             # <<<<<<<<<<<<<<
@@ -4836,7 +4899,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_2unpackb(CYTH
   __Pyx_INCREF(__pyx_v_encoding);
   __Pyx_INCREF(__pyx_v_unicode_errors);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":118
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":120
  *     """
  *     cdef unpack_context ctx
  *     cdef size_t off = 0             # <<<<<<<<<<<<<<
@@ -4845,7 +4908,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_2unpackb(CYTH
  */
   __pyx_v_off = 0;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":123
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":125
  *     cdef char* buf
  *     cdef Py_ssize_t buf_len
  *     cdef char* cenc = NULL             # <<<<<<<<<<<<<<
@@ -4854,7 +4917,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_2unpackb(CYTH
  */
   __pyx_v_cenc = NULL;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":124
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":126
  *     cdef Py_ssize_t buf_len
  *     cdef char* cenc = NULL
  *     cdef char* cerr = NULL             # <<<<<<<<<<<<<<
@@ -4863,31 +4926,31 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_2unpackb(CYTH
  */
   __pyx_v_cerr = NULL;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":128
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":130
  * 
  *     # PyObject_AsReadBuffer(packed, <const void**>&buf, &buf_len)
  *     if PyObject_GetBuffer(packed, &view, PyBUF_SIMPLE) < 0:             # <<<<<<<<<<<<<<
  *         raise ValueError("Unable to get buffer view")
  *     buf = <char*>view.buf
  */
-  __pyx_t_1 = PyObject_GetBuffer(__pyx_v_packed, (&__pyx_v_view), PyBUF_SIMPLE); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 128, __pyx_L1_error)
+  __pyx_t_1 = PyObject_GetBuffer(__pyx_v_packed, (&__pyx_v_view), PyBUF_SIMPLE); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 130, __pyx_L1_error)
   __pyx_t_2 = (__pyx_t_1 < 0);
   if (unlikely(__pyx_t_2)) {
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":129
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":131
  *     # PyObject_AsReadBuffer(packed, <const void**>&buf, &buf_len)
  *     if PyObject_GetBuffer(packed, &view, PyBUF_SIMPLE) < 0:
  *         raise ValueError("Unable to get buffer view")             # <<<<<<<<<<<<<<
  *     buf = <char*>view.buf
  *     buf_len = view.len
  */
-    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 129, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 131, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __PYX_ERR(0, 129, __pyx_L1_error)
+    __PYX_ERR(0, 131, __pyx_L1_error)
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":128
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":130
  * 
  *     # PyObject_AsReadBuffer(packed, <const void**>&buf, &buf_len)
  *     if PyObject_GetBuffer(packed, &view, PyBUF_SIMPLE) < 0:             # <<<<<<<<<<<<<<
@@ -4896,7 +4959,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_2unpackb(CYTH
  */
   }
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":130
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":132
  *     if PyObject_GetBuffer(packed, &view, PyBUF_SIMPLE) < 0:
  *         raise ValueError("Unable to get buffer view")
  *     buf = <char*>view.buf             # <<<<<<<<<<<<<<
@@ -4905,7 +4968,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_2unpackb(CYTH
  */
   __pyx_v_buf = ((char *)__pyx_v_view.buf);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":131
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":133
  *         raise ValueError("Unable to get buffer view")
  *     buf = <char*>view.buf
  *     buf_len = view.len             # <<<<<<<<<<<<<<
@@ -4915,7 +4978,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_2unpackb(CYTH
   __pyx_t_4 = __pyx_v_view.len;
   __pyx_v_buf_len = __pyx_t_4;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":133
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":135
  *     buf_len = view.len
  * 
  *     if encoding is not None:             # <<<<<<<<<<<<<<
@@ -4925,7 +4988,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_2unpackb(CYTH
   __pyx_t_2 = (__pyx_v_encoding != Py_None);
   if (__pyx_t_2) {
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":134
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":136
  * 
  *     if encoding is not None:
  *         if isinstance(encoding, unicode):             # <<<<<<<<<<<<<<
@@ -4935,14 +4998,14 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_2unpackb(CYTH
     __pyx_t_2 = PyUnicode_Check(__pyx_v_encoding); 
     if (__pyx_t_2) {
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":135
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":137
  *     if encoding is not None:
  *         if isinstance(encoding, unicode):
  *             encoding = encoding.encode('ascii')             # <<<<<<<<<<<<<<
  *         cenc = PyBytes_AsString(encoding)
  * 
  */
-      __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_encoding, __pyx_n_s_encode); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 135, __pyx_L1_error)
+      __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_encoding, __pyx_n_s_encode); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 137, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       __pyx_t_6 = NULL;
       __pyx_t_7 = 0;
@@ -4962,14 +5025,14 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_2unpackb(CYTH
         PyObject *__pyx_callargs[2] = {__pyx_t_6, __pyx_n_s_ascii};
         __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_5, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
         __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-        if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 135, __pyx_L1_error)
+        if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 137, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_3);
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       }
       __Pyx_DECREF_SET(__pyx_v_encoding, __pyx_t_3);
       __pyx_t_3 = 0;
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":134
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":136
  * 
  *     if encoding is not None:
  *         if isinstance(encoding, unicode):             # <<<<<<<<<<<<<<
@@ -4978,17 +5041,17 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_2unpackb(CYTH
  */
     }
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":136
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":138
  *         if isinstance(encoding, unicode):
  *             encoding = encoding.encode('ascii')
  *         cenc = PyBytes_AsString(encoding)             # <<<<<<<<<<<<<<
  * 
  *     if unicode_errors is not None:
  */
-    __pyx_t_8 = PyBytes_AsString(__pyx_v_encoding); if (unlikely(__pyx_t_8 == ((char *)NULL))) __PYX_ERR(0, 136, __pyx_L1_error)
+    __pyx_t_8 = PyBytes_AsString(__pyx_v_encoding); if (unlikely(__pyx_t_8 == ((char *)NULL))) __PYX_ERR(0, 138, __pyx_L1_error)
     __pyx_v_cenc = __pyx_t_8;
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":133
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":135
  *     buf_len = view.len
  * 
  *     if encoding is not None:             # <<<<<<<<<<<<<<
@@ -4997,7 +5060,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_2unpackb(CYTH
  */
   }
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":138
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":140
  *         cenc = PyBytes_AsString(encoding)
  * 
  *     if unicode_errors is not None:             # <<<<<<<<<<<<<<
@@ -5007,7 +5070,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_2unpackb(CYTH
   __pyx_t_2 = (__pyx_v_unicode_errors != Py_None);
   if (__pyx_t_2) {
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":139
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":141
  * 
  *     if unicode_errors is not None:
  *         if isinstance(unicode_errors, unicode):             # <<<<<<<<<<<<<<
@@ -5017,14 +5080,14 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_2unpackb(CYTH
     __pyx_t_2 = PyUnicode_Check(__pyx_v_unicode_errors); 
     if (__pyx_t_2) {
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":140
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":142
  *     if unicode_errors is not None:
  *         if isinstance(unicode_errors, unicode):
  *             unicode_errors = unicode_errors.encode('ascii')             # <<<<<<<<<<<<<<
  *         cerr = PyBytes_AsString(unicode_errors)
  * 
  */
-      __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_unicode_errors, __pyx_n_s_encode); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 140, __pyx_L1_error)
+      __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_v_unicode_errors, __pyx_n_s_encode); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 142, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       __pyx_t_6 = NULL;
       __pyx_t_7 = 0;
@@ -5044,14 +5107,14 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_2unpackb(CYTH
         PyObject *__pyx_callargs[2] = {__pyx_t_6, __pyx_n_s_ascii};
         __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_5, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
         __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-        if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 140, __pyx_L1_error)
+        if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 142, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_3);
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       }
       __Pyx_DECREF_SET(__pyx_v_unicode_errors, __pyx_t_3);
       __pyx_t_3 = 0;
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":139
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":141
  * 
  *     if unicode_errors is not None:
  *         if isinstance(unicode_errors, unicode):             # <<<<<<<<<<<<<<
@@ -5060,17 +5123,17 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_2unpackb(CYTH
  */
     }
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":141
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":143
  *         if isinstance(unicode_errors, unicode):
  *             unicode_errors = unicode_errors.encode('ascii')
  *         cerr = PyBytes_AsString(unicode_errors)             # <<<<<<<<<<<<<<
  * 
  *     init_ctx(&ctx, object_hook, object_pairs_hook, list_hook, ext_hook,
  */
-    __pyx_t_8 = PyBytes_AsString(__pyx_v_unicode_errors); if (unlikely(__pyx_t_8 == ((char *)NULL))) __PYX_ERR(0, 141, __pyx_L1_error)
+    __pyx_t_8 = PyBytes_AsString(__pyx_v_unicode_errors); if (unlikely(__pyx_t_8 == ((char *)NULL))) __PYX_ERR(0, 143, __pyx_L1_error)
     __pyx_v_cerr = __pyx_t_8;
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":138
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":140
  *         cenc = PyBytes_AsString(encoding)
  * 
  *     if unicode_errors is not None:             # <<<<<<<<<<<<<<
@@ -5079,28 +5142,28 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_2unpackb(CYTH
  */
   }
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":143
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":145
  *         cerr = PyBytes_AsString(unicode_errors)
  * 
  *     init_ctx(&ctx, object_hook, object_pairs_hook, list_hook, ext_hook,             # <<<<<<<<<<<<<<
  *              use_list, cenc, cerr,
  *              max_str_len, max_bin_len, max_array_len, max_map_len, max_ext_len)
  */
-  __pyx_t_3 = __pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_init_ctx((&__pyx_v_ctx), __pyx_v_object_hook, __pyx_v_object_pairs_hook, __pyx_v_list_hook, __pyx_v_ext_hook, __pyx_v_use_list, __pyx_v_cenc, __pyx_v_cerr, __pyx_v_max_str_len, __pyx_v_max_bin_len, __pyx_v_max_array_len, __pyx_v_max_map_len, __pyx_v_max_ext_len); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 143, __pyx_L1_error)
+  __pyx_t_3 = __pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_init_ctx((&__pyx_v_ctx), __pyx_v_object_hook, __pyx_v_object_pairs_hook, __pyx_v_list_hook, __pyx_v_ext_hook, __pyx_v_use_list, __pyx_v_cenc, __pyx_v_cerr, __pyx_v_max_str_len, __pyx_v_max_bin_len, __pyx_v_max_array_len, __pyx_v_max_map_len, __pyx_v_max_ext_len); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 145, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":146
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":148
  *              use_list, cenc, cerr,
  *              max_str_len, max_bin_len, max_array_len, max_map_len, max_ext_len)
  *     ret = unpack_construct(&ctx, buf, buf_len, &off)             # <<<<<<<<<<<<<<
  *     if ret == 1:
  *         obj = unpack_data(&ctx)
  */
-  __pyx_t_1 = unpack_construct((&__pyx_v_ctx), __pyx_v_buf, __pyx_v_buf_len, (&__pyx_v_off)); if (unlikely(__pyx_t_1 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 146, __pyx_L1_error)
+  __pyx_t_1 = unpack_construct((&__pyx_v_ctx), __pyx_v_buf, __pyx_v_buf_len, (&__pyx_v_off)); if (unlikely(__pyx_t_1 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 148, __pyx_L1_error)
   __pyx_v_ret = __pyx_t_1;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":147
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":149
  *              max_str_len, max_bin_len, max_array_len, max_map_len, max_ext_len)
  *     ret = unpack_construct(&ctx, buf, buf_len, &off)
  *     if ret == 1:             # <<<<<<<<<<<<<<
@@ -5110,19 +5173,19 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_2unpackb(CYTH
   __pyx_t_2 = (__pyx_v_ret == 1);
   if (likely(__pyx_t_2)) {
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":148
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":150
  *     ret = unpack_construct(&ctx, buf, buf_len, &off)
  *     if ret == 1:
  *         obj = unpack_data(&ctx)             # <<<<<<<<<<<<<<
  *         if off < buf_len:
  *             raise ExtraData(obj, PyBytes_FromStringAndSize(
  */
-    __pyx_t_3 = unpack_data((&__pyx_v_ctx)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 148, __pyx_L1_error)
+    __pyx_t_3 = unpack_data((&__pyx_v_ctx)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 150, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __pyx_v_obj = __pyx_t_3;
     __pyx_t_3 = 0;
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":149
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":151
  *     if ret == 1:
  *         obj = unpack_data(&ctx)
  *         if off < buf_len:             # <<<<<<<<<<<<<<
@@ -5132,24 +5195,24 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_2unpackb(CYTH
     __pyx_t_2 = (__pyx_v_off < __pyx_v_buf_len);
     if (unlikely(__pyx_t_2)) {
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":150
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":152
  *         obj = unpack_data(&ctx)
  *         if off < buf_len:
  *             raise ExtraData(obj, PyBytes_FromStringAndSize(             # <<<<<<<<<<<<<<
  *                 buf + off, buf_len - off))
  *         return obj
  */
-      __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_ExtraData); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 150, __pyx_L1_error)
+      __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_ExtraData); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 152, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":151
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":153
  *         if off < buf_len:
  *             raise ExtraData(obj, PyBytes_FromStringAndSize(
  *                 buf + off, buf_len - off))             # <<<<<<<<<<<<<<
  *         return obj
  *     else:
  */
-      __pyx_t_6 = PyBytes_FromStringAndSize((__pyx_v_buf + __pyx_v_off), (__pyx_v_buf_len - __pyx_v_off)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 150, __pyx_L1_error)
+      __pyx_t_6 = PyBytes_FromStringAndSize((__pyx_v_buf + __pyx_v_off), (__pyx_v_buf_len - __pyx_v_off)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 152, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_6);
       __pyx_t_9 = NULL;
       __pyx_t_7 = 0;
@@ -5170,15 +5233,15 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_2unpackb(CYTH
         __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_5, __pyx_callargs+1-__pyx_t_7, 2+__pyx_t_7);
         __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
         __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 150, __pyx_L1_error)
+        if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 152, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_3);
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       }
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __PYX_ERR(0, 150, __pyx_L1_error)
+      __PYX_ERR(0, 152, __pyx_L1_error)
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":149
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":151
  *     if ret == 1:
  *         obj = unpack_data(&ctx)
  *         if off < buf_len:             # <<<<<<<<<<<<<<
@@ -5187,7 +5250,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_2unpackb(CYTH
  */
     }
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":152
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":154
  *             raise ExtraData(obj, PyBytes_FromStringAndSize(
  *                 buf + off, buf_len - off))
  *         return obj             # <<<<<<<<<<<<<<
@@ -5199,7 +5262,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_2unpackb(CYTH
     __pyx_r = __pyx_v_obj;
     goto __pyx_L0;
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":147
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":149
  *              max_str_len, max_bin_len, max_array_len, max_map_len, max_ext_len)
  *     ret = unpack_construct(&ctx, buf, buf_len, &off)
  *     if ret == 1:             # <<<<<<<<<<<<<<
@@ -5208,7 +5271,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_2unpackb(CYTH
  */
   }
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":154
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":156
  *         return obj
  *     else:
  *         raise UnpackValueError("Unpack failed: error = %d" % (ret,))             # <<<<<<<<<<<<<<
@@ -5216,16 +5279,16 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_2unpackb(CYTH
  * 
  */
   /*else*/ {
-    __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_UnpackValueError); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 154, __pyx_L1_error)
+    __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_UnpackValueError); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 156, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_ret); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 154, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyInt_From_int(__pyx_v_ret); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 156, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_9 = PyTuple_New(1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 154, __pyx_L1_error)
+    __pyx_t_9 = PyTuple_New(1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 156, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_9);
     __Pyx_GIVEREF(__pyx_t_6);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_6)) __PYX_ERR(0, 154, __pyx_L1_error);
+    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_6)) __PYX_ERR(0, 156, __pyx_L1_error);
     __pyx_t_6 = 0;
-    __pyx_t_6 = __Pyx_PyString_Format(__pyx_kp_s_Unpack_failed_error_d, __pyx_t_9); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 154, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyString_Format(__pyx_kp_s_Unpack_failed_error_d, __pyx_t_9); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 156, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
     __pyx_t_9 = NULL;
@@ -5247,16 +5310,16 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_2unpackb(CYTH
       __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_5, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
       __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 154, __pyx_L1_error)
+      if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 156, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     }
     __Pyx_Raise(__pyx_t_3, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __PYX_ERR(0, 154, __pyx_L1_error)
+    __PYX_ERR(0, 156, __pyx_L1_error)
   }
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":102
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":104
  * 
  * 
  * def unpackb(object packed, object object_hook=None, object list_hook=None,             # <<<<<<<<<<<<<<
@@ -5281,7 +5344,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_2unpackb(CYTH
   return __pyx_r;
 }
 
-/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":157
+/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":159
  * 
  * 
  * def unpack(object stream, object object_hook=None, object list_hook=None,             # <<<<<<<<<<<<<<
@@ -5337,7 +5400,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
     values[1] = __Pyx_Arg_NewRef_FASTCALL(((PyObject *)Py_None));
     values[2] = __Pyx_Arg_NewRef_FASTCALL(((PyObject *)Py_None));
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":158
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":160
  * 
  * def unpack(object stream, object object_hook=None, object list_hook=None,
  *            bint use_list=1, encoding=None, unicode_errors="strict",             # <<<<<<<<<<<<<<
@@ -5347,7 +5410,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
     values[4] = __Pyx_Arg_NewRef_FASTCALL(((PyObject *)Py_None));
     values[5] = __Pyx_Arg_NewRef_FASTCALL(((PyObject *)((PyObject*)__pyx_n_s_strict)));
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":159
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":161
  * def unpack(object stream, object object_hook=None, object list_hook=None,
  *            bint use_list=1, encoding=None, unicode_errors="strict",
  *            object_pairs_hook=None,             # <<<<<<<<<<<<<<
@@ -5382,54 +5445,54 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 157, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 159, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
         CYTHON_FALLTHROUGH;
         case  1:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_object_hook);
           if (value) { values[1] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 157, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 159, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_list_hook);
           if (value) { values[2] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 157, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 159, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_use_list);
           if (value) { values[3] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 157, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 159, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  4:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_encoding);
           if (value) { values[4] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 157, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 159, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  5:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_unicode_errors);
           if (value) { values[5] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 157, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 159, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  6:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_object_pairs_hook);
           if (value) { values[6] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 157, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 159, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "unpack") < 0)) __PYX_ERR(0, 157, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "unpack") < 0)) __PYX_ERR(0, 159, __pyx_L3_error)
       }
     } else {
       switch (__pyx_nargs) {
@@ -5454,7 +5517,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
     __pyx_v_object_hook = values[1];
     __pyx_v_list_hook = values[2];
     if (values[3]) {
-      __pyx_v_use_list = __Pyx_PyObject_IsTrue(values[3]); if (unlikely((__pyx_v_use_list == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 158, __pyx_L3_error)
+      __pyx_v_use_list = __Pyx_PyObject_IsTrue(values[3]); if (unlikely((__pyx_v_use_list == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 160, __pyx_L3_error)
     } else {
       __pyx_v_use_list = ((int)((int)1));
     }
@@ -5464,7 +5527,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("unpack", 0, 1, 7, __pyx_nargs); __PYX_ERR(0, 157, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("unpack", 0, 1, 7, __pyx_nargs); __PYX_ERR(0, 159, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -5480,7 +5543,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __pyx_L4_argument_unpacking_done:;
   __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_4unpack(__pyx_self, __pyx_v_stream, __pyx_v_object_hook, __pyx_v_list_hook, __pyx_v_use_list, __pyx_v_encoding, __pyx_v_unicode_errors, __pyx_v_object_pairs_hook);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":157
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":159
  * 
  * 
  * def unpack(object stream, object object_hook=None, object list_hook=None,             # <<<<<<<<<<<<<<
@@ -5512,7 +5575,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_4unpack(CYTHO
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("unpack", 1);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":168
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":170
  *     See :class:`Unpacker` for options.
  *     """
  *     return unpackb(stream.read(), use_list=use_list,             # <<<<<<<<<<<<<<
@@ -5520,9 +5583,9 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_4unpack(CYTHO
  *                    object_pairs_hook=object_pairs_hook, list_hook=list_hook,
  */
   __Pyx_XDECREF(__pyx_r);
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_unpackb); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_unpackb); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 170, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_stream, __pyx_n_s_read); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_v_stream, __pyx_n_s_read); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 170, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_t_4 = NULL;
   __pyx_t_5 = 0;
@@ -5542,59 +5605,59 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_4unpack(CYTHO
     PyObject *__pyx_callargs[2] = {__pyx_t_4, NULL};
     __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_3, __pyx_callargs+1-__pyx_t_5, 0+__pyx_t_5);
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 168, __pyx_L1_error)
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 170, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   }
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 170, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_GIVEREF(__pyx_t_2);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_2)) __PYX_ERR(0, 168, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_2)) __PYX_ERR(0, 170, __pyx_L1_error);
   __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyDict_NewPresized(6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 170, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_4 = __Pyx_PyBool_FromLong(__pyx_v_use_list); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyBool_FromLong(__pyx_v_use_list); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 170, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_use_list, __pyx_t_4) < 0) __PYX_ERR(0, 168, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_use_list, __pyx_t_4) < 0) __PYX_ERR(0, 170, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":169
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":171
  *     """
  *     return unpackb(stream.read(), use_list=use_list,
  *                    object_hook=object_hook,             # <<<<<<<<<<<<<<
  *                    object_pairs_hook=object_pairs_hook, list_hook=list_hook,
  *                    encoding=encoding, unicode_errors=unicode_errors)
  */
-  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_object_hook, __pyx_v_object_hook) < 0) __PYX_ERR(0, 168, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_object_hook, __pyx_v_object_hook) < 0) __PYX_ERR(0, 170, __pyx_L1_error)
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":170
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":172
  *     return unpackb(stream.read(), use_list=use_list,
  *                    object_hook=object_hook,
  *                    object_pairs_hook=object_pairs_hook, list_hook=list_hook,             # <<<<<<<<<<<<<<
  *                    encoding=encoding, unicode_errors=unicode_errors)
  * 
  */
-  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_object_pairs_hook, __pyx_v_object_pairs_hook) < 0) __PYX_ERR(0, 168, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_list_hook, __pyx_v_list_hook) < 0) __PYX_ERR(0, 168, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_object_pairs_hook, __pyx_v_object_pairs_hook) < 0) __PYX_ERR(0, 170, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_list_hook, __pyx_v_list_hook) < 0) __PYX_ERR(0, 170, __pyx_L1_error)
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":171
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":173
  *                    object_hook=object_hook,
  *                    object_pairs_hook=object_pairs_hook, list_hook=list_hook,
  *                    encoding=encoding, unicode_errors=unicode_errors)             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_encoding, __pyx_v_encoding) < 0) __PYX_ERR(0, 168, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_unicode_errors, __pyx_v_unicode_errors) < 0) __PYX_ERR(0, 168, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_encoding, __pyx_v_encoding) < 0) __PYX_ERR(0, 170, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_unicode_errors, __pyx_v_unicode_errors) < 0) __PYX_ERR(0, 170, __pyx_L1_error)
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":168
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":170
  *     See :class:`Unpacker` for options.
  *     """
  *     return unpackb(stream.read(), use_list=use_list,             # <<<<<<<<<<<<<<
  *                    object_hook=object_hook,
  *                    object_pairs_hook=object_pairs_hook, list_hook=list_hook,
  */
-  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_3, __pyx_t_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 168, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_3, __pyx_t_2); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 170, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -5603,7 +5666,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_4unpack(CYTHO
   __pyx_t_4 = 0;
   goto __pyx_L0;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":157
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":159
  * 
  * 
  * def unpack(object stream, object object_hook=None, object list_hook=None,             # <<<<<<<<<<<<<<
@@ -5625,12 +5688,12 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_4unpack(CYTHO
   return __pyx_r;
 }
 
-/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":256
- *     cdef size_t max_buffer_size
+/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":268
+ *     cdef object source
  * 
  *     def __cinit__(self):             # <<<<<<<<<<<<<<
  *         self.buf = NULL
- * 
+ *         self.has_view = 0
  */
 
 /* Python wrapper */
@@ -5660,21 +5723,30 @@ static int __pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_1__cinit_
 static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker___cinit__(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self) {
   int __pyx_r;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":257
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":269
  * 
  *     def __cinit__(self):
  *         self.buf = NULL             # <<<<<<<<<<<<<<
+ *         self.has_view = 0
  * 
- *     def __dealloc__(self):
  */
   __pyx_v_self->buf = NULL;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":256
- *     cdef size_t max_buffer_size
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":270
+ *     def __cinit__(self):
+ *         self.buf = NULL
+ *         self.has_view = 0             # <<<<<<<<<<<<<<
+ * 
+ *     def __dealloc__(self):
+ */
+  __pyx_v_self->has_view = 0;
+
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":268
+ *     cdef object source
  * 
  *     def __cinit__(self):             # <<<<<<<<<<<<<<
  *         self.buf = NULL
- * 
+ *         self.has_view = 0
  */
 
   /* function exit code */
@@ -5682,12 +5754,12 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker___cinit__
   return __pyx_r;
 }
 
-/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":259
- *         self.buf = NULL
+/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":272
+ *         self.has_view = 0
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
- *         free(self.buf)
- *         self.buf = NULL
+ *         if self.has_view:
+ *             PyBuffer_Release(&self.view)
  */
 
 /* Python wrapper */
@@ -5705,36 +5777,76 @@ static void __pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_3__deall
 
 static void __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_2__dealloc__(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self) {
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":260
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":273
+ * 
+ *     def __dealloc__(self):
+ *         if self.has_view:             # <<<<<<<<<<<<<<
+ *             PyBuffer_Release(&self.view)
+ *             self.has_view = 0
+ */
+  if (__pyx_v_self->has_view) {
+
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":274
+ *     def __dealloc__(self):
+ *         if self.has_view:
+ *             PyBuffer_Release(&self.view)             # <<<<<<<<<<<<<<
+ *             self.has_view = 0
+ *         else:
+ */
+    PyBuffer_Release((&__pyx_v_self->view));
+
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":275
+ *         if self.has_view:
+ *             PyBuffer_Release(&self.view)
+ *             self.has_view = 0             # <<<<<<<<<<<<<<
+ *         else:
+ *             free(self.buf)
+ */
+    __pyx_v_self->has_view = 0;
+
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":273
  * 
  *     def __dealloc__(self):
- *         free(self.buf)             # <<<<<<<<<<<<<<
+ *         if self.has_view:             # <<<<<<<<<<<<<<
+ *             PyBuffer_Release(&self.view)
+ *             self.has_view = 0
+ */
+    goto __pyx_L3;
+  }
+
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":277
+ *             self.has_view = 0
+ *         else:
+ *             free(self.buf)             # <<<<<<<<<<<<<<
  *         self.buf = NULL
  * 
  */
-  free(__pyx_v_self->buf);
+  /*else*/ {
+    free(__pyx_v_self->buf);
+  }
+  __pyx_L3:;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":261
- *     def __dealloc__(self):
- *         free(self.buf)
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":278
+ *         else:
+ *             free(self.buf)
  *         self.buf = NULL             # <<<<<<<<<<<<<<
  * 
  *     def __init__(self, file_like=None, Py_ssize_t read_size=0, bint use_list=1,
  */
   __pyx_v_self->buf = NULL;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":259
- *         self.buf = NULL
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":272
+ *         self.has_view = 0
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
- *         free(self.buf)
- *         self.buf = NULL
+ *         if self.has_view:
+ *             PyBuffer_Release(&self.view)
  */
 
   /* function exit code */
 }
 
-/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":263
+/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":280
  *         self.buf = NULL
  * 
  *     def __init__(self, file_like=None, Py_ssize_t read_size=0, bint use_list=1,             # <<<<<<<<<<<<<<
@@ -5760,9 +5872,10 @@ static int __pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_5__init__
   Py_ssize_t __pyx_v_max_array_len;
   Py_ssize_t __pyx_v_max_map_len;
   Py_ssize_t __pyx_v_max_ext_len;
+  PyObject *__pyx_v_buffer = 0;
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[15] = {0,0,0,0,0,0,0,0,0,0,0,0,0,0,0};
+  PyObject* values[16] = {0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0};
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -5776,10 +5889,10 @@ static int __pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_5__init__
   #endif
   __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
   {
-    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_file_like,&__pyx_n_s_read_size,&__pyx_n_s_use_list,&__pyx_n_s_object_hook,&__pyx_n_s_object_pairs_hook,&__pyx_n_s_list_hook,&__pyx_n_s_encoding,&__pyx_n_s_unicode_errors,&__pyx_n_s_max_buffer_size,&__pyx_n_s_ext_hook,&__pyx_n_s_max_str_len,&__pyx_n_s_max_bin_len,&__pyx_n_s_max_array_len,&__pyx_n_s_max_map_len,&__pyx_n_s_max_ext_len,0};
+    PyObject **__pyx_pyargnames[] = {&__pyx_n_s_file_like,&__pyx_n_s_read_size,&__pyx_n_s_use_list,&__pyx_n_s_object_hook,&__pyx_n_s_object_pairs_hook,&__pyx_n_s_list_hook,&__pyx_n_s_encoding,&__pyx_n_s_unicode_errors,&__pyx_n_s_max_buffer_size,&__pyx_n_s_ext_hook,&__pyx_n_s_max_str_len,&__pyx_n_s_max_bin_len,&__pyx_n_s_max_array_len,&__pyx_n_s_max_map_len,&__pyx_n_s_max_ext_len,&__pyx_n_s_buffer,0};
     values[0] = __Pyx_Arg_NewRef_VARARGS(((PyObject *)Py_None));
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":264
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":281
  * 
  *     def __init__(self, file_like=None, Py_ssize_t read_size=0, bint use_list=1,
  *                  object object_hook=None, object object_pairs_hook=None,             # <<<<<<<<<<<<<<
@@ -5789,7 +5902,7 @@ static int __pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_5__init__
     values[3] = __Pyx_Arg_NewRef_VARARGS(((PyObject *)Py_None));
     values[4] = __Pyx_Arg_NewRef_VARARGS(((PyObject *)Py_None));
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":265
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":282
  *     def __init__(self, file_like=None, Py_ssize_t read_size=0, bint use_list=1,
  *                  object object_hook=None, object object_pairs_hook=None,
  *                  object list_hook=None, encoding=None, unicode_errors='strict',             # <<<<<<<<<<<<<<
@@ -5800,9 +5913,20 @@ static int __pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_5__init__
     values[6] = __Pyx_Arg_NewRef_VARARGS(((PyObject *)Py_None));
     values[7] = __Pyx_Arg_NewRef_VARARGS(((PyObject *)__pyx_n_s_strict));
     values[9] = __Pyx_Arg_NewRef_VARARGS(__pyx_k__7);
+
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":289
+ *                  Py_ssize_t max_map_len=2147483647,
+ *                  Py_ssize_t max_ext_len=2147483647,
+ *                  object buffer=None):             # <<<<<<<<<<<<<<
+ *         cdef char *cenc=NULL,
+ *         cdef char *cerr=NULL
+ */
+    values[15] = __Pyx_Arg_NewRef_VARARGS(((PyObject *)Py_None));
     if (__pyx_kwds) {
       Py_ssize_t kw_args;
       switch (__pyx_nargs) {
+        case 16: values[15] = __Pyx_Arg_VARARGS(__pyx_args, 15);
+        CYTHON_FALLTHROUGH;
         case 15: values[14] = __Pyx_Arg_VARARGS(__pyx_args, 14);
         CYTHON_FALLTHROUGH;
         case 14: values[13] = __Pyx_Arg_VARARGS(__pyx_args, 13);
@@ -5842,113 +5966,122 @@ static int __pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_5__init__
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_file_like);
           if (value) { values[0] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 263, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 280, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  1:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_read_size);
           if (value) { values[1] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 263, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 280, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_use_list);
           if (value) { values[2] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 263, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 280, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_object_hook);
           if (value) { values[3] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 263, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 280, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  4:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_object_pairs_hook);
           if (value) { values[4] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 263, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 280, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  5:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_list_hook);
           if (value) { values[5] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 263, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 280, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  6:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_encoding);
           if (value) { values[6] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 263, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 280, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  7:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_unicode_errors);
           if (value) { values[7] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 263, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 280, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  8:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_max_buffer_size);
           if (value) { values[8] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 263, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 280, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  9:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_ext_hook);
           if (value) { values[9] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 263, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 280, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case 10:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_max_str_len);
           if (value) { values[10] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 263, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 280, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case 11:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_max_bin_len);
           if (value) { values[11] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 263, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 280, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case 12:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_max_array_len);
           if (value) { values[12] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 263, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 280, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case 13:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_max_map_len);
           if (value) { values[13] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 263, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 280, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case 14:
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_max_ext_len);
           if (value) { values[14] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 263, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 280, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case 15:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_GetKwValue_VARARGS(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_buffer);
+          if (value) { values[15] = __Pyx_Arg_NewRef_VARARGS(value); kw_args--; }
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 280, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__init__") < 0)) __PYX_ERR(0, 263, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "__init__") < 0)) __PYX_ERR(0, 280, __pyx_L3_error)
       }
     } else {
       switch (__pyx_nargs) {
+        case 16: values[15] = __Pyx_Arg_VARARGS(__pyx_args, 15);
+        CYTHON_FALLTHROUGH;
         case 15: values[14] = __Pyx_Arg_VARARGS(__pyx_args, 14);
         CYTHON_FALLTHROUGH;
         case 14: values[13] = __Pyx_Arg_VARARGS(__pyx_args, 13);
@@ -5985,12 +6118,12 @@ static int __pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_5__init__
     }
     __pyx_v_file_like = values[0];
     if (values[1]) {
-      __pyx_v_read_size = __Pyx_PyIndex_AsSsize_t(values[1]); if (unlikely((__pyx_v_read_size == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 263, __pyx_L3_error)
+      __pyx_v_read_size = __Pyx_PyIndex_AsSsize_t(values[1]); if (unlikely((__pyx_v_read_size == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 280, __pyx_L3_error)
     } else {
       __pyx_v_read_size = ((Py_ssize_t)0);
     }
     if (values[2]) {
-      __pyx_v_use_list = __Pyx_PyObject_IsTrue(values[2]); if (unlikely((__pyx_v_use_list == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 263, __pyx_L3_error)
+      __pyx_v_use_list = __Pyx_PyObject_IsTrue(values[2]); if (unlikely((__pyx_v_use_list == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 280, __pyx_L3_error)
     } else {
       __pyx_v_use_list = ((int)1);
     }
@@ -6000,40 +6133,41 @@ static int __pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_5__init__
     __pyx_v_encoding = values[6];
     __pyx_v_unicode_errors = values[7];
     if (values[8]) {
-      __pyx_v_max_buffer_size = __Pyx_PyInt_As_int(values[8]); if (unlikely((__pyx_v_max_buffer_size == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 266, __pyx_L3_error)
+      __pyx_v_max_buffer_size = __Pyx_PyInt_As_int(values[8]); if (unlikely((__pyx_v_max_buffer_size == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 283, __pyx_L3_error)
     } else {
       __pyx_v_max_buffer_size = ((int)0);
     }
     __pyx_v_ext_hook = values[9];
     if (values[10]) {
-      __pyx_v_max_str_len = __Pyx_PyIndex_AsSsize_t(values[10]); if (unlikely((__pyx_v_max_str_len == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 267, __pyx_L3_error)
+      __pyx_v_max_str_len = __Pyx_PyIndex_AsSsize_t(values[10]); if (unlikely((__pyx_v_max_str_len == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 284, __pyx_L3_error)
     } else {
       __pyx_v_max_str_len = ((Py_ssize_t)0x7FFFFFFF);
     }
     if (values[11]) {
-      __pyx_v_max_bin_len = __Pyx_PyIndex_AsSsize_t(values[11]); if (unlikely((__pyx_v_max_bin_len == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 268, __pyx_L3_error)
+      __pyx_v_max_bin_len = __Pyx_PyIndex_AsSsize_t(values[11]); if (unlikely((__pyx_v_max_bin_len == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 285, __pyx_L3_error)
     } else {
       __pyx_v_max_bin_len = ((Py_ssize_t)0x7FFFFFFF);
     }
     if (values[12]) {
-      __pyx_v_max_array_len = __Pyx_PyIndex_AsSsize_t(values[12]); if (unlikely((__pyx_v_max_array_len == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 269, __pyx_L3_error)
+      __pyx_v_max_array_len = __Pyx_PyIndex_AsSsize_t(values[12]); if (unlikely((__pyx_v_max_array_len == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 286, __pyx_L3_error)
     } else {
       __pyx_v_max_array_len = ((Py_ssize_t)0x7FFFFFFF);
     }
     if (values[13]) {
-      __pyx_v_max_map_len = __Pyx_PyIndex_AsSsize_t(values[13]); if (unlikely((__pyx_v_max_map_len == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 270, __pyx_L3_error)
+      __pyx_v_max_map_len = __Pyx_PyIndex_AsSsize_t(values[13]); if (unlikely((__pyx_v_max_map_len == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 287, __pyx_L3_error)
     } else {
       __pyx_v_max_map_len = ((Py_ssize_t)0x7FFFFFFF);
     }
     if (values[14]) {
-      __pyx_v_max_ext_len = __Pyx_PyIndex_AsSsize_t(values[14]); if (unlikely((__pyx_v_max_ext_len == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 271, __pyx_L3_error)
+      __pyx_v_max_ext_len = __Pyx_PyIndex_AsSsize_t(values[14]); if (unlikely((__pyx_v_max_ext_len == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 288, __pyx_L3_error)
     } else {
       __pyx_v_max_ext_len = ((Py_ssize_t)0x7FFFFFFF);
     }
+    __pyx_v_buffer = values[15];
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 0, 0, 15, __pyx_nargs); __PYX_ERR(0, 263, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 0, 16, __pyx_nargs); __PYX_ERR(0, 280, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -6047,9 +6181,9 @@ static int __pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_5__init__
   __Pyx_RefNannyFinishContext();
   return -1;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self), __pyx_v_file_like, __pyx_v_read_size, __pyx_v_use_list, __pyx_v_object_hook, __pyx_v_object_pairs_hook, __pyx_v_list_hook, __pyx_v_encoding, __pyx_v_unicode_errors, __pyx_v_max_buffer_size, __pyx_v_ext_hook, __pyx_v_max_str_len, __pyx_v_max_bin_len, __pyx_v_max_array_len, __pyx_v_max_map_len, __pyx_v_max_ext_len);
+  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self), __pyx_v_file_like, __pyx_v_read_size, __pyx_v_use_list, __pyx_v_object_hook, __pyx_v_object_pairs_hook, __pyx_v_list_hook, __pyx_v_encoding, __pyx_v_unicode_errors, __pyx_v_max_buffer_size, __pyx_v_ext_hook, __pyx_v_max_str_len, __pyx_v_max_bin_len, __pyx_v_max_array_len, __pyx_v_max_map_len, __pyx_v_max_ext_len, __pyx_v_buffer);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":263
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":280
  *         self.buf = NULL
  * 
  *     def __init__(self, file_like=None, Py_ssize_t read_size=0, bint use_list=1,             # <<<<<<<<<<<<<<
@@ -6068,7 +6202,7 @@ static int __pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_5__init__
   return __pyx_r;
 }
 
-static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self, PyObject *__pyx_v_file_like, Py_ssize_t __pyx_v_read_size, int __pyx_v_use_list, PyObject *__pyx_v_object_hook, PyObject *__pyx_v_object_pairs_hook, PyObject *__pyx_v_list_hook, PyObject *__pyx_v_encoding, PyObject *__pyx_v_unicode_errors, int __pyx_v_max_buffer_size, PyObject *__pyx_v_ext_hook, Py_ssize_t __pyx_v_max_str_len, Py_ssize_t __pyx_v_max_bin_len, Py_ssize_t __pyx_v_max_array_len, Py_ssize_t __pyx_v_max_map_len, Py_ssize_t __pyx_v_max_ext_len) {
+static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self, PyObject *__pyx_v_file_like, Py_ssize_t __pyx_v_read_size, int __pyx_v_use_list, PyObject *__pyx_v_object_hook, PyObject *__pyx_v_object_pairs_hook, PyObject *__pyx_v_list_hook, PyObject *__pyx_v_encoding, PyObject *__pyx_v_unicode_errors, int __pyx_v_max_buffer_size, PyObject *__pyx_v_ext_hook, Py_ssize_t __pyx_v_max_str_len, Py_ssize_t __pyx_v_max_bin_len, Py_ssize_t __pyx_v_max_array_len, Py_ssize_t __pyx_v_max_map_len, Py_ssize_t __pyx_v_max_ext_len, PyObject *__pyx_v_buffer) {
   char *__pyx_v_cenc;
   char *__pyx_v_cerr;
   int __pyx_r;
@@ -6081,23 +6215,24 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
   PyObject *__pyx_t_6 = NULL;
   PyObject *__pyx_t_7 = NULL;
   unsigned int __pyx_t_8;
-  char *__pyx_t_9;
+  Py_ssize_t __pyx_t_9;
+  char *__pyx_t_10;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__init__", 1);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":272
- *                  Py_ssize_t max_map_len=2147483647,
- *                  Py_ssize_t max_ext_len=2147483647):
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":290
+ *                  Py_ssize_t max_ext_len=2147483647,
+ *                  object buffer=None):
  *         cdef char *cenc=NULL,             # <<<<<<<<<<<<<<
  *         cdef char *cerr=NULL
  * 
  */
   __pyx_v_cenc = NULL;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":273
- *                  Py_ssize_t max_ext_len=2147483647):
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":291
+ *                  object buffer=None):
  *         cdef char *cenc=NULL,
  *         cdef char *cerr=NULL             # <<<<<<<<<<<<<<
  * 
@@ -6105,7 +6240,7 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
  */
   __pyx_v_cerr = NULL;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":275
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":293
  *         cdef char *cerr=NULL
  * 
  *         self.object_hook = object_hook             # <<<<<<<<<<<<<<
@@ -6118,7 +6253,7 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
   __Pyx_DECREF(__pyx_v_self->object_hook);
   __pyx_v_self->object_hook = __pyx_v_object_hook;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":276
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":294
  * 
  *         self.object_hook = object_hook
  *         self.object_pairs_hook = object_pairs_hook             # <<<<<<<<<<<<<<
@@ -6131,7 +6266,7 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
   __Pyx_DECREF(__pyx_v_self->object_pairs_hook);
   __pyx_v_self->object_pairs_hook = __pyx_v_object_pairs_hook;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":277
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":295
  *         self.object_hook = object_hook
  *         self.object_pairs_hook = object_pairs_hook
  *         self.list_hook = list_hook             # <<<<<<<<<<<<<<
@@ -6144,7 +6279,7 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
   __Pyx_DECREF(__pyx_v_self->list_hook);
   __pyx_v_self->list_hook = __pyx_v_list_hook;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":278
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":296
  *         self.object_pairs_hook = object_pairs_hook
  *         self.list_hook = list_hook
  *         self.ext_hook = ext_hook             # <<<<<<<<<<<<<<
@@ -6157,7 +6292,7 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
   __Pyx_DECREF(__pyx_v_self->ext_hook);
   __pyx_v_self->ext_hook = __pyx_v_ext_hook;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":280
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":298
  *         self.ext_hook = ext_hook
  * 
  *         self.file_like = file_like             # <<<<<<<<<<<<<<
@@ -6170,24 +6305,24 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
   __Pyx_DECREF(__pyx_v_self->file_like);
   __pyx_v_self->file_like = __pyx_v_file_like;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":281
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":299
  * 
  *         self.file_like = file_like
  *         if file_like:             # <<<<<<<<<<<<<<
  *             self.file_like_read = file_like.read
  *             if not PyCallable_Check(self.file_like_read):
  */
-  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_file_like); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 281, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_file_like); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 299, __pyx_L1_error)
   if (__pyx_t_1) {
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":282
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":300
  *         self.file_like = file_like
  *         if file_like:
  *             self.file_like_read = file_like.read             # <<<<<<<<<<<<<<
  *             if not PyCallable_Check(self.file_like_read):
  *                 raise TypeError("`file_like.read` must be a callable.")
  */
-    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_file_like, __pyx_n_s_read); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 282, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_file_like, __pyx_n_s_read); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 300, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_GIVEREF(__pyx_t_2);
     __Pyx_GOTREF(__pyx_v_self->file_like_read);
@@ -6195,7 +6330,7 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
     __pyx_v_self->file_like_read = __pyx_t_2;
     __pyx_t_2 = 0;
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":283
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":301
  *         if file_like:
  *             self.file_like_read = file_like.read
  *             if not PyCallable_Check(self.file_like_read):             # <<<<<<<<<<<<<<
@@ -6208,20 +6343,20 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     if (unlikely(__pyx_t_1)) {
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":284
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":302
  *             self.file_like_read = file_like.read
  *             if not PyCallable_Check(self.file_like_read):
  *                 raise TypeError("`file_like.read` must be a callable.")             # <<<<<<<<<<<<<<
  *         if not max_buffer_size:
  *             max_buffer_size = INT_MAX
  */
-      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__8, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 284, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__8, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 302, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_Raise(__pyx_t_2, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __PYX_ERR(0, 284, __pyx_L1_error)
+      __PYX_ERR(0, 302, __pyx_L1_error)
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":283
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":301
  *         if file_like:
  *             self.file_like_read = file_like.read
  *             if not PyCallable_Check(self.file_like_read):             # <<<<<<<<<<<<<<
@@ -6230,7 +6365,7 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
  */
     }
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":281
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":299
  * 
  *         self.file_like = file_like
  *         if file_like:             # <<<<<<<<<<<<<<
@@ -6239,7 +6374,7 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
  */
   }
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":285
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":303
  *             if not PyCallable_Check(self.file_like_read):
  *                 raise TypeError("`file_like.read` must be a callable.")
  *         if not max_buffer_size:             # <<<<<<<<<<<<<<
@@ -6249,7 +6384,7 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
   __pyx_t_1 = (!(__pyx_v_max_buffer_size != 0));
   if (__pyx_t_1) {
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":286
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":304
  *                 raise TypeError("`file_like.read` must be a callable.")
  *         if not max_buffer_size:
  *             max_buffer_size = INT_MAX             # <<<<<<<<<<<<<<
@@ -6258,7 +6393,7 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
  */
     __pyx_v_max_buffer_size = INT_MAX;
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":285
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":303
  *             if not PyCallable_Check(self.file_like_read):
  *                 raise TypeError("`file_like.read` must be a callable.")
  *         if not max_buffer_size:             # <<<<<<<<<<<<<<
@@ -6267,7 +6402,7 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
  */
   }
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":287
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":305
  *         if not max_buffer_size:
  *             max_buffer_size = INT_MAX
  *         if read_size > max_buffer_size:             # <<<<<<<<<<<<<<
@@ -6277,20 +6412,20 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
   __pyx_t_1 = (__pyx_v_read_size > __pyx_v_max_buffer_size);
   if (unlikely(__pyx_t_1)) {
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":288
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":306
  *             max_buffer_size = INT_MAX
  *         if read_size > max_buffer_size:
  *             raise ValueError("read_size should be less or "             # <<<<<<<<<<<<<<
  *                              "equal to max_buffer_size")
  *         if not read_size:
  */
-    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 288, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 306, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_Raise(__pyx_t_2, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __PYX_ERR(0, 288, __pyx_L1_error)
+    __PYX_ERR(0, 306, __pyx_L1_error)
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":287
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":305
  *         if not max_buffer_size:
  *             max_buffer_size = INT_MAX
  *         if read_size > max_buffer_size:             # <<<<<<<<<<<<<<
@@ -6299,7 +6434,7 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
  */
   }
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":290
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":308
  *             raise ValueError("read_size should be less or "
  *                              "equal to max_buffer_size")
  *         if not read_size:             # <<<<<<<<<<<<<<
@@ -6309,7 +6444,7 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
   __pyx_t_1 = (!(__pyx_v_read_size != 0));
   if (__pyx_t_1) {
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":291
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":309
  *                              "equal to max_buffer_size")
  *         if not read_size:
  *             read_size = min(max_buffer_size, 1024**2)             # <<<<<<<<<<<<<<
@@ -6326,7 +6461,7 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
     }
     __pyx_v_read_size = __pyx_t_5;
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":290
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":308
  *             raise ValueError("read_size should be less or "
  *                              "equal to max_buffer_size")
  *         if not read_size:             # <<<<<<<<<<<<<<
@@ -6335,94 +6470,239 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
  */
   }
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":292
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":310
  *         if not read_size:
  *             read_size = min(max_buffer_size, 1024**2)
  *         self.max_buffer_size = max_buffer_size             # <<<<<<<<<<<<<<
  *         self.read_size = read_size
- *         self.buf = <char*>malloc(read_size)
+ *         self.buf_head = 0
  */
   __pyx_v_self->max_buffer_size = __pyx_v_max_buffer_size;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":293
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":311
  *             read_size = min(max_buffer_size, 1024**2)
  *         self.max_buffer_size = max_buffer_size
  *         self.read_size = read_size             # <<<<<<<<<<<<<<
- *         self.buf = <char*>malloc(read_size)
- *         if self.buf == NULL:
+ *         self.buf_head = 0
+ *         if buffer is not None:
  */
   __pyx_v_self->read_size = __pyx_v_read_size;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":294
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":312
  *         self.max_buffer_size = max_buffer_size
  *         self.read_size = read_size
- *         self.buf = <char*>malloc(read_size)             # <<<<<<<<<<<<<<
- *         if self.buf == NULL:
- *             raise MemoryError("Unable to allocate internal buffer.")
+ *         self.buf_head = 0             # <<<<<<<<<<<<<<
+ *         if buffer is not None:
+ *             if file_like is not None:
  */
-  __pyx_v_self->buf = ((char *)malloc(__pyx_v_read_size));
+  __pyx_v_self->buf_head = 0;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":295
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":313
  *         self.read_size = read_size
- *         self.buf = <char*>malloc(read_size)
- *         if self.buf == NULL:             # <<<<<<<<<<<<<<
- *             raise MemoryError("Unable to allocate internal buffer.")
- *         self.buf_size = read_size
+ *         self.buf_head = 0
+ *         if buffer is not None:             # <<<<<<<<<<<<<<
+ *             if file_like is not None:
+ *                 raise TypeError("file_like and buffer are mutually exclusive.")
  */
-  __pyx_t_1 = (__pyx_v_self->buf == NULL);
-  if (unlikely(__pyx_t_1)) {
+  __pyx_t_1 = (__pyx_v_buffer != Py_None);
+  if (__pyx_t_1) {
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":296
- *         self.buf = <char*>malloc(read_size)
- *         if self.buf == NULL:
- *             raise MemoryError("Unable to allocate internal buffer.")             # <<<<<<<<<<<<<<
- *         self.buf_size = read_size
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":314
  *         self.buf_head = 0
+ *         if buffer is not None:
+ *             if file_like is not None:             # <<<<<<<<<<<<<<
+ *                 raise TypeError("file_like and buffer are mutually exclusive.")
+ *             self.source = memoryview(buffer).cast('B')
  */
-    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_MemoryError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 296, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __pyx_t_1 = (__pyx_v_file_like != Py_None);
+    if (unlikely(__pyx_t_1)) {
+
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":315
+ *         if buffer is not None:
+ *             if file_like is not None:
+ *                 raise TypeError("file_like and buffer are mutually exclusive.")             # <<<<<<<<<<<<<<
+ *             self.source = memoryview(buffer).cast('B')
+ *             PyObject_GetBuffer(self.source, &self.view, PyBUF_SIMPLE)
+ */
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 315, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __PYX_ERR(0, 315, __pyx_L1_error)
+
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":314
+ *         self.buf_head = 0
+ *         if buffer is not None:
+ *             if file_like is not None:             # <<<<<<<<<<<<<<
+ *                 raise TypeError("file_like and buffer are mutually exclusive.")
+ *             self.source = memoryview(buffer).cast('B')
+ */
+    }
+
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":316
+ *             if file_like is not None:
+ *                 raise TypeError("file_like and buffer are mutually exclusive.")
+ *             self.source = memoryview(buffer).cast('B')             # <<<<<<<<<<<<<<
+ *             PyObject_GetBuffer(self.source, &self.view, PyBUF_SIMPLE)
+ *             self.has_view = 1
+ */
+    __pyx_t_6 = PyMemoryView_FromObject(__pyx_v_buffer); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 316, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_cast); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 316, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_6 = NULL;
+    __pyx_t_8 = 0;
+    #if CYTHON_UNPACK_METHODS
+    if (likely(PyMethod_Check(__pyx_t_7))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_7);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_7, function);
+        __pyx_t_8 = 1;
+      }
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_6, __pyx_n_s_B};
+      __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_7, __pyx_callargs+1-__pyx_t_8, 1+__pyx_t_8);
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 316, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    }
+    __Pyx_GIVEREF(__pyx_t_2);
+    __Pyx_GOTREF(__pyx_v_self->source);
+    __Pyx_DECREF(__pyx_v_self->source);
+    __pyx_v_self->source = __pyx_t_2;
+    __pyx_t_2 = 0;
+
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":317
+ *                 raise TypeError("file_like and buffer are mutually exclusive.")
+ *             self.source = memoryview(buffer).cast('B')
+ *             PyObject_GetBuffer(self.source, &self.view, PyBUF_SIMPLE)             # <<<<<<<<<<<<<<
+ *             self.has_view = 1
+ *             self.buf = <char*>self.view.buf
+ */
+    __pyx_t_2 = __pyx_v_self->source;
+    __Pyx_INCREF(__pyx_t_2);
+    __pyx_t_4 = PyObject_GetBuffer(__pyx_t_2, (&__pyx_v_self->view), PyBUF_SIMPLE); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(0, 317, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __PYX_ERR(0, 296, __pyx_L1_error)
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":295
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":318
+ *             self.source = memoryview(buffer).cast('B')
+ *             PyObject_GetBuffer(self.source, &self.view, PyBUF_SIMPLE)
+ *             self.has_view = 1             # <<<<<<<<<<<<<<
+ *             self.buf = <char*>self.view.buf
+ *             self.buf_size = self.view.len
+ */
+    __pyx_v_self->has_view = 1;
+
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":319
+ *             PyObject_GetBuffer(self.source, &self.view, PyBUF_SIMPLE)
+ *             self.has_view = 1
+ *             self.buf = <char*>self.view.buf             # <<<<<<<<<<<<<<
+ *             self.buf_size = self.view.len
+ *             self.buf_tail = self.view.len
+ */
+    __pyx_v_self->buf = ((char *)__pyx_v_self->view.buf);
+
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":320
+ *             self.has_view = 1
+ *             self.buf = <char*>self.view.buf
+ *             self.buf_size = self.view.len             # <<<<<<<<<<<<<<
+ *             self.buf_tail = self.view.len
+ *         else:
+ */
+    __pyx_t_9 = __pyx_v_self->view.len;
+    __pyx_v_self->buf_size = __pyx_t_9;
+
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":321
+ *             self.buf = <char*>self.view.buf
+ *             self.buf_size = self.view.len
+ *             self.buf_tail = self.view.len             # <<<<<<<<<<<<<<
+ *         else:
+ *             self.buf = <char*>malloc(read_size)
+ */
+    __pyx_t_9 = __pyx_v_self->view.len;
+    __pyx_v_self->buf_tail = __pyx_t_9;
+
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":313
  *         self.read_size = read_size
- *         self.buf = <char*>malloc(read_size)
- *         if self.buf == NULL:             # <<<<<<<<<<<<<<
- *             raise MemoryError("Unable to allocate internal buffer.")
- *         self.buf_size = read_size
+ *         self.buf_head = 0
+ *         if buffer is not None:             # <<<<<<<<<<<<<<
+ *             if file_like is not None:
+ *                 raise TypeError("file_like and buffer are mutually exclusive.")
  */
+    goto __pyx_L8;
   }
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":297
- *         if self.buf == NULL:
- *             raise MemoryError("Unable to allocate internal buffer.")
- *         self.buf_size = read_size             # <<<<<<<<<<<<<<
- *         self.buf_head = 0
- *         self.buf_tail = 0
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":323
+ *             self.buf_tail = self.view.len
+ *         else:
+ *             self.buf = <char*>malloc(read_size)             # <<<<<<<<<<<<<<
+ *             if self.buf == NULL:
+ *                 raise MemoryError("Unable to allocate internal buffer.")
  */
-  __pyx_v_self->buf_size = __pyx_v_read_size;
+  /*else*/ {
+    __pyx_v_self->buf = ((char *)malloc(__pyx_v_read_size));
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":298
- *             raise MemoryError("Unable to allocate internal buffer.")
- *         self.buf_size = read_size
- *         self.buf_head = 0             # <<<<<<<<<<<<<<
- *         self.buf_tail = 0
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":324
+ *         else:
+ *             self.buf = <char*>malloc(read_size)
+ *             if self.buf == NULL:             # <<<<<<<<<<<<<<
+ *                 raise MemoryError("Unable to allocate internal buffer.")
+ *             self.buf_size = read_size
+ */
+    __pyx_t_1 = (__pyx_v_self->buf == NULL);
+    if (unlikely(__pyx_t_1)) {
+
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":325
+ *             self.buf = <char*>malloc(read_size)
+ *             if self.buf == NULL:
+ *                 raise MemoryError("Unable to allocate internal buffer.")             # <<<<<<<<<<<<<<
+ *             self.buf_size = read_size
+ *             self.buf_tail = 0
+ */
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_MemoryError, __pyx_tuple__11, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 325, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __PYX_ERR(0, 325, __pyx_L1_error)
+
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":324
+ *         else:
+ *             self.buf = <char*>malloc(read_size)
+ *             if self.buf == NULL:             # <<<<<<<<<<<<<<
+ *                 raise MemoryError("Unable to allocate internal buffer.")
+ *             self.buf_size = read_size
+ */
+    }
+
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":326
+ *             if self.buf == NULL:
+ *                 raise MemoryError("Unable to allocate internal buffer.")
+ *             self.buf_size = read_size             # <<<<<<<<<<<<<<
+ *             self.buf_tail = 0
  * 
  */
-  __pyx_v_self->buf_head = 0;
+    __pyx_v_self->buf_size = __pyx_v_read_size;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":299
- *         self.buf_size = read_size
- *         self.buf_head = 0
- *         self.buf_tail = 0             # <<<<<<<<<<<<<<
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":327
+ *                 raise MemoryError("Unable to allocate internal buffer.")
+ *             self.buf_size = read_size
+ *             self.buf_tail = 0             # <<<<<<<<<<<<<<
  * 
  *         if encoding is not None:
  */
-  __pyx_v_self->buf_tail = 0;
+    __pyx_v_self->buf_tail = 0;
+  }
+  __pyx_L8:;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":301
- *         self.buf_tail = 0
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":329
+ *             self.buf_tail = 0
  * 
  *         if encoding is not None:             # <<<<<<<<<<<<<<
  *             if isinstance(encoding, unicode):
@@ -6431,7 +6711,7 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
   __pyx_t_1 = (__pyx_v_encoding != Py_None);
   if (__pyx_t_1) {
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":302
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":330
  * 
  *         if encoding is not None:
  *             if isinstance(encoding, unicode):             # <<<<<<<<<<<<<<
@@ -6441,36 +6721,36 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
     __pyx_t_1 = PyUnicode_Check(__pyx_v_encoding); 
     if (__pyx_t_1) {
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":303
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":331
  *         if encoding is not None:
  *             if isinstance(encoding, unicode):
  *                 self.encoding = encoding.encode('ascii')             # <<<<<<<<<<<<<<
  *             elif isinstance(encoding, bytes):
  *                 self.encoding = encoding
  */
-      __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_encoding, __pyx_n_s_encode); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 303, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
-      __pyx_t_7 = NULL;
+      __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_encoding, __pyx_n_s_encode); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 331, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __pyx_t_6 = NULL;
       __pyx_t_8 = 0;
       #if CYTHON_UNPACK_METHODS
-      if (likely(PyMethod_Check(__pyx_t_6))) {
-        __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_6);
-        if (likely(__pyx_t_7)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
-          __Pyx_INCREF(__pyx_t_7);
+      if (likely(PyMethod_Check(__pyx_t_7))) {
+        __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_7);
+        if (likely(__pyx_t_6)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+          __Pyx_INCREF(__pyx_t_6);
           __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_6, function);
+          __Pyx_DECREF_SET(__pyx_t_7, function);
           __pyx_t_8 = 1;
         }
       }
       #endif
       {
-        PyObject *__pyx_callargs[2] = {__pyx_t_7, __pyx_n_s_ascii};
-        __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_6, __pyx_callargs+1-__pyx_t_8, 1+__pyx_t_8);
-        __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 303, __pyx_L1_error)
+        PyObject *__pyx_callargs[2] = {__pyx_t_6, __pyx_n_s_ascii};
+        __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_7, __pyx_callargs+1-__pyx_t_8, 1+__pyx_t_8);
+        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 331, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
       }
       __Pyx_GIVEREF(__pyx_t_2);
       __Pyx_GOTREF(__pyx_v_self->encoding);
@@ -6478,17 +6758,17 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
       __pyx_v_self->encoding = __pyx_t_2;
       __pyx_t_2 = 0;
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":302
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":330
  * 
  *         if encoding is not None:
  *             if isinstance(encoding, unicode):             # <<<<<<<<<<<<<<
  *                 self.encoding = encoding.encode('ascii')
  *             elif isinstance(encoding, bytes):
  */
-      goto __pyx_L10;
+      goto __pyx_L12;
     }
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":304
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":332
  *             if isinstance(encoding, unicode):
  *                 self.encoding = encoding.encode('ascii')
  *             elif isinstance(encoding, bytes):             # <<<<<<<<<<<<<<
@@ -6498,7 +6778,7 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
     __pyx_t_1 = PyBytes_Check(__pyx_v_encoding); 
     if (likely(__pyx_t_1)) {
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":305
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":333
  *                 self.encoding = encoding.encode('ascii')
  *             elif isinstance(encoding, bytes):
  *                 self.encoding = encoding             # <<<<<<<<<<<<<<
@@ -6511,17 +6791,17 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
       __Pyx_DECREF(__pyx_v_self->encoding);
       __pyx_v_self->encoding = __pyx_v_encoding;
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":304
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":332
  *             if isinstance(encoding, unicode):
  *                 self.encoding = encoding.encode('ascii')
  *             elif isinstance(encoding, bytes):             # <<<<<<<<<<<<<<
  *                 self.encoding = encoding
  *             else:
  */
-      goto __pyx_L10;
+      goto __pyx_L12;
     }
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":307
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":335
  *                 self.encoding = encoding
  *             else:
  *                 raise TypeError("encoding should be bytes or unicode")             # <<<<<<<<<<<<<<
@@ -6529,15 +6809,15 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
  * 
  */
     /*else*/ {
-      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__11, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 307, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__12, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 335, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_Raise(__pyx_t_2, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __PYX_ERR(0, 307, __pyx_L1_error)
+      __PYX_ERR(0, 335, __pyx_L1_error)
     }
-    __pyx_L10:;
+    __pyx_L12:;
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":308
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":336
  *             else:
  *                 raise TypeError("encoding should be bytes or unicode")
  *             cenc = PyBytes_AsString(self.encoding)             # <<<<<<<<<<<<<<
@@ -6546,12 +6826,12 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
  */
     __pyx_t_2 = __pyx_v_self->encoding;
     __Pyx_INCREF(__pyx_t_2);
-    __pyx_t_9 = PyBytes_AsString(__pyx_t_2); if (unlikely(__pyx_t_9 == ((char *)NULL))) __PYX_ERR(0, 308, __pyx_L1_error)
-    __pyx_v_cenc = __pyx_t_9;
+    __pyx_t_10 = PyBytes_AsString(__pyx_t_2); if (unlikely(__pyx_t_10 == ((char *)NULL))) __PYX_ERR(0, 336, __pyx_L1_error)
+    __pyx_v_cenc = __pyx_t_10;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":301
- *         self.buf_tail = 0
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":329
+ *             self.buf_tail = 0
  * 
  *         if encoding is not None:             # <<<<<<<<<<<<<<
  *             if isinstance(encoding, unicode):
@@ -6559,7 +6839,7 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
  */
   }
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":310
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":338
  *             cenc = PyBytes_AsString(self.encoding)
  * 
  *         if unicode_errors is not None:             # <<<<<<<<<<<<<<
@@ -6569,7 +6849,7 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
   __pyx_t_1 = (__pyx_v_unicode_errors != Py_None);
   if (__pyx_t_1) {
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":311
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":339
  * 
  *         if unicode_errors is not None:
  *             if isinstance(unicode_errors, unicode):             # <<<<<<<<<<<<<<
@@ -6579,36 +6859,36 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
     __pyx_t_1 = PyUnicode_Check(__pyx_v_unicode_errors); 
     if (__pyx_t_1) {
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":312
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":340
  *         if unicode_errors is not None:
  *             if isinstance(unicode_errors, unicode):
  *                 self.unicode_errors = unicode_errors.encode('ascii')             # <<<<<<<<<<<<<<
  *             elif isinstance(unicode_errors, bytes):
  *                 self.unicode_errors = unicode_errors
  */
-      __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_unicode_errors, __pyx_n_s_encode); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 312, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
-      __pyx_t_7 = NULL;
+      __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_unicode_errors, __pyx_n_s_encode); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 340, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_7);
+      __pyx_t_6 = NULL;
       __pyx_t_8 = 0;
       #if CYTHON_UNPACK_METHODS
-      if (likely(PyMethod_Check(__pyx_t_6))) {
-        __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_6);
-        if (likely(__pyx_t_7)) {
-          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_6);
-          __Pyx_INCREF(__pyx_t_7);
+      if (likely(PyMethod_Check(__pyx_t_7))) {
+        __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_7);
+        if (likely(__pyx_t_6)) {
+          PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_7);
+          __Pyx_INCREF(__pyx_t_6);
           __Pyx_INCREF(function);
-          __Pyx_DECREF_SET(__pyx_t_6, function);
+          __Pyx_DECREF_SET(__pyx_t_7, function);
           __pyx_t_8 = 1;
         }
       }
       #endif
       {
-        PyObject *__pyx_callargs[2] = {__pyx_t_7, __pyx_n_s_ascii};
-        __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_6, __pyx_callargs+1-__pyx_t_8, 1+__pyx_t_8);
-        __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 312, __pyx_L1_error)
+        PyObject *__pyx_callargs[2] = {__pyx_t_6, __pyx_n_s_ascii};
+        __pyx_t_2 = __Pyx_PyObject_FastCall(__pyx_t_7, __pyx_callargs+1-__pyx_t_8, 1+__pyx_t_8);
+        __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 340, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
       }
       __Pyx_GIVEREF(__pyx_t_2);
       __Pyx_GOTREF(__pyx_v_self->unicode_errors);
@@ -6616,17 +6896,17 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
       __pyx_v_self->unicode_errors = __pyx_t_2;
       __pyx_t_2 = 0;
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":311
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":339
  * 
  *         if unicode_errors is not None:
  *             if isinstance(unicode_errors, unicode):             # <<<<<<<<<<<<<<
  *                 self.unicode_errors = unicode_errors.encode('ascii')
  *             elif isinstance(unicode_errors, bytes):
  */
-      goto __pyx_L12;
+      goto __pyx_L14;
     }
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":313
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":341
  *             if isinstance(unicode_errors, unicode):
  *                 self.unicode_errors = unicode_errors.encode('ascii')
  *             elif isinstance(unicode_errors, bytes):             # <<<<<<<<<<<<<<
@@ -6636,7 +6916,7 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
     __pyx_t_1 = PyBytes_Check(__pyx_v_unicode_errors); 
     if (likely(__pyx_t_1)) {
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":314
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":342
  *                 self.unicode_errors = unicode_errors.encode('ascii')
  *             elif isinstance(unicode_errors, bytes):
  *                 self.unicode_errors = unicode_errors             # <<<<<<<<<<<<<<
@@ -6649,17 +6929,17 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
       __Pyx_DECREF(__pyx_v_self->unicode_errors);
       __pyx_v_self->unicode_errors = __pyx_v_unicode_errors;
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":313
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":341
  *             if isinstance(unicode_errors, unicode):
  *                 self.unicode_errors = unicode_errors.encode('ascii')
  *             elif isinstance(unicode_errors, bytes):             # <<<<<<<<<<<<<<
  *                 self.unicode_errors = unicode_errors
  *             else:
  */
-      goto __pyx_L12;
+      goto __pyx_L14;
     }
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":316
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":344
  *                 self.unicode_errors = unicode_errors
  *             else:
  *                 raise TypeError("unicode_errors should be bytes or unicode")             # <<<<<<<<<<<<<<
@@ -6667,15 +6947,15 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
  * 
  */
     /*else*/ {
-      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__12, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 316, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 344, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_Raise(__pyx_t_2, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __PYX_ERR(0, 316, __pyx_L1_error)
+      __PYX_ERR(0, 344, __pyx_L1_error)
     }
-    __pyx_L12:;
+    __pyx_L14:;
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":317
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":345
  *             else:
  *                 raise TypeError("unicode_errors should be bytes or unicode")
  *             cerr = PyBytes_AsString(self.unicode_errors)             # <<<<<<<<<<<<<<
@@ -6684,11 +6964,11 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
  */
     __pyx_t_2 = __pyx_v_self->unicode_errors;
     __Pyx_INCREF(__pyx_t_2);
-    __pyx_t_9 = PyBytes_AsString(__pyx_t_2); if (unlikely(__pyx_t_9 == ((char *)NULL))) __PYX_ERR(0, 317, __pyx_L1_error)
-    __pyx_v_cerr = __pyx_t_9;
+    __pyx_t_10 = PyBytes_AsString(__pyx_t_2); if (unlikely(__pyx_t_10 == ((char *)NULL))) __PYX_ERR(0, 345, __pyx_L1_error)
+    __pyx_v_cerr = __pyx_t_10;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":310
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":338
  *             cenc = PyBytes_AsString(self.encoding)
  * 
  *         if unicode_errors is not None:             # <<<<<<<<<<<<<<
@@ -6697,18 +6977,45 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
  */
   }
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":319
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":347
  *             cerr = PyBytes_AsString(self.unicode_errors)
  * 
  *         init_ctx(&self.ctx, object_hook, object_pairs_hook, list_hook,             # <<<<<<<<<<<<<<
  *                  ext_hook, use_list, cenc, cerr,
  *                  max_str_len, max_bin_len, max_array_len,
  */
-  __pyx_t_2 = __pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_init_ctx((&__pyx_v_self->ctx), __pyx_v_object_hook, __pyx_v_object_pairs_hook, __pyx_v_list_hook, __pyx_v_ext_hook, __pyx_v_use_list, __pyx_v_cenc, __pyx_v_cerr, __pyx_v_max_str_len, __pyx_v_max_bin_len, __pyx_v_max_array_len, __pyx_v_max_map_len, __pyx_v_max_ext_len); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 319, __pyx_L1_error)
+  __pyx_t_2 = __pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_init_ctx((&__pyx_v_self->ctx), __pyx_v_object_hook, __pyx_v_object_pairs_hook, __pyx_v_list_hook, __pyx_v_ext_hook, __pyx_v_use_list, __pyx_v_cenc, __pyx_v_cerr, __pyx_v_max_str_len, __pyx_v_max_bin_len, __pyx_v_max_array_len, __pyx_v_max_map_len, __pyx_v_max_ext_len); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 347, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":263
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":351
+ *                  max_str_len, max_bin_len, max_array_len,
+ *                  max_map_len, max_ext_len)
+ *         if self.has_view:             # <<<<<<<<<<<<<<
+ *             self.ctx.user.ext_source = <PyObject*>self.source
+ * 
+ */
+  if (__pyx_v_self->has_view) {
+
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":352
+ *                  max_map_len, max_ext_len)
+ *         if self.has_view:
+ *             self.ctx.user.ext_source = <PyObject*>self.source             # <<<<<<<<<<<<<<
+ * 
+ *     def feed(self, object next_bytes):
+ */
+    __pyx_v_self->ctx.user.ext_source = ((PyObject *)__pyx_v_self->source);
+
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":351
+ *                  max_str_len, max_bin_len, max_array_len,
+ *                  max_map_len, max_ext_len)
+ *         if self.has_view:             # <<<<<<<<<<<<<<
+ *             self.ctx.user.ext_source = <PyObject*>self.source
+ * 
+ */
+  }
+
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":280
  *         self.buf = NULL
  * 
  *     def __init__(self, file_like=None, Py_ssize_t read_size=0, bint use_list=1,             # <<<<<<<<<<<<<<
@@ -6730,8 +7037,8 @@ static int __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_4__init__
   return __pyx_r;
 }
 
-/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":324
- *                  max_map_len, max_ext_len)
+/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":354
+ *             self.ctx.user.ext_source = <PyObject*>self.source
  * 
  *     def feed(self, object next_bytes):             # <<<<<<<<<<<<<<
  *         """Append `next_bytes` to internal buffer."""
@@ -6792,12 +7099,12 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 324, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 354, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "feed") < 0)) __PYX_ERR(0, 324, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "feed") < 0)) __PYX_ERR(0, 354, __pyx_L3_error)
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
@@ -6808,7 +7115,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("feed", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 324, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("feed", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 354, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -6855,7 +7162,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_6fe
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("feed", 1);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":327
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":357
  *         """Append `next_bytes` to internal buffer."""
  *         cdef Py_buffer pybuff
  *         if self.file_like is not None:             # <<<<<<<<<<<<<<
@@ -6865,20 +7172,20 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_6fe
   __pyx_t_1 = (__pyx_v_self->file_like != Py_None);
   if (unlikely(__pyx_t_1)) {
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":328
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":358
  *         cdef Py_buffer pybuff
  *         if self.file_like is not None:
  *             raise AssertionError("unpacker.feed() is not be able "             # <<<<<<<<<<<<<<
  *                                  "to use with `file_like`.")
- *         PyObject_GetBuffer(next_bytes, &pybuff, PyBUF_SIMPLE)
+ *         if self.has_view:
  */
-    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_AssertionError, __pyx_tuple__13, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 328, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_AssertionError, __pyx_tuple__14, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 358, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_Raise(__pyx_t_2, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __PYX_ERR(0, 328, __pyx_L1_error)
+    __PYX_ERR(0, 358, __pyx_L1_error)
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":327
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":357
  *         """Append `next_bytes` to internal buffer."""
  *         cdef Py_buffer pybuff
  *         if self.file_like is not None:             # <<<<<<<<<<<<<<
@@ -6887,17 +7194,48 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_6fe
  */
   }
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":330
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":360
+ *             raise AssertionError("unpacker.feed() is not be able "
+ *                                  "to use with `file_like`.")
+ *         if self.has_view:             # <<<<<<<<<<<<<<
  *             raise AssertionError("unpacker.feed() is not be able "
+ *                                  "to use with `buffer`.")
+ */
+  if (unlikely(__pyx_v_self->has_view)) {
+
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":361
  *                                  "to use with `file_like`.")
+ *         if self.has_view:
+ *             raise AssertionError("unpacker.feed() is not be able "             # <<<<<<<<<<<<<<
+ *                                  "to use with `buffer`.")
+ *         PyObject_GetBuffer(next_bytes, &pybuff, PyBUF_SIMPLE)
+ */
+    __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_AssertionError, __pyx_tuple__15, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 361, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 361, __pyx_L1_error)
+
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":360
+ *             raise AssertionError("unpacker.feed() is not be able "
+ *                                  "to use with `file_like`.")
+ *         if self.has_view:             # <<<<<<<<<<<<<<
+ *             raise AssertionError("unpacker.feed() is not be able "
+ *                                  "to use with `buffer`.")
+ */
+  }
+
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":363
+ *             raise AssertionError("unpacker.feed() is not be able "
+ *                                  "to use with `buffer`.")
  *         PyObject_GetBuffer(next_bytes, &pybuff, PyBUF_SIMPLE)             # <<<<<<<<<<<<<<
  *         try:
  *             self.append_buffer(<char*>pybuff.buf, pybuff.len)
  */
-  __pyx_t_3 = PyObject_GetBuffer(__pyx_v_next_bytes, (&__pyx_v_pybuff), PyBUF_SIMPLE); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 330, __pyx_L1_error)
+  __pyx_t_3 = PyObject_GetBuffer(__pyx_v_next_bytes, (&__pyx_v_pybuff), PyBUF_SIMPLE); if (unlikely(__pyx_t_3 == ((int)-1))) __PYX_ERR(0, 363, __pyx_L1_error)
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":331
- *                                  "to use with `file_like`.")
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":364
+ *                                  "to use with `buffer`.")
  *         PyObject_GetBuffer(next_bytes, &pybuff, PyBUF_SIMPLE)
  *         try:             # <<<<<<<<<<<<<<
  *             self.append_buffer(<char*>pybuff.buf, pybuff.len)
@@ -6905,19 +7243,19 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_6fe
  */
   /*try:*/ {
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":332
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":365
  *         PyObject_GetBuffer(next_bytes, &pybuff, PyBUF_SIMPLE)
  *         try:
  *             self.append_buffer(<char*>pybuff.buf, pybuff.len)             # <<<<<<<<<<<<<<
  *         finally:
  *             PyBuffer_Release(&pybuff)
  */
-    __pyx_t_2 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self->__pyx_vtab)->append_buffer(__pyx_v_self, ((char *)__pyx_v_pybuff.buf), __pyx_v_pybuff.len); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 332, __pyx_L5_error)
+    __pyx_t_2 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self->__pyx_vtab)->append_buffer(__pyx_v_self, ((char *)__pyx_v_pybuff.buf), __pyx_v_pybuff.len); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 365, __pyx_L6_error)
     __Pyx_GOTREF(__pyx_t_2);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   }
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":334
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":367
  *             self.append_buffer(<char*>pybuff.buf, pybuff.len)
  *         finally:
  *             PyBuffer_Release(&pybuff)             # <<<<<<<<<<<<<<
@@ -6927,9 +7265,9 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_6fe
   /*finally:*/ {
     /*normal exit:*/{
       PyBuffer_Release((&__pyx_v_pybuff));
-      goto __pyx_L6;
+      goto __pyx_L7;
     }
-    __pyx_L5_error:;
+    __pyx_L6_error:;
     /*exception exit:*/{
       __Pyx_PyThreadState_declare
       __Pyx_PyThreadState_assign
@@ -6961,11 +7299,11 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_6fe
       __pyx_lineno = __pyx_t_3; __pyx_clineno = __pyx_t_4; __pyx_filename = __pyx_t_5;
       goto __pyx_L1_error;
     }
-    __pyx_L6:;
+    __pyx_L7:;
   }
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":324
- *                  max_map_len, max_ext_len)
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":354
+ *             self.ctx.user.ext_source = <PyObject*>self.source
  * 
  *     def feed(self, object next_bytes):             # <<<<<<<<<<<<<<
  *         """Append `next_bytes` to internal buffer."""
@@ -6985,7 +7323,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_6fe
   return __pyx_r;
 }
 
-/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":336
+/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":369
  *             PyBuffer_Release(&pybuff)
  * 
  *     cdef append_buffer(self, void* _buf, Py_ssize_t _buf_len):             # <<<<<<<<<<<<<<
@@ -7013,7 +7351,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("append_buffer", 1);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":338
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":371
  *     cdef append_buffer(self, void* _buf, Py_ssize_t _buf_len):
  *         cdef:
  *             char* buf = self.buf             # <<<<<<<<<<<<<<
@@ -7023,7 +7361,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
   __pyx_t_1 = __pyx_v_self->buf;
   __pyx_v_buf = __pyx_t_1;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":340
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":373
  *             char* buf = self.buf
  *             char* new_buf
  *             size_t head = self.buf_head             # <<<<<<<<<<<<<<
@@ -7033,7 +7371,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
   __pyx_t_2 = __pyx_v_self->buf_head;
   __pyx_v_head = __pyx_t_2;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":341
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":374
  *             char* new_buf
  *             size_t head = self.buf_head
  *             size_t tail = self.buf_tail             # <<<<<<<<<<<<<<
@@ -7043,7 +7381,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
   __pyx_t_2 = __pyx_v_self->buf_tail;
   __pyx_v_tail = __pyx_t_2;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":342
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":375
  *             size_t head = self.buf_head
  *             size_t tail = self.buf_tail
  *             size_t buf_size = self.buf_size             # <<<<<<<<<<<<<<
@@ -7053,7 +7391,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
   __pyx_t_2 = __pyx_v_self->buf_size;
   __pyx_v_buf_size = __pyx_t_2;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":345
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":378
  *             size_t new_size
  * 
  *         if tail + _buf_len > buf_size:             # <<<<<<<<<<<<<<
@@ -7063,7 +7401,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
   __pyx_t_3 = ((__pyx_v_tail + __pyx_v__buf_len) > __pyx_v_buf_size);
   if (__pyx_t_3) {
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":346
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":379
  * 
  *         if tail + _buf_len > buf_size:
  *             if ((tail - head) + _buf_len) <= buf_size:             # <<<<<<<<<<<<<<
@@ -7073,7 +7411,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
     __pyx_t_3 = (((__pyx_v_tail - __pyx_v_head) + __pyx_v__buf_len) <= __pyx_v_buf_size);
     if (__pyx_t_3) {
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":348
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":381
  *             if ((tail - head) + _buf_len) <= buf_size:
  *                 # move to front.
  *                 memmove(buf, buf + head, tail - head)             # <<<<<<<<<<<<<<
@@ -7082,7 +7420,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
  */
       (void)(memmove(__pyx_v_buf, (__pyx_v_buf + __pyx_v_head), (__pyx_v_tail - __pyx_v_head)));
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":349
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":382
  *                 # move to front.
  *                 memmove(buf, buf + head, tail - head)
  *                 tail -= head             # <<<<<<<<<<<<<<
@@ -7091,7 +7429,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
  */
       __pyx_v_tail = (__pyx_v_tail - __pyx_v_head);
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":350
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":383
  *                 memmove(buf, buf + head, tail - head)
  *                 tail -= head
  *                 head = 0             # <<<<<<<<<<<<<<
@@ -7100,7 +7438,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
  */
       __pyx_v_head = 0;
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":346
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":379
  * 
  *         if tail + _buf_len > buf_size:
  *             if ((tail - head) + _buf_len) <= buf_size:             # <<<<<<<<<<<<<<
@@ -7110,7 +7448,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
       goto __pyx_L4;
     }
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":353
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":386
  *             else:
  *                 # expand buffer.
  *                 new_size = (tail - head) + _buf_len             # <<<<<<<<<<<<<<
@@ -7120,7 +7458,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
     /*else*/ {
       __pyx_v_new_size = ((__pyx_v_tail - __pyx_v_head) + __pyx_v__buf_len);
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":354
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":387
  *                 # expand buffer.
  *                 new_size = (tail - head) + _buf_len
  *                 if new_size > self.max_buffer_size:             # <<<<<<<<<<<<<<
@@ -7130,20 +7468,20 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
       __pyx_t_3 = (__pyx_v_new_size > __pyx_v_self->max_buffer_size);
       if (unlikely(__pyx_t_3)) {
 
-        /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":355
+        /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":388
  *                 new_size = (tail - head) + _buf_len
  *                 if new_size > self.max_buffer_size:
  *                     raise BufferFull             # <<<<<<<<<<<<<<
  *                 new_size = min(new_size * 2, self.max_buffer_size)
  *                 new_buf = <char*>malloc(new_size)
  */
-        __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_BufferFull); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 355, __pyx_L1_error)
+        __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_BufferFull); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 388, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
         __Pyx_Raise(__pyx_t_4, 0, 0, 0);
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __PYX_ERR(0, 355, __pyx_L1_error)
+        __PYX_ERR(0, 388, __pyx_L1_error)
 
-        /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":354
+        /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":387
  *                 # expand buffer.
  *                 new_size = (tail - head) + _buf_len
  *                 if new_size > self.max_buffer_size:             # <<<<<<<<<<<<<<
@@ -7152,7 +7490,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
  */
       }
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":356
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":389
  *                 if new_size > self.max_buffer_size:
  *                     raise BufferFull
  *                 new_size = min(new_size * 2, self.max_buffer_size)             # <<<<<<<<<<<<<<
@@ -7169,7 +7507,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
       }
       __pyx_v_new_size = __pyx_t_6;
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":357
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":390
  *                     raise BufferFull
  *                 new_size = min(new_size * 2, self.max_buffer_size)
  *                 new_buf = <char*>malloc(new_size)             # <<<<<<<<<<<<<<
@@ -7178,7 +7516,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
  */
       __pyx_v_new_buf = ((char *)malloc(__pyx_v_new_size));
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":358
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":391
  *                 new_size = min(new_size * 2, self.max_buffer_size)
  *                 new_buf = <char*>malloc(new_size)
  *                 if new_buf == NULL:             # <<<<<<<<<<<<<<
@@ -7188,20 +7526,20 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
       __pyx_t_3 = (__pyx_v_new_buf == NULL);
       if (unlikely(__pyx_t_3)) {
 
-        /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":361
+        /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":394
  *                     # self.buf still holds old buffer and will be freed during
  *                     # obj destruction
  *                     raise MemoryError("Unable to enlarge internal buffer.")             # <<<<<<<<<<<<<<
  *                 memcpy(new_buf, buf + head, tail - head)
  *                 free(buf)
  */
-        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_MemoryError, __pyx_tuple__14, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 361, __pyx_L1_error)
+        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_MemoryError, __pyx_tuple__16, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 394, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
         __Pyx_Raise(__pyx_t_4, 0, 0, 0);
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __PYX_ERR(0, 361, __pyx_L1_error)
+        __PYX_ERR(0, 394, __pyx_L1_error)
 
-        /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":358
+        /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":391
  *                 new_size = min(new_size * 2, self.max_buffer_size)
  *                 new_buf = <char*>malloc(new_size)
  *                 if new_buf == NULL:             # <<<<<<<<<<<<<<
@@ -7210,7 +7548,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
  */
       }
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":362
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":395
  *                     # obj destruction
  *                     raise MemoryError("Unable to enlarge internal buffer.")
  *                 memcpy(new_buf, buf + head, tail - head)             # <<<<<<<<<<<<<<
@@ -7219,7 +7557,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
  */
       (void)(memcpy(__pyx_v_new_buf, (__pyx_v_buf + __pyx_v_head), (__pyx_v_tail - __pyx_v_head)));
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":363
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":396
  *                     raise MemoryError("Unable to enlarge internal buffer.")
  *                 memcpy(new_buf, buf + head, tail - head)
  *                 free(buf)             # <<<<<<<<<<<<<<
@@ -7228,7 +7566,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
  */
       free(__pyx_v_buf);
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":365
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":398
  *                 free(buf)
  * 
  *                 buf = new_buf             # <<<<<<<<<<<<<<
@@ -7237,7 +7575,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
  */
       __pyx_v_buf = __pyx_v_new_buf;
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":366
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":399
  * 
  *                 buf = new_buf
  *                 buf_size = new_size             # <<<<<<<<<<<<<<
@@ -7246,7 +7584,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
  */
       __pyx_v_buf_size = __pyx_v_new_size;
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":367
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":400
  *                 buf = new_buf
  *                 buf_size = new_size
  *                 tail -= head             # <<<<<<<<<<<<<<
@@ -7255,7 +7593,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
  */
       __pyx_v_tail = (__pyx_v_tail - __pyx_v_head);
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":368
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":401
  *                 buf_size = new_size
  *                 tail -= head
  *                 head = 0             # <<<<<<<<<<<<<<
@@ -7266,7 +7604,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
     }
     __pyx_L4:;
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":345
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":378
  *             size_t new_size
  * 
  *         if tail + _buf_len > buf_size:             # <<<<<<<<<<<<<<
@@ -7275,7 +7613,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
  */
   }
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":370
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":403
  *                 head = 0
  * 
  *         memcpy(buf + tail, <char*>(_buf), _buf_len)             # <<<<<<<<<<<<<<
@@ -7284,7 +7622,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
  */
   (void)(memcpy((__pyx_v_buf + __pyx_v_tail), ((char *)__pyx_v__buf), __pyx_v__buf_len));
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":371
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":404
  * 
  *         memcpy(buf + tail, <char*>(_buf), _buf_len)
  *         self.buf = buf             # <<<<<<<<<<<<<<
@@ -7293,7 +7631,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
  */
   __pyx_v_self->buf = __pyx_v_buf;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":372
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":405
  *         memcpy(buf + tail, <char*>(_buf), _buf_len)
  *         self.buf = buf
  *         self.buf_head = head             # <<<<<<<<<<<<<<
@@ -7302,7 +7640,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
  */
   __pyx_v_self->buf_head = __pyx_v_head;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":373
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":406
  *         self.buf = buf
  *         self.buf_head = head
  *         self.buf_size = buf_size             # <<<<<<<<<<<<<<
@@ -7311,7 +7649,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
  */
   __pyx_v_self->buf_size = __pyx_v_buf_size;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":374
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":407
  *         self.buf_head = head
  *         self.buf_size = buf_size
  *         self.buf_tail = tail + _buf_len             # <<<<<<<<<<<<<<
@@ -7320,7 +7658,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
  */
   __pyx_v_self->buf_tail = (__pyx_v_tail + __pyx_v__buf_len);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":336
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":369
  *             PyBuffer_Release(&pybuff)
  * 
  *     cdef append_buffer(self, void* _buf, Py_ssize_t _buf_len):             # <<<<<<<<<<<<<<
@@ -7341,7 +7679,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_appe
   return __pyx_r;
 }
 
-/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":376
+/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":409
  *         self.buf_tail = tail + _buf_len
  * 
  *     cdef read_from_file(self):             # <<<<<<<<<<<<<<
@@ -7368,7 +7706,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_read
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("read_from_file", 1);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":379
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":412
  *         next_bytes = self.file_like_read(
  *             min(self.read_size,
  *                 self.max_buffer_size - (self.buf_tail - self.buf_head)))             # <<<<<<<<<<<<<<
@@ -7377,7 +7715,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_read
  */
   __pyx_t_2 = (__pyx_v_self->max_buffer_size - (__pyx_v_self->buf_tail - __pyx_v_self->buf_head));
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":378
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":411
  *     cdef read_from_file(self):
  *         next_bytes = self.file_like_read(
  *             min(self.read_size,             # <<<<<<<<<<<<<<
@@ -7386,7 +7724,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_read
  */
   __pyx_t_3 = __pyx_v_self->read_size;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":379
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":412
  *         next_bytes = self.file_like_read(
  *             min(self.read_size,
  *                 self.max_buffer_size - (self.buf_tail - self.buf_head)))             # <<<<<<<<<<<<<<
@@ -7399,7 +7737,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_read
   } else {
     __pyx_t_4 = __pyx_t_3;
   }
-  __pyx_t_6 = __Pyx_PyInt_FromSize_t(__pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 379, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyInt_FromSize_t(__pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 412, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_INCREF(__pyx_v_self->file_like_read);
   __pyx_t_7 = __pyx_v_self->file_like_read; __pyx_t_8 = NULL;
@@ -7421,53 +7759,53 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_read
     __pyx_t_1 = __Pyx_PyObject_FastCall(__pyx_t_7, __pyx_callargs+1-__pyx_t_9, 1+__pyx_t_9);
     __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 377, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 410, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
   }
   __pyx_v_next_bytes = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":380
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":413
  *             min(self.read_size,
  *                 self.max_buffer_size - (self.buf_tail - self.buf_head)))
  *         if next_bytes:             # <<<<<<<<<<<<<<
  *             self.append_buffer(PyBytes_AsString(next_bytes),
  *                                PyBytes_Size(next_bytes))
  */
-  __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_v_next_bytes); if (unlikely((__pyx_t_5 < 0))) __PYX_ERR(0, 380, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_v_next_bytes); if (unlikely((__pyx_t_5 < 0))) __PYX_ERR(0, 413, __pyx_L1_error)
   if (__pyx_t_5) {
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":381
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":414
  *                 self.max_buffer_size - (self.buf_tail - self.buf_head)))
  *         if next_bytes:
  *             self.append_buffer(PyBytes_AsString(next_bytes),             # <<<<<<<<<<<<<<
  *                                PyBytes_Size(next_bytes))
  *         else:
  */
-    __pyx_t_10 = PyBytes_AsString(__pyx_v_next_bytes); if (unlikely(__pyx_t_10 == ((char *)NULL))) __PYX_ERR(0, 381, __pyx_L1_error)
+    __pyx_t_10 = PyBytes_AsString(__pyx_v_next_bytes); if (unlikely(__pyx_t_10 == ((char *)NULL))) __PYX_ERR(0, 414, __pyx_L1_error)
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":382
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":415
  *         if next_bytes:
  *             self.append_buffer(PyBytes_AsString(next_bytes),
  *                                PyBytes_Size(next_bytes))             # <<<<<<<<<<<<<<
  *         else:
  *             self.file_like = None
  */
-    __pyx_t_3 = PyBytes_Size(__pyx_v_next_bytes); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1L))) __PYX_ERR(0, 382, __pyx_L1_error)
+    __pyx_t_3 = PyBytes_Size(__pyx_v_next_bytes); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1L))) __PYX_ERR(0, 415, __pyx_L1_error)
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":381
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":414
  *                 self.max_buffer_size - (self.buf_tail - self.buf_head)))
  *         if next_bytes:
  *             self.append_buffer(PyBytes_AsString(next_bytes),             # <<<<<<<<<<<<<<
  *                                PyBytes_Size(next_bytes))
  *         else:
  */
-    __pyx_t_1 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self->__pyx_vtab)->append_buffer(__pyx_v_self, __pyx_t_10, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 381, __pyx_L1_error)
+    __pyx_t_1 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self->__pyx_vtab)->append_buffer(__pyx_v_self, __pyx_t_10, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 414, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":380
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":413
  *             min(self.read_size,
  *                 self.max_buffer_size - (self.buf_tail - self.buf_head)))
  *         if next_bytes:             # <<<<<<<<<<<<<<
@@ -7477,7 +7815,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_read
     goto __pyx_L3;
   }
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":384
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":417
  *                                PyBytes_Size(next_bytes))
  *         else:
  *             self.file_like = None             # <<<<<<<<<<<<<<
@@ -7493,7 +7831,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_read
   }
   __pyx_L3:;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":376
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":409
  *         self.buf_tail = tail + _buf_len
  * 
  *     cdef read_from_file(self):             # <<<<<<<<<<<<<<
@@ -7518,7 +7856,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_read
   return __pyx_r;
 }
 
-/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":386
+/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":419
  *             self.file_like = None
  * 
  *     cdef object _unpack(self, execute_fn execute,             # <<<<<<<<<<<<<<
@@ -7552,7 +7890,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unp
     }
   }
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":392
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":425
  *         cdef size_t prev_head
  * 
  *         if self.buf_head >= self.buf_tail and self.file_like is not None:             # <<<<<<<<<<<<<<
@@ -7570,18 +7908,18 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unp
   __pyx_L4_bool_binop_done:;
   if (__pyx_t_1) {
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":393
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":426
  * 
  *         if self.buf_head >= self.buf_tail and self.file_like is not None:
  *             self.read_from_file()             # <<<<<<<<<<<<<<
  * 
  *         while 1:
  */
-    __pyx_t_3 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self->__pyx_vtab)->read_from_file(__pyx_v_self); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 393, __pyx_L1_error)
+    __pyx_t_3 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self->__pyx_vtab)->read_from_file(__pyx_v_self); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 426, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":392
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":425
  *         cdef size_t prev_head
  * 
  *         if self.buf_head >= self.buf_tail and self.file_like is not None:             # <<<<<<<<<<<<<<
@@ -7590,7 +7928,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unp
  */
   }
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":395
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":428
  *             self.read_from_file()
  * 
  *         while 1:             # <<<<<<<<<<<<<<
@@ -7599,7 +7937,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unp
  */
   while (1) {
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":396
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":429
  * 
  *         while 1:
  *             prev_head = self.buf_head             # <<<<<<<<<<<<<<
@@ -7609,7 +7947,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unp
     __pyx_t_4 = __pyx_v_self->buf_head;
     __pyx_v_prev_head = __pyx_t_4;
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":397
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":430
  *         while 1:
  *             prev_head = self.buf_head
  *             if prev_head >= self.buf_tail:             # <<<<<<<<<<<<<<
@@ -7619,7 +7957,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unp
     __pyx_t_1 = (__pyx_v_prev_head >= __pyx_v_self->buf_tail);
     if (__pyx_t_1) {
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":398
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":431
  *             prev_head = self.buf_head
  *             if prev_head >= self.buf_tail:
  *                 if iter:             # <<<<<<<<<<<<<<
@@ -7628,20 +7966,20 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unp
  */
       if (unlikely(__pyx_v_iter)) {
 
-        /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":399
+        /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":432
  *             if prev_head >= self.buf_tail:
  *                 if iter:
  *                     raise StopIteration("No more data to unpack.")             # <<<<<<<<<<<<<<
  *                 else:
  *                     raise OutOfData("No more data to unpack.")
  */
-        __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_StopIteration, __pyx_tuple__15, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 399, __pyx_L1_error)
+        __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_StopIteration, __pyx_tuple__17, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 432, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_3);
         __Pyx_Raise(__pyx_t_3, 0, 0, 0);
         __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __PYX_ERR(0, 399, __pyx_L1_error)
+        __PYX_ERR(0, 432, __pyx_L1_error)
 
-        /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":398
+        /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":431
  *             prev_head = self.buf_head
  *             if prev_head >= self.buf_tail:
  *                 if iter:             # <<<<<<<<<<<<<<
@@ -7650,7 +7988,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unp
  */
       }
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":401
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":434
  *                     raise StopIteration("No more data to unpack.")
  *                 else:
  *                     raise OutOfData("No more data to unpack.")             # <<<<<<<<<<<<<<
@@ -7658,7 +7996,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unp
  *             ret = execute(&self.ctx, self.buf, self.buf_tail, &self.buf_head)
  */
       /*else*/ {
-        __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_OutOfData); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 401, __pyx_L1_error)
+        __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_OutOfData); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 434, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_5);
         __pyx_t_6 = NULL;
         __pyx_t_7 = 0;
@@ -7678,16 +8016,16 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unp
           PyObject *__pyx_callargs[2] = {__pyx_t_6, __pyx_kp_s_No_more_data_to_unpack};
           __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_5, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
           __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-          if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 401, __pyx_L1_error)
+          if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 434, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_3);
           __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
         }
         __Pyx_Raise(__pyx_t_3, 0, 0, 0);
         __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __PYX_ERR(0, 401, __pyx_L1_error)
+        __PYX_ERR(0, 434, __pyx_L1_error)
       }
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":397
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":430
  *         while 1:
  *             prev_head = self.buf_head
  *             if prev_head >= self.buf_tail:             # <<<<<<<<<<<<<<
@@ -7696,17 +8034,17 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unp
  */
     }
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":403
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":436
  *                     raise OutOfData("No more data to unpack.")
  * 
  *             ret = execute(&self.ctx, self.buf, self.buf_tail, &self.buf_head)             # <<<<<<<<<<<<<<
  *             if write_bytes is not None:
  *                 write_bytes(PyBytes_FromStringAndSize(
  */
-    __pyx_t_8 = __pyx_v_execute((&__pyx_v_self->ctx), __pyx_v_self->buf, __pyx_v_self->buf_tail, (&__pyx_v_self->buf_head)); if (unlikely(__pyx_t_8 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 403, __pyx_L1_error)
+    __pyx_t_8 = __pyx_v_execute((&__pyx_v_self->ctx), __pyx_v_self->buf, __pyx_v_self->buf_tail, (&__pyx_v_self->buf_head)); if (unlikely(__pyx_t_8 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 436, __pyx_L1_error)
     __pyx_v_ret = __pyx_t_8;
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":404
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":437
  * 
  *             ret = execute(&self.ctx, self.buf, self.buf_tail, &self.buf_head)
  *             if write_bytes is not None:             # <<<<<<<<<<<<<<
@@ -7716,14 +8054,14 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unp
     __pyx_t_1 = (__pyx_v_write_bytes != Py_None);
     if (__pyx_t_1) {
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":405
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":438
  *             ret = execute(&self.ctx, self.buf, self.buf_tail, &self.buf_head)
  *             if write_bytes is not None:
  *                 write_bytes(PyBytes_FromStringAndSize(             # <<<<<<<<<<<<<<
  *                     self.buf + prev_head, self.buf_head - prev_head))
  * 
  */
-      __pyx_t_5 = PyBytes_FromStringAndSize((__pyx_v_self->buf + __pyx_v_prev_head), (__pyx_v_self->buf_head - __pyx_v_prev_head)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 405, __pyx_L1_error)
+      __pyx_t_5 = PyBytes_FromStringAndSize((__pyx_v_self->buf + __pyx_v_prev_head), (__pyx_v_self->buf_head - __pyx_v_prev_head)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 438, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_INCREF(__pyx_v_write_bytes);
       __pyx_t_6 = __pyx_v_write_bytes; __pyx_t_9 = NULL;
@@ -7745,13 +8083,13 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unp
         __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_6, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
         __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
         __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 405, __pyx_L1_error)
+        if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 438, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_3);
         __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
       }
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":404
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":437
  * 
  *             ret = execute(&self.ctx, self.buf, self.buf_tail, &self.buf_head)
  *             if write_bytes is not None:             # <<<<<<<<<<<<<<
@@ -7760,7 +8098,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unp
  */
     }
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":408
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":441
  *                     self.buf + prev_head, self.buf_head - prev_head))
  * 
  *             if ret == 1:             # <<<<<<<<<<<<<<
@@ -7770,19 +8108,19 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unp
     switch (__pyx_v_ret) {
       case 1:
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":409
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":442
  * 
  *             if ret == 1:
  *                 obj = unpack_data(&self.ctx)             # <<<<<<<<<<<<<<
  *                 unpack_init(&self.ctx)
  *                 return obj
  */
-      __pyx_t_3 = unpack_data((&__pyx_v_self->ctx)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 409, __pyx_L1_error)
+      __pyx_t_3 = unpack_data((&__pyx_v_self->ctx)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 442, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __pyx_v_obj = __pyx_t_3;
       __pyx_t_3 = 0;
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":410
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":443
  *             if ret == 1:
  *                 obj = unpack_data(&self.ctx)
  *                 unpack_init(&self.ctx)             # <<<<<<<<<<<<<<
@@ -7791,7 +8129,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unp
  */
       unpack_init((&__pyx_v_self->ctx));
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":411
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":444
  *                 obj = unpack_data(&self.ctx)
  *                 unpack_init(&self.ctx)
  *                 return obj             # <<<<<<<<<<<<<<
@@ -7803,7 +8141,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unp
       __pyx_r = __pyx_v_obj;
       goto __pyx_L0;
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":408
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":441
  *                     self.buf + prev_head, self.buf_head - prev_head))
  * 
  *             if ret == 1:             # <<<<<<<<<<<<<<
@@ -7813,7 +8151,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unp
       break;
       case 0:
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":413
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":446
  *                 return obj
  *             elif ret == 0:
  *                 if self.file_like is not None:             # <<<<<<<<<<<<<<
@@ -7823,18 +8161,18 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unp
       __pyx_t_1 = (__pyx_v_self->file_like != Py_None);
       if (__pyx_t_1) {
 
-        /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":414
+        /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":447
  *             elif ret == 0:
  *                 if self.file_like is not None:
  *                     self.read_from_file()             # <<<<<<<<<<<<<<
  *                     continue
  *                 if iter:
  */
-        __pyx_t_3 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self->__pyx_vtab)->read_from_file(__pyx_v_self); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 414, __pyx_L1_error)
+        __pyx_t_3 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self->__pyx_vtab)->read_from_file(__pyx_v_self); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 447, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_3);
         __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-        /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":415
+        /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":448
  *                 if self.file_like is not None:
  *                     self.read_from_file()
  *                     continue             # <<<<<<<<<<<<<<
@@ -7843,7 +8181,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unp
  */
         goto __pyx_L6_continue;
 
-        /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":413
+        /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":446
  *                 return obj
  *             elif ret == 0:
  *                 if self.file_like is not None:             # <<<<<<<<<<<<<<
@@ -7852,7 +8190,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unp
  */
       }
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":416
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":449
  *                     self.read_from_file()
  *                     continue
  *                 if iter:             # <<<<<<<<<<<<<<
@@ -7861,20 +8199,20 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unp
  */
       if (unlikely(__pyx_v_iter)) {
 
-        /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":417
+        /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":450
  *                     continue
  *                 if iter:
  *                     raise StopIteration("No more data to unpack.")             # <<<<<<<<<<<<<<
  *                 else:
  *                     raise OutOfData("No more data to unpack.")
  */
-        __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_StopIteration, __pyx_tuple__15, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 417, __pyx_L1_error)
+        __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_StopIteration, __pyx_tuple__17, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 450, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_3);
         __Pyx_Raise(__pyx_t_3, 0, 0, 0);
         __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __PYX_ERR(0, 417, __pyx_L1_error)
+        __PYX_ERR(0, 450, __pyx_L1_error)
 
-        /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":416
+        /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":449
  *                     self.read_from_file()
  *                     continue
  *                 if iter:             # <<<<<<<<<<<<<<
@@ -7883,7 +8221,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unp
  */
       }
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":419
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":452
  *                     raise StopIteration("No more data to unpack.")
  *                 else:
  *                     raise OutOfData("No more data to unpack.")             # <<<<<<<<<<<<<<
@@ -7891,7 +8229,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unp
  *                 raise ValueError("Unpack failed: error = %d" % (ret,))
  */
       /*else*/ {
-        __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_OutOfData); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 419, __pyx_L1_error)
+        __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_OutOfData); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 452, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_6);
         __pyx_t_5 = NULL;
         __pyx_t_7 = 0;
@@ -7911,16 +8249,16 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unp
           PyObject *__pyx_callargs[2] = {__pyx_t_5, __pyx_kp_s_No_more_data_to_unpack};
           __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_6, __pyx_callargs+1-__pyx_t_7, 1+__pyx_t_7);
           __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-          if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 419, __pyx_L1_error)
+          if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 452, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_3);
           __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
         }
         __Pyx_Raise(__pyx_t_3, 0, 0, 0);
         __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __PYX_ERR(0, 419, __pyx_L1_error)
+        __PYX_ERR(0, 452, __pyx_L1_error)
       }
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":412
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":445
  *                 unpack_init(&self.ctx)
  *                 return obj
  *             elif ret == 0:             # <<<<<<<<<<<<<<
@@ -7930,35 +8268,35 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unp
       break;
       default:
 
-      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":421
+      /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":454
  *                     raise OutOfData("No more data to unpack.")
  *             else:
  *                 raise ValueError("Unpack failed: error = %d" % (ret,))             # <<<<<<<<<<<<<<
  * 
  *     def read_bytes(self, Py_ssize_t nbytes):
  */
-      __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_ret); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 421, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_ret); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 454, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 421, __pyx_L1_error)
+      __pyx_t_6 = PyTuple_New(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 454, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_GIVEREF(__pyx_t_3);
-      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_3)) __PYX_ERR(0, 421, __pyx_L1_error);
+      if (__Pyx_PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_3)) __PYX_ERR(0, 454, __pyx_L1_error);
       __pyx_t_3 = 0;
-      __pyx_t_3 = __Pyx_PyString_Format(__pyx_kp_s_Unpack_failed_error_d, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 421, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyString_Format(__pyx_kp_s_Unpack_failed_error_d, __pyx_t_6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 454, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __pyx_t_6 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 421, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_3); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 454, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __Pyx_Raise(__pyx_t_6, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __PYX_ERR(0, 421, __pyx_L1_error)
+      __PYX_ERR(0, 454, __pyx_L1_error)
       break;
     }
     __pyx_L6_continue:;
   }
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":386
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":419
  *             self.file_like = None
  * 
  *     cdef object _unpack(self, execute_fn execute,             # <<<<<<<<<<<<<<
@@ -7983,7 +8321,7 @@ static PyObject *__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unp
   return __pyx_r;
 }
 
-/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":423
+/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":456
  *                 raise ValueError("Unpack failed: error = %d" % (ret,))
  * 
  *     def read_bytes(self, Py_ssize_t nbytes):             # <<<<<<<<<<<<<<
@@ -8045,23 +8383,23 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
           (void)__Pyx_Arg_NewRef_FASTCALL(values[0]);
           kw_args--;
         }
-        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 423, __pyx_L3_error)
+        else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 456, __pyx_L3_error)
         else goto __pyx_L5_argtuple_error;
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "read_bytes") < 0)) __PYX_ERR(0, 423, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "read_bytes") < 0)) __PYX_ERR(0, 456, __pyx_L3_error)
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_Arg_FASTCALL(__pyx_args, 0);
     }
-    __pyx_v_nbytes = __Pyx_PyIndex_AsSsize_t(values[0]); if (unlikely((__pyx_v_nbytes == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 423, __pyx_L3_error)
+    __pyx_v_nbytes = __Pyx_PyIndex_AsSsize_t(values[0]); if (unlikely((__pyx_v_nbytes == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 456, __pyx_L3_error)
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("read_bytes", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 423, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("read_bytes", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 456, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -8108,7 +8446,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_8re
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("read_bytes", 1);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":426
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":459
  *         """Read a specified number of raw bytes from the stream"""
  *         cdef size_t nread
  *         nread = min(self.buf_tail - self.buf_head, nbytes)             # <<<<<<<<<<<<<<
@@ -8125,19 +8463,19 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_8re
   }
   __pyx_v_nread = __pyx_t_3;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":427
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":460
  *         cdef size_t nread
  *         nread = min(self.buf_tail - self.buf_head, nbytes)
  *         ret = PyBytes_FromStringAndSize(self.buf + self.buf_head, nread)             # <<<<<<<<<<<<<<
  *         self.buf_head += nread
  *         if len(ret) < nbytes and self.file_like is not None:
  */
-  __pyx_t_5 = PyBytes_FromStringAndSize((__pyx_v_self->buf + __pyx_v_self->buf_head), __pyx_v_nread); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 427, __pyx_L1_error)
+  __pyx_t_5 = PyBytes_FromStringAndSize((__pyx_v_self->buf + __pyx_v_self->buf_head), __pyx_v_nread); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 460, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __pyx_v_ret = __pyx_t_5;
   __pyx_t_5 = 0;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":428
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":461
  *         nread = min(self.buf_tail - self.buf_head, nbytes)
  *         ret = PyBytes_FromStringAndSize(self.buf + self.buf_head, nread)
  *         self.buf_head += nread             # <<<<<<<<<<<<<<
@@ -8146,14 +8484,14 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_8re
  */
   __pyx_v_self->buf_head = (__pyx_v_self->buf_head + __pyx_v_nread);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":429
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":462
  *         ret = PyBytes_FromStringAndSize(self.buf + self.buf_head, nread)
  *         self.buf_head += nread
  *         if len(ret) < nbytes and self.file_like is not None:             # <<<<<<<<<<<<<<
  *             ret += self.file_like.read(nbytes - len(ret))
  *         return ret
  */
-  __pyx_t_1 = PyObject_Length(__pyx_v_ret); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 429, __pyx_L1_error)
+  __pyx_t_1 = PyObject_Length(__pyx_v_ret); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 462, __pyx_L1_error)
   __pyx_t_6 = (__pyx_t_1 < __pyx_v_nbytes);
   if (__pyx_t_6) {
   } else {
@@ -8165,17 +8503,17 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_8re
   __pyx_L4_bool_binop_done:;
   if (__pyx_t_4) {
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":430
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":463
  *         self.buf_head += nread
  *         if len(ret) < nbytes and self.file_like is not None:
  *             ret += self.file_like.read(nbytes - len(ret))             # <<<<<<<<<<<<<<
  *         return ret
  * 
  */
-    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->file_like, __pyx_n_s_read); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 430, __pyx_L1_error)
+    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_self->file_like, __pyx_n_s_read); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 463, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_1 = PyObject_Length(__pyx_v_ret); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 430, __pyx_L1_error)
-    __pyx_t_8 = PyInt_FromSsize_t((__pyx_v_nbytes - __pyx_t_1)); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 430, __pyx_L1_error)
+    __pyx_t_1 = PyObject_Length(__pyx_v_ret); if (unlikely(__pyx_t_1 == ((Py_ssize_t)-1))) __PYX_ERR(0, 463, __pyx_L1_error)
+    __pyx_t_8 = PyInt_FromSsize_t((__pyx_v_nbytes - __pyx_t_1)); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 463, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_8);
     __pyx_t_9 = NULL;
     __pyx_t_10 = 0;
@@ -8196,17 +8534,17 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_8re
       __pyx_t_5 = __Pyx_PyObject_FastCall(__pyx_t_7, __pyx_callargs+1-__pyx_t_10, 1+__pyx_t_10);
       __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 430, __pyx_L1_error)
+      if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 463, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
     }
-    __pyx_t_7 = PyNumber_InPlaceAdd(__pyx_v_ret, __pyx_t_5); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 430, __pyx_L1_error)
+    __pyx_t_7 = PyNumber_InPlaceAdd(__pyx_v_ret, __pyx_t_5); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 463, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
     __Pyx_DECREF_SET(__pyx_v_ret, __pyx_t_7);
     __pyx_t_7 = 0;
 
-    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":429
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":462
  *         ret = PyBytes_FromStringAndSize(self.buf + self.buf_head, nread)
  *         self.buf_head += nread
  *         if len(ret) < nbytes and self.file_like is not None:             # <<<<<<<<<<<<<<
@@ -8215,7 +8553,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_8re
  */
   }
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":431
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":464
  *         if len(ret) < nbytes and self.file_like is not None:
  *             ret += self.file_like.read(nbytes - len(ret))
  *         return ret             # <<<<<<<<<<<<<<
@@ -8227,7 +8565,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_8re
   __pyx_r = __pyx_v_ret;
   goto __pyx_L0;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":423
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":456
  *                 raise ValueError("Unpack failed: error = %d" % (ret,))
  * 
  *     def read_bytes(self, Py_ssize_t nbytes):             # <<<<<<<<<<<<<<
@@ -8250,7 +8588,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_8re
   return __pyx_r;
 }
 
-/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":433
+/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":466
  *         return ret
  * 
  *     def unpack(self, object write_bytes=None):             # <<<<<<<<<<<<<<
@@ -8312,12 +8650,12 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_write_bytes);
           if (value) { values[0] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 433, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 466, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "unpack") < 0)) __PYX_ERR(0, 433, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "unpack") < 0)) __PYX_ERR(0, 466, __pyx_L3_error)
       }
     } else {
       switch (__pyx_nargs) {
@@ -8331,7 +8669,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("unpack", 0, 0, 1, __pyx_nargs); __PYX_ERR(0, 433, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("unpack", 0, 0, 1, __pyx_nargs); __PYX_ERR(0, 466, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -8367,7 +8705,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_10u
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("unpack", 1);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":441
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":474
  *         Raises `OutOfData` when there are no more bytes to unpack.
  *         """
  *         return self._unpack(unpack_construct, write_bytes)             # <<<<<<<<<<<<<<
@@ -8375,13 +8713,13 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_10u
  *     def skip(self, object write_bytes=None):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self->__pyx_vtab)->_unpack(__pyx_v_self, unpack_construct, __pyx_v_write_bytes, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 441, __pyx_L1_error)
+  __pyx_t_1 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self->__pyx_vtab)->_unpack(__pyx_v_self, unpack_construct, __pyx_v_write_bytes, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 474, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":433
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":466
  *         return ret
  * 
  *     def unpack(self, object write_bytes=None):             # <<<<<<<<<<<<<<
@@ -8400,7 +8738,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_10u
   return __pyx_r;
 }
 
-/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":443
+/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":476
  *         return self._unpack(unpack_construct, write_bytes)
  * 
  *     def skip(self, object write_bytes=None):             # <<<<<<<<<<<<<<
@@ -8462,12 +8800,12 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_write_bytes);
           if (value) { values[0] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 443, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 476, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "skip") < 0)) __PYX_ERR(0, 443, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "skip") < 0)) __PYX_ERR(0, 476, __pyx_L3_error)
       }
     } else {
       switch (__pyx_nargs) {
@@ -8481,7 +8819,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("skip", 0, 0, 1, __pyx_nargs); __PYX_ERR(0, 443, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("skip", 0, 0, 1, __pyx_nargs); __PYX_ERR(0, 476, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -8517,7 +8855,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_12s
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("skip", 1);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":451
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":484
  *         Raises `OutOfData` when there are no more bytes to unpack.
  *         """
  *         return self._unpack(unpack_skip, write_bytes)             # <<<<<<<<<<<<<<
@@ -8525,13 +8863,13 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_12s
  *     def read_array_header(self, object write_bytes=None):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self->__pyx_vtab)->_unpack(__pyx_v_self, unpack_skip, __pyx_v_write_bytes, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 451, __pyx_L1_error)
+  __pyx_t_1 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self->__pyx_vtab)->_unpack(__pyx_v_self, unpack_skip, __pyx_v_write_bytes, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 484, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":443
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":476
  *         return self._unpack(unpack_construct, write_bytes)
  * 
  *     def skip(self, object write_bytes=None):             # <<<<<<<<<<<<<<
@@ -8550,7 +8888,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_12s
   return __pyx_r;
 }
 
-/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":453
+/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":486
  *         return self._unpack(unpack_skip, write_bytes)
  * 
  *     def read_array_header(self, object write_bytes=None):             # <<<<<<<<<<<<<<
@@ -8612,12 +8950,12 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_write_bytes);
           if (value) { values[0] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 453, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 486, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "read_array_header") < 0)) __PYX_ERR(0, 453, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "read_array_header") < 0)) __PYX_ERR(0, 486, __pyx_L3_error)
       }
     } else {
       switch (__pyx_nargs) {
@@ -8631,7 +8969,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("read_array_header", 0, 0, 1, __pyx_nargs); __PYX_ERR(0, 453, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("read_array_header", 0, 0, 1, __pyx_nargs); __PYX_ERR(0, 486, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -8667,7 +9005,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_14r
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("read_array_header", 1);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":459
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":492
  *         Raises `OutOfData` when there are no more bytes to unpack.
  *         """
  *         return self._unpack(read_array_header, write_bytes)             # <<<<<<<<<<<<<<
@@ -8675,13 +9013,13 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_14r
  *     def read_map_header(self, object write_bytes=None):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self->__pyx_vtab)->_unpack(__pyx_v_self, read_array_header, __pyx_v_write_bytes, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 459, __pyx_L1_error)
+  __pyx_t_1 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self->__pyx_vtab)->_unpack(__pyx_v_self, read_array_header, __pyx_v_write_bytes, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 492, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":453
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":486
  *         return self._unpack(unpack_skip, write_bytes)
  * 
  *     def read_array_header(self, object write_bytes=None):             # <<<<<<<<<<<<<<
@@ -8700,7 +9038,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_14r
   return __pyx_r;
 }
 
-/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":461
+/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":494
  *         return self._unpack(read_array_header, write_bytes)
  * 
  *     def read_map_header(self, object write_bytes=None):             # <<<<<<<<<<<<<<
@@ -8762,12 +9100,12 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
         if (kw_args > 0) {
           PyObject* value = __Pyx_GetKwValue_FASTCALL(__pyx_kwds, __pyx_kwvalues, __pyx_n_s_write_bytes);
           if (value) { values[0] = __Pyx_Arg_NewRef_FASTCALL(value); kw_args--; }
-          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 461, __pyx_L3_error)
+          else if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 494, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
         const Py_ssize_t kwd_pos_args = __pyx_nargs;
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "read_map_header") < 0)) __PYX_ERR(0, 461, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values + 0, kwd_pos_args, "read_map_header") < 0)) __PYX_ERR(0, 494, __pyx_L3_error)
       }
     } else {
       switch (__pyx_nargs) {
@@ -8781,7 +9119,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("read_map_header", 0, 0, 1, __pyx_nargs); __PYX_ERR(0, 461, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("read_map_header", 0, 0, 1, __pyx_nargs); __PYX_ERR(0, 494, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -8798,51 +9136,242 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_16read_map_header(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self), __pyx_v_write_bytes);
 
   /* function exit code */
-  {
-    Py_ssize_t __pyx_temp;
-    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
-    }
-  }
+  {
+    Py_ssize_t __pyx_temp;
+    for (__pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+      __Pyx_Arg_XDECREF_FASTCALL(values[__pyx_temp]);
+    }
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_16read_map_header(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self, PyObject *__pyx_v_write_bytes) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("read_map_header", 1);
+
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":500
+ *         Raises `OutOfData` when there are no more bytes to unpack.
+ *         """
+ *         return self._unpack(read_map_header, write_bytes)             # <<<<<<<<<<<<<<
+ * 
+ *     def peek_type(self):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self->__pyx_vtab)->_unpack(__pyx_v_self, read_map_header, __pyx_v_write_bytes, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 500, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":494
+ *         return self._unpack(read_array_header, write_bytes)
+ * 
+ *     def read_map_header(self, object write_bytes=None):             # <<<<<<<<<<<<<<
+ *         """assuming the next object is a map, return its size n, such that the
+ *         next n * 2 unpack() calls will iterate over its key-value pairs.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._unpacker.Unpacker.read_map_header", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":502
+ *         return self._unpack(read_map_header, write_bytes)
+ * 
+ *     def peek_type(self):             # <<<<<<<<<<<<<<
+ *         """return the first byte of the next object, which tells its type,
+ *         without consuming it
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_19peek_type(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_18peek_type, "Unpacker.peek_type(self)\nreturn the first byte of the next object, which tells its type,\n        without consuming it\n\n        Raises `OutOfData` when there are no more bytes to unpack.\n        ");
+static PyMethodDef __pyx_mdef_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_19peek_type = {"peek_type", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_19peek_type, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_18peek_type};
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_19peek_type(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("peek_type (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_MACROS
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) {
+    __Pyx_RaiseArgtupleInvalid("peek_type", 1, 0, 0, __pyx_nargs); return NULL;}
+  if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "peek_type", 0))) return NULL;
+  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_18peek_type(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self));
+
+  /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_16read_map_header(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self, PyObject *__pyx_v_write_bytes) {
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_18peek_type(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  unsigned int __pyx_t_6;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("read_map_header", 1);
+  __Pyx_RefNannySetupContext("peek_type", 1);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":467
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":508
  *         Raises `OutOfData` when there are no more bytes to unpack.
  *         """
- *         return self._unpack(read_map_header, write_bytes)             # <<<<<<<<<<<<<<
+ *         if self.buf_head >= self.buf_tail and self.file_like is not None:             # <<<<<<<<<<<<<<
+ *             self.read_from_file()
+ *         if self.buf_head >= self.buf_tail:
+ */
+  __pyx_t_2 = (__pyx_v_self->buf_head >= __pyx_v_self->buf_tail);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_self->file_like != Py_None);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":509
+ *         """
+ *         if self.buf_head >= self.buf_tail and self.file_like is not None:
+ *             self.read_from_file()             # <<<<<<<<<<<<<<
+ *         if self.buf_head >= self.buf_tail:
+ *             raise OutOfData("No more data to unpack.")
+ */
+    __pyx_t_3 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self->__pyx_vtab)->read_from_file(__pyx_v_self); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 509, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":508
+ *         Raises `OutOfData` when there are no more bytes to unpack.
+ *         """
+ *         if self.buf_head >= self.buf_tail and self.file_like is not None:             # <<<<<<<<<<<<<<
+ *             self.read_from_file()
+ *         if self.buf_head >= self.buf_tail:
+ */
+  }
+
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":510
+ *         if self.buf_head >= self.buf_tail and self.file_like is not None:
+ *             self.read_from_file()
+ *         if self.buf_head >= self.buf_tail:             # <<<<<<<<<<<<<<
+ *             raise OutOfData("No more data to unpack.")
+ *         return <unsigned char>self.buf[self.buf_head]
+ */
+  __pyx_t_1 = (__pyx_v_self->buf_head >= __pyx_v_self->buf_tail);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":511
+ *             self.read_from_file()
+ *         if self.buf_head >= self.buf_tail:
+ *             raise OutOfData("No more data to unpack.")             # <<<<<<<<<<<<<<
+ *         return <unsigned char>self.buf[self.buf_head]
+ * 
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_OutOfData); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 511, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = NULL;
+    __pyx_t_6 = 0;
+    #if CYTHON_UNPACK_METHODS
+    if (unlikely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_5)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_5);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+        __pyx_t_6 = 1;
+      }
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_5, __pyx_kp_s_No_more_data_to_unpack};
+      __pyx_t_3 = __Pyx_PyObject_FastCall(__pyx_t_4, __pyx_callargs+1-__pyx_t_6, 1+__pyx_t_6);
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 511, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    }
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 511, __pyx_L1_error)
+
+    /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":510
+ *         if self.buf_head >= self.buf_tail and self.file_like is not None:
+ *             self.read_from_file()
+ *         if self.buf_head >= self.buf_tail:             # <<<<<<<<<<<<<<
+ *             raise OutOfData("No more data to unpack.")
+ *         return <unsigned char>self.buf[self.buf_head]
+ */
+  }
+
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":512
+ *         if self.buf_head >= self.buf_tail:
+ *             raise OutOfData("No more data to unpack.")
+ *         return <unsigned char>self.buf[self.buf_head]             # <<<<<<<<<<<<<<
  * 
  *     def __iter__(self):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self->__pyx_vtab)->_unpack(__pyx_v_self, read_map_header, __pyx_v_write_bytes, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 467, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+  __pyx_t_3 = __Pyx_PyInt_From_unsigned_char(((unsigned char)(__pyx_v_self->buf[__pyx_v_self->buf_head]))); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 512, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_r = __pyx_t_3;
+  __pyx_t_3 = 0;
   goto __pyx_L0;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":461
- *         return self._unpack(read_array_header, write_bytes)
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":502
+ *         return self._unpack(read_map_header, write_bytes)
  * 
- *     def read_map_header(self, object write_bytes=None):             # <<<<<<<<<<<<<<
- *         """assuming the next object is a map, return its size n, such that the
- *         next n * 2 unpack() calls will iterate over its key-value pairs.
+ *     def peek_type(self):             # <<<<<<<<<<<<<<
+ *         """return the first byte of the next object, which tells its type,
+ *         without consuming it
  */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._unpacker.Unpacker.read_map_header", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("isf_pandas_msgpack.msgpack._unpacker.Unpacker.peek_type", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -8850,8 +9379,8 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_16r
   return __pyx_r;
 }
 
-/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":469
- *         return self._unpack(read_map_header, write_bytes)
+/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":514
+ *         return <unsigned char>self.buf[self.buf_head]
  * 
  *     def __iter__(self):             # <<<<<<<<<<<<<<
  *         return self
@@ -8859,26 +9388,26 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_16r
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_19__iter__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_19__iter__(PyObject *__pyx_v_self) {
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_21__iter__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_21__iter__(PyObject *__pyx_v_self) {
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__iter__ (wrapper)", 0);
   __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
-  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_18__iter__(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self));
+  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_20__iter__(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_18__iter__(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self) {
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_20__iter__(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__iter__", 1);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":470
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":515
  * 
  *     def __iter__(self):
  *         return self             # <<<<<<<<<<<<<<
@@ -8890,8 +9419,8 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_18_
   __pyx_r = ((PyObject *)__pyx_v_self);
   goto __pyx_L0;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":469
- *         return self._unpack(read_map_header, write_bytes)
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":514
+ *         return <unsigned char>self.buf[self.buf_head]
  * 
  *     def __iter__(self):             # <<<<<<<<<<<<<<
  *         return self
@@ -8905,7 +9434,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_18_
   return __pyx_r;
 }
 
-/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":472
+/* "isf_pandas_msgpack/msgpack/_unpacker.pyx":517
  *         return self
  * 
  *     def __next__(self):             # <<<<<<<<<<<<<<
@@ -8914,21 +9443,21 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_18_
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_21__next__(PyObject *__pyx_v_self); /*proto*/
-static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_21__next__(PyObject *__pyx_v_self) {
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_23__next__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_23__next__(PyObject *__pyx_v_self) {
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__next__ (wrapper)", 0);
   __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
-  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_20__next__(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self));
+  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_22__next__(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_20__next__(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self) {
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_22__next__(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -8938,7 +9467,7 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_20_
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__next__", 1);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":473
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":518
  * 
  *     def __next__(self):
  *         return self._unpack(unpack_construct, None, 1)             # <<<<<<<<<<<<<<
@@ -8948,13 +9477,13 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_20_
   __Pyx_XDECREF(__pyx_r);
   __pyx_t_2.__pyx_n = 1;
   __pyx_t_2.iter = 1;
-  __pyx_t_1 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self->__pyx_vtab)->_unpack(__pyx_v_self, unpack_construct, Py_None, &__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 473, __pyx_L1_error)
+  __pyx_t_1 = ((struct __pyx_vtabstruct_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self->__pyx_vtab)->_unpack(__pyx_v_self, unpack_construct, Py_None, &__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 518, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":472
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":517
  *         return self
  * 
  *     def __next__(self):             # <<<<<<<<<<<<<<
@@ -8980,16 +9509,16 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_20_
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_23__reduce_cython__(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_25__reduce_cython__(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-PyDoc_STRVAR(__pyx_doc_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_22__reduce_cython__, "Unpacker.__reduce_cython__(self)");
-static PyMethodDef __pyx_mdef_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_23__reduce_cython__ = {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_23__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_22__reduce_cython__};
-static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_23__reduce_cython__(PyObject *__pyx_v_self, 
+PyDoc_STRVAR(__pyx_doc_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_24__reduce_cython__, "Unpacker.__reduce_cython__(self)");
+static PyMethodDef __pyx_mdef_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_25__reduce_cython__ = {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_25__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_24__reduce_cython__};
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_25__reduce_cython__(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -9014,14 +9543,14 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   if (unlikely(__pyx_nargs > 0)) {
     __Pyx_RaiseArgtupleInvalid("__reduce_cython__", 1, 0, 0, __pyx_nargs); return NULL;}
   if (unlikely(__pyx_kwds) && __Pyx_NumKwargs_FASTCALL(__pyx_kwds) && unlikely(!__Pyx_CheckKeywordStrings(__pyx_kwds, "__reduce_cython__", 0))) return NULL;
-  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_22__reduce_cython__(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self));
+  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_24__reduce_cython__(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_22__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self) {
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_24__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_lineno = 0;
@@ -9061,16 +9590,16 @@ static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_22_
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_25__setstate_cython__(PyObject *__pyx_v_self, 
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_27__setstate_cython__(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-PyDoc_STRVAR(__pyx_doc_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_24__setstate_cython__, "Unpacker.__setstate_cython__(self, __pyx_state)");
-static PyMethodDef __pyx_mdef_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_25__setstate_cython__ = {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_25__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_24__setstate_cython__};
-static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_25__setstate_cython__(PyObject *__pyx_v_self, 
+PyDoc_STRVAR(__pyx_doc_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_26__setstate_cython__, "Unpacker.__setstate_cython__(self, __pyx_state)");
+static PyMethodDef __pyx_mdef_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_27__setstate_cython__ = {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_27__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_26__setstate_cython__};
+static PyObject *__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_27__setstate_cython__(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
@@ -9144,7 +9673,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_24__setstate_cython__(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self), __pyx_v___pyx_state);
+  __pyx_r = __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_26__setstate_cython__(((struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *)__pyx_v_self), __pyx_v___pyx_state);
 
   /* function exit code */
   {
@@ -9157,7 +9686,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_24__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_26__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_lineno = 0;
@@ -9215,6 +9744,8 @@ static PyObject *__pyx_tp_new_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker(
   p->ext_hook = Py_None; Py_INCREF(Py_None);
   p->encoding = Py_None; Py_INCREF(Py_None);
   p->unicode_errors = Py_None; Py_INCREF(Py_None);
+  p->source = Py_None; Py_INCREF(Py_None);
+  p->view.obj = NULL;
   if (unlikely(__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_1__cinit__(o, __pyx_empty_tuple, NULL) < 0)) goto bad;
   return o;
   bad:
@@ -9249,6 +9780,7 @@ static void __pyx_tp_dealloc_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker(P
   Py_CLEAR(p->ext_hook);
   Py_CLEAR(p->encoding);
   Py_CLEAR(p->unicode_errors);
+  Py_CLEAR(p->source);
   #if CYTHON_USE_TYPE_SLOTS || CYTHON_COMPILING_IN_PYPY
   (*Py_TYPE(o)->tp_free)(o);
   #else
@@ -9286,6 +9818,12 @@ static int __pyx_tp_traverse_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker(P
   if (p->unicode_errors) {
     e = (*v)(p->unicode_errors, a); if (e) return e;
   }
+  if (p->source) {
+    e = (*v)(p->source, a); if (e) return e;
+  }
+  if (p->view.obj) {
+    e = (*v)(p->view.obj, a); if (e) return e;
+  }
   return 0;
 }
 
@@ -9316,11 +9854,15 @@ static int __pyx_tp_clear_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker(PyOb
   tmp = ((PyObject*)p->unicode_errors);
   p->unicode_errors = Py_None; Py_INCREF(Py_None);
   Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->source);
+  p->source = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  Py_CLEAR(p->view.obj);
   return 0;
 }
 
-static PyObject *__pyx_specialmethod___pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_21__next__(PyObject *self, CYTHON_UNUSED PyObject *arg) {
-  PyObject *res = __pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_21__next__(self);
+static PyObject *__pyx_specialmethod___pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_23__next__(PyObject *self, CYTHON_UNUSED PyObject *arg) {
+  PyObject *res = __pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_23__next__(self);
   if (!res && !PyErr_Occurred()) { PyErr_SetNone(PyExc_StopIteration); }
   return res;
 }
@@ -9332,19 +9874,20 @@ static PyMethodDef __pyx_methods_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpack
   {"skip", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_13skip, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_12skip},
   {"read_array_header", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_15read_array_header, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_14read_array_header},
   {"read_map_header", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_17read_map_header, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_16read_map_header},
-  {"__next__", (PyCFunction)__pyx_specialmethod___pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_21__next__, METH_NOARGS|METH_COEXIST, 0},
-  {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_23__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_22__reduce_cython__},
-  {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_25__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_24__setstate_cython__},
+  {"peek_type", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_19peek_type, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_18peek_type},
+  {"__next__", (PyCFunction)__pyx_specialmethod___pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_23__next__, METH_NOARGS|METH_COEXIST, 0},
+  {"__reduce_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_25__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_24__reduce_cython__},
+  {"__setstate_cython__", (PyCFunction)(void*)(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_27__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_26__setstate_cython__},
   {0, 0, 0, 0}
 };
 #if CYTHON_USE_TYPE_SPECS
 static PyType_Slot __pyx_type_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker_slots[] = {
   {Py_tp_dealloc, (void *)__pyx_tp_dealloc_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker},
-  {Py_tp_doc, (void *)PyDoc_STR("Unpacker(file_like=None, Py_ssize_t read_size=0, bool use_list=1, object_hook=None, object_pairs_hook=None, list_hook=None, encoding=None, unicode_errors='strict', int max_buffer_size=0, ext_hook=ExtType, Py_ssize_t max_str_len=2147483647, Py_ssize_t max_bin_len=2147483647, Py_ssize_t max_array_len=2147483647, Py_ssize_t max_map_len=2147483647, Py_ssize_t max_ext_len=2147483647)\nStreaming unpacker.\n\n    arguments:\n\n    :param file_like:\n        File-like object having `.read(n)` method.\n        If specified, unpacker reads serialized data from it and\n        :meth:`feed()` is not usable.\n\n    :param int read_size:\n        Used as `file_like.read(read_size)`. (default:\n        `min(1024**2, max_buffer_size)`)\n\n    :param bool use_list:\n        If true, unpack msgpack array to Python list.\n        Otherwise, unpack to Python tuple. (default: True)\n\n    :param callable object_hook:\n        When specified, it should be callable.\n        Unpacker calls it with a dict argument after unpacking msgpack map.\n        (See also simplejson)\n\n    :param callable object_pairs_hook:\n        When specified, it should be callable. Unpacker calls it with a list\n        of key-value pairs after unpacking msgpack map. (See also simplejson)\n\n    :param str encoding:\n        Encoding used for decoding msgpack raw.\n        If it is None (default), msgpack raw is deserialized to Python bytes.\n\n    :param str unicode_errors:\n        Used for decoding msgpack raw with *encoding*.\n        (default: `'strict'`)\n\n    :param int max_buffer_size:\n        Limits size of data waiting unpacked.  0 means system's\n        INT_MAX  (default). Raises `BufferFull` exception when it\n        is insufficient. You shoud set this parameter when unpacking\n        data from untrasted source.\n\n    :param int max_str_len:\n        Limits max length of str. (default: 2**31-1)\n\n    :param int max_bin_len:\n        Limits max length of bin. (default: 2**31-1)\n\n    :param ""int max_array_len:\n        Limits max length of array. (default: 2**31-1)\n\n    :param int max_map_len:\n        Limits max length of map. (default: 2**31-1)\n\n\n    example of streaming deserialize from file-like object::\n\n        unpacker = Unpacker(file_like)\n        for o in unpacker:\n            process(o)\n\n    example of streaming deserialize from socket::\n\n        unpacker = Unpacker()\n        while True:\n            buf = sock.recv(1024**2)\n            if not buf:\n                break\n            unpacker.feed(buf)\n            for o in unpacker:\n                process(o)\n    ")},
+  {Py_tp_doc, (void *)PyDoc_STR("Unpacker(file_like=None, Py_ssize_t read_size=0, bool use_list=1, object_hook=None, object_pairs_hook=None, list_hook=None, encoding=None, unicode_errors='strict', int max_buffer_size=0, ext_hook=ExtType, Py_ssize_t max_str_len=2147483647, Py_ssize_t max_bin_len=2147483647, Py_ssize_t max_array_len=2147483647, Py_ssize_t max_map_len=2147483647, Py_ssize_t max_ext_len=2147483647, buffer=None)\nStreaming unpacker.\n\n    arguments:\n\n    :param file_like:\n        File-like object having `.read(n)` method.\n        If specified, unpacker reads serialized data from it and\n        :meth:`feed()` is not usable.\n\n    :param int read_size:\n        Used as `file_like.read(read_size)`. (default:\n        `min(1024**2, max_buffer_size)`)\n\n    :param bool use_list:\n        If true, unpack msgpack array to Python list.\n        Otherwise, unpack to Python tuple. (default: True)\n\n    :param callable object_hook:\n        When specified, it should be callable.\n        Unpacker calls it with a dict argument after unpacking msgpack map.\n        (See also simplejson)\n\n    :param callable object_pairs_hook:\n        When specified, it should be callable. Unpacker calls it with a list\n        of key-value pairs after unpacking msgpack map. (See also simplejson)\n\n    :param str encoding:\n        Encoding used for decoding msgpack raw.\n        If it is None (default), msgpack raw is deserialized to Python bytes.\n\n    :param str unicode_errors:\n        Used for decoding msgpack raw with *encoding*.\n        (default: `'strict'`)\n\n    :param int max_buffer_size:\n        Limits size of data waiting unpacked.  0 means system's\n        INT_MAX  (default). Raises `BufferFull` exception when it\n        is insufficient. You shoud set this parameter when unpacking\n        data from untrasted source.\n\n    :param int max_str_len:\n        Limits max length of str. (default: 2**31-1)\n\n    :param int max_bin_len:\n        Limits max length of bin. (default: 2**31-1)""\n\n    :param int max_array_len:\n        Limits max length of array. (default: 2**31-1)\n\n    :param int max_map_len:\n        Limits max length of map. (default: 2**31-1)\n\n    :param buffer:\n        Object supporting the buffer protocol to unpack from in place.\n        Nothing is copied into the internal buffer and ext payloads are\n        passed to *ext_hook* as memoryview slices of *buffer*, which keep\n        it alive. Can't be combined with *file_like* or :meth:`feed()`.\n\n\n    example of streaming deserialize from file-like object::\n\n        unpacker = Unpacker(file_like)\n        for o in unpacker:\n            process(o)\n\n    example of streaming deserialize from socket::\n\n        unpacker = Unpacker()\n        while True:\n            buf = sock.recv(1024**2)\n            if not buf:\n                break\n            unpacker.feed(buf)\n            for o in unpacker:\n                process(o)\n    ")},
   {Py_tp_traverse, (void *)__pyx_tp_traverse_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker},
   {Py_tp_clear, (void *)__pyx_tp_clear_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker},
-  {Py_tp_iter, (void *)__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_19__iter__},
-  {Py_tp_iternext, (void *)__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_21__next__},
+  {Py_tp_iter, (void *)__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_21__iter__},
+  {Py_tp_iternext, (void *)__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_23__next__},
   {Py_tp_methods, (void *)__pyx_methods_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker},
   {Py_tp_init, (void *)__pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_5__init__},
   {Py_tp_new, (void *)__pyx_tp_new_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker},
@@ -9390,13 +9933,13 @@ static PyTypeObject __pyx_type_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker
   0, /*tp_setattro*/
   0, /*tp_as_buffer*/
   Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  PyDoc_STR("Unpacker(file_like=None, Py_ssize_t read_size=0, bool use_list=1, object_hook=None, object_pairs_hook=None, list_hook=None, encoding=None, unicode_errors='strict', int max_buffer_size=0, ext_hook=ExtType, Py_ssize_t max_str_len=2147483647, Py_ssize_t max_bin_len=2147483647, Py_ssize_t max_array_len=2147483647, Py_ssize_t max_map_len=2147483647, Py_ssize_t max_ext_len=2147483647)\nStreaming unpacker.\n\n    arguments:\n\n    :param file_like:\n        File-like object having `.read(n)` method.\n        If specified, unpacker reads serialized data from it and\n        :meth:`feed()` is not usable.\n\n    :param int read_size:\n        Used as `file_like.read(read_size)`. (default:\n        `min(1024**2, max_buffer_size)`)\n\n    :param bool use_list:\n        If true, unpack msgpack array to Python list.\n        Otherwise, unpack to Python tuple. (default: True)\n\n    :param callable object_hook:\n        When specified, it should be callable.\n        Unpacker calls it with a dict argument after unpacking msgpack map.\n        (See also simplejson)\n\n    :param callable object_pairs_hook:\n        When specified, it should be callable. Unpacker calls it with a list\n        of key-value pairs after unpacking msgpack map. (See also simplejson)\n\n    :param str encoding:\n        Encoding used for decoding msgpack raw.\n        If it is None (default), msgpack raw is deserialized to Python bytes.\n\n    :param str unicode_errors:\n        Used for decoding msgpack raw with *encoding*.\n        (default: `'strict'`)\n\n    :param int max_buffer_size:\n        Limits size of data waiting unpacked.  0 means system's\n        INT_MAX  (default). Raises `BufferFull` exception when it\n        is insufficient. You shoud set this parameter when unpacking\n        data from untrasted source.\n\n    :param int max_str_len:\n        Limits max length of str. (default: 2**31-1)\n\n    :param int max_bin_len:\n        Limits max length of bin. (default: 2**31-1)\n\n    :param ""int max_array_len:\n        Limits max length of array. (default: 2**31-1)\n\n    :param int max_map_len:\n        Limits max length of map. (default: 2**31-1)\n\n\n    example of streaming deserialize from file-like object::\n\n        unpacker = Unpacker(file_like)\n        for o in unpacker:\n            process(o)\n\n    example of streaming deserialize from socket::\n\n        unpacker = Unpacker()\n        while True:\n            buf = sock.recv(1024**2)\n            if not buf:\n                break\n            unpacker.feed(buf)\n            for o in unpacker:\n                process(o)\n    "), /*tp_doc*/
+  PyDoc_STR("Unpacker(file_like=None, Py_ssize_t read_size=0, bool use_list=1, object_hook=None, object_pairs_hook=None, list_hook=None, encoding=None, unicode_errors='strict', int max_buffer_size=0, ext_hook=ExtType, Py_ssize_t max_str_len=2147483647, Py_ssize_t max_bin_len=2147483647, Py_ssize_t max_array_len=2147483647, Py_ssize_t max_map_len=2147483647, Py_ssize_t max_ext_len=2147483647, buffer=None)\nStreaming unpacker.\n\n    arguments:\n\n    :param file_like:\n        File-like object having `.read(n)` method.\n        If specified, unpacker reads serialized data from it and\n        :meth:`feed()` is not usable.\n\n    :param int read_size:\n        Used as `file_like.read(read_size)`. (default:\n        `min(1024**2, max_buffer_size)`)\n\n    :param bool use_list:\n        If true, unpack msgpack array to Python list.\n        Otherwise, unpack to Python tuple. (default: True)\n\n    :param callable object_hook:\n        When specified, it should be callable.\n        Unpacker calls it with a dict argument after unpacking msgpack map.\n        (See also simplejson)\n\n    :param callable object_pairs_hook:\n        When specified, it should be callable. Unpacker calls it with a list\n        of key-value pairs after unpacking msgpack map. (See also simplejson)\n\n    :param str encoding:\n        Encoding used for decoding msgpack raw.\n        If it is None (default), msgpack raw is deserialized to Python bytes.\n\n    :param str unicode_errors:\n        Used for decoding msgpack raw with *encoding*.\n        (default: `'strict'`)\n\n    :param int max_buffer_size:\n        Limits size of data waiting unpacked.  0 means system's\n        INT_MAX  (default). Raises `BufferFull` exception when it\n        is insufficient. You shoud set this parameter when unpacking\n        data from untrasted source.\n\n    :param int max_str_len:\n        Limits max length of str. (default: 2**31-1)\n\n    :param int max_bin_len:\n        Limits max length of bin. (default: 2**31-1)""\n\n    :param int max_array_len:\n        Limits max length of array. (default: 2**31-1)\n\n    :param int max_map_len:\n        Limits max length of map. (default: 2**31-1)\n\n    :param buffer:\n        Object supporting the buffer protocol to unpack from in place.\n        Nothing is copied into the internal buffer and ext payloads are\n        passed to *ext_hook* as memoryview slices of *buffer*, which keep\n        it alive. Can't be combined with *file_like* or :meth:`feed()`.\n\n\n    example of streaming deserialize from file-like object::\n\n        unpacker = Unpacker(file_like)\n        for o in unpacker:\n            process(o)\n\n    example of streaming deserialize from socket::\n\n        unpacker = Unpacker()\n        while True:\n            buf = sock.recv(1024**2)\n            if not buf:\n                break\n            unpacker.feed(buf)\n            for o in unpacker:\n                process(o)\n    "), /*tp_doc*/
   __pyx_tp_traverse_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker, /*tp_traverse*/
   __pyx_tp_clear_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker, /*tp_clear*/
   0, /*tp_richcompare*/
   0, /*tp_weaklistoffset*/
-  __pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_19__iter__, /*tp_iter*/
-  __pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_21__next__, /*tp_iternext*/
+  __pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_21__iter__, /*tp_iter*/
+  __pyx_pw_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_23__next__, /*tp_iternext*/
   __pyx_methods_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker, /*tp_methods*/
   0, /*tp_members*/
   0, /*tp_getset*/
@@ -9461,6 +10004,7 @@ static PyMethodDef __pyx_methods[] = {
 static int __Pyx_CreateStringTabAndInitStrings(void) {
   __Pyx_StringTabEntry __pyx_string_tab[] = {
     {&__pyx_n_s_AssertionError, __pyx_k_AssertionError, sizeof(__pyx_k_AssertionError), 0, 0, 1, 1},
+    {&__pyx_n_s_B, __pyx_k_B, sizeof(__pyx_k_B), 0, 0, 1, 1},
     {&__pyx_n_s_BufferFull, __pyx_k_BufferFull, sizeof(__pyx_k_BufferFull), 0, 0, 1, 1},
     {&__pyx_kp_s_Cannot_decode_extended_type_with, __pyx_k_Cannot_decode_extended_type_with, sizeof(__pyx_k_Cannot_decode_extended_type_with), 0, 0, 1, 0},
     {&__pyx_n_s_ExtType, __pyx_k_ExtType, sizeof(__pyx_k_ExtType), 0, 0, 1, 1},
@@ -9480,19 +10024,22 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_s_Unpacker___reduce_cython, __pyx_k_Unpacker___reduce_cython, sizeof(__pyx_k_Unpacker___reduce_cython), 0, 0, 1, 1},
     {&__pyx_n_s_Unpacker___setstate_cython, __pyx_k_Unpacker___setstate_cython, sizeof(__pyx_k_Unpacker___setstate_cython), 0, 0, 1, 1},
     {&__pyx_n_s_Unpacker_feed, __pyx_k_Unpacker_feed, sizeof(__pyx_k_Unpacker_feed), 0, 0, 1, 1},
+    {&__pyx_n_s_Unpacker_peek_type, __pyx_k_Unpacker_peek_type, sizeof(__pyx_k_Unpacker_peek_type), 0, 0, 1, 1},
     {&__pyx_n_s_Unpacker_read_array_header, __pyx_k_Unpacker_read_array_header, sizeof(__pyx_k_Unpacker_read_array_header), 0, 0, 1, 1},
     {&__pyx_n_s_Unpacker_read_bytes, __pyx_k_Unpacker_read_bytes, sizeof(__pyx_k_Unpacker_read_bytes), 0, 0, 1, 1},
     {&__pyx_n_s_Unpacker_read_map_header, __pyx_k_Unpacker_read_map_header, sizeof(__pyx_k_Unpacker_read_map_header), 0, 0, 1, 1},
     {&__pyx_n_s_Unpacker_skip, __pyx_k_Unpacker_skip, sizeof(__pyx_k_Unpacker_skip), 0, 0, 1, 1},
     {&__pyx_n_s_Unpacker_unpack, __pyx_k_Unpacker_unpack, sizeof(__pyx_k_Unpacker_unpack), 0, 0, 1, 1},
     {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
-    {&__pyx_kp_u__16, __pyx_k__16, sizeof(__pyx_k__16), 0, 1, 0, 0},
-    {&__pyx_n_s__17, __pyx_k__17, sizeof(__pyx_k__17), 0, 0, 1, 1},
-    {&__pyx_n_s__38, __pyx_k__38, sizeof(__pyx_k__38), 0, 0, 1, 1},
+    {&__pyx_kp_u__18, __pyx_k__18, sizeof(__pyx_k__18), 0, 1, 0, 0},
+    {&__pyx_n_s__19, __pyx_k__19, sizeof(__pyx_k__19), 0, 0, 1, 1},
+    {&__pyx_n_s__41, __pyx_k__41, sizeof(__pyx_k__41), 0, 0, 1, 1},
     {&__pyx_n_s_ascii, __pyx_k_ascii, sizeof(__pyx_k_ascii), 0, 0, 1, 1},
     {&__pyx_n_s_asyncio_coroutines, __pyx_k_asyncio_coroutines, sizeof(__pyx_k_asyncio_coroutines), 0, 0, 1, 1},
     {&__pyx_n_s_buf, __pyx_k_buf, sizeof(__pyx_k_buf), 0, 0, 1, 1},
     {&__pyx_n_s_buf_len, __pyx_k_buf_len, sizeof(__pyx_k_buf_len), 0, 0, 1, 1},
+    {&__pyx_n_s_buffer, __pyx_k_buffer, sizeof(__pyx_k_buffer), 0, 0, 1, 1},
+    {&__pyx_n_s_cast, __pyx_k_cast, sizeof(__pyx_k_cast), 0, 0, 1, 1},
     {&__pyx_n_s_cenc, __pyx_k_cenc, sizeof(__pyx_k_cenc), 0, 0, 1, 1},
     {&__pyx_n_s_cerr, __pyx_k_cerr, sizeof(__pyx_k_cerr), 0, 0, 1, 1},
     {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
@@ -9509,6 +10056,7 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_kp_s_ext_hook_must_be_a_callable, __pyx_k_ext_hook_must_be_a_callable, sizeof(__pyx_k_ext_hook_must_be_a_callable), 0, 0, 1, 0},
     {&__pyx_n_s_feed, __pyx_k_feed, sizeof(__pyx_k_feed), 0, 0, 1, 1},
     {&__pyx_n_s_file_like, __pyx_k_file_like, sizeof(__pyx_k_file_like), 0, 0, 1, 1},
+    {&__pyx_kp_s_file_like_and_buffer_are_mutuall, __pyx_k_file_like_and_buffer_are_mutuall, sizeof(__pyx_k_file_like_and_buffer_are_mutuall), 0, 0, 1, 0},
     {&__pyx_kp_s_file_like_read_must_be_a_callab, __pyx_k_file_like_read_must_be_a_callab, sizeof(__pyx_k_file_like_read_must_be_a_callab), 0, 0, 1, 0},
     {&__pyx_kp_u_gc, __pyx_k_gc, sizeof(__pyx_k_gc), 0, 1, 0, 0},
     {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
@@ -9539,6 +10087,7 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_kp_s_object_pairs_hook_must_be_a_call, __pyx_k_object_pairs_hook_must_be_a_call, sizeof(__pyx_k_object_pairs_hook_must_be_a_call), 0, 0, 1, 0},
     {&__pyx_n_s_off, __pyx_k_off, sizeof(__pyx_k_off), 0, 0, 1, 1},
     {&__pyx_n_s_packed, __pyx_k_packed, sizeof(__pyx_k_packed), 0, 0, 1, 1},
+    {&__pyx_n_s_peek_type, __pyx_k_peek_type, sizeof(__pyx_k_peek_type), 0, 0, 1, 1},
     {&__pyx_n_s_pybuff, __pyx_k_pybuff, sizeof(__pyx_k_pybuff), 0, 0, 1, 1},
     {&__pyx_n_s_pyx_state, __pyx_k_pyx_state, sizeof(__pyx_k_pyx_state), 0, 0, 1, 1},
     {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
@@ -9566,6 +10115,7 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
     {&__pyx_n_s_unpack, __pyx_k_unpack, sizeof(__pyx_k_unpack), 0, 0, 1, 1},
     {&__pyx_n_s_unpackb, __pyx_k_unpackb, sizeof(__pyx_k_unpackb), 0, 0, 1, 1},
     {&__pyx_kp_s_unpacker_feed_is_not_be_able_to, __pyx_k_unpacker_feed_is_not_be_able_to, sizeof(__pyx_k_unpacker_feed_is_not_be_able_to), 0, 0, 1, 0},
+    {&__pyx_kp_s_unpacker_feed_is_not_be_able_to_2, __pyx_k_unpacker_feed_is_not_be_able_to_2, sizeof(__pyx_k_unpacker_feed_is_not_be_able_to_2), 0, 0, 1, 0},
     {&__pyx_n_s_use_list, __pyx_k_use_list, sizeof(__pyx_k_use_list), 0, 0, 1, 1},
     {&__pyx_n_s_view, __pyx_k_view, sizeof(__pyx_k_view), 0, 0, 1, 1},
     {&__pyx_n_s_write_bytes, __pyx_k_write_bytes, sizeof(__pyx_k_write_bytes), 0, 0, 1, 1},
@@ -9575,12 +10125,12 @@ static int __Pyx_CreateStringTabAndInitStrings(void) {
 }
 /* #### Code section: cached_builtins ### */
 static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(0, 67, __pyx_L1_error)
-  __pyx_builtin_NotImplementedError = __Pyx_GetBuiltinName(__pyx_n_s_NotImplementedError); if (!__pyx_builtin_NotImplementedError) __PYX_ERR(0, 98, __pyx_L1_error)
-  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 129, __pyx_L1_error)
-  __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(0, 296, __pyx_L1_error)
-  __pyx_builtin_AssertionError = __Pyx_GetBuiltinName(__pyx_n_s_AssertionError); if (!__pyx_builtin_AssertionError) __PYX_ERR(0, 328, __pyx_L1_error)
-  __pyx_builtin_StopIteration = __Pyx_GetBuiltinName(__pyx_n_s_StopIteration); if (!__pyx_builtin_StopIteration) __PYX_ERR(0, 399, __pyx_L1_error)
+  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(0, 69, __pyx_L1_error)
+  __pyx_builtin_NotImplementedError = __Pyx_GetBuiltinName(__pyx_n_s_NotImplementedError); if (!__pyx_builtin_NotImplementedError) __PYX_ERR(0, 100, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 131, __pyx_L1_error)
+  __pyx_builtin_MemoryError = __Pyx_GetBuiltinName(__pyx_n_s_MemoryError); if (!__pyx_builtin_MemoryError) __PYX_ERR(0, 325, __pyx_L1_error)
+  __pyx_builtin_AssertionError = __Pyx_GetBuiltinName(__pyx_n_s_AssertionError); if (!__pyx_builtin_AssertionError) __PYX_ERR(0, 358, __pyx_L1_error)
+  __pyx_builtin_StopIteration = __Pyx_GetBuiltinName(__pyx_n_s_StopIteration); if (!__pyx_builtin_StopIteration) __PYX_ERR(0, 432, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -9591,271 +10141,302 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":67
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":69
  * 
  *     if object_hook is not None and object_pairs_hook is not None:
  *         raise TypeError("object_pairs_hook and object_hook "             # <<<<<<<<<<<<<<
  *                         "are mutually exclusive.")
  * 
  */
-  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_s_object_pairs_hook_and_object_hoo); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 67, __pyx_L1_error)
+  __pyx_tuple_ = PyTuple_Pack(1, __pyx_kp_s_object_pairs_hook_and_object_hoo); if (unlikely(!__pyx_tuple_)) __PYX_ERR(0, 69, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple_);
   __Pyx_GIVEREF(__pyx_tuple_);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":72
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":74
  *     if object_hook is not None:
  *         if not PyCallable_Check(object_hook):
  *             raise TypeError("object_hook must be a callable.")             # <<<<<<<<<<<<<<
  *         ctx.user.object_hook = <PyObject*>object_hook
  * 
  */
-  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_s_object_hook_must_be_a_callable); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 72, __pyx_L1_error)
+  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_s_object_hook_must_be_a_callable); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 74, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__2);
   __Pyx_GIVEREF(__pyx_tuple__2);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":79
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":81
  *     else:
  *         if not PyCallable_Check(object_pairs_hook):
  *             raise TypeError("object_pairs_hook must be a callable.")             # <<<<<<<<<<<<<<
  *         ctx.user.object_hook = <PyObject*>object_pairs_hook
  *         ctx.user.has_pairs_hook = True
  */
-  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_s_object_pairs_hook_must_be_a_call); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 79, __pyx_L1_error)
+  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_s_object_pairs_hook_must_be_a_call); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 81, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__3);
   __Pyx_GIVEREF(__pyx_tuple__3);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":85
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":87
  *     if list_hook is not None:
  *         if not PyCallable_Check(list_hook):
  *             raise TypeError("list_hook must be a callable.")             # <<<<<<<<<<<<<<
  *         ctx.user.list_hook = <PyObject*>list_hook
  * 
  */
-  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_s_list_hook_must_be_a_callable); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 85, __pyx_L1_error)
+  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_s_list_hook_must_be_a_callable); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(0, 87, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__4);
   __Pyx_GIVEREF(__pyx_tuple__4);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":90
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":92
  *     if ext_hook is not None:
  *         if not PyCallable_Check(ext_hook):
  *             raise TypeError("ext_hook must be a callable.")             # <<<<<<<<<<<<<<
  *         ctx.user.ext_hook = <PyObject*>ext_hook
  * 
  */
-  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_s_ext_hook_must_be_a_callable); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(0, 90, __pyx_L1_error)
+  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_s_ext_hook_must_be_a_callable); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(0, 92, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__5);
   __Pyx_GIVEREF(__pyx_tuple__5);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":129
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":131
  *     # PyObject_AsReadBuffer(packed, <const void**>&buf, &buf_len)
  *     if PyObject_GetBuffer(packed, &view, PyBUF_SIMPLE) < 0:
  *         raise ValueError("Unable to get buffer view")             # <<<<<<<<<<<<<<
  *     buf = <char*>view.buf
  *     buf_len = view.len
  */
-  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_s_Unable_to_get_buffer_view); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 129, __pyx_L1_error)
+  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_s_Unable_to_get_buffer_view); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 131, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__6);
   __Pyx_GIVEREF(__pyx_tuple__6);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":284
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":302
  *             self.file_like_read = file_like.read
  *             if not PyCallable_Check(self.file_like_read):
  *                 raise TypeError("`file_like.read` must be a callable.")             # <<<<<<<<<<<<<<
  *         if not max_buffer_size:
  *             max_buffer_size = INT_MAX
  */
-  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_kp_s_file_like_read_must_be_a_callab); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(0, 284, __pyx_L1_error)
+  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_kp_s_file_like_read_must_be_a_callab); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(0, 302, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__8);
   __Pyx_GIVEREF(__pyx_tuple__8);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":288
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":306
  *             max_buffer_size = INT_MAX
  *         if read_size > max_buffer_size:
  *             raise ValueError("read_size should be less or "             # <<<<<<<<<<<<<<
  *                              "equal to max_buffer_size")
  *         if not read_size:
  */
-  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_s_read_size_should_be_less_or_equa); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(0, 288, __pyx_L1_error)
+  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_s_read_size_should_be_less_or_equa); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(0, 306, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__9);
   __Pyx_GIVEREF(__pyx_tuple__9);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":296
- *         self.buf = <char*>malloc(read_size)
- *         if self.buf == NULL:
- *             raise MemoryError("Unable to allocate internal buffer.")             # <<<<<<<<<<<<<<
- *         self.buf_size = read_size
- *         self.buf_head = 0
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":315
+ *         if buffer is not None:
+ *             if file_like is not None:
+ *                 raise TypeError("file_like and buffer are mutually exclusive.")             # <<<<<<<<<<<<<<
+ *             self.source = memoryview(buffer).cast('B')
+ *             PyObject_GetBuffer(self.source, &self.view, PyBUF_SIMPLE)
  */
-  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_kp_s_Unable_to_allocate_internal_buff); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(0, 296, __pyx_L1_error)
+  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_kp_s_file_like_and_buffer_are_mutuall); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(0, 315, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__10);
   __Pyx_GIVEREF(__pyx_tuple__10);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":307
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":325
+ *             self.buf = <char*>malloc(read_size)
+ *             if self.buf == NULL:
+ *                 raise MemoryError("Unable to allocate internal buffer.")             # <<<<<<<<<<<<<<
+ *             self.buf_size = read_size
+ *             self.buf_tail = 0
+ */
+  __pyx_tuple__11 = PyTuple_Pack(1, __pyx_kp_s_Unable_to_allocate_internal_buff); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(0, 325, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__11);
+  __Pyx_GIVEREF(__pyx_tuple__11);
+
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":335
  *                 self.encoding = encoding
  *             else:
  *                 raise TypeError("encoding should be bytes or unicode")             # <<<<<<<<<<<<<<
  *             cenc = PyBytes_AsString(self.encoding)
  * 
  */
-  __pyx_tuple__11 = PyTuple_Pack(1, __pyx_kp_s_encoding_should_be_bytes_or_unic); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(0, 307, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__11);
-  __Pyx_GIVEREF(__pyx_tuple__11);
+  __pyx_tuple__12 = PyTuple_Pack(1, __pyx_kp_s_encoding_should_be_bytes_or_unic); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(0, 335, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__12);
+  __Pyx_GIVEREF(__pyx_tuple__12);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":316
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":344
  *                 self.unicode_errors = unicode_errors
  *             else:
  *                 raise TypeError("unicode_errors should be bytes or unicode")             # <<<<<<<<<<<<<<
  *             cerr = PyBytes_AsString(self.unicode_errors)
  * 
  */
-  __pyx_tuple__12 = PyTuple_Pack(1, __pyx_kp_s_unicode_errors_should_be_bytes_o); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(0, 316, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__12);
-  __Pyx_GIVEREF(__pyx_tuple__12);
+  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_kp_s_unicode_errors_should_be_bytes_o); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(0, 344, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__13);
+  __Pyx_GIVEREF(__pyx_tuple__13);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":328
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":358
  *         cdef Py_buffer pybuff
  *         if self.file_like is not None:
  *             raise AssertionError("unpacker.feed() is not be able "             # <<<<<<<<<<<<<<
  *                                  "to use with `file_like`.")
- *         PyObject_GetBuffer(next_bytes, &pybuff, PyBUF_SIMPLE)
+ *         if self.has_view:
  */
-  __pyx_tuple__13 = PyTuple_Pack(1, __pyx_kp_s_unpacker_feed_is_not_be_able_to); if (unlikely(!__pyx_tuple__13)) __PYX_ERR(0, 328, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__13);
-  __Pyx_GIVEREF(__pyx_tuple__13);
+  __pyx_tuple__14 = PyTuple_Pack(1, __pyx_kp_s_unpacker_feed_is_not_be_able_to); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(0, 358, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__14);
+  __Pyx_GIVEREF(__pyx_tuple__14);
 
   /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":361
+ *                                  "to use with `file_like`.")
+ *         if self.has_view:
+ *             raise AssertionError("unpacker.feed() is not be able "             # <<<<<<<<<<<<<<
+ *                                  "to use with `buffer`.")
+ *         PyObject_GetBuffer(next_bytes, &pybuff, PyBUF_SIMPLE)
+ */
+  __pyx_tuple__15 = PyTuple_Pack(1, __pyx_kp_s_unpacker_feed_is_not_be_able_to_2); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(0, 361, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__15);
+  __Pyx_GIVEREF(__pyx_tuple__15);
+
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":394
  *                     # self.buf still holds old buffer and will be freed during
  *                     # obj destruction
  *                     raise MemoryError("Unable to enlarge internal buffer.")             # <<<<<<<<<<<<<<
  *                 memcpy(new_buf, buf + head, tail - head)
  *                 free(buf)
  */
-  __pyx_tuple__14 = PyTuple_Pack(1, __pyx_kp_s_Unable_to_enlarge_internal_buffe); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(0, 361, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__14);
-  __Pyx_GIVEREF(__pyx_tuple__14);
+  __pyx_tuple__16 = PyTuple_Pack(1, __pyx_kp_s_Unable_to_enlarge_internal_buffe); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(0, 394, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__16);
+  __Pyx_GIVEREF(__pyx_tuple__16);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":399
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":432
  *             if prev_head >= self.buf_tail:
  *                 if iter:
  *                     raise StopIteration("No more data to unpack.")             # <<<<<<<<<<<<<<
  *                 else:
  *                     raise OutOfData("No more data to unpack.")
  */
-  __pyx_tuple__15 = PyTuple_Pack(1, __pyx_kp_s_No_more_data_to_unpack); if (unlikely(!__pyx_tuple__15)) __PYX_ERR(0, 399, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__15);
-  __Pyx_GIVEREF(__pyx_tuple__15);
+  __pyx_tuple__17 = PyTuple_Pack(1, __pyx_kp_s_No_more_data_to_unpack); if (unlikely(!__pyx_tuple__17)) __PYX_ERR(0, 432, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__17);
+  __Pyx_GIVEREF(__pyx_tuple__17);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":97
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":99
  * 
  * 
  * def default_read_extended_type(typecode, data):             # <<<<<<<<<<<<<<
  *     raise NotImplementedError("Cannot decode extended type "
  *                               "with typecode=%d" % typecode)
  */
-  __pyx_tuple__18 = PyTuple_Pack(2, __pyx_n_s_typecode, __pyx_n_s_data); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(0, 97, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__18);
-  __Pyx_GIVEREF(__pyx_tuple__18);
-  __pyx_codeobj__19 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__unpa, __pyx_n_s_default_read_extended_type, 97, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__19)) __PYX_ERR(0, 97, __pyx_L1_error)
+  __pyx_tuple__20 = PyTuple_Pack(2, __pyx_n_s_typecode, __pyx_n_s_data); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(0, 99, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__20);
+  __Pyx_GIVEREF(__pyx_tuple__20);
+  __pyx_codeobj__21 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__20, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__unpa, __pyx_n_s_default_read_extended_type, 99, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__21)) __PYX_ERR(0, 99, __pyx_L1_error)
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":102
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":104
  * 
  * 
  * def unpackb(object packed, object object_hook=None, object list_hook=None,             # <<<<<<<<<<<<<<
  *             bint use_list=1, encoding=None, unicode_errors="strict",
  *             object_pairs_hook=None, ext_hook=ExtType,
  */
-  __pyx_tuple__20 = PyTuple_Pack(22, __pyx_n_s_packed, __pyx_n_s_object_hook, __pyx_n_s_list_hook, __pyx_n_s_use_list, __pyx_n_s_encoding, __pyx_n_s_unicode_errors, __pyx_n_s_object_pairs_hook, __pyx_n_s_ext_hook, __pyx_n_s_max_str_len, __pyx_n_s_max_bin_len, __pyx_n_s_max_array_len, __pyx_n_s_max_map_len, __pyx_n_s_max_ext_len, __pyx_n_s_ctx, __pyx_n_s_off, __pyx_n_s_ret, __pyx_n_s_buf, __pyx_n_s_buf_len, __pyx_n_s_cenc, __pyx_n_s_cerr, __pyx_n_s_view, __pyx_n_s_obj); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(0, 102, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__20);
-  __Pyx_GIVEREF(__pyx_tuple__20);
-  __pyx_codeobj__21 = (PyObject*)__Pyx_PyCode_New(13, 0, 0, 22, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__20, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__unpa, __pyx_n_s_unpackb, 102, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__21)) __PYX_ERR(0, 102, __pyx_L1_error)
+  __pyx_tuple__22 = PyTuple_Pack(22, __pyx_n_s_packed, __pyx_n_s_object_hook, __pyx_n_s_list_hook, __pyx_n_s_use_list, __pyx_n_s_encoding, __pyx_n_s_unicode_errors, __pyx_n_s_object_pairs_hook, __pyx_n_s_ext_hook, __pyx_n_s_max_str_len, __pyx_n_s_max_bin_len, __pyx_n_s_max_array_len, __pyx_n_s_max_map_len, __pyx_n_s_max_ext_len, __pyx_n_s_ctx, __pyx_n_s_off, __pyx_n_s_ret, __pyx_n_s_buf, __pyx_n_s_buf_len, __pyx_n_s_cenc, __pyx_n_s_cerr, __pyx_n_s_view, __pyx_n_s_obj); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(0, 104, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__22);
+  __Pyx_GIVEREF(__pyx_tuple__22);
+  __pyx_codeobj__23 = (PyObject*)__Pyx_PyCode_New(13, 0, 0, 22, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__22, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__unpa, __pyx_n_s_unpackb, 104, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__23)) __PYX_ERR(0, 104, __pyx_L1_error)
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":157
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":159
  * 
  * 
  * def unpack(object stream, object object_hook=None, object list_hook=None,             # <<<<<<<<<<<<<<
  *            bint use_list=1, encoding=None, unicode_errors="strict",
  *            object_pairs_hook=None,
  */
-  __pyx_tuple__22 = PyTuple_Pack(7, __pyx_n_s_stream, __pyx_n_s_object_hook, __pyx_n_s_list_hook, __pyx_n_s_use_list, __pyx_n_s_encoding, __pyx_n_s_unicode_errors, __pyx_n_s_object_pairs_hook); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(0, 157, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__22);
-  __Pyx_GIVEREF(__pyx_tuple__22);
-  __pyx_codeobj__23 = (PyObject*)__Pyx_PyCode_New(7, 0, 0, 7, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__22, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__unpa, __pyx_n_s_unpack, 157, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__23)) __PYX_ERR(0, 157, __pyx_L1_error)
+  __pyx_tuple__24 = PyTuple_Pack(7, __pyx_n_s_stream, __pyx_n_s_object_hook, __pyx_n_s_list_hook, __pyx_n_s_use_list, __pyx_n_s_encoding, __pyx_n_s_unicode_errors, __pyx_n_s_object_pairs_hook); if (unlikely(!__pyx_tuple__24)) __PYX_ERR(0, 159, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__24);
+  __Pyx_GIVEREF(__pyx_tuple__24);
+  __pyx_codeobj__25 = (PyObject*)__Pyx_PyCode_New(7, 0, 0, 7, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__24, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__unpa, __pyx_n_s_unpack, 159, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__25)) __PYX_ERR(0, 159, __pyx_L1_error)
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":324
- *                  max_map_len, max_ext_len)
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":354
+ *             self.ctx.user.ext_source = <PyObject*>self.source
  * 
  *     def feed(self, object next_bytes):             # <<<<<<<<<<<<<<
  *         """Append `next_bytes` to internal buffer."""
  *         cdef Py_buffer pybuff
  */
-  __pyx_tuple__24 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_next_bytes, __pyx_n_s_pybuff); if (unlikely(!__pyx_tuple__24)) __PYX_ERR(0, 324, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__24);
-  __Pyx_GIVEREF(__pyx_tuple__24);
-  __pyx_codeobj__25 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__24, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__unpa, __pyx_n_s_feed, 324, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__25)) __PYX_ERR(0, 324, __pyx_L1_error)
+  __pyx_tuple__26 = PyTuple_Pack(3, __pyx_n_s_self, __pyx_n_s_next_bytes, __pyx_n_s_pybuff); if (unlikely(!__pyx_tuple__26)) __PYX_ERR(0, 354, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__26);
+  __Pyx_GIVEREF(__pyx_tuple__26);
+  __pyx_codeobj__27 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 3, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__26, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__unpa, __pyx_n_s_feed, 354, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__27)) __PYX_ERR(0, 354, __pyx_L1_error)
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":423
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":456
  *                 raise ValueError("Unpack failed: error = %d" % (ret,))
  * 
  *     def read_bytes(self, Py_ssize_t nbytes):             # <<<<<<<<<<<<<<
  *         """Read a specified number of raw bytes from the stream"""
  *         cdef size_t nread
  */
-  __pyx_tuple__26 = PyTuple_Pack(4, __pyx_n_s_self, __pyx_n_s_nbytes, __pyx_n_s_nread, __pyx_n_s_ret); if (unlikely(!__pyx_tuple__26)) __PYX_ERR(0, 423, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__26);
-  __Pyx_GIVEREF(__pyx_tuple__26);
-  __pyx_codeobj__27 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__26, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__unpa, __pyx_n_s_read_bytes, 423, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__27)) __PYX_ERR(0, 423, __pyx_L1_error)
+  __pyx_tuple__28 = PyTuple_Pack(4, __pyx_n_s_self, __pyx_n_s_nbytes, __pyx_n_s_nread, __pyx_n_s_ret); if (unlikely(!__pyx_tuple__28)) __PYX_ERR(0, 456, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__28);
+  __Pyx_GIVEREF(__pyx_tuple__28);
+  __pyx_codeobj__29 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__28, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__unpa, __pyx_n_s_read_bytes, 456, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__29)) __PYX_ERR(0, 456, __pyx_L1_error)
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":433
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":466
  *         return ret
  * 
  *     def unpack(self, object write_bytes=None):             # <<<<<<<<<<<<<<
  *         """Unpack one object
  * 
  */
-  __pyx_tuple__28 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_write_bytes); if (unlikely(!__pyx_tuple__28)) __PYX_ERR(0, 433, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__28);
-  __Pyx_GIVEREF(__pyx_tuple__28);
-  __pyx_codeobj__29 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__28, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__unpa, __pyx_n_s_unpack, 433, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__29)) __PYX_ERR(0, 433, __pyx_L1_error)
-  __pyx_tuple__30 = PyTuple_Pack(1, Py_None); if (unlikely(!__pyx_tuple__30)) __PYX_ERR(0, 433, __pyx_L1_error)
+  __pyx_tuple__30 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_write_bytes); if (unlikely(!__pyx_tuple__30)) __PYX_ERR(0, 466, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__30);
   __Pyx_GIVEREF(__pyx_tuple__30);
+  __pyx_codeobj__31 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__30, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__unpa, __pyx_n_s_unpack, 466, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__31)) __PYX_ERR(0, 466, __pyx_L1_error)
+  __pyx_tuple__32 = PyTuple_Pack(1, Py_None); if (unlikely(!__pyx_tuple__32)) __PYX_ERR(0, 466, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__32);
+  __Pyx_GIVEREF(__pyx_tuple__32);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":443
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":476
  *         return self._unpack(unpack_construct, write_bytes)
  * 
  *     def skip(self, object write_bytes=None):             # <<<<<<<<<<<<<<
  *         """Read and ignore one object, returning None
  * 
  */
-  __pyx_codeobj__31 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__28, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__unpa, __pyx_n_s_skip, 443, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__31)) __PYX_ERR(0, 443, __pyx_L1_error)
+  __pyx_codeobj__33 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__30, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__unpa, __pyx_n_s_skip, 476, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__33)) __PYX_ERR(0, 476, __pyx_L1_error)
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":453
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":486
  *         return self._unpack(unpack_skip, write_bytes)
  * 
  *     def read_array_header(self, object write_bytes=None):             # <<<<<<<<<<<<<<
  *         """assuming the next object is an array, return its size n, such that
  *         the next n unpack() calls will iterate over its contents.
  */
-  __pyx_codeobj__32 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__28, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__unpa, __pyx_n_s_read_array_header, 453, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__32)) __PYX_ERR(0, 453, __pyx_L1_error)
+  __pyx_codeobj__34 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__30, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__unpa, __pyx_n_s_read_array_header, 486, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__34)) __PYX_ERR(0, 486, __pyx_L1_error)
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":461
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":494
  *         return self._unpack(read_array_header, write_bytes)
  * 
  *     def read_map_header(self, object write_bytes=None):             # <<<<<<<<<<<<<<
  *         """assuming the next object is a map, return its size n, such that the
  *         next n * 2 unpack() calls will iterate over its key-value pairs.
  */
-  __pyx_codeobj__33 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__28, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__unpa, __pyx_n_s_read_map_header, 461, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__33)) __PYX_ERR(0, 461, __pyx_L1_error)
+  __pyx_codeobj__35 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__30, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__unpa, __pyx_n_s_read_map_header, 494, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__35)) __PYX_ERR(0, 494, __pyx_L1_error)
+
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":502
+ *         return self._unpack(read_map_header, write_bytes)
+ * 
+ *     def peek_type(self):             # <<<<<<<<<<<<<<
+ *         """return the first byte of the next object, which tells its type,
+ *         without consuming it
+ */
+  __pyx_tuple__36 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__36)) __PYX_ERR(0, 502, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__36);
+  __Pyx_GIVEREF(__pyx_tuple__36);
+  __pyx_codeobj__37 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__36, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_isf_pandas_msgpack_msgpack__unpa, __pyx_n_s_peek_type, 502, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__37)) __PYX_ERR(0, 502, __pyx_L1_error)
 
   /* "(tree fragment)":1
  * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
  *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
  * def __setstate_cython__(self, __pyx_state):
  */
-  __pyx_tuple__34 = PyTuple_Pack(1, __pyx_n_s_self); if (unlikely(!__pyx_tuple__34)) __PYX_ERR(2, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__34);
-  __Pyx_GIVEREF(__pyx_tuple__34);
-  __pyx_codeobj__35 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__34, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_reduce_cython, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__35)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __pyx_codeobj__38 = (PyObject*)__Pyx_PyCode_New(1, 0, 0, 1, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__36, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_reduce_cython, 1, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__38)) __PYX_ERR(2, 1, __pyx_L1_error)
 
   /* "(tree fragment)":3
  * def __reduce_cython__(self):
@@ -9863,10 +10444,10 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
  */
-  __pyx_tuple__36 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_pyx_state); if (unlikely(!__pyx_tuple__36)) __PYX_ERR(2, 3, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__36);
-  __Pyx_GIVEREF(__pyx_tuple__36);
-  __pyx_codeobj__37 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__36, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_setstate_cython, 3, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__37)) __PYX_ERR(2, 3, __pyx_L1_error)
+  __pyx_tuple__39 = PyTuple_Pack(2, __pyx_n_s_self, __pyx_n_s_pyx_state); if (unlikely(!__pyx_tuple__39)) __PYX_ERR(2, 3, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__39);
+  __Pyx_GIVEREF(__pyx_tuple__39);
+  __pyx_codeobj__40 = (PyObject*)__Pyx_PyCode_New(2, 0, 0, 2, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__39, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_stringsource, __pyx_n_s_setstate_cython, 3, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__40)) __PYX_ERR(2, 3, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -9932,15 +10513,15 @@ static int __Pyx_modinit_type_init_code(void) {
   __pyx_vtable_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker.read_from_file = (PyObject *(*)(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *))__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_read_from_file;
   __pyx_vtable_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker._unpack = (PyObject *(*)(struct __pyx_obj_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker *, execute_fn, PyObject *, struct __pyx_opt_args_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unpack *__pyx_optional_args))__pyx_f_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker__unpack;
   #if CYTHON_USE_TYPE_SPECS
-  __pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker_spec, NULL); if (unlikely(!__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker)) __PYX_ERR(0, 174, __pyx_L1_error)
-  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker_spec, __pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker) < 0) __PYX_ERR(0, 174, __pyx_L1_error)
+  __pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker_spec, NULL); if (unlikely(!__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker)) __PYX_ERR(0, 176, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker_spec, __pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker) < 0) __PYX_ERR(0, 176, __pyx_L1_error)
   #else
   __pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker = &__pyx_type_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker;
   #endif
   #if !CYTHON_COMPILING_IN_LIMITED_API
   #endif
   #if !CYTHON_USE_TYPE_SPECS
-  if (__Pyx_PyType_Ready(__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker) < 0) __PYX_ERR(0, 174, __pyx_L1_error)
+  if (__Pyx_PyType_Ready(__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker) < 0) __PYX_ERR(0, 176, __pyx_L1_error)
   #endif
   #if PY_MAJOR_VERSION < 3
   __pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker->tp_print = 0;
@@ -9950,13 +10531,13 @@ static int __Pyx_modinit_type_init_code(void) {
     __pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker->tp_getattro = __Pyx_PyObject_GenericGetAttr;
   }
   #endif
-  if (__Pyx_SetVtable(__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker, __pyx_vtabptr_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker) < 0) __PYX_ERR(0, 174, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker, __pyx_vtabptr_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker) < 0) __PYX_ERR(0, 176, __pyx_L1_error)
   #if !CYTHON_COMPILING_IN_LIMITED_API
-  if (__Pyx_MergeVtables(__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker) < 0) __PYX_ERR(0, 174, __pyx_L1_error)
+  if (__Pyx_MergeVtables(__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker) < 0) __PYX_ERR(0, 176, __pyx_L1_error)
   #endif
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_Unpacker, (PyObject *) __pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker) < 0) __PYX_ERR(0, 174, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_Unpacker, (PyObject *) __pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker) < 0) __PYX_ERR(0, 176, __pyx_L1_error)
   #if !CYTHON_COMPILING_IN_LIMITED_API
-  if (__Pyx_setup_reduce((PyObject *) __pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker) < 0) __PYX_ERR(0, 174, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject *) __pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker) < 0) __PYX_ERR(0, 176, __pyx_L1_error)
   #endif
   __Pyx_RefNannyFinishContext();
   return 0;
@@ -10350,7 +10931,7 @@ if (!__Pyx_RefNanny) {
   __Pyx_INCREF(__pyx_n_s_ExtType);
   __Pyx_GIVEREF(__pyx_n_s_ExtType);
   if (__Pyx_PyList_SET_ITEM(__pyx_t_3, 0, __pyx_n_s_ExtType)) __PYX_ERR(0, 18, __pyx_L1_error);
-  __pyx_t_2 = __Pyx_Import(__pyx_n_s__17, __pyx_t_3, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 18, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s__19, __pyx_t_3, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 18, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_t_3 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_ExtType); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 18, __pyx_L1_error)
@@ -10359,181 +10940,194 @@ if (!__Pyx_RefNanny) {
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":97
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":99
  * 
  * 
  * def default_read_extended_type(typecode, data):             # <<<<<<<<<<<<<<
  *     raise NotImplementedError("Cannot decode extended type "
  *                               "with typecode=%d" % typecode)
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_9_unpacker_1default_read_extended_type, 0, __pyx_n_s_default_read_extended_type, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__unpa_2, __pyx_d, ((PyObject *)__pyx_codeobj__19)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 97, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_9_unpacker_1default_read_extended_type, 0, __pyx_n_s_default_read_extended_type, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__unpa_2, __pyx_d, ((PyObject *)__pyx_codeobj__21)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 99, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_default_read_extended_type, __pyx_t_2) < 0) __PYX_ERR(0, 97, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_default_read_extended_type, __pyx_t_2) < 0) __PYX_ERR(0, 99, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":102
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":104
  * 
  * 
  * def unpackb(object packed, object object_hook=None, object list_hook=None,             # <<<<<<<<<<<<<<
  *             bint use_list=1, encoding=None, unicode_errors="strict",
  *             object_pairs_hook=None, ext_hook=ExtType,
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_9_unpacker_3unpackb, 0, __pyx_n_s_unpackb, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__unpa_2, __pyx_d, ((PyObject *)__pyx_codeobj__21)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 102, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_9_unpacker_3unpackb, 0, __pyx_n_s_unpackb, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__unpa_2, __pyx_d, ((PyObject *)__pyx_codeobj__23)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 104, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (!__Pyx_CyFunction_InitDefaults(__pyx_t_2, sizeof(__pyx_defaults), 1)) __PYX_ERR(0, 102, __pyx_L1_error)
+  if (!__Pyx_CyFunction_InitDefaults(__pyx_t_2, sizeof(__pyx_defaults), 1)) __PYX_ERR(0, 104, __pyx_L1_error)
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":104
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":106
  * def unpackb(object packed, object object_hook=None, object list_hook=None,
  *             bint use_list=1, encoding=None, unicode_errors="strict",
  *             object_pairs_hook=None, ext_hook=ExtType,             # <<<<<<<<<<<<<<
  *             Py_ssize_t max_str_len=2147483647, # 2**32-1
  *             Py_ssize_t max_bin_len=2147483647,
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_ExtType); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 104, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_ExtType); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 106, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_CyFunction_Defaults(__pyx_defaults, __pyx_t_2)->__pyx_arg_ext_hook = __pyx_t_3;
   __Pyx_GIVEREF(__pyx_t_3);
   __pyx_t_3 = 0;
   __Pyx_CyFunction_SetDefaultsGetter(__pyx_t_2, __pyx_pf_18isf_pandas_msgpack_7msgpack_9_unpacker_6__defaults__);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_unpackb, __pyx_t_2) < 0) __PYX_ERR(0, 102, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_unpackb, __pyx_t_2) < 0) __PYX_ERR(0, 104, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":158
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":160
  * 
  * def unpack(object stream, object object_hook=None, object list_hook=None,
  *            bint use_list=1, encoding=None, unicode_errors="strict",             # <<<<<<<<<<<<<<
  *            object_pairs_hook=None,
  *            ):
  */
-  __pyx_t_2 = __Pyx_PyBool_FromLong(((int)1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 158, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyBool_FromLong(((int)1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 160, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":157
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":159
  * 
  * 
  * def unpack(object stream, object object_hook=None, object list_hook=None,             # <<<<<<<<<<<<<<
  *            bint use_list=1, encoding=None, unicode_errors="strict",
  *            object_pairs_hook=None,
  */
-  __pyx_t_3 = PyTuple_New(6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 157, __pyx_L1_error)
+  __pyx_t_3 = PyTuple_New(6); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 159, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_INCREF(Py_None);
   __Pyx_GIVEREF(Py_None);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 0, Py_None)) __PYX_ERR(0, 157, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 0, Py_None)) __PYX_ERR(0, 159, __pyx_L1_error);
   __Pyx_INCREF(Py_None);
   __Pyx_GIVEREF(Py_None);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 1, Py_None)) __PYX_ERR(0, 157, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 1, Py_None)) __PYX_ERR(0, 159, __pyx_L1_error);
   __Pyx_GIVEREF(__pyx_t_2);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_t_2)) __PYX_ERR(0, 157, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 2, __pyx_t_2)) __PYX_ERR(0, 159, __pyx_L1_error);
   __Pyx_INCREF(Py_None);
   __Pyx_GIVEREF(Py_None);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 3, Py_None)) __PYX_ERR(0, 157, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 3, Py_None)) __PYX_ERR(0, 159, __pyx_L1_error);
   __Pyx_INCREF(((PyObject*)__pyx_n_s_strict));
   __Pyx_GIVEREF(((PyObject*)__pyx_n_s_strict));
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 4, ((PyObject*)__pyx_n_s_strict))) __PYX_ERR(0, 157, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 4, ((PyObject*)__pyx_n_s_strict))) __PYX_ERR(0, 159, __pyx_L1_error);
   __Pyx_INCREF(Py_None);
   __Pyx_GIVEREF(Py_None);
-  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 5, Py_None)) __PYX_ERR(0, 157, __pyx_L1_error);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_3, 5, Py_None)) __PYX_ERR(0, 159, __pyx_L1_error);
   __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_9_unpacker_5unpack, 0, __pyx_n_s_unpack, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__unpa_2, __pyx_d, ((PyObject *)__pyx_codeobj__23)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 157, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_9_unpacker_5unpack, 0, __pyx_n_s_unpack, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__unpa_2, __pyx_d, ((PyObject *)__pyx_codeobj__25)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 159, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_t_3);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_unpack, __pyx_t_2) < 0) __PYX_ERR(0, 157, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_unpack, __pyx_t_2) < 0) __PYX_ERR(0, 159, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":266
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":283
  *                  object object_hook=None, object object_pairs_hook=None,
  *                  object list_hook=None, encoding=None, unicode_errors='strict',
  *                  int max_buffer_size=0, object ext_hook=ExtType,             # <<<<<<<<<<<<<<
  *                  Py_ssize_t max_str_len=2147483647, # 2**32-1
  *                  Py_ssize_t max_bin_len=2147483647,
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_ExtType); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 266, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_ExtType); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 283, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_k__7 = __pyx_t_2;
   __Pyx_GIVEREF(__pyx_t_2);
   __pyx_t_2 = 0;
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":324
- *                  max_map_len, max_ext_len)
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":354
+ *             self.ctx.user.ext_source = <PyObject*>self.source
  * 
  *     def feed(self, object next_bytes):             # <<<<<<<<<<<<<<
  *         """Append `next_bytes` to internal buffer."""
  *         cdef Py_buffer pybuff
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_7feed, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Unpacker_feed, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__unpa_2, __pyx_d, ((PyObject *)__pyx_codeobj__25)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 324, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_7feed, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Unpacker_feed, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__unpa_2, __pyx_d, ((PyObject *)__pyx_codeobj__27)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 354, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker, __pyx_n_s_feed, __pyx_t_2) < 0) __PYX_ERR(0, 324, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker, __pyx_n_s_feed, __pyx_t_2) < 0) __PYX_ERR(0, 354, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   PyType_Modified(__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":423
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":456
  *                 raise ValueError("Unpack failed: error = %d" % (ret,))
  * 
  *     def read_bytes(self, Py_ssize_t nbytes):             # <<<<<<<<<<<<<<
  *         """Read a specified number of raw bytes from the stream"""
  *         cdef size_t nread
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_9read_bytes, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Unpacker_read_bytes, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__unpa_2, __pyx_d, ((PyObject *)__pyx_codeobj__27)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 423, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_9read_bytes, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Unpacker_read_bytes, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__unpa_2, __pyx_d, ((PyObject *)__pyx_codeobj__29)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 456, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker, __pyx_n_s_read_bytes, __pyx_t_2) < 0) __PYX_ERR(0, 423, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker, __pyx_n_s_read_bytes, __pyx_t_2) < 0) __PYX_ERR(0, 456, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   PyType_Modified(__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":433
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":466
  *         return ret
  * 
  *     def unpack(self, object write_bytes=None):             # <<<<<<<<<<<<<<
  *         """Unpack one object
  * 
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_11unpack, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Unpacker_unpack, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__unpa_2, __pyx_d, ((PyObject *)__pyx_codeobj__29)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 433, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_11unpack, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Unpacker_unpack, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__unpa_2, __pyx_d, ((PyObject *)__pyx_codeobj__31)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 466, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_tuple__30);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker, __pyx_n_s_unpack, __pyx_t_2) < 0) __PYX_ERR(0, 433, __pyx_L1_error)
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_tuple__32);
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker, __pyx_n_s_unpack, __pyx_t_2) < 0) __PYX_ERR(0, 466, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   PyType_Modified(__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":443
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":476
  *         return self._unpack(unpack_construct, write_bytes)
  * 
  *     def skip(self, object write_bytes=None):             # <<<<<<<<<<<<<<
  *         """Read and ignore one object, returning None
  * 
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_13skip, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Unpacker_skip, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__unpa_2, __pyx_d, ((PyObject *)__pyx_codeobj__31)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 443, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_13skip, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Unpacker_skip, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__unpa_2, __pyx_d, ((PyObject *)__pyx_codeobj__33)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 476, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_tuple__30);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker, __pyx_n_s_skip, __pyx_t_2) < 0) __PYX_ERR(0, 443, __pyx_L1_error)
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_tuple__32);
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker, __pyx_n_s_skip, __pyx_t_2) < 0) __PYX_ERR(0, 476, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   PyType_Modified(__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":453
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":486
  *         return self._unpack(unpack_skip, write_bytes)
  * 
  *     def read_array_header(self, object write_bytes=None):             # <<<<<<<<<<<<<<
  *         """assuming the next object is an array, return its size n, such that
  *         the next n unpack() calls will iterate over its contents.
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_15read_array_header, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Unpacker_read_array_header, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__unpa_2, __pyx_d, ((PyObject *)__pyx_codeobj__32)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 453, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_15read_array_header, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Unpacker_read_array_header, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__unpa_2, __pyx_d, ((PyObject *)__pyx_codeobj__34)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 486, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_tuple__30);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker, __pyx_n_s_read_array_header, __pyx_t_2) < 0) __PYX_ERR(0, 453, __pyx_L1_error)
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_tuple__32);
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker, __pyx_n_s_read_array_header, __pyx_t_2) < 0) __PYX_ERR(0, 486, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   PyType_Modified(__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker);
 
-  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":461
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":494
  *         return self._unpack(read_array_header, write_bytes)
  * 
  *     def read_map_header(self, object write_bytes=None):             # <<<<<<<<<<<<<<
  *         """assuming the next object is a map, return its size n, such that the
  *         next n * 2 unpack() calls will iterate over its key-value pairs.
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_17read_map_header, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Unpacker_read_map_header, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__unpa_2, __pyx_d, ((PyObject *)__pyx_codeobj__33)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 461, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_17read_map_header, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Unpacker_read_map_header, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__unpa_2, __pyx_d, ((PyObject *)__pyx_codeobj__35)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 494, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_tuple__32);
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker, __pyx_n_s_read_map_header, __pyx_t_2) < 0) __PYX_ERR(0, 494, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  PyType_Modified(__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker);
+
+  /* "isf_pandas_msgpack/msgpack/_unpacker.pyx":502
+ *         return self._unpack(read_map_header, write_bytes)
+ * 
+ *     def peek_type(self):             # <<<<<<<<<<<<<<
+ *         """return the first byte of the next object, which tells its type,
+ *         without consuming it
+ */
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_19peek_type, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Unpacker_peek_type, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__unpa_2, __pyx_d, ((PyObject *)__pyx_codeobj__37)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 502, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_CyFunction_SetDefaultsTuple(__pyx_t_2, __pyx_tuple__30);
-  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker, __pyx_n_s_read_map_header, __pyx_t_2) < 0) __PYX_ERR(0, 461, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict((PyObject *)__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker, __pyx_n_s_peek_type, __pyx_t_2) < 0) __PYX_ERR(0, 502, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   PyType_Modified(__pyx_ptype_18isf_pandas_msgpack_7msgpack_9_unpacker_Unpacker);
 
@@ -10542,7 +11136,7 @@ if (!__Pyx_RefNanny) {
  *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
  * def __setstate_cython__(self, __pyx_state):
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_23__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Unpacker___reduce_cython, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__unpa_2, __pyx_d, ((PyObject *)__pyx_codeobj__35)); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_25__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Unpacker___reduce_cython, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__unpa_2, __pyx_d, ((PyObject *)__pyx_codeobj__38)); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_reduce_cython, __pyx_t_2) < 0) __PYX_ERR(2, 1, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -10553,7 +11147,7 @@ if (!__Pyx_RefNanny) {
  * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
  *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
  */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_25__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Unpacker___setstate_cython, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__unpa_2, __pyx_d, ((PyObject *)__pyx_codeobj__37)); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 3, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_18isf_pandas_msgpack_7msgpack_9_unpacker_8Unpacker_27__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_n_s_Unpacker___setstate_cython, NULL, __pyx_n_s_isf_pandas_msgpack_msgpack__unpa_2, __pyx_d, ((PyObject *)__pyx_codeobj__40)); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 3, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_setstate_cython, __pyx_t_2) < 0) __PYX_ERR(2, 3, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -12777,7 +13371,7 @@ static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
         if (unlikely(!module_name_str)) { goto modbad; }
         module_name = PyUnicode_FromString(module_name_str);
         if (unlikely(!module_name)) { goto modbad; }
-        module_dot = PyUnicode_Concat(module_name, __pyx_kp_u__16);
+        module_dot = PyUnicode_Concat(module_name, __pyx_kp_u__18);
         if (unlikely(!module_dot)) { goto modbad; }
         full_name = PyUnicode_Concat(module_dot, name);
         if (unlikely(!full_name)) { goto modbad; }
@@ -14664,6 +15258,77 @@ static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
     }
 }
 
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_unsigned_char(unsigned char value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const unsigned char neg_one = (unsigned char) -1, const_zero = (unsigned char) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(unsigned char) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(unsigned char) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(unsigned char) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(unsigned char) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(unsigned char) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(unsigned char),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *from_bytes, *result = NULL;
+        PyObject *py_bytes = NULL, *arg_tuple = NULL, *kwds = NULL, *order_str = NULL;
+        from_bytes = PyObject_GetAttrString((PyObject*)&PyLong_Type, "from_bytes");
+        if (!from_bytes) return NULL;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(unsigned char));
+        if (!py_bytes) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        arg_tuple = PyTuple_Pack(2, py_bytes, order_str);
+        if (!arg_tuple) goto limited_bad;
+        if (!is_unsigned) {
+            kwds = PyDict_New();
+            if (!kwds) goto limited_bad;
+            if (PyDict_SetItemString(kwds, "signed", __Pyx_NewRef(Py_True))) goto limited_bad;
+        }
+        result = PyObject_Call(from_bytes, arg_tuple, kwds);
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(arg_tuple);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes);
+        return result;
+#endif
+    }
+}
+
 /* FormatTypeName */
 #if CYTHON_COMPILING_IN_LIMITED_API
 static __Pyx_TypeName
@@ -14674,7 +15339,7 @@ __Pyx_PyType_GetName(PyTypeObject* tp)
     if (unlikely(name == NULL) || unlikely(!PyUnicode_Check(name))) {
         PyErr_Clear();
         Py_XDECREF(name);
-        name = __Pyx_NewRef(__pyx_n_s__38);
+        name = __Pyx_NewRef(__pyx_n_s__41);
     }
     return name;
 }
@@ -25,6 +25,7 @@ cdef extern from "../includes/unpack.h":
         bint has_pairs_hook # call object_hook with k-v pairs
         PyObject* list_hook
         PyObject* ext_hook
+        PyObject* ext_source
         char *encoding
         char *unicode_errors
         Py_ssize_t max_str_len
@@ -57,6 +58,7 @@ cdef inline init_ctx(unpack_context *ctx,
     unpack_init(ctx)
     ctx.user.use_list = use_list
     ctx.user.object_hook = ctx.user.list_hook = <PyObject*>NULL
+    ctx.user.ext_source = <PyObject*>NULL
     ctx.user.max_str_len = max_str_len
     ctx.user.max_bin_len = max_bin_len
     ctx.user.max_array_len = max_array_len
@@ -224,6 +226,12 @@ cdef class Unpacker(object):
     :param int max_map_len:
         Limits max length of map. (default: 2**31-1)
 
+    :param buffer:
+        Object supporting the buffer protocol to unpack from in place.
+        Nothing is copied into the internal buffer and ext payloads are
+        passed to *ext_hook* as memoryview slices of *buffer*, which keep
+        it alive. Can't be combined with *file_like* or :meth:`feed()`.
+
 
     example of streaming deserialize from file-like object::
 
@@ -252,12 +260,21 @@ cdef class Unpacker(object):
     cdef object object_hook, object_pairs_hook, list_hook, ext_hook
     cdef object encoding, unicode_errors
     cdef size_t max_buffer_size
+    # set when unpacking in place from a buffer
+    cdef Py_buffer view
+    cdef bint has_view
+    cdef object source
 
     def __cinit__(self):
         self.buf = NULL
+        self.has_view = 0
 
     def __dealloc__(self):
-        free(self.buf)
+        if self.has_view:
+            PyBuffer_Release(&self.view)
+            self.has_view = 0
+        else:
+            free(self.buf)
         self.buf = NULL
 
     def __init__(self, file_like=None, Py_ssize_t read_size=0, bint use_list=1,
@@ -268,7 +285,8 @@ cdef class Unpacker(object):
                  Py_ssize_t max_bin_len=2147483647,
                  Py_ssize_t max_array_len=2147483647,
                  Py_ssize_t max_map_len=2147483647,
-                 Py_ssize_t max_ext_len=2147483647):
+                 Py_ssize_t max_ext_len=2147483647,
+                 object buffer=None):
         cdef char *cenc=NULL,
         cdef char *cerr=NULL
 
@@ -291,12 +309,22 @@ cdef class Unpacker(object):
             read_size = min(max_buffer_size, 1024**2)
         self.max_buffer_size = max_buffer_size
         self.read_size = read_size
-        self.buf = <char*>malloc(read_size)
-        if self.buf == NULL:
-            raise MemoryError("Unable to allocate internal buffer.")
-        self.buf_size = read_size
         self.buf_head = 0
-        self.buf_tail = 0
+        if buffer is not None:
+            if file_like is not None:
+                raise TypeError("file_like and buffer are mutually exclusive.")
+            self.source = memoryview(buffer).cast('B')
+            PyObject_GetBuffer(self.source, &self.view, PyBUF_SIMPLE)
+            self.has_view = 1
+            self.buf = <char*>self.view.buf
+            self.buf_size = self.view.len
+            self.buf_tail = self.view.len
+        else:
+            self.buf = <char*>malloc(read_size)
+            if self.buf == NULL:
+                raise MemoryError("Unable to allocate internal buffer.")
+            self.buf_size = read_size
+            self.buf_tail = 0
 
         if encoding is not None:
             if isinstance(encoding, unicode):
@@ -320,6 +348,8 @@ cdef class Unpacker(object):
                  ext_hook, use_list, cenc, cerr,
                  max_str_len, max_bin_len, max_array_len,
                  max_map_len, max_ext_len)
+        if self.has_view:
+            self.ctx.user.ext_source = <PyObject*>self.source
 
     def feed(self, object next_bytes):
         """Append `next_bytes` to internal buffer."""
@@ -327,6 +357,9 @@ cdef class Unpacker(object):
         if self.file_like is not None:
             raise AssertionError("unpacker.feed() is not be able "
                                  "to use with `file_like`.")
+        if self.has_view:
+            raise AssertionError("unpacker.feed() is not be able "
+                                 "to use with `buffer`.")
         PyObject_GetBuffer(next_bytes, &pybuff, PyBUF_SIMPLE)
         try:
             self.append_buffer(<char*>pybuff.buf, pybuff.len)
@@ -466,6 +499,18 @@ cdef class Unpacker(object):
         """
         return self._unpack(read_map_header, write_bytes)
 
+    def peek_type(self):
+        """return the first byte of the next object, which tells its type,
+        without consuming it
+
+        Raises `OutOfData` when there are no more bytes to unpack.
+        """
+        if self.buf_head >= self.buf_tail and self.file_like is not None:
+            self.read_from_file()
+        if self.buf_head >= self.buf_tail:
+            raise OutOfData("No more data to unpack.")
+        return <unsigned char>self.buf[self.buf_head]
+
     def __iter__(self):
         return self
 
@@ -39,13 +39,25 @@ PY3 = (sys.version_info[0] >= 3)
 PY35 = (sys.version_info >= (3, 5))
 PY36 = (sys.version_info >= (3, 6))
 
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, date, timedelta
+from functools import partial
 from dateutil.parser import parse
 import os
+import mmap as _mmap
 from textwrap import dedent
 
 import numpy as np
 import io
+import itertools
+import operator
+import pickle
+import struct
+import threading
+import time
+import warnings
 # from pandas import compat
 # try:
 #     compat.string_types
@@ -93,7 +105,7 @@ except ImportError:
 from pandas import (Timestamp, Period, Series, DataFrame,  # noqa
                     Index, MultiIndex, Int64Index, Float64Index,
                     RangeIndex, PeriodIndex, DatetimeIndex, NaT,
-                    Categorical, CategoricalIndex)
+                    Categorical, CategoricalIndex, concat, isna, unique)
 from pandas.core.arrays.sparse.array import BlockIndex, IntIndex
 from pandas.arrays import PeriodArray
 from pandas.core.arrays.sparse import SparseDtype
@@ -101,6 +113,7 @@ from pandas.core.generic import NDFrame
 from pandas.core.dtypes.generic import ABCSeries
 from pandas.io.common import _get_filepath_or_buffer
 from pandas.errors import PerformanceWarning
+from pandas.util import hash_array
 
 
 def get_filepath_or_buffer(*args, **kwargs):
@@ -135,7 +148,8 @@ def _safe_reshape(arr, new_shape):
 # from pandas_msgpack import _is_pandas_legacy_version
 from isf_pandas_msgpack.msgpack import (Unpacker as _Unpacker,
                                     Packer as _Packer,
-                                    ExtType)
+                                    ExtType,
+                                    OutOfData)
 from isf_pandas_msgpack._move import (
     BadMove as _BadMove,
     move_into_mutable_buffer as _move_into_mutable_buffer,
@@ -182,9 +196,225 @@ _check_blosc.__doc__ = dedent(
     """,
 )
 
-# until we can pass this into our conversion functions,
-# this is pretty hacky
-compressor = None
+def _check_module(name):
+    """ return a check raising ImportError if module name is missing """
+    def check():
+        try:
+            __import__(name)
+        except ImportError:
+            raise ImportError('{} is not installed'.format(name))
+    return check
+
+
+class Codec(namedtuple('Codec', 'name compress decompress decompress_into '
+                                'check')):
+    """
+    A compression codec, see register_codec
+    """
+
+
+_codecs = {}
+
+
+def register_codec(name, compress, decompress, decompress_into=None,
+                   check=None):
+    """
+    Register a compression codec, usable as to_msgpack(compress=name); the
+    name is stored with every array it compresses, so the codec has to be
+    registered under the same name to read them back
+
+    Parameters
+    ----------
+    name : string
+    compress : callable, compress(data, typesize, **options) returns the
+               compressed bytes of the bytes-like data of an array whose
+               items are typesize bytes, with the options given to
+               to_msgpack(compress=(name, options)), if any
+    decompress : callable, decompress(data) returns the decompressed
+                 bytes-like of the bytes-like data
+    decompress_into : callable, optional, decompress_into(data, out)
+                      decompresses data into the writable buffer out and
+                      returns the number of bytes written, or raises
+                      ValueError if out is too small
+    check : callable, optional, raises ImportError if the codec cannot be
+            used
+    """
+    _codecs[u(name)] = Codec(u(name), compress, decompress, decompress_into,
+                             check)
+
+
+def _get_codec(name):
+    """ the registered codec name, checked to be usable """
+    try:
+        codec = _codecs[name]
+    except KeyError:
+        raise ValueError('compress must be one of {}'.format(
+            ', '.join(repr(str(n)) for n in sorted(_codecs))))
+    if codec.check is not None:
+        codec.check()
+    return codec
+
+
+def _blosc_decompress_into(data, out):
+    # the uncompressed size is in the blosc header
+    nbytes, = struct.unpack_from('<I', data, 4)
+    if nbytes > len(out):
+        raise ValueError('out is too small to decompress into')
+    return blosc.decompress_ptr(
+        data, np.frombuffer(out, dtype=np.uint8).ctypes.data)
+
+
+# the bytes a streaming decompress_into feeds or takes at a time
+_STREAM_CHUNK = 1 << 16
+
+
+def _put(out, n, chunk):
+    """ copy the bytes chunk into the uint8 array out at n, return the end """
+    end = n + len(chunk)
+    if end > len(out):
+        raise ValueError('out is too small to decompress into')
+    out[n:end] = np.frombuffer(chunk, dtype=np.uint8)
+    return end
+
+
+def _zlib_decompress_into(data, out):
+    # stream the output of a decompressobj, a chunk at a time
+    out = np.frombuffer(out, dtype=np.uint8)
+    data = memoryview(data)
+    d = zlib.decompressobj()
+    n = 0
+    for start in range(0, len(data), _STREAM_CHUNK):
+        tail = data[start:start + _STREAM_CHUNK]
+        while tail:
+            n = _put(out, n, d.decompress(tail, _STREAM_CHUNK))
+            tail = d.unconsumed_tail
+    return _put(out, n, d.flush())
+
+
+def _decompressor_into(module, name):
+    """
+    a decompress_into streaming the output of the decompressor class name
+    of module, such as lzma.LZMADecompressor
+    """
+    def decompress_into(data, out):
+        out = np.frombuffer(out, dtype=np.uint8)
+        data = memoryview(data)
+        d = getattr(sys.modules[module], name)()
+        n = 0
+        for start in range(0, len(data), _STREAM_CHUNK):
+            n = _put(out, n, d.decompress(data[start:start + _STREAM_CHUNK],
+                                          _STREAM_CHUNK))
+            while not d.needs_input and not d.eof:
+                n = _put(out, n, d.decompress(b'', _STREAM_CHUNK))
+        return n
+
+    return decompress_into
+
+
+_BLOSC_SHUFFLES = {u'none': 0, u'byte': 1, u'bit': 2}
+
+# the blosc thread count is global to the process, so the calls setting it
+# for themselves take turns
+_blosc_nthreads_lock = threading.Lock()
+
+
+def _blosc_compress(data, typesize, shuffle=None, nthreads=None, **options):
+    # shuffle by name as well, and on nthreads threads for this call
+    if shuffle is not None:
+        options[u'shuffle'] = _BLOSC_SHUFFLES.get(shuffle, shuffle)
+    if nthreads is None:
+        return blosc.compress(data, typesize=typesize, **options)
+    with _blosc_nthreads_lock:
+        previous = blosc.set_nthreads(nthreads)
+        try:
+            return blosc.compress(data, typesize=typesize, **options)
+        finally:
+            blosc.set_nthreads(previous)
+
+
+# the options of the builtin codecs are the keyword arguments of the
+# compress functions of their modules, such as level for zlib and zstd,
+# preset for lzma, compresslevel for bz2 and compression_level for lz4
+
+# the modules are looked up on every call, so that they can be patched
+register_codec('zlib',
+               lambda data, typesize, **options: zlib.compress(data,
+                                                               **options),
+               lambda data: zlib.decompress(data),
+               decompress_into=_zlib_decompress_into, check=_check_zlib)
+register_codec('blosc', lambda data, typesize, **options: _blosc_compress(
+                   data, typesize, **options),
+               lambda data: blosc.decompress(data),
+               decompress_into=_blosc_decompress_into, check=_check_blosc)
+register_codec('lzma',
+               lambda data, typesize, **options: sys.modules[
+                   'lzma'].compress(data, **options),
+               lambda data: sys.modules['lzma'].decompress(data),
+               decompress_into=_decompressor_into('lzma', 'LZMADecompressor'),
+               check=_check_module('lzma'))
+register_codec('bz2',
+               lambda data, typesize, **options: sys.modules[
+                   'bz2'].compress(data, **options),
+               lambda data: sys.modules['bz2'].decompress(data),
+               decompress_into=_decompressor_into('bz2', 'BZ2Decompressor'),
+               check=_check_module('bz2'))
+register_codec('zstd',
+               lambda data, typesize, **options: sys.modules[
+                   'zstandard'].compress(data, **options),
+               lambda data: sys.modules['zstandard'].decompress(data),
+               check=_check_module('zstandard'))
+register_codec('lz4',
+               lambda data, typesize, **options: sys.modules[
+                   'lz4.frame'].compress(data, **options),
+               lambda data: sys.modules['lz4.frame'].decompress(data),
+               check=_check_module('lz4.frame'))
+
+# the options of a to_msgpack call, which encode and the functions it
+# calls look up with _options() rather than being passed them; see
+# to_msgpack for their meaning
+_WriteOptions = namedtuple('_WriteOptions',
+                           'compress compress_options buffer_callback '
+                           'buffer_ids row_group_size min_decode_speed '
+                           'statistics bloom_columns frame_size shuffle '
+                           'delta narrow codecs',
+                           defaults=(None, None, None, None, None, 200,
+                                     False, None, None, False, False,
+                                     False, None))
+
+# the options of the to_msgpack call on this thread, if any, and the
+# thread pool (de)compressing the blocks of the to_msgpack or read_msgpack
+# call on this thread when given workers, see _map
+_local = threading.local()
+
+
+def _options():
+    """
+    the options of the to_msgpack call writing on this thread, the
+    defaults outside of one, such as for a plain pack
+    """
+    return getattr(_local, 'options', None) or _WriteOptions()
+
+
+@contextmanager
+def _writing(options):
+    """ encode with options on this thread """
+    previous = getattr(_local, 'options', None)
+    _local.options = options
+    try:
+        yield
+    finally:
+        _local.options = previous
+
+
+# ext type code of a placeholder for an out-of-band buffer; its data is
+# the buffer's position in the buffers passed to read_msgpack
+_OUT_OF_BAND = 1
+
+# ext type code of the fixed size footer closing a file with a table of
+# contents; its data is _TOC_MAGIC and the offset of the table
+_TOC_FOOTER = 2
+_TOC_MAGIC = b'PDMSGTOC'
+_TOC_FOOTER_SIZE = 18
 
 
 def to_msgpack(path_or_buf, *args, **kwargs):
@@ -198,11 +428,78 @@ def to_msgpack(path_or_buf, *args, **kwargs):
     encoding: encoding for unicode objects
     append : boolean whether to append to an existing msgpack
              (default is False)
-    compress : type of compressor (zlib or blosc), default to None (no
-               compression)
+    compress : name of a registered codec, zlib, blosc, lzma, bz2, zstd
+               (needs zstandard) or lz4 (needs lz4) by default, see
+               register_codec, or a tuple of the name and a dict of
+               options, such as ('zlib', {'level': 1}) or ('blosc',
+               {'cname': 'zstd', 'clevel': 5, 'shuffle': 'bit',
+               'nthreads': 8}), recorded with every array; or 'auto' to
+               pick the codec compressing a sample of each array best, or
+               none if none saves 10%; default to None (no compression)
+    min_decode_speed : float, the MB/s a codec picked by compress='auto'
+                       has to decompress the sample at (default is 200)
+    buffers : boolean, if True and path_or_buf is None, return a list of
+              segments (bytes, and memoryviews of the original arrays for
+              large uncompressed data) whose concatenation is the
+              generated string (default is False)
+    buffer_callback : callable, if given it is called with a
+                      pickle.PickleBuffer for the data of each array; when
+                      it returns a false value the data is left out and
+                      only a placeholder is written, and the buffers have
+                      to be passed to read_msgpack in the same order
+                      (default is None, all data is written)
+    align : int, if nonzero, pad so the data of every uncompressed array
+            of at least align bytes starts on an align-byte boundary of
+            the file, at most 256; readers unaware of the padding can
+            read the file as usual (default is 0)
+    toc : boolean, if True, end the output with a table of contents of
+          the offset, length, typ and klass of every object so that
+          read_msgpack can seek to single objects; appending to a file
+          that has one keeps it up to date (default is None, only when
+          appending to such a file)
+    row_group_size : int, if given, store DataFrames of more rows as
+                     consecutive row groups of this many rows, so that
+                     read_msgpack can decode only the row groups of the
+                     rows it reads (default is None)
+    statistics : boolean, if True, store the min, max, null count and
+                 distinct count of every column of the blocks of
+                 DataFrames and of their row groups, so that read_msgpack
+                 can skip row groups that its filters exclude
+                 (default is False)
+    bloom_columns : list of column labels, store a Bloom filter of the
+                    values of these columns for every row group of
+                    DataFrames stored in row groups, so that read_msgpack
+                    can skip the row groups a lookup cannot match; needs
+                    row_group_size (default is None)
+    shuffle : boolean, if True, byte shuffle the arrays of numbers before
+              compressing them, storing the first bytes of all items, then
+              the second bytes and so on, which often compresses much
+              better with any codec (default is False)
+    delta : boolean, if True, store the datetimes of DatetimeIndexes and of
+            datetime blocks and Series by their first values and their
+            deltas or deltas of deltas, in the narrowest int type that
+            holds them, or, of a regular grid, by the first value and the
+            step only (default is False)
+    narrow : boolean, if True, store arrays of ints as their difference
+             to their min in the narrowest unsigned int type that holds
+             them, when that is narrower (default is False)
+    frame_size : int, compress arrays of more bytes as consecutive frames
+                 of about this many bytes, such as 4 MB, so that
+                 read_msgpack can decompress them concurrently and only
+                 those of the rows it reads; older versions cannot read
+                 them (default is None, every array is compressed whole)
+    workers : int, if more than 1, compress the blocks and index arrays of
+              DataFrames, and their row groups, concurrently on this many
+              threads; not with a buffer_callback (default is None)
     """
-    global compressor
     compressor = kwargs.pop('compress', None)
+    compress_options = {}
+    if isinstance(compressor, (tuple, list)):
+        compressor, compress_options = compressor
+        compress_options = dict((u(k), v)
+                                for k, v in compress_options.items())
+        if compressor == 'auto' and compress_options:
+            raise ValueError('compress=auto takes no options')
     if compressor:
         compressor = u(compressor)
     append = kwargs.pop('append', None)
@@ -210,46 +507,235 @@ def to_msgpack(path_or_buf, *args, **kwargs):
         mode = 'a+b'
     else:
         mode = 'wb'
-
-    def writer(fh):
+    buffers = kwargs.pop('buffers', False)
+    toc = kwargs.pop('toc', None)
+    options = _WriteOptions(
+        compress=compressor, compress_options=compress_options,
+        buffer_callback=kwargs.pop('buffer_callback', None),
+        buffer_ids=itertools.count(),
+        row_group_size=kwargs.pop('row_group_size', None),
+        min_decode_speed=kwargs.pop('min_decode_speed', 200),
+        statistics=kwargs.pop('statistics', False),
+        bloom_columns=kwargs.pop('bloom_columns', None),
+        frame_size=kwargs.pop('frame_size', None),
+        shuffle=kwargs.pop('shuffle', False),
+        delta=kwargs.pop('delta', False),
+        narrow=kwargs.pop('narrow', False),
+        codecs={})
+    if options.bloom_columns and not options.row_group_size:
+        raise ValueError('bloom_columns needs row_group_size')
+    workers = kwargs.pop('workers', None)
+
+    def writer(fh, offset=0, entries=None):
+        # stream straight into fh rather than packing each object whole
+        if not toc:
+            packer = Packer(stream=fh, offset=offset, **kwargs)
+            for a in args:
+                packer.pack(a)
+            return
+
+        top = {}
+
+        def default(o):
+            # note how the object written is encoded, for its toc entry
+            e = encode(o)
+            if o is top[u'obj'] and isinstance(e, dict):
+                top[u'typ'], top[u'klass'] = e.get(u'typ'), e.get(u'klass')
+            return e
+
+        entries = entries or _new_toc()
+        packer = Packer(stream=fh, offset=offset, default=default, **kwargs)
         for a in args:
-            fh.write(pack(a, **kwargs))
-
-    if isinstance(path_or_buf, STRING_TYPES):
-        with open(path_or_buf, mode) as fh:
-            writer(fh)
-    elif path_or_buf is None:
-        buf = io.BytesIO()
-        writer(buf)
-        return buf.getvalue()
-    else:
-        writer(path_or_buf)
+            top.update(obj=a, typ=None, klass=u(type(a).__name__))
+            start = packer.tell()
+            packer.pack(a)
+            for key, value in [(u'offsets', start),
+                               (u'lengths', packer.tell() - start),
+                               (u'typs', top[u'typ']),
+                               (u'klasses', top[u'klass'])]:
+                entries[key].append(value)
+        footer = _TOC_MAGIC + struct.pack('<Q', packer.tell())
+        packer.pack(entries)
+        packer.pack(ExtType(_TOC_FOOTER, footer))
+
+    # only the pool of this call is shut down, on leaving
+    with _workers(workers) as executor, _using(executor), \
+            _writing(options):
+        if isinstance(path_or_buf, STRING_TYPES):
+            # unbuffered, the packer gathers its output and writes it with
+            # os.writev on the file descriptor
+            with open(path_or_buf, mode, buffering=0) as fh:
+                fd = fh.fileno()
+                entries = None
+                if append:
+                    entries = _read_toc(_file_reader(fh),
+                                        os.fstat(fd).st_size)
+                    if entries is not None:
+                        # the new objects and toc replace the old toc
+                        os.ftruncate(fd, entries.pop(u'start'))
+                        toc = True if toc is None else toc
+                    elif toc:
+                        fh.seek(0)
+                        entries = _scan_toc(fh)
+                writer(fd, offset=os.fstat(fd).st_size, entries=entries)
+        elif path_or_buf is None and buffers:
+            packer = Packer(**kwargs)
+            segments = []
+            for a in args:
+                segments.extend(packer.pack_segments(a))
+            return segments
+        elif path_or_buf is None:
+            buf = io.BytesIO()
+            writer(buf)
+            return buf.getvalue()
+        else:
+            try:
+                offset = path_or_buf.tell()
+            except (AttributeError, OSError, ValueError):
+                offset = 0
+            writer(path_or_buf, offset=offset)
 
 
-def read_msgpack(path_or_buf, encoding='utf-8', iterator=False, **kwargs):
+def read_msgpack(path_or_buf, encoding='utf-8', iterator=False, copy=True,
+                 mmap=False, mmap_mode='r', advice=None, buffers=None,
+                 index=None, indices=None, columns=None, rows=None,
+                 time_range=None, filters=None, lookup=None, lazy=False,
+                 select=None, workers=None, **kwargs):
     """
     Load msgpack pandas object from the specified
     file path
     Parameters
     ----------
-    path_or_buf : string File path, BytesIO like or string
+    path_or_buf : string File path, BytesIO like, bytes, bytearray or
+                  memoryview
     encoding: Encoding for decoding msgpack str type
     iterator : boolean, if True, return an iterator to the unpacker
                (default is False)
+    copy : boolean, if False and path_or_buf is bytes, bytearray or
+           memoryview, uncompressed arrays are returned as views into
+           path_or_buf instead of copies; they are read-only when
+           path_or_buf is (default is True)
+    mmap : boolean, if True and path_or_buf is a file path, memory-map the
+           file and return uncompressed arrays backed by the mapping
+           (default is False)
+    mmap_mode : 'r' for read-only arrays or 'c' for copy-on-write arrays
+                whose changes are never written back (default is 'r')
+    advice : access pattern hint for the mapping, one of 'normal',
+             'sequential', 'random' or 'willneed'; ignored on platforms
+             without madvise (default is None)
+    buffers : iterable of buffer-like objects, the out-of-band buffers in
+              the order they were passed to the buffer_callback of
+              to_msgpack; uncompressed arrays are views into them
+              (default is None)
+    index : int, position of the single object to read from a file with a
+            table of contents, see to_msgpack (default is None)
+    indices : list of ints, positions of the objects to read from a file
+              with a table of contents, returned as a list
+              (default is None)
+    columns : list of column labels, read only these columns of
+              DataFrames; blocks holding none of them are skipped without
+              being copied or decompressed (default is None, all)
+    rows : slice, read only these rows of DataFrames and Series by
+           position; of DataFrames stored in row groups only the row
+           groups overlapping them are decoded (default is None, all)
+    time_range : tuple of two timestamps, either may be None, read only
+                 the rows of DataFrames and Series with a DatetimeIndex
+                 whose label lies between them, both included; of
+                 DataFrames stored in row groups only the row groups
+                 holding such labels are decoded (default is None, all)
+    filters : list of (column, op, value) tuples, read only the rows of
+              DataFrames for which all hold; op is one of '==', '!=',
+              '<', '<=', '>', '>=', 'in' or 'not in'. Of DataFrames
+              stored in row groups with statistics, the row groups the
+              statistics exclude are skipped (default is None, all)
+    lookup : dict of column labels to lists of values, read only the rows
+             of DataFrames holding one of the values in every column; of
+             DataFrames stored in row groups with Bloom filters for the
+             columns, the row groups that cannot hold them are skipped
+             (default is None, all)
+    lazy : boolean, if True, return DataFrames stored whole as
+           LazyDataFrames, which decode a block only when one of its
+           columns is first accessed; cannot be combined with the
+           options selecting columns or rows (default is False)
+    select : list of keys, read only the value at this key path, of map
+             keys and array positions, in each stored object, skipping
+             everything else undecoded; the other options apply to it
+             (default is None, the whole objects)
+    workers : int, if more than 1, decompress the blocks of DataFrames
+              concurrently on this many threads (default is None)
     Returns
     -------
     obj : type of object stored in file
     """
-    path_or_buf, _, _ = get_filepath_or_buffer(path_or_buf)
+    if rows is not None and time_range is not None:
+        raise ValueError('rows and time_range cannot be combined')
+    if lookup is not None:
+        filters = list(filters or []) + [(column, 'in', list(values))
+                                         for column, values in lookup.items()]
+    for _, op, _ in filters or []:
+        if op not in _FILTER_OPS:
+            raise ValueError('unknown filter op {!r}'.format(op))
+    if buffers is not None:
+        kwargs['ext_hook'] = _out_of_band_hook(buffers)
+    if not isinstance(path_or_buf, (bytearray, memoryview)):
+        path_or_buf, _, _ = get_filepath_or_buffer(path_or_buf)
+    selection = dict(columns=columns, rows=rows, time_range=time_range,
+                     filters=filters)
+    if lazy:
+        if any(v is not None for v in selection.values()):
+            raise ValueError('lazy cannot be combined with columns, rows, '
+                             'time_range, filters or lookup')
+        selection = dict(lazy=True)
+    selection['select'] = select
     if iterator:
-        return Iterator(path_or_buf)
-
-    def read(fh):
-        l = list(unpack(fh, encoding=encoding, **kwargs))
+        if index is not None or indices is not None:
+            raise ValueError('iterator cannot be combined with index or '
+                             'indices')
+        buffer = None
+        if isinstance(path_or_buf, STRING_TYPES) and mmap:
+            try:
+                exists = os.path.exists(path_or_buf)
+            except (TypeError, ValueError):
+                exists = False
+            if exists:
+                buffer = _map_file(path_or_buf, mmap_mode, advice)
+        if (buffer is None and not copy and
+                isinstance(path_or_buf, (bytes, bytearray, memoryview))):
+            buffer = path_or_buf
+        return Iterator(path_or_buf, workers=workers, buffer=buffer,
+                        unpack_options=dict(kwargs, encoding=encoding),
+                        **selection)
+
+    def read(fh=None, buffer=None):
+        objs = _selected(unpack(fh, encoding=encoding, buffer=buffer,
+                                **kwargs), workers=workers, **selection)
+        with _workers(workers) as executor, _using(executor):
+            l = list(_without_toc(objs))
         if len(l) == 1:
             return l[0]
         return l
 
+    if index is not None or indices is not None:
+        def read_object(data):
+            if isinstance(data, memoryview) and (mmap or not copy):
+                return read(buffer=data)
+            return read(io.BytesIO(data))
+
+        def read_indexed(read_at, size):
+            entries = _read_toc(read_at, size)
+            if entries is None:
+                raise ValueError('index and indices need a file with a table '
+                                 'of contents, see to_msgpack')
+            if index is not None:
+                return read_object(read_at(entries[u'offsets'][index],
+                                           entries[u'lengths'][index]))
+            return [read_object(read_at(entries[u'offsets'][i],
+                                        entries[u'lengths'][i]))
+                    for i in indices]
+
+        return _with_reader(path_or_buf, read_indexed, mmap=mmap,
+                            mmap_mode=mmap_mode, advice=advice)
+
     # see if we have an actual file
     if isinstance(path_or_buf, STRING_TYPES):
 
@@ -259,11 +745,15 @@ def read_msgpack(path_or_buf, encoding='utf-8', iterator=False, **kwargs):
             exists = False
 
         if exists:
+            if mmap:
+                return read(buffer=_map_file(path_or_buf, mmap_mode, advice))
             with open(path_or_buf, 'rb') as fh:
                 return read(fh)
 
     # treat as a binary-like
-    if isinstance(path_or_buf, bytes):
+    if isinstance(path_or_buf, (bytes, bytearray, memoryview)):
+        if not copy:
+            return read(buffer=path_or_buf)
         fh = None
         try:
             fh = io.BytesIO(path_or_buf)
@@ -279,6 +769,279 @@ def read_msgpack(path_or_buf, encoding='utf-8', iterator=False, **kwargs):
     raise ValueError('path_or_buf needs to be a string file path or file-like')
 
 
+def read_msgpack_schema(path_or_buf, encoding='utf-8'):
+    """
+    Describe the pandas objects stored in the specified file path without
+    reading their data
+
+    Parameters
+    ----------
+    path_or_buf : string File path, BytesIO like, bytes, bytearray or
+                  memoryview
+    encoding: Encoding for decoding msgpack str type
+
+    Returns
+    -------
+    schemas : list, for each stored object the map it is stored as with
+              its array data left out: the typ and klass, the dtype,
+              shape and compression of arrays and blocks, and of
+              DataFrames the column labels in axes and the locs and any
+              statistics of every block; other objects are returned as
+              they are
+    """
+    path_or_buf, _, _ = get_filepath_or_buffer(path_or_buf)
+
+    def read(fh=None, buffer=None):
+        unpacker = unpack(fh, encoding=encoding, buffer=buffer)
+        schemas = []
+        while True:
+            try:
+                schemas.append(_read_schema(unpacker))
+            except OutOfData:
+                return list(_without_toc(schemas))
+
+    if isinstance(path_or_buf, STRING_TYPES) and os.path.exists(path_or_buf):
+        # mapped, skipping the data never reads it from disk
+        return read(buffer=_map_file(path_or_buf))
+    if isinstance(path_or_buf, (bytes, bytearray, memoryview)):
+        return read(buffer=path_or_buf)
+    if hasattr(path_or_buf, 'read'):
+        return read(path_or_buf)
+
+    raise ValueError('path_or_buf needs to be a string file path, bytes-like '
+                     'or file-like')
+
+
+def dumps(obj, buffer_callback=None, **kwargs):
+    """
+    msgpack (serialize) obj to bytes, with the data of its arrays
+    optionally passed out-of-band to buffer_callback, see to_msgpack
+    """
+    return to_msgpack(None, obj, buffer_callback=buffer_callback, **kwargs)
+
+
+def loads(data, buffers=None, **kwargs):
+    """
+    Load a pandas object from bytes made by dumps, with the out-of-band
+    buffers in the order they were passed to its buffer_callback; see
+    read_msgpack
+    """
+    return read_msgpack(data, buffers=buffers, **kwargs)
+
+
+class SharedMemoryHandle(namedtuple('SharedMemoryHandle',
+                                    'name header buffers')):
+    """
+    Picklable reference to an object serialized into shared memory by
+    to_shared_memory: the segment name, the length of the msgpack header
+    at its start and the (offset, length) of each out-of-band buffer.
+    """
+
+    def unlink(self):
+        """ free the segment once no process needs it any more """
+        from multiprocessing.shared_memory import SharedMemory
+        shm = SharedMemory(name=self.name)
+        shm.close()
+        shm.unlink()
+
+
+class _SharedMemoryView(object):
+    """
+    Expose an attached segment as a numpy array whose base is this
+    object, so that the segment stays attached for as long as any array
+    views it and is closed cleanly once none does.
+    """
+
+    def __init__(self, shm, readonly=True):
+        self.shm = shm
+        address = np.frombuffer(shm.buf, dtype=np.uint8).ctypes.data
+        self.__array_interface__ = {u'data': (address, readonly),
+                                    u'shape': (shm.size,),
+                                    u'typestr': u'|u1',
+                                    u'version': 3}
+
+
+def to_shared_memory(obj, align=64, **kwargs):
+    """
+    msgpack (serialize) obj into a new shared memory segment, with the
+    data of each array at an align-byte boundary after the header
+    Parameters
+    ----------
+    obj : the object to serialize
+    align : int, alignment of the data of each array (default is 64)
+    kwargs : passed to to_msgpack, e.g. compress
+    Returns
+    -------
+    handle : SharedMemoryHandle, to pass to from_shared_memory in any
+             process on the same host; call its unlink method to free the
+             segment
+    """
+    from multiprocessing.shared_memory import SharedMemory
+    buffers = []
+    header = dumps(obj, buffer_callback=buffers.append, **kwargs)
+    buffers = [b.raw() for b in buffers]
+
+    offset = len(header)
+    layout = []
+    for b in buffers:
+        offset += -offset % align
+        layout.append((offset, b.nbytes))
+        offset += b.nbytes
+
+    shm = SharedMemory(create=True, size=max(offset, 1))
+    try:
+        shm.buf[:len(header)] = header
+        for (start, length), b in zip(layout, buffers):
+            shm.buf[start:start + length] = b
+        return SharedMemoryHandle(shm.name, len(header), tuple(layout))
+    finally:
+        shm.close()
+
+
+def from_shared_memory(handle, readonly=True):
+    """
+    Load an object serialized by to_shared_memory, uncompressed arrays
+    are views into the segment; they keep it attached and are read-only
+    unless readonly is False
+    """
+    from multiprocessing.shared_memory import SharedMemory
+    data = np.asarray(_SharedMemoryView(SharedMemory(name=handle.name),
+                                        readonly=readonly))
+    buffers = [data[start:start + length]
+               for start, length in handle.buffers]
+    return loads(data[:handle.header].tobytes(), buffers=buffers)
+
+
+def _new_toc():
+    return {u'typ': u'toc', u'offsets': [], u'lengths': [], u'typs': [],
+            u'klasses': []}
+
+
+def _read_toc(read_at, size):
+    """
+    return the table of contents, with the offset it starts at as 'start',
+    from the footer of a stream of size bytes, or None if it has none;
+    read_at(offset, length) returns the bytes at offset
+    """
+    if size < _TOC_FOOTER_SIZE:
+        return None
+    footer = bytes(read_at(size - _TOC_FOOTER_SIZE, _TOC_FOOTER_SIZE))
+    if (footer[:2] != b'\xd8' + struct.pack('b', _TOC_FOOTER) or
+            footer[2:10] != _TOC_MAGIC):
+        return None
+    start, = struct.unpack('<Q', footer[10:])
+    data = read_at(start, size - _TOC_FOOTER_SIZE - start)
+    entries = dict(next(iter(unpack(io.BytesIO(data), object_hook=None,
+                                    use_list=True))))
+    entries[u'start'] = start
+    return entries
+
+
+def _scan_toc(fh):
+    """ return a table of contents of the objects in the file fh """
+    entries = _new_toc()
+    unpacker = unpack(fh, object_hook=None)
+    offset = 0
+    while True:
+        sizes = []
+        try:
+            unpacker.skip(write_bytes=lambda b: sizes.append(len(b)))
+        except OutOfData:
+            return entries
+        for key, value in [(u'offsets', offset), (u'lengths', sum(sizes)),
+                           (u'typs', None), (u'klasses', None)]:
+            entries[key].append(value)
+        offset += sum(sizes)
+
+
+def _is_toc_footer(obj):
+    return (isinstance(obj, ExtType) and obj.code == _TOC_FOOTER and
+            bytes(obj.data[:len(_TOC_MAGIC)]) == _TOC_MAGIC)
+
+
+def _without_toc(objs):
+    """ iterate over objs, leaving out a table of contents and its footer """
+    toc = None
+    for obj in objs:
+        if _is_toc_footer(obj):
+            toc = None
+            continue
+        if toc is not None:
+            yield toc
+            toc = None
+        if isinstance(obj, dict) and obj.get(u'typ') == u'toc':
+            toc = obj
+            continue
+        yield obj
+    if toc is not None:
+        yield toc
+
+
+def _file_reader(fh):
+    """ return a read_at(offset, length) function for the file fh """
+    def read_at(offset, length):
+        fh.seek(offset)
+        return fh.read(length)
+    return read_at
+
+
+def _with_reader(path_or_buf, func, mmap=False, mmap_mode='r', advice=None):
+    """
+    call func(read_at, size) for random access to path_or_buf, a file
+    path, a bytes-like or a seekable file-like; read_at(offset, length)
+    returns memoryviews for mapped files and bytes-likes
+    """
+    if isinstance(path_or_buf, STRING_TYPES) and os.path.exists(path_or_buf):
+        if mmap:
+            path_or_buf = _map_file(path_or_buf, mmap_mode, advice)
+        else:
+            with open(path_or_buf, 'rb') as fh:
+                return func(_file_reader(fh), os.fstat(fh.fileno()).st_size)
+
+    if isinstance(path_or_buf, (bytes, bytearray, memoryview, _mmap.mmap)):
+        data = memoryview(path_or_buf).cast('B')
+        return func(lambda offset, length: data[offset:offset + length],
+                    len(data))
+
+    if hasattr(path_or_buf, 'seek') and hasattr(path_or_buf, 'read'):
+        path_or_buf.seek(0, os.SEEK_END)
+        return func(_file_reader(path_or_buf), path_or_buf.tell())
+
+    raise ValueError('path_or_buf needs to be a string file path, bytes-like '
+                     'or seekable file-like')
+
+
+_mmap_access = {'r': _mmap.ACCESS_READ,
+                'c': _mmap.ACCESS_COPY}
+
+_mmap_advice = {'normal': 'MADV_NORMAL',
+                'sequential': 'MADV_SEQUENTIAL',
+                'random': 'MADV_RANDOM',
+                'willneed': 'MADV_WILLNEED'}
+
+
+def _map_file(path, mode='r', advice=None):
+    """ memory-map the file at path, return the mapping """
+    if mode not in _mmap_access:
+        raise ValueError("mmap_mode must be one of 'r' or 'c'")
+    if advice is not None and advice not in _mmap_advice:
+        raise ValueError("advice must be one of %s"
+                         % ', '.join(repr(a) for a in _mmap_advice))
+
+    with open(path, 'rb') as fh:
+        size = os.fstat(fh.fileno()).st_size
+        if not size:
+            # empty files can't be mapped
+            return b''
+        # the mapping stays valid after the file is closed
+        mapped = _mmap.mmap(fh.fileno(), size, access=_mmap_access[mode])
+
+    flag = getattr(_mmap, _mmap_advice.get(advice, ''), None)
+    if flag is not None and hasattr(mapped, 'madvise'):
+        mapped.madvise(flag)
+    return mapped
+
+
 dtype_dict = {21: np.dtype('M8[ns]'),
               u('datetime64[ns]'): np.dtype('M8[ns]'),
               u('datetime64[us]'): np.dtype('M8[us]'),
@@ -318,8 +1081,287 @@ def c2f(r, i, ctype_name):
     return np.sctypeDict[ctype_name](ftype(r) + 1j * ftype(i))
 
 
-def convert(values):
-    """ convert the numpy values to a list """
+def _encode_values(key, values, column=None):
+    """
+    the converted values under key, the name of the codec they are
+    compressed with under 'compress' and its options, if any, under
+    'compress_options', for the encoded object; compress='auto' picks the
+    codec once for all values of the key, dtype and column, such as the
+    locs of a block, of a call
+    """
+    opts = _options()
+    if opts.delta and values.dtype.kind == 'M':
+        encoded = _delta_encode(values)
+        if encoded is not None:
+            deltas, meta = encoded
+            if deltas is None:
+                d = {key: None, u'compress': None}
+            else:
+                d = _encode_values(key, deltas, column)
+            d[u'delta'] = meta
+            return d
+
+    if (opts.narrow and isinstance(values, np.ndarray) and
+            values.dtype.kind in 'iu'):
+        encoded = _narrow(values)
+        if encoded is not None:
+            narrowed, meta = encoded
+            d = _encode_values(key, narrowed, column)
+            d[u'narrow'] = meta
+            return d
+
+    # once, as it copies values that are not contiguous
+    data = _raw(values)
+    compress, options = opts.compress, opts.compress_options
+    if compress == u'auto':
+        # of the first values, for those of the other row groups too
+        choice = (key, values.dtype.str, column)
+        if opts.codecs is None or choice not in opts.codecs:
+            chosen = _choose_codec(values, data)
+            if opts.codecs is None:
+                compress, options = chosen
+            else:
+                opts.codecs[choice] = chosen
+        if opts.codecs is not None:
+            compress, options = opts.codecs[choice]
+    shuffled = bool(opts.shuffle and compress and data is not None and
+                    values.dtype.itemsize > 1)
+    frame_size = opts.frame_size
+    if (compress and frame_size and data is not None and
+            len(data) > frame_size):
+        # the frame table: the uncompressed size of every frame but the
+        # last, and of all of them
+        itemsize = values.dtype.itemsize
+        size = max(frame_size // itemsize, 1) * itemsize
+        d = {key: _compress_frames(data, compress, size, itemsize, options,
+                                   shuffled),
+             u'compress': compress,
+             u'frames': [size, len(data)]}
+    else:
+        d = {key: convert(values, compress, options, shuffled, data),
+             u'compress': compress}
+    if compress and options:
+        d[u'compress_options'] = options
+    if shuffled:
+        # in the tag, so that readers that don't unshuffle fail loudly
+        d[u'compress'] = compress + _SHUFFLE_SUFFIX
+    return d
+
+
+# appended to the codec name of byte shuffled arrays
+_SHUFFLE_SUFFIX = u'+shuffle'
+
+
+def _compression(obj):
+    """
+    the codec name of the values of the encoded obj, and whether they were
+    byte shuffled before compressing
+    """
+    compress = obj.get(u'compress')
+    if compress and compress.endswith(_SHUFFLE_SUFFIX):
+        return compress[:-len(_SHUFFLE_SUFFIX)], True
+    return compress, False
+
+
+def _narrowest(values):
+    """ the narrowest signed int dtype holding the int64 values """
+    lo, hi = (values.min(), values.max()) if values.size else (0, 0)
+    for dtype in (np.int8, np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+def _narrow(values):
+    """
+    the int values less their min, in the narrowest unsigned int type
+    holding them, and the narrow metadata: the offset added back and the
+    dtype; None if no type is narrower
+    """
+    if not values.size:
+        return None
+    lo, hi = int(values.min()), int(values.max())
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if np.dtype(dtype).itemsize >= values.dtype.itemsize:
+            return None
+        if hi - lo <= np.iinfo(dtype).max:
+            break
+    else:
+        return None
+    # the differences fit the dtype of values, being at most hi - lo
+    narrowed = (values - values.dtype.type(lo)).astype(dtype)
+    return narrowed, {u'offset': lo, u'dtype': u(np.dtype(dtype).name)}
+
+
+def _width(values):
+    """ the bytes an int64 value of values is stored in, narrowed if narrow """
+    widths = [_narrowest(values).itemsize]
+    if _options().narrow and values.size:
+        span = int(values.max()) - int(values.min())
+        widths += [np.dtype(dtype).itemsize
+                   for dtype in (np.uint8, np.uint16, np.uint32)
+                   if span <= np.iinfo(dtype).max]
+    return min(widths)
+
+
+def _delta_encode(values):
+    """
+    the deltas, or deltas of deltas, along the last axis of the datetime64
+    values, in the narrowest int type, and the delta metadata: the order,
+    the first values (and deltas) of every row, their length n and the
+    dtype; None deltas for a regular grid, and None if neither order is
+    narrower than int64 or the values hold NaT
+    """
+    n = values.shape[-1]
+    if n < 3:
+        return None
+    rows = np.frombuffer(_raw(values), dtype=np.int64).reshape(-1, n)
+    if (rows == NaT.value).any():
+        return None
+    diffs = [rows]
+    for _ in range(2):
+        diffs.append(np.diff(diffs[-1], axis=1))
+
+    if not diffs[2].any():
+        order, deltas = 2, None
+    else:
+        order = min((1, 2), key=lambda o: _width(diffs[o]))
+        if _width(diffs[order]) == 8:
+            return None
+        deltas = diffs[order].astype(_narrowest(diffs[order]))
+    heads = np.stack([diffs[j][:, 0] for j in range(order)], axis=1)
+    return deltas, {u'order': order,
+                    u'heads': heads.tolist(),
+                    u'n': n,
+                    u'dtype': None if deltas is None else u(
+                        deltas.dtype.name)}
+
+
+def _delta_decode(obj, key):
+    """ the int64 values of the delta encoded values under key of obj """
+    meta = obj[u'delta']
+    order, n = meta[u'order'], meta[u'n']
+    heads = np.array(meta[u'heads'], dtype=np.int64).reshape(-1, order)
+    if obj[key] is None:
+        values = np.zeros((len(heads), n - order), dtype=np.int64)
+    else:
+        compress, shuffled = _compression(obj)
+        values = unconvert(obj[key], np.dtype(meta[u'dtype']), compress,
+                           obj.get(u'frames'), size=len(heads) * (n - order),
+                           shuffle=shuffled, narrow=obj.get(u'narrow'))
+        values = values.reshape(len(heads), n - order).astype(np.int64)
+    # integrate the deltas of each order, starting at the heads
+    for j in reversed(range(order)):
+        head = heads[:, j:j + 1]
+        values = np.concatenate([head, head + np.cumsum(values, axis=1)],
+                                axis=1)
+    return values.reshape(-1)
+
+
+def _compress_frames(data, compress, size, itemsize, options=None,
+                     shuffle=False):
+    """
+    the frames of size bytes of the memory data, each byte shuffled if
+    shuffle, compressed
+    """
+    codec = _get_codec(compress)
+
+    def compress_frame(start):
+        frame = data[start:start + size]
+        if shuffle:
+            frame = _shuffled(frame, itemsize)
+        return codec.compress(frame, itemsize, **(options or {}))
+
+    frames = _map(compress_frame, range(0, len(data), size))
+    return [_out_of_band(ExtType(0, f)) for f in frames]
+
+
+def _decompress_frames(frames, compress, table, spans=None, shuffle=1):
+    """
+    the uint8 array of the compressed frames with the frame table table;
+    if spans of byte positions are given, only the frames holding them are
+    decompressed and the rest is left zero; each frame is unshuffled of
+    items of shuffle bytes
+    """
+    size, nbytes = table
+    if spans is None:
+        out = np.empty(nbytes, dtype=np.uint8)
+        wanted = range(len(frames))
+    else:
+        out = np.zeros(nbytes, dtype=np.uint8)
+        wanted = sorted(set(i for lo, hi in spans if hi > lo
+                            for i in range(lo // size, (hi - 1) // size + 1)))
+    codec = _get_codec(compress)
+
+    def decompress(i):
+        # straight into its part of out, where the codec can
+        target = out[i * size:(i + 1) * size]
+        if codec.decompress_into is not None:
+            n = codec.decompress_into(frames[i].data, target)
+        else:
+            data = codec.decompress(frames[i].data)
+            n = len(data)
+            if n == len(target):
+                target[:] = np.frombuffer(data, dtype=np.uint8)
+        if n != len(target):
+            raise ValueError('decompressed {} bytes of frame {}, expected '
+                             '{}'.format(n, i, len(target)))
+        if shuffle > 1:
+            _unshuffle(target, shuffle)
+
+    _map(decompress, wanted)
+    return out
+
+
+def _shuffled(data, itemsize):
+    """
+    the bytes of the memory data of items of itemsize bytes, byte shuffled:
+    the first bytes of all items, then the second bytes and so on
+    """
+    return np.frombuffer(data, dtype=np.uint8).reshape(
+        -1, itemsize).T.tobytes()
+
+
+def _unshuffled(data, itemsize):
+    """ the uint8 array of the byte shuffled uint8 array data, unshuffled """
+    return np.ascontiguousarray(data.reshape(itemsize, -1).T).reshape(-1)
+
+
+def _unshuffle(data, itemsize):
+    """ unshuffle the byte shuffled uint8 array data in place """
+    data[:] = _unshuffled(data, itemsize)
+
+
+def _row_spans(shape, rows):
+    """
+    the spans of item positions holding the rows slice of the values of
+    an array of shape, of rows along its last axis
+    """
+    positions = range(shape[-1])[rows]
+    if not len(positions):
+        return []
+    lo = min(positions[0], positions[-1])
+    hi = max(positions[0], positions[-1]) + 1
+    n = shape[-1]
+    return [(j * n + lo, j * n + hi)
+            for j in range(int(np.prod(shape[:-1], dtype=np.int64)))]
+
+
+def _raw(values):
+    """ the memory of the numpy values, None if they are not numbers """
+    if is_categorical_dtype(values) or is_object_dtype(values.dtype):
+        return None
+    if needs_i8_conversion(values.dtype):
+        values = values.view('i8')
+    return memoryview(values.ravel()).cast('B')
+
+
+def convert(values, compress=None, options=None, shuffle=False, data=None):
+    """
+    convert the numpy values to a list; data is their memory, if already
+    taken with _raw
+    """
 
     dtype = values.dtype
 
@@ -329,37 +1371,130 @@ def convert(values):
     elif is_object_dtype(dtype):
         return values.ravel().tolist()
 
-    if needs_i8_conversion(dtype):
-        values = values.view('i8')
-    v = values.ravel()
-
-    if compressor == 'zlib':
-        _check_zlib()
+    v = _raw(values) if data is None else data
+    if compress:
+        codec = _get_codec(compress)
+        if shuffle:
+            v = _shuffled(v, dtype.itemsize)
+        return _out_of_band(ExtType(0, codec.compress(v, dtype.itemsize,
+                                                      **(options or {}))))
+
+    # ndarray (on original dtype), as a view of its memory
+    return _out_of_band(ExtType(0, v))
+
+
+# compress='auto' tries these codecs and options, where available, on a
+# sample of _AUTO_SAMPLE bytes of every array of at least _AUTO_MIN_SIZE
+# bytes, and only compresses with the best if it saves _AUTO_MIN_RATIO.
+# Every codec is tried at a fast and a high level, the faster codecs
+# first, until the trials took _AUTO_BUDGET seconds
+_AUTO_CODECS = ((u'lz4', {}), (u'lz4', {u'compression_level': 9}),
+                (u'zstd', {u'level': 1}), (u'zstd', {u'level': 19}),
+                (u'blosc', {u'clevel': 1}), (u'blosc', {u'clevel': 9}),
+                (u'blosc', {u'clevel': 1, u'shuffle': u'bit'}),
+                (u'blosc', {u'clevel': 9, u'shuffle': u'bit'}),
+                (u'zlib', {u'level': 1}), (u'zlib', {u'level': 9}),
+                (u'lzma', {u'preset': 1}), (u'lzma', {u'preset': 6}),
+                (u'bz2', {u'compresslevel': 1}),
+                (u'bz2', {u'compresslevel': 9}))
+_AUTO_SAMPLE = 16 * 1024
+_AUTO_MIN_SIZE = 1024
+_AUTO_MIN_RATIO = 1.1
+_AUTO_BUDGET = 0.02
+
+
+def _sample(data, itemsize, n=4):
+    """ n evenly spaced, item aligned slices of data, _AUTO_SAMPLE in all """
+    if len(data) <= _AUTO_SAMPLE:
+        return bytes(data)
+    size = _AUTO_SAMPLE // n // itemsize * itemsize
+    step = (len(data) - size) // (n - 1) // itemsize * itemsize
+    return b''.join(bytes(data[i * step:i * step + size]) for i in range(n))
+
+
+def _choose_codec(values, data=None):
+    """
+    the name and options of the codec compressing a sample of the numpy
+    values, of the memory data if already taken with _raw, best of those
+    decompressing it at min_decode_speed, None and no options if none is
+    worth it
+    """
+    best, best_options, best_ratio = None, {}, _AUTO_MIN_RATIO
+    if data is None:
+        data = _raw(values)
+    if data is None or len(data) < _AUTO_MIN_SIZE:
+        return best, best_options
+    sample = _sample(data, values.dtype.itemsize)
+    opts = _options()
+    if opts.shuffle and values.dtype.itemsize > 1:
+        sample = _shuffled(sample, values.dtype.itemsize)
+
+    deadline = time.perf_counter() + _AUTO_BUDGET
+    for name, options in _AUTO_CODECS:
+        try:
+            codec = _get_codec(name)
+        except ImportError:
+            continue
+        compressed = codec.compress(sample, values.dtype.itemsize, **options)
+        # the fastest of a few, the sample being small
+        elapsed = float('inf')
+        for _ in range(3):
+            start = time.perf_counter()
+            codec.decompress(compressed)
+            elapsed = min(elapsed, time.perf_counter() - start)
+        ratio = len(sample) / float(max(len(compressed), 1))
+        if (ratio > best_ratio and
+                len(sample) >= opts.min_decode_speed * 1e6 * elapsed):
+            best, best_options, best_ratio = name, options, ratio
+        if time.perf_counter() > deadline:
+            break
+    return best, best_options
+
+
+def _out_of_band(ext):
+    """
+    offer the data of ext to the buffer_callback, return ext or the
+    placeholder to write instead of it
+    """
+    opts = _options()
+    if (opts.buffer_callback is None or
+            opts.buffer_callback(pickle.PickleBuffer(ext.data))):
+        return ext
+    return ExtType(_OUT_OF_BAND, struct.pack('<I', next(opts.buffer_ids)))
 
-        # return string arrays like they are
-        if dtype == np.object_:
-            return v.tolist()
 
-        # convert to a bytes array
-        v = v.tobytes()
-        return ExtType(0, zlib.compress(v))
+def _out_of_band_hook(buffers):
+    """ return an ext_hook resolving placeholders into buffers """
+    buffers = [memoryview(b).cast('B') for b in buffers]
 
-    elif compressor == 'blosc':
-        _check_blosc()
+    def ext_hook(code, data):
+        if code == _OUT_OF_BAND:
+            return ExtType(0, buffers[struct.unpack('<I', data)[0]])
+        return ExtType(code, data)
 
-        # return string arrays like they are
-        if dtype == np.object_:
-            return v.tolist()
+    return ext_hook
 
-        # convert to a bytes array
-        v = v.tobytes()
-        return ExtType(0, blosc.compress(v, typesize=dtype.itemsize))
 
-    # ndarray (on original dtype)
-    return ExtType(0, v.tobytes())
+def _unconvert(obj, key, dtype, spans=None, size=None):
+    """
+    unconvert the values under key of the encoded obj, by how it records
+    they are stored
+    """
+    if u'delta' in obj:
+        # all of them, to sum the deltas
+        return _delta_decode(obj, key).view(pandas_dtype(dtype).base)
+    compress, shuffled = _compression(obj)
+    return unconvert(obj[key], dtype, compress, obj.get(u'frames'), spans,
+                     size, shuffled, obj.get(u'narrow'))
 
 
-def unconvert(values, dtype, compress=None):
+def unconvert(values, dtype, compress=None, frames=None, spans=None,
+              size=None, shuffle=False, narrow=None):
+    """
+    the numpy array of the converted values; compressed values of a known
+    size, of items, are decompressed straight into it where the codec can,
+    byte shuffled values are unshuffled and narrowed values widened
+    """
 
     as_is_ext = isinstance(values, ExtType) and values.code == 0
 
@@ -380,47 +1515,78 @@ def unconvert(values, dtype, compress=None):
     else:
         dtype = original_dtype.base
 
-    if not as_is_ext:
+    if narrow is not None:
+        # stored as the narrowed values, widened below
+        dtype, stored_dtype = np.dtype(narrow[u'dtype']), np.dtype(dtype)
+
+    if not as_is_ext and frames is None:
         values = values.encode('latin1')
 
-    if compress:
-        if compress == u'zlib':
-            _check_zlib()
-            decompress = zlib.decompress
-        elif compress == u'blosc':
-            _check_blosc()
-            decompress = blosc.decompress
+    if frames is not None:
+        # compressed frames, of which only those of spans are needed
+        itemsize = np.dtype(dtype).itemsize
+        if spans is not None:
+            spans = [(lo * itemsize, hi * itemsize) for lo, hi in spans]
+        array = _decompress_frames(values, compress, frames, spans,
+                                   itemsize if shuffle else 1).view(dtype)
+        in_place = False
+    elif compress:
+        codec = _get_codec(compress)
+        if size is not None and codec.decompress_into is not None:
+            # one allocation, of the known size
+            array = np.empty(size, dtype=dtype)
+            n = 0
+            if size:
+                n = codec.decompress_into(values, array.view(np.uint8))
+            if n != array.nbytes:
+                raise ValueError('decompressed {} bytes, expected {}'.format(
+                    n, array.nbytes))
+            if shuffle:
+                _unshuffle(array.view(np.uint8), array.itemsize)
         else:
-            raise ValueError("compress must be one of 'zlib' or 'blosc'")
+            decompress = codec.decompress
 
-        try:
-            array = np.frombuffer(
-                _move_into_mutable_buffer(decompress(values)),
-                dtype=dtype,
-            )
-        except _BadMove as e:
-            # Pull the decompressed data off of the `_BadMove` exception.
-            # We don't just store this in the locals because we want to
-            # minimize the risk of giving users access to a `bytes` object
-            # whose data is also given to a mutable buffer.
-            values = e.args[0]
-            if len(values) > 1:
-                # The empty string and single characters are memoized in many
-                # string creating functions in the capi. This case should not
-                # warn even though we need to make a copy because we are only
-                # copying at most 1 byte.
-                raise PerformanceWarning(
-                    'copying data after decompressing; this may mean that'
-                    ' decompress is caching its result',
-                    PerformanceWarning,
+            try:
+                array = np.frombuffer(
+                    _move_into_mutable_buffer(decompress(values)),
+                    dtype=dtype,
                 )
-            # fall through to copying `np.fromstring`
-            array = np.frombuffer(values, dtype=dtype)
+            except _BadMove as e:
+                # Pull the decompressed data off of the `_BadMove`
+                # exception. We don't just store this in the locals because
+                # we want to minimize the risk of giving users access to a
+                # `bytes` object whose data is also given to a mutable
+                # buffer.
+                values = e.args[0]
+                if len(values) > 1:
+                    # The empty string and single characters are memoized in
+                    # many string creating functions in the capi. This case
+                    # should not warn even though we need to make a copy
+                    # because we are only copying at most 1 byte.
+                    warnings.warn(
+                        'copying data after decompressing; this may mean that'
+                        ' decompress is caching its result',
+                        PerformanceWarning,
+                        stacklevel=2,
+                    )
+                # fall through to copying `np.fromstring`
+                array = np.frombuffer(values, dtype=dtype)
+            if shuffle:
+                array = _unshuffled(array.view(np.uint8),
+                                    array.itemsize).view(dtype)
+        in_place = False
     else:
         array = np.frombuffer(values, dtype=dtype)
+        # a memoryview into the source buffer of a zero-copy read
+        in_place = isinstance(values, memoryview)
+
+    if narrow is not None:
+        array = array.astype(stored_dtype)
+        array += stored_dtype.type(narrow[u'offset'])
+        in_place = False
 
     # Set array to be writeable
-    if not array.flags.writeable:
+    if not array.flags.writeable and not in_place:
         # Move the data into a new array
         # This is identical to how the deprecated np.fromstring worked
         # in the old version of packers.
@@ -453,8 +1619,7 @@ def encode(obj):
                     u'name': getattr(obj, 'name', None),
                     u'freq': u_safe(getattr(obj, 'freqstr', None)),
                     u'dtype': u(obj.dtype.name),
-                    u'data': convert(obj.asi8),
-                    u'compress': compressor}
+                    **_encode_values(u'data', obj.asi8)}
         elif isinstance(obj, DatetimeIndex):
             tz = getattr(obj, 'tz', None)
 
@@ -466,24 +1631,21 @@ def encode(obj):
                     u'klass': u(obj.__class__.__name__),
                     u'name': getattr(obj, 'name', None),
                     u'dtype': u(obj.dtype.name),
-                    u'data': convert(obj.asi8),
                     u'freq': u_safe(getattr(obj, 'freqstr', None)),
                     u'tz': tz,
-                    u'compress': compressor}
+                    **_encode_values(u'data', obj.values)}
         elif isinstance(obj, MultiIndex):
             return {u'typ': u'multi_index',
                     u'klass': u(obj.__class__.__name__),
                     u'names': getattr(obj, 'names', None),
                     u'dtype': u(obj.dtype.name),
-                    u'data': convert(obj.values),
-                    u'compress': compressor}
+                    **_encode_values(u'data', obj.values)}
         else:
             return {u'typ': u'index',
                     u'klass': u(obj.__class__.__name__),
                     u'name': getattr(obj, 'name', None),
                     u'dtype': u(obj.dtype.name),
-                    u'data': convert(obj.values),
-                    u'compress': compressor}
+                    **_encode_values(u'data', obj.values)}
 
     elif isinstance(obj, Categorical):
         return {u'typ': u'category',
@@ -492,7 +1654,7 @@ def encode(obj):
                 u'codes': obj.codes,
                 u'categories': obj.categories,
                 u'ordered': obj.ordered,
-                u'compress': compressor}
+                u'compress': _options().compress}
 
     elif isinstance(obj, Series):
         if isinstance(obj.dtype, SparseDtype):
@@ -501,8 +1663,7 @@ def encode(obj):
                 'dtype': obj.dtype.name,
                 'index': obj.index,
                 'sp_index': obj.values.sp_index,
-                'sp_values': convert(obj.values.sp_values),
-                'compress': compressor}
+                **_encode_values(u'sp_values', obj.values.sp_values)}
             for f in ['name', 'fill_value', 'kind']:
                d[f] = getattr(obj, f, None)
             return d
@@ -512,8 +1673,7 @@ def encode(obj):
                     u'name': getattr(obj, 'name', None),
                     u'index': obj.index,
                     u'dtype': u(obj.dtype.name),
-                    u'data': convert(obj.values),
-                    u'compress': compressor}
+                    **_encode_values(u'data', obj.values)}
     elif issubclass(tobj, NDFrame):
         # if isinstance(obj.dtype, SparseDtype):
         #     d = {'typ': 'sparse_dataframe',
@@ -525,21 +1685,31 @@ def encode(obj):
         #                     for name, ss in compat.iteritems(obj)])
         #     return d
         # else:
-        data = obj._data
-        if not data.is_consolidated():
-            data = data.consolidate()
+        opts = _options()
+        row_group_size = opts.row_group_size
+        if (row_group_size and isinstance(obj, DataFrame) and
+                len(obj) > row_group_size):
+            # the row groups are encoded as frames of their own
+            d = {u'typ': u'row_groups',
+                 u'klass': u(obj.__class__.__name__),
+                 u'nrows': len(obj),
+                 u'row_group_size': row_group_size}
+            if isinstance(obj.index, DatetimeIndex):
+                d[u'index_stats'] = _index_stats(obj.index, row_group_size)
+            groups = [obj.iloc[i:i + row_group_size]
+                      for i in range(0, len(obj), row_group_size)]
+            if opts.statistics or _pool() is not None:
+                groups = _map(_encode_block_manager, groups)
+            if opts.statistics:
+                d[u'columns'] = obj.columns
+                d[u'column_stats'] = _column_stats(groups, len(obj.columns))
+            if opts.bloom_columns:
+                d[u'bloom'] = _bloom(obj, opts.bloom_columns, row_group_size)
+            d[u'row_groups'] = groups
+            return d
+
+        return _encode_block_manager(obj)
 
-        # the block manager
-        return {u'typ': u'block_manager',
-                u'klass': u(obj.__class__.__name__),
-                u'axes': data.axes,
-                u'blocks': [{u'locs': b.mgr_locs.as_array,
-                            u'values': convert(b.values),
-                            u'shape': b.values.shape,
-                            u'dtype': u(b.dtype.name),
-                            u'klass': u(b.__class__.__name__),
-                            u'compress': compressor} for b in data.blocks]
-                }
 
     elif isinstance(obj, (datetime, date, np.datetime64, timedelta,
                           np.timedelta64, NaTType)):
@@ -592,8 +1762,7 @@ def encode(obj):
                 u'shape': obj.shape,
                 u'ndim': obj.ndim,
                 u'dtype': u(obj.dtype.name),
-                u'data': convert(obj),
-                u'compress': compressor}
+                **_encode_values(u'data', obj)}
     elif isinstance(obj, np.number):
         if np.iscomplexobj(obj):
             return {u'typ': u'np_scalar',
@@ -613,9 +1782,138 @@ def encode(obj):
     return obj
 
 
-def decode(obj):
+def _encode_block_manager(obj):
+    data = obj._data
+    if not data.is_consolidated():
+        data = data.consolidate()
+
+    # the block manager, its axes and blocks encoded together
+    n = len(data.axes)
+    encoded = _map(lambda f: f(),
+                   [partial(encode, a) for a in data.axes] +
+                   [partial(_encode_block, b) for b in data.blocks])
+    return {u'typ': u'block_manager',
+            u'klass': u(obj.__class__.__name__),
+            u'axes': encoded[:n],
+            u'blocks': encoded[n:]}
+
+
+def _encode_block(b):
+    d = {u'locs': b.mgr_locs.as_array}
+    if _options().statistics:
+        d[u'stats'] = _block_stats(b.values)
+    d.update(_encode_values(u'values', b.values,
+                            tuple(b.mgr_locs.as_array.tolist())))
+    d.update({u'shape': b.values.shape,
+              u'dtype': u(b.dtype.name),
+              u'klass': u(b.__class__.__name__)})
+    return d
+
+
+_STATS = (u'min', u'max', u'null_count', u'distinct')
+
+
+def _block_stats(values):
+    """
+    the min, max, null count and distinct count of every column of the
+    values of a block; min and max are None for unordered columns
+    """
+    stats = dict((k, []) for k in _STATS)
+    for column in (values if values.ndim == 2 else [values]):
+        s = Series(column, copy=False)
+        valid = s.dropna()
+        try:
+            lo, hi = (valid.min(), valid.max()) if len(valid) else (None, None)
+        except TypeError:
+            lo = hi = None
+        # numpy scalars, such as of bools, as the plain values
+        lo, hi = [v.item() if isinstance(v, np.generic) else v
+                  for v in (lo, hi)]
+        try:
+            distinct = int(valid.nunique())
+        except TypeError:
+            distinct = None
+        stats[u'min'].append(lo)
+        stats[u'max'].append(hi)
+        stats[u'null_count'].append(int(len(s) - len(valid)))
+        stats[u'distinct'].append(distinct)
+    return stats
+
+
+def _column_stats(groups, ncols):
+    """
+    the statistics of each column as lists over the encoded row groups,
+    gathered from the statistics of their blocks
+    """
+    stats = [dict((k, []) for k in _STATS) for _ in range(ncols)]
+    for g in groups:
+        for b in g[u'blocks']:
+            for i, loc in enumerate(b[u'locs']):
+                for k in _STATS:
+                    stats[loc][k].append(b[u'stats'][k][i])
+    return stats
+
+
+# a Bloom filter has _BLOOM_BITS bits per distinct value and sets
+# _BLOOM_HASHES of them for each, for about 1% false positives
+_BLOOM_BITS = 10
+_BLOOM_HASHES = 7
+_BLOOM_KEY = '5a0b2ce19f8d7e36'
+
+
+def _bloom(obj, columns, size):
+    """ the Bloom filters of each of the columns of obj per row group """
+    filters = []
+    for column in columns:
+        values = obj[column].values
+        filters.append([_bloom_filter(values[i:i + size])
+                        for i in range(0, len(values), size)])
+    return {u'columns': list(columns),
+            u'dtypes': [u(obj[column].dtype.name) for column in columns],
+            u'hashes': _BLOOM_HASHES,
+            u'filters': filters}
+
+
+def _bloom_positions(values, nbits, nhashes):
+    """ the nhashes bits of each of values, by double hashing """
+    h1 = hash_array(values)
+    h2 = hash_array(values, hash_key=_BLOOM_KEY) | np.uint64(1)
+    i = np.arange(nhashes, dtype=np.uint64)
+    return (h1[:, None] + i * h2[:, None]) % np.uint64(nbits)
+
+
+def _bloom_filter(values):
+    values = unique(values[~isna(values)])
+    nbits = max(64, -(-len(values) * _BLOOM_BITS // 8) * 8)
+    bits = np.zeros(nbits, dtype=bool)
+    bits[_bloom_positions(values, nbits, _BLOOM_HASHES).ravel()] = True
+    return np.packbits(bits).tobytes()
+
+
+def _bloom_may_contain(bloom, column, values):
+    """
+    which row groups may hold any of values in the column at position
+    column of the Bloom filters bloom
+    """
+    try:
+        values = Series(values, dtype=bloom[u'dtypes'][column]).values
+    except (TypeError, ValueError):
+        # values the column cannot hold are left to the filter
+        return np.ones(len(bloom[u'filters'][column]), dtype=bool)
+    values = values[~isna(values)]
+    wanted = []
+    for f in bloom[u'filters'][column]:
+        bits = np.unpackbits(np.frombuffer(f, dtype=np.uint8))
+        positions = _bloom_positions(values, len(bits), bloom[u'hashes'])
+        wanted.append(bool(bits[positions].all(axis=1).any()))
+    return np.array(wanted, dtype=bool)
+
+
+def decode(obj, rows=None):
     """
     Decoder for deserializing numpy data types.
+    If the slice rows is given, of the compressed frames of DataFrames and
+    Series only those holding these rows are decompressed.
     """
 
     typ = obj.get(u'typ')
@@ -630,8 +1928,7 @@ def decode(obj):
         return Period(ordinal=obj[u'ordinal'], freq=obj[u'freq'])
     elif typ == u'index':
         dtype = dtype_for(obj[u'dtype'])
-        data = unconvert(obj[u'data'], dtype,
-                         obj.get(u'compress'))
+        data = _unconvert(obj, u'data', dtype)
         return globals()[obj[u'klass']](data, dtype=dtype, name=obj[u'name'])
     elif typ == u'range_index':
         return globals()[obj[u'klass']](obj[u'start'],
@@ -645,7 +1942,7 @@ def decode(obj):
         data = [tuple(x) for x in data]
         return globals()[obj[u'klass']].from_tuples(data, names=obj[u'names'])
     elif typ == u'period_index':
-        data = unconvert(obj[u'data'], obj[u'dtype'], obj.get(u'compress'))
+        data = _unconvert(obj, u'data', obj[u'dtype'])
         d = dict(name=obj[u'name'], freq=obj[u'freq'])
         # raise ValueError(obj)
         # if _is_pandas_legacy_version:
@@ -655,7 +1952,7 @@ def decode(obj):
         #     return globals()[obj[u'klass']]._from_ordinals(data, **d)
         return globals()[obj[u'klass']](data, **d)
     elif typ == u'datetime_index':
-        data = unconvert(obj[u'data'], np.int64, obj.get(u'compress'))
+        data = _unconvert(obj, u'data', np.int64)
         d = dict(
             name=obj[u'name'], 
             freq=obj[u'freq'], 
@@ -680,36 +1977,31 @@ def decode(obj):
         pd_dtype = pandas_dtype(dtype)
 
         index = obj[u'index']
-        result = globals()[obj[u'klass']](unconvert(obj[u'data'], dtype,
-                                                    obj[u'compress']),
+        spans = None
+        if rows is not None:
+            spans = _row_spans((len(index),), rows)
+        result = globals()[obj[u'klass']](_unconvert(obj, u'data', dtype,
+                                                     spans, len(index)),
                                           index=index,
                                           dtype=pd_dtype,
                                           name=obj[u'name'])
         return result
 
     elif typ == u'block_manager':
-        from pandas.core.internals import BlockManager, make_block
-        import pandas.core.internals as internals
-        axes = obj[u'axes']
-
-        def create_block(b):
-            values = _safe_reshape(unconvert(
-                b[u'values'], dtype_for(b[u'dtype']),
-                b[u'compress']), b[u'shape'])
-
-            # locs handles duplicate column names, and should be used instead
-            # of items; see GH 9618
-            if u'locs' in b:
-                placement = b[u'locs']
-            else:
-                placement = axes[0].get_indexer(b[u'items'])
-            return make_block(values=values,
-                              klass=getattr(internals.blocks, b[u'klass']),
-                              placement=placement,
-                              dtype=b[u'dtype'])
-
-        blocks = [create_block(b) for b in obj[u'blocks']]
-        return globals()[obj[u'klass']](BlockManager(blocks, list(axes)))
+        from pandas.core.internals import BlockManager
+        # the axes _read_map left undecoded are decoded with the blocks
+        axes = list(obj[u'axes'])
+        raw = [i for i, axis in enumerate(axes) if isinstance(axis, dict)]
+        values = _map(_call, [partial(_decode_raw, axes[i]) for i in raw] +
+                      [partial(_block_values, b, rows=rows)
+                       for b in obj[u'blocks']])
+        for i, axis in zip(raw, values):
+            axes[i] = axis
+        blocks = [_create_block(b, v, _placement(b, axes))
+                  for b, v in zip(obj[u'blocks'], values[len(raw):])]
+        return globals()[obj[u'klass']](BlockManager(blocks, axes))
+    elif typ == u'row_groups':
+        return _concat_row_groups(obj[u'row_groups'])
     elif typ == u'datetime':
         return parse(obj[u'data'])
     elif typ == u'datetime64':
@@ -745,8 +2037,9 @@ def decode(obj):
     elif typ == u'int_index':
         return globals()[obj[u'klass']](obj[u'length'], obj[u'indices'])
     elif typ == u'ndarray':
-        return unconvert(obj[u'data'], np.sctypeDict[obj[u'dtype']],
-                         obj.get(u'compress')).reshape(obj[u'shape'])
+        return _unconvert(obj, u'data', np.sctypeDict[obj[u'dtype']],
+                          size=int(np.prod(obj[u'shape'], dtype=np.int64))
+                          ).reshape(obj[u'shape'])
     elif typ == u'np_scalar':
         if obj.get(u'sub_typ') == u'np_complex':
             return c2f(obj[u'real'], obj[u'imag'], obj[u'dtype'])
@@ -764,6 +2057,696 @@ def decode(obj):
         return obj
 
 
+def _map(func, items):
+    """
+    [func(item) for item in items], run on the threads of the pool of this
+    thread if there is one, with its options and pool, but serially while
+    the buffer_callback has to see the buffers in order
+    """
+    items = list(items)
+    executor = _pool()
+    options = getattr(_local, 'options', None)
+    if (executor is None or len(items) < 2 or
+            options is not None and options.buffer_callback is not None):
+        return [func(item) for item in items]
+
+    # the calling thread runs the items no thread has started, so that
+    # nested calls, as of the frames of a block, cannot deadlock the pool
+    futures = [executor.submit(_run_with, options, executor, func, item)
+               for item in items]
+    return [func(item) if future.cancel() else future.result()
+            for item, future in zip(items, futures)]
+
+
+def _call(func):
+    return func()
+
+
+def _run_with(options, executor, func, item):
+    """ func(item), encoding with options and on executor """
+    with _writing(options), _using(executor):
+        return func(item)
+
+
+@contextmanager
+def _workers(workers):
+    """ a thread pool of workers threads, None for 1 or None """
+    if not workers or workers <= 1:
+        yield None
+        return
+    with ThreadPoolExecutor(workers) as executor:
+        yield executor
+
+
+def _pool():
+    """ the thread pool of the call on this thread, if any """
+    return getattr(_local, 'executor', None)
+
+
+@contextmanager
+def _using(executor):
+    """ (de)compress the blocks on executor on this thread """
+    previous = _pool()
+    _local.executor = executor
+    try:
+        yield
+    finally:
+        _local.executor = previous
+
+
+def _placement(b, axes):
+    # locs handles duplicate column names, and should be used instead
+    # of items; see GH 9618
+    if u'locs' in b:
+        return b[u'locs']
+    return axes[0].get_indexer(b[u'items'])
+
+
+def _block_values(b, rows=None):
+    # of the rows slice only, if given
+    spans = None
+    if rows is not None:
+        spans = _row_spans(b[u'shape'], rows)
+    size = int(np.prod(b[u'shape'], dtype=np.int64))
+    return _safe_reshape(_unconvert(b, u'values', dtype_for(b[u'dtype']),
+                                    spans, size), b[u'shape'])
+
+
+def _create_block(b, values, placement):
+    from pandas.core.internals import make_block
+    import pandas.core.internals as internals
+    return make_block(values=values,
+                      klass=getattr(internals.blocks, b[u'klass']),
+                      placement=placement,
+                      dtype=b[u'dtype'])
+
+
+# keys whose values hold array data, left out of a schema
+_DATA_KEYS = (u'data', u'values', u'sp_values', u'__pad__')
+
+# the first bytes of msgpack bin, ext and array values, which array data
+# is stored as
+_DATA_TYPES = frozenset(list(range(0xc4, 0xca)) + list(range(0xd4, 0xd9)) +
+                        list(range(0x90, 0xa0)) + [0xdc, 0xdd])
+
+# the typs of scalars, whose data is kept in the schema
+_SCALAR_TYPS = (u'timedelta', u'timedelta64', u'datetime64', u'datetime',
+                u'date', u'np_scalar', u'np_complex')
+
+
+def _read_schema(unpacker, encoded=False):
+    """
+    read the next object of unpacker, skipping array data; only the column
+    labels of a block manager and the locs and statistics of its blocks
+    are decoded. Array data is only looked for in the maps of encoded
+    objects, those with a typ and the maps in them, so that the maps of
+    the caller are read whole
+    """
+    try:
+        n = unpacker.read_map_header()
+    except ValueError:
+        pass
+    else:
+        obj = {}
+        for _ in range(n):
+            key = unpacker.unpack()
+            encoded = encoded or key == u'typ'
+            if (encoded and key in _DATA_KEYS and
+                    obj.get(u'typ') not in _SCALAR_TYPS and
+                    unpacker.peek_type() in _DATA_TYPES):
+                unpacker.skip()
+            elif encoded and key in (u'locs', u'stats'):
+                obj[key] = unpacker.unpack()
+            elif key == u'axes' and obj.get(u'typ') == u'block_manager':
+                n_axes = unpacker.read_array_header()
+                obj[key] = [unpacker.unpack()] + [
+                    _read_schema(unpacker, encoded)
+                    for _ in range(n_axes - 1)]
+            else:
+                obj[key] = _read_schema(unpacker, encoded)
+        return obj
+
+    try:
+        n = unpacker.read_array_header()
+    except ValueError:
+        return unpacker.unpack()
+    return tuple(_read_schema(unpacker, encoded) for _ in range(n))
+
+
+def _index_stats(index, size):
+    """
+    the min and max of the int64 values of a DatetimeIndex per row group
+    of size rows, NaT where a row group has no timestamps, and whether it
+    is monotonic
+    """
+    values = index.asi8
+    mins, maxs = [], []
+    for i in range(0, len(values), size):
+        group = values[i:i + size]
+        group = group[group != NaT.value]
+        mins.append(int(group.min()) if len(group) else NaT.value)
+        maxs.append(int(group.max()) if len(group) else NaT.value)
+    tz = index.tz
+    if tz is not None:
+        tz = u(tz.zone)
+    return {u'tz': tz,
+            u'monotonic': bool(index.is_monotonic_increasing),
+            u'min': mins,
+            u'max': maxs}
+
+
+def _time_bounds(time_range, tz=None):
+    """
+    the int64 values of the first and last timestamp of time_range,
+    naive ones taken as in tz
+    """
+    def value(t, default):
+        if t is None:
+            return default
+        t = Timestamp(t)
+        if tz is not None and t.tzinfo is None:
+            t = t.tz_localize(tz)
+        return t.value
+
+    t0, t1 = time_range
+    return (value(t0, NaT.value + 1),
+            value(t1, np.iinfo(np.int64).max))
+
+
+def _time_slice(index, time_range):
+    """
+    the slice of the rows of the sorted DatetimeIndex index whose label is
+    in time_range, None if index is not one
+    """
+    if not (isinstance(index, DatetimeIndex) and
+            index.is_monotonic_increasing):
+        return None
+    lo, hi = _time_bounds(time_range, index.tz)
+    values = index.asi8
+    return slice(values.searchsorted(lo, side='left'),
+                 values.searchsorted(hi, side='right'))
+
+
+def _in_time_range(result, time_range):
+    """ the rows of result whose DatetimeIndex label is in time_range """
+    index = getattr(result, 'index', None)
+    if not isinstance(index, DatetimeIndex):
+        return result
+    rows = _time_slice(index, time_range)
+    if rows is not None:
+        return result.iloc[rows]
+    lo, hi = _time_bounds(time_range, index.tz)
+    values = index.asi8
+    return result[(values >= lo) & (values <= hi)]
+
+
+def _selected(unpacker, select=None, workers=None, **selection):
+    """
+    the objects of unpacker, or the values at the key path select in them,
+    read with the selection options of read_msgpack; with workers, maps
+    are read pair by pair, so that the axes of DataFrames are decoded on
+    the pool too
+    """
+    if select is not None:
+        return _select(unpacker, list(select), selection)
+    if (workers and workers > 1 or
+            any(v is not None for v in selection.values())):
+        return _project(unpacker, **selection)
+    return unpacker
+
+
+# the value of a key path missing from an object
+_missing = object()
+
+
+def _select(unpacker, path, selection):
+    """
+    iterate over the values at the key path in the objects of unpacker,
+    skipping everything else
+    """
+    found = False
+    while True:
+        try:
+            result = _read_path(unpacker, path, selection)
+        except OutOfData:
+            break
+        if result is not _missing:
+            found = True
+            yield result
+    if not found:
+        raise KeyError('no value at {!r}'.format(path))
+
+
+def _read_path(unpacker, path, selection):
+    """
+    read the value at the key path in the next object of unpacker, or
+    _missing; the rest of the object is skipped
+    """
+    if not path:
+        if any(v is not None for v in selection.values()):
+            try:
+                n = unpacker.read_map_header()
+            except ValueError:
+                return unpacker.unpack()
+            return _read_map(unpacker, n, **selection)
+        return unpacker.unpack()
+
+    key, rest = path[0], path[1:]
+    try:
+        n = unpacker.read_map_header()
+    except ValueError:
+        try:
+            n = unpacker.read_array_header()
+        except ValueError:
+            unpacker.skip()
+            return _missing
+        # array positions are the keys
+        keys = iter(range(n))
+    else:
+        keys = (unpacker.unpack() for _ in range(n))
+
+    result = _missing
+    for _ in range(n):
+        k = next(keys)
+        if result is _missing and k == key:
+            result = _read_path(unpacker, rest, selection)
+        else:
+            unpacker.skip()
+    return result
+
+
+def _project(unpacker, columns=None, rows=None, time_range=None,
+             filters=None, lazy=False):
+    """
+    iterate over the objects of unpacker like it does, reading only the
+    given columns of DataFrames, the given rows or time_range of
+    DataFrames and Series and the rows of DataFrames passing filters; the
+    values of blocks holding none of the columns and the row groups
+    holding none of the rows are skipped without being copied or
+    decompressed; if lazy, DataFrames are returned as LazyDataFrames
+    """
+    while True:
+        try:
+            n = unpacker.read_map_header()
+        except OutOfData:
+            return
+        except ValueError:
+            # not a map, the header is left unread
+            yield unpacker.unpack()
+            continue
+        yield _read_map(unpacker, n, columns, rows, time_range, filters,
+                        lazy)
+
+
+def _read_map(unpacker, n, columns=None, rows=None, time_range=None,
+              filters=None, lazy=False):
+    """ read and decode the n pairs of a map, see _project """
+    read_columns = columns
+    if columns is not None and filters:
+        # the filtered columns are needed too
+        read_columns = list(columns) + list(unique(
+            [c for c, _, _ in filters if c not in list(columns)]))
+
+    obj = {}
+    for _ in range(n):
+        key = unpacker.unpack()
+        typ = obj.get(u'typ')
+        if (key == u'blocks' and typ == u'block_manager' and
+                read_columns is not None and u'axes' in obj):
+            obj[key] = _read_blocks(unpacker,
+                                    obj[u'axes'][0].isin(read_columns))
+        elif key == u'row_groups' and typ == u'row_groups':
+            obj[key] = _read_row_groups(unpacker, obj, read_columns, rows,
+                                        time_range, filters)
+        elif (key == u'axes' and typ == u'block_manager' and
+              _pool() is not None and not lazy and
+              read_columns is None and time_range is None):
+            # left undecoded, for decode to decode on the pool along
+            # with the blocks
+            obj[key] = _read_raw(unpacker)
+        else:
+            obj[key] = unpacker.unpack()
+
+    typ = obj.get(u'typ')
+    if typ == u'block_manager' and lazy:
+        return LazyDataFrame(obj)
+    if typ == u'row_groups':
+        # the row groups read are already cut to the rows
+        result = obj[u'row_groups']
+    else:
+        if time_range is not None and rows is None:
+            # of a sorted index, only the frames of the rows in time_range
+            # need decompressing
+            if typ == u'block_manager':
+                rows = _time_slice(obj[u'axes'][1], time_range)
+            elif typ == u'series':
+                rows = _time_slice(obj[u'index'], time_range)
+        if typ == u'block_manager' and read_columns is not None:
+            result = _project_frame(obj, read_columns, rows=rows)
+        else:
+            result = decode(obj, rows=rows)
+        if rows is not None and isinstance(result, NDFrame):
+            result = result.iloc[rows]
+        if time_range is not None and isinstance(result, NDFrame):
+            result = _in_time_range(result, time_range)
+
+    if filters and isinstance(result, DataFrame):
+        result = _filter(result, filters)
+        if read_columns is not columns:
+            result = result[list(columns)]
+    return result
+
+
+_FILTER_OPS = {'==': operator.eq,
+               '!=': operator.ne,
+               '<': operator.lt,
+               '<=': operator.le,
+               '>': operator.gt,
+               '>=': operator.ge,
+               'in': lambda s, v: s.isin(v),
+               'not in': lambda s, v: ~s.isin(v)}
+
+
+def _filter(result, filters):
+    """ the rows of the DataFrame result for which all filters hold """
+    mask = np.ones(len(result), dtype=bool)
+    for column, op, value in filters:
+        mask &= np.asarray(_FILTER_OPS[op](result[column], value))
+    return result[mask]
+
+
+def _may_match(op, value, stats, i):
+    """
+    whether row group i, by the statistics of a column, may hold rows for
+    which the column op value holds
+    """
+    lo, hi = stats[u'min'][i], stats[u'max'][i]
+    nulls, distinct = stats[u'null_count'][i], stats[u'distinct'][i]
+    if op == 'in' and nulls and any(isna(v) for v in value):
+        return True
+    if lo is None:
+        # only a row group of nulls is known to not match, unless negated
+        return distinct != 0 or op in ('!=', 'not in')
+    try:
+        if op == '==':
+            return lo <= value <= hi
+        elif op == 'in':
+            return any(lo <= v <= hi for v in value)
+        elif op == '<':
+            return lo < value
+        elif op == '<=':
+            return lo <= value
+        elif op == '>':
+            return hi > value
+        elif op == '>=':
+            return hi >= value
+        # != and not in exclude a row group only of a single excluded value
+        values = [value] if op == '!=' else list(value)
+        return bool(nulls) or not (lo == hi and lo in values)
+    except TypeError:
+        return True
+
+
+def _groups_matching(obj, n_groups, filters):
+    """
+    which of the n_groups row groups may pass filters, by statistics and
+    Bloom filters
+    """
+    wanted = np.ones(n_groups, dtype=bool)
+    bloom = obj.get(u'bloom')
+    for column, op, value in filters:
+        if bloom is not None and op in ('==', 'in'):
+            try:
+                j = list(bloom[u'columns']).index(column)
+            except ValueError:
+                pass
+            else:
+                values = [value] if op == '==' else list(value)
+                wanted &= _bloom_may_contain(bloom, j, values)
+        if u'column_stats' not in obj:
+            continue
+        try:
+            loc = obj[u'columns'].get_loc(column)
+        except KeyError:
+            continue
+        if not isinstance(loc, int):
+            # a duplicate column
+            continue
+        stats = obj[u'column_stats'][loc]
+        for i in range(n_groups):
+            wanted[i] = wanted[i] and _may_match(op, value, stats, i)
+    return wanted
+
+
+def _read_row_groups(unpacker, obj, columns=None, rows=None,
+                     time_range=None, filters=None):
+    """
+    read the row groups overlapping rows or time_range and not excluded
+    by the statistics for filters, skipping the others, and return the
+    frame of the rows read, unfiltered
+    """
+    nrows, size = obj[u'nrows'], obj[u'row_group_size']
+    n_groups = unpacker.read_array_header()
+    if time_range is not None:
+        wanted = _groups_in_time_range(obj.get(u'index_stats'), n_groups,
+                                       time_range)
+    else:
+        positions = range(nrows)[rows if rows is not None else slice(None)]
+        wanted = np.zeros(n_groups, dtype=bool)
+        if len(positions):
+            wanted[min(positions[0], positions[-1]) // size:
+                   max(positions[0], positions[-1]) // size + 1] = True
+    if filters and rows is None:
+        # cutting rows needs the row groups in between
+        wanted &= _groups_matching(obj, n_groups, filters)
+    if not wanted.any():
+        # read a row group for the columns and dtypes of the empty frame
+        wanted[0] = True
+
+    groups = []
+    for i in range(n_groups):
+        if wanted[i]:
+            groups.append(_read_map(unpacker, unpacker.read_map_header(),
+                                    columns))
+        else:
+            unpacker.skip()
+    result = _concat_row_groups(groups)
+
+    if time_range is not None:
+        return _in_time_range(result, time_range)
+    if rows is None:
+        return result
+    offset = wanted.argmax() * size
+    if positions.step == 1 or not len(positions):
+        start = positions.start - offset if len(positions) else 0
+        return result.iloc[start:start + len(positions)]
+    return result.iloc[np.asarray(positions) - offset]
+
+
+def _groups_in_time_range(stats, n_groups, time_range):
+    """
+    which of the n_groups row groups hold labels in time_range, by a binary
+    search of the stats of a monotonic index; all without stats
+    """
+    if stats is None:
+        return np.ones(n_groups, dtype=bool)
+    lo, hi = _time_bounds(time_range, stats[u'tz'])
+    mins = np.asarray(stats[u'min'], dtype=np.int64)
+    maxs = np.asarray(stats[u'max'], dtype=np.int64)
+    if not stats[u'monotonic']:
+        return (mins <= hi) & (maxs >= lo)
+    wanted = np.zeros(n_groups, dtype=bool)
+    wanted[maxs.searchsorted(lo, side='left'):
+           mins.searchsorted(hi, side='right')] = True
+    return wanted
+
+
+def _concat_row_groups(groups):
+    if len(groups) == 1:
+        return groups[0]
+    return concat(groups)
+
+
+def _read_raw(unpacker):
+    """
+    read the next object of unpacker without decoding its maps, for
+    _decode_raw
+    """
+    try:
+        n = unpacker.read_map_header()
+    except ValueError:
+        pass
+    else:
+        return dict((unpacker.unpack(), _read_raw(unpacker))
+                    for _ in range(n))
+
+    try:
+        n = unpacker.read_array_header()
+    except ValueError:
+        return unpacker.unpack()
+    return tuple(_read_raw(unpacker) for _ in range(n))
+
+
+def _decode_raw(obj):
+    """ decode the object read by _read_raw, its inner maps first """
+    if isinstance(obj, dict):
+        return decode(dict((k, _decode_raw(v)) for k, v in obj.items()))
+    if type(obj) is tuple:
+        return tuple(_decode_raw(v) for v in obj)
+    return obj
+
+
+def _read_blocks(unpacker, wanted):
+    """
+    read the blocks of a block manager from unpacker, skipping the values
+    of those whose locs are all unwanted
+    """
+    blocks = []
+    for _ in range(unpacker.read_array_header()):
+        b = {}
+        for _ in range(unpacker.read_map_header()):
+            key = unpacker.unpack()
+            if (key == u'values' and u'locs' in b and
+                    not wanted[b[u'locs']].any()):
+                unpacker.skip()
+                b = None
+                continue
+            value = unpacker.unpack()
+            if b is not None:
+                b[key] = value
+        if b is not None:
+            blocks.append(b)
+    return blocks
+
+
+def _project_frame(obj, columns, block_values=None, rows=None):
+    """
+    build the DataFrame of the given columns from a read block manager;
+    block_values(i) returns the values of block i, if given, else only
+    the frames of the rows slice are decompressed, if given
+    """
+    from pandas.core.internals import BlockManager
+    axes = obj[u'axes']
+    missing = Index(columns).difference(axes[0])
+    if len(missing):
+        raise KeyError('columns not found: {}'.format(list(missing)))
+
+    wanted = axes[0].isin(columns)
+    # position of each wanted column among the wanted ones
+    positions = np.cumsum(wanted) - 1
+    kept = [i for i, b in enumerate(obj[u'blocks'])
+            if wanted[np.asarray(_placement(b, axes))].any()]
+    if block_values is None:
+        def block_values(i):
+            return _block_values(obj[u'blocks'][i], rows=rows)
+    kept_values = _map(block_values, kept)
+    blocks = []
+    for i, values in zip(kept, kept_values):
+        b = obj[u'blocks'][i]
+        locs = np.asarray(_placement(b, axes))
+        keep = wanted[locs]
+        if not keep.all():
+            values = values[keep]
+        blocks.append(_create_block(b, values, positions[locs[keep]]))
+
+    result = globals()[obj[u'klass']](
+        BlockManager(blocks, [axes[0][wanted]] + list(axes[1:])))
+    if list(result.columns) != list(columns):
+        result = result[list(columns)]
+    return result
+
+
+class LazyDataFrame(object):
+    """
+    A DataFrame read by read_msgpack(lazy=True) whose blocks are decoded
+    the first time one of their columns is accessed; its columns, index,
+    dtypes and shape are known without decoding any
+
+    Selecting columns with [] returns real Series and DataFrames, and
+    materialize() the whole DataFrame. Decoded blocks are kept, so these
+    share their data.
+    """
+
+    def __init__(self, obj):
+        self._obj = obj
+        self._values = {}
+
+    @property
+    def columns(self):
+        return self._obj[u'axes'][0]
+
+    @property
+    def index(self):
+        return self._obj[u'axes'][1]
+
+    @property
+    def shape(self):
+        return len(self.index), len(self.columns)
+
+    @property
+    def dtypes(self):
+        dtypes = np.empty(len(self.columns), dtype=object)
+        for b in self._obj[u'blocks']:
+            dtypes[_placement(b, self._obj[u'axes'])] = _lazy_dtype(
+                b[u'dtype'], b.get(u'values'))
+        return Series(dtypes, index=self.columns, dtype=object)
+
+    @property
+    def decoded(self):
+        """ the number of blocks decoded so far """
+        return len(self._values)
+
+    def _block_values(self, i):
+        if i not in self._values:
+            b = self._obj[u'blocks'][i]
+            self._values[i] = _block_values(b)
+            # the raw data is no longer needed
+            b[u'values'] = None
+        return self._values[i]
+
+    def __getitem__(self, key):
+        if isinstance(key, list):
+            return _project_frame(self._obj, key, self._block_values)
+        return _project_frame(self._obj, [key], self._block_values)[key]
+
+    def __getattr__(self, name):
+        if name.startswith('_') or name not in self.columns:
+            raise AttributeError(name)
+        return self[name]
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, key):
+        return key in self.columns
+
+    def __iter__(self):
+        return iter(self.columns)
+
+    def keys(self):
+        return self.columns
+
+    def materialize(self):
+        """ return the DataFrame, decoding the blocks not decoded yet """
+        return _project_frame(self._obj, list(self.columns),
+                              self._block_values)
+
+    def __repr__(self):
+        return '<{}: {} rows x {} columns, {} of {} blocks decoded>'.format(
+            self.__class__.__name__, len(self.index), len(self.columns),
+            self.decoded, len(self._obj[u'blocks']))
+
+
+def _lazy_dtype(name, values=None):
+    if isinstance(values, Categorical):
+        # decoded with the block, its categories and order with it
+        return values.dtype
+    try:
+        return pandas_dtype(dtype_for(name))
+    except TypeError:
+        return name
+
+
 def pack(o, default=encode,
          encoding='utf-8', unicode_errors='strict', use_single_float=False,
          autoreset=1, use_bin_type=1):
@@ -781,10 +2764,11 @@ def pack(o, default=encode,
 def unpack(packed, object_hook=decode,
            list_hook=None, use_list=False, encoding='utf-8',
            unicode_errors='strict', object_pairs_hook=None,
-           max_buffer_size=0, ext_hook=ExtType):
+           max_buffer_size=0, ext_hook=ExtType, buffer=None):
     """
     Unpack a packed object, return an iterator
     Note: packed lists will be returned as tuples
+    If buffer is given, unpack from it in place instead of from packed
     """
 
     return Unpacker(packed, object_hook=object_hook,
@@ -793,7 +2777,8 @@ def unpack(packed, object_hook=decode,
                     unicode_errors=unicode_errors,
                     object_pairs_hook=object_pairs_hook,
                     max_buffer_size=max_buffer_size,
-                    ext_hook=ext_hook)
+                    ext_hook=ext_hook,
+                    buffer=buffer)
 
 
 class Packer(_Packer):
@@ -803,13 +2788,21 @@ class Packer(_Packer):
                  unicode_errors='strict',
                  use_single_float=False,
                  autoreset=1,
-                 use_bin_type=1):
+                 use_bin_type=1,
+                 stream=None,
+                 flush_threshold=1024 * 1024,
+                 align=0,
+                 offset=0):
         super(Packer, self).__init__(default=default,
                                      encoding=encoding,
                                      unicode_errors=unicode_errors,
                                      use_single_float=use_single_float,
                                      autoreset=autoreset,
-                                     use_bin_type=use_bin_type)
+                                     use_bin_type=use_bin_type,
+                                     stream=stream,
+                                     flush_threshold=flush_threshold,
+                                     align=align,
+                                     offset=offset)
 
 
 class Unpacker(_Unpacker):
@@ -817,7 +2810,8 @@ class Unpacker(_Unpacker):
     def __init__(self, file_like=None, read_size=0, use_list=False,
                  object_hook=decode,
                  object_pairs_hook=None, list_hook=None, encoding='utf-8',
-                 unicode_errors='strict', max_buffer_size=0, ext_hook=ExtType):
+                 unicode_errors='strict', max_buffer_size=0, ext_hook=ExtType,
+                 buffer=None):
         super(Unpacker, self).__init__(file_like=file_like,
                                        read_size=read_size,
                                        use_list=use_list,
@@ -827,16 +2821,22 @@ class Unpacker(_Unpacker):
                                        encoding=encoding,
                                        unicode_errors=unicode_errors,
                                        max_buffer_size=max_buffer_size,
-                                       ext_hook=ext_hook)
+                                       ext_hook=ext_hook,
+                                       buffer=buffer)
 
 
 class Iterator(object):
 
     """ manage the unpacking iteration,
-        close the file on completion """
+        close the file on completion; if buffer is given, unpack from it
+        in place instead of from path """
 
-    def __init__(self, path, **kwargs):
+    def __init__(self, path, workers=None, buffer=None, unpack_options=None,
+                 **kwargs):
         self.path = path
+        self.workers = workers
+        self.buffer = buffer
+        self.unpack_options = unpack_options or {}
         self.kwargs = kwargs
 
     def __iter__(self):
@@ -844,8 +2844,12 @@ class Iterator(object):
         needs_closing = True
         try:
 
+            if self.buffer is not None:
+                needs_closing = False
+                fh = None
+
             # see if we have an actual file
-            if isinstance(self.path, STRING_TYPES):
+            elif isinstance(self.path, STRING_TYPES):
 
                 try:
                     path_exists = os.path.exists(self.path)
@@ -868,9 +2872,18 @@ class Iterator(object):
                     needs_closing = False
                     fh = self.path
 
-            unpacker = unpack(fh)
-            for o in unpacker:
-                yield o
+            unpacker = unpack(fh, buffer=self.buffer, **self.unpack_options)
+            unpacker = _selected(unpacker, workers=self.workers,
+                                 **self.kwargs)
+            objs = _without_toc(unpacker)
+            with _workers(self.workers) as executor:
+                while True:
+                    # only while reading, not while the caller holds o
+                    with _using(executor):
+                        o = next(objs, _missing)
+                    if o is _missing:
+                        break
+                    yield o
         finally:
             if needs_closing:
                 fh.close()
@@ -1,14 +1,19 @@
 import pytest
 
 import os, io
+import threading
+import time
 import datetime
 import numpy as np
 import sys
 from distutils.version import LooseVersion
 import random, string
 
-from isf_pandas_msgpack import to_msgpack, read_msgpack
-from isf_pandas_msgpack.packers import unpack
+from isf_pandas_msgpack import (to_msgpack, read_msgpack, read_msgpack_schema,
+                                dumps, loads, register_codec,
+                                to_shared_memory, from_shared_memory)
+from isf_pandas_msgpack.packers import unpack, pack, Packer
+from isf_pandas_msgpack.msgpack import ExtType
 
 import pandas as pd
 from pandas import (Series, DataFrame, MultiIndex, bdate_range,
@@ -152,6 +157,1685 @@ class TestAPI(TestPackers):
         with pytest.raises(ValueError):
             read_msgpack(path_or_buf=A())
 
+class TestZeroCopy(TestPackers):
+
+    def test_bytes_views_source(self):
+        df = DataFrame({'A': np.random.randn(10),
+                        'B': np.arange(10),
+                        'C': list('abcdefghij')},
+                       index=Index(np.arange(10.) * 2))
+        s = to_msgpack(None, df)
+        result = read_msgpack(s, copy=False)
+        tm.assert_frame_equal(result, df)
+
+        source = np.frombuffer(s, dtype=np.uint8)
+        for block in result._data.blocks:
+            if block.dtype != np.object_:
+                assert np.shares_memory(block.values, source)
+                assert not block.values.flags.writeable
+        assert np.shares_memory(result.index.values, source)
+
+    def test_bytearray_is_writeable(self):
+        x = np.random.randn(10)
+        buf = bytearray(to_msgpack(None, x))
+        x_rec = read_msgpack(buf, copy=False)
+        tm.assert_numpy_array_equal(x_rec, x)
+        assert x_rec.flags.writeable
+
+        x_rec[0] = 42.0
+        assert np.shares_memory(x_rec, np.frombuffer(buf, dtype=np.uint8))
+
+        # the source is kept alive by the array
+        del buf
+        assert x_rec[0] == 42.0
+
+    def test_memoryview_multiple(self):
+        dfs = [DataFrame(np.random.randn(10, 2)) for i in range(3)]
+        s = memoryview(to_msgpack(None, *dfs))
+        for copy in [True, False]:
+            result = read_msgpack(s, copy=copy)
+            for df, r in zip(dfs, result):
+                tm.assert_frame_equal(r, df)
+
+    def test_iterator(self):
+        xs = [np.random.randn(10), np.arange(10)]
+        s = to_msgpack(None, *xs)
+        results = list(read_msgpack(s, copy=False, iterator=True))
+        source = np.frombuffer(s, dtype=np.uint8)
+        for x, x_rec in zip(xs, results):
+            tm.assert_numpy_array_equal(x_rec, x)
+            assert np.shares_memory(x_rec, source)
+
+    def test_compressed_is_copied(self):
+        if not _ZLIB_INSTALLED:
+            pytest.skip('no zlib')
+        df = DataFrame(np.random.randn(10, 2))
+        result = read_msgpack(to_msgpack(None, df, compress='zlib'),
+                              copy=False)
+        tm.assert_frame_equal(result, df)
+        for block in result._data.blocks:
+            assert block.values.flags.writeable
+
+
+class TestMmap(TestPackers):
+
+    def setup_class(cls):
+        super().setup_class(cls)
+        cls.frame = DataFrame({'A': np.random.randn(100),
+                               'B': np.arange(100),
+                               'C': list(10 * 'abcdefghij')},
+                              index=date_range('20130101', periods=100))
+
+    def test_read_only(self):
+        with ensure_clean(self.path) as p:
+            to_msgpack(p, self.frame)
+            for advice in [None, 'sequential', 'random']:
+                result = read_msgpack(p, mmap=True, advice=advice)
+                tm.assert_frame_equal(result, self.frame)
+                for block in result._data.blocks:
+                    if block.dtype != np.object_:
+                        assert not block.values.flags.writeable
+
+    def test_copy_on_write(self):
+        x = np.arange(100.)
+        with ensure_clean(self.path) as p:
+            to_msgpack(p, x)
+            with open(p, 'rb') as fh:
+                expected = fh.read()
+
+            x_rec = read_msgpack(p, mmap=True, mmap_mode='c')
+            tm.assert_numpy_array_equal(x_rec, x)
+            assert x_rec.flags.writeable
+            x_rec[:] = -1
+            del x_rec
+
+            with open(p, 'rb') as fh:
+                assert fh.read() == expected
+
+    def test_multiple_and_compressed(self):
+        with ensure_clean(self.path) as p:
+            to_msgpack(p, self.frame, self.frame.A, compress='zlib')
+            result = read_msgpack(p, mmap=True)
+            tm.assert_frame_equal(result[0], self.frame)
+            tm.assert_series_equal(result[1], self.frame.A)
+
+    def test_empty_file(self):
+        with ensure_clean(self.path) as p:
+            open(p, 'wb').close()
+            assert read_msgpack(p, mmap=True) == []
+
+    def test_iterator(self):
+        with ensure_clean(self.path) as p:
+            to_msgpack(p, self.frame, self.frame.A)
+            result = list(read_msgpack(p, mmap=True, iterator=True))
+            tm.assert_frame_equal(result[0], self.frame)
+            tm.assert_series_equal(result[1], self.frame.A)
+            assert not result[1].values.flags.writeable
+            with pytest.raises(ValueError):
+                read_msgpack(p, iterator=True, index=0)
+
+    def test_invalid_mode(self):
+        with ensure_clean(self.path) as p:
+            to_msgpack(p, self.frame)
+            with pytest.raises(ValueError):
+                read_msgpack(p, mmap=True, mmap_mode='w')
+            with pytest.raises(ValueError):
+                read_msgpack(p, mmap=True, advice='backwards')
+
+
+class TestStreaming(TestPackers):
+
+    def setup_class(cls):
+        super().setup_class(cls)
+        cls.frame = DataFrame({'A': np.random.randn(10000),
+                               'B': np.arange(10000),
+                               'C': list(1000 * 'abcdefghij')})
+
+    def test_matches_pack(self):
+        expected = pack(self.frame)
+        for threshold in [1, 1024, 1024 ** 2]:
+            buf = io.BytesIO()
+            packer = Packer(stream=buf, flush_threshold=threshold)
+            assert packer.pack(self.frame) is None
+            assert buf.getvalue() == expected
+
+    def test_large_bodies_are_not_copied(self):
+        writes = []
+
+        class Recorder(object):
+            def write(self, data):
+                writes.append(len(memoryview(data).cast('B')))
+
+        Packer(stream=Recorder(), flush_threshold=1024).pack(self.frame)
+        # the float and int blocks are written on their own
+        assert writes.count(10000 * 8) == 2
+        assert max(writes) == 10000 * 8
+
+    def test_blocks_copied_once(self):
+        import isf_pandas_msgpack.packers as packers
+        # the block of a 2-d array is not contiguous, so _raw copies it
+        frame = DataFrame(np.random.randn(1000, 10))
+        for compress in [None, 'zlib', 'auto']:
+            with patch.object(packers, '_raw',
+                              wraps=packers._raw) as raw:
+                packed = to_msgpack(None, frame, compress=compress)
+            assert_frame_equal(read_msgpack(packed), frame)
+            # the columns and the block
+            assert raw.call_count == 2
+
+    def test_file_descriptor(self):
+        with ensure_clean(self.path) as p:
+            fd = os.open(p, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+            try:
+                packer = Packer(stream=fd, flush_threshold=1024)
+                packer.pack(self.frame)
+                packer.pack(self.frame.A)
+            finally:
+                os.close(fd)
+            result = read_msgpack(p)
+        assert_frame_equal(result[0], self.frame)
+        assert_series_equal(result[1], self.frame.A)
+
+    def test_flush_without_stream(self):
+        with pytest.raises(TypeError):
+            Packer().flush()
+
+    def test_buffers(self):
+        expected = to_msgpack(None, self.frame, self.frame.A)
+        segments = to_msgpack(None, self.frame, self.frame.A, buffers=True,
+                              flush_threshold=1024)
+        assert b''.join(segments) == expected
+
+        # large blocks are referenced, not copied
+        shared = [s for s in segments if not isinstance(s, bytes)]
+        assert len(shared) == 3
+        for block in self.frame._data.blocks:
+            if block.dtype != np.object_:
+                assert any(np.shares_memory(block.values, np.asarray(s))
+                           for s in shared)
+
+        result = read_msgpack(b''.join(segments))
+        assert_frame_equal(result[0], self.frame)
+        assert_series_equal(result[1], self.frame.A)
+
+    def test_pack_segments_with_stream(self):
+        with pytest.raises(TypeError):
+            Packer(stream=io.BytesIO()).pack_segments(self.frame)
+
+    def test_append(self):
+        with ensure_clean(self.path) as p:
+            to_msgpack(p, self.frame)
+            to_msgpack(p, self.frame.A, append=True)
+            result = read_msgpack(p)
+        assert_frame_equal(result[0], self.frame)
+        assert_series_equal(result[1], self.frame.A)
+
+    def test_ext_type_buffers(self):
+        x = np.arange(10.)
+        packed = pack(ExtType(0, x))
+        assert packed == pack(ExtType(0, x.tobytes()))
+        with pytest.raises(TypeError):
+            ExtType(0, x[::2])
+        with pytest.raises(TypeError):
+            ExtType(0, u'foo')
+
+
+class TestOutOfBand(TestPackers):
+
+    def setup_class(cls):
+        super().setup_class(cls)
+        cls.frame = DataFrame({'A': np.random.randn(100),
+                               'B': np.arange(100),
+                               'C': list(10 * 'abcdefghij')},
+                              index=Index(np.arange(100.)))
+
+    def test_roundtrip(self):
+        buffers = []
+
+        def callback(buf):
+            # keep small arrays, such as the block locs, in-band
+            if buf.raw().nbytes < 512:
+                return True
+            buffers.append(buf)
+
+        header = dumps(self.frame, buffer_callback=callback)
+        # the index and two numeric blocks
+        assert len(buffers) == 3
+        assert len(header) < 1000
+
+        result = loads(header, buffers=buffers)
+        assert_frame_equal(result, self.frame)
+        for block in result._data.blocks:
+            if block.dtype != np.object_:
+                assert any(np.shares_memory(block.values, b.raw())
+                           for b in buffers)
+
+    def test_in_band(self):
+        buffers = []
+
+        def callback(buf):
+            buffers.append(buf)
+            return True
+
+        header = dumps(self.frame, buffer_callback=callback)
+        assert header == dumps(self.frame)
+        assert_frame_equal(loads(header), self.frame)
+
+    def test_copies_and_compression(self):
+        buffers = []
+        header = dumps(self.frame, buffer_callback=buffers.append,
+                       compress='zlib')
+        # the buffers can travel as copies, e.g. through a pipe
+        buffers = [bytes(b) for b in buffers]
+        assert_frame_equal(loads(header, buffers=buffers), self.frame)
+
+    def test_iterator(self):
+        buffers = []
+        packed = to_msgpack(None, self.frame, self.frame.A,
+                            buffer_callback=buffers.append)
+        result = list(read_msgpack(packed, buffers=buffers, iterator=True))
+        assert_frame_equal(result[0], self.frame)
+        assert_series_equal(result[1], self.frame.A)
+
+    def test_missing_buffers(self):
+        header = dumps(self.frame, buffer_callback=lambda b: None)
+        with pytest.raises(Exception):
+            loads(header)
+
+
+class TestSharedMemory(TestPackers):
+
+    def setup_class(cls):
+        super().setup_class(cls)
+        cls.frame = DataFrame({'A': np.random.randn(100),
+                               'B': np.arange(100),
+                               'C': list(10 * 'abcdefghij'),
+                               'D': date_range('20130101', periods=100)})
+
+    def test_roundtrip(self):
+        handle = to_shared_memory(self.frame)
+        try:
+            result = from_shared_memory(handle)
+            assert_frame_equal(result, self.frame)
+            for block in result._data.blocks:
+                if isinstance(block.values, np.ndarray) and \
+                        block.dtype != np.object_:
+                    assert block.values.ctypes.data % 64 == 0
+                    assert not block.values.flags.writeable
+
+            # the arrays keep the segment attached
+            values = result['A'].values
+            del result
+            tm.assert_numpy_array_equal(values, self.frame['A'].values)
+        finally:
+            handle.unlink()
+
+    def test_writeable_and_compressed(self):
+        handle = to_shared_memory(self.frame, align=16, compress='zlib')
+        try:
+            result = from_shared_memory(handle, readonly=False)
+            assert_frame_equal(result, self.frame)
+        finally:
+            handle.unlink()
+
+        x = np.arange(10.)
+        handle = to_shared_memory(x)
+        try:
+            first = from_shared_memory(handle, readonly=False)
+            second = from_shared_memory(handle)
+            first[0] = 42.
+            assert second[0] == 42.
+        finally:
+            handle.unlink()
+
+
+class TestAlign(TestPackers):
+
+    def setup_class(cls):
+        super().setup_class(cls)
+        cls.frame = DataFrame({'A': np.random.randn(100),
+                               'B': np.arange(100),
+                               'C': list(10 * 'abcdefghij'),
+                               'D': date_range('20130101', periods=100)},
+                              index=Index(np.arange(100.)))
+
+    def _check_aligned(self, arrays, align):
+        for a in arrays:
+            a = np.asarray(a)
+            assert a.ctypes.data % align == 0
+
+    def test_align(self):
+        with ensure_clean(self.path) as p:
+            to_msgpack(p, self.frame, align=64)
+            to_msgpack(p, self.frame.A, np.arange(77.), append=True,
+                       align=64)
+            result = read_msgpack(p, mmap=True)
+            assert_frame_equal(result[0], self.frame)
+            assert_series_equal(result[1], self.frame.A)
+            tm.assert_numpy_array_equal(result[2], np.arange(77.))
+            self._check_aligned(
+                [b.values for b in result[0]._data.blocks
+                 if b.dtype != np.object_] +
+                [result[0].index.values, result[1].values, result[2]], 64)
+
+    def test_file_like_offset(self):
+        buf = io.BytesIO()
+        buf.write(b'\xc0' * 13)
+        to_msgpack(buf, self.frame, align=32)
+        data = bytearray(buf.getvalue())
+        result = read_msgpack(data, copy=False)
+        assert result[0] is None
+        assert_frame_equal(result[-1], self.frame)
+        base = np.frombuffer(data, dtype=np.uint8).ctypes.data
+        for b in result[-1]._data.blocks:
+            if b.dtype != np.object_:
+                assert (np.asarray(b.values).ctypes.data - base) % 32 == 0
+
+    def test_padding_is_ignorable(self):
+        packed = to_msgpack(None, self.frame, align=64)
+        assert len(packed) > len(to_msgpack(None, self.frame))
+        raw = next(iter(unpack(io.BytesIO(packed), object_hook=None)))
+        assert '__pad__' in raw['blocks'][0]
+
+    def test_user_dict_not_padded(self):
+        obj = {'x': ExtType(5, b'x' * 100), 'y': 1}
+        for o in [obj, (obj, {'z': (obj,)})]:
+            result = read_msgpack(to_msgpack(None, o, align=64))
+            assert result == o
+
+    def test_invalid_align(self):
+        with pytest.raises(ValueError):
+            to_msgpack(None, self.frame, align=512)
+        with pytest.raises(ValueError):
+            Packer(align=64, use_bin_type=False)
+
+
+class TestToc(TestPackers):
+
+    def setup_class(cls):
+        super().setup_class(cls)
+        cls.frame = DataFrame({'A': np.random.randn(50),
+                               'B': np.arange(50),
+                               'C': list(5 * 'abcdefghij')})
+        cls.objs = [cls.frame, cls.frame.A, np.arange(10.), 'foo', 12]
+
+    def _check(self, result, positions):
+        for r, i in zip(result, positions):
+            tm.assert_almost_equal(r, self.objs[i])
+
+    def test_index(self):
+        with ensure_clean(self.path) as p:
+            to_msgpack(p, *self.objs, toc=True)
+            assert_series_equal(read_msgpack(p, index=1), self.frame.A)
+            self._check(read_msgpack(p, indices=[4, 0, 2]), [4, 0, 2])
+            self._check(read_msgpack(p, indices=[3, 1], mmap=True), [3, 1])
+            self._check(read_msgpack(p), range(5))
+            self._check(list(read_msgpack(p, iterator=True)), range(5))
+
+    def test_buffers(self):
+        packed = to_msgpack(None, *self.objs, toc=True)
+        assert_frame_equal(read_msgpack(packed, index=0), self.frame)
+        self._check(read_msgpack(bytearray(packed), indices=[2, 3],
+                                 copy=False), [2, 3])
+        self._check(read_msgpack(io.BytesIO(packed), indices=[1]), [1])
+        self._check(read_msgpack(packed), range(5))
+
+    def test_append(self):
+        with ensure_clean(self.path) as p:
+            to_msgpack(p, *self.objs[:2], toc=True)
+            to_msgpack(p, *self.objs[2:], append=True)
+            self._check(read_msgpack(p, indices=range(5)), range(5))
+            self._check(read_msgpack(p), range(5))
+
+    def test_append_indexes_existing(self):
+        with ensure_clean(self.path) as p:
+            to_msgpack(p, *self.objs[:3])
+            to_msgpack(p, *self.objs[3:], append=True, toc=True)
+            self._check(read_msgpack(p, indices=[4, 2, 0]), [4, 2, 0])
+
+    def test_entries(self):
+        packed = to_msgpack(None, *self.objs, toc=True)
+        entries = [o for o in unpack(io.BytesIO(packed), object_hook=None)
+                   if isinstance(o, dict) and o.get('typ') == 'toc'][0]
+        assert entries['typs'][:3] == ('block_manager', 'series', 'ndarray')
+        assert entries['klasses'][:2] == ('DataFrame', 'Series')
+
+    def test_no_toc(self):
+        packed = to_msgpack(None, *self.objs)
+        with pytest.raises(ValueError):
+            read_msgpack(packed, index=0)
+
+
+class TestColumns(TestPackers):
+
+    def setup_class(cls):
+        super().setup_class(cls)
+        cls.frame = DataFrame({'A': np.random.randn(50),
+                               'B': np.arange(50),
+                               'C': list(5 * 'abcdefghij'),
+                               'D': np.random.randn(50),
+                               'E': date_range('20130101', periods=50)})
+
+    def test_columns(self):
+        with ensure_clean(self.path) as p:
+            to_msgpack(p, self.frame, self.frame.A)
+            for columns in [['A'], ['D', 'B'], ['C', 'A', 'E'], []]:
+                result = read_msgpack(p, columns=columns)
+                assert_frame_equal(result[0], self.frame[columns])
+                assert_series_equal(result[1], self.frame.A)
+
+    def test_compressed(self):
+        if not _ZLIB_INSTALLED:
+            pytest.skip('no zlib')
+        packed = to_msgpack(None, self.frame, compress='zlib')
+        assert_frame_equal(read_msgpack(packed, columns=['D', 'A']),
+                           self.frame[['D', 'A']])
+
+    def test_zero_copy(self):
+        packed = bytearray(to_msgpack(None, self.frame))
+        result = read_msgpack(packed, columns=['B'], copy=False)
+        assert_frame_equal(result, self.frame[['B']])
+        assert np.shares_memory(result._data.blocks[0].values,
+                                np.frombuffer(packed, dtype=np.uint8))
+
+    def test_skips_unselected_blocks(self):
+        import isf_pandas_msgpack.packers as packers
+        if not _ZLIB_INSTALLED:
+            pytest.skip('no zlib')
+        packed = to_msgpack(None, self.frame, compress='zlib')
+        with patch.object(packers, '_block_values',
+                          wraps=packers._block_values) as block_values:
+            read_msgpack(packed, columns=['B'])
+        assert [b['dtype'] for (b,), _ in block_values.call_args_list] == [
+            'int64']
+
+    def test_duplicate_columns(self):
+        df = DataFrame([[1, 2., 3]], columns=['a', 'b', 'a'])
+        result = read_msgpack(to_msgpack(None, df), columns=['a'])
+        assert_frame_equal(result, df[['a']])
+
+    def test_iterator(self):
+        packed = to_msgpack(None, self.frame, self.frame)
+        for result in read_msgpack(packed, iterator=True, columns=['E']):
+            assert_frame_equal(result, self.frame[['E']])
+
+    def test_missing(self):
+        with pytest.raises(KeyError):
+            read_msgpack(to_msgpack(None, self.frame), columns=['Z'])
+
+
+class TestSchema(TestPackers):
+
+    def setup_class(cls):
+        super().setup_class(cls)
+        cls.frame = DataFrame({'A': np.random.randn(50),
+                               'B': np.arange(50),
+                               'C': list(5 * 'abcdefghij')},
+                              index=date_range('20130101', periods=50))
+
+    def test_frame(self):
+        with ensure_clean(self.path) as p:
+            to_msgpack(p, self.frame, self.frame.A, np.arange(6.), 'foo',
+                       compress='zlib', toc=True)
+            with patch('isf_pandas_msgpack.packers.unconvert') as unconvert:
+                schema = read_msgpack_schema(p)
+            # the column labels and locs are decoded, nothing else
+            assert unconvert.call_count == 1 + len(self.frame._data.blocks)
+        assert len(schema) == 4
+        frame, series, array, foo = schema
+        assert frame['typ'] == 'block_manager'
+        assert frame['klass'] == 'DataFrame'
+        assert frame['axes'][1]['typ'] == 'datetime_index'
+        assert 'data' not in frame['axes'][1]
+        assert sorted((b['dtype'], b['shape'], b['compress'])
+                      for b in frame['blocks']) == [
+            ('float64', (1, 50), 'zlib'), ('int64', (1, 50), 'zlib'),
+            ('object', (1, 50), 'zlib')]
+        assert 'values' not in frame['blocks'][0]
+        assert series['typ'] == 'series' and series['name'] == 'A'
+        assert array['shape'] == (6,) and array['dtype'] == 'float64'
+        assert foo == 'foo'
+
+    def test_column_labels(self):
+        schema, = read_msgpack_schema(to_msgpack(None, self.frame, align=64))
+        tm.assert_index_equal(schema['axes'][0], self.frame.columns)
+        labels = {b['dtype']: list(schema['axes'][0][b['locs']])
+                  for b in schema['blocks']}
+        assert labels == {'float64': ['A'], 'int64': ['B'], 'object': ['C']}
+        assert '__pad__' not in schema['blocks'][0]
+
+    def test_user_dicts(self):
+        obj = {'data': self.frame, 'values': 3, 'x': {'data': 'foo'}}
+        schema, = read_msgpack_schema(to_msgpack(None, obj))
+        assert schema['data']['typ'] == 'block_manager'
+        assert 'values' not in schema['data']['blocks'][0]
+        assert schema['values'] == 3
+        assert schema['x'] == {'data': 'foo'}
+
+    def test_scalars(self):
+        objs = [np.timedelta64(5, 's'), datetime.timedelta(seconds=5),
+                np.datetime64('2013-01-01'), np.int32(3)]
+        schemas = read_msgpack_schema(to_msgpack(None, *objs))
+        assert [s['data'] for s in schemas[1:]] == [
+            (0, 5, 0), '2013-01-01', '3']
+        assert schemas[0]['data']['data'] == '5'
+
+    def test_file_like(self):
+        buf = io.BytesIO(to_msgpack(None, self.frame.B))
+        schema, = read_msgpack_schema(buf)
+        assert schema['dtype'] == 'int64'
+
+
+class TestRowGroups(TestPackers):
+
+    def setup_class(cls):
+        super().setup_class(cls)
+        cls.frame = DataFrame({'A': np.arange(103.),
+                               'B': list(35 * 'abc')[:103],
+                               'C': date_range('20130101', periods=103,
+                                               tz='UTC')},
+                              index=date_range('20130101', periods=103,
+                                               freq='H'))
+
+    def test_round_trip(self):
+        for frame in [self.frame, self.frame.reset_index(drop=True)]:
+            packed = to_msgpack(None, frame, row_group_size=10)
+            assert_frame_equal(read_msgpack(packed), frame)
+        # frames that fit a row group are stored as they are
+        packed = to_msgpack(None, self.frame, row_group_size=1000)
+        assert packed == to_msgpack(None, self.frame)
+
+    def test_rows(self):
+        with ensure_clean(self.path) as p:
+            to_msgpack(p, self.frame, row_group_size=10, compress='zlib')
+            for rows in [slice(5, 37), slice(None), slice(90, None),
+                         slice(40, 40), slice(None, None, -3),
+                         slice(-15, -2, 2), slice(200, 300)]:
+                assert_frame_equal(read_msgpack(p, rows=rows),
+                                   self.frame.iloc[rows])
+                assert_frame_equal(read_msgpack(p, rows=rows,
+                                                columns=['C', 'A']),
+                                   self.frame.iloc[rows][['C', 'A']])
+
+    def test_decodes_overlapping_row_groups(self):
+        import isf_pandas_msgpack.packers as packers
+        packed = to_msgpack(None, self.frame, row_group_size=10)
+        with patch.object(packers, '_block_values',
+                          wraps=packers._block_values) as block_values:
+            result = read_msgpack(packed, rows=slice(15, 25))
+        assert_frame_equal(result, self.frame.iloc[15:25])
+        # three blocks of two row groups
+        assert block_values.call_count == 6
+
+    def test_unchunked(self):
+        packed = to_msgpack(None, self.frame, self.frame.A)
+        result = read_msgpack(packed, rows=slice(3, 8))
+        assert_frame_equal(result[0], self.frame.iloc[3:8])
+        assert_series_equal(result[1], self.frame.A.iloc[3:8])
+
+    def test_iterator(self):
+        packed = to_msgpack(None, self.frame, self.frame, row_group_size=20)
+        for result in read_msgpack(packed, iterator=True, rows=slice(50)):
+            assert_frame_equal(result, self.frame.iloc[:50])
+
+
+class TestTimeRange(TestPackers):
+
+    def setup_class(cls):
+        super().setup_class(cls)
+        cls.frame = DataFrame({'A': np.arange(500.),
+                               'B': np.arange(500)},
+                              index=date_range('20130101', periods=500,
+                                               freq='H'))
+
+    def _check(self, packed, frame, time_range):
+        t0, t1 = time_range
+        expected = frame[(frame.index >= (t0 or frame.index.min())) &
+                         (frame.index <= (t1 or frame.index.max()))]
+        assert_frame_equal(read_msgpack(packed, time_range=time_range),
+                           expected)
+
+    def test_time_range(self):
+        ranges = [('20130103', '20130103 23:00'), (None, '20130102'),
+                  ('20130120', None), ('20120101', '20120102'),
+                  ('20130105 01:30', '20130105 02:30'), (None, None)]
+        shuffled = self.frame.iloc[np.random.permutation(len(self.frame))]
+        tz = self.frame.tz_localize('US/Eastern')
+        for frame in [self.frame, shuffled, tz]:
+            for row_group_size in [None, 24]:
+                packed = to_msgpack(None, frame,
+                                    row_group_size=row_group_size)
+                for time_range in ranges:
+                    self._check(packed, frame, time_range)
+
+    def test_decodes_matching_row_groups(self):
+        import isf_pandas_msgpack.packers as packers
+        packed = to_msgpack(None, self.frame, row_group_size=24)
+        with patch.object(packers, '_block_values',
+                          wraps=packers._block_values) as block_values:
+            result = read_msgpack(packed,
+                                  time_range=('20130103 20:00',
+                                              '20130104 02:00'))
+        assert_frame_equal(result, self.frame['20130103 20:00':
+                                              '20130104 02:00'])
+        # two blocks of two row groups
+        assert block_values.call_count == 4
+
+    def test_decodes_matching_frames(self):
+        if not _ZLIB_INSTALLED:
+            pytest.skip('no zlib')
+        # 100 rows a frame
+        packed = to_msgpack(None, self.frame, self.frame.A, compress='zlib',
+                            frame_size=800)
+        time_range = ('20130106 02:00', '20130107 06:00')
+        with patch('zlib.decompressobj', wraps=zlib.decompressobj) as dec:
+            result = read_msgpack(packed, time_range=time_range)
+        assert_frame_equal(result[0], self.frame[time_range[0]:
+                                                 time_range[1]])
+        assert_series_equal(result[1], self.frame.A[time_range[0]:
+                                                    time_range[1]])
+        # all of both indexes, the locs of both blocks and a frame of
+        # every array
+        assert dec.call_count == 2 * 5 + 2 + 3
+
+    def test_index_stats(self):
+        packed = to_msgpack(None, self.frame, row_group_size=100)
+        raw = next(iter(unpack(io.BytesIO(packed), object_hook=None)))
+        stats = raw['index_stats']
+        assert stats['monotonic']
+        assert len(stats['min']) == len(stats['max']) == 5
+        assert stats['min'][1] == self.frame.index[100].value
+        assert stats['max'][1] == self.frame.index[199].value
+
+    def test_other_objects(self):
+        packed = to_msgpack(None, self.frame.A, np.arange(3.), 'foo')
+        result = read_msgpack(packed, time_range=('20130102', '20130102'))
+        assert_series_equal(result[0], self.frame.A.iloc[24:25])
+        tm.assert_numpy_array_equal(result[1], np.arange(3.))
+        assert result[2] == 'foo'
+
+    def test_rows_and_time_range(self):
+        with pytest.raises(ValueError):
+            read_msgpack(to_msgpack(None, self.frame), rows=slice(3),
+                         time_range=(None, None))
+
+
+class TestFilters(TestPackers):
+
+    def setup_class(cls):
+        super().setup_class(cls)
+        cls.frame = DataFrame({'price': np.arange(1000.),
+                               'id': np.arange(1000) % 37,
+                               's': [str(i) for i in range(1000)],
+                               't': date_range('20130101', periods=1000,
+                                               freq='H'),
+                               'flag': np.arange(1000) % 3 == 0})
+        cls.frame.loc[5, 'price'] = np.nan
+
+    def _expected(self, filters):
+        mask = np.ones(len(self.frame), dtype=bool)
+        for column, op, value in filters:
+            s = self.frame[column]
+            if op == 'in':
+                mask &= s.isin(value).values
+            elif op == 'not in':
+                mask &= ~s.isin(value).values
+            else:
+                mask &= eval('s {} value'.format(op)).values
+        return self.frame[mask]
+
+    def test_filters(self):
+        stored = [to_msgpack(None, self.frame),
+                  to_msgpack(None, self.frame, statistics=True),
+                  to_msgpack(None, self.frame, row_group_size=100),
+                  to_msgpack(None, self.frame, row_group_size=100,
+                             statistics=True)]
+        for filters in [[('price', '>', 850)], [('price', '==', 5)],
+                        [('id', 'in', [3, 4]), ('price', '<', 300)],
+                        [('s', '==', '17')], [('price', '!=', 3)],
+                        [('t', '>=', Timestamp('20130120'))],
+                        [('price', 'in', [np.nan])],
+                        [('flag', '==', True), ('price', '<', 100)],
+                        [('id', 'not in', list(range(30)))]]:
+            expected = self._expected(filters)
+            for packed in stored:
+                assert_frame_equal(read_msgpack(packed, filters=filters),
+                                   expected)
+                assert_frame_equal(read_msgpack(packed, filters=filters,
+                                                columns=['s', 'id']),
+                                   expected[['s', 'id']])
+
+    def test_skips_row_groups(self):
+        import isf_pandas_msgpack.packers as packers
+        packed = to_msgpack(None, self.frame, row_group_size=100,
+                            statistics=True)
+        with patch.object(packers, '_block_values',
+                          wraps=packers._block_values) as block_values:
+            result = read_msgpack(packed, filters=[('price', '>=', 850),
+                                                   ('price', '<', 890)])
+        assert_frame_equal(result, self.frame.iloc[850:890])
+        # five blocks of a single row group
+        assert block_values.call_count == 5
+
+    def test_block_stats(self):
+        packed = to_msgpack(None, self.frame, statistics=True)
+        schema, = read_msgpack_schema(packed)
+        stats = dict((schema['axes'][0][loc],
+                      dict((k, v[i]) for k, v in b['stats'].items()))
+                     for b in schema['blocks']
+                     for i, loc in enumerate(b['locs']))
+        assert stats['price'] == {'min': 0., 'max': 999., 'null_count': 1,
+                                  'distinct': 999}
+        assert stats['s']['min'] == '0' and stats['s']['max'] == '999'
+        assert stats['id']['distinct'] == 37
+        assert stats['t']['max'] == self.frame.t.max()
+        assert stats['flag'] == {'min': False, 'max': True, 'null_count': 0,
+                                 'distinct': 2}
+
+    def test_rows_and_filters(self):
+        packed = to_msgpack(None, self.frame, row_group_size=100,
+                            statistics=True)
+        result = read_msgpack(packed, rows=slice(50, 650),
+                              filters=[('id', '==', 3)])
+        frame = self.frame.iloc[50:650]
+        assert_frame_equal(result, frame[frame.id == 3])
+
+    def test_unknown_op(self):
+        with pytest.raises(ValueError):
+            read_msgpack(to_msgpack(None, self.frame),
+                         filters=[('id', '~', 3)])
+
+
+class TestLookup(TestPackers):
+
+    def setup_class(cls):
+        super().setup_class(cls)
+        n = 5000
+        cls.frame = DataFrame({'id': np.random.permutation(n),
+                               's': ['k%d' % i
+                                     for i in np.random.permutation(n)],
+                               'c': Categorical(np.random.choice(
+                                   list('abcdefghij'), n)),
+                               'x': np.random.randn(n)})
+        cls.packed = to_msgpack(None, cls.frame, row_group_size=500,
+                                bloom_columns=['id', 's', 'c'])
+
+    def _expected(self, lookup):
+        result = self.frame
+        for column, values in lookup.items():
+            result = result[result[column].isin(values)]
+        return result
+
+    def test_lookup(self):
+        for lookup in [{'id': [5, 77]}, {'s': ['k5', 'nope']},
+                       {'id': [5], 's': ['k5']}, {'c': ['a']},
+                       {'x': [self.frame.x[3]]}, {'id': [1.]},
+                       {'id': ['nope']}, {'id': []}]:
+            assert_frame_equal(read_msgpack(self.packed, lookup=lookup),
+                               self._expected(lookup))
+            # frames without Bloom filters give the same rows
+            assert_frame_equal(read_msgpack(to_msgpack(None, self.frame),
+                                            lookup=lookup),
+                               self._expected(lookup))
+
+    def test_skips_row_groups(self):
+        import isf_pandas_msgpack.packers as packers
+        with patch.object(packers, '_block_values',
+                          wraps=packers._block_values) as block_values:
+            result = read_msgpack(self.packed,
+                                  lookup={'s': [self.frame.s[10]]})
+        assert_frame_equal(result, self.frame.iloc[10:11])
+        # four blocks of the row group holding the value, and possibly a
+        # false positive
+        assert block_values.call_count in (4, 8)
+
+    def test_bloom_filter(self):
+        import isf_pandas_msgpack.packers as packers
+        values = np.arange(1000)
+        bloom = {'columns': ['a'], 'dtypes': ['int64'],
+                 'hashes': packers._BLOOM_HASHES,
+                 'filters': [[packers._bloom_filter(values)]]}
+        # no false negatives
+        for v in values[::37]:
+            assert packers._bloom_may_contain(bloom, 0, [v]).all()
+        # few false positives
+        misses = [packers._bloom_may_contain(bloom, 0, [v])[0]
+                  for v in range(1000, 3000)]
+        assert sum(misses) < 100
+
+    def test_needs_row_groups(self):
+        with pytest.raises(ValueError, match='row_group_size'):
+            to_msgpack(None, self.frame, bloom_columns=['id'])
+
+
+class TestLazy(TestPackers):
+
+    def setup_class(cls):
+        super().setup_class(cls)
+        cls.frame = DataFrame({'A': np.random.randn(20),
+                               'B': list(2 * 'abcdefghij'),
+                               'C': date_range('20130101', periods=20,
+                                               tz='UTC'),
+                               'D': np.arange(20)})
+
+    def test_metadata(self):
+        result = read_msgpack(to_msgpack(None, self.frame), lazy=True)
+        tm.assert_index_equal(result.columns, self.frame.columns)
+        tm.assert_index_equal(result.index, self.frame.index)
+        assert result.shape == self.frame.shape
+        assert len(result) == len(self.frame)
+        assert_series_equal(result.dtypes, self.frame.dtypes)
+        assert 'A' in result and list(result) == list('ABCD')
+        assert result.decoded == 0
+
+    def test_categorical_dtypes(self):
+        frame = self.frame.assign(E=Categorical(list(10 * 'ab'),
+                                                categories=['b', 'a'],
+                                                ordered=True))
+        for compress in [None, 'zlib']:
+            result = read_msgpack(to_msgpack(None, frame, compress=compress),
+                                  lazy=True)
+            assert_series_equal(result.dtypes, frame.dtypes)
+
+    def test_decodes_on_access(self):
+        with ensure_clean(self.path) as p:
+            to_msgpack(p, self.frame, compress='zlib')
+            result = read_msgpack(p, lazy=True)
+            assert_series_equal(result['A'], self.frame.A)
+            assert result.decoded == 1
+            assert_frame_equal(result[['D', 'A']], self.frame[['D', 'A']])
+            assert result.decoded == 2
+            assert_series_equal(result.C, self.frame.C)
+            assert result.decoded == 3
+            assert_frame_equal(result.materialize(), self.frame)
+            assert result.decoded == 4
+
+    def test_other_objects(self):
+        result = read_msgpack(to_msgpack(None, self.frame, self.frame.A,
+                                         'foo'), lazy=True)
+        assert_frame_equal(result[0].materialize(), self.frame)
+        assert_series_equal(result[1], self.frame.A)
+        assert result[2] == 'foo'
+
+    def test_missing_column(self):
+        result = read_msgpack(to_msgpack(None, self.frame), lazy=True)
+        with pytest.raises(KeyError):
+            result['Z']
+        with pytest.raises(AttributeError):
+            result.Z
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            read_msgpack(to_msgpack(None, self.frame), lazy=True,
+                         columns=['A'])
+
+
+class TestSelect(TestPackers):
+
+    def setup_class(cls):
+        super().setup_class(cls)
+        cls.frame = DataFrame({'A': np.random.randn(20),
+                               'B': np.arange(20)})
+        cls.bundle = {'meta': {'name': 'run'},
+                      'results': dict(('sim_%d' % i, cls.frame + i)
+                                      for i in range(5)),
+                      'series': [cls.frame.A, cls.frame.B]}
+
+    def test_select(self):
+        with ensure_clean(self.path) as p:
+            to_msgpack(p, self.bundle)
+            assert_frame_equal(read_msgpack(p, select=['results', 'sim_3']),
+                               self.frame + 3)
+            assert read_msgpack(p, select=['meta', 'name']) == 'run'
+            assert_series_equal(read_msgpack(p, select=['series', 1]),
+                                self.frame.B)
+            result = read_msgpack(p, select=['results'])
+            assert sorted(result) == ['sim_%d' % i for i in range(5)]
+
+    def test_decodes_selected_only(self):
+        import isf_pandas_msgpack.packers as packers
+        packed = to_msgpack(None, self.bundle, compress='zlib')
+        with patch.object(packers, '_block_values',
+                          wraps=packers._block_values) as block_values:
+            read_msgpack(packed, select=['results', 'sim_1'])
+        assert block_values.call_count == 2
+
+    def test_with_options(self):
+        packed = to_msgpack(None, self.bundle, self.bundle, toc=True)
+        result = read_msgpack(packed, select=['results', 'sim_2'],
+                              columns=['B'], rows=slice(5))
+        assert len(result) == 2
+        for r in result:
+            assert_frame_equal(r, (self.frame + 2)[['B']].iloc[:5])
+        result = read_msgpack(packed, select=['results', 'sim_2'],
+                              iterator=True, lazy=True)
+        for r in result:
+            assert_frame_equal(r.materialize(), self.frame + 2)
+
+    def test_missing(self):
+        packed = to_msgpack(None, self.bundle)
+        for select in [['results', 'sim_9'], ['nope'], ['series', 7],
+                       ['meta', 'name', 'deeper']]:
+            with pytest.raises(KeyError):
+                read_msgpack(packed, select=select)
+
+
+class TestCodecs(TestPackers):
+
+    def setup_class(cls):
+        super().setup_class(cls)
+        cls.frame = DataFrame({'A': np.arange(1000.),
+                               'B': np.arange(1000) % 7,
+                               'C': date_range('20130101', periods=1000)})
+
+    def teardown_method(self, method):
+        import isf_pandas_msgpack.packers as packers
+        packers._codecs.pop('reverse', None)
+        packers._codecs.pop('missing', None)
+
+    def test_codecs(self):
+        for name, module in [('lzma', 'lzma'), ('bz2', 'bz2'),
+                             ('zstd', 'zstandard'), ('lz4', 'lz4.frame')]:
+            try:
+                __import__(module)
+            except ImportError:
+                continue
+            packed = to_msgpack(None, self.frame, compress=name)
+            assert len(packed) < len(to_msgpack(None, self.frame))
+            assert_frame_equal(read_msgpack(packed), self.frame)
+
+    def test_register_codec(self):
+        register_codec('reverse', lambda data, typesize: bytes(data)[::-1],
+                       lambda data: bytes(data)[::-1])
+        packed = to_msgpack(None, self.frame, compress='reverse')
+        raw = next(iter(unpack(io.BytesIO(packed), object_hook=None)))
+        assert raw['blocks'][0]['compress'] == 'reverse'
+        assert_frame_equal(read_msgpack(packed), self.frame)
+
+    def test_unknown_codec(self):
+        with pytest.raises(ValueError):
+            to_msgpack(None, self.frame, compress='nope')
+        register_codec('reverse', lambda data, typesize: bytes(data)[::-1],
+                       lambda data: bytes(data)[::-1])
+        packed = to_msgpack(None, self.frame, compress='reverse')
+        import isf_pandas_msgpack.packers as packers
+        del packers._codecs['reverse']
+        with pytest.raises(ValueError):
+            read_msgpack(packed)
+
+    def test_unavailable_codec(self):
+        def check():
+            raise ImportError('missing is not installed')
+        register_codec('missing', None, None, check=check)
+        with pytest.raises(ImportError):
+            to_msgpack(None, self.frame, compress='missing')
+
+    def test_options(self):
+        if not _ZLIB_INSTALLED:
+            pytest.skip('no zlib')
+        frame = DataFrame({'A': np.random.randint(0, 100, 100000)})
+        fast = to_msgpack(None, frame, compress=('zlib', {'level': 1}))
+        small = to_msgpack(None, frame, compress=('zlib', {'level': 9}))
+        assert len(small) < len(fast)
+        for packed, level in [(fast, 1), (small, 9)]:
+            raw = next(iter(unpack(io.BytesIO(packed), object_hook=None)))
+            assert raw['blocks'][0]['compress'] == 'zlib'
+            assert raw['blocks'][0]['compress_options'] == {'level': level}
+            assert_frame_equal(read_msgpack(packed), frame)
+        raw = next(iter(unpack(io.BytesIO(to_msgpack(None, frame,
+                                                     compress='zlib')),
+                               object_hook=None)))
+        assert 'compress_options' not in raw['blocks'][0]
+
+    def test_blosc_options(self):
+        if not _BLOSC_INSTALLED:
+            pytest.skip('no blosc')
+        nthreads = blosc.set_nthreads(2)
+        options = {'cname': 'zstd', 'clevel': 5, 'shuffle': 'bit',
+                   'nthreads': 4}
+        packed = to_msgpack(None, self.frame, compress=('blosc', options))
+        assert blosc.set_nthreads(nthreads) == 2
+        schema, = read_msgpack_schema(packed)
+        assert [b['compress_options'] for b in schema['blocks']] == [
+            options] * 3
+        assert_frame_equal(read_msgpack(packed), self.frame)
+        with pytest.raises(TypeError):
+            to_msgpack(None, self.frame, compress=('blosc', {'nope': 1}))
+
+    def test_blosc_nthreads_workers(self):
+        if not _BLOSC_INSTALLED:
+            pytest.skip('no blosc')
+        nthreads = blosc.set_nthreads(2)
+        frame = DataFrame(np.random.randn(100000, 4))
+        packed = to_msgpack(None, frame, compress=('blosc', {'nthreads': 4}),
+                            frame_size=10000, workers=8)
+        # restored by every call in turn, whatever their order
+        assert blosc.set_nthreads(nthreads) == 2
+        assert_frame_equal(read_msgpack(packed), frame)
+
+    def test_registered_codec_options(self):
+        calls = []
+
+        def compress(data, typesize, **options):
+            calls.append(options)
+            return bytes(data)[::-1]
+
+        register_codec('reverse', compress, lambda data: bytes(data)[::-1])
+        packed = to_msgpack(None, self.frame, compress=('reverse', {'a': 1}),
+                            frame_size=1000)
+        assert_frame_equal(read_msgpack(packed), self.frame)
+        assert calls and all(options == {'a': 1} for options in calls)
+
+    def test_auto_options(self):
+        with pytest.raises(ValueError):
+            to_msgpack(None, self.frame, compress=('auto', {'level': 1}))
+
+    def test_decompress_into(self):
+        import isf_pandas_msgpack.packers as packers
+        for name in ['blosc', 'zlib', 'lzma', 'bz2']:
+            if name == 'blosc' and not _BLOSC_INSTALLED:
+                continue
+            codec = packers._get_codec(name)
+            # more than a streaming chunk, of a high ratio
+            data = np.arange(100000.) // 1000
+            compressed = codec.compress(memoryview(data).cast('B'), 8)
+            out = np.empty_like(data)
+            assert codec.decompress_into(compressed,
+                                         memoryview(out).cast('B')) == 800000
+            tm.assert_numpy_array_equal(out, data)
+            with pytest.raises(ValueError):
+                codec.decompress_into(compressed,
+                                      memoryview(out[:10]).cast('B'))
+
+    def test_decompressed_into_blocks(self):
+        if not _ZLIB_INSTALLED:
+            pytest.skip('no zlib')
+        packed = to_msgpack(None, self.frame, compress='zlib')
+        with patch('zlib.decompress', wraps=zlib.decompress) as dec:
+            result = read_msgpack(packed)
+        assert_frame_equal(result, self.frame)
+        assert dec.call_count == 0
+        assert all(b.values.flags.writeable for b in result._data.blocks
+                   if isinstance(b.values, np.ndarray))
+
+    def test_decompressed_size_mismatch(self):
+        if not _ZLIB_INSTALLED:
+            pytest.skip('no zlib')
+        packed = to_msgpack(None, np.arange(100.), compress='zlib')
+        raw = next(iter(unpack(io.BytesIO(packed), object_hook=None)))
+        raw['shape'] = [50]
+        with pytest.raises(ValueError):
+            read_msgpack(pack(raw, default=None))
+
+
+class TestAutoCompress(TestPackers):
+
+    def setup_class(cls):
+        super().setup_class(cls)
+        n = 100000
+        cls.frame = DataFrame({'noise': np.random.randn(n),
+                               'repeated': np.arange(n) % 10,
+                               't': date_range('20130101', periods=n,
+                                               freq='s'),
+                               's': ['a'] * n})
+
+    def _codecs(self, packed):
+        schema, = read_msgpack_schema(packed)
+        return dict((b['dtype'], b['compress']) for b in schema['blocks'])
+
+    def test_auto(self):
+        packed = to_msgpack(None, self.frame, compress='auto')
+        assert_frame_equal(read_msgpack(packed), self.frame)
+        codecs = self._codecs(packed)
+        assert codecs['float64'] is None
+        assert codecs['int64'] is not None
+        assert codecs['datetime64[ns]'] is not None
+        assert codecs['object'] is None
+        assert len(packed) < len(to_msgpack(None, self.frame))
+
+    def test_min_decode_speed(self):
+        packed = to_msgpack(None, self.frame, compress='auto',
+                            min_decode_speed=1e12)
+        assert set(self._codecs(packed).values()) == set([None])
+        assert_frame_equal(read_msgpack(packed), self.frame)
+
+    def test_levels(self):
+        import isf_pandas_msgpack.packers as packers
+        x = np.arange(100000) % 10
+        fast, high = (u'zlib', {u'level': 1}), (u'zlib', {u'level': 9})
+        # the best ratio, in any order, of those tried within the budget
+        for codecs, budget, level in [((fast, high), 1, 9),
+                                      ((high, fast), 1, 9),
+                                      ((fast, high), 0, 1)]:
+            with patch.object(packers, '_AUTO_CODECS', codecs), \
+                    patch.object(packers, '_AUTO_BUDGET', budget):
+                packed = to_msgpack(None, x, compress='auto')
+            raw = next(iter(unpack(io.BytesIO(packed), object_hook=None)))
+            assert raw['compress_options'] == {'level': level}
+            tm.assert_numpy_array_equal(read_msgpack(packed), x)
+        # every codec is tried at a fast and a high level
+        names = [name for name, _ in packers._AUTO_CODECS]
+        assert all(names.count(name) >= 2 for name in names)
+
+    def test_chosen_once(self):
+        import isf_pandas_msgpack.packers as packers
+        with patch.object(packers, '_choose_codec',
+                          wraps=packers._choose_codec) as choose:
+            packed = to_msgpack(None, self.frame, compress='auto',
+                                row_group_size=10000)
+        assert_frame_equal(read_msgpack(packed), self.frame)
+        # the column labels, the locs and every block, once for all ten
+        # row groups
+        assert choose.call_count == 2 + len(self.frame._data.blocks)
+        schema, = read_msgpack_schema(packed)
+        codecs = set((b['dtype'], b['compress'])
+                     for g in schema['row_groups'] for b in g['blocks'])
+        assert len(codecs) == len(self.frame._data.blocks)
+
+    def test_small_arrays(self):
+        packed = to_msgpack(None, np.zeros(10), compress='auto')
+        raw = next(iter(unpack(io.BytesIO(packed), object_hook=None)))
+        assert raw['compress'] is None
+
+
+class TestWorkers(TestPackers):
+
+    def setup_class(cls):
+        super().setup_class(cls)
+        n = 10000
+        cls.frame = DataFrame({'a': np.arange(n),
+                               'b': np.random.randn(n),
+                               'c': date_range('20130101', periods=n,
+                                               freq='s'),
+                               'd': ['x'] * n},
+                              index=date_range('20120101', periods=n,
+                                               freq='min'))
+
+    def test_round_trip(self):
+        import isf_pandas_msgpack.packers as packers
+        for compress in [None, 'zlib', 'blosc']:
+            if compress == 'blosc' and not _BLOSC_INSTALLED:
+                continue
+            packed = to_msgpack(None, self.frame, compress=compress,
+                                workers=4)
+            assert packed == to_msgpack(None, self.frame, compress=compress)
+            assert_frame_equal(read_msgpack(packed, workers=4), self.frame)
+        assert packers._pool() is None
+
+    def test_row_groups(self):
+        packed = to_msgpack(None, self.frame, compress='zlib',
+                            row_group_size=1000, statistics=True,
+                            workers=4)
+        assert packed == to_msgpack(None, self.frame, compress='zlib',
+                                    row_group_size=1000, statistics=True)
+        assert_frame_equal(read_msgpack(packed, workers=4), self.frame)
+        result = read_msgpack(packed, workers=4, columns=['d', 'a'],
+                              rows=slice(1500, 2500))
+        assert_frame_equal(result, self.frame[['d', 'a']].iloc[1500:2500])
+
+    def test_decompressed_on_threads(self):
+        import isf_pandas_msgpack.packers as packers
+        packed = to_msgpack(None, self.frame, compress='zlib')
+        threads = set()
+
+        def block_values(b, rows=None):
+            threads.add(threading.current_thread())
+            time.sleep(0.05)
+            return _block_values(b, rows)
+
+        _block_values = packers._block_values
+        with patch.object(packers, '_block_values', block_values):
+            assert_frame_equal(read_msgpack(packed, workers=4), self.frame)
+        assert len(threads - set([threading.current_thread()])) > 0
+
+    def test_axes_on_pool(self):
+        import isf_pandas_msgpack.packers as packers
+        packed = to_msgpack(None, self.frame, compress='zlib')
+        with patch.object(packers, '_map', wraps=packers._map) as map_:
+            assert_frame_equal(read_msgpack(packed, workers=4), self.frame)
+        # the index and the column labels with the four blocks
+        (_, jobs), _ = map_.call_args
+        assert len(jobs) == 2 + 4
+        frames = [self.frame.set_index(['a', 'd']),
+                  self.frame.tz_localize('UTC'),
+                  self.frame.set_index(self.frame.index.to_period('min'))]
+        for frame in frames:
+            packed = to_msgpack(None, frame, frame.b, compress='zlib')
+            for result in [read_msgpack(packed, workers=4),
+                           list(read_msgpack(packed, iterator=True,
+                                             workers=4))]:
+                assert_frame_equal(result[0], frame)
+                assert_series_equal(result[1], frame.b)
+
+    def test_iterator(self):
+        import isf_pandas_msgpack.packers as packers
+        packed = to_msgpack(None, self.frame, self.frame, compress='zlib')
+        for result in read_msgpack(packed, iterator=True, workers=4):
+            assert packers._pool() is None
+            assert_frame_equal(result, self.frame)
+
+    def test_concurrent_writer(self):
+        # a plain to_msgpack on another thread while read_msgpack decodes
+        # on its pool doesn't shut the pool down
+        import isf_pandas_msgpack.packers as packers
+        packed = to_msgpack(None, self.frame, compress='zlib')
+        threads = set()
+
+        def block_values(b, rows=None):
+            threads.add(threading.current_thread())
+            writer = threading.Thread(target=to_msgpack,
+                                      args=(None, self.frame.iloc[:10]))
+            writer.start()
+            writer.join()
+            return _block_values(b, rows)
+
+        _block_values = packers._block_values
+        with patch.object(packers, '_block_values', block_values):
+            assert_frame_equal(read_msgpack(packed, workers=4), self.frame)
+        assert len(threads - set([threading.current_thread()])) > 0
+
+    def test_concurrent_readers_and_writers(self):
+        import isf_pandas_msgpack.packers as packers
+        packed = to_msgpack(None, self.frame, compress='zlib')
+        errors = []
+
+        def run(i):
+            try:
+                for _ in range(5):
+                    if i % 2:
+                        assert to_msgpack(None, self.frame, compress='zlib',
+                                          workers=2) == packed
+                    else:
+                        assert_frame_equal(read_msgpack(packed, workers=3),
+                                           self.frame)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert errors == []
+        assert packers._pool() is None
+
+    def test_buffer_callback(self):
+        buffers = []
+        packed = to_msgpack(None, self.frame, workers=4,
+                            buffer_callback=lambda b: buffers.append(b.raw()))
+        assert_frame_equal(read_msgpack(packed, buffers=buffers), self.frame)
+
+
+class TestFrames(TestPackers):
+
+    def setup_class(cls):
+        super().setup_class(cls)
+        n = 10000
+        cls.frame = DataFrame({'a': np.arange(n),
+                               'b': np.arange(n) * 2,
+                               'c': np.random.randn(n)})
+        cls.series = Series(np.arange(n) % 7)
+
+    def _frames(self, packed):
+        schema, = read_msgpack_schema(packed)
+        return dict((b['dtype'], b.get('frames')) for b in schema['blocks'])
+
+    def test_truncated_frame(self):
+        import bz2
+        for compress, module in [('zlib', zlib), ('bz2', bz2)]:
+            packed = to_msgpack(None, self.series, compress=compress,
+                                frame_size=7000)
+            raw = next(iter(unpack(io.BytesIO(packed), object_hook=None)))
+            frames = list(raw['data'])
+            frames[1] = ExtType(0, module.compress(b'\0' * 100))
+            raw['data'] = frames
+            with pytest.raises(ValueError, match='expected 7000'):
+                read_msgpack(pack(raw))
+
+    def test_round_trip(self):
+        for compress in ['zlib', 'blosc']:
+            if compress == 'blosc' and not _BLOSC_INSTALLED:
+                continue
+            for workers in [None, 4]:
+                packed = to_msgpack(None, self.frame, compress=compress,
+                                    frame_size=7000, workers=workers)
+                result = read_msgpack(packed, workers=workers)
+                assert_frame_equal(result, self.frame)
+        # the frames are item aligned, the last one is shorter
+        assert self._frames(packed) == {'int64': (7000, 160000),
+                                        'float64': (7000, 80000)}
+
+    def test_default(self):
+        packed = to_msgpack(None, self.frame, compress='zlib')
+        assert self._frames(packed) == {'int64': None, 'float64': None}
+        # large arrays too, unless asked, for older versions to read
+        big = DataFrame({'a': np.arange(1000000)})
+        packed = to_msgpack(None, big, compress='zlib')
+        assert self._frames(packed) == {'int64': None}
+        packed = to_msgpack(None, big, compress='zlib',
+                            frame_size=4 * 1024 * 1024)
+        assert self._frames(packed) == {'int64': (4 * 1024 * 1024,
+                                                  8000000)}
+        assert_frame_equal(read_msgpack(packed), big)
+
+    def test_uncompressed(self):
+        packed = to_msgpack(None, self.frame, frame_size=7000)
+        assert self._frames(packed) == {'int64': None, 'float64': None}
+
+    def test_other_objects(self):
+        index = date_range('20130101', periods=10000, freq='s')
+        for obj in [self.series, Series(self.series.values, index=index),
+                    index, np.arange(30000.).reshape(100, 300)]:
+            packed = to_msgpack(None, obj, compress='zlib', frame_size=7000)
+            tm.assert_equal(read_msgpack(packed), obj)
+
+    def test_rows_decompress_needed_frames(self):
+        if not _ZLIB_INSTALLED:
+            pytest.skip('no zlib')
+        # the locs of a block are compressed whole too
+        cases = [(self.series, slice(100, 200), 1),
+                 (self.series, slice(870, 880), 2),
+                 (self.frame[['a', 'b']], slice(100, 200), 1 + 2),
+                 (self.frame[['a', 'b']], slice(None), 1 + 23)]
+        for obj, rows, n_frames in cases:
+            packed = to_msgpack(None, obj, compress='zlib', frame_size=7000)
+            with patch('zlib.decompressobj',
+                       wraps=zlib.decompressobj) as dec:
+                result = read_msgpack(packed, rows=rows)
+            tm.assert_equal(result, obj.iloc[rows])
+            assert dec.call_count == n_frames
+
+    def test_columns_and_rows(self):
+        if not _ZLIB_INSTALLED:
+            pytest.skip('no zlib')
+        packed = to_msgpack(None, self.frame, compress='zlib',
+                            frame_size=7000)
+        with patch('zlib.decompressobj',
+                       wraps=zlib.decompressobj) as dec:
+            result = read_msgpack(packed, columns=['c'],
+                                  rows=slice(5000, 5010))
+        assert_frame_equal(result, self.frame[['c']].iloc[5000:5010])
+        # the locs of both blocks and a frame of c
+        assert dec.call_count == 2 + 1
+
+    def test_out_of_band(self):
+        buffers = []
+        packed = to_msgpack(None, self.frame, compress='zlib',
+                            frame_size=7000,
+                            buffer_callback=lambda b: buffers.append(b.raw()))
+        # the locs of both blocks and the frames
+        assert len(buffers) == 2 + 35
+        assert_frame_equal(read_msgpack(packed, buffers=buffers), self.frame)
+
+
+class TestShuffle(TestPackers):
+
+    def setup_class(cls):
+        super().setup_class(cls)
+        n = 20000
+        cls.frame = DataFrame({'a': np.cumsum(np.random.randn(n)).round(2),
+                               'b': np.arange(n) * 1000,
+                               'c': np.arange(n, dtype='int32'),
+                               'd': np.zeros(n, dtype='uint8')},
+                              index=date_range('20130101', periods=n,
+                                               freq='s'))
+
+    def test_round_trip(self):
+        for compress in ['zlib', 'lzma', 'bz2', 'blosc', 'auto']:
+            if compress == 'blosc' and not _BLOSC_INSTALLED:
+                continue
+            packed = to_msgpack(None, self.frame, compress=compress,
+                                shuffle=True)
+            assert_frame_equal(read_msgpack(packed), self.frame)
+
+    def test_smaller(self):
+        if not _ZLIB_INSTALLED:
+            pytest.skip('no zlib')
+        frame = self.frame[['a']]
+        shuffled = to_msgpack(None, frame, compress='zlib', shuffle=True)
+        assert len(shuffled) < 0.8 * len(to_msgpack(None, frame,
+                                                     compress='zlib'))
+
+    def test_recorded(self):
+        packed = to_msgpack(None, self.frame, compress='zlib', shuffle=True)
+        schema, = read_msgpack_schema(packed)
+        # single bytes are left as they are
+        assert dict((b['dtype'], b['compress'])
+                    for b in schema['blocks']) == {'float64': 'zlib+shuffle',
+                                                   'int64': 'zlib+shuffle',
+                                                   'int32': 'zlib+shuffle',
+                                                   'uint8': 'zlib'}
+        packed = to_msgpack(None, self.frame, shuffle=True)
+        schema, = read_msgpack_schema(packed)
+        assert all(b['compress'] is None for b in schema['blocks'])
+
+    def test_unknown_to_plain_codec(self):
+        import isf_pandas_msgpack.packers as packers
+        # readers that don't unshuffle see an unknown codec
+        packed = to_msgpack(None, self.frame['a'], compress='zlib',
+                            shuffle=True)
+        with patch.object(packers, '_SHUFFLE_SUFFIX', u'+none'):
+            with pytest.raises(ValueError, match='compress must be one of'):
+                read_msgpack(packed)
+
+    def test_frames(self):
+        packed = to_msgpack(None, self.frame, compress='zlib', shuffle=True,
+                            frame_size=10000)
+        assert_frame_equal(read_msgpack(packed, workers=4), self.frame)
+        assert_frame_equal(read_msgpack(packed, rows=slice(12345, 12400)),
+                           self.frame.iloc[12345:12400])
+
+    def test_other_objects(self):
+        for obj in [self.frame['a'], self.frame.index,
+                    np.arange(1000.).reshape(10, 100)]:
+            packed = to_msgpack(None, obj, compress='zlib', shuffle=True)
+            tm.assert_equal(read_msgpack(packed), obj)
+
+
+class TestDelta(TestPackers):
+
+    def setup_class(cls):
+        super().setup_class(cls)
+        n = 10000
+        cls.index = date_range('20130101', periods=n, freq='s')
+        jitter = np.random.randint(0, 1000, n).astype('m8[ms]')
+        cls.frame = DataFrame({'regular': cls.index,
+                               'shifted': cls.index + pd.Timedelta('1h'),
+                               'jittered': cls.index + jitter,
+                               'x': np.arange(n)},
+                              index=cls.index)
+
+    def _raw(self, packed):
+        return next(iter(unpack(io.BytesIO(packed), object_hook=None)))
+
+    def test_regular_index(self):
+        obj = Series(np.arange(len(self.index)), index=self.index)
+        packed = to_msgpack(None, obj, delta=True)
+        index = self._raw(packed)['index']
+        assert index['data'] is None
+        assert index['delta'] == {'order': 2, 'n': 10000, 'dtype': None,
+                                  'heads': ((self.index[0].value,
+                                             10 ** 9),)}
+        assert len(packed) < 0.6 * len(to_msgpack(None, obj))
+        tm.assert_series_equal(read_msgpack(packed), obj)
+
+    def test_blocks(self):
+        packed = to_msgpack(None, self.frame, delta=True)
+        raw = self._raw(packed)
+        block, = [b for b in raw['blocks']
+                  if b['dtype'] == 'datetime64[ns]']
+        # the regular columns collapse with the jittered ones, deltas of
+        # up to a second and a bit in ns need int32
+        assert block['delta']['order'] == 1
+        assert block['delta']['dtype'] == 'int32'
+        assert_frame_equal(read_msgpack(packed), self.frame)
+        regular = self.frame[['regular', 'shifted']]
+        packed = to_msgpack(None, regular, delta=True)
+        block, = self._raw(packed)['blocks']
+        assert block['values'] is None
+        assert_frame_equal(read_msgpack(packed), regular)
+
+    def test_delta_of_deltas(self):
+        # steps growing by a nanosecond narrow better as deltas of deltas
+        values = np.cumsum(np.arange(1000) + 10 ** 9)
+        values[500] += 1
+        index = pd.DatetimeIndex(values)
+        packed = to_msgpack(None, index, delta=True)
+        assert self._raw(packed)['delta']['order'] == 2
+        assert self._raw(packed)['delta']['dtype'] == 'int8'
+        tm.assert_index_equal(read_msgpack(packed), index)
+
+    def test_not_encoded(self):
+        index = self.index.insert(5, NaT)
+        for obj in [index, self.index[:2], self.index[:0],
+                    pd.DatetimeIndex(np.random.randint(0, 2 ** 62, 100))]:
+            packed = to_msgpack(None, obj, delta=True)
+            assert 'delta' not in self._raw(packed)
+            tm.assert_index_equal(read_msgpack(packed), obj)
+
+    def test_tz(self):
+        frame = DataFrame({'a': self.index.tz_localize('US/Eastern')},
+                          index=self.index.tz_localize('Asia/Tokyo'))
+        packed = to_msgpack(None, frame, delta=True)
+        assert self._raw(packed)['axes'][1]['delta']['order'] == 2
+        assert_frame_equal(read_msgpack(packed), frame)
+
+    def test_compressed(self):
+        for kwargs in [dict(compress='zlib'),
+                       dict(compress='zlib', shuffle=True, frame_size=1000),
+                       dict(compress='auto', row_group_size=3000)]:
+            packed = to_msgpack(None, self.frame, delta=True, **kwargs)
+            assert_frame_equal(read_msgpack(packed), self.frame)
+            assert_frame_equal(read_msgpack(packed, rows=slice(4000, 4100)),
+                               self.frame.iloc[4000:4100])
+
+
+class TestNarrow(TestPackers):
+
+    def setup_class(cls):
+        super().setup_class(cls)
+        n = 10000
+        cls.frame = DataFrame({'ids': 10 ** 12 + np.arange(n) % 200,
+                               'counts': np.random.randint(-1000, 1000, n),
+                               'small': np.arange(n, dtype='int32') % 7,
+                               'wide': np.random.randint(0, 2 ** 40, n),
+                               'x': np.random.randn(n)})
+
+    def _narrow(self, packed):
+        schema, = read_msgpack_schema(packed)
+        return dict((b['dtype'], b.get('narrow')) for b in schema['blocks'])
+
+    def test_blocks(self):
+        for columns, meta in [(['ids'], {'offset': 10 ** 12,
+                                         'dtype': 'uint8'}),
+                              (['counts'], {'offset': int(
+                                  self.frame['counts'].min()),
+                                  'dtype': 'uint16'}),
+                              (['small'], {'offset': 0, 'dtype': 'uint8'}),
+                              (['wide'], None)]:
+            frame = self.frame[columns]
+            packed = to_msgpack(None, frame, narrow=True)
+            assert list(self._narrow(packed).values()) == [meta]
+            assert_frame_equal(read_msgpack(packed), frame)
+        frame = self.frame[['ids']]
+        assert len(to_msgpack(None, frame, narrow=True)) < 0.2 * len(
+            to_msgpack(None, frame))
+
+    def test_frame(self):
+        packed = to_msgpack(None, self.frame, narrow=True)
+        result = read_msgpack(packed)
+        assert_frame_equal(result, self.frame)
+        assert all(b.values.flags.writeable for b in result._data.blocks)
+        empty = self.frame.iloc[:0]
+        assert_frame_equal(read_msgpack(to_msgpack(None, empty, narrow=True)),
+                           empty)
+
+    def test_other_objects(self):
+        for obj in [self.frame['ids'],
+                    pd.Index(self.frame['ids'].values),
+                    self.frame[['ids', 'small']].values,
+                    np.arange(2 ** 63, 2 ** 63 + 100, dtype='uint64'),
+                    pd.period_range('2000', periods=100, freq='D')]:
+            packed = to_msgpack(None, obj, narrow=True)
+            tm.assert_equal(read_msgpack(packed), obj)
+
+    def test_compressed(self):
+        for kwargs in [dict(compress='zlib'),
+                       dict(compress='zlib', shuffle=True, frame_size=1000),
+                       dict(compress='auto', delta=True)]:
+            frame = self.frame.copy()
+            frame['t'] = date_range('20130101', periods=len(frame),
+                                    freq='s') + pd.to_timedelta(
+                frame['small'], unit='ms')
+            packed = to_msgpack(None, frame, narrow=True, **kwargs)
+            assert_frame_equal(read_msgpack(packed), frame)
+            assert_frame_equal(read_msgpack(packed, rows=slice(4000, 4100)),
+                               frame.iloc[4000:4100])
+
+    def test_narrowed_deltas(self):
+        # deltas of a second and up to 200 ns narrow to uint8, better
+        # than the int16 of the deltas of deltas
+        values = np.cumsum(10 ** 9 + np.random.randint(0, 200, 1000))
+        index = pd.DatetimeIndex(values)
+        packed = to_msgpack(None, index, delta=True, narrow=True)
+        raw = next(iter(unpack(io.BytesIO(packed), object_hook=None)))
+        assert raw['delta']['order'] == 1
+        assert raw['delta']['dtype'] == 'int32'
+        assert raw['narrow']['dtype'] == 'uint8'
+        tm.assert_index_equal(read_msgpack(packed), index)
+
+
+class TestWriteOptions(TestPackers):
+
+    def setup_class(cls):
+        super().setup_class(cls)
+        n = 10000
+        cls.frame = DataFrame({'a': np.arange(n) % 100,
+                               'b': np.random.randn(n)},
+                              index=date_range('20130101', periods=n,
+                                               freq='s'))
+
+    def _raw(self, packed):
+        return next(iter(unpack(io.BytesIO(packed), object_hook=None)))
+
+    def test_not_left_set(self):
+        x = np.arange(1000)
+        to_msgpack(None, x, compress='zlib', narrow=True, shuffle=True,
+                   delta=True)
+        raw = self._raw(pack(x))
+        assert raw['compress'] is None
+        assert 'narrow' not in raw
+
+        def callback(b):
+            raise RuntimeError('full')
+
+        with pytest.raises(RuntimeError):
+            to_msgpack(None, x, buffer_callback=callback)
+        tm.assert_numpy_array_equal(read_msgpack(pack(x)), x)
+
+    def test_concurrent_writers(self):
+        options = [dict(compress='zlib', narrow=True, delta=True),
+                   dict(shuffle=True, frame_size=1000),
+                   dict(row_group_size=1000, statistics=True), dict()]
+        expected = [to_msgpack(None, self.frame, **o) for o in options]
+        barrier = threading.Barrier(len(options))
+        errors = []
+
+        def write(o, packed):
+            barrier.wait()
+            for _ in range(10):
+                if to_msgpack(None, self.frame, **o) != packed:
+                    errors.append(o)
+
+        threads = [threading.Thread(target=write, args=(o, packed))
+                   for o, packed in zip(options, expected)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert errors == []
+
+
 class TestNumpy(TestPackers):
 
     def test_numpy_scalar_float(self):
@@ -643,15 +2327,27 @@ class TestCompression(TestPackers):
             np.dtype('timedelta64[ns]'): np.timedelta64(1, 'ns'),
         }
 
-        with patch(f"{compress}.decompress", decompress), pytest.raises(PerformanceWarning) as excinfo:
+        # blocks are decompressed into arrays of their size, the indexes,
+        # of unknown size, by decompress
+        frames = {}
+        for k, frame in self.frame.items():
+            frames[k] = frame.copy()
+            frames[k].index = Index(np.arange(len(frame), dtype='float64'))
+
+        with patch(f"{compress}.decompress", decompress), \
+                tm.assert_produces_warning(
+                    PerformanceWarning,
+                    match='copying data after decompressing; this may mean '
+                          'that decompress is caching its result',
+                    check_stacklevel=False):
 
             i_rec = self.encode_decode(
-                self.frame, 
+                frames,
                 compress=compress
                 )
-            for k in self.frame.keys():
+            for k in frames.keys():
                 value = i_rec[k]
-                expected = self.frame[k]
+                expected = frames[k]
                 assert_frame_equal(value, expected)
                 # make sure that we can write to the new frames even though
                 # we needed to copy the data
@@ -666,7 +2362,7 @@ class TestCompression(TestPackers):
                         assert block.values._data.flags.writeable
                         block.values._data[0] += rhs[block.dtype]
 
-        assert excinfo.match('copying data after decompressing; this may mean that decompress is caching its result')
+        assert not_garbage
         for buf, control_buf in zip(not_garbage, control):
             # make sure none of our mutations above affected the
             # original buffers